@@ -12,7 +12,8 @@ from sqlalchemy import engine_from_config, pool
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from app.db.base import Base  # noqa: E402
+from app.constants import ALEMBIC_AUDIT_SECTION  # noqa: E402
+from app.db.base import AuditBase, Base  # noqa: E402
 from app.models.user import User  # noqa: F401, E402
 from app.models.folder import Folder  # noqa: F401, E402
 from app.models.file import File  # noqa: F401, E402
@@ -21,7 +22,9 @@ from app.models.file_comment import FileComment  # noqa: F401, E402
 from app.models.file_tag import FileTag  # noqa: F401, E402
 from app.models.file_thumbnail import FileThumbnail  # noqa: F401, E402
 from app.models.variable import Variable  # noqa: F401, E402
+from app.models.upload_session import UploadSession  # noqa: F401, E402
 from app.models.audit import Audit  # noqa: F401, E402
+from app.models.audit_segment import AuditSegment  # noqa: F401, E402
 
 
 config = context.config
@@ -30,7 +33,13 @@ config = context.config
 if config.config_file_name is not None and not logging.root.handlers:
     fileConfig(config.config_file_name)
 
-target_metadata = Base.metadata
+# NOTE (ADR-70): Audit is stored in a separate database file.
+# The audit section migrates the audit database on its own branch with
+# its own version table; every other section targets the main database.
+if config.config_ini_section == ALEMBIC_AUDIT_SECTION:
+    target_metadata = AuditBase.metadata
+else:
+    target_metadata = Base.metadata
 
 
 def run_migrations() -> None:
@@ -0,0 +1,111 @@
+"""move audit to audit database
+
+Revision ID: 4b8e2f61c9a7
+Revises: dd149a38612f
+Create Date: 2026-10-19 10:14:03.877120
+
+"""
+
+# flake8: noqa
+
+import os
+import sqlite3
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.constants import SQLITE_AUDIT_FILENAME
+
+
+revision: str = '4b8e2f61c9a7'
+down_revision: str | Sequence[str] | None = 'dd149a38612f'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+AUDIT_COLUMNS = (
+    "id, created_at, created_by, event, request_uuid, resource_type, "
+    "resource_id"
+)
+AUDIT_BATCH_SIZE = 5000
+AUDIT_INDEXES = (
+    "created_at", "created_by", "event", "request_uuid", "resource_id",
+    "resource_type",
+)
+
+
+def _get_audit_db_path() -> str:
+    main_db_path = op.get_bind().engine.url.database
+    return os.path.join(os.path.dirname(main_db_path), SQLITE_AUDIT_FILENAME)
+
+
+def _copy_rows(source, insert) -> None:
+    while True:
+        rows = source.fetchmany(AUDIT_BATCH_SIZE)
+        if not rows:
+            break
+        insert([tuple(row) for row in rows])
+
+
+def upgrade() -> None:
+    # NOTE (ADR-70): Audit is stored in a separate database file.
+    # Existing rows are copied into the audit database (migrated first
+    # by upgrade_db) keeping their identifiers; INSERT OR IGNORE makes
+    # the copy idempotent if the migration is interrupted and re-run.
+    audit_conn = sqlite3.connect(_get_audit_db_path())
+    try:
+        audit_conn.execute("PRAGMA synchronous=FULL")
+        source = op.get_bind().execute(
+            sa.text(f"SELECT {AUDIT_COLUMNS} FROM audit ORDER BY id")
+        )
+        with audit_conn:
+            _copy_rows(source, lambda rows: audit_conn.executemany(
+                f"INSERT OR IGNORE INTO audit ({AUDIT_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            ))
+    finally:
+        audit_conn.close()
+
+    with op.batch_alter_table('audit', schema=None) as batch_op:
+        for column in AUDIT_INDEXES:
+            batch_op.drop_index(batch_op.f(f'ix_audit_{column}'))
+
+    op.drop_table('audit')
+
+
+def downgrade() -> None:
+    op.create_table('audit',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.Integer(), nullable=False),
+    sa.Column('created_by', sa.Integer(), nullable=True),
+    sa.Column('event', sa.String(length=128), nullable=False),
+    sa.Column('request_uuid', sa.String(length=64), nullable=True),
+    sa.Column('resource_type', sa.String(length=64), nullable=True),
+    sa.Column('resource_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ondelete='RESTRICT'),
+    sa.PrimaryKeyConstraint('id'),
+    sqlite_autoincrement=True
+    )
+    with op.batch_alter_table('audit', schema=None) as batch_op:
+        for column in AUDIT_INDEXES:
+            batch_op.create_index(
+                batch_op.f(f'ix_audit_{column}'), [column], unique=False,
+            )
+
+    audit_conn = sqlite3.connect(_get_audit_db_path())
+    try:
+        source = audit_conn.execute(
+            f"SELECT {AUDIT_COLUMNS} FROM audit ORDER BY id"
+        )
+        bind = op.get_bind()
+        _copy_rows(source, lambda rows: bind.execute(
+            sa.text(
+                f"INSERT INTO audit ({AUDIT_COLUMNS}) VALUES "
+                "(:id, :created_at, :created_by, :event, :request_uuid, "
+                ":resource_type, :resource_id)"
+            ),
+            [dict(zip(AUDIT_COLUMNS.split(", "), row)) for row in rows],
+        ))
+    finally:
+        audit_conn.close()
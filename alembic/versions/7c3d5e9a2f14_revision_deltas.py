@@ -0,0 +1,32 @@
+"""revision deltas
+
+Revision ID: 7c3d5e9a2f14
+Revises: 4b8e2f61c9a7
+Create Date: 2026-10-19 16:42:11.503218
+
+"""
+
+# flake8: noqa
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '7c3d5e9a2f14'
+down_revision: str | Sequence[str] | None = '4b8e2f61c9a7'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('files_revisions', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('is_delta', sa.Boolean(), server_default=sa.text('0'), nullable=False))
+
+
+def downgrade() -> None:
+    # Delta revisions cannot be read without the flag; downgrading is
+    # only safe while no delta revisions exist.
+    with op.batch_alter_table('files_revisions', schema=None) as batch_op:
+        batch_op.drop_column('is_delta')
@@ -0,0 +1,52 @@
+"""upload sessions
+
+Revision ID: 9e4a6c2b7d31
+Revises: 7c3d5e9a2f14
+Create Date: 2026-10-19 18:05:37.214906
+
+"""
+
+# flake8: noqa
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '9e4a6c2b7d31'
+down_revision: str | Sequence[str] | None = '7c3d5e9a2f14'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table('upload_sessions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_by', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.Integer(), nullable=False),
+    sa.Column('expires_at', sa.Integer(), nullable=False),
+    sa.Column('folder_id', sa.Integer(), nullable=False),
+    sa.Column('filename', sa.String(length=255), nullable=False),
+    sa.Column('filesize', sa.Integer(), nullable=False),
+    sa.Column('upload_uuid', sa.String(length=255), nullable=False),
+    sa.Column('received_ranges', sa.Text(), server_default=sa.text("'[]'"), nullable=False),
+    sa.CheckConstraint('filesize >= 0', name='ck_upload_sessions_filesize_non_negative'),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ondelete='RESTRICT'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('upload_uuid'),
+    sqlite_autoincrement=True
+    )
+    with op.batch_alter_table('upload_sessions', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_upload_sessions_created_by'), ['created_by'], unique=False)
+        batch_op.create_index(batch_op.f('ix_upload_sessions_expires_at'), ['expires_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_upload_sessions_folder_id'), ['folder_id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('upload_sessions', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_upload_sessions_folder_id'))
+        batch_op.drop_index(batch_op.f('ix_upload_sessions_expires_at'))
+        batch_op.drop_index(batch_op.f('ix_upload_sessions_created_by'))
+
+    op.drop_table('upload_sessions')
@@ -1,10 +1,17 @@
 # app/audit.py
 # SPDX-License-Identifier: GPL-3.0-only
 
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.context import get_context_var
+from app.events import Events as E
 from app.models.audit import Audit
 from app.repositories.orm import ORMRepository
 
+log = logging.getLogger(__name__)
+
 # NOTE (ADR-21): Commit ownership and transaction boundaries.
 # The service layer owns transaction boundaries at the core application
 # level and is responsible for explicit commit and rollback of the
@@ -22,6 +29,17 @@ from app.repositories.orm import ORMRepository
 # application AsyncSession or an open SQLite file (cipherdir may be
 # unmounted; SQLite lives on the mount).
 
+# NOTE (ADR-70): Audit is stored in a separate database file.
+# Audit rows are staged on the service session and written to the
+# audit database in a short transaction of its own right after the
+# main transaction commits; a rollback discards them. Consistency
+# model: the audit trail never records a mutation that was rolled
+# back, but a crash or an audit write failure between the two commits
+# loses the staged rows (at-most-once). An audit write failure is
+# logged and never fails the already committed operation.
+
+AUDIT_PENDING_KEY = "audit_pending"
+
 
 async def write_audit(
     repository: ORMRepository,
@@ -32,8 +50,9 @@ async def write_audit(
     commit: bool = False,
 ) -> None:
     """
-    Persist an audit event in the current transaction. Current user
-    and request correlation are resolved from request context.
+    Stage an audit event on the current session; it is persisted to
+    the audit database when the session commits. Current user and
+    request correlation are resolved from request context.
     """
     if current_user_id is None:
         current_user_id = get_context_var("current_user_id")
@@ -46,4 +65,38 @@ async def write_audit(
         resource_id=resource_id,
     )
 
-    await repository.insert(audit_event, commit=commit)
+    pending = repository.session.info.setdefault(AUDIT_PENDING_KEY, [])
+    pending.append(audit_event)
+
+    if commit:
+        await repository.commit()
+
+
+async def flush_audit(session: AsyncSession) -> None:
+    """
+    Write audit events staged on the session into the audit database.
+    Called after the main transaction has been committed.
+    """
+    audit_events = session.info.pop(AUDIT_PENDING_KEY, None)
+    if not audit_events:
+        return
+
+    from app.db.engine import AuditSessionLocal  # noqa: PLC0415
+
+    try:
+        async with AuditSessionLocal() as audit_session:
+            audit_session.add_all(audit_events)
+            await audit_session.commit()
+
+    except Exception:
+        log.exception(
+            "event=%s audit_events_count=%s",
+            E.AUDIT_WRITE_FAILED, len(audit_events),
+        )
+
+
+def discard_audit(session: AsyncSession) -> None:
+    """
+    Drop audit events staged on the session after a rollback.
+    """
+    session.info.pop(AUDIT_PENDING_KEY, None)
@@ -5,27 +5,34 @@ from collections import OrderedDict
 from functools import lru_cache
 
 from app.config import get_config
+from app.runtime.metrics import CACHE_EVICTIONS, CACHE_REQUESTS
 
 # NOTE (ADR-58): LRU cache holds decrypted bytes in process memory.
 # This avoids repeated gocryptfs reads for frequently requested
-# thumbnails. Plaintext may temporarily reach swap; sensitive
-# deployments should disable swap or use encrypted swap. The cache
-# is process-local, requires no locking, and is cleared on cipherdir
-# unmount as a defense-in-depth measure.
+# thumbnails and repeated reconstruction of delta revisions. Plaintext
+# may temporarily reach swap; sensitive deployments should disable
+# swap or use encrypted swap. Caches are process-local, require no
+# locking, and are cleared on cipherdir unmount as a defense-in-depth
+# measure.
 
 
 class LRUCache:
     """
-    Process-local LRU cache keyed by file_id that stores decoded
-    thumbnail bytes. Eviction is driven by total byte size so that
-    large thumbnails do not crowd out many small ones.
+    Process-local LRU cache keyed by an integer id (file_id for
+    thumbnails, revision id for revisions) that stores decoded bytes
+    with their mimetype. Eviction is driven by total byte size so that
+    large thumbnails do not crowd out many small ones. Hits, misses
+    and evictions are counted in the metrics under the cache name.
 
     Not thread-safe by design — the application runs a single asyncio
     worker, so all access is serialized on the event loop.
     """
 
-    def __init__(self, max_bytes: int) -> None:
+    def __init__(self, max_bytes: int, name: str = "default") -> None:
         self._max_bytes = max_bytes
+        self._hits = CACHE_REQUESTS.labels(name, "hit")
+        self._misses = CACHE_REQUESTS.labels(name, "miss")
+        self._evictions = CACHE_EVICTIONS.labels(name)
         self._store: OrderedDict[int, tuple[str, bytes]] = OrderedDict()
         self._current_bytes: int = 0
 
@@ -36,7 +43,9 @@ class LRUCache:
         """
         entry = self._store.get(file_id)
         if entry is None:
+            self._misses.inc()
             return None
+        self._hits.inc()
         self._store.move_to_end(file_id)
         return entry
 
@@ -60,6 +69,7 @@ class LRUCache:
         while self._current_bytes + entry_size > self._max_bytes:
             _, (_, evicted_data) = self._store.popitem(last=False)
             self._current_bytes -= len(evicted_data)
+            self._evictions.inc()
 
         self._store[file_id] = (mimetype, data)
         self._current_bytes += entry_size
@@ -95,4 +105,20 @@ def get_thumbnail_cache() -> LRUCache:
     first call so that get_config() is not invoked at module import time
     (consistent with the ADR constraint).
     """
-    return LRUCache(max_bytes=get_config().LRU_CACHE_MAX_BYTES)
+    return LRUCache(
+        max_bytes=get_config().LRU_CACHE_MAX_BYTES,
+        name="thumbnail",
+    )
+
+
+@lru_cache(maxsize=1)
+def get_revision_cache() -> LRUCache:
+    """
+    Return the process-wide cache of reconstructed delta revisions,
+    keyed by revision id. Revision content is immutable and ids are
+    never reused, so entries need no invalidation.
+    """
+    return LRUCache(
+        max_bytes=get_config().REVISION_CACHE_MAX_BYTES,
+        name="revision",
+    )
@@ -7,16 +7,21 @@ from functools import cached_property, lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from app.constants import (
+    AUDIT_ARCHIVE_DIRNAME,
     FERNET_KEY_FILENAME,
     FILES_DIRNAME,
+    FILES_INTENTS_DIRNAME,
     FILES_REVISIONS_DIRNAME,
     FILES_THUMBNAILS_DIRNAME,
     FILES_TMP_DIRNAME,
+    FILES_TRASH_DIRNAME,
+    FILES_UPLOADS_DIRNAME,
     FIRST_ADMIN_CREATED_FLAG_FILENAME,
     GOCRYPTFS_CIPHER_DIRNAME,
     GOCRYPTFS_MOUNTPOINT_DIRNAME,
     GOCRYPTFS_PASSPHRASE_ENCRYPTED_FILENAME,
     JWT_SIGNING_KEY_FILENAME,
+    SQLITE_AUDIT_FILENAME,
     SQLITE_DIRNAME,
     SQLITE_FILENAME,
 )
@@ -33,19 +38,53 @@ class Config(BaseSettings):
     INSTALL_EXTENSIONS_DIR: str
     LOG_LEVEL: str
     LOG_FORMAT: str
+    LOG_JSON: bool = False
+    LOG_QUEUE_SIZE: int = 0
+    SERVER_TIMING_ENABLED: bool = False
     GOCRYPTFS_WATCHDOG_INTERVAL_SECONDS: int
     GOCRYPTFS_WATCHDOG_LIVENESS_SECONDS: int
     SQLITE_JOURNAL_MODE: str
     SQLITE_SYNCHRONOUS: str
     SQLITE_BUSY_TIMEOUT: int
     SQLITE_TEMP_STORE: str
+    SQL_SLOW_THRESHOLD_MILLISECONDS: int = 0
     UVICORN_HOST: str
     UVICORN_PORT: int
     API_PREFIX: str
     AUTH_TOKEN_TTL_SECONDS: int
     AUTH_ALLOW_PERMANENT_TOKENS: bool = False
     LRU_CACHE_MAX_BYTES: int = 0
+    REVISION_CACHE_MAX_BYTES: int = 0
     IMAGE_MAX_PIXELS: int = 52428800
+    AUDIT_ARCHIVE_AFTER_SECONDS: int = 0
+    AUDIT_ARCHIVE_INTERVAL_SECONDS: int = 3600
+    TRASH_RECLAIM_INTERVAL_SECONDS: int = 60
+    INTEGRITY_SCAN_INTERVAL_SECONDS: int = 300
+    INTEGRITY_SCAN_PASS_INTERVAL_SECONDS: int = 86400
+    INTEGRITY_SCAN_BYTES_PER_SECOND: int = 8388608
+    INTEGRITY_SCAN_IOPS: int = 50
+    INTEGRITY_SCAN_MAX_ACTIVE_REQUESTS: int = 2
+    REVISIONS_COMPACT_INTERVAL_SECONDS: int = 3600
+    REVISIONS_KEEP_LAST: int = 0
+    REVISIONS_KEEP_DAILY: int = 0
+    REVISIONS_KEEP_WEEKLY: int = 0
+    REVISIONS_KEEP_MONTHLY: int = 0
+    REVISIONS_MAX_BYTES_PER_FILE: int = 0
+    UPLOAD_SESSION_TTL_SECONDS: int = 86400
+    UPLOAD_SESSIONS_EXPIRE_INTERVAL_SECONDS: int = 600
+    THUMBNAILS_GENERATE_INTERVAL_SECONDS: int = 60
+    METRICS_SAMPLE_INTERVAL_SECONDS: int = 0
+    METRICS_HISTORY_SECONDS: int = 3600
+    UPLOADS_MAX_BYTES_IN_FLIGHT: int = 0
+    UPLOADS_MAX_BYTES_IN_FLIGHT_PER_USER: int = 0
+    UPLOADS_MIN_FREE_BYTES: int = 0
+    FILES_IMPORT_MAX_EXTRACTED_BYTES: int = 10737418240
+    RATE_LIMIT_TOKENS_PER_SECOND: float = 0
+    RATE_LIMIT_BURST_TOKENS: int = 0
+    RATE_LIMIT_COST_LIGHT: int = 1
+    RATE_LIMIT_COST_MEDIUM: int = 5
+    RATE_LIMIT_COST_HEAVY: int = 20
+    CRYPTO_MAX_WORKERS: int = 2
     CORS_ALLOW_ORIGINS: str = ""
     CORS_MAX_AGE_SECONDS: int = 0
     ENABLED_EXTENSIONS: str = ""
@@ -96,6 +135,17 @@ class Config(BaseSettings):
     def SQLITE_URL(self) -> str:
         return "sqlite+aiosqlite:///" + self.SQLITE_PATH
 
+    @cached_property
+    def SQLITE_AUDIT_PATH(self) -> str:
+        return os.path.join(
+            self.SQLITE_DIR,
+            SQLITE_AUDIT_FILENAME,
+        )
+
+    @cached_property
+    def SQLITE_AUDIT_URL(self) -> str:
+        return "sqlite+aiosqlite:///" + self.SQLITE_AUDIT_PATH
+
     @cached_property
     def FILES_DIR(self) -> str:
         return os.path.join(
@@ -124,6 +174,34 @@ class Config(BaseSettings):
             FILES_TMP_DIRNAME,
         )
 
+    @cached_property
+    def FILES_TRASH_DIR(self) -> str:
+        return os.path.join(
+            self.GOCRYPTFS_MOUNTPOINT,
+            FILES_TRASH_DIRNAME,
+        )
+
+    @cached_property
+    def FILES_INTENTS_DIR(self) -> str:
+        return os.path.join(
+            self.GOCRYPTFS_MOUNTPOINT,
+            FILES_INTENTS_DIRNAME,
+        )
+
+    @cached_property
+    def FILES_UPLOADS_DIR(self) -> str:
+        return os.path.join(
+            self.GOCRYPTFS_MOUNTPOINT,
+            FILES_UPLOADS_DIRNAME,
+        )
+
+    @cached_property
+    def AUDIT_ARCHIVE_DIR(self) -> str:
+        return os.path.join(
+            self.GOCRYPTFS_MOUNTPOINT,
+            AUDIT_ARCHIVE_DIRNAME,
+        )
+
     @cached_property
     def JWT_SIGNING_KEY_PATH(self) -> str:
         return os.path.join(
@@ -50,9 +50,19 @@ GOCRYPTFS_MOUNTPOINT_DIRNAME = "mountpoint"
 GOCRYPTFS_CIPHERDIR_LOCK_PATH = "/tmp/hidden-gocryptfs-cipherdir.lock"
 
 # SQLite storage inside encrypted filesystem.
-# Defines DB directory and database filename.
+# Defines DB directory and main and audit database filenames.
 SQLITE_DIRNAME = "db"
 SQLITE_FILENAME = "hidden.db"
+SQLITE_AUDIT_FILENAME = "audit.db"
+
+# Alembic configuration file, its per-database sections and the
+# directories of their revision scripts.
+# Each section keeps its own version table in its own SQLite file.
+ALEMBIC_INI_PATH = "/opt/hidden/alembic.ini"
+ALEMBIC_MAIN_SECTION = "alembic"
+ALEMBIC_AUDIT_SECTION = "audit"
+ALEMBIC_MAIN_VERSIONS_DIR = "/opt/hidden/alembic/versions"
+ALEMBIC_AUDIT_VERSIONS_DIR = "/opt/hidden/alembic/audit_versions"
 
 # File processing and detection parameters.
 # Defines chunk size and MIME sniffing limits.
@@ -66,6 +76,80 @@ FILES_TMP_DIRNAME = "tmp"
 FILES_MAX_FOLDER_DEPTH = 32
 FILES_MAX_PATH_LENGTH_BYTES = 4096
 
+# Bulk file operations.
+# Defines request size limit and number of files per transaction.
+FILES_BULK_MAX_ITEMS = 1000
+FILES_BULK_BATCH_SIZE = 250
+
+# Patch-based text edits.
+# Defines the number of ranges accepted in one request.
+FILE_PATCH_MAX_RANGES = 1000
+
+# Streaming archive downloads and archive imports.
+# Defines the number of files and folders accepted in one archive.
+FILES_ARCHIVE_MAX_ITEMS = 10000
+
+# Trash for recursively deleted folder trees on the encrypted mount.
+# Defines trash layout and number of files reclaimed per job run.
+FILES_TRASH_DIRNAME = "trash"
+FILES_TRASH_TREE_DIRNAME = "tree"
+FILES_TRASH_MANIFEST_FILENAME = "manifest.json"
+FILES_TRASH_PENDING_FILENAME = "manifest.pending"
+FILES_TRASH_RECLAIM_MAX_FILES_PER_RUN = 1000
+
+# Intent journal for in-flight file operations on the encrypted mount.
+# Defines journal directory and intent file suffix.
+FILES_INTENTS_DIRNAME = "intents"
+FILES_INTENT_SUFFIX = ".json"
+
+# Resumable upload sessions on the encrypted mount.
+# Defines staging directory and sessions expired per job run.
+FILES_UPLOADS_DIRNAME = "uploads"
+UPLOAD_SESSIONS_EXPIRE_BATCH_SIZE = 100
+
+# Background thumbnail generation.
+# Defines the number of image files checked per job run.
+THUMBNAILS_GENERATE_BATCH_SIZE = 50
+
+# Admission control for requests that write file content.
+# Defines free space cache lifetime and Retry-After hints (seconds).
+UPLOAD_ADMISSION_STATVFS_TTL_SECONDS = 5
+UPLOAD_ADMISSION_BUSY_RETRY_AFTER_SECONDS = 5
+UPLOAD_ADMISSION_STORAGE_RETRY_AFTER_SECONDS = 300
+
+# Background integrity scan of the encrypted storage.
+# Defines cursor variable, batch and run bounds, and report size.
+INTEGRITY_SCAN_VARIABLE_NAMESPACE = "integrity_scan"
+INTEGRITY_SCAN_VARIABLE_KEY = "state"
+INTEGRITY_SCAN_BATCH_ROWS = 50
+INTEGRITY_SCAN_MAX_SECONDS_PER_RUN = 60
+INTEGRITY_SCAN_MAX_FINDINGS = 1000
+INTEGRITY_SCAN_ORPHAN_GRACE_SECONDS = 3600
+INTEGRITY_SCAN_PAUSE_SECONDS = 1
+
+# Revision retention and background compaction.
+# Defines per-folder policy variables and compaction batch bounds.
+REVISION_RETENTION_VARIABLE_NAMESPACE = "revision_retention"
+REVISION_RETENTION_FOLDER_KEY_PREFIX = "folder-"
+REVISION_RETENTION_BATCH_FILES = 100
+REVISION_COMPACT_MAX_REVISIONS_PER_RUN = 1000
+
+# Delta storage of text file revisions.
+# Defines the largest delta-encoded content and the keyframe interval:
+# at most this many revisions are read to rebuild one revision.
+REVISION_DELTA_MAX_BYTES = 16777216
+REVISION_DELTA_KEYFRAME_INTERVAL = 16
+
+# Audit archive segments on the encrypted mount.
+# Defines archive directory and number of rows sealed per segment.
+AUDIT_ARCHIVE_DIRNAME = "audit"
+AUDIT_SEGMENT_ROWS = 10000
+AUDIT_ARCHIVE_MAX_SEGMENTS_PER_RUN = 10
+
+# Audit export streaming.
+# Defines number of live rows read per short audit transaction.
+AUDIT_EXPORT_BATCH_ROWS = 1000
+
 # First admin bootstrap marker (secrets volume).
 # Presence indicates initial admin registration completed; readable
 # without cipherdir mount for onboarding UX (see app/config.py path).
@@ -84,4 +168,15 @@ AUTH_PASSWORD_VERIFIED_TTL_SECONDS = 120
 REGISTER_ATTEMPTS_LIMIT = 200
 REGISTER_ATTEMPTS_WINDOW_SECONDS = 60
 
+# Per-user rate limiting of expensive endpoints.
+# Defines the number of idle buckets above which full ones are dropped.
+RATE_LIMIT_MAX_BUCKETS = 1024
+
 OBSCURED_VALUE = "*" * 8
+
+# Log queue occupancy above which records below WARNING are dropped
+# instead of enqueued, as a fraction of LOG_QUEUE_SIZE.
+LOG_QUEUE_SHED_RATIO = 0.8
+
+# Number of distinct normalized statements kept by the slow SQL log.
+SQL_SLOW_MAX_STATEMENTS = 256
@@ -11,6 +11,7 @@ from typing import Any
 # 1. request_start_time - timestamp when the request processing started
 # 2. request_uuid - identifier of the current request
 # 3. current_user_id - identifier of the current user
+# 4. request_timings - seconds spent per timing category (app/timing.py)
 
 _context: ContextVar[dict[str, Any]] = ContextVar(
     "context",
@@ -10,3 +10,11 @@ class Base(DeclarativeBase):
     Registers models in the shared SQLAlchemy metadata.
     """
     pass
+
+
+class AuditBase(DeclarativeBase):
+    """
+    Declarative base class for ORM models stored in the audit database.
+    Kept in a separate metadata so each database migrates independently.
+    """
+    pass
@@ -1,6 +1,8 @@
 # app/db/engine.py
 # SPDX-License-Identifier: GPL-3.0-only
 
+import time
+
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -8,7 +10,10 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+from app.audit import discard_audit, flush_audit
 from app.config import get_config
+from app.db.slow_sql import explain_query_plan, get_slow_sql_log
+from app.timing import TimingCategory, add_timing
 
 config = get_config()
 
@@ -28,12 +33,46 @@ config = get_config()
 # NORMAL allows gocryptfs to buffer writes, which leads to data loss when
 # the container stops before the FUSE layer flushes.
 
+
+# NOTE (ADR-70): Audit is stored in a separate database file.
+# The audit table lives in its own SQLite file with its own engine,
+# rollback journal and PRAGMAs, so audit writes never extend the main
+# database transaction or grow the file scanned by integrity checks.
+# AuditedSession forwards staged audit rows after each main commit.
+
 engine = create_async_engine(
     config.SQLITE_URL,
 )
 
+audit_engine = create_async_engine(
+    config.SQLITE_AUDIT_URL,
+)
+
+
+class AuditedSession(AsyncSession):
+    """
+    Main database session that persists staged audit events into the
+    audit database after commit and discards them on rollback.
+    """
+
+    async def commit(self) -> None:
+        await super().commit()
+        await flush_audit(self)
+
+    async def rollback(self) -> None:
+        discard_audit(self)
+        await super().rollback()
+
+
 SessionLocal = async_sessionmaker(
     bind=engine,
+    class_=AuditedSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+AuditSessionLocal = async_sessionmaker(
+    bind=audit_engine,
     class_=AsyncSession,
     autoflush=False,
     expire_on_commit=False,
@@ -41,6 +80,7 @@ SessionLocal = async_sessionmaker(
 
 
 @event.listens_for(engine.sync_engine, "connect")
+@event.listens_for(audit_engine.sync_engine, "connect")
 def set_sqlite_pragma(dbapi_connection, _connection_record) -> None:
     """
     Apply SQLite PRAGMA settings for each new database connection.
@@ -55,16 +95,60 @@ def set_sqlite_pragma(dbapi_connection, _connection_record) -> None:
     cursor.close()
 
 
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+@event.listens_for(audit_engine.sync_engine, "before_cursor_execute")
+def start_sql_timing(
+    conn, _cursor, _statement, _parameters, _context, _executemany,
+) -> None:
+    """
+    Remember when the statement was sent to the database.
+    """
+    conn.info["sql_start_time"] = time.perf_counter()
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+@event.listens_for(audit_engine.sync_engine, "after_cursor_execute")
+def stop_sql_timing(
+    conn, _cursor, statement, parameters, _context, executemany,
+) -> None:
+    """
+    Count the statement execution time as SQL time of the request and
+    record the statement in the slow SQL log when it exceeds the
+    threshold. A failed statement is not counted; the next one
+    overwrites its start time.
+    """
+    start_time = conn.info.pop("sql_start_time", None)
+    if start_time is None:
+        return
+
+    elapsed_time = time.perf_counter() - start_time
+    add_timing(TimingCategory.SQL, elapsed_time)
+
+    slow_sql_log = get_slow_sql_log()
+    if slow_sql_log.is_slow(elapsed_time):
+        if executemany:
+            parameters = parameters[0] if parameters else None
+        slow_sql_log.record(
+            statement,
+            elapsed_time,
+            lambda: explain_query_plan(
+                conn.connection.dbapi_connection, statement, parameters,
+            ),
+        )
+
+
 def load_all_models() -> None:
     """
     Import all ORM models so SQLAlchemy can resolve relationships.
     """
     from app.models.audit import Audit  # noqa F401
+    from app.models.audit_segment import AuditSegment  # noqa F401
     from app.models.file import File  # noqa F401
     from app.models.file_comment import FileComment  # noqa F401
     from app.models.file_revision import FileRevision  # noqa F401
     from app.models.file_tag import FileTag  # noqa F401
     from app.models.file_thumbnail import FileThumbnail  # noqa F401
     from app.models.folder import Folder  # noqa F401
+    from app.models.upload_session import UploadSession  # noqa F401
     from app.models.user import User  # noqa F401
     from app.models.variable import Variable  # noqa F401
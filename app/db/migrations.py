@@ -1,6 +1,7 @@
 # app/db/migrations.py
 # SPDX-License-Identifier: GPL-3.0-only
 
+import ast
 import asyncio
 import sqlite3
 from pathlib import Path
@@ -8,23 +9,135 @@ from pathlib import Path
 from alembic import command
 from alembic.config import Config
 
+from app.config import get_config
+from app.constants import (
+    ALEMBIC_AUDIT_SECTION,
+    ALEMBIC_AUDIT_VERSIONS_DIR,
+    ALEMBIC_INI_PATH,
+    ALEMBIC_MAIN_SECTION,
+    ALEMBIC_MAIN_VERSIONS_DIR,
+)
+
+
+# NOTE (ADR-83): Mount skips Alembic when the schema is current.
+# Loading the Alembic environment imports every model and opens its own
+# engine, which is paid on each unlock although most mounts find the
+# schema already at head. The head revisions are read from the revision
+# scripts without importing them and compared with the alembic_version
+# table; Alembic only runs for a database that is behind.
 
 def _upgrade_db_sync() -> None:
-    alembic_cfg = Config(str(Path("/opt/hidden/alembic.ini")))
-    command.upgrade(alembic_cfg, "head")
+    config = get_config()
+
+    # NOTE (ADR-70): Audit is stored in a separate database file.
+    # The audit database is upgraded first: the main migration that
+    # drops the legacy audit table copies its rows into the audit
+    # database and expects the audit schema to exist already.
+    for ini_section, db_path, versions_dir in (
+        (
+            ALEMBIC_AUDIT_SECTION,
+            config.SQLITE_AUDIT_PATH,
+            ALEMBIC_AUDIT_VERSIONS_DIR,
+        ),
+        (
+            ALEMBIC_MAIN_SECTION,
+            config.SQLITE_PATH,
+            ALEMBIC_MAIN_VERSIONS_DIR,
+        ),
+    ):
+        if _get_db_revisions(db_path) == _get_head_revisions(versions_dir):
+            continue
+
+        alembic_cfg = Config(
+            str(Path(ALEMBIC_INI_PATH)),
+            ini_section=ini_section,
+        )
+        command.upgrade(alembic_cfg, "head")
+
+
+def _get_head_revisions(versions_dir: str) -> set[str]:
+    """
+    Return the head revisions of the revision scripts in the directory:
+    revisions that are not the down revision of any other script.
+    """
+    revisions = set()
+    down_revisions = set()
+
+    for path in Path(versions_dir).glob("*.py"):
+        values = _read_revision_identifiers(path)
+        if "revision" not in values:
+            continue
+
+        revisions.add(values["revision"])
+        down_revision = values.get("down_revision")
+        if isinstance(down_revision, str):
+            down_revisions.add(down_revision)
+        elif down_revision:
+            down_revisions.update(down_revision)
+
+    return revisions - down_revisions
+
+
+def _read_revision_identifiers(path: Path) -> dict:
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    values = {}
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            target = node.target
+        else:
+            continue
+
+        if (
+            isinstance(target, ast.Name)
+            and target.id in ("revision", "down_revision")
+        ):
+            values[target.id] = ast.literal_eval(node.value)
+
+    return values
+
+
+def _get_db_revisions(db_path: str) -> set[str]:
+    """
+    Return the revisions stored in the alembic_version table, or an
+    empty set when the database or the table does not exist yet.
+    """
+    if not Path(db_path).is_file():
+        return set()
+
+    conn = sqlite3.connect(Path(db_path).as_uri() + "?mode=ro", uri=True)
+    try:
+        rows = conn.execute("SELECT version_num FROM alembic_version")
+        return {row[0] for row in rows.fetchall()}
+    except sqlite3.OperationalError:
+        return set()
+    finally:
+        conn.close()
 
 
 async def upgrade_db() -> None:
     """
-    Apply database migrations after encrypted storage is mounted.
+    Apply main and audit database migrations after encrypted storage
+    is mounted. A database whose schema is already at head is left
+    untouched without loading the Alembic environment.
     """
     await asyncio.to_thread(_upgrade_db_sync)
 
 
-def _check_db_integrity_sync(db_path: str) -> None:
+def _check_db_integrity_sync(
+    db_path: str,
+    quick: bool = False,
+    table: str | None = None,
+) -> None:
+    pragma = "quick_check" if quick else "integrity_check"
+    if table is not None:
+        pragma += '("%s")' % table.replace('"', '""')
+
     conn = sqlite3.connect(db_path)
     try:
-        rows = conn.execute("PRAGMA integrity_check").fetchall()
+        rows = conn.execute(f"PRAGMA {pragma}").fetchall()
     finally:
         conn.close()
 
@@ -35,13 +148,37 @@ def _check_db_integrity_sync(db_path: str) -> None:
         )
 
 
-async def check_db_integrity(db_path: str) -> None:
+async def check_db_integrity(
+    db_path: str,
+    quick: bool = False,
+    table: str | None = None,
+) -> None:
     """
-    Run PRAGMA integrity_check on the database file.
+    Run PRAGMA integrity_check (or the cheaper quick_check, which skips
+    index content verification) on the database file, or only on the
+    given table and its indexes.
 
-    Must be called after upgrade_db() and before the application starts
-    serving requests. Raises RuntimeError if the database is corrupted so
-    that the mount is rolled back and the operator is alerted early rather
-    than allowing silent data corruption to propagate.
+    Raises RuntimeError if the database is corrupted so that the mount
+    is rolled back or lockdown mode is enabled and the operator is
+    alerted early rather than allowing silent data corruption to
+    propagate.
     """
-    await asyncio.to_thread(_check_db_integrity_sync, db_path)
+    await asyncio.to_thread(_check_db_integrity_sync, db_path, quick, table)
+
+
+def _list_db_tables_sync(db_path: str) -> list[str]:
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' "
+            "ORDER BY name"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    return [row[0] for row in rows]
+
+
+async def list_db_tables(db_path: str) -> list[str]:
+    """Return the names of the tables of the database file."""
+    return await asyncio.to_thread(_list_db_tables_sync, db_path)
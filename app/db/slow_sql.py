@@ -0,0 +1,187 @@
+# app/db/slow_sql.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import hashlib
+import logging
+import re
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+from app.config import get_config
+from app.constants import SQL_SLOW_MAX_STATEMENTS
+from app.events import Events as E
+
+log = logging.getLogger(__name__)
+
+# NOTE (ADR-90): Slow SQL statements are aggregated in memory.
+# Statements that run longer than SQL_SLOW_THRESHOLD_MILLISECONDS are
+# grouped by their normalized text: string and number literals become
+# "?" and lists of placeholders collapse, so statements built from
+# different filter values share one entry. Parameters are never stored
+# or logged (ADR-27); the EXPLAIN QUERY PLAN of a statement is captured
+# once, when it is first found slow, by binding its parameters on the
+# same connection. Entries are kept per process and the least costly
+# one is dropped when the table is full.
+
+_EXPLAINABLE_RE = re.compile(r"^\s*(SELECT|INSERT|UPDATE|DELETE|WITH)\b", re.I)
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@dataclass
+class SlowStatement:
+    """Aggregated executions of one normalized slow statement."""
+
+    statement_id: str
+    statement: str
+    plan: list[str] | None
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    last_seen_at: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "statement_id": self.statement_id,
+            "statement": self.statement,
+            "count": self.count,
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.total_seconds / self.count,
+            "max_seconds": self.max_seconds,
+            "last_seen_at": self.last_seen_at,
+            "plan": self.plan,
+        }
+
+
+class SlowStatementLog:
+    """
+    Process-local table of slow statements keyed by normalized text.
+    A non-positive threshold disables recording. Not thread-safe by
+    design: statements finish on the event loop thread.
+    """
+
+    def __init__(
+        self,
+        threshold_seconds: float,
+        max_statements: int = SQL_SLOW_MAX_STATEMENTS,
+    ) -> None:
+        self.threshold_seconds = threshold_seconds
+        self._max_statements = max_statements
+        self._entries: dict[str, SlowStatement] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold_seconds > 0
+
+    def is_slow(self, elapsed_seconds: float) -> bool:
+        return self.enabled and elapsed_seconds >= self.threshold_seconds
+
+    def record(
+        self,
+        statement: str,
+        elapsed_seconds: float,
+        explain: Callable[[], list[str] | None],
+    ) -> SlowStatement:
+        """
+        Add a slow execution of statement. explain is called to capture
+        the query plan only when the statement is seen for the first
+        time.
+        """
+        normalized = normalize_statement(statement)
+        entry = self._entries.get(normalized)
+
+        if entry is None:
+            if len(self._entries) >= self._max_statements:
+                cheapest = min(
+                    self._entries.values(),
+                    key=lambda item: item.total_seconds,
+                )
+                del self._entries[cheapest.statement]
+
+            entry = self._entries[normalized] = SlowStatement(
+                statement_id=_statement_id(normalized),
+                statement=normalized,
+                plan=explain(),
+            )
+
+        entry.count += 1
+        entry.total_seconds += elapsed_seconds
+        entry.max_seconds = max(entry.max_seconds, elapsed_seconds)
+        entry.last_seen_at = time.time()
+
+        log.warning(
+            "event=%s statement_id=%s elapsed_time=%.6f",
+            E.SQL_STATEMENT_SLOW,
+            entry.statement_id,
+            elapsed_seconds,
+        )
+        return entry
+
+    def top(self, limit: int, order_by: str) -> list[SlowStatement]:
+        """
+        Return at most limit entries with the largest total_seconds,
+        max_seconds or count.
+        """
+        return sorted(
+            self._entries.values(),
+            key=lambda item: getattr(item, order_by),
+            reverse=True,
+        )[:limit]
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Return the statement with literals replaced by placeholders,
+    placeholder lists collapsed and whitespace squeezed.
+    """
+    statement = _STRING_RE.sub("?", statement)
+    statement = _NUMBER_RE.sub("?", statement)
+    statement = _PLACEHOLDER_LIST_RE.sub("(?)", statement)
+    return _WHITESPACE_RE.sub(" ", statement).strip()
+
+
+def explain_query_plan(
+    dbapi_connection,
+    statement: str,
+    parameters: Sequence | dict | None,
+) -> list[str] | None:
+    """
+    Return the EXPLAIN QUERY PLAN of a statement as detail lines
+    indented by depth, or None when the statement cannot be explained.
+    """
+    if not _EXPLAINABLE_RE.match(statement):
+        return None
+
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters or ())
+        rows = cursor.fetchall()
+    except Exception:
+        log.debug("event=%s", E.SQL_EXPLAIN_FAILED, exc_info=True)
+        return None
+    finally:
+        cursor.close()
+
+    depths: dict[int, int] = {}
+    plan = []
+    for node_id, parent_id, _, detail in rows:
+        depths[node_id] = depths.get(parent_id, -1) + 1
+        plan.append("  " * depths[node_id] + detail)
+    return plan
+
+
+def _statement_id(normalized: str) -> str:
+    return hashlib.sha256(normalized.encode()).hexdigest()[:16]
+
+
+@lru_cache(maxsize=1)
+def get_slow_sql_log() -> SlowStatementLog:
+    """
+    Return the process-wide slow statement log.
+    """
+    threshold = get_config().SQL_SLOW_THRESHOLD_MILLISECONDS / 1000
+    return SlowStatementLog(threshold_seconds=threshold)
@@ -0,0 +1,33 @@
+# app/dependencies/rate_limit.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import logging
+
+from app.context import get_context_var
+from app.errors import TooManyRequestsError
+from app.events import Events as E
+from app.runtime.rate_limit import RateLimitCost, get_rate_limiter
+
+log = logging.getLogger(__name__)
+
+
+def require_rate_limit(cost: RateLimitCost):
+    async def rate_limit() -> None:
+        """
+        Dependency that takes the tokens of the cost class from the
+        bucket of the current user. It reads current_user_id from the
+        request context, so it must be declared after require_access
+        in the route signature. Raises TooManyRequestsError with
+        Retry-After when the bucket holds too few tokens.
+        """
+        user_id = get_context_var("current_user_id")
+        retry_after = get_rate_limiter().acquire(user_id, cost)
+
+        if retry_after is not None:
+            log.warning(
+                "event=%s user_id=%s cost=%s retry_after=%s",
+                E.RATE_LIMIT_EXCEEDED, user_id, cost, retry_after,
+            )
+            raise TooManyRequestsError(retry_after=retry_after)
+
+    return rate_limit
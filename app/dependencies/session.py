@@ -5,7 +5,7 @@ from collections.abc import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.engine import SessionLocal
+from app.db.engine import AuditSessionLocal, SessionLocal
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -15,3 +15,12 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
     async with SessionLocal() as session:
         yield session
+
+
+async def get_audit_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide an audit database session for a single request.
+    The session is automatically closed after the request finishes.
+    """
+    async with AuditSessionLocal() as session:
+        yield session
@@ -39,7 +39,18 @@ class ResourceLockedError(Exception):
 
 class TooManyRequestsError(Exception):
     """Raised when request rate exceeds allowed limits (429)."""
-    pass
+
+    def __init__(self, retry_after: int | None = None) -> None:
+        super().__init__()
+        self.retry_after = retry_after
+
+
+class InsufficientStorageError(Exception):
+    """Storage has too little free space for the request (507)."""
+
+    def __init__(self, retry_after: int | None = None) -> None:
+        super().__init__()
+        self.retry_after = retry_after
 
 
 # NOTE (ADR-33): Errors are split into resource and field-level types.
@@ -20,6 +20,11 @@ class Events:
     REQUEST_FAILED = "request:failed"
     REQUEST_COMPLETED = "request:completed"
 
+    LOG_RECORDS_DROPPED = "log:records_dropped"
+
+    SQL_STATEMENT_SLOW = "sql:statement_slow"
+    SQL_EXPLAIN_FAILED = "sql:explain_failed"
+
     CIPHERDIR_CREATE_STARTED = "cipherdir_create:started"
     CIPHERDIR_CREATE_ALREADY_CREATED = "cipherdir_create:already_created"
     CIPHERDIR_CREATE_PASSPHRASE_EXISTS = "cipherdir_create:passphrase_exists"
@@ -146,6 +151,7 @@ class Events:
     FOLDER_DELETE_HAS_FILES = "folder_delete:has_files"
     FOLDER_DELETE_FAILED = "folder_delete:failed"
     FOLDER_DELETE_INCONSISTENT = "folder_delete:inconsistent"
+    FOLDER_DELETE_TRASH_SEAL_FAILED = "folder_delete:trash_seal_failed"
     FOLDER_DELETE_COMPLETED = "folder_delete:completed"
 
     FOLDER_WRITE_PROTECT_STARTED = "folder_write_protect:started"
@@ -168,10 +174,59 @@ class Events:
     FILE_UPLOAD_THUMBNAIL_FAILED = "file_upload:thumbnail_failed"
     FILE_UPLOAD_COMPLETED = "file_upload:completed"
 
+    UPLOAD_SESSION_CREATE_STARTED = "upload_session_create:started"
+    UPLOAD_SESSION_CREATE_FOLDER_NOT_FOUND = "upload_session_create:folder_not_found"  # noqa: E501
+    UPLOAD_SESSION_CREATE_FOLDER_WRITE_PROTECTED = "upload_session_create:folder_write_protected"  # noqa: E501
+    UPLOAD_SESSION_CREATE_COMPLETED = "upload_session_create:completed"
+
+    UPLOAD_SESSION_SELECT_STARTED = "upload_session_select:started"
+    UPLOAD_SESSION_SELECT_NOT_FOUND = "upload_session_select:not_found"
+    UPLOAD_SESSION_SELECT_COMPLETED = "upload_session_select:completed"
+
+    UPLOAD_SESSION_WRITE_STARTED = "upload_session_write:started"
+    UPLOAD_SESSION_WRITE_NOT_FOUND = "upload_session_write:not_found"
+    UPLOAD_SESSION_WRITE_OFFSET_INVALID = "upload_session_write:offset_invalid"  # noqa: E501
+    UPLOAD_SESSION_WRITE_COMPLETED = "upload_session_write:completed"
+
+    UPLOAD_SESSION_COMMIT_STARTED = "upload_session_commit:started"
+    UPLOAD_SESSION_COMMIT_NOT_FOUND = "upload_session_commit:not_found"
+    UPLOAD_SESSION_COMMIT_INCOMPLETE = "upload_session_commit:incomplete"
+    UPLOAD_SESSION_COMMIT_DATA_LOST = "upload_session_commit:data_lost"
+    UPLOAD_SESSION_COMMIT_CLOSE_FAILED = "upload_session_commit:close_failed"  # noqa: E501
+    UPLOAD_SESSION_COMMIT_COMPLETED = "upload_session_commit:completed"
+
+    UPLOAD_SESSION_EXPIRE_STARTED = "upload_session_expire:started"
+    UPLOAD_SESSION_EXPIRE_SESSION_REMOVED = "upload_session_expire:session_removed"  # noqa: E501
+    UPLOAD_SESSION_EXPIRE_ORPHAN_REMOVED = "upload_session_expire:orphan_removed"  # noqa: E501
+    UPLOAD_SESSION_EXPIRE_COMPLETED = "upload_session_expire:completed"
+
     FILE_DOWNLOAD_STARTED = "file_download:started"
     FILE_DOWNLOAD_NOT_FOUND = "file_download:not_found"
+    FILE_DOWNLOAD_REVISION_CORRUPTED = "file_download:revision_corrupted"
     FILE_DOWNLOAD_COMPLETED = "file_download:completed"
 
+    FILE_ARCHIVE_STARTED = "file_archive:started"
+    FILE_ARCHIVE_NOT_FOUND = "file_archive:not_found"
+    FILE_ARCHIVE_TOO_MANY_ITEMS = "file_archive:too_many_items"
+    FILE_ARCHIVE_FILE_CHANGED = "file_archive:file_changed"
+    FILE_ARCHIVE_COMPLETED = "file_archive:completed"
+
+    FILE_IMPORT_STARTED = "file_import:started"
+    FILE_IMPORT_FOLDER_NOT_FOUND = "file_import:folder_not_found"
+    FILE_IMPORT_FOLDER_WRITE_PROTECTED = "file_import:folder_write_protected"
+    FILE_IMPORT_ARCHIVE_INVALID = "file_import:archive_invalid"
+    FILE_IMPORT_TOO_MANY_ITEMS = "file_import:too_many_items"
+    FILE_IMPORT_TOO_LARGE = "file_import:too_large"
+    FILE_IMPORT_STORAGE_LOW = "file_import:storage_low"
+    FILE_IMPORT_ENTRY_INVALID = "file_import:entry_invalid"
+    FILE_IMPORT_ENTRY_CONFLICT = "file_import:entry_conflict"
+    FILE_IMPORT_ENTRY_FAILED = "file_import:entry_failed"
+    FILE_IMPORT_DEPTH_LIMIT_EXCEEDED = "file_import:depth_limit_exceeded"
+    FILE_IMPORT_PATH_TOO_LONG = "file_import:path_too_long"
+    FILE_IMPORT_BATCH_FAILED = "file_import:batch_failed"
+    FILE_IMPORT_CLEANUP_FAILED = "file_import:cleanup_failed"
+    FILE_IMPORT_COMPLETED = "file_import:completed"
+
     FILE_SELECT_STARTED = "file_select:started"
     FILE_SELECT_NOT_FOUND = "file_select:not_found"
     FILE_SELECT_COMPLETED = "file_select:completed"
@@ -188,6 +243,10 @@ class Events:
     FILE_STARRED_CHANGE_FILE_NOT_FOUND = "file_starred_change:file_not_found"
     FILE_STARRED_CHANGE_COMPLETED = "file_starred_change:completed"
 
+    FILE_BULK_STARRED_CHANGE_STARTED = "file_bulk_starred_change:started"
+    FILE_BULK_STARRED_CHANGE_BATCH_FAILED = "file_bulk_starred_change:batch_failed"  # noqa: E501
+    FILE_BULK_STARRED_CHANGE_COMPLETED = "file_bulk_starred_change:completed"
+
     FILE_MOVE_STARTED = "file_move:started"
     FILE_MOVE_FILE_NOT_FOUND = "file_move:file_not_found"
     FILE_MOVE_FOLDER_NOT_FOUND = "file_move:folder_not_found"
@@ -198,6 +257,14 @@ class Events:
     FILE_MOVE_RESTORE_FAILED = "file_move:restore_failed"
     FILE_MOVE_COMPLETED = "file_move:completed"
 
+    FILE_BULK_MOVE_STARTED = "file_bulk_move:started"
+    FILE_BULK_MOVE_FOLDER_NOT_FOUND = "file_bulk_move:folder_not_found"
+    FILE_BULK_MOVE_DESTINATION_WRITE_PROTECTED = "file_bulk_move:destination_write_protected"  # noqa: E501
+    FILE_BULK_MOVE_ITEM_FAILED = "file_bulk_move:item_failed"
+    FILE_BULK_MOVE_BATCH_FAILED = "file_bulk_move:batch_failed"
+    FILE_BULK_MOVE_RESTORE_FAILED = "file_bulk_move:restore_failed"
+    FILE_BULK_MOVE_COMPLETED = "file_bulk_move:completed"
+
     FILE_ROTATE_STARTED = "file_rotate:started"
     FILE_ROTATE_FILE_NOT_FOUND = "file_rotate:file_not_found"
     FILE_ROTATE_NOT_IMAGE = "file_rotate:not_image"
@@ -227,6 +294,8 @@ class Events:
     FILE_EDIT_NOT_TEXT = "file_edit:not_text"
     FILE_EDIT_PARENT_WRITE_PROTECTED = "file_edit:parent_write_protected"
     FILE_EDIT_INCONSISTENT = "file_edit:inconsistent"
+    FILE_EDIT_BASE_CHANGED = "file_edit:base_changed"
+    FILE_EDIT_PATCH_INVALID = "file_edit:patch_invalid"
     FILE_EDIT_WRITE_FAILED = "file_edit:write_failed"
     FILE_EDIT_RESTORE_FAILED = "file_edit:restore_failed"
     FILE_EDIT_CLEANUP_COMPLETED = "file_edit:cleanup_completed"
@@ -242,6 +311,13 @@ class Events:
     FILE_DELETE_CLEANUP_REVISION_FAILED = "file_delete:cleanup_revision_failed"
     FILE_DELETE_COMPLETED = "file_delete:completed"
 
+    FILE_BULK_DELETE_STARTED = "file_bulk_delete:started"
+    FILE_BULK_DELETE_ITEM_FAILED = "file_bulk_delete:item_failed"
+    FILE_BULK_DELETE_BATCH_FAILED = "file_bulk_delete:batch_failed"
+    FILE_BULK_DELETE_RESTORE_FAILED = "file_bulk_delete:restore_failed"
+    FILE_BULK_DELETE_CLEANUP_FAILED = "file_bulk_delete:cleanup_failed"
+    FILE_BULK_DELETE_COMPLETED = "file_bulk_delete:completed"
+
     FILE_THUMBNAIL_RETRIEVE_STARTED = "file_thumbnail_retrieve:started"
     FILE_THUMBNAIL_RETRIEVE_NOT_FOUND = "file_thumbnail_retrieve:not_found"
     FILE_THUMBNAIL_RETRIEVE_COMPLETED = "file_thumbnail_retrieve:completed"
@@ -255,6 +331,10 @@ class Events:
     TAG_ADD_PARENT_WRITE_PROTECTED = "tag_add:parent_write_protected"
     TAG_ADD_COMPLETED = "tag_add:completed"
 
+    FILE_BULK_TAG_ADD_STARTED = "file_bulk_tag_add:started"
+    FILE_BULK_TAG_ADD_BATCH_FAILED = "file_bulk_tag_add:batch_failed"
+    FILE_BULK_TAG_ADD_COMPLETED = "file_bulk_tag_add:completed"
+
     TAG_DELETE_STARTED = "tag_delete:started"
     TAG_DELETE_FILE_NOT_FOUND = "tag_delete:file_not_found"
     TAG_DELETE_PARENT_WRITE_PROTECTED = "tag_delete:parent_write_protected"
@@ -312,4 +392,67 @@ class Events:
     AUTH_COMPLETED = "auth:completed"
 
     AUDIT_LIST_STARTED = "audit_list:started"
+    AUDIT_LIST_ORDER_UNSUPPORTED = "audit_list:order_unsupported"
     AUDIT_LIST_COMPLETED = "audit_list:completed"
+
+    AUDIT_EXPORT_STARTED = "audit_export:started"
+    AUDIT_EXPORT_COMPLETED = "audit_export:completed"
+    AUDIT_EXPORT_STREAMED = "audit_export:streamed"
+    AUDIT_EXPORT_FAILED = "audit_export:failed"
+
+    AUDIT_WRITE_FAILED = "audit_write:failed"
+
+    AUDIT_ARCHIVE_STARTED = "audit_archive:started"
+    AUDIT_ARCHIVE_SEGMENT_SEALED = "audit_archive:segment_sealed"
+    AUDIT_ARCHIVE_FAILED = "audit_archive:failed"
+    AUDIT_ARCHIVE_COMPLETED = "audit_archive:completed"
+    AUDIT_SEGMENT_CHECKSUM_MISMATCH = "audit_segment:checksum_mismatch"
+
+    TRASH_RECLAIM_STARTED = "trash_reclaim:started"
+    TRASH_RECLAIM_ENTRY_REMOVED = "trash_reclaim:entry_removed"
+    TRASH_RECLAIM_COMPLETED = "trash_reclaim:completed"
+
+    INTENT_REPLAY_STARTED = "intent_replay:started"
+    INTENT_REPLAY_APPLIED = "intent_replay:applied"
+    INTENT_REPLAY_FAILED = "intent_replay:failed"
+    INTENT_REPLAY_TMP_CLEARED = "intent_replay:tmp_cleared"
+    INTENT_REPLAY_COMPLETED = "intent_replay:completed"
+    INTENT_REMOVE_FAILED = "intent:remove_failed"
+
+    INTEGRITY_SCAN_STARTED = "integrity_scan:started"
+    INTEGRITY_SCAN_FINDING = "integrity_scan:finding"
+    INTEGRITY_SCAN_PASS_COMPLETED = "integrity_scan:pass_completed"
+    INTEGRITY_SCAN_COMPLETED = "integrity_scan:completed"
+
+    DB_INTEGRITY_CHECK_STARTED = "db_integrity_check:started"
+    DB_INTEGRITY_CHECK_INTERRUPTED = "db_integrity_check:interrupted"
+    DB_INTEGRITY_CHECK_FAILED = "db_integrity_check:failed"
+    DB_INTEGRITY_CHECK_COMPLETED = "db_integrity_check:completed"
+
+    INTEGRITY_REPORT_RETRIEVE_STARTED = "integrity_report_retrieve:started"
+    INTEGRITY_REPORT_RETRIEVE_COMPLETED = "integrity_report_retrieve:completed"  # noqa: E501
+
+    REVISION_RETENTION_POLICY_INVALID = "revision_retention:policy_invalid"
+
+    REVISION_COMPACT_STARTED = "revision_compact:started"
+    REVISION_COMPACT_FILE_COMPACTED = "revision_compact:file_compacted"
+    REVISION_COMPACT_FILE_FAILED = "revision_compact:file_failed"
+    REVISION_COMPACT_CLEANUP_FAILED = "revision_compact:cleanup_failed"
+    REVISION_COMPACT_COMPLETED = "revision_compact:completed"
+
+    THUMBNAIL_GENERATE_STARTED = "thumbnail_generate:started"
+    THUMBNAIL_GENERATE_FILE_FAILED = "thumbnail_generate:file_failed"
+    THUMBNAIL_GENERATE_CLEANUP_FAILED = "thumbnail_generate:cleanup_failed"
+    THUMBNAIL_GENERATE_COMPLETED = "thumbnail_generate:completed"
+
+    UPLOAD_ADMISSION_BUSY = "upload_admission:busy"
+    UPLOAD_ADMISSION_STORAGE_LOW = "upload_admission:storage_low"
+
+    RATE_LIMIT_EXCEEDED = "rate_limit:exceeded"
+
+    REVISION_RETENTION_ESTIMATE_STARTED = "revision_retention_estimate:started"  # noqa: E501
+    REVISION_RETENTION_ESTIMATE_COMPLETED = "revision_retention_estimate:completed"  # noqa: E501
+
+    SCHEDULER_JOB_STARTED = "scheduler_job:started"
+    SCHEDULER_JOB_FAILED = "scheduler_job:failed"
+    SCHEDULER_JOB_COMPLETED = "scheduler_job:completed"
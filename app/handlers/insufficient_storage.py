@@ -0,0 +1,26 @@
+# app/handlers/insufficient_storage.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+
+from app.errors import InsufficientStorageError
+
+
+async def insufficient_storage_handler(
+    request: Request,
+    exc: InsufficientStorageError,
+) -> JSONResponse:
+    """
+    Handle low free space on the storage by returning a 507 response,
+    with a Retry-After header when the error carries one.
+    """
+    headers = None
+    if exc.retry_after is not None:
+        headers = {"Retry-After": str(exc.retry_after)}
+
+    return JSONResponse(
+        status_code=status.HTTP_507_INSUFFICIENT_STORAGE,
+        content={"detail": "Insufficient storage"},
+        headers=headers,
+    )
@@ -12,12 +12,18 @@ async def too_many_requests_handler(
     exc: TooManyRequestsError,
 ) -> JSONResponse:
     """
-    Handle rate limit violations by returning a 429 response.
+    Handle rate limit violations by returning a 429 response, with a
+    Retry-After header when the error carries one.
 
-    Used for registration and master-password attempt spacing, among
-    other TooManyRequestsError sources.
+    Used for registration and master-password attempt spacing and for
+    upload admission, among other TooManyRequestsError sources.
     """
+    headers = None
+    if exc.retry_after is not None:
+        headers = {"Retry-After": str(exc.retry_after)}
+
     return JSONResponse(
         status_code=status.HTTP_429_TOO_MANY_REQUESTS,
         content={"detail": "Too many requests"},
+        headers=headers,
     )
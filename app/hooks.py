@@ -10,6 +10,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_config
 from app.events import Events as E
+from app.runtime.metrics import HOOK_FAILURES
+from app.timing import TimingCategory, timed
 
 # NOTE (ADR-30): Hooks and extensions trust model.
 # Extensions are loaded via environment configuration (.env) and,
@@ -56,17 +58,24 @@ ALLOWED_HOOK_EVENTS = {
     E.FOLDER_LIST_COMPLETED,
     E.FOLDER_WRITE_PROTECT_COMPLETED,
     E.FILE_UPLOAD_COMPLETED,
+    E.UPLOAD_SESSION_CREATE_COMPLETED,
     E.FILE_DOWNLOAD_COMPLETED,
+    E.FILE_ARCHIVE_COMPLETED,
+    E.FILE_IMPORT_COMPLETED,
     E.FILE_SELECT_COMPLETED,
     E.FILE_UPDATE_COMPLETED,
     E.FILE_STARRED_CHANGE_COMPLETED,
+    E.FILE_BULK_STARRED_CHANGE_COMPLETED,
     E.FILE_MOVE_COMPLETED,
+    E.FILE_BULK_MOVE_COMPLETED,
     E.FILE_ROTATE_COMPLETED,
     E.FILE_FLIP_COMPLETED,
     E.FILE_EDIT_COMPLETED,
     E.FILE_DELETE_COMPLETED,
+    E.FILE_BULK_DELETE_COMPLETED,
     E.FILE_THUMBNAIL_RETRIEVE_COMPLETED,
     E.TAG_ADD_COMPLETED,
+    E.FILE_BULK_TAG_ADD_COMPLETED,
     E.TAG_DELETE_COMPLETED,
     E.TAG_LIST_COMPLETED,
     E.FILE_LIST_COMPLETED,
@@ -78,6 +87,10 @@ ALLOWED_HOOK_EVENTS = {
     E.VARIABLE_DELETE_COMPLETED,
     E.VARIABLE_LIST_COMPLETED,
     E.AUDIT_LIST_COMPLETED,
+    E.AUDIT_EXPORT_COMPLETED,
+    E.INTEGRITY_REPORT_RETRIEVE_COMPLETED,
+    E.REVISION_RETENTION_ESTIMATE_COMPLETED,
+    E.DB_INTEGRITY_CHECK_FAILED,
 }
 
 
@@ -104,6 +117,7 @@ class HookManager:
 
         self._hooks[event].append(hook)
 
+    @timed(TimingCategory.HOOK)
     async def emit(
         self,
         event: str,
@@ -123,6 +137,7 @@ class HookManager:
 
             except Exception:
                 logger.exception("hook execution failed")
+                HOOK_FAILURES.labels(event).inc()
 
     def load_extensions(self) -> None:
         """
@@ -3,10 +3,14 @@
 
 import asyncio
 import os
+import time
 from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator, Iterable, Sequence
 from dataclasses import dataclass
 from enum import StrEnum
-from typing import AsyncIterator
+
+from app.runtime.metrics import LOCK_WAIT_DURATION
+from app.timing import TimingCategory, timed
 
 
 class LockType(StrEnum):
@@ -49,6 +53,9 @@ class LockHolder:
 # 1. A directory overlaps with itself and any descendant directory.
 # 2. A directory overlaps with any file in its subtree.
 # 3. Two files overlap only if they refer to the same file.
+# Multi-resource requests (lock_many) are granted all at once or not
+# at all, so no task ever holds part of a set while waiting for the
+# rest, and lock sets cannot deadlock regardless of request order.
 
 class LockManager:
     """
@@ -103,6 +110,41 @@ class LockManager:
         finally:
             await self._release(resource, lock_type)
 
+    @asynccontextmanager
+    async def lock_many(
+        self,
+        lock_type: LockType,
+        dir_paths: Sequence[str] = (),
+        file_paths: Sequence[str] = (),
+    ) -> AsyncIterator[None]:
+        """
+        Acquire locks of one type for several directories and files at
+        once. All resources are granted together in a single step, or
+        the caller waits until none of them conflicts with a held lock,
+        so two tasks locking overlapping sets can never deadlock. The
+        requested resources may overlap each other.
+        """
+        resources = self._normalize_resources([
+            *(self._build_directory_resource(path) for path in dir_paths),
+            *(self._build_file_resource(path) for path in file_paths),
+        ])
+
+        await self._acquire_many(resources, lock_type)
+        try:
+            yield
+        finally:
+            await self._release_many(resources, lock_type)
+
+    def _normalize_resources(
+        self,
+        resources: Iterable[LockResource],
+    ) -> tuple[LockResource, ...]:
+        # Canonical order keeps holder lists and error messages stable.
+        return tuple(sorted(
+            set(resources),
+            key=lambda resource: (resource.directory, resource.filename or ""),
+        ))
+
     def _build_directory_resource(self, dir_path: str) -> LockResource:
         directory = os.path.abspath(os.path.normpath(dir_path))
         return LockResource(directory=directory)
@@ -127,43 +169,75 @@ class LockManager:
         resource: LockResource,
         lock_type: LockType,
     ) -> None:
+        await self._acquire_many((resource,), lock_type)
+
+    async def _release(
+        self,
+        resource: LockResource,
+        lock_type: LockType,
+    ) -> None:
+        await self._release_many((resource,), lock_type)
+
+    @timed(TimingCategory.LOCK)
+    async def _acquire_many(
+        self,
+        resources: Sequence[LockResource],
+        lock_type: LockType,
+    ) -> None:
+        owner = asyncio.current_task()
+        start_time = time.perf_counter()
+
         async with self._condition:
-            while self._has_conflict(resource, lock_type):
+            while any(
+                self._has_conflict(resource, lock_type)
+                for resource in resources
+            ):
                 await self._condition.wait()
 
-            self._holders.append(
+            self._holders.extend(
                 LockHolder(
                     resource=resource,
                     lock_type=lock_type,
-                    owner=asyncio.current_task(),
-                ),
+                    owner=owner,
+                )
+                for resource in resources
             )
 
-    async def _release(
+        LOCK_WAIT_DURATION.labels(lock_type).observe(
+            time.perf_counter() - start_time,
+        )
+
+    async def _release_many(
         self,
-        resource: LockResource,
+        resources: Sequence[LockResource],
         lock_type: LockType,
     ) -> None:
         owner = asyncio.current_task()
 
         async with self._condition:
-            for index, holder in enumerate(self._holders):
-                if (
-                    holder.resource == resource
-                    and holder.lock_type == lock_type
-                    and holder.owner == owner
-                ):
-                    del self._holders[index]
-                    self._condition.notify_all()
-                    return
-
-            raise RuntimeError(
-                "Attempted to release a lock that is not held by the "
-                "current task: "
-                f"resource={resource!r}, "
-                f"lock_type={lock_type!r}, "
-                f"owner={owner!r}"
-            )
+            held = [
+                LockHolder(
+                    resource=resource,
+                    lock_type=lock_type,
+                    owner=owner,
+                )
+                for resource in resources
+            ]
+
+            for holder in held:
+                if holder not in self._holders:
+                    raise RuntimeError(
+                        "Attempted to release a lock that is not held by "
+                        "the current task: "
+                        f"resource={holder.resource!r}, "
+                        f"lock_type={lock_type!r}, "
+                        f"owner={owner!r}"
+                    )
+
+            for holder in held:
+                self._holders.remove(holder)
+
+            self._condition.notify_all()
 
     def _has_conflict(
         self,
@@ -1,11 +1,20 @@
 # app/log.py
 # SPDX-License-Identifier: GPL-3.0-only
 
+import atexit
+import copy
+import json
 import logging
+import re
 import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from queue import Full, Queue
 
 from app.config import get_config
+from app.constants import LOG_QUEUE_SHED_RATIO
 from app.context import get_context_var
+from app.events import Events as E
 
 # NOTE (ADR-26): Logging is structured across three levels.
 # 1. Request-level (middleware): request start, request completion,
@@ -46,23 +55,194 @@ class RequestContextFilter(logging.Filter):
         return True
 
 
+_FIELD_RE = re.compile(r"(?:^|\s)([a-z_][a-z0-9_]*)=(\S*)")
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format each record as one JSON object per line. The key=value
+    pairs of canonical event messages (ADR-28), such as event, are
+    emitted as separate fields next to request_uuid, so log collectors
+    do not need to parse the message.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        entry = {
+            "time": datetime.fromtimestamp(
+                record.created, timezone.utc,
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "line": record.lineno,
+            "request_uuid": getattr(record, "request_uuid", "-"),
+            "message": message,
+        }
+
+        for key, value in _FIELD_RE.findall(message):
+            entry.setdefault(key, value)
+
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+
+        return json.dumps(entry, default=str)
+
+
+# NOTE (ADR-86): Log records are written by a separate thread.
+# Services log several event lines per request from the event loop
+# thread, and a synchronous write to stdout stalls every request while
+# the log pipe is slow. Records are put on a bounded queue instead and
+# written by a listener thread. The queue never blocks the caller: past
+# the high-water mark only warnings and errors are kept, and when it is
+# full records are dropped and counted.
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+
+class LogQueueHandler(QueueHandler):
+    """
+    Enqueue records for a QueueListener without blocking. Records below
+    WARNING are dropped while the queue holds shed_size records or
+    more, and every record is dropped while it is full. Dropped records
+    are counted, and the next enqueued record is preceded by a warning
+    with the number dropped since the last one.
+    """
+
+    def __init__(self, queue: Queue, shed_size: int):
+        super().__init__(queue)
+        self.shed_size = shed_size
+        self.dropped_count = 0
+        self._unreported_count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Shed before preparing, so an overloaded queue does not cost
+        # the formatting of records that are dropped anyway.
+        if (
+            record.levelno < logging.WARNING
+            and self.queue.qsize() >= self.shed_size
+        ):
+            self._drop()
+            return
+
+        try:
+            self.enqueue(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Return a copy of the record with the message merged and the
+        exception rendered, so that the listener thread never formats
+        arguments that may change or lazy-load after the call. The
+        output line itself is still formatted by the listener.
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+
+        if record.exc_info:
+            record.exc_text = _EXCEPTION_FORMATTER.formatException(
+                record.exc_info,
+            )
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if self._unreported_count:
+                self.queue.put_nowait(self._make_dropped_record())
+                self._unreported_count = 0
+            self.queue.put_nowait(record)
+        except Full:
+            self._drop()
+
+    def _drop(self) -> None:
+        self.dropped_count += 1
+        self._unreported_count += 1
+
+    def _make_dropped_record(self) -> logging.LogRecord:
+        return logging.makeLogRecord({
+            "name": __name__,
+            "levelno": logging.WARNING,
+            "levelname": logging.getLevelName(logging.WARNING),
+            "msg": "event=%s dropped=%s",
+            "args": (E.LOG_RECORDS_DROPPED, self._unreported_count),
+            "request_uuid": "-",
+        })
+
+
+_queue_handler: LogQueueHandler | None = None
+_queue_listener: QueueListener | None = None
+
+
+def get_dropped_log_count() -> int:
+    """
+    Return the number of records dropped by the log queue since
+    logging was initialized.
+    """
+    return _queue_handler.dropped_count if _queue_handler else 0
+
+
+def stop_logging() -> None:
+    """
+    Write the records left in the log queue and stop the listener
+    thread. Registered to run at interpreter exit.
+    """
+    global _queue_handler, _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+    _queue_handler = None
+    _queue_listener = None
+
+
 def init_logging() -> None:
     """
     Initialize root logger with configured level, format and handlers.
     Replaces existing handlers and attaches a stream handler with
-    request context enrichment.
+    request context enrichment, fed through a bounded queue and a
+    listener thread when LOG_QUEUE_SIZE is positive.
     """
+    global _queue_handler, _queue_listener
+
     config = get_config()
+    stop_logging()
 
     level = getattr(logging, config.LOG_LEVEL.upper(), logging.INFO)
-    formatter = logging.Formatter(fmt=config.LOG_FORMAT)
+    if config.LOG_JSON:
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(fmt=config.LOG_FORMAT)
 
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(formatter)
-    handler.addFilter(RequestContextFilter())
 
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
-
     root_logger.handlers.clear()
-    root_logger.addHandler(handler)
+
+    if config.LOG_QUEUE_SIZE <= 0:
+        handler.addFilter(RequestContextFilter())
+        root_logger.addHandler(handler)
+        return
+
+    queue = Queue(maxsize=config.LOG_QUEUE_SIZE)
+    _queue_handler = LogQueueHandler(
+        queue,
+        shed_size=int(config.LOG_QUEUE_SIZE * LOG_QUEUE_SHED_RATIO),
+    )
+    # Context variables are only visible in the logging thread, so
+    # the request UUID is attached before the record is enqueued.
+    _queue_handler.addFilter(RequestContextFilter())
+
+    _queue_listener = QueueListener(queue, handler)
+    _queue_listener.start()
+
+    root_logger.addHandler(_queue_handler)
+
+
+atexit.register(stop_logging)
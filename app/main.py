@@ -3,7 +3,10 @@
 
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from starlette.middleware.gzip import GZipMiddleware
+from starlette.middleware.gzip import (
+    DEFAULT_EXCLUDED_CONTENT_TYPES,
+    GZipMiddleware,
+)
 
 from app.config import get_config
 from app.log import init_logging
@@ -11,11 +14,21 @@ from app.hooks import hooks
 from app.version import __version__
 from app.openapi import TAGS_METADATA
 from app.db.engine import load_all_models
+from app.runtime.crypto import get_crypto_executor
+from app.runtime.scheduler import scheduler
+from app.services.audit_archive import archive_audit
+from app.services.trash_reclaim import reclaim_trash
+from app.services.integrity_scan import scan_integrity
+from app.services.revision_retention import compact_revisions
+from app.services.upload_session_expire import expire_upload_sessions
+from app.services.thumbnail_generate import generate_thumbnails
+from app.services.metrics_sample import sample_metrics
 
 from app.errors import (
     InternalServerError,
     ServiceUnavailableError,
     TooManyRequestsError,
+    InsufficientStorageError,
     ResourceNotFoundError,
     ResourceForbiddenError,
     ResourceConflictError,
@@ -27,15 +40,17 @@ from app.errors import (
 )
 
 from app.middleware.cors_setup import cors_setup_middleware
-from app.middleware.request_context import request_context_middleware
-from app.middleware.request_logging import request_logging_middleware
-from app.middleware.lockdown_mode import lockdown_mode_middleware
-from app.middleware.mountpoint_check import mountpoint_check_middleware
-from app.middleware.security_headers import security_headers_middleware
+from app.middleware.request_context import RequestContextMiddleware
+from app.middleware.request_logging import RequestLoggingMiddleware
+from app.middleware.request_metrics import RequestMetricsMiddleware
+from app.middleware.lockdown_mode import LockdownModeMiddleware
+from app.middleware.mountpoint_check import MountpointCheckMiddleware
+from app.middleware.security_headers import SecurityHeadersMiddleware
 
 from app.handlers.internal_server_error import internal_server_error_handler
 from app.handlers.service_unavailable import service_unavailable_handler
 from app.handlers.too_many_requests import too_many_requests_handler
+from app.handlers.insufficient_storage import insufficient_storage_handler
 from app.handlers.resource_not_found import resource_not_found_handler
 from app.handlers.resource_forbidden import resource_forbidden_handler
 from app.handlers.resource_conflict import resource_conflict_handler
@@ -75,7 +90,13 @@ from app.routers.folder_delete import router as folder_delete_router
 from app.routers.folder_write_protect import router as folder_write_protect_router  # noqa: E501
 from app.routers.folder_list import router as folder_list_router
 from app.routers.file_upload import router as file_upload_router
+from app.routers.upload_session_create import router as upload_session_create_router  # noqa: E501
+from app.routers.upload_session_select import router as upload_session_select_router  # noqa: E501
+from app.routers.upload_session_write import router as upload_session_write_router  # noqa: E501
+from app.routers.upload_session_commit import router as upload_session_commit_router  # noqa: E501
 from app.routers.file_download import router as file_download_router
+from app.routers.file_archive import router as file_archive_router
+from app.routers.file_import import router as file_import_router
 from app.routers.file_select import router as file_select_router
 from app.routers.file_update import router as file_update_router
 from app.routers.file_starred_change import router as file_starred_change_router  # noqa: E501
@@ -84,7 +105,12 @@ from app.routers.file_move import router as file_move_router
 from app.routers.file_rotate import router as file_rotate_router
 from app.routers.file_flip import router as file_flip_router
 from app.routers.file_edit import router as file_edit_router
+from app.routers.file_patch import router as file_patch_router
 from app.routers.file_list import router as file_list_router
+from app.routers.file_bulk_move import router as file_bulk_move_router
+from app.routers.file_bulk_delete import router as file_bulk_delete_router
+from app.routers.file_bulk_tag_add import router as file_bulk_tag_add_router
+from app.routers.file_bulk_starred_change import router as file_bulk_starred_change_router  # noqa: E501
 from app.routers.file_thumbnail_retrieve import router as thumbnail_retrieve_router  # noqa: E501
 from app.routers.file_tag_add import router as file_tag_add_router
 from app.routers.file_tag_delete import router as file_tag_delete_router
@@ -97,7 +123,15 @@ from app.routers.variable_get import router as variable_get_router
 from app.routers.variable_delete import router as variable_delete_router
 from app.routers.variable_list import router as variable_list_router
 from app.routers.metrics_retrieve import router as metrics_retrieve_router
+from app.routers.metrics_export import router as metrics_export_router
+from app.routers.metrics_history_retrieve import (
+    router as metrics_history_retrieve_router,
+)
+from app.routers.sql_statement_list import router as sql_statement_list_router
 from app.routers.audit_list import router as audit_list_router
+from app.routers.audit_export import router as audit_export_router
+from app.routers.integrity_report_retrieve import router as integrity_report_retrieve_router  # noqa: E501
+from app.routers.revision_retention_estimate import router as revision_retention_estimate_router  # noqa: E501
 
 config = get_config()
 
@@ -107,7 +141,48 @@ async def lifespan(app: FastAPI):
     init_logging()
     load_all_models()
     hooks.load_extensions()
-    yield
+
+    scheduler.every(
+        "audit_archive",
+        config.AUDIT_ARCHIVE_INTERVAL_SECONDS,
+        archive_audit,
+    )
+    scheduler.every(
+        "trash_reclaim",
+        config.TRASH_RECLAIM_INTERVAL_SECONDS,
+        reclaim_trash,
+    )
+    scheduler.every(
+        "integrity_scan",
+        config.INTEGRITY_SCAN_INTERVAL_SECONDS,
+        scan_integrity,
+    )
+    scheduler.every(
+        "revision_compact",
+        config.REVISIONS_COMPACT_INTERVAL_SECONDS,
+        compact_revisions,
+    )
+    scheduler.every(
+        "upload_session_expire",
+        config.UPLOAD_SESSIONS_EXPIRE_INTERVAL_SECONDS,
+        expire_upload_sessions,
+    )
+    scheduler.every(
+        "thumbnail_generate",
+        config.THUMBNAILS_GENERATE_INTERVAL_SECONDS,
+        generate_thumbnails,
+    )
+    scheduler.every(
+        "metrics_sample",
+        config.METRICS_SAMPLE_INTERVAL_SECONDS,
+        sample_metrics,
+    )
+    scheduler.start()
+    try:
+        yield
+    finally:
+        await scheduler.stop()
+        get_crypto_executor().shutdown()
 
 
 app = FastAPI(
@@ -135,17 +210,36 @@ app = FastAPI(
 # expected to address them at the reverse proxy, load balancer, firewall,
 # upstream provider or cloud mitigation, or equivalent.
 
-app.middleware("http")(lockdown_mode_middleware)
-app.middleware("http")(mountpoint_check_middleware)
-app.middleware("http")(request_logging_middleware)
-app.middleware("http")(request_context_middleware)
-app.middleware("http")(security_headers_middleware)
+# NOTE (ADR-85): HTTP middleware is written as pure ASGI.
+# Function middleware registered with app.middleware("http") runs the
+# rest of the stack in a separate task and passes every response body
+# chunk through a memory stream, once per layer. The middleware below
+# wraps receive and send directly instead, so the request runs in one
+# task and streamed downloads pass through without copies. Each class
+# is added to the outside of the stack, as app.middleware("http") did,
+# so the order above is kept.
+
+app.add_middleware(LockdownModeMiddleware)
+app.add_middleware(MountpointCheckMiddleware)
+app.add_middleware(RequestLoggingMiddleware)
+app.add_middleware(RequestMetricsMiddleware)
+app.add_middleware(RequestContextMiddleware)
+app.add_middleware(SecurityHeadersMiddleware)
 cors_setup_middleware(app)
-app.add_middleware(GZipMiddleware)
+# Tar archives are sent with ranges that refer to the uncompressed
+# bytes, so they are excluded from compression like zip archives.
+app.add_middleware(
+    GZipMiddleware,
+    exclude_content_types=(
+        *DEFAULT_EXCLUDED_CONTENT_TYPES,
+        "application/x-tar",
+    ),
+)
 
 app.add_exception_handler(InternalServerError, internal_server_error_handler)
 app.add_exception_handler(ServiceUnavailableError, service_unavailable_handler)
 app.add_exception_handler(TooManyRequestsError, too_many_requests_handler)
+app.add_exception_handler(InsufficientStorageError, insufficient_storage_handler)  # noqa E501
 app.add_exception_handler(ResourceNotFoundError, resource_not_found_handler)
 app.add_exception_handler(ResourceForbiddenError, resource_forbidden_handler)
 app.add_exception_handler(ResourceConflictError, resource_conflict_handler)
@@ -180,7 +274,13 @@ app.include_router(folder_delete_router, prefix=config.API_PREFIX)
 app.include_router(folder_write_protect_router, prefix=config.API_PREFIX)
 app.include_router(folder_list_router, prefix=config.API_PREFIX)
 app.include_router(file_upload_router, prefix=config.API_PREFIX)
+app.include_router(upload_session_create_router, prefix=config.API_PREFIX)
+app.include_router(upload_session_select_router, prefix=config.API_PREFIX)
+app.include_router(upload_session_write_router, prefix=config.API_PREFIX)
+app.include_router(upload_session_commit_router, prefix=config.API_PREFIX)
 app.include_router(file_download_router, prefix=config.API_PREFIX)
+app.include_router(file_archive_router, prefix=config.API_PREFIX)
+app.include_router(file_import_router, prefix=config.API_PREFIX)
 app.include_router(file_select_router, prefix=config.API_PREFIX)
 app.include_router(file_update_router, prefix=config.API_PREFIX)
 app.include_router(file_starred_change_router, prefix=config.API_PREFIX)
@@ -189,7 +289,12 @@ app.include_router(file_move_router, prefix=config.API_PREFIX)
 app.include_router(file_rotate_router, prefix=config.API_PREFIX)
 app.include_router(file_flip_router, prefix=config.API_PREFIX)
 app.include_router(file_edit_router, prefix=config.API_PREFIX)
+app.include_router(file_patch_router, prefix=config.API_PREFIX)
 app.include_router(file_list_router, prefix=config.API_PREFIX)
+app.include_router(file_bulk_move_router, prefix=config.API_PREFIX)
+app.include_router(file_bulk_delete_router, prefix=config.API_PREFIX)
+app.include_router(file_bulk_tag_add_router, prefix=config.API_PREFIX)
+app.include_router(file_bulk_starred_change_router, prefix=config.API_PREFIX)
 app.include_router(file_tag_add_router, prefix=config.API_PREFIX)
 app.include_router(file_tag_delete_router, prefix=config.API_PREFIX)
 app.include_router(file_tag_list_router, prefix=config.API_PREFIX)
@@ -202,4 +307,12 @@ app.include_router(variable_get_router, prefix=config.API_PREFIX)
 app.include_router(variable_delete_router, prefix=config.API_PREFIX)
 app.include_router(variable_list_router, prefix=config.API_PREFIX)
 app.include_router(metrics_retrieve_router, prefix=config.API_PREFIX)
+app.include_router(metrics_export_router, prefix=config.API_PREFIX)
+app.include_router(
+    metrics_history_retrieve_router, prefix=config.API_PREFIX,
+)
+app.include_router(sql_statement_list_router, prefix=config.API_PREFIX)
+app.include_router(audit_export_router, prefix=config.API_PREFIX)
 app.include_router(audit_list_router, prefix=config.API_PREFIX)
+app.include_router(integrity_report_retrieve_router, prefix=config.API_PREFIX)
+app.include_router(revision_retention_estimate_router, prefix=config.API_PREFIX)  # noqa: E501
@@ -3,6 +3,7 @@
 
 from fastapi import Request, status
 from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.config import get_config
 from app.constants import LOCKDOWN_MODE_ENABLED_FLAG_PATH
@@ -14,23 +15,31 @@ LOCKDOWN_MODE_EXCLUDED_URLS = {
 }
 
 
-async def lockdown_mode_middleware(request: Request, call_next):
+class LockdownModeMiddleware:
     """
     Enforces lockdown mode when the flag file is present (503).
     Blocks all requests except init and explicitly excluded paths.
     """
-    config = get_config()
 
-    if not await isfile(LOCKDOWN_MODE_ENABLED_FLAG_PATH):
-        return await call_next(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-    init_prefix = f"/{config.API_PREFIX.strip('/')}/init/"
-    url = request.url.path.rstrip("/") or "/"
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
 
-    if url.startswith(init_prefix) or url in LOCKDOWN_MODE_EXCLUDED_URLS:
-        return await call_next(request)
+        if not await isfile(LOCKDOWN_MODE_ENABLED_FLAG_PATH):
+            return await self.app(scope, receive, send)
 
-    return Response(
-        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-        headers={"Retry-After": "300"},
-    )
+        config = get_config()
+        init_prefix = f"/{config.API_PREFIX.strip('/')}/init/"
+        url = Request(scope).url.path.rstrip("/") or "/"
+
+        if url.startswith(init_prefix) or url in LOCKDOWN_MODE_EXCLUDED_URLS:
+            return await self.app(scope, receive, send)
+
+        response = Response(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": "300"},
+        )
+        await response(scope, receive, send)
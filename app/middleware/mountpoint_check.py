@@ -3,6 +3,7 @@
 
 from fastapi import Request, status
 from fastapi.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.config import get_config
 from app.repositories.file import isfile, ismount
@@ -13,27 +14,44 @@ MOUNTPOINT_CHECK_EXCLUDED_URLS = {
 }
 
 
-async def mountpoint_check_middleware(request: Request, call_next):
-    config = get_config()
+class MountpointCheckMiddleware:
+    """
+    Rejects requests with 503 while the encrypted passphrase is missing
+    or the storage is not mounted, except init and excluded paths.
+    """
 
-    url = request.url.path.rstrip("/") or "/"
-    init_prefix = f"/{config.API_PREFIX.strip('/')}/init/"
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-    if url.startswith(init_prefix) or url in MOUNTPOINT_CHECK_EXCLUDED_URLS:
-        return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
 
-    # Scenario 1: passphrase is missing
-    if not await isfile(config.GOCRYPTFS_PASSPHRASE_ENCRYPTED_PATH):
-        return Response(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            headers={"Retry-After": "300"},
-        )
+        config = get_config()
 
-    # Scenario 2: mountpoint is not mounted
-    if not await ismount(config.GOCRYPTFS_MOUNTPOINT):
-        return Response(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            headers={"Retry-After": "300"},
-        )
+        url = Request(scope).url.path.rstrip("/") or "/"
+        init_prefix = f"/{config.API_PREFIX.strip('/')}/init/"
 
-    return await call_next(request)
+        if (
+            url.startswith(init_prefix)
+            or url in MOUNTPOINT_CHECK_EXCLUDED_URLS
+        ):
+            return await self.app(scope, receive, send)
+
+        # Scenario 1: passphrase is missing
+        if not await isfile(config.GOCRYPTFS_PASSPHRASE_ENCRYPTED_PATH):
+            response = Response(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": "300"},
+            )
+            return await response(scope, receive, send)
+
+        # Scenario 2: mountpoint is not mounted
+        if not await ismount(config.GOCRYPTFS_MOUNTPOINT):
+            response = Response(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": "300"},
+            )
+            return await response(scope, receive, send)
+
+        await self.app(scope, receive, send)
@@ -5,9 +5,13 @@ import re
 import time
 import uuid
 
-from fastapi import Request
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.config import get_config
 from app.context import reset_context, set_context_var
+from app.runtime.load import request_load
+from app.timing import format_server_timing, get_timings, start_timings
 
 # NOTE (ADR-20): X-Request-ID is accepted for request correlation.
 # If not provided, a value is generated and returned in the response.
@@ -40,24 +44,47 @@ def resolve_request_uuid(header_value: str | None) -> str:
 # This guarantees isolation between concurrent requests and prevents
 # leakage of context data across execution boundaries.
 
-async def request_context_middleware(request: Request, call_next):
+class RequestContextMiddleware:
     """
     Populate request-scoped context for the duration of the request.
-    Initializes context variables (request_uuid, request_start_time)
-    and ensures cleanup after request processing.
+    Initializes context variables (request_uuid, request_start_time,
+    request_timings), returns the request id in the X-Request-ID
+    response header, and the timing breakdown in the Server-Timing
+    header when enabled, and ensures cleanup after the response is
+    sent. The request is counted as active load until then.
     """
-    reset_context()
 
-    try:
-        header_value = request.headers.get("X-Request-ID")
-        request_uuid = resolve_request_uuid(header_value)
-        set_context_var("request_uuid", request_uuid)
-        set_context_var("request_start_time", time.perf_counter())
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        response = await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
 
-        response.headers["X-Request-ID"] = request_uuid
-        return response
-
-    finally:
         reset_context()
+        server_timing_enabled = get_config().SERVER_TIMING_ENABLED
+
+        try:
+            header_value = Headers(scope=scope).get("X-Request-ID")
+            request_uuid = resolve_request_uuid(header_value)
+            set_context_var("request_uuid", request_uuid)
+            start_time = time.perf_counter()
+            set_context_var("request_start_time", start_time)
+            start_timings()
+
+            async def send_with_request_uuid(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers["X-Request-ID"] = request_uuid
+                    if server_timing_enabled:
+                        headers["Server-Timing"] = format_server_timing(
+                            get_timings(),
+                            time.perf_counter() - start_time,
+                        )
+                await send(message)
+
+            with request_load.track():
+                await self.app(scope, receive, send_with_request_uuid)
+
+        finally:
+            reset_context()
@@ -5,41 +5,67 @@ import logging
 import time
 
 from fastapi import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.context import get_context_var
 from app.events import Events as E
+from app.timing import TimingCategory, get_timings
 
 logger = logging.getLogger(__name__)
 
 
-async def request_logging_middleware(request: Request, call_next):
+class RequestLoggingMiddleware:
     """
     Log request lifecycle events with basic metadata. Emits logs for
-    request start, completion and failure, including elapsed time.
+    request start, completion and failure, including elapsed time
+    until the whole response is sent and its breakdown by category.
     """
-    client = request.client.host if request.client else None
-    logger.info(
-        "event=%s method=%s url=%s client=%s",
-        E.REQUEST_STARTED,
-        request.method,
-        request.url,
-        client,
-    )
-
-    try:
-        response = await call_next(request)
-
-        start_time = get_context_var("request_start_time")
-        elapsed_time = time.perf_counter() - start_time
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        request = Request(scope)
+        client = request.client.host if request.client else None
         logger.info(
-            "event=%s status_code=%s elapsed_time=%.6f",
-            E.REQUEST_COMPLETED,
-            response.status_code,
-            elapsed_time,
+            "event=%s method=%s url=%s client=%s",
+            E.REQUEST_STARTED,
+            request.method,
+            request.url,
+            client,
         )
 
-    except Exception:
-        logger.exception("event=%s", E.REQUEST_FAILED)
-        raise
+        status_code = None
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+
+            start_time = get_context_var("request_start_time")
+            elapsed_time = time.perf_counter() - start_time
+            timings = get_timings()
+            logger.info(
+                "event=%s status_code=%s elapsed_time=%.6f lock_time=%.6f "
+                "sql_time=%.6f file_time=%.6f image_time=%.6f "
+                "hook_time=%.6f",
+                E.REQUEST_COMPLETED,
+                status_code,
+                elapsed_time,
+                timings[TimingCategory.LOCK],
+                timings[TimingCategory.SQL],
+                timings[TimingCategory.FILE],
+                timings[TimingCategory.IMAGE],
+                timings[TimingCategory.HOOK],
+            )
 
-    return response
+        except Exception:
+            logger.exception("event=%s", E.REQUEST_FAILED)
+            raise
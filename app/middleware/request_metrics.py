@@ -0,0 +1,49 @@
+# app/middleware/request_metrics.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.runtime.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS
+
+_KNOWN_METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+
+
+class RequestMetricsMiddleware:
+    """
+    Count completed HTTP requests by method, route template and status
+    code, and observe the time until the whole response is sent. A
+    request that fails before the response starts is counted as 500.
+    Requests matching no route and unknown methods are grouped, so
+    clients cannot create new series.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+
+        finally:
+            elapsed_time = time.perf_counter() - start_time
+            method = scope["method"]
+            if method not in _KNOWN_METHODS:
+                method = "other"
+            route = getattr(scope.get("route"), "path", "unmatched")
+
+            HTTP_REQUESTS.labels(method, route, status_code).inc()
+            HTTP_REQUEST_DURATION.labels(method, route).observe(elapsed_time)
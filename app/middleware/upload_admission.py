@@ -0,0 +1,58 @@
+# app/middleware/upload_admission.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import jwt
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from app.runtime.admission import get_upload_admission
+from app.security.jwt import decode_auth_token
+
+
+class UploadAdmissionRoute(APIRoute):
+    """
+    Route class for endpoints that write file content. The request is
+    admitted against the upload byte budgets before FastAPI reads and
+    parses the body, which happens before any dependency runs.
+    """
+
+    def get_route_handler(
+        self,
+    ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler = super().get_route_handler()
+
+        async def upload_admission_handler(request: Request) -> Response:
+            async with get_upload_admission().reserve(
+                _get_user_key(request),
+                _get_content_length(request),
+            ):
+                return await route_handler(request)
+
+        return upload_admission_handler
+
+
+def _get_user_key(request: Request) -> str | None:
+    # The token is only used to attribute bytes to a user; it is
+    # authenticated by the route dependencies afterwards.
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+
+    try:
+        user_id = decode_auth_token(token).get("sub")
+    except jwt.InvalidTokenError:
+        return None
+
+    return None if user_id is None else str(user_id)
+
+
+def _get_content_length(request: Request) -> int | None:
+    try:
+        content_length = int(request.headers["content-length"])
+    except (KeyError, ValueError):
+        return None
+
+    return content_length if content_length >= 0 else None
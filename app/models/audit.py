@@ -3,13 +3,13 @@
 
 import time
 
-from sqlalchemy import ForeignKey, Integer, String, event
+from sqlalchemy import Integer, String, event
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.db.base import Base
+from app.db.base import AuditBase
 
 
-class Audit(Base):
+class Audit(AuditBase):
     __tablename__ = "audit"
 
     id: Mapped[int] = mapped_column(
@@ -24,9 +24,12 @@ class Audit(Base):
         index=True,
     )
 
+    # NOTE (ADR-70): Audit is stored in a separate database file.
+    # SQLite cannot enforce foreign keys across database files, so
+    # created_by is a plain user identifier without a constraint.
+    # Users are never deleted, which keeps the reference stable.
     created_by: Mapped[int | None] = mapped_column(
         Integer,
-        ForeignKey("users.id", ondelete="RESTRICT"),
         nullable=True,
         index=True,
     )
@@ -0,0 +1,129 @@
+# app/models/audit_segment.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import os
+import time
+
+from sqlalchemy import Integer, String, Text, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.config import get_config
+from app.db.base import AuditBase
+
+
+class AuditSegment(AuditBase):
+    """
+    Sealed archive segment holding a contiguous range of audit rows in
+    a compressed, checksummed file. Min/max columns summarize segment
+    contents so that queries can skip segments without reading them;
+    the summary holds row counts grouped by event, resource type and
+    creator so that queries can count and order rows without reading
+    them. Segments sealed before summaries were kept have none.
+    """
+    __tablename__ = "audit_segments"
+
+    id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+    )
+
+    created_at: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=lambda: int(time.time()),
+    )
+
+    segment_uuid: Mapped[str] = mapped_column(
+        String(36),
+        nullable=False,
+        unique=True,
+    )
+
+    rows_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+
+    filesize: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+
+    checksum: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+    )
+
+    min_id: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        index=True,
+    )
+
+    max_id: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        index=True,
+    )
+
+    min_created_at: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+
+    max_created_at: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+
+    min_created_by: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+
+    max_created_by: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+
+    min_resource_id: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+
+    max_resource_id: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+
+    summary: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
+
+    @property
+    def absolute_path(self) -> str:
+        """
+        Return the absolute filesystem path of this segment file.
+        Example: /var/lib/hidden/mountpoint/audit/550e8400-e29b-41d4
+        """
+        config = get_config()
+
+        return os.path.join(
+            config.AUDIT_ARCHIVE_DIR,
+            self.segment_uuid,
+        )
+
+
+# NOTE (ADR-24): Audit data is append-only.
+# Segments are sealed once written: segment rows and files are never
+# updated or deleted through the ORM.
+
+@event.listens_for(AuditSegment, "before_update", propagate=True)
+def prevent_update(mapper, connection, target):
+    raise RuntimeError("Audit segments cannot be updated")
+
+
+@event.listens_for(AuditSegment, "before_delete", propagate=True)
+def prevent_delete(mapper, connection, target):
+    raise RuntimeError("Audit segments cannot be deleted")
@@ -5,6 +5,7 @@ import os
 import time
 
 from sqlalchemy import (
+    Boolean,
     CheckConstraint,
     ForeignKey,
     Index,
@@ -17,10 +18,6 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.config import get_config
 from app.db.base import Base
 
-# TODO: Introduce retention policy for file revisions. Define rules
-# (e.g., max revisions, time-based cleanup, pinned revisions) and
-# enforce them at the service layer.
-
 # NOTE (ADR-51): File stores current state; revision stores history.
 # File represents the current version, while file revision keeps only
 # previous immutable versions. When a new upload replaces the current
@@ -96,6 +93,14 @@ class FileRevision(Base):
         nullable=False,
     )
 
+    # Stored as a reverse delta against the next newer version rather
+    # than a full copy; filesize and checksum describe the content.
+    is_delta: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        server_default=text("0"),
+    )
+
     revision_file: Mapped["File"] = relationship(  # noqa: F821
         "File",
         back_populates="file_revisions",
@@ -41,7 +41,8 @@ from app.db.base import Base
 # NOTE (ADR-60): Folder deletion is service-layer controlled.
 # Direct DELETE is not allowed due to filesystem consistency.
 # Folder deletion removes direct files but does not recursively delete
-# subfolders; folders containing subfolders are rejected.
+# subfolders; folders containing subfolders are rejected unless the
+# caller explicitly requests recursive deletion (ADR-72).
 
 # NOTE (ADR-61): Folder write protection is an additional restriction.
 # The is_write_protected flag acts as an administrative override and
@@ -0,0 +1,123 @@
+# app/models/upload_session.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import json
+import os
+import time
+
+from sqlalchemy import (
+    CheckConstraint,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.config import get_config
+from app.db.base import Base
+
+# NOTE (ADR-77): Upload sessions stage chunks outside the tmp dir.
+# A session reserves a part file in the uploads directory that chunks
+# are written into at their offsets; received byte ranges are kept on
+# the session row. The tmp directory is cleared on every mount, so a
+# part file there would not survive a remount. The file is created only
+# on commit, through the same path as a regular upload.
+
+
+class UploadSession(Base):
+    __tablename__ = "upload_sessions"
+
+    id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+    )
+
+    created_by: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("users.id", ondelete="RESTRICT"),
+        nullable=False,
+        index=True,
+    )
+
+    created_at: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=lambda: int(time.time()),
+    )
+
+    expires_at: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        index=True,
+    )
+
+    # Target folder is validated on create and commit; no foreign key,
+    # so that deleting a folder is not blocked by a pending upload.
+    folder_id: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        index=True,
+    )
+
+    filename: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+    )
+
+    filesize: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+
+    # Public session identifier and part filename on disk
+    upload_uuid: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        unique=True,
+    )
+
+    # Sorted, merged [start, end) byte ranges received so far (JSON)
+    received_ranges: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        server_default=text("'[]'"),
+        default="[]",
+    )
+
+    __table_args__ = (
+        CheckConstraint(
+            "filesize >= 0",
+            name="ck_upload_sessions_filesize_non_negative",
+        ),
+        {"sqlite_autoincrement": True},
+    )
+
+    @property
+    def absolute_path(self) -> str:
+        """
+        Return the absolute filesystem path of the part file that
+        receives the chunks of this upload session.
+        Example: /var/lib/hidden/mountpoint/uploads/550e8400-e29b-41d4
+        """
+        config = get_config()
+
+        return os.path.join(
+            config.FILES_UPLOADS_DIR,
+            self.upload_uuid,
+        )
+
+    @property
+    def ranges(self) -> list[tuple[int, int]]:
+        """
+        Return the received byte ranges as (start, end) tuples.
+        """
+        return [tuple(item) for item in json.loads(self.received_ranges)]
+
+    @property
+    def is_complete(self) -> bool:
+        """
+        Return True if the received ranges cover the whole file.
+        """
+        return self.ranges == ([(0, self.filesize)] if self.filesize else [])
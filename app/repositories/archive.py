@@ -0,0 +1,639 @@
+# app/repositories/archive.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import asyncio
+import stat
+import struct
+import tarfile
+import time
+import zipfile
+import zlib
+from collections.abc import AsyncIterator, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from app.constants import FILE_CHUNK_SIZE_BYTES
+
+INCOMPRESSIBLE_MIME_PREFIXES = ("image/", "video/", "audio/")
+
+INCOMPRESSIBLE_MIME_TYPES = {
+    "application/gzip",
+    "application/x-gzip",
+    "application/x-bzip2",
+    "application/x-xz",
+    "application/x-7z-compressed",
+    "application/x-rar-compressed",
+    "application/vnd.rar",
+    "application/zip",
+    "application/zstd",
+}
+
+_TAR_BLOCK_SIZE = tarfile.BLOCKSIZE
+_TAR_END = b"\0" * (_TAR_BLOCK_SIZE * 2)
+
+_ZIP_LOCAL_SIGNATURE = 0x04034B50
+_ZIP_DESCRIPTOR_SIGNATURE = 0x08074B50
+_ZIP_CENTRAL_SIGNATURE = 0x02014B50
+_ZIP64_END_SIGNATURE = 0x06064B50
+_ZIP64_LOCATOR_SIGNATURE = 0x07064B50
+_ZIP_END_SIGNATURE = 0x06054B50
+
+_ZIP_FLAGS = 0x0808  # data descriptor follows, names are UTF-8
+_ZIP_VERSION = 20
+_ZIP64_VERSION = 45
+_ZIP_MADE_BY = (3 << 8) | _ZIP64_VERSION  # UNIX
+_ZIP_STORED = 0
+_ZIP_DEFLATED = 8
+_ZIP_DEFLATE_LEVEL = 6
+_ZIP64_EXTRA_ID = 0x0001
+_UINT16_MAX = 0xFFFF
+_UINT32_MAX = 0xFFFFFFFF
+
+# Deflate may grow incompressible data slightly, so entries switch to
+# ZIP64 sizes well below the 32-bit limit.
+_ZIP64_SIZE_LIMIT = 0xFF000000
+
+_FILE_MODE = 0o644
+_DIR_MODE = 0o755
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    """
+    File or directory stored in an archive. The name is a relative
+    POSIX path; key identifies the source for the entry reader.
+    """
+
+    name: str
+    mtime: int
+    size: int = 0
+    is_dir: bool = False
+    deflate: bool = False
+    key: Any = None
+
+
+# Reader of length bytes of an entry content starting at offset.
+EntryReader = Callable[[ArchiveEntry, int, int], AsyncIterator[bytes]]
+
+
+def is_compressible(mimetype: str | None) -> bool:
+    """
+    Return whether content of the MIME type is worth deflating. Media
+    and archive formats are compressed already.
+    """
+    if mimetype is None:
+        return True
+    return (
+        not mimetype.startswith(INCOMPRESSIBLE_MIME_PREFIXES) and
+        mimetype not in INCOMPRESSIBLE_MIME_TYPES
+    )
+
+
+class TarArchive:
+    """
+    POSIX tar archive streamed from entries. Long and non-ASCII names
+    are stored in PAX headers. The size is known in advance, so any
+    byte range of the archive can be streamed.
+    """
+
+    media_type = "application/x-tar"
+    extension = "tar"
+
+    def __init__(
+        self,
+        entries: Sequence[ArchiveEntry],
+        read_entry: EntryReader,
+    ) -> None:
+        self._entries = list(entries)
+        self._read_entry = read_entry
+        self._header_sizes = [
+            len(_tar_header(entry)) for entry in self._entries
+        ]
+        self.size: int | None = sum(
+            header_size + _tar_padded(entry.size)
+            for header_size, entry in zip(self._header_sizes, self._entries)
+        ) + len(_TAR_END)
+
+    async def stream(
+        self,
+        start: int = 0,
+        end: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield the archive bytes in [start, end). Headers are rebuilt
+        on the fly and entry contents are read only within the range.
+        """
+        position = 0
+
+        for entry, header_size in zip(self._entries, self._header_sizes):
+            if _overlaps(position, header_size, start, end):
+                yield _slice(_tar_header(entry), position, start, end)
+            position += header_size
+
+            if _overlaps(position, entry.size, start, end):
+                offset, count = _window(position, entry.size, start, end)
+                async for chunk in self._read_entry(entry, offset, count):
+                    yield chunk
+            position += entry.size
+
+            padding = _tar_padded(entry.size) - entry.size
+            if _overlaps(position, padding, start, end):
+                yield _slice(b"\0" * padding, position, start, end)
+            position += padding
+
+        if _overlaps(position, len(_TAR_END), start, end):
+            yield _slice(_TAR_END, position, start, end)
+
+
+class ZipArchive:
+    """
+    ZIP archive streamed from entries. Each entry is followed by a data
+    descriptor, so the CRC is computed while the content streams and no
+    entry is read twice for a full download. ZIP64 records are used for
+    large entries, offsets, and entry counts.
+
+    Without deflated entries the size is known in advance and any byte
+    range can be streamed. A range that starts past an entry still
+    needs its CRC for the descriptor and central directory; such
+    entries are read once more to compute it.
+    """
+
+    media_type = "application/zip"
+    extension = "zip"
+
+    def __init__(
+        self,
+        entries: Sequence[ArchiveEntry],
+        read_entry: EntryReader,
+    ) -> None:
+        self._entries = list(entries)
+        self._read_entry = read_entry
+        self._names = [
+            (entry.name + "/" if entry.is_dir else entry.name).encode()
+            for entry in self._entries
+        ]
+        self._zip64 = [
+            entry.size >= _ZIP64_SIZE_LIMIT for entry in self._entries
+        ]
+        self._offsets = [0] * len(self._entries)
+        self._crcs: dict[int, int] = {}
+        self._compressed_sizes: dict[int, int] = {}
+
+        for index, entry in enumerate(self._entries):
+            if entry.size == 0 and not entry.deflate:
+                self._crcs[index] = 0
+            if not entry.deflate:
+                self._compressed_sizes[index] = entry.size
+
+        self.size: int | None = None
+        if not any(entry.deflate for entry in self._entries):
+            self.size = self._layout()
+
+    async def stream(
+        self,
+        start: int = 0,
+        end: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield the archive bytes in [start, end). A range can only be
+        requested when the size is known; deflated archives are
+        streamed as a whole.
+        """
+        if self.size is None and (start != 0 or end is not None):
+            raise ValueError("Range requires a stored archive")
+
+        position = 0
+
+        for index, entry in enumerate(self._entries):
+            self._offsets[index] = position
+
+            header = self._local_header(index)
+            if _overlaps(position, len(header), start, end):
+                yield _slice(header, position, start, end)
+            position += len(header)
+
+            if entry.deflate:
+                async for chunk in self._deflate(index):
+                    position += len(chunk)
+                    yield chunk
+
+            else:
+                if _overlaps(position, entry.size, start, end):
+                    offset, count = _window(position, entry.size, start, end)
+                    async for chunk in self._store(index, offset, count):
+                        yield chunk
+                position += entry.size
+
+            length = self._descriptor_length(index)
+            if _overlaps(position, length, start, end):
+                descriptor = await self._descriptor(index)
+                yield _slice(descriptor, position, start, end)
+            position += length
+
+        directory_offset = position
+        for index in range(len(self._entries)):
+            length = self._central_length(index)
+            if _overlaps(position, length, start, end):
+                record = await self._central_record(index)
+                yield _slice(record, position, start, end)
+            position += length
+
+        records = self._end_records(
+            directory_offset, position - directory_offset,
+        )
+        if _overlaps(position, len(records), start, end):
+            yield _slice(records, position, start, end)
+
+    def _layout(self) -> int:
+        """
+        Compute entry offsets of a stored archive and return its size.
+        """
+        position = 0
+        for index, entry in enumerate(self._entries):
+            self._offsets[index] = position
+            position += (
+                len(self._local_header(index)) +
+                entry.size +
+                self._descriptor_length(index)
+            )
+
+        directory_size = sum(
+            self._central_length(index)
+            for index in range(len(self._entries))
+        )
+        records = self._end_records(position, directory_size)
+        return position + directory_size + len(records)
+
+    async def _store(
+        self,
+        index: int,
+        offset: int,
+        count: int,
+    ) -> AsyncIterator[bytes]:
+        entry = self._entries[index]
+        whole = offset == 0 and count == entry.size
+        crc = 0
+
+        async for chunk in self._read_entry(entry, offset, count):
+            if whole:
+                crc = zlib.crc32(chunk, crc)
+            yield chunk
+
+        if whole:
+            self._crcs[index] = crc
+
+    async def _deflate(self, index: int) -> AsyncIterator[bytes]:
+        entry = self._entries[index]
+        compressor = zlib.compressobj(
+            _ZIP_DEFLATE_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS,
+        )
+        crc = 0
+        compressed_size = 0
+
+        async for chunk in self._read_entry(entry, 0, entry.size):
+            crc = zlib.crc32(chunk, crc)
+            data = await asyncio.to_thread(compressor.compress, chunk)
+            if data:
+                compressed_size += len(data)
+                yield data
+
+        data = compressor.flush()
+        compressed_size += len(data)
+        yield data
+
+        self._crcs[index] = crc
+        self._compressed_sizes[index] = compressed_size
+
+    async def _crc(self, index: int) -> int:
+        if index not in self._crcs:
+            entry = self._entries[index]
+            crc = 0
+            async for chunk in self._read_entry(entry, 0, entry.size):
+                crc = zlib.crc32(chunk, crc)
+            self._crcs[index] = crc
+        return self._crcs[index]
+
+    def _local_header(self, index: int) -> bytes:
+        entry = self._entries[index]
+        name = self._names[index]
+        extra = b""
+        size_field = 0
+
+        if self._zip64[index]:
+            extra = struct.pack("<HHQQ", _ZIP64_EXTRA_ID, 16, 0, 0)
+            size_field = _UINT32_MAX
+
+        dos_time, dos_date = _dos_datetime(entry.mtime)
+        return struct.pack(
+            "<IHHHHHIIIHH",
+            _ZIP_LOCAL_SIGNATURE,
+            _ZIP64_VERSION if self._zip64[index] else _ZIP_VERSION,
+            _ZIP_FLAGS,
+            _ZIP_DEFLATED if entry.deflate else _ZIP_STORED,
+            dos_time,
+            dos_date,
+            0,
+            size_field,
+            size_field,
+            len(name),
+            len(extra),
+        ) + name + extra
+
+    def _descriptor_length(self, index: int) -> int:
+        return 24 if self._zip64[index] else 16
+
+    async def _descriptor(self, index: int) -> bytes:
+        crc = await self._crc(index)
+        sizes_format = "QQ" if self._zip64[index] else "II"
+        return struct.pack(
+            "<II" + sizes_format,
+            _ZIP_DESCRIPTOR_SIGNATURE,
+            crc,
+            self._compressed_sizes[index],
+            self._entries[index].size,
+        )
+
+    def _central_zip64_fields(self, index: int) -> list[int]:
+        fields = []
+        if self._zip64[index]:
+            fields += [
+                self._entries[index].size,
+                self._compressed_sizes.get(index, 0),
+            ]
+        if self._offsets[index] >= _UINT32_MAX:
+            fields.append(self._offsets[index])
+        return fields
+
+    def _central_length(self, index: int) -> int:
+        fields = self._central_zip64_fields(index)
+        extra_length = 4 + 8 * len(fields) if fields else 0
+        return 46 + len(self._names[index]) + extra_length
+
+    async def _central_record(self, index: int) -> bytes:
+        entry = self._entries[index]
+        name = self._names[index]
+        crc = await self._crc(index)
+        fields = self._central_zip64_fields(index)
+
+        extra = b""
+        if fields:
+            extra = struct.pack(
+                f"<HH{len(fields)}Q",
+                _ZIP64_EXTRA_ID, 8 * len(fields), *fields,
+            )
+
+        compressed_size = self._compressed_sizes[index]
+        size = entry.size
+        if self._zip64[index]:
+            compressed_size = size = _UINT32_MAX
+
+        mode = _DIR_MODE | 0o040000 if entry.is_dir else _FILE_MODE | 0o100000
+        external_attr = mode << 16 | (0x10 if entry.is_dir else 0)
+
+        dos_time, dos_date = _dos_datetime(entry.mtime)
+        return struct.pack(
+            "<IHHHHHHIIIHHHHHII",
+            _ZIP_CENTRAL_SIGNATURE,
+            _ZIP_MADE_BY,
+            _ZIP64_VERSION if fields else _ZIP_VERSION,
+            _ZIP_FLAGS,
+            _ZIP_DEFLATED if entry.deflate else _ZIP_STORED,
+            dos_time,
+            dos_date,
+            crc,
+            compressed_size,
+            size,
+            len(name),
+            len(extra),
+            0,
+            0,
+            0,
+            external_attr,
+            min(self._offsets[index], _UINT32_MAX),
+        ) + name + extra
+
+    def _end_records(
+        self,
+        directory_offset: int,
+        directory_size: int,
+    ) -> bytes:
+        count = len(self._entries)
+        records = b""
+
+        if (
+            count >= _UINT16_MAX or
+            directory_offset >= _UINT32_MAX or
+            directory_size >= _UINT32_MAX
+        ):
+            records += struct.pack(
+                "<IQHHIIQQQQ",
+                _ZIP64_END_SIGNATURE,
+                44,
+                _ZIP_MADE_BY,
+                _ZIP64_VERSION,
+                0,
+                0,
+                count,
+                count,
+                directory_size,
+                directory_offset,
+            )
+            records += struct.pack(
+                "<IIQI",
+                _ZIP64_LOCATOR_SIGNATURE,
+                0,
+                directory_offset + directory_size,
+                1,
+            )
+
+        return records + struct.pack(
+            "<IHHHHIIH",
+            _ZIP_END_SIGNATURE,
+            0,
+            0,
+            min(count, _UINT16_MAX),
+            min(count, _UINT16_MAX),
+            min(directory_size, _UINT32_MAX),
+            min(directory_offset, _UINT32_MAX),
+            0,
+        )
+
+
+@dataclass(frozen=True)
+class ArchiveMember:
+    """
+    Member of an archive being read. Members that are neither regular
+    files nor directories, such as links and devices, are not
+    supported for extraction.
+    """
+
+    name: str
+    size: int
+    is_dir: bool
+    is_supported: bool
+
+
+class ArchiveReader:
+    """
+    Reader of a zip or tar archive file; tar archives may be gzip,
+    bzip2, or xz compressed. Members are extracted one at a time in
+    worker threads. Reading members in archive order avoids seeking
+    back in compressed tar streams.
+    """
+
+    def __init__(
+        self,
+        archive: zipfile.ZipFile | tarfile.TarFile,
+        infos: list[zipfile.ZipInfo] | list[tarfile.TarInfo],
+    ) -> None:
+        self._archive = archive
+        self._infos = infos
+        self.members = [_archive_member(info) for info in infos]
+
+    @classmethod
+    async def open(cls, path: str) -> "ArchiveReader":
+        """
+        Open an archive file and list its members. Raises ValueError
+        if the file is not a readable zip or tar archive.
+        """
+        return await asyncio.to_thread(cls._open_sync, path)
+
+    @classmethod
+    def _open_sync(cls, path: str) -> "ArchiveReader":
+        try:
+            if zipfile.is_zipfile(path):
+                archive = zipfile.ZipFile(path)
+                return cls(archive, archive.infolist())
+
+            archive = tarfile.open(path, mode="r:*")
+            return cls(archive, archive.getmembers())
+
+        except (OSError, EOFError, zipfile.BadZipFile, tarfile.TarError) as e:
+            raise ValueError("Unsupported or corrupted archive") from e
+
+    async def extract(self, index: int, destination: str) -> None:
+        """
+        Write the content of a file member to destination. At most the
+        declared member size is written. Raises ValueError if the
+        member data is corrupted or longer than declared.
+        """
+        await asyncio.to_thread(self._extract_sync, index, destination)
+
+    def _extract_sync(self, index: int, destination: str) -> None:
+        info = self._infos[index]
+        remaining = self.members[index].size
+
+        try:
+            if isinstance(self._archive, zipfile.ZipFile):
+                source = self._archive.open(info)
+            else:
+                source = self._archive.extractfile(info)
+
+            with source, open(destination, "wb") as target:
+                while remaining > 0:
+                    chunk = source.read(min(remaining, FILE_CHUNK_SIZE_BYTES))
+                    if not chunk:
+                        break
+                    target.write(chunk)
+                    remaining -= len(chunk)
+
+                if source.read(1):
+                    raise ValueError("Archive member exceeds its size")
+
+        except (EOFError, zipfile.BadZipFile, tarfile.TarError) as e:
+            raise ValueError("Corrupted archive member") from e
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._archive.close)
+
+
+def _archive_member(info: zipfile.ZipInfo | tarfile.TarInfo) -> ArchiveMember:
+    if isinstance(info, zipfile.ZipInfo):
+        is_link = stat.S_ISLNK(info.external_attr >> 16)
+        return ArchiveMember(
+            name=info.filename,
+            size=info.file_size,
+            is_dir=info.is_dir(),
+            is_supported=not is_link,
+        )
+
+    return ArchiveMember(
+        name=info.name,
+        size=info.size,
+        is_dir=info.isdir(),
+        is_supported=info.isdir() or info.isreg(),
+    )
+
+
+def _tar_header(entry: ArchiveEntry) -> bytes:
+    info = tarfile.TarInfo(entry.name)
+    info.mtime = entry.mtime
+    if entry.is_dir:
+        info.type = tarfile.DIRTYPE
+        info.mode = _DIR_MODE
+    else:
+        info.size = entry.size
+        info.mode = _FILE_MODE
+    return info.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape")
+
+
+def _tar_padded(size: int) -> int:
+    return -(-size // _TAR_BLOCK_SIZE) * _TAR_BLOCK_SIZE
+
+
+def _dos_datetime(mtime: int) -> tuple[int, int]:
+    """
+    Return DOS time and date of a timestamp in UTC, clamped to the
+    range the format can represent.
+    """
+    t = time.gmtime(mtime)
+    if t.tm_year < 1980:
+        return 0, (1 << 5) | 1
+    if t.tm_year > 2107:
+        return (23 << 11) | (59 << 5) | 29, (127 << 9) | (12 << 5) | 31
+    return (
+        (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2),
+        ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday,
+    )
+
+
+def _overlaps(
+    position: int,
+    length: int,
+    start: int,
+    end: int | None,
+) -> bool:
+    """
+    Return whether [position, position + length) intersects the
+    requested range [start, end); end None means the archive end.
+    """
+    return (
+        length > 0 and
+        position + length > start and
+        (end is None or position < end)
+    )
+
+
+def _window(
+    position: int,
+    length: int,
+    start: int,
+    end: int | None,
+) -> tuple[int, int]:
+    """
+    Return offset and count of the part of [position, position +
+    length) within the requested range.
+    """
+    offset = max(start - position, 0)
+    stop = length if end is None else min(end - position, length)
+    return offset, stop - offset
+
+
+def _slice(
+    data: bytes,
+    position: int,
+    start: int,
+    end: int | None,
+) -> bytes:
+    offset, count = _window(position, len(data), start, end)
+    return data[offset:offset + count]
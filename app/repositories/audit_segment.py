@@ -0,0 +1,197 @@
+# app/repositories/audit_segment.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import asyncio
+import gzip
+import hashlib
+import json
+import re
+from collections import Counter
+from collections.abc import Sequence
+from typing import Any
+
+from app.models.audit import Audit
+from app.models.audit_segment import AuditSegment
+from app.repositories.file import read, write
+
+PAGINATION_KEYS = ("offset", "limit", "order_by", "order")
+
+AUDIT_SEGMENT_FIELDS = (
+    "id",
+    "created_at",
+    "created_by",
+    "event",
+    "request_uuid",
+    "resource_type",
+    "resource_id",
+)
+
+AUDIT_SUMMARY_FIELDS = ("event", "resource_type", "created_by")
+
+
+def _encode_segment(rows: list[dict]) -> bytes:
+    lines = "".join(
+        json.dumps(row, separators=(",", ":")) + "\n" for row in rows
+    )
+    return gzip.compress(lines.encode("utf-8"), mtime=0)
+
+
+def _decode_segment(data: bytes) -> list[dict]:
+    lines = gzip.decompress(data).decode("utf-8").splitlines()
+    return [json.loads(line) for line in lines if line]
+
+
+async def write_segment(
+    path: str,
+    audit_events: Sequence[Audit],
+) -> tuple[int, str]:
+    """
+    Atomically write audit rows as a gzip-compressed NDJSON segment.
+    Returns the file size and the SHA-256 checksum of the file bytes.
+    """
+    rows = [
+        {field: getattr(audit_event, field)
+         for field in AUDIT_SEGMENT_FIELDS}
+        for audit_event in audit_events
+    ]
+    data = await asyncio.to_thread(_encode_segment, rows)
+    await write(path, data)
+    return len(data), hashlib.sha256(data).hexdigest()
+
+
+async def read_segment(path: str, checksum: str) -> list[Audit]:
+    """
+    Read a segment file, verify its checksum, and return its rows as
+    detached (transient) Audit objects ordered by id.
+    """
+    data = await read(path)
+    if hashlib.sha256(data).hexdigest() != checksum:
+        raise ValueError("Audit segment checksum mismatch")
+
+    rows = await asyncio.to_thread(_decode_segment, data)
+    return [Audit(**row) for row in rows]
+
+
+def summarize_segment(audit_events: Sequence[Audit]) -> str:
+    """
+    Return the segment summary: JSON rows of event, resource type,
+    creator, and the number of audit rows with these values.
+    """
+    counts = Counter(
+        tuple(getattr(audit_event, field) for field in AUDIT_SUMMARY_FIELDS)
+        for audit_event in audit_events
+    )
+    return json.dumps(
+        [[*values, count] for values, count in counts.items()],
+        separators=(",", ":"),
+    )
+
+
+def count_summary(
+    segment: AuditSegment,
+    filters: dict[str, Any],
+    group_by: str | None = None,
+) -> Counter | None:
+    """
+    Count segment rows matching filters without reading the segment,
+    grouped by the values of a summary field (or under None). Returns
+    None when the filters cannot be decided from the segment bounds
+    and summary, so the segment has to be read.
+    """
+    summary_filters = {}
+
+    for key, value in filters.items():
+        if key in PAGINATION_KEYS:
+            continue
+
+        if key == "created_at__ge" and segment.min_created_at >= value:
+            continue
+
+        if key == "created_at__le" and segment.max_created_at <= value:
+            continue
+
+        if key.rsplit("__", 1)[0] not in AUDIT_SUMMARY_FIELDS:
+            return None
+
+        summary_filters[key] = value
+
+    if not summary_filters and group_by is None:
+        return Counter({None: segment.rows_count})
+
+    if segment.summary is None:
+        return None
+
+    counts = Counter()
+    for *values, count in json.loads(segment.summary):
+        row = Audit(**dict(zip(AUDIT_SUMMARY_FIELDS, values)))
+        if match_filters(row, summary_filters):
+            key = None if group_by is None else getattr(row, group_by)
+            counts[key] += count
+
+    return counts
+
+
+def get_segment_filters(filters: dict[str, Any]) -> dict[str, Any]:
+    """
+    Translate audit filters into min/max bound filters that select only
+    segments which may contain matching rows.
+    """
+    segment_filters = {}
+
+    if "created_at__ge" in filters:
+        segment_filters["max_created_at__ge"] = filters["created_at__ge"]
+
+    if "created_at__le" in filters:
+        segment_filters["min_created_at__le"] = filters["created_at__le"]
+
+    for field in ("created_by", "resource_id"):
+        if f"{field}__eq" in filters:
+            segment_filters[f"min_{field}__le"] = filters[f"{field}__eq"]
+            segment_filters[f"max_{field}__ge"] = filters[f"{field}__eq"]
+
+    return segment_filters
+
+
+def match_filters(audit_event: Audit, filters: dict[str, Any]) -> bool:
+    """
+    Return True when a decoded audit row satisfies the eq, ge, le and
+    ilike filters the same way the ORM repository would. Reserved
+    ordering and pagination keys are ignored.
+    """
+    for key, value in filters.items():
+        if key in PAGINATION_KEYS:
+            continue
+
+        field, operator = key.rsplit("__", 1)
+        if not _match(getattr(audit_event, field), operator, value):
+            return False
+
+    return True
+
+
+def _match(column_value: Any, operator: str, value: Any) -> bool:
+    if column_value is None:
+        return False
+
+    if operator == "eq":
+        return column_value == value
+
+    if operator == "gt":
+        return column_value > value
+
+    if operator == "ge":
+        return column_value >= value
+
+    if operator == "le":
+        return column_value <= value
+
+    if operator == "ilike":
+        pattern = "".join(
+            ".*" if char == "%" else "." if char == "_" else re.escape(char)
+            for char in value
+        )
+        return re.fullmatch(
+            pattern, column_value, re.IGNORECASE | re.DOTALL,
+        ) is not None
+
+    raise ValueError("Unsupported operator in filter")
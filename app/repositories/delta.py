@@ -0,0 +1,136 @@
+# app/repositories/delta.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import asyncio
+import difflib
+import zlib
+from itertools import accumulate
+
+from app.repositories.file import read, write
+
+DELTA_MAGIC = b"HDLT\x01"
+
+_OP_COPY = 0
+_OP_INSERT = 1
+
+
+def encode_delta(base: bytes, target: bytes) -> bytes:
+    """
+    Return a binary delta that rebuilds target from base. Content is
+    matched line by line, so the delta is compact for text; any bytes
+    are encoded correctly. The delta is a sequence of copy (offset,
+    length in base) and insert (literal bytes) operations prefixed by
+    the target length, compressed with zlib.
+    """
+    base_lines = base.splitlines(keepends=True)
+    target_lines = target.splitlines(keepends=True)
+    base_offsets = list(accumulate(map(len, base_lines), initial=0))
+    target_offsets = list(accumulate(map(len, target_lines), initial=0))
+
+    matcher = difflib.SequenceMatcher(None, base_lines, target_lines)
+    ops = bytearray(_encode_varint(len(target)))
+
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            start = base_offsets[i1]
+            ops.append(_OP_COPY)
+            ops += _encode_varint(start)
+            ops += _encode_varint(base_offsets[i2] - start)
+        elif j2 > j1:
+            data = target[target_offsets[j1]:target_offsets[j2]]
+            ops.append(_OP_INSERT)
+            ops += _encode_varint(len(data))
+            ops += data
+
+    return DELTA_MAGIC + zlib.compress(bytes(ops))
+
+
+def apply_delta(base: bytes, delta: bytes) -> bytes:
+    """
+    Rebuild the target from base and a delta produced by encode_delta.
+    Raises ValueError if the delta is malformed or does not match base.
+    """
+    if not delta.startswith(DELTA_MAGIC):
+        raise ValueError("Invalid delta header")
+
+    try:
+        ops = zlib.decompress(delta[len(DELTA_MAGIC):])
+    except zlib.error as e:
+        raise ValueError("Invalid delta payload") from e
+
+    size, pos = _decode_varint(ops, 0)
+    result = bytearray()
+
+    while pos < len(ops):
+        op = ops[pos]
+        pos += 1
+
+        if op == _OP_COPY:
+            start, pos = _decode_varint(ops, pos)
+            length, pos = _decode_varint(ops, pos)
+            if start + length > len(base):
+                raise ValueError("Delta copy out of base range")
+            result += base[start:start + length]
+
+        elif op == _OP_INSERT:
+            length, pos = _decode_varint(ops, pos)
+            if pos + length > len(ops):
+                raise ValueError("Delta insert out of range")
+            result += ops[pos:pos + length]
+            pos += length
+
+        else:
+            raise ValueError("Invalid delta operation")
+
+    if len(result) != size:
+        raise ValueError("Delta target size mismatch")
+
+    return bytes(result)
+
+
+async def write_delta(
+    base: bytes,
+    target: bytes,
+    delta_path: str,
+) -> None:
+    """
+    Atomically write a delta rebuilding target from base. Encoding
+    runs in a worker thread.
+    """
+    delta = await asyncio.to_thread(encode_delta, base, target)
+    await write(delta_path, delta)
+
+
+async def read_delta(base: bytes, delta_path: str) -> bytes:
+    """
+    Read the delta at delta_path and return the content it rebuilds
+    from base. Decoding runs in a worker thread.
+    """
+    delta = await read(delta_path)
+    return await asyncio.to_thread(apply_delta, base, delta)
+
+
+def _encode_varint(value: int) -> bytes:
+    result = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            result.append(byte | 0x80)
+        else:
+            result.append(byte)
+            return bytes(result)
+
+
+def _decode_varint(data: bytes, pos: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("Truncated delta")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
@@ -6,6 +6,7 @@ import hashlib
 import mimetypes
 import os
 import uuid
+from collections.abc import Awaitable, Callable, Sequence
 from typing import AsyncIterable, AsyncIterator, Protocol
 
 import aiofiles
@@ -19,6 +20,7 @@ from app.constants import (
     FILE_CHUNK_SIZE_BYTES,
     FILE_MIMETYPE_READ_BYTES,
 )
+from app.timing import TimingCategory, timed, untimed
 
 TEXT_APPLICATION_MIME_TYPES = {
     "application/json",
@@ -50,6 +52,7 @@ def get_tmp_path() -> str:
     return os.path.join(config.FILES_TMP_DIR, str(uuid.uuid4()))
 
 
+@timed(TimingCategory.FILE)
 async def get_mimetype(path: str) -> str | None:
     """
     Guess MIME type from file content using libmagic and filetype,
@@ -80,32 +83,74 @@ async def get_mimetype(path: str) -> str | None:
     return guessed.lower().strip() if guessed else None
 
 
+@timed(TimingCategory.FILE)
 async def get_filesize(path: str) -> int:
     """Return the size of the filesystem object in bytes."""
     stats = await aiofiles.os.stat(path)
     return stats.st_size
 
 
-async def get_checksum(path: str) -> str:
-    """Return a hexadecimal SHA-256 checksum of the file."""
+@timed(TimingCategory.FILE)
+async def get_mtime(path: str) -> float:
+    """Return the modification time of the filesystem object."""
+    stats = await aiofiles.os.stat(path)
+    return stats.st_mtime
+
+
+@timed(TimingCategory.FILE)
+async def get_free_bytes(path: str) -> int:
+    """
+    Return the free space available to unprivileged users on the
+    filesystem that contains the path.
+    """
+    stats = await aiofiles.os.statvfs(path)
+    return stats.f_bavail * stats.f_frsize
+
+
+@timed(TimingCategory.FILE)
+async def get_signature(path: str) -> tuple[int, int, int]:
+    """
+    Return the inode, size and nanosecond modification time of the
+    filesystem object, which change whenever it is rewritten or
+    replaced.
+    """
+    stats = await aiofiles.os.stat(path)
+    return stats.st_ino, stats.st_size, stats.st_mtime_ns
+
+
+@timed(TimingCategory.FILE)
+async def get_checksum(
+    path: str,
+    on_chunk: Callable[[int], Awaitable[None]] | None = None,
+) -> str:
+    """
+    Return a hexadecimal SHA-256 checksum of the file. The optional
+    on_chunk callback is awaited with the size of every chunk read,
+    which lets callers pace the I/O.
+    """
     digest = hashlib.sha256()
 
     async for chunk in _iter_read(path):
         digest.update(chunk)
+        if on_chunk is not None:
+            await on_chunk(len(chunk))
 
     return digest.hexdigest()
 
 
+@timed(TimingCategory.FILE)
 async def isfile(path: str) -> bool:
     """Return whether the path points to a regular file."""
     return await aiofiles.ospath.isfile(path)
 
 
+@timed(TimingCategory.FILE)
 async def isdir(path: str) -> bool:
     """Return whether the path points to a directory."""
     return await aiofiles.ospath.isdir(path)
 
 
+@timed(TimingCategory.FILE)
 async def ismount(path: str) -> bool:
     """
     Return whether the path is a mount point.
@@ -135,6 +180,7 @@ def isimage(mimetype: str | None) -> bool:
     return mimetype in IMAGE_MIME_TYPES if mimetype else False
 
 
+@timed(TimingCategory.FILE)
 async def mkdir(path: str) -> None:
     """
     Create a directory and persist the directory entry update.
@@ -144,6 +190,7 @@ async def mkdir(path: str) -> None:
     await _fsync_directory(parent)
 
 
+@timed(TimingCategory.FILE)
 async def rmdir(path: str) -> None:
     """Remove an empty directory and persist the directory entry update."""
     parent = _parent_dir(path)
@@ -151,6 +198,25 @@ async def rmdir(path: str) -> None:
     await _fsync_directory(parent)
 
 
+@timed(TimingCategory.FILE)
+async def listdir(path: str) -> list[str]:
+    """Return the sorted names of the entries in a directory."""
+    return sorted(await aiofiles.os.listdir(path))
+
+
+@timed(TimingCategory.FILE)
+async def delete_tree(path: str, max_files: int) -> int:
+    """
+    Remove a directory tree bottom-up, unlinking at most max_files
+    files, and return the number of files removed. Directories are
+    removed once empty. A missing path is treated as already removed.
+    Directory updates are not fsynced: the tree is garbage, and a lost
+    removal is repeated by the next call.
+    """
+    return await asyncio.to_thread(_delete_tree_sync, path, max_files)
+
+
+@timed(TimingCategory.FILE)
 async def touch(path: str) -> None:
     """
     Create an empty file if it does not exist, or update its
@@ -161,6 +227,7 @@ async def touch(path: str) -> None:
     await _fsync_directory(parent)
 
 
+@timed(TimingCategory.FILE)
 async def upload(
     file: AsyncReadable,
     destination: str,
@@ -173,7 +240,8 @@ async def upload(
     """
     async def data_iter() -> AsyncIterator[bytes]:
         while True:
-            chunk = await file.read(FILE_CHUNK_SIZE_BYTES)
+            with untimed():
+                chunk = await file.read(FILE_CHUNK_SIZE_BYTES)
             if not chunk:
                 break
             yield chunk
@@ -181,6 +249,21 @@ async def upload(
     await _atomic_write_stream(data_iter(), destination)
 
 
+@timed(TimingCategory.FILE)
+async def write_stream(
+    destination: str,
+    data: AsyncIterable[bytes],
+) -> None:
+    """
+    Atomically write an async byte stream to destination, such as a
+    raw request body. The stream is written to a temporary file, then
+    flushed, fsynced, atomically replaced, and the parent directory is
+    fsynced.
+    """
+    await _atomic_write_stream(_iter_untimed(data), destination)
+
+
+@timed(TimingCategory.FILE)
 async def write(
     destination: str,
     data: bytes | bytearray | memoryview,
@@ -198,6 +281,7 @@ async def write(
     await _atomic_write_stream(data_iter(), destination)
 
 
+@timed(TimingCategory.FILE)
 async def read(path: str) -> bytes:
     """
     Read the whole file asynchronously in chunks. Data is read
@@ -212,6 +296,24 @@ async def read(path: str) -> bytes:
     return bytes(result)
 
 
+@timed(TimingCategory.FILE)
+async def read_range(
+    path: str,
+    offset: int,
+    length: int,
+) -> AsyncIterator[bytes]:
+    """
+    Read length bytes of a file starting at offset and yield chunks.
+    The file remains open during iteration. Raises ValueError if the
+    file ends before length bytes are read.
+    """
+    async with aiofiles.open(path, mode="rb") as file:
+        await file.seek(offset)
+        async for chunk in _iter_units(file, length, by_line=False):
+            yield chunk
+
+
+@timed(TimingCategory.FILE)
 async def delete(
     path: str,
 ) -> None:
@@ -228,6 +330,7 @@ async def delete(
     await _fsync_directory(_parent_dir(path))
 
 
+@timed(TimingCategory.FILE)
 async def copy(
     source: str,
     destination: str,
@@ -244,6 +347,40 @@ async def copy(
     await _atomic_write_stream(source_iter(), destination)
 
 
+@timed(TimingCategory.FILE)
+async def apply_patches(
+    source: str,
+    destination: str,
+    patches: Sequence[tuple[int, int, bytes]],
+    by_line: bool = False,
+) -> None:
+    """
+    Atomically write source to destination with ranges replaced. Each
+    patch is (start, end, data) in bytes, or in lines if by_line is
+    set, half-open and relative to source; patches must be ordered and
+    non-overlapping. Source is streamed, so unchanged content is never
+    held in memory. Raises ValueError if a range exceeds source.
+    """
+    async def patched_iter() -> AsyncIterator[bytes]:
+        async with aiofiles.open(source, mode="rb") as file:
+            position = 0
+
+            for start, end, data in patches:
+                kept = _iter_units(file, start - position, by_line)
+                async for chunk in kept:
+                    yield chunk
+                async for _ in _iter_units(file, end - start, by_line):
+                    pass
+                yield data
+                position = end
+
+            while chunk := await file.read(FILE_CHUNK_SIZE_BYTES):
+                yield chunk
+
+    await _atomic_write_stream(patched_iter(), destination)
+
+
+@timed(TimingCategory.FILE)
 async def rename(source: str, destination: str) -> None:
     """
     Atomically rename or replace a file or directory. The operation
@@ -261,6 +398,38 @@ async def rename(source: str, destination: str) -> None:
         await _fsync_directory(destination_parent)
 
 
+@timed(TimingCategory.FILE)
+async def write_at(
+    path: str,
+    offset: int,
+    data: AsyncIterable[bytes],
+    limit: int,
+) -> int:
+    """
+    Write a byte stream into a file at offset, creating the file if it
+    does not exist; other regions are left intact, so writers of
+    disjoint ranges may run in parallel. The data is fsynced and its
+    length returned. Raises ValueError if it extends past limit; data
+    written up to that point is kept.
+    """
+    fd = await asyncio.to_thread(os.open, path, os.O_WRONLY | os.O_CREAT)
+    position = offset
+
+    try:
+        async for chunk in _iter_untimed(data):
+            if position + len(chunk) > limit:
+                raise ValueError("Data exceeds the file size")
+            await asyncio.to_thread(_pwrite_all, fd, chunk, position)
+            position += len(chunk)
+
+        await asyncio.to_thread(os.fsync, fd)
+
+    finally:
+        await asyncio.to_thread(os.close, fd)
+
+    return position - offset
+
+
 async def _iter_read(
     path: str,
     chunk_size: int = FILE_CHUNK_SIZE_BYTES,
@@ -278,6 +447,43 @@ async def _iter_read(
             yield chunk
 
 
+async def _iter_untimed(data: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """
+    Yield chunks of a caller-supplied stream, such as a request body,
+    without counting the wait for them as file time.
+    """
+    iterator = aiter(data)
+    while True:
+        with untimed():
+            try:
+                chunk = await anext(iterator)
+            except StopAsyncIteration:
+                return
+        yield chunk
+
+
+async def _iter_units(
+    file,
+    count: int,
+    by_line: bool,
+) -> AsyncIterator[bytes]:
+    """
+    Yield the next count bytes, or count lines, of an open file.
+    Raises ValueError if the file ends first.
+    """
+    while count > 0:
+        if by_line:
+            chunk = await file.readline()
+            count -= 1
+        else:
+            chunk = await file.read(min(count, FILE_CHUNK_SIZE_BYTES))
+            count -= len(chunk)
+
+        if not chunk:
+            raise ValueError("Range exceeds source")
+        yield chunk
+
+
 # NOTE (ADR-46): File writes follow POSIX durability semantics.
 # The file is fsynced before atomic replace, then the parent
 # directory is fsynced to persist the directory entry update.
@@ -313,6 +519,26 @@ async def _atomic_write_stream(
         raise
 
 
+def _delete_tree_sync(path: str, max_files: int) -> int:
+    removed = 0
+    for root, _, filenames in os.walk(path, topdown=False):
+        for filename in filenames:
+            if removed >= max_files:
+                return removed
+            os.unlink(os.path.join(root, filename))
+            removed += 1
+        os.rmdir(root)
+    return removed
+
+
+def _pwrite_all(fd: int, data: bytes, offset: int) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
 def _touch_sync(path: str) -> None:
     with open(path, "a"):
         os.utime(path, None)
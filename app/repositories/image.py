@@ -10,11 +10,13 @@ from PIL import Image, ImageOps
 from app.config import get_config
 from app.constants import FILE_THUMBNAIL_SIZE
 from app.repositories import file as file_repository
+from app.timing import TimingCategory, timed
 
 ImageRotationAngle = Literal[90, 180, 270]
 ImageAxis = Literal["horizontal", "vertical"]
 
 
+@timed(TimingCategory.IMAGE)
 async def get_image_size(source: str) -> tuple[int, int]:
     """
     Return the image dimensions after EXIF orientation normalization.
@@ -22,6 +24,7 @@ async def get_image_size(source: str) -> tuple[int, int]:
     return await asyncio.to_thread(_get_image_size_sync, source)
 
 
+@timed(TimingCategory.IMAGE)
 async def create_thumbnail(
     source: str,
     destination: str,
@@ -37,6 +40,7 @@ async def create_thumbnail(
     await file_repository.write(destination, data)
 
 
+@timed(TimingCategory.IMAGE)
 async def rotate(
     source: str,
     destination: str,
@@ -51,6 +55,7 @@ async def rotate(
     await file_repository.write(destination, data)
 
 
+@timed(TimingCategory.IMAGE)
 async def flip(
     source: str,
     destination: str,
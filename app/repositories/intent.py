@@ -0,0 +1,116 @@
+# app/repositories/intent.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import json
+import os
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from app.config import get_config
+from app.constants import FILES_INTENT_SUFFIX
+from app.repositories.file import (
+    copy,
+    delete,
+    isdir,
+    isfile,
+    listdir,
+    read,
+    rename,
+    rmdir,
+    write,
+)
+
+ACTION_DELETE = "delete"
+ACTION_COPY = "copy"
+ACTION_RENAME = "rename"
+ACTION_RMDIR = "rmdir"
+
+IntentAction = tuple[str, ...]
+
+
+# NOTE (ADR-73): Multi-step file operations are journaled as intents.
+# Before its first filesystem effect, an operation writes an intent
+# file with a commit marker (a row that exists or is absent only if
+# the database transaction committed) and idempotent filesystem
+# actions for both outcomes. The intent is removed once the process
+# has finished the operation, successfully or not. Intents left by a
+# crashed process are replayed on mount: the marker decides which
+# actions run, so recovery costs O(in-flight operations) and never
+# scans the storage.
+
+@dataclass
+class Intent:
+    """Planned filesystem effects of one in-flight file operation."""
+
+    operation: str
+    table: str
+    filters: dict[str, Any]
+    on_commit: list[IntentAction] = field(default_factory=list)
+    on_rollback: list[IntentAction] = field(default_factory=list)
+    committed_if_present: bool = True
+    intent_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+
+
+def get_intent_path(intent_id: str) -> str:
+    config = get_config()
+    return os.path.join(
+        config.FILES_INTENTS_DIR,
+        intent_id + FILES_INTENT_SUFFIX,
+    )
+
+
+async def write_intent(intent: Intent) -> None:
+    """Atomically write or replace an intent file."""
+    await write(
+        get_intent_path(intent.intent_id),
+        json.dumps(asdict(intent)).encode("utf-8"),
+    )
+
+
+async def remove_intent(intent: Intent) -> None:
+    """Remove an intent file. A missing file is ignored."""
+    await delete(get_intent_path(intent.intent_id))
+
+
+async def list_intents() -> list[Intent]:
+    """Return intents left in the journal in name order."""
+    config = get_config()
+    intents = []
+    for name in await listdir(config.FILES_INTENTS_DIR):
+        if not name.endswith(FILES_INTENT_SUFFIX):
+            continue
+        data = await read(os.path.join(config.FILES_INTENTS_DIR, name))
+        intent = Intent(**json.loads(data.decode("utf-8")))
+        intent.on_commit = [tuple(action) for action in intent.on_commit]
+        intent.on_rollback = [tuple(action) for action in intent.on_rollback]
+        intents.append(intent)
+    return intents
+
+
+async def apply_intent_actions(actions: list[IntentAction]) -> None:
+    """
+    Apply journaled filesystem actions in order. Every action is
+    idempotent: a missing source means the action already ran, so a
+    replay interrupted by another crash can be repeated safely.
+    """
+    for action in actions:
+        name, *paths = action
+
+        if name == ACTION_DELETE:
+            await delete(paths[0])
+
+        elif name == ACTION_COPY:
+            if await isfile(paths[0]):
+                await copy(paths[0], paths[1])
+
+        elif name == ACTION_RENAME:
+            if await isfile(paths[0]) or await isdir(paths[0]):
+                await rename(paths[0], paths[1])
+
+        elif name == ACTION_RMDIR:
+            if await isdir(paths[0]):
+                await rmdir(paths[0])
+
+        else:
+            raise ValueError(f"Unknown intent action: {name}")
@@ -3,7 +3,7 @@
 
 from typing import Any
 
-from sqlalchemy import Select, asc, desc, func, literal, select
+from sqlalchemy import Select, asc, delete, desc, func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 from sqlalchemy.sql import ColumnElement
@@ -178,6 +178,80 @@ class ORMRepository:
 
         return tuple(result.scalars().all())
 
+    async def select_subtree_ids(
+        self,
+        obj: Base,
+        parent_id_attr: str = "parent_id",
+    ) -> list[tuple[Any, int]]:
+        """
+        Return (id, depth) pairs for a self-referential ORM object and
+        all its descendants using a recursive CTE. The object itself
+        has depth 0. Pairs are ordered by depth. Performs a single
+        query and does not load ORM objects.
+        """
+        cls = type(obj)
+        id_column = getattr(cls, "id")
+
+        subtree = (
+            select(
+                id_column.label("id"),
+                literal(0).label("depth"),
+            )
+            .where(id_column == obj.id)
+            .cte(name="subtree", recursive=True)
+        )
+
+        child_alias = aliased(cls)
+
+        subtree = subtree.union_all(
+            select(
+                getattr(child_alias, "id"),
+                (subtree.c.depth + 1).label("depth"),
+            )
+            .where(getattr(child_alias, parent_id_attr) == subtree.c.id)
+        )
+
+        result = await self.session.execute(
+            select(subtree.c.id, subtree.c.depth)
+            .order_by(subtree.c.depth, subtree.c.id)
+        )
+
+        return [(row.id, row.depth) for row in result]
+
+    async def select_values(
+        self,
+        cls: type[Base],
+        column_name: str,
+        **filters: Any,
+    ) -> list[Any]:
+        """
+        Select values of one mapped column matching dynamic filters.
+        Does not load ORM objects or their relationships.
+        """
+        query = self.make_subquery(cls, column_name, **filters)
+
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def delete_all(
+        self,
+        cls: type[Base],
+        **filters: Any,
+    ) -> int:
+        """
+        Delete all rows matching dynamic filters with one set-based
+        DELETE statement. Loaded objects are not synchronized and ORM
+        delete events are not fired. Returns number of deleted rows.
+        """
+        query = (
+            delete(cls)
+            .where(*self._build_where(cls, **filters))
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await self.session.execute(query)
+        return int(result.rowcount)
+
     async def count_all(
         self,
         cls: type[Base],
@@ -193,6 +267,23 @@ class ORMRepository:
         result = await self.session.execute(query)
         return int(result.scalar_one())
 
+    async def count_values(
+        self,
+        cls: type[Base],
+        column_name: str,
+        **filters: Any,
+    ) -> dict[Any, int]:
+        """
+        Count ORM objects matching dynamic filters grouped by values of
+        one mapped column. Returns mapping of value to count.
+        """
+        column = self._get_column(cls, column_name)
+        query = select(column, func.count()).group_by(column)
+        query = query.where(*self._build_where(cls, **filters))
+
+        result = await self.session.execute(query)
+        return {value: int(count) for value, count in result.all()}
+
     async def flush(self) -> None:
         """
         Flush pending session changes without committing transaction.
@@ -251,6 +342,7 @@ class ORMRepository:
         - field__is=None
         - field__isnot=None
         - field__subquery=select(...)
+        - field__notsubquery=select(...)
         """
         conditions: list[ColumnElement[bool]] = []
 
@@ -291,6 +383,8 @@ class ORMRepository:
                 conditions.append(column.is_not(value))
             elif operator == "subquery":
                 conditions.append(column.in_(value))
+            elif operator == "notsubquery":
+                conditions.append(column.not_in(value))
             else:
                 raise ValueError("Unsupported operator in filter")
 
@@ -0,0 +1,130 @@
+# app/repositories/trash.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import json
+import os
+import uuid
+from collections.abc import Sequence
+
+from app.config import get_config
+from app.constants import (
+    FILES_TRASH_MANIFEST_FILENAME,
+    FILES_TRASH_PENDING_FILENAME,
+    FILES_TRASH_TREE_DIRNAME,
+)
+from app.repositories.file import (
+    delete,
+    isfile,
+    listdir,
+    mkdir,
+    read,
+    rename,
+    rmdir,
+    write,
+)
+
+TrashManifest = dict[str, list[str]]
+
+MANIFEST_REVISIONS = "revisions"
+MANIFEST_THUMBNAILS = "thumbnails"
+
+
+# NOTE (ADR-72): Recursive folder deletion moves the tree to trash.
+# Every trash entry is a directory holding the renamed folder tree and
+# a manifest with revision and thumbnail storage keys of the deleted
+# files. The manifest is written as pending before the database
+# transaction and sealed by rename after the commit. Only sealed
+# entries are reclaimed, so blobs are never removed while database
+# rows still reference them; an entry left pending by a crash is
+# sealed or rolled back by the intent journal on mount (ADR-73).
+
+def get_trash_entry_path() -> str:
+    """Return a unique path for a new trash entry directory."""
+    config = get_config()
+    return os.path.join(config.FILES_TRASH_DIR, str(uuid.uuid4()))
+
+
+def get_trash_tree_path(entry_dir: str) -> str:
+    return os.path.join(entry_dir, FILES_TRASH_TREE_DIRNAME)
+
+
+def get_trash_pending_path(entry_dir: str) -> str:
+    return os.path.join(entry_dir, FILES_TRASH_PENDING_FILENAME)
+
+
+def get_trash_manifest_path(entry_dir: str) -> str:
+    return os.path.join(entry_dir, FILES_TRASH_MANIFEST_FILENAME)
+
+
+async def create_trash_entry(
+    entry_dir: str,
+    revision_uuids: Sequence[str],
+    thumbnail_uuids: Sequence[str],
+) -> None:
+    """
+    Create a trash entry directory with a pending manifest. The folder
+    tree is moved into it by the caller.
+    """
+    await mkdir(entry_dir)
+    await _write_manifest(
+        get_trash_pending_path(entry_dir),
+        {
+            MANIFEST_REVISIONS: list(revision_uuids),
+            MANIFEST_THUMBNAILS: list(thumbnail_uuids),
+        },
+    )
+
+
+async def seal_trash_entry(entry_dir: str) -> None:
+    """Mark a trash entry as committed and eligible for reclaim."""
+    await rename(
+        get_trash_pending_path(entry_dir),
+        get_trash_manifest_path(entry_dir),
+    )
+
+
+async def discard_trash_entry(entry_dir: str) -> None:
+    """
+    Remove an unsealed trash entry whose tree was moved back. The
+    entry directory must contain only the pending manifest.
+    """
+    await delete(get_trash_pending_path(entry_dir))
+    await rmdir(entry_dir)
+
+
+async def list_sealed_trash_entries() -> list[str]:
+    """Return paths of sealed trash entries in name order."""
+    config = get_config()
+    entries = []
+    for name in await listdir(config.FILES_TRASH_DIR):
+        entry_dir = os.path.join(config.FILES_TRASH_DIR, name)
+        if await isfile(get_trash_manifest_path(entry_dir)):
+            entries.append(entry_dir)
+    return entries
+
+
+async def read_trash_manifest(entry_dir: str) -> TrashManifest:
+    data = await read(get_trash_manifest_path(entry_dir))
+    manifest = json.loads(data.decode("utf-8"))
+    return {
+        MANIFEST_REVISIONS: list(manifest.get(MANIFEST_REVISIONS, [])),
+        MANIFEST_THUMBNAILS: list(manifest.get(MANIFEST_THUMBNAILS, [])),
+    }
+
+
+async def write_trash_manifest(
+    entry_dir: str,
+    manifest: TrashManifest,
+) -> None:
+    """Atomically replace the manifest of a sealed trash entry."""
+    await _write_manifest(get_trash_manifest_path(entry_dir), manifest)
+
+
+async def remove_trash_entry(entry_dir: str) -> None:
+    """Remove a fully reclaimed trash entry and its manifest."""
+    await delete(get_trash_manifest_path(entry_dir))
+    await rmdir(entry_dir)
+
+
+async def _write_manifest(path: str, manifest: TrashManifest) -> None:
+    await write(path, json.dumps(manifest).encode("utf-8"))
@@ -0,0 +1,63 @@
+# app/routers/audit_export.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.auth import AccessLevel, require_access
+from app.dependencies.session import get_session
+from app.models.user import User
+from app.schemas.audit_export import AUDIT_EXPORT_ERRORS, AuditExportRequest
+from app.services.audit_export import export_audit
+
+router = APIRouter(tags=["Services"])
+
+
+@router.get(
+    "/audit/export",
+    response_class=StreamingResponse,
+    responses=AUDIT_EXPORT_ERRORS,
+    status_code=status.HTTP_200_OK,
+    summary="Export audit records as NDJSON stream",
+)
+async def audit_export_router(
+    session: AsyncSession = Depends(get_session),
+    params: AuditExportRequest = Depends(),
+    current_user: User = Depends(require_access(AccessLevel.ADMIN)),
+) -> StreamingResponse:
+    """
+    Streams audit records matching the filters as newline-delimited
+    JSON in ascending ID order, including archived records. Memory use
+    does not depend on the size of the exported range. The response is
+    gzip-compressed when the client accepts it.
+
+    **Hooks:**
+
+    `AUDIT_EXPORT_COMPLETED` — executed before the stream starts.
+
+    **Authentication:**
+
+    - Requires a valid token with admin access.
+
+    **Request query:**
+
+    `AuditExportRequest` — time range, event filter, and `after_id`
+    resume cursor.
+
+    **Response:**
+
+    One JSON object per line with the same fields as an audit list
+    item. To resume an interrupted export, repeat the request with
+    `after_id` set to the last received `audit_id`.
+
+    **Response codes:**
+
+    - `200` — Audit export stream started.
+    - `401` — Invalid, expired, or missing token.
+    - `403` — User not admin, inactive, or blocked.
+    - `422` — Input values failed validation.
+    - `503` — Service temporarily unavailable.
+    """
+    chunks = await export_audit(session=session, params=params)
+    return StreamingResponse(chunks, media_type="application/x-ndjson")
@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies.auth import AccessLevel, require_access
-from app.dependencies.session import get_session
+from app.dependencies.session import get_audit_session, get_session
 from app.models.user import User
 from app.schemas.audit_list import (
     AUDIT_LIST_ERRORS,
@@ -26,6 +26,7 @@ router = APIRouter(tags=["Services"])
 )
 async def audit_list_router(
     session: AsyncSession = Depends(get_session),
+    audit_session: AsyncSession = Depends(get_audit_session),
     params: AuditListRequest = Depends(),
     current_user: User = Depends(require_access(AccessLevel.ADMIN)),
 ) -> AuditListResponse:
@@ -50,17 +51,26 @@ async def audit_list_router(
 
     `AuditListResponse` — current page of audit records and total
     count of audit records matching the filters (before pagination).
+    With archived records filtered by request UUID or resource ID the
+    total may only count records up to the page; `audit_count_exact`
+    is false then.
 
     **Response codes:**
 
     - `200` — Audit list returned successfully.
     - `401` — Invalid, expired, or missing token.
     - `403` — User not admin, inactive, or blocked.
-    - `422` — Input values failed validation.
+    - `422` — Input values failed validation, or archived records
+      cannot be ordered by `request_uuid` or `resource_id`.
     - `503` — Service temporarily unavailable.
     """
-    audit, audit_count = await list_audit(
+    audit, audit_count, audit_count_exact = await list_audit(
         session=session,
+        audit_session=audit_session,
         params=params,
     )
-    return AuditListResponse(audit=audit, audit_count=audit_count)
+    return AuditListResponse(
+        audit=audit,
+        audit_count=audit_count,
+        audit_count_exact=audit_count_exact,
+    )
@@ -0,0 +1,158 @@
+# app/routers/file_archive.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.auth import AccessLevel, require_access
+from app.dependencies.rate_limit import require_rate_limit
+from app.dependencies.session import get_session
+from app.models.user import User
+from app.runtime.rate_limit import RateLimitCost
+from app.routers.file_download import content_disposition
+from app.schemas.file_archive import FILE_ARCHIVE_ERRORS, FileArchiveRequest
+from app.services.file_archive import archive_files
+
+router = APIRouter(tags=["Files"])
+
+
+@router.get(
+    "/files/archive",
+    response_class=StreamingResponse,
+    responses=FILE_ARCHIVE_ERRORS,
+    status_code=status.HTTP_200_OK,
+    summary="Download files as archive",
+)
+async def file_archive_router(
+    request: Request,
+    params: Annotated[FileArchiveRequest, Query()],
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(require_access(AccessLevel.READ)),
+    rate_limit: None = Depends(require_rate_limit(RateLimitCost.HEAVY)),
+) -> Response:
+    """
+    Streams a folder subtree or a selection of files as a zip or tar
+    archive. The archive is built while it is sent, so memory use does
+    not depend on its size. Each file is read under a READ lock; a file
+    changed after the request started aborts the stream.
+
+    **Hooks:**
+
+    `FILE_ARCHIVE_COMPLETED` — executed before the stream starts.
+
+    **Authentication:**
+
+    - Requires a valid token with read access or higher.
+
+    **Request query:**
+
+    `FileArchiveRequest` — `folder_id` or `file_ids`, `format`, and
+    `compression`.
+
+    **Request headers:**
+
+    - `Range` — single byte range to resume an interrupted download of
+      a tar or a stored zip archive.
+    - `If-Range` — entity tag of the interrupted download; the whole
+      archive is returned if its content changed since.
+
+    **Response:**
+
+    Archive content. Tar and stored zip archives have a known length
+    and support ranges; deflated zip archives are streamed without
+    length.
+
+    **Response codes:**
+
+    - `200` — Archive stream started.
+    - `206` — Requested range of the archive stream started.
+    - `401` — Invalid, expired, or missing token.
+    - `403` — User inactive, blocked, or lacks read access.
+    - `404` — Folder or one of the files was not found.
+    - `409` — Archive would contain too many entries.
+    - `416` — Requested range is outside the archive.
+    - `422` — Input values failed validation.
+    - `429` — Rate limit exceeded; retry later.
+    - `503` — Service temporarily unavailable.
+    """
+    archive, filename, etag = await archive_files(
+        session=session,
+        params=params,
+    )
+
+    headers = {
+        "Content-Disposition": content_disposition(filename),
+        "ETag": etag,
+    }
+
+    if archive.size is None:
+        return StreamingResponse(
+            archive.stream(), media_type=archive.media_type, headers=headers,
+        )
+
+    headers["Accept-Ranges"] = "bytes"
+    if_range = request.headers.get("if-range")
+
+    try:
+        byte_range = None
+        if if_range is None or if_range == etag:
+            byte_range = _parse_range(
+                request.headers.get("range"), archive.size,
+            )
+
+    except ValueError:
+        return Response(
+            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+            headers={"Content-Range": f"bytes */{archive.size}"},
+        )
+
+    if byte_range is None:
+        headers["Content-Length"] = str(archive.size)
+        return StreamingResponse(
+            archive.stream(), media_type=archive.media_type, headers=headers,
+        )
+
+    start, end = byte_range
+    headers["Content-Length"] = str(end - start)
+    headers["Content-Range"] = f"bytes {start}-{end - 1}/{archive.size}"
+    return StreamingResponse(
+        archive.stream(start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=archive.media_type,
+        headers=headers,
+    )
+
+
+def _parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    Return [start, end) of a single byte range header, or None if the
+    header is absent or not a single byte range, which is served as the
+    whole archive. Raises ValueError if the range is unsatisfiable.
+    """
+    if header is None:
+        return None
+
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    first, dash, last = spec.strip().partition("-")
+    digits = first + last
+    if not dash or not (digits.isascii() and digits.isdigit()):
+        return None
+
+    if not first:
+        length = int(last)
+        if length == 0:
+            raise ValueError("Empty suffix range")
+        return max(size - length, 0), size
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError("Range is outside the archive")
+    return start, min(int(last) + 1, size) if last else size
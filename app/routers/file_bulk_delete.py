@@ -0,0 +1,71 @@
+# app/routers/file_bulk_delete.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.auth import AccessLevel, require_access
+from app.dependencies.session import get_session
+from app.models.user import User
+from app.schemas.file_bulk import FileBulkResponse, FileBulkResult
+from app.schemas.file_bulk_delete import (
+    FILE_BULK_DELETE_ERRORS,
+    FileBulkDeleteRequest,
+)
+from app.services.file_bulk_delete import delete_files
+
+router = APIRouter(tags=["Files"])
+
+
+@router.post(
+    "/files/delete",
+    response_model=FileBulkResponse,
+    responses=FILE_BULK_DELETE_ERRORS,
+    status_code=status.HTTP_200_OK,
+    summary="Delete files",
+)
+async def file_bulk_delete_router(
+    data: FileBulkDeleteRequest,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(require_access(AccessLevel.ADMIN)),
+) -> FileBulkResponse:
+    """
+    Deletes several files together with their thumbnails, revisions,
+    tags, and comments. Files are processed in batches with one
+    transaction per batch; each file gets its own result status.
+
+    **Hooks:**
+
+    `FILE_BULK_DELETE_COMPLETED` — executed once after all batches are
+    processed, with per-file statuses.
+
+    **Authentication:**
+
+    - Requires a valid token with admin access.
+
+    **Request body:**
+
+    `FileBulkDeleteRequest` — file IDs.
+
+    **Response:**
+
+    `FileBulkResponse` — per-file statuses: `ok`, `not_found`,
+    `locked` (parent folder is write-protected), or `failed`.
+
+    **Response codes:**
+
+    - `200` — Request processed; see per-file statuses.
+    - `401` — Invalid, expired, or missing token.
+    - `403` — User inactive, blocked, or lacks admin access.
+    - `422` — Input values failed validation.
+    - `503` — Service temporarily unavailable.
+    """
+    statuses = await delete_files(
+        session=session,
+        data=data,
+    )
+
+    return FileBulkResponse(results=[
+        FileBulkResult(file_id=file_id, status=file_status)
+        for file_id, file_status in statuses.items()
+    ])
@@ -0,0 +1,75 @@
+# app/routers/file_bulk_move.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.auth import AccessLevel, require_access
+from app.dependencies.session import get_session
+from app.models.user import User
+from app.schemas.file_bulk import FileBulkResponse, FileBulkResult
+from app.schemas.file_bulk_move import (
+    FILE_BULK_MOVE_ERRORS,
+    FileBulkMoveRequest,
+)
+from app.services.file_bulk_move import move_files
+
+router = APIRouter(tags=["Files"])
+
+
+@router.post(
+    "/files/move",
+    response_model=FileBulkResponse,
+    responses=FILE_BULK_MOVE_ERRORS,
+    status_code=status.HTTP_200_OK,
+    summary="Move files",
+)
+async def file_bulk_move_router(
+    data: FileBulkMoveRequest,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(require_access(AccessLevel.EDIT)),
+) -> FileBulkResponse:
+    """
+    Moves several files to another folder. Files are processed in
+    batches with one transaction per batch; each file gets its own
+    result status.
+
+    **Hooks:**
+
+    `FILE_BULK_MOVE_COMPLETED` — executed once after all batches are
+    processed, with per-file statuses.
+
+    **Authentication:**
+
+    - Requires a valid token with edit access or higher.
+
+    **Request body:**
+
+    `FileBulkMoveRequest` — file IDs and destination folder ID.
+
+    **Response:**
+
+    `FileBulkResponse` — per-file statuses: `ok`, `not_found`,
+    `locked` (source folder is write-protected), `conflict` (filename
+    or path conflict in the destination), or `failed`.
+
+    **Response codes:**
+
+    - `200` — Request processed; see per-file statuses.
+    - `401` — Invalid, expired, or missing token.
+    - `403` — User inactive, blocked, or lacks editor access.
+    - `404` — Destination folder was not found.
+    - `422` — Input values failed validation.
+    - `423` — Destination folder is write-protected.
+    - `503` — Service temporarily unavailable.
+    """
+    statuses = await move_files(
+        session=session,
+        user=current_user,
+        data=data,
+    )
+
+    return FileBulkResponse(results=[
+        FileBulkResult(file_id=file_id, status=file_status)
+        for file_id, file_status in statuses.items()
+    ])
@@ -0,0 +1,72 @@
+# app/routers/file_bulk_starred_change.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.auth import AccessLevel, require_access
+from app.dependencies.session import get_session
+from app.models.user import User
+from app.schemas.file_bulk import FileBulkResponse, FileBulkResult
+from app.schemas.file_bulk_starred_change import (
+    FILE_BULK_STARRED_ERRORS,
+    FileBulkStarredChangeRequest,
+)
+from app.services.file_bulk_starred_change import change_files_starred
+
+router = APIRouter(tags=["Files"])
+
+
+@router.patch(
+    "/files/starred",
+    response_model=FileBulkResponse,
+    responses=FILE_BULK_STARRED_ERRORS,
+    status_code=status.HTTP_200_OK,
+    summary="Change starred flag of files",
+)
+async def file_bulk_starred_change_router(
+    data: FileBulkStarredChangeRequest,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(require_access(AccessLevel.EDIT)),
+) -> FileBulkResponse:
+    """
+    Updates the starred flag for several files. Files are processed in
+    batches with one transaction per batch; each file gets its own
+    result status.
+
+    **Hooks:**
+
+    `FILE_BULK_STARRED_CHANGE_COMPLETED` — executed once after all
+    batches are processed, with per-file statuses.
+
+    **Authentication:**
+
+    - Requires edit access or higher.
+
+    **Request body:**
+
+    - `FileBulkStarredChangeRequest` — file IDs and new starred value.
+
+    **Response:**
+
+    `FileBulkResponse` — per-file statuses: `ok`, `not_found`, or
+    `failed`.
+
+    **Response codes:**
+
+    - `200` — Request processed; see per-file statuses.
+    - `401` — Invalid, expired, or missing token.
+    - `403` — User inactive, blocked, or lacks access.
+    - `422` — Validation error.
+    - `503` — Service unavailable.
+    """
+    statuses = await change_files_starred(
+        session=session,
+        user=current_user,
+        data=data,
+    )
+
+    return FileBulkResponse(results=[
+        FileBulkResult(file_id=file_id, status=file_status)
+        for file_id, file_status in statuses.items()
+    ])
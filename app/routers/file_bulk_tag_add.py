@@ -0,0 +1,72 @@
+# app/routers/file_bulk_tag_add.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.auth import AccessLevel, require_access
+from app.dependencies.session import get_session
+from app.models.user import User
+from app.schemas.file_bulk import FileBulkResponse, FileBulkResult
+from app.schemas.file_bulk_tag_add import (
+    FILE_BULK_TAG_ADD_ERRORS,
+    FileBulkTagAddRequest,
+)
+from app.services.file_bulk_tag_add import add_files_tag
+
+router = APIRouter(tags=["Files"])
+
+
+@router.post(
+    "/files/tag",
+    response_model=FileBulkResponse,
+    responses=FILE_BULK_TAG_ADD_ERRORS,
+    status_code=status.HTTP_200_OK,
+    summary="Add tag to files",
+)
+async def file_bulk_tag_add_router(
+    data: FileBulkTagAddRequest,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(require_access(AccessLevel.EDIT)),
+) -> FileBulkResponse:
+    """
+    Adds a tag to several files. The operation is idempotent per file.
+    Files are processed in batches with one transaction per batch; each
+    file gets its own result status.
+
+    **Hooks:**
+
+    `FILE_BULK_TAG_ADD_COMPLETED` — executed once after all batches
+    are processed, with per-file statuses.
+
+    **Authentication:**
+
+    - Requires a valid token with edit access or higher.
+
+    **Request body:**
+
+    `FileBulkTagAddRequest` — file IDs and tag value.
+
+    **Response:**
+
+    `FileBulkResponse` — per-file statuses: `ok`, `not_found`,
+    `locked` (parent folder is write-protected), or `failed`.
+
+    **Response codes:**
+
+    - `200` — Request processed; see per-file statuses.
+    - `401` — Invalid, expired, or missing token.
+    - `403` — User inactive, blocked, or lacks editor access.
+    - `422` — Input values failed validation.
+    - `503` — Service temporarily unavailable.
+    """
+    statuses = await add_files_tag(
+        session=session,
+        user=current_user,
+        data=data,
+    )
+
+    return FileBulkResponse(results=[
+        FileBulkResult(file_id=file_id, status=file_status)
+        for file_id, file_status in statuses.items()
+    ])
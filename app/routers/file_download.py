@@ -1,8 +1,10 @@
 # app/routers/file_download.py
 # SPDX-License-Identifier: GPL-3.0-only
 
+from urllib.parse import quote
+
 from fastapi import APIRouter, Depends, status
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies.auth import AccessLevel, require_access
@@ -26,7 +28,7 @@ async def file_download_router(
     revision_number: int,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(require_access(AccessLevel.READ)),
-) -> FileResponse:
+) -> Response:
     """
     Downloads the specified revision of a file.
 
@@ -48,7 +50,8 @@ async def file_download_router(
 
     **Response:**
 
-    Binary file content.
+    Binary file content. Text revisions stored as deltas are rebuilt
+    before they are returned.
 
     **Response codes:**
 
@@ -59,14 +62,33 @@ async def file_download_router(
     - `422` — Input values failed validation.
     - `503` — Service temporarily unavailable.
     """
-    revision, file_path = await download_file(
+    revision, content = await download_file(
         session=session,
         file_id=file_id,
         revision_number=revision_number,
     )
 
+    if isinstance(content, bytes):
+        return Response(
+            content=content,
+            media_type=revision.mimetype,
+            headers={
+                "Content-Disposition": content_disposition(
+                    revision.filename,
+                ),
+            },
+        )
+
     return FileResponse(
-        path=file_path,
+        path=content,
         media_type=revision.mimetype,
         filename=revision.filename,
     )
+
+
+def content_disposition(filename: str) -> str:
+    # Same header as FileResponse builds for the path-based responses.
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
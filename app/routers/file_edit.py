@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies.auth import AccessLevel, require_access
 from app.dependencies.session import get_session
+from app.middleware.upload_admission import UploadAdmissionRoute
 from app.models.user import User
 from app.schemas.file_edit import (
     FILE_EDIT_ERRORS,
@@ -14,7 +15,7 @@ from app.schemas.file_edit import (
 )
 from app.services.file_edit import edit_file
 
-router = APIRouter(tags=["Files"])
+router = APIRouter(tags=["Files"], route_class=UploadAdmissionRoute)
 
 
 @router.post(
@@ -64,7 +65,9 @@ async def file_edit_router(
     - `409` — File is not a text file or inconsistent state.
     - `422` — Input validation error.
     - `423` — Parent folder is write-protected.
+    - `429` — Too many bytes in flight; retry later.
     - `503` — Service temporarily unavailable.
+    - `507` — Insufficient free storage space.
     """
     edited = await edit_file(
         session=session,
@@ -0,0 +1,87 @@
+# app/routers/file_import.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from fastapi import APIRouter, Depends, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.auth import AccessLevel, require_access
+from app.dependencies.rate_limit import require_rate_limit
+from app.dependencies.session import get_session
+from app.middleware.upload_admission import UploadAdmissionRoute
+from app.models.user import User
+from app.runtime.rate_limit import RateLimitCost
+from app.schemas.file_import import FILE_IMPORT_ERRORS, FileImportResponse
+from app.services.file_import import import_archive
+
+router = APIRouter(tags=["Files"], route_class=UploadAdmissionRoute)
+
+
+@router.post(
+    "/folder/{folder_id}/import",
+    response_model=FileImportResponse,
+    responses=FILE_IMPORT_ERRORS,
+    status_code=status.HTTP_200_OK,
+    summary="Import archive",
+)
+async def file_import_router(
+    folder_id: int,
+    request: Request,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(require_access(AccessLevel.WRITE)),
+    rate_limit: None = Depends(require_rate_limit(RateLimitCost.HEAVY)),
+) -> FileImportResponse:
+    """
+    Expands a zip or tar archive into an existing folder. Folders of
+    the archive are created or reused and files are created; existing
+    files are never overwritten. Entries are committed in batches with
+    one transaction per batch, and each entry gets its own result
+    status. Thumbnails of imported images are created in the
+    background.
+
+    **Hooks:**
+
+    `FILE_IMPORT_COMPLETED` — executed once after all batches are
+    processed, with per-entry results.
+
+    **Authentication:**
+
+    - Requires a valid token with write access or higher.
+
+    **Request path:**
+
+    - `folder_id` — ID of the target folder.
+
+    **Request body:**
+
+    - Zip or tar archive content; tar may be gzip, bzip2, or xz
+      compressed.
+
+    **Response:**
+
+    `FileImportResponse` — per-entry results: `created`, `exists`
+    (folder reused), `locked` (existing folder is write-protected),
+    `invalid` (unsafe path, link or special file, or depth or path
+    length limit exceeded), `conflict` (name already taken), or
+    `failed`.
+
+    **Response codes:**
+
+    - `200` — Archive processed; see per-entry results.
+    - `401` — Invalid, expired, or missing token.
+    - `403` — User inactive, blocked, or lacks writer access.
+    - `404` — Target folder was not found.
+    - `409` — Archive contains too many entries or too many
+      uncompressed bytes.
+    - `422` — Request body is not a readable archive.
+    - `423` — Target folder is write-protected.
+    - `429` — Too many bytes in flight or rate limit exceeded.
+    - `503` — Service temporarily unavailable.
+    - `507` — Insufficient free storage space.
+    """
+    results = await import_archive(
+        session=session,
+        user=current_user,
+        folder_id=folder_id,
+        data=request.stream(),
+    )
+    return FileImportResponse(results=results)
@@ -5,8 +5,10 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies.auth import AccessLevel, require_access
+from app.dependencies.rate_limit import require_rate_limit
 from app.dependencies.session import get_session
 from app.models.user import User
+from app.runtime.rate_limit import RateLimitCost
 from app.schemas.file_list import (
     FILE_LIST_ERRORS,
     FileListRequest,
@@ -29,6 +31,7 @@ async def file_list_router(
     session: AsyncSession = Depends(get_session),
     params: FileListRequest = Depends(),
     current_user: User = Depends(require_access(AccessLevel.READ)),
+    rate_limit: None = Depends(require_rate_limit(RateLimitCost.MEDIUM)),
 ) -> FileListResponse:
     """
     Returns files matching the query. When folder_id__eq is set, only
@@ -55,6 +58,7 @@ async def file_list_router(
     - `403` — User inactive, blocked, or lacks read access.
     - `404` — Folder not found (when set).
     - `422` — Input values failed validation.
+    - `429` — Rate limit exceeded; retry later.
     - `503` — Service temporarily unavailable.
     """
     files, files_count = await list_files(
@@ -0,0 +1,84 @@
+# app/routers/file_patch.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.auth import AccessLevel, require_access
+from app.dependencies.session import get_session
+from app.middleware.upload_admission import UploadAdmissionRoute
+from app.models.user import User
+from app.schemas.file_patch import (
+    FILE_PATCH_ERRORS,
+    FilePatchRequest,
+    FilePatchResponse,
+)
+from app.services.file_edit import patch_file
+
+router = APIRouter(tags=["Files"], route_class=UploadAdmissionRoute)
+
+
+@router.post(
+    "/file/{file_id}/patch",
+    response_model=FilePatchResponse,
+    responses=FILE_PATCH_ERRORS,
+    status_code=status.HTTP_200_OK,
+    summary="Patch text file",
+)
+async def file_patch_router(
+    file_id: int,
+    data: FilePatchRequest,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(require_access(AccessLevel.EDIT)),
+) -> FilePatchResponse:
+    """
+    Replaces line or byte ranges of a text file without sending its
+    full content. The ranges refer to the content identified by the
+    base checksum; if the file has changed since, the patch is
+    rejected. A new file revision is created for every successful
+    patch.
+
+    **Hooks:**
+
+    `FILE_EDIT_COMPLETED` — executed after the file is successfully
+    patched.
+
+    **Authentication:**
+
+    - Requires a valid token with edit access or higher.
+
+    **Request path:**
+
+    - `file_id` — ID of the target file.
+
+    **Request body:**
+
+    - `FilePatchRequest` — base checksum, range unit and ordered,
+      non-overlapping ranges with their replacement text.
+
+    **Response:**
+
+    `FilePatchResponse` — identifier of the patched file.
+
+    **Response codes:**
+
+    - `200` — File patched successfully.
+    - `401` — Invalid, expired, or missing token.
+    - `403` — User inactive, blocked, or lacks edit access.
+    - `404` — Target file not found.
+    - `409` — File is not a text file, base checksum does not match,
+      or inconsistent state.
+    - `422` — Input validation error or range beyond the end of file.
+    - `423` — Parent folder is write-protected.
+    - `429` — Too many bytes in flight; retry later.
+    - `503` — Service temporarily unavailable.
+    - `507` — Insufficient free storage space.
+    """
+    patched = await patch_file(
+        session=session,
+        user=current_user,
+        file_id=file_id,
+        data=data,
+    )
+
+    return FilePatchResponse.model_validate(patched)
@@ -5,8 +5,11 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies.auth import AccessLevel, require_access
+from app.dependencies.rate_limit import require_rate_limit
 from app.dependencies.session import get_session
+from app.middleware.upload_admission import UploadAdmissionRoute
 from app.models.user import User
+from app.runtime.rate_limit import RateLimitCost
 from app.schemas.file_rotate import (
     FILE_ROTATE_ERRORS,
     FileRotateRequest,
@@ -14,7 +17,7 @@ from app.schemas.file_rotate import (
 )
 from app.services.file_rotate import rotate_file
 
-router = APIRouter(tags=["Files"])
+router = APIRouter(tags=["Files"], route_class=UploadAdmissionRoute)
 
 
 @router.post(
@@ -29,6 +32,7 @@ async def file_rotate_router(
     data: FileRotateRequest,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(require_access(AccessLevel.EDIT)),
+    rate_limit: None = Depends(require_rate_limit(RateLimitCost.HEAVY)),
 ) -> FileRotateResponse:
     """
     Rotates an image file clockwise by the specified angle. A new file
@@ -64,7 +68,9 @@ async def file_rotate_router(
     - `409` — File is not an image or unsupported format.
     - `422` — Input validation error.
     - `423` — Parent folder is write-protected.
+    - `429` — Too many bytes in flight or rate limit exceeded.
     - `503` — Service temporarily unavailable.
+    - `507` — Insufficient free storage space.
     """
     rotated = await rotate_file(
         session=session,
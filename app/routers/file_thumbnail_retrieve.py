@@ -6,8 +6,10 @@ from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies.auth import AccessLevel, require_access
+from app.dependencies.rate_limit import require_rate_limit
 from app.dependencies.session import get_session
 from app.models.user import User
+from app.runtime.rate_limit import RateLimitCost
 from app.schemas.file_thumbnail_retrieve import FILE_THUMBNAIL_RETRIEVE_ERRORS
 from app.services.file_thumbnail_retrieve import retrieve_file_thumbnail
 
@@ -24,6 +26,7 @@ async def file_thumbnail_retrieve_router(
     file_id: int,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(require_access(AccessLevel.READ)),
+    rate_limit: None = Depends(require_rate_limit(RateLimitCost.LIGHT)),
 ) -> Response:
     """
     Returns the thumbnail image for the specified file.
@@ -52,6 +55,7 @@ async def file_thumbnail_retrieve_router(
     - `403` — User inactive, blocked, or lacks read access.
     - `404` — File, thumbnail record, or thumbnail file was not found.
     - `422` — Input values failed validation.
+    - `429` — Rate limit exceeded; retry later.
     - `503` — Service temporarily unavailable.
     """
     mimetype, data = await retrieve_file_thumbnail(
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies.auth import AccessLevel, require_access
 from app.dependencies.session import get_session
+from app.middleware.upload_admission import UploadAdmissionRoute
 from app.models.user import User
 from app.schemas.file_upload import (
     FILE_UPLOAD_ERRORS,
@@ -15,7 +16,7 @@ from app.schemas.file_upload import (
 )
 from app.services.file_upload import upload_file
 
-router = APIRouter(tags=["Files"])
+router = APIRouter(tags=["Files"], route_class=UploadAdmissionRoute)
 
 
 @router.post(
@@ -64,7 +65,9 @@ async def file_upload_router(
     - `409` — File conflict.
     - `422` — Input values failed validation.
     - `423` — Target folder is write-protected.
+    - `429` — Too many bytes in flight; retry later.
     - `503` — Service temporarily unavailable.
+    - `507` — Insufficient free storage space.
     """
     uploaded = await upload_file(
         session=session,
@@ -7,7 +7,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.dependencies.auth import AccessLevel, require_access
 from app.dependencies.session import get_session
 from app.models.user import User
-from app.schemas.folder_delete import FOLDER_DELETE_ERRORS
+from app.schemas.folder_delete import (
+    FOLDER_DELETE_ERRORS,
+    FolderDeleteRequest,
+)
 from app.services.folder_delete import delete_folder
 
 router = APIRouter(tags=["Folders"])
@@ -21,12 +24,15 @@ router = APIRouter(tags=["Folders"])
 )
 async def folder_delete_router(
     folder_id: int,
+    params: FolderDeleteRequest = Depends(),
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(require_access(AccessLevel.ADMIN)),
 ) -> Response:
     """
     Deletes an existing folder and all direct files inside it.
-    Folders containing subfolders cannot be deleted.
+    Folders containing subfolders cannot be deleted unless `recursive`
+    is set, in which case the whole subtree is deleted at once and
+    disk space is reclaimed in the background.
 
     **Hooks:**
 
@@ -41,6 +47,10 @@ async def folder_delete_router(
 
     - `folder_id` — ID of the target folder.
 
+    **Query parameters:**
+
+    - `FolderDeleteRequest` — `recursive` flag (default false).
+
     **Response:**
 
     Empty response body.
@@ -51,14 +61,17 @@ async def folder_delete_router(
     - `401` — Invalid, expired, or missing token.
     - `403` — User inactive, blocked, or lacks admin access.
     - `404` — Target folder was not found.
-    - `409` — Target folder contains subfolders and cannot be deleted.
+    - `409` — Target folder contains subfolders and `recursive` is not
+      set.
     - `422` — Input values failed validation.
-    - `423` — Target folder or parent folder is write-protected.
+    - `423` — Target folder, parent folder, or a nested folder is
+      write-protected.
     - `503` — Service temporarily unavailable.
     """
     await delete_folder(
         session=session,
         folder_id=folder_id,
+        recursive=params.recursive,
     )
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
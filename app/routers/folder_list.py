@@ -5,8 +5,10 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies.auth import AccessLevel, require_access
+from app.dependencies.rate_limit import require_rate_limit
 from app.dependencies.session import get_session
 from app.models.user import User
+from app.runtime.rate_limit import RateLimitCost
 from app.schemas.folder_list import (
     FOLDER_LIST_ERRORS,
     FolderListRequest,
@@ -29,6 +31,7 @@ async def folder_root_list_router(
     session: AsyncSession = Depends(get_session),
     params: FolderListRequest = Depends(),
     current_user: User = Depends(require_access(AccessLevel.READ)),
+    rate_limit: None = Depends(require_rate_limit(RateLimitCost.MEDIUM)),
 ) -> FolderListResponse:
     """
     Returns folders of the root or of the given parent folder.
@@ -52,6 +55,7 @@ async def folder_root_list_router(
     - `403` — User inactive, blocked, or lacks read access.
     - `404` — Parent folder not found (when set).
     - `422` — Input values failed validation.
+    - `429` — Rate limit exceeded; retry later.
     - `503` — Service temporarily unavailable.
     """
     folders, folders_count, is_write_protected_recursive = await list_folders(
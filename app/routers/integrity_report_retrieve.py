@@ -0,0 +1,57 @@
+# app/routers/integrity_report_retrieve.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.auth import AccessLevel, require_access
+from app.dependencies.session import get_session
+from app.models.user import User
+from app.schemas.integrity_report_retrieve import (
+    INTEGRITY_REPORT_RETRIEVE_ERRORS,
+    IntegrityReportResponse,
+)
+from app.services.integrity_report_retrieve import retrieve_integrity_report
+
+router = APIRouter(tags=["Services"])
+
+
+@router.get(
+    "/integrity/report",
+    response_model=IntegrityReportResponse,
+    responses=INTEGRITY_REPORT_RETRIEVE_ERRORS,
+    status_code=status.HTTP_200_OK,
+    summary="Retrieve integrity scan report",
+)
+async def integrity_report_retrieve_router(
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(require_access(AccessLevel.ADMIN)),
+) -> IntegrityReportResponse:
+    """
+    Returns the progress and findings of the background integrity scan,
+    which checks files, revisions, thumbnails and folder directories
+    against the database: missing or orphan files, size and checksum
+    mismatches, and broken revision or thumbnail linkage.
+
+    **Hooks:**
+
+    `INTEGRITY_REPORT_RETRIEVE_COMPLETED` — executed after the report
+    is read.
+
+    **Authentication:**
+
+    - Requires a valid token with admin access.
+
+    **Response:**
+
+    `IntegrityReportResponse` — the pass in progress with its findings
+    so far, and the last completed pass.
+
+    **Response codes:**
+
+    - `200` — Report was returned successfully.
+    - `401` — Invalid, expired, or missing token.
+    - `403` — User not admin, inactive, or blocked.
+    - `503` — Service temporarily unavailable.
+    """
+    return await retrieve_integrity_report(session)
@@ -0,0 +1,47 @@
+# app/routers/metrics_export.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from fastapi import APIRouter, Depends, Response, status
+
+from app.dependencies.auth import AccessLevel, require_access
+from app.models.user import User
+from app.schemas.metrics_export import METRICS_EXPORT_ERRORS
+from app.services.metrics_export import export_metrics
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter(tags=["Services"])
+
+
+@router.get(
+    "/metrics/export",
+    response_class=Response,
+    responses=METRICS_EXPORT_ERRORS,
+    status_code=status.HTTP_200_OK,
+    summary="Export metrics in Prometheus format",
+)
+async def metrics_export_router(
+    current_user: User = Depends(require_access(AccessLevel.ADMIN)),
+) -> Response:
+    """
+    Returns request counters and latency histograms per route, lock
+    wait times, cache hits, misses and sizes, hook failures and
+    background job runs in the Prometheus text format, for scraping
+    with a bearer token. Values are kept in process memory since the
+    application started.
+
+    **Authentication:**
+
+    - Requires a valid token with admin access.
+
+    **Response codes:**
+
+    - `200` — Metrics were returned successfully.
+    - `401` — Invalid, expired, or missing token.
+    - `403` — User not admin, inactive, or blocked.
+    - `503` — Service temporarily unavailable.
+    """
+    return Response(
+        content=export_metrics(),
+        media_type=PROMETHEUS_CONTENT_TYPE,
+    )
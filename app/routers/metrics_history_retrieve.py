@@ -0,0 +1,52 @@
+# app/routers/metrics_history_retrieve.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
+
+from app.dependencies.auth import AccessLevel, require_access
+from app.models.user import User
+from app.schemas.metrics_history_retrieve import (
+    METRICS_HISTORY_RETRIEVE_ERRORS,
+    MetricsHistoryRequest,
+)
+from app.services.metrics_history_retrieve import retrieve_metrics_history
+
+router = APIRouter(tags=["Services"])
+
+
+@router.get(
+    "/metrics/history",
+    responses=METRICS_HISTORY_RETRIEVE_ERRORS,
+    status_code=status.HTTP_200_OK,
+    summary="Getting metrics history",
+)
+async def retrieve_metrics_history_router(
+    params: MetricsHistoryRequest = Depends(),
+    current_user: User = Depends(require_access(AccessLevel.ADMIN)),
+) -> JSONResponse:
+    """
+    Returns the metrics sampled in the background over the last
+    minutes. Every numeric metric of `/metrics` is a list of values
+    aligned with the list of sample timestamps (Unix seconds); a
+    missing value is null. Served from memory without querying the
+    database.
+
+    **Authentication:**
+
+    - Requires a valid token with admin access.
+
+    **Request query:**
+
+    `MetricsHistoryRequest` — `minutes` of history to return.
+
+    **Response codes:**
+
+    - `200` — Metrics history was returned successfully.
+    - `401` — Invalid, expired, or missing token.
+    - `403` — User not admin, inactive, or blocked.
+    - `422` — Input values failed validation.
+    - `503` — Service temporarily unavailable.
+    """
+    history = retrieve_metrics_history(params)
+    return JSONResponse(content=history)
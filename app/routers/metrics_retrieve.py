@@ -28,7 +28,8 @@ async def retrieve_metrics_router(
     Returns application metrics and runtime statistics.
     The response includes application version, platform details,
     Python runtime information, disk usage, memory usage, and CPU
-    statistics.
+    statistics. With background sampling enabled, the latest sample is
+    returned without querying the database.
 
     **Authentication:**
 
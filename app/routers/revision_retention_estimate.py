@@ -0,0 +1,59 @@
+# app/routers/revision_retention_estimate.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.auth import AccessLevel, require_access
+from app.dependencies.session import get_session
+from app.models.user import User
+from app.schemas.revision_retention_estimate import (
+    REVISION_RETENTION_ESTIMATE_ERRORS,
+    RevisionRetentionEstimateResponse,
+)
+from app.services.revision_retention_estimate import (
+    estimate_revision_retention,
+)
+
+router = APIRouter(tags=["Services"])
+
+
+@router.get(
+    "/revisions/retention/estimate",
+    response_model=RevisionRetentionEstimateResponse,
+    responses=REVISION_RETENTION_ESTIMATE_ERRORS,
+    status_code=status.HTTP_200_OK,
+    summary="Estimate revision retention",
+)
+async def revision_retention_estimate_router(
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(require_access(AccessLevel.ADMIN)),
+) -> RevisionRetentionEstimateResponse:
+    """
+    Dry run of the revision retention policies. Applies the configured
+    policy and per-folder overrides to all revisions and returns how
+    many revisions and bytes the background compactor would remove.
+    Only revision metadata is read; nothing is deleted.
+
+    **Hooks:**
+
+    `REVISION_RETENTION_ESTIMATE_COMPLETED` — executed after the
+    estimate is computed.
+
+    **Authentication:**
+
+    - Requires a valid token with admin access.
+
+    **Response:**
+
+    `RevisionRetentionEstimateResponse` — stored revisions and the part
+    to be reclaimed.
+
+    **Response codes:**
+
+    - `200` — Estimate was returned successfully.
+    - `401` — Invalid, expired, or missing token.
+    - `403` — User not admin, inactive, or blocked.
+    - `503` — Service temporarily unavailable.
+    """
+    return await estimate_revision_retention(session)
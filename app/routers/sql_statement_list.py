@@ -0,0 +1,53 @@
+# app/routers/sql_statement_list.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
+
+from app.dependencies.auth import AccessLevel, require_access
+from app.models.user import User
+from app.schemas.sql_statement_list import (
+    SQL_STATEMENT_LIST_ERRORS,
+    SqlStatementListRequest,
+)
+from app.services.sql_statement_list import list_slow_sql_statements
+
+router = APIRouter(tags=["Services"])
+
+
+@router.get(
+    "/sql/statements",
+    responses=SQL_STATEMENT_LIST_ERRORS,
+    status_code=status.HTTP_200_OK,
+    summary="List slow SQL statements",
+)
+async def sql_statement_list_router(
+    params: SqlStatementListRequest = Depends(),
+    current_user: User = Depends(require_access(AccessLevel.ADMIN)),
+) -> JSONResponse:
+    """
+    Returns the SQL statements that ran longer than the configured
+    threshold since the process started, grouped by normalized text
+    (literals replaced with `?`). Each statement has its execution
+    count, total, mean and max time in seconds, the Unix time it was
+    last seen and its EXPLAIN QUERY PLAN as lines, or null when no
+    plan could be captured. Parameter values are never returned.
+
+    **Authentication:**
+
+    - Requires a valid token with admin access.
+
+    **Request query:**
+
+    `SqlStatementListRequest` — `limit` and `order_by`.
+
+    **Response codes:**
+
+    - `200` — Slow statements were returned successfully.
+    - `401` — Invalid, expired, or missing token.
+    - `403` — User not admin, inactive, or blocked.
+    - `422` — Input values failed validation.
+    - `503` — Service temporarily unavailable.
+    """
+    statements = list_slow_sql_statements(params)
+    return JSONResponse(content=statements)
@@ -0,0 +1,69 @@
+# app/routers/upload_session_commit.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.auth import AccessLevel, require_access
+from app.dependencies.session import get_session
+from app.models.user import User
+from app.schemas.upload_session_commit import (
+    UPLOAD_SESSION_COMMIT_ERRORS,
+    UploadSessionCommitResponse,
+)
+from app.services.upload_session_commit import commit_upload_session
+
+router = APIRouter(tags=["Files"])
+
+
+@router.post(
+    "/upload/{upload_id}/commit",
+    response_model=UploadSessionCommitResponse,
+    responses=UPLOAD_SESSION_COMMIT_ERRORS,
+    status_code=status.HTTP_201_CREATED,
+    summary="Commit upload session",
+)
+async def upload_session_commit_router(
+    upload_id: str,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(require_access(AccessLevel.WRITE)),
+) -> UploadSessionCommitResponse:
+    """
+    Stores the content of a complete upload session as a file in the
+    target folder and closes the session. An existing file with the
+    same name gets a new revision, as with a regular upload.
+
+    **Hooks:**
+
+    `FILE_UPLOAD_COMPLETED` — executed after the file is successfully
+    stored.
+
+    **Authentication:**
+
+    - Requires a valid token with write access or higher.
+
+    **Request path:**
+
+    - `upload_id` — ID of the upload session.
+
+    **Response:**
+
+    `UploadSessionCommitResponse` — uploaded file ID.
+
+    **Response codes:**
+
+    - `201` — File uploaded successfully.
+    - `401` — Invalid, expired, or missing token.
+    - `403` — User inactive, blocked, or lacks writer access.
+    - `404` — Upload session or target folder not found.
+    - `409` — Upload incomplete or file conflict.
+    - `422` — Input values failed validation.
+    - `423` — Target folder is write-protected.
+    - `503` — Service temporarily unavailable.
+    """
+    uploaded = await commit_upload_session(
+        session=session,
+        user=current_user,
+        upload_id=upload_id,
+    )
+    return UploadSessionCommitResponse.model_validate(uploaded)
@@ -0,0 +1,75 @@
+# app/routers/upload_session_create.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.auth import AccessLevel, require_access
+from app.dependencies.session import get_session
+from app.models.user import User
+from app.schemas.upload_session_create import (
+    UPLOAD_SESSION_CREATE_ERRORS,
+    UploadSessionCreateRequest,
+    UploadSessionCreateResponse,
+)
+from app.services.upload_session_create import create_upload_session
+
+router = APIRouter(tags=["Files"])
+
+
+@router.post(
+    "/folder/{folder_id}/upload",
+    response_model=UploadSessionCreateResponse,
+    responses=UPLOAD_SESSION_CREATE_ERRORS,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create upload session",
+)
+async def upload_session_create_router(
+    folder_id: int,
+    data: UploadSessionCreateRequest,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(require_access(AccessLevel.WRITE)),
+) -> UploadSessionCreateResponse:
+    """
+    Opens a resumable upload session for a file of known size. Chunks
+    are then written at their offsets, in any order and in parallel,
+    and the session is committed once all bytes are received.
+
+    **Hooks:**
+
+    `UPLOAD_SESSION_CREATE_COMPLETED` — executed after the session is
+    created.
+
+    **Authentication:**
+
+    - Requires a valid token with write access or higher.
+
+    **Request path:**
+
+    - `folder_id` — ID of the target folder.
+
+    **Request body:**
+
+    - `UploadSessionCreateRequest` — filename and total file size.
+
+    **Response:**
+
+    `UploadSessionCreateResponse` — upload session ID and expiry time.
+
+    **Response codes:**
+
+    - `201` — Upload session created successfully.
+    - `401` — Invalid, expired, or missing token.
+    - `403` — User inactive, blocked, or lacks writer access.
+    - `404` — Target folder was not found.
+    - `422` — Input values failed validation.
+    - `423` — Target folder is write-protected.
+    - `503` — Service temporarily unavailable.
+    """
+    upload_session = await create_upload_session(
+        session=session,
+        user=current_user,
+        folder_id=folder_id,
+        data=data,
+    )
+    return UploadSessionCreateResponse.model_validate(upload_session)
@@ -0,0 +1,62 @@
+# app/routers/upload_session_select.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.auth import AccessLevel, require_access
+from app.dependencies.session import get_session
+from app.models.user import User
+from app.schemas.upload_session_select import (
+    UPLOAD_SESSION_SELECT_ERRORS,
+    UploadSessionSelectResponse,
+)
+from app.services.upload_session_select import select_upload_session
+
+router = APIRouter(tags=["Files"])
+
+
+@router.get(
+    "/upload/{upload_id}",
+    response_model=UploadSessionSelectResponse,
+    responses=UPLOAD_SESSION_SELECT_ERRORS,
+    status_code=status.HTTP_200_OK,
+    summary="Select upload session",
+)
+async def upload_session_select_router(
+    upload_id: str,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(require_access(AccessLevel.WRITE)),
+) -> UploadSessionSelectResponse:
+    """
+    Returns an upload session of the current user with the byte ranges
+    received so far, so that an interrupted upload can resume with
+    the missing ranges.
+
+    **Authentication:**
+
+    - Requires a valid token with write access or higher.
+
+    **Request path:**
+
+    - `upload_id` — ID of the upload session.
+
+    **Response:**
+
+    `UploadSessionSelectResponse` — session metadata and received
+    ranges.
+
+    **Response codes:**
+
+    - `200` — Upload session retrieved successfully.
+    - `401` — Invalid, expired, or missing token.
+    - `403` — User inactive, blocked, or lacks writer access.
+    - `404` — Upload session not found or expired.
+    - `503` — Service temporarily unavailable.
+    """
+    upload_session = await select_upload_session(
+        session=session,
+        user=current_user,
+        upload_id=upload_id,
+    )
+    return UploadSessionSelectResponse.model_validate(upload_session)
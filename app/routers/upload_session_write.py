@@ -0,0 +1,79 @@
+# app/routers/upload_session_write.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from fastapi import APIRouter, Depends, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.auth import AccessLevel, require_access
+from app.dependencies.session import get_session
+from app.middleware.upload_admission import UploadAdmissionRoute
+from app.models.user import User
+from app.schemas.upload_session_write import (
+    UPLOAD_SESSION_WRITE_ERRORS,
+    UploadSessionWriteRequest,
+    UploadSessionWriteResponse,
+)
+from app.services.upload_session_write import write_upload_session
+
+router = APIRouter(tags=["Files"], route_class=UploadAdmissionRoute)
+
+
+@router.put(
+    "/upload/{upload_id}",
+    response_model=UploadSessionWriteResponse,
+    responses=UPLOAD_SESSION_WRITE_ERRORS,
+    status_code=status.HTTP_200_OK,
+    summary="Write upload session chunk",
+)
+async def upload_session_write_router(
+    upload_id: str,
+    request: Request,
+    params: UploadSessionWriteRequest = Depends(),
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(require_access(AccessLevel.WRITE)),
+) -> UploadSessionWriteResponse:
+    """
+    Writes a chunk of an upload session at the given offset. The chunk
+    is the raw request body and is streamed to storage. Chunks may be
+    sent in any order and in parallel; a rewritten range is simply
+    overwritten. Every chunk extends the session expiry.
+
+    **Authentication:**
+
+    - Requires a valid token with write access or higher.
+
+    **Request path:**
+
+    - `upload_id` — ID of the upload session.
+
+    **Request query:**
+
+    - `offset` — byte offset of the chunk within the file.
+
+    **Request body:**
+
+    - `application/octet-stream` chunk content.
+
+    **Response:**
+
+    `UploadSessionWriteResponse` — received ranges and expiry time.
+
+    **Response codes:**
+
+    - `200` — Chunk written successfully.
+    - `401` — Invalid, expired, or missing token.
+    - `403` — User inactive, blocked, or lacks writer access.
+    - `404` — Upload session not found or expired.
+    - `422` — Chunk does not fit into the declared file size.
+    - `429` — Too many bytes in flight; retry later.
+    - `503` — Service temporarily unavailable.
+    - `507` — Insufficient free storage space.
+    """
+    upload_session = await write_upload_session(
+        session=session,
+        user=current_user,
+        upload_id=upload_id,
+        offset=params.offset,
+        data=request.stream(),
+    )
+    return UploadSessionWriteResponse.model_validate(upload_session)
@@ -0,0 +1,164 @@
+# app/runtime/admission.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+from app.config import get_config
+from app.constants import (
+    UPLOAD_ADMISSION_BUSY_RETRY_AFTER_SECONDS,
+    UPLOAD_ADMISSION_STATVFS_TTL_SECONDS,
+    UPLOAD_ADMISSION_STORAGE_RETRY_AFTER_SECONDS,
+)
+from app.errors import InsufficientStorageError, TooManyRequestsError
+from app.events import Events as E
+
+log = logging.getLogger(__name__)
+
+# NOTE (ADR-80): Upload admission rejects instead of queueing.
+# Requests that write file content reserve their declared body size
+# against budgets of in-flight bytes, globally and per user, before the
+# body is read. A request over budget, or one that would bring free
+# space on the mount below the floor, is rejected at once with 429 or
+# 507 and Retry-After. Admitted requests therefore keep their latency
+# under bursts instead of all of them slowing down together.
+
+
+class UploadAdmission:
+    """
+    Budgets of bytes in flight in admitted requests, globally and per
+    user, and a floor of free space on the storage mount. Free space is
+    read with statvfs at most once per statvfs_ttl seconds and reduced
+    by the bytes in flight. A single request larger than a budget is
+    admitted when nothing else is in flight for that budget, so large
+    files are serialized rather than refused. Non-positive budgets and
+    floors are treated as unlimited.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        max_bytes_per_user: int,
+        min_free_bytes: int,
+        path: str,
+        statvfs_ttl: float = UPLOAD_ADMISSION_STATVFS_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_bytes = max_bytes
+        self._max_bytes_per_user = max_bytes_per_user
+        self._min_free_bytes = min_free_bytes
+        self._path = path
+        self._statvfs_ttl = statvfs_ttl
+        self._clock = clock
+        self._free_bytes = 0
+        self._checked_at: float | None = None
+        self._user_bytes: dict[str | None, int] = {}
+        self.bytes_in_flight = 0
+
+    @asynccontextmanager
+    async def reserve(
+        self,
+        user_id: str | None,
+        nbytes: int | None,
+    ) -> AsyncIterator[None]:
+        """
+        Hold nbytes of the budgets for the enclosed block. A request of
+        unknown size reserves the whole per-user budget, or the global
+        one if users are unlimited. Raises TooManyRequestsError when a
+        budget is exhausted and InsufficientStorageError when free
+        space would fall below the floor.
+        """
+        if nbytes is None:
+            nbytes = max(self._max_bytes_per_user, self._max_bytes, 0)
+            if self._max_bytes_per_user > 0:
+                nbytes = self._max_bytes_per_user
+
+        free_bytes = await self._get_free_bytes()
+
+        # No await between the checks and the reservation, so
+        # concurrent requests cannot both take the last budget.
+        user_bytes = self._user_bytes.get(user_id, 0)
+
+        if not (
+            _fits(self.bytes_in_flight, nbytes, self._max_bytes)
+            and _fits(user_bytes, nbytes, self._max_bytes_per_user)
+        ):
+            log.warning(
+                "event=%s bytes_in_flight=%s user_bytes=%s nbytes=%s",
+                E.UPLOAD_ADMISSION_BUSY,
+                self.bytes_in_flight, user_bytes, nbytes,
+            )
+            raise TooManyRequestsError(
+                retry_after=UPLOAD_ADMISSION_BUSY_RETRY_AFTER_SECONDS,
+            )
+
+        if (
+            free_bytes is not None
+            and free_bytes - self.bytes_in_flight - nbytes
+            < self._min_free_bytes
+        ):
+            log.warning(
+                "event=%s free_bytes=%s bytes_in_flight=%s nbytes=%s",
+                E.UPLOAD_ADMISSION_STORAGE_LOW,
+                free_bytes, self.bytes_in_flight, nbytes,
+            )
+            raise InsufficientStorageError(
+                retry_after=UPLOAD_ADMISSION_STORAGE_RETRY_AFTER_SECONDS,
+            )
+
+        self.bytes_in_flight += nbytes
+        self._user_bytes[user_id] = user_bytes + nbytes
+
+        try:
+            yield
+
+        finally:
+            self.bytes_in_flight -= nbytes
+            remaining = self._user_bytes[user_id] - nbytes
+            if remaining:
+                self._user_bytes[user_id] = remaining
+            else:
+                del self._user_bytes[user_id]
+
+    async def _get_free_bytes(self) -> int | None:
+        """
+        Return the cached free space of the mount, or None if no floor
+        is configured.
+        """
+        if self._min_free_bytes <= 0:
+            return None
+
+        now = self._clock()
+        if (
+            self._checked_at is None
+            or now - self._checked_at >= self._statvfs_ttl
+        ):
+            stat = await asyncio.to_thread(os.statvfs, self._path)
+            self._free_bytes = stat.f_bavail * stat.f_frsize
+            self._checked_at = now
+
+        return self._free_bytes
+
+
+def _fits(in_flight: int, nbytes: int, budget: int) -> bool:
+    return budget <= 0 or in_flight == 0 or in_flight + nbytes <= budget
+
+
+@lru_cache(maxsize=1)
+def get_upload_admission() -> UploadAdmission:
+    """
+    Return the process-wide upload admission singleton. Initialised on
+    first call so that get_config() is not invoked at import time.
+    """
+    config = get_config()
+    return UploadAdmission(
+        max_bytes=config.UPLOADS_MAX_BYTES_IN_FLIGHT,
+        max_bytes_per_user=config.UPLOADS_MAX_BYTES_IN_FLIGHT_PER_USER,
+        min_free_bytes=config.UPLOADS_MIN_FREE_BYTES,
+        path=config.GOCRYPTFS_MOUNTPOINT,
+    )
@@ -0,0 +1,93 @@
+# app/runtime/crypto.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import asyncio
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from app.config import get_config
+from app.security import encryption, hashing
+
+T = TypeVar("T")
+
+# NOTE (ADR-82): Key derivation runs in a separate process pool.
+# PBKDF2 password hashes and the scrypt key of the master password take
+# hundreds of milliseconds of CPU, and scrypt holds the GIL while it
+# runs, so neither the event loop nor its default thread pool can host
+# them without stalling other requests. Requests that derive keys await
+# a small pool of worker processes instead; at most max_workers keys are
+# derived at a time and further calls queue for a free worker.
+
+
+class CryptoExecutor:
+    """
+    Runs CPU-bound key derivation in a pool of max_workers processes.
+    The pool is started on first use from a fork server, so workers do
+    not inherit the threads and open files of the application process.
+    A non-positive max_workers runs calls in the default thread pool.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._pool: ProcessPoolExecutor | None = None
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a picklable module-level function with the given arguments
+        and return its result or raise its exception.
+        """
+        if self.max_workers <= 0:
+            return await asyncio.to_thread(func, *args)
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, func, *args)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, dropping calls not yet started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+@lru_cache(maxsize=1)
+def get_crypto_executor() -> CryptoExecutor:
+    """
+    Return the process-wide crypto executor singleton. Initialised on
+    first call so that get_config() is not invoked at import time.
+    """
+    return CryptoExecutor(max_workers=get_config().CRYPTO_MAX_WORKERS)
+
+
+async def hash_string(value: str) -> str:
+    """Async counterpart of hashing.hash_string."""
+    return await get_crypto_executor().run(hashing.hash_string, value)
+
+
+async def is_password_correct(password: str, password_hash: str) -> bool:
+    """Async counterpart of hashing.is_password_correct."""
+    return await get_crypto_executor().run(
+        hashing.is_password_correct, password, password_hash,
+    )
+
+
+async def encrypt_passphrase(plaintext: bytes, password: bytes) -> bytes:
+    """Async counterpart of encryption.encrypt_passphrase."""
+    return await get_crypto_executor().run(
+        encryption.encrypt_passphrase, plaintext, password,
+    )
+
+
+async def decrypt_passphrase(ciphertext: bytes, password: bytes) -> bytes:
+    """Async counterpart of encryption.decrypt_passphrase."""
+    return await get_crypto_executor().run(
+        encryption.decrypt_passphrase, ciphertext, password,
+    )
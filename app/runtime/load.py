@@ -0,0 +1,27 @@
+# app/runtime/load.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class RequestLoad:
+    """
+    Counts HTTP requests currently being processed by the application
+    process. Background jobs read the counter to yield to user traffic.
+    """
+
+    def __init__(self):
+        self.active = 0
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Count the enclosed block as one active request."""
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+
+
+request_load = RequestLoad()
@@ -0,0 +1,301 @@
+# app/runtime/metrics.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Generic, TypeVar
+
+# NOTE (ADR-88): Metrics are kept in an in-process registry.
+# Counters, gauges and fixed-bucket histograms are plain numbers updated
+# on the event loop, so an observation is a dict lookup and an addition
+# and needs no lock (the application runs as a single process). Label
+# values must come from small fixed sets (route templates, not URLs) to
+# keep the number of series bounded. The registry is exported in the
+# Prometheus text format; values are lost on restart, which scrapers
+# treat as a counter reset.
+
+HTTP_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+LOCK_WAIT_BUCKETS = (
+    0.0001, 0.001, 0.01, 0.1, 1.0, 10.0, 60.0,
+)
+
+
+class _ScalarValue:
+    """Series holding a single number."""
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+
+class _CounterValue(_ScalarValue):
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class _GaugeValue(_ScalarValue):
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class _HistogramValue:
+    def __init__(self, upper_bounds: tuple[float, ...]) -> None:
+        self.upper_bounds = upper_bounds
+        self.bucket_counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect_left(self.upper_bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+SeriesT = TypeVar("SeriesT")
+ScalarT = TypeVar("ScalarT", bound=_ScalarValue)
+
+
+class _Metric(ABC, Generic[SeriesT]):
+    """
+    Metric family with a fixed list of label names. Each combination
+    of label values is a separate series, created on first use.
+    """
+
+    type_name = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._series: dict[tuple[str, ...], SeriesT] = {}
+        if not self.label_names:
+            self.labels()
+
+    def labels(self, *values: object) -> SeriesT:
+        """
+        Return the series for the label values, in label name order.
+        Callers on hot paths should keep the returned series.
+        """
+        key = tuple(str(value) for value in values)
+        series = self._series.get(key)
+        if series is None:
+            if len(key) != len(self.label_names):
+                raise ValueError(f"{self.name} expects {self.label_names}")
+            series = self._series[key] = self._new_series()
+        return series
+
+    @abstractmethod
+    def _new_series(self) -> SeriesT:
+        """Return a new series with its initial value."""
+
+    @abstractmethod
+    def _render_series(
+        self,
+        labels: list[tuple[str, str]],
+        series: SeriesT,
+    ) -> list[str]:
+        """Return the exposition lines of one series."""
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {_escape_help(self.documentation)}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for key, series in sorted(self._series.items()):
+            labels = list(zip(self.label_names, key))
+            lines.extend(self._render_series(labels, series))
+        return lines
+
+
+class _ScalarMetric(_Metric[ScalarT]):
+    """Metric family whose series are single numbers."""
+
+    def _render_series(
+        self,
+        labels: list[tuple[str, str]],
+        series: ScalarT,
+    ) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(labels)} "
+            f"{_format_value(series.value)}"
+        ]
+
+
+class Counter(_ScalarMetric[_CounterValue]):
+    """Monotonically increasing value, such as a number of requests."""
+
+    type_name = "counter"
+
+    def _new_series(self) -> _CounterValue:
+        return _CounterValue()
+
+
+class Gauge(_ScalarMetric[_GaugeValue]):
+    """Value that can go up and down, such as bytes held in a cache."""
+
+    type_name = "gauge"
+
+    def _new_series(self) -> _GaugeValue:
+        return _GaugeValue()
+
+
+class Histogram(_Metric[_HistogramValue]):
+    """
+    Distribution of observed values over fixed upper bounds, such as
+    request latencies. Buckets are cumulative only when rendered.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = HTTP_LATENCY_BUCKETS,
+    ) -> None:
+        self.upper_bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, label_names)
+
+    def _new_series(self) -> _HistogramValue:
+        return _HistogramValue(self.upper_bounds)
+
+    def _render_series(
+        self,
+        labels: list[tuple[str, str]],
+        series: _HistogramValue,
+    ) -> list[str]:
+        lines = []
+        cumulative = 0
+        bounds = [*series.upper_bounds, math.inf]
+        for bound, count in zip(bounds, series.bucket_counts):
+            cumulative += count
+            bucket_labels = [*labels, ("le", _format_value(bound))]
+            lines.append(
+                f"{self.name}_bucket{_format_labels(bucket_labels)} "
+                f"{cumulative}"
+            )
+        lines.append(
+            f"{self.name}_sum{_format_labels(labels)} "
+            f"{_format_value(series.sum)}"
+        )
+        lines.append(
+            f"{self.name}_count{_format_labels(labels)} {series.count}"
+        )
+        return lines
+
+
+MetricT = TypeVar("MetricT", bound=_Metric)
+
+
+class MetricsRegistry:
+    """
+    Process-wide set of metric families, rendered together in the
+    Prometheus text exposition format.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: MetricT) -> MetricT:
+        if metric.name in self._metrics:
+            raise ValueError(f"metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels: list[tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in labels
+    )
+    return "{" + pairs + "}"
+
+
+def _escape_label_value(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    )
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUESTS = registry.register(Counter(
+    "hidden_http_requests_total",
+    "HTTP requests completed, by method, route template and status.",
+    ("method", "route", "status"),
+))
+HTTP_REQUEST_DURATION = registry.register(Histogram(
+    "hidden_http_request_duration_seconds",
+    "Time until the whole HTTP response was sent.",
+    ("method", "route"),
+))
+HTTP_REQUESTS_IN_PROGRESS = registry.register(Gauge(
+    "hidden_http_requests_in_progress",
+    "HTTP requests currently being processed.",
+))
+LOCK_WAIT_DURATION = registry.register(Histogram(
+    "hidden_lock_wait_seconds",
+    "Time spent waiting for directory and file locks.",
+    ("lock_type",),
+    buckets=LOCK_WAIT_BUCKETS,
+))
+CACHE_REQUESTS = registry.register(Counter(
+    "hidden_cache_requests_total",
+    "In-memory cache lookups, by cache and result (hit or miss).",
+    ("cache", "result"),
+))
+CACHE_EVICTIONS = registry.register(Counter(
+    "hidden_cache_evictions_total",
+    "Entries evicted from in-memory caches to make room.",
+    ("cache",),
+))
+CACHE_ENTRIES = registry.register(Gauge(
+    "hidden_cache_entries",
+    "Entries held by in-memory caches.",
+    ("cache",),
+))
+CACHE_BYTES = registry.register(Gauge(
+    "hidden_cache_bytes",
+    "Bytes held by in-memory caches.",
+    ("cache",),
+))
+HOOK_FAILURES = registry.register(Counter(
+    "hidden_hook_failures_total",
+    "Hook executions that raised an exception, by event.",
+    ("event",),
+))
+SCHEDULER_JOB_RUNS = registry.register(Counter(
+    "hidden_scheduler_job_runs_total",
+    "Background job runs, by job and result (completed or failed).",
+    ("job", "result"),
+))
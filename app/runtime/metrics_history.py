@@ -0,0 +1,107 @@
+# app/runtime/metrics_history.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import math
+from array import array
+from functools import lru_cache
+
+from app.config import get_config
+
+# NOTE (ADR-89): Metrics snapshots are sampled in the background.
+# Collecting the metrics takes several SQLite round-trips, a stat of
+# the database file and psutil calls, so a scheduler job collects them
+# on an interval and the metrics endpoint returns the latest sample.
+# Numeric values are kept in fixed-size ring buffers of doubles, one
+# per series, so the history has a fixed memory cost and serving it
+# never touches the database.
+
+
+class MetricsHistory:
+    """
+    Ring buffers of metrics samples with one shared timestamp buffer.
+    Holds the last capacity samples; numeric values (not booleans) form
+    the series, missing or non-numeric values are stored as NaN and
+    returned as None. The latest sample is also kept as a whole.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(capacity, 0)
+        self._timestamps = array("d", [0.0]) * self.capacity
+        self._series: dict[str, array] = {}
+        self._next = 0
+        self._size = 0
+        self._latest: tuple[float, dict] | None = None
+
+    def append(self, timestamp: float, sample: dict) -> None:
+        """
+        Store a sample taken at timestamp (Unix seconds), overwriting
+        the oldest one when the buffers are full.
+        """
+        self._latest = (timestamp, dict(sample))
+        if self.capacity == 0:
+            return
+
+        index = self._next
+        self._timestamps[index] = timestamp
+
+        for name, value in sample.items():
+            if _is_number(value) and name not in self._series:
+                self._series[name] = array("d", [math.nan]) * self.capacity
+
+        for name, series in self._series.items():
+            value = sample.get(name)
+            series[index] = value if _is_number(value) else math.nan
+
+        self._next = (index + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def latest(self) -> tuple[float, dict] | None:
+        """
+        Return (timestamp, sample) of the latest sample, or None.
+        """
+        return self._latest
+
+    def since(self, start_time: float) -> dict:
+        """
+        Return timestamps and series values of the samples taken at or
+        after start_time, oldest first.
+        """
+        first = (self._next - self._size) % max(self.capacity, 1)
+        indexes = [
+            index for index in (
+                (first + offset) % self.capacity
+                for offset in range(self._size)
+            )
+            if self._timestamps[index] >= start_time
+        ]
+
+        return {
+            "timestamps": [self._timestamps[index] for index in indexes],
+            "series": {
+                name: [_to_json(series[index]) for index in indexes]
+                for name, series in self._series.items()
+            },
+        }
+
+
+def _is_number(value: object) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _to_json(value: float) -> float | None:
+    return None if math.isnan(value) else value
+
+
+@lru_cache(maxsize=1)
+def get_metrics_history() -> MetricsHistory:
+    """
+    Return the process-wide metrics history sized to hold
+    METRICS_HISTORY_SECONDS of samples taken every
+    METRICS_SAMPLE_INTERVAL_SECONDS. Holds no history while sampling
+    is disabled.
+    """
+    config = get_config()
+    interval = config.METRICS_SAMPLE_INTERVAL_SECONDS
+    if interval <= 0:
+        return MetricsHistory(0)
+    return MetricsHistory(config.METRICS_HISTORY_SECONDS // interval)
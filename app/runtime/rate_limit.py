@@ -0,0 +1,129 @@
+# app/runtime/rate_limit.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import math
+import time
+from collections.abc import Callable
+from enum import StrEnum
+from functools import lru_cache
+
+from app.config import get_config
+from app.constants import RATE_LIMIT_MAX_BUCKETS
+
+# NOTE (ADR-81): Expensive endpoints are rate limited per user by cost.
+# Each user has a token bucket that refills at a fixed rate up to the
+# burst size, and each limited endpoint takes a number of tokens that
+# reflects its cost, so a client looping image operations runs out much
+# sooner than one browsing thumbnails. Buckets are kept in process, as
+# the application runs as a single process.
+
+
+class RateLimitCost(StrEnum):
+    """Cost class of a rate limited endpoint."""
+
+    LIGHT = "light"
+    MEDIUM = "medium"
+    HEAVY = "heavy"
+
+
+class RateLimiter:
+    """
+    Token buckets keyed by user id. A bucket starts full with burst
+    tokens and refills at tokens_per_second; a request takes the tokens
+    of its cost class. A cost larger than the burst is capped to it, so
+    such requests pass only on a full bucket. A non-positive rate or
+    burst disables the limiter.
+    """
+
+    def __init__(
+        self,
+        tokens_per_second: float,
+        burst: float,
+        costs: dict[RateLimitCost, int],
+        max_buckets: int = RATE_LIMIT_MAX_BUCKETS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.tokens_per_second = tokens_per_second
+        self.burst = burst
+        self.costs = costs
+        self._max_buckets = max_buckets
+        self._clock = clock
+        self._buckets: dict[int | None, tuple[float, float]] = {}
+        self.allowed_count = 0
+        self.rejected_count = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.tokens_per_second > 0 and self.burst > 0
+
+    @property
+    def bucket_count(self) -> int:
+        return len(self._buckets)
+
+    def acquire(self, key: int | None, cost: RateLimitCost) -> int | None:
+        """
+        Take the tokens of the cost class from the bucket of the key.
+        Return None if the tokens were taken, otherwise the number of
+        seconds after which the bucket will hold enough tokens.
+        """
+        if not self.enabled:
+            return None
+
+        now = self._clock()
+        cost = min(self.costs[cost], self.burst)
+        tokens = self._get_tokens(key, now)
+
+        if tokens < cost:
+            self._store(key, tokens, now)
+            self.rejected_count += 1
+            return math.ceil((cost - tokens) / self.tokens_per_second)
+
+        self._store(key, tokens - cost, now)
+        self.allowed_count += 1
+        return None
+
+    def _get_tokens(self, key: int | None, now: float) -> float:
+        if key not in self._buckets:
+            return self.burst
+
+        tokens, updated_at = self._buckets[key]
+        return min(
+            self.burst,
+            tokens + (now - updated_at) * self.tokens_per_second,
+        )
+
+    def _store(self, key: int | None, tokens: float, now: float) -> None:
+        # Every new bucket is checked against the bound, whether its
+        # request was allowed or rejected.
+        if key not in self._buckets and (
+            len(self._buckets) >= self._max_buckets
+        ):
+            self._prune(now)
+
+        self._buckets[key] = (tokens, now)
+
+    def _prune(self, now: float) -> None:
+        # A full bucket is the same as a missing one, so it is dropped.
+        for key in [
+            key for key in self._buckets
+            if self._get_tokens(key, now) >= self.burst
+        ]:
+            del self._buckets[key]
+
+
+@lru_cache(maxsize=1)
+def get_rate_limiter() -> RateLimiter:
+    """
+    Return the process-wide rate limiter singleton. Initialised on
+    first call so that get_config() is not invoked at import time.
+    """
+    config = get_config()
+    return RateLimiter(
+        tokens_per_second=config.RATE_LIMIT_TOKENS_PER_SECOND,
+        burst=config.RATE_LIMIT_BURST_TOKENS,
+        costs={
+            RateLimitCost.LIGHT: config.RATE_LIMIT_COST_LIGHT,
+            RateLimitCost.MEDIUM: config.RATE_LIMIT_COST_MEDIUM,
+            RateLimitCost.HEAVY: config.RATE_LIMIT_COST_HEAVY,
+        },
+    )
@@ -0,0 +1,124 @@
+# app/runtime/scheduler.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import Any
+
+from app.config import get_config
+from app.constants import LOCKDOWN_MODE_ENABLED_FLAG_PATH
+from app.events import Events as E
+from app.repositories.file import isfile, ismount
+from app.runtime.metrics import SCHEDULER_JOB_RUNS
+
+log = logging.getLogger(__name__)
+
+Job = Callable[[], Awaitable[None]]
+
+
+# NOTE (ADR-71): Background jobs run inside the application process.
+# Periodic maintenance runs as asyncio tasks in the single Uvicorn
+# worker (ADR-12), so jobs share the in-process lock manager with
+# request handlers. A tick is skipped while the storage is unmounted
+# or lockdown mode is enabled, runs of one job never overlap, and a
+# failing run is logged without stopping the schedule. Jobs open their
+# own sessions and own their transactions like services do.
+
+class Scheduler:
+    """
+    Runs registered periodic jobs and one-off background tasks as
+    asyncio tasks bound to the application lifespan.
+    """
+
+    def __init__(self):
+        self._jobs: list[tuple[str, float, Job]] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    def every(self, name: str, interval_seconds: float, job: Job) -> None:
+        """
+        Register a periodic job started by start(). Non-positive
+        intervals disable the job.
+        """
+        if interval_seconds > 0:
+            self._jobs.append((name, interval_seconds, job))
+
+    def start(self) -> None:
+        """
+        Start a loop task for every registered periodic job.
+        """
+        for name, interval_seconds, job in self._jobs:
+            self._track(asyncio.create_task(
+                self._run_periodic(name, interval_seconds, job),
+                name=name,
+            ))
+
+    def spawn(
+        self,
+        name: str,
+        coro: Coroutine[Any, Any, None],
+    ) -> asyncio.Task:
+        """
+        Run a one-off background task that is cancelled on shutdown.
+        """
+        async def run_once() -> None:
+            await self._run_job(name, lambda: coro)
+
+        task = asyncio.create_task(run_once(), name=name)
+        self._track(task)
+        return task
+
+    async def stop(self) -> None:
+        """
+        Cancel all running tasks, wait for them to finish, and forget
+        registered jobs.
+        """
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._jobs.clear()
+
+    def _track(self, task: asyncio.Task) -> None:
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_periodic(
+        self,
+        name: str,
+        interval_seconds: float,
+        job: Job,
+    ) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            if await is_storage_available():
+                await self._run_job(name, job)
+
+    async def _run_job(self, name: str, job: Job) -> None:
+        log.debug("event=%s job=%s", E.SCHEDULER_JOB_STARTED, name)
+        try:
+            await job()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            log.exception("event=%s job=%s", E.SCHEDULER_JOB_FAILED, name)
+            SCHEDULER_JOB_RUNS.labels(name, "failed").inc()
+            return
+        log.debug("event=%s job=%s", E.SCHEDULER_JOB_COMPLETED, name)
+        SCHEDULER_JOB_RUNS.labels(name, "completed").inc()
+
+
+async def is_storage_available() -> bool:
+    """
+    Return True when the encrypted storage is mounted and lockdown
+    mode is not enabled.
+    """
+    config = get_config()
+    if await isfile(LOCKDOWN_MODE_ENABLED_FLAG_PATH):
+        return False
+    return await ismount(config.GOCRYPTFS_MOUNTPOINT)
+
+
+scheduler = Scheduler()
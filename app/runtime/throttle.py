@@ -0,0 +1,66 @@
+# app/runtime/throttle.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import asyncio
+import time
+
+from app.runtime.load import RequestLoad, request_load
+
+
+class IOThrottle:
+    """
+    Paces background filesystem I/O to a bytes-per-second and an
+    operations-per-second budget, and pauses while the number of
+    active requests exceeds a limit. Non-positive budgets and limits
+    are treated as unlimited.
+    """
+
+    def __init__(
+        self,
+        bytes_per_second: int,
+        iops: int,
+        max_active_requests: int,
+        pause_seconds: float,
+        load: RequestLoad = request_load,
+    ):
+        self._bytes_per_second = bytes_per_second
+        self._iops = iops
+        self._max_active_requests = max_active_requests
+        self._pause_seconds = pause_seconds
+        self._load = load
+        self._bytes_ready_at = 0.0
+        self._ops_ready_at = 0.0
+
+    async def acquire_bytes(self, nbytes: int) -> None:
+        """Wait until nbytes may be read within the byte budget."""
+        await self._wait_for_idle()
+        if self._bytes_per_second > 0:
+            self._bytes_ready_at = await self._pace(
+                self._bytes_ready_at, nbytes / self._bytes_per_second,
+            )
+
+    async def acquire_ops(self, count: int = 1) -> None:
+        """Wait until count operations fit within the IOPS budget."""
+        await self._wait_for_idle()
+        if self._iops > 0:
+            self._ops_ready_at = await self._pace(
+                self._ops_ready_at, count / self._iops,
+            )
+
+    async def _wait_for_idle(self) -> None:
+        if self._max_active_requests <= 0:
+            return
+        while self._load.active > self._max_active_requests:
+            await asyncio.sleep(self._pause_seconds)
+
+    async def _pace(self, ready_at: float, cost: float) -> float:
+        """
+        Sleep until the budget is available and return the time the
+        next acquisition becomes available. Unused budget is not
+        accumulated, so idle periods do not allow bursts.
+        """
+        now = time.monotonic()
+        start = max(ready_at, now)
+        if start > now:
+            await asyncio.sleep(start - now)
+        return start + cost
@@ -2,7 +2,11 @@
 # SPDX-License-Identifier: GPL-3.0-only
 
 import asyncio
+import ctypes
 import logging
+import os
+import struct
+import sys
 from pathlib import Path
 
 from app.config import get_config
@@ -26,8 +30,17 @@ logger = logging.getLogger(__name__)
 # storage failures within request execution is intentionally avoided
 # to keep runtime logic simple and predictable.
 
+# Secrets directory changes that trigger an immediate check.
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVE_SELF = 0x00000800
+_IN_IGNORED = 0x00008000
+_IN_WATCH_MASK = _IN_DELETE | _IN_DELETE_SELF | _IN_MOVED_FROM | _IN_MOVE_SELF
+_IN_EVENT_HEADER = struct.Struct("iIII")
 
-async def run_watchdog() -> None:
+
+async def run_watchdog(app_pid: int | None = None) -> None:
     """
     If the mountpoint is mounted, the watchdog triggers an emergency
     unmount when critical conditions are violated (missing secrets,
@@ -53,7 +66,7 @@ async def run_watchdog() -> None:
         logger.info("passphrase not found, mountpoint unmounted")
         return
 
-    if not _is_application_running():
+    if not _is_application_running(app_pid):
         logger.warning("application not running, unmount started")
         await _lockdown_and_unmount(soft_drain=False)
         logger.info("application not running, mountpoint unmounted")
@@ -78,11 +91,14 @@ async def _lockdown_and_unmount(soft_drain: bool = True) -> None:
     await unmount_gocryptfs(config.GOCRYPTFS_MOUNTPOINT)
 
 
-def _is_application_running() -> bool:
+def _is_application_running(app_pid: int | None = None) -> bool:
     """
-    Return whether a process matching the expected Uvicorn application
-    command line is present in /proc.
+    Return whether the process with the given PID, or any process when
+    no PID is given, runs the expected Uvicorn application command line.
     """
+    if app_pid is not None:
+        return _is_application_cmdline(Path("/proc", str(app_pid)))
+
     proc_path = Path("/proc")
 
     try:
@@ -91,23 +107,145 @@ def _is_application_running() -> bool:
         return False
 
     for entry in entries:
-        if not entry.name.isdigit():
-            continue
+        if entry.name.isdigit() and _is_application_cmdline(entry):
+            return True
+
+    return False
+
+
+def _is_application_cmdline(proc_entry: Path) -> bool:
+    try:
+        cmdline = (proc_entry / "cmdline").read_bytes()
+    except OSError:
+        return False
+
+    return b"uvicorn" in cmdline and b"app.main:app" in cmdline
+
+
+class Watchdog:
+    """
+    Long-running watchdog loop. Checks run every interval seconds and
+    immediately when an entry of the secrets directory is deleted or
+    moved away (inotify) or when the application process exits (pidfd).
+    Without inotify or pidfd support only the interval applies.
+    """
+
+    def __init__(self, app_pid: int | None, interval: float):
+        self._app_pid = app_pid
+        self._interval = interval
+        self._wakeup = asyncio.Event()
+        self._libc: ctypes.CDLL | None = None
+        self._inotify_fd: int | None = None
+        self._inotify_wd: int | None = None
+        self._pidfd: int | None = None
+
+    async def run(self) -> None:
+        """Run checks until cancelled."""
+        loop = asyncio.get_running_loop()
+        self._open_pidfd(loop)
+        self._open_inotify(loop)
 
         try:
-            cmdline = (entry / "cmdline").read_bytes()
-        except OSError:
-            continue
+            while True:
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=self._interval,
+                    )
+                except TimeoutError:
+                    pass
 
-        if not cmdline:
-            continue
+                self._wakeup.clear()
+                self._watch_secrets()
 
-        if b"uvicorn" in cmdline and b"app.main:app" in cmdline:
-            return True
+                try:
+                    await run_watchdog(self._app_pid)
+                except Exception:
+                    logger.exception("watchdog check failed")
 
-    return False
+        finally:
+            self._close(loop)
+
+    def _open_pidfd(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._app_pid is None:
+            return
+
+        try:
+            self._pidfd = os.pidfd_open(self._app_pid)
+        except (AttributeError, OSError):
+            logger.warning("pidfd not available, application polled")
+            return
+
+        loop.add_reader(self._pidfd, self._on_application_exit, loop)
+
+    def _on_application_exit(self, loop: asyncio.AbstractEventLoop) -> None:
+        # An exited process stays readable, so the pidfd is closed after
+        # the first wakeup and later checks read /proc only.
+        loop.remove_reader(self._pidfd)
+        os.close(self._pidfd)
+        self._pidfd = None
+        self._wakeup.set()
+
+    def _open_inotify(self, loop: asyncio.AbstractEventLoop) -> None:
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (AttributeError, OSError):
+            fd = -1
+
+        if fd < 0:
+            logger.warning("inotify not available, secrets polled")
+            return
+
+        self._libc = libc
+        self._inotify_fd = fd
+        loop.add_reader(fd, self._on_secrets_event)
+        self._watch_secrets()
+
+    def _watch_secrets(self) -> None:
+        # The watch is dropped with the directory and added again once
+        # the directory is back.
+        if self._inotify_fd is None or self._inotify_wd is not None:
+            return
+
+        secrets_dir = get_config().INSTALL_SECRETS_DIR
+        wd = self._libc.inotify_add_watch(
+            self._inotify_fd, os.fsencode(secrets_dir), _IN_WATCH_MASK,
+        )
+        if wd >= 0:
+            self._inotify_wd = wd
+
+    def _on_secrets_event(self) -> None:
+        try:
+            data = os.read(self._inotify_fd, 4096)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset + _IN_EVENT_HEADER.size <= len(data):
+            _, mask, _, name_len = _IN_EVENT_HEADER.unpack_from(data, offset)
+            if mask & _IN_IGNORED:
+                self._inotify_wd = None
+            offset += _IN_EVENT_HEADER.size + name_len
+
+        self._wakeup.set()
+
+    def _close(self, loop: asyncio.AbstractEventLoop) -> None:
+        for fd in (self._pidfd, self._inotify_fd):
+            if fd is not None:
+                loop.remove_reader(fd)
+                os.close(fd)
+        self._pidfd = None
+        self._inotify_fd = None
+
+
+async def watch(app_pid: int | None = None) -> None:
+    """Run the watchdog loop with the configured interval."""
+    config = get_config()
+    await Watchdog(app_pid, config.GOCRYPTFS_WATCHDOG_INTERVAL_SECONDS).run()
 
 
 if __name__ == "__main__":
     init_logging()
-    raise SystemExit(asyncio.run(run_watchdog()))
+    raise SystemExit(asyncio.run(watch(
+        int(sys.argv[1]) if len(sys.argv) > 1 else None,
+    )))
@@ -0,0 +1,72 @@
+# app/schemas/audit_export.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.pydantic_error import PydanticErrorResponse
+
+AUDIT_EXPORT_ERRORS = {
+    401: {
+        "description": (
+            "Invalid, expired, or missing authentication token."
+        ),
+    },
+    403: {
+        "description": (
+            "Authenticated user is not an admin, inactive, or blocked."
+        ),
+    },
+    422: {
+        "model": PydanticErrorResponse,
+        "description": (
+            "Input values failed validation (negative timestamps or "
+            "negative after_id)."
+        ),
+    },
+    503: {
+        "description": (
+            "Service is temporarily unavailable (lockdown mode enabled "
+            "or gocryptfs storage not ready)."
+        ),
+    },
+}
+
+
+class AuditExportRequest(BaseModel):
+    """
+    Request schema for exporting audit records in id order with
+    filtering by timestamps and event name. The after_id cursor resumes
+    an interrupted export. Extra fields are forbidden. Leading and
+    trailing whitespace is stripped from string fields.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+        str_strip_whitespace=True,
+    )
+
+    created_at__ge: int | None = Field(
+        default=None,
+        ge=0,
+        description="Lower bound for audit creation timestamp.",
+    )
+
+    created_at__le: int | None = Field(
+        default=None,
+        ge=0,
+        description="Upper bound for audit creation timestamp.",
+    )
+
+    event__ilike: str | None = Field(
+        default=None,
+        description="Case-insensitive substring match for event name.",
+    )
+
+    after_id: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Export only records with a greater ID. Use the ID of the "
+            "last received record to resume an export."
+        ),
+    )
@@ -34,7 +34,9 @@ AUDIT_LIST_ERRORS = {
         "model": PydanticErrorResponse,
         "description": (
             "Input values failed validation (negative timestamps, "
-            "invalid ordering values, or invalid offset / limit)."
+            "invalid ordering values, or invalid offset / limit), or "
+            "archived records cannot be ordered by the requested "
+            "field."
         ),
     },
     503: {
@@ -126,7 +128,7 @@ class AuditListResponse(BaseModel):
     """
     Response schema for audit listing containing matched audit records
     and the total number of audit records satisfying the query
-    conditions.
+    conditions. The total is a lower bound when it is not exact.
     """
 
     model_config = ConfigDict(
@@ -140,3 +142,10 @@ class AuditListResponse(BaseModel):
         ge=0,
         description="Total number of audit records matching the query.",
     )
+    audit_count_exact: bool = Field(
+        default=True,
+        description=(
+            "Whether audit_count is exact. False when archived records "
+            "past the page would have to be read to count them."
+        ),
+    )
@@ -0,0 +1,113 @@
+# app/schemas/file_archive.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from typing import Annotated, Literal, Self
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_validator,
+    model_validator,
+)
+
+from app.constants import FILES_BULK_MAX_ITEMS
+from app.schemas.pydantic_error import PydanticErrorResponse
+
+FILE_ARCHIVE_ERRORS = {
+    401: {
+        "description": (
+            "Invalid, expired, or missing authentication token."
+        ),
+    },
+    403: {
+        "description": (
+            "Authenticated user is inactive, blocked, or lacks "
+            "required permissions."
+        ),
+    },
+    404: {
+        "description": "Folder or one of the files was not found.",
+    },
+    409: {
+        "description": (
+            "Archive would contain more entries than allowed."
+        ),
+    },
+    416: {
+        "description": "Requested range is outside the archive.",
+    },
+    422: {
+        "model": PydanticErrorResponse,
+        "description": (
+            "Input values failed validation (neither or both of folder "
+            "ID and file IDs given, or deflate requested for tar)."
+        ),
+    },
+    429: {
+        "description": (
+            "Request rate limit of the user exceeded; retry after the "
+            "Retry-After interval."
+        ),
+    },
+    503: {
+        "description": (
+            "Service is temporarily unavailable (lockdown mode enabled "
+            "or gocryptfs storage not ready)."
+        ),
+    },
+}
+
+
+class FileArchiveRequest(BaseModel):
+    """
+    Request schema for downloading a folder subtree or a selection of
+    files as one archive. Exactly one of folder_id and file_ids must be
+    given. Duplicate file IDs are collapsed while preserving the order
+    of first occurrence. Extra fields are forbidden.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+
+    folder_id: int | None = Field(
+        default=None,
+        ge=1,
+        description="Identifier of the folder archived with subfolders.",
+    )
+
+    file_ids: list[Annotated[int, Field(ge=1)]] | None = Field(
+        default=None,
+        min_length=1,
+        max_length=FILES_BULK_MAX_ITEMS,
+        description="Identifiers of the archived files.",
+    )
+
+    format: Literal["zip", "tar"] = Field(
+        default="zip",
+        description="Archive format.",
+    )
+
+    compression: Literal["store", "deflate"] = Field(
+        default="store",
+        description=(
+            "Zip compression. With deflate, files of compressible "
+            "types are compressed and the archive cannot be resumed."
+        ),
+    )
+
+    @field_validator("file_ids")
+    @classmethod
+    def deduplicate_file_ids(cls, value: list[int] | None) -> list[int] | None:
+        if value is None:
+            return None
+        return list(dict.fromkeys(value))
+
+    @model_validator(mode="after")
+    def validate_selection(self) -> Self:
+        if (self.folder_id is None) == (self.file_ids is None):
+            raise ValueError("Exactly one of folder_id and file_ids required")
+        if self.format == "tar" and self.compression == "deflate":
+            raise ValueError("Deflate compression requires zip format")
+        return self
@@ -0,0 +1,77 @@
+# app/schemas/file_bulk.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from enum import StrEnum
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.constants import FILES_BULK_MAX_ITEMS
+
+
+class FileBulkStatus(StrEnum):
+    """Per-file outcome of a bulk file operation."""
+
+    OK = "ok"
+    NOT_FOUND = "not_found"
+    LOCKED = "locked"
+    CONFLICT = "conflict"
+    FAILED = "failed"
+
+
+class FileBulkRequest(BaseModel):
+    """
+    Base request schema for bulk file operations. Duplicate file IDs
+    are collapsed while preserving the order of first occurrence.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+
+    file_ids: list[Annotated[int, Field(ge=1)]] = Field(
+        min_length=1,
+        max_length=FILES_BULK_MAX_ITEMS,
+        description="Identifiers of the target files.",
+    )
+
+    @field_validator("file_ids")
+    @classmethod
+    def deduplicate_file_ids(cls, value: list[int]) -> list[int]:
+        return list(dict.fromkeys(value))
+
+
+class FileBulkResult(BaseModel):
+    """
+    Outcome of a bulk file operation for a single file.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+
+    file_id: int = Field(
+        description="Identifier of the target file.",
+    )
+
+    status: FileBulkStatus = Field(
+        description=(
+            "Outcome for this file: ok, not_found, locked (folder is "
+            "write-protected), conflict, or failed."
+        ),
+    )
+
+
+class FileBulkResponse(BaseModel):
+    """
+    Response schema for bulk file operations containing per-file
+    results in request order.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+
+    results: list[FileBulkResult] = Field(
+        description="Per-file results in request order.",
+    )
@@ -0,0 +1,38 @@
+# app/schemas/file_bulk_delete.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from app.schemas.file_bulk import FileBulkRequest
+from app.schemas.pydantic_error import PydanticErrorResponse
+
+FILE_BULK_DELETE_ERRORS = {
+    401: {
+        "description": (
+            "Invalid, expired, or missing authentication token."
+        ),
+    },
+    403: {
+        "description": (
+            "Authenticated user is inactive, blocked, or lacks "
+            "required permissions."
+        ),
+    },
+    422: {
+        "model": PydanticErrorResponse,
+        "description": (
+            "Input values failed validation (empty or too long file ID "
+            "list, or invalid file ID)."
+        ),
+    },
+    503: {
+        "description": (
+            "Service is temporarily unavailable (lockdown mode enabled "
+            "or gocryptfs storage not ready)."
+        ),
+    },
+}
+
+
+class FileBulkDeleteRequest(FileBulkRequest):
+    """
+    Request schema for deleting several files.
+    """
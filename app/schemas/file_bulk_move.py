@@ -0,0 +1,51 @@
+# app/schemas/file_bulk_move.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from pydantic import Field
+
+from app.schemas.file_bulk import FileBulkRequest
+from app.schemas.pydantic_error import PydanticErrorResponse
+
+FILE_BULK_MOVE_ERRORS = {
+    401: {
+        "description": (
+            "Invalid, expired, or missing authentication token."
+        ),
+    },
+    403: {
+        "description": (
+            "Authenticated user is inactive, blocked, or lacks "
+            "required permissions."
+        ),
+    },
+    404: {
+        "description": "Destination folder was not found.",
+    },
+    422: {
+        "model": PydanticErrorResponse,
+        "description": (
+            "Input values failed validation (empty or too long file ID "
+            "list, invalid file ID, or invalid destination folder ID)."
+        ),
+    },
+    423: {
+        "description": "Destination folder is write-protected.",
+    },
+    503: {
+        "description": (
+            "Service is temporarily unavailable (lockdown mode enabled "
+            "or gocryptfs storage not ready)."
+        ),
+    },
+}
+
+
+class FileBulkMoveRequest(FileBulkRequest):
+    """
+    Request schema for moving several files to another folder.
+    """
+
+    folder_id: int = Field(
+        ge=1,
+        description="Identifier of the destination folder.",
+    )
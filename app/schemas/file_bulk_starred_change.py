@@ -0,0 +1,44 @@
+# app/schemas/file_bulk_starred_change.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from pydantic import Field
+
+from app.schemas.file_bulk import FileBulkRequest
+from app.schemas.pydantic_error import PydanticErrorResponse
+
+FILE_BULK_STARRED_ERRORS = {
+    401: {
+        "description": (
+            "Invalid, expired, or missing authentication token."
+        ),
+    },
+    403: {
+        "description": (
+            "Authenticated user is inactive, blocked, or lacks "
+            "required permissions."
+        ),
+    },
+    422: {
+        "model": PydanticErrorResponse,
+        "description": (
+            "Input values failed validation (empty or too long file ID "
+            "list, invalid file ID, or invalid starred value)."
+        ),
+    },
+    503: {
+        "description": (
+            "Service is temporarily unavailable (lockdown mode enabled "
+            "or gocryptfs storage not ready)."
+        ),
+    },
+}
+
+
+class FileBulkStarredChangeRequest(FileBulkRequest):
+    """
+    Request schema for changing the starred flag of several files.
+    """
+
+    is_starred: bool = Field(
+        description="Whether the target files are starred.",
+    )
@@ -0,0 +1,59 @@
+# app/schemas/file_bulk_tag_add.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from pydantic import ConfigDict, Field, field_validator
+
+from app.schemas.file_bulk import FileBulkRequest
+from app.schemas.pydantic_error import PydanticErrorResponse
+from app.validators.file_tag import validate_file_tag
+
+FILE_BULK_TAG_ADD_ERRORS = {
+    401: {
+        "description": (
+            "Invalid, expired, or missing authentication token."
+        ),
+    },
+    403: {
+        "description": (
+            "Authenticated user is inactive, blocked, or lacks "
+            "required permissions."
+        ),
+    },
+    422: {
+        "model": PydanticErrorResponse,
+        "description": (
+            "Input values failed validation (empty or too long file ID "
+            "list, invalid file ID, missing tag, empty tag, tag too "
+            "long, or invalid tag format)."
+        ),
+    },
+    503: {
+        "description": (
+            "Service is temporarily unavailable (lockdown mode enabled "
+            "or gocryptfs storage not ready)."
+        ),
+    },
+}
+
+
+class FileBulkTagAddRequest(FileBulkRequest):
+    """
+    Request schema for adding a tag to several files. Leading and
+    trailing whitespace is stripped from the tag value.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+        str_strip_whitespace=True,
+    )
+
+    tag: str = Field(
+        min_length=1,
+        max_length=64,
+        description="Tag value to attach to the files.",
+    )
+
+    @field_validator("tag")
+    @classmethod
+    def validate_tag(cls, value: object) -> str:
+        return validate_file_tag(value)
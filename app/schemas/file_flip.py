@@ -37,12 +37,25 @@ FILE_FLIP_ERRORS = {
     423: {
         "description": "Parent folder is write-protected.",
     },
+    429: {
+        "description": (
+            "Too many bytes are being uploaded or rewritten at the "
+            "moment, or request rate limit of the user exceeded; "
+            "retry after the Retry-After interval."
+        ),
+    },
     503: {
         "description": (
             "Service is temporarily unavailable (lockdown mode enabled "
             "or gocryptfs storage not ready)."
         ),
     },
+    507: {
+        "description": (
+            "Free space on the encrypted storage is below the "
+            "configured floor."
+        ),
+    },
 }
 
 
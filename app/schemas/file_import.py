@@ -0,0 +1,121 @@
+# app/schemas/file_import.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from enum import StrEnum
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.pydantic_error import PydanticErrorResponse
+
+FILE_IMPORT_ERRORS = {
+    401: {
+        "description": (
+            "Invalid, expired, or missing authentication token."
+        ),
+    },
+    403: {
+        "description": (
+            "Authenticated user is inactive, blocked, or lacks "
+            "required permissions."
+        ),
+    },
+    404: {
+        "description": "Target folder was not found.",
+    },
+    409: {
+        "description": (
+            "Archive contains more entries, or declares more "
+            "uncompressed bytes, than allowed."
+        ),
+    },
+    422: {
+        "model": PydanticErrorResponse,
+        "description": (
+            "Input values failed validation (request body is not a "
+            "readable zip or tar archive)."
+        ),
+    },
+    423: {
+        "description": "Target folder is write-protected.",
+    },
+    429: {
+        "description": (
+            "Too many bytes are being uploaded or rewritten at the "
+            "moment, or request rate limit of the user exceeded; "
+            "retry after the Retry-After interval."
+        ),
+    },
+    503: {
+        "description": (
+            "Service is temporarily unavailable (lockdown mode enabled "
+            "or gocryptfs storage not ready)."
+        ),
+    },
+    507: {
+        "description": (
+            "Free space on the encrypted storage is below the "
+            "configured floor, or would fall below it once the archive "
+            "is extracted."
+        ),
+    },
+}
+
+
+class FileImportStatus(StrEnum):
+    """Per-entry outcome of an archive import."""
+
+    CREATED = "created"
+    EXISTS = "exists"
+    LOCKED = "locked"
+    INVALID = "invalid"
+    CONFLICT = "conflict"
+    FAILED = "failed"
+
+
+class FileImportResult(BaseModel):
+    """
+    Outcome of an archive import for a single archive entry.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+
+    path: str = Field(
+        description="Entry path as stored in the archive.",
+    )
+
+    status: FileImportStatus = Field(
+        description=(
+            "Outcome for this entry: created, exists (folder already "
+            "present and reused), locked (existing folder is "
+            "write-protected), invalid (unsafe or unsupported entry, "
+            "or depth or path length limit exceeded), conflict, or "
+            "failed."
+        ),
+    )
+
+    folder_id: int | None = Field(
+        default=None,
+        description="Identifier of the created or reused folder.",
+    )
+
+    file_id: int | None = Field(
+        default=None,
+        description="Identifier of the created file.",
+    )
+
+
+class FileImportResponse(BaseModel):
+    """
+    Response schema for an archive import containing per-entry results
+    in archive order.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+
+    results: list[FileImportResult] = Field(
+        description="Per-entry results in archive order.",
+    )
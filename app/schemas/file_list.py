@@ -48,6 +48,12 @@ FILE_LIST_ERRORS = {
             "invalid offset / limit)."
         ),
     },
+    429: {
+        "description": (
+            "Request rate limit of the user exceeded; retry after the "
+            "Retry-After interval."
+        ),
+    },
     503: {
         "description": (
             "Service is temporarily unavailable (lockdown mode enabled "
@@ -0,0 +1,147 @@
+# app/schemas/file_patch.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic_core import PydanticCustomError
+
+from app.constants import FILE_PATCH_MAX_RANGES
+from app.schemas.pydantic_error import PydanticErrorResponse
+from app.validators.validation_errors import VALUE_RANGES_INVALID
+
+FILE_PATCH_ERRORS = {
+    401: {
+        "description": (
+            "Invalid, expired, or missing authentication token."
+        ),
+    },
+    403: {
+        "description": (
+            "Authenticated user is inactive, blocked, or lacks "
+            "required permissions."
+        ),
+    },
+    404: {
+        "description": "Target file was not found.",
+    },
+    409: {
+        "description": (
+            "File is not a text file, its content no longer matches "
+            "the base checksum, or filesystem state conflicts with the "
+            "database."
+        ),
+    },
+    422: {
+        "model": PydanticErrorResponse,
+        "description": (
+            "Input values failed validation (invalid base checksum, "
+            "empty or too long patch list, unordered or overlapping "
+            "ranges, or a range beyond the end of the file)."
+        ),
+    },
+    423: {
+        "description": "Parent folder is write-protected.",
+    },
+    429: {
+        "description": (
+            "Too many bytes are being uploaded or rewritten at the "
+            "moment; retry after the Retry-After interval."
+        ),
+    },
+    503: {
+        "description": (
+            "Service is temporarily unavailable (lockdown mode enabled "
+            "or gocryptfs storage not ready)."
+        ),
+    },
+    507: {
+        "description": (
+            "Free space on the encrypted storage is below the "
+            "configured floor."
+        ),
+    },
+}
+
+
+class FilePatchRange(BaseModel):
+    """
+    A half-open range of the base content and its replacement text.
+    An empty range (start equal to end) inserts the text.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+
+    start: int = Field(
+        ge=0,
+        description="Start of the replaced range, inclusive.",
+    )
+
+    end: int = Field(
+        ge=0,
+        description="End of the replaced range, exclusive.",
+    )
+
+    content: str = Field(
+        description="Replacement text.",
+    )
+
+
+class FilePatchRequest(BaseModel):
+    """
+    Request schema for patching a text file. Ranges refer to the base
+    content identified by its checksum; a successful patch creates a
+    new file revision.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+
+    base_checksum: str = Field(
+        pattern=r"^[0-9a-f]{64}$",
+        description="SHA-256 checksum of the content being patched.",
+    )
+
+    unit: Literal["line", "byte"] = Field(
+        default="line",
+        description="Unit of range offsets: lines or bytes, from zero.",
+    )
+
+    patches: list[FilePatchRange] = Field(
+        min_length=1,
+        max_length=FILE_PATCH_MAX_RANGES,
+        description="Ranges to replace, ordered by position.",
+    )
+
+    @field_validator("patches")
+    @classmethod
+    def validate_patches(
+        cls,
+        value: list[FilePatchRange],
+    ) -> list[FilePatchRange]:
+        position = 0
+        for patch in value:
+            if patch.start < position or patch.end < patch.start:
+                raise PydanticCustomError(*VALUE_RANGES_INVALID)
+            position = patch.end
+        return value
+
+
+class FilePatchResponse(BaseModel):
+    """
+    Response schema for text file patch.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+        from_attributes=True,
+        populate_by_name=True,
+    )
+
+    file_id: int = Field(
+        validation_alias="id",
+        description="Identifier of the patched file.",
+    )
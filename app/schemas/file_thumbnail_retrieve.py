@@ -19,6 +19,12 @@ FILE_THUMBNAIL_RETRIEVE_ERRORS = {
     422: {
         "description": "Input values failed validation.",
     },
+    429: {
+        "description": (
+            "Request rate limit of the user exceeded; retry after the "
+            "Retry-After interval."
+        ),
+    },
     503: {
         "description": (
             "Service is temporarily unavailable (lockdown mode enabled "
@@ -36,12 +36,24 @@ FILE_UPLOAD_ERRORS = {
     423: {
         "description": "Target folder is write-protected.",
     },
+    429: {
+        "description": (
+            "Too many bytes are being uploaded or rewritten at the "
+            "moment; retry after the Retry-After interval."
+        ),
+    },
     503: {
         "description": (
             "Service is temporarily unavailable (lockdown mode enabled "
             "or gocryptfs storage not ready)."
         ),
     },
+    507: {
+        "description": (
+            "Free space on the encrypted storage is below the "
+            "configured floor."
+        ),
+    },
 }
 
 
@@ -1,6 +1,8 @@
 # app/schemas/folder_delete.py
 # SPDX-License-Identifier: GPL-3.0-only
 
+from pydantic import BaseModel, ConfigDict, Field
+
 from app.schemas.pydantic_error import PydanticErrorResponse
 
 FOLDER_DELETE_ERRORS = {
@@ -21,7 +23,8 @@ FOLDER_DELETE_ERRORS = {
     409: {
         "description": (
             "Folder cannot be deleted because it contains subfolders "
-            "or still has files after deletion attempt."
+            "(non-recursive deletion only) or still has files after "
+            "deletion attempt."
         ),
     },
     422: {
@@ -31,7 +34,10 @@ FOLDER_DELETE_ERRORS = {
         ),
     },
     423: {
-        "description": "Target folder or parent folder is write-protected.",
+        "description": (
+            "Target folder, parent folder, or (recursive deletion "
+            "only) a nested folder is write-protected."
+        ),
     },
     503: {
         "description": (
@@ -40,3 +46,21 @@ FOLDER_DELETE_ERRORS = {
         ),
     },
 }
+
+
+class FolderDeleteRequest(BaseModel):
+    """
+    Query parameters for folder deletion. Extra fields are forbidden.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+
+    recursive: bool = Field(
+        default=False,
+        description=(
+            "Delete the folder together with all nested folders and "
+            "files. When false, folders with subfolders are rejected."
+        ),
+    )
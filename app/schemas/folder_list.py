@@ -39,6 +39,12 @@ FOLDER_LIST_ERRORS = {
             "or ordering values)."
         ),
     },
+    429: {
+        "description": (
+            "Request rate limit of the user exceeded; retry after the "
+            "Retry-After interval."
+        ),
+    },
     503: {
         "description": (
             "Service is temporarily unavailable (lockdown mode enabled "
@@ -0,0 +1,139 @@
+# app/schemas/integrity_report_retrieve.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from pydantic import BaseModel, ConfigDict, Field
+
+INTEGRITY_REPORT_RETRIEVE_ERRORS = {
+    401: {
+        "description": (
+            "Invalid, expired, or missing authentication token."
+        ),
+    },
+    403: {
+        "description": (
+            "Authenticated user is not an admin, inactive, or blocked."
+        ),
+    },
+    503: {
+        "description": (
+            "Service is temporarily unavailable (lockdown mode enabled "
+            "or gocryptfs storage not ready)."
+        ),
+    },
+}
+
+
+class IntegrityFindingResponse(BaseModel):
+    """
+    Response schema for a single integrity finding: the failed check,
+    the affected row if any, and the path relative to the mountpoint.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    check: str = Field(
+        description=(
+            "Failed check: missing, filesize_mismatch, checksum_mismatch, "
+            "orphan, revision_number_invalid, or thumbnail_unlinked."
+        ),
+    )
+
+    resource_type: str | None = Field(
+        default=None,
+        description="Table of the affected row; null for orphans.",
+    )
+
+    resource_id: int | None = Field(
+        default=None,
+        description="Identifier of the affected row; null for orphans.",
+    )
+
+    path: str = Field(
+        description="Affected path relative to the storage mountpoint.",
+    )
+
+    detected_at: int = Field(
+        description="Timestamp when the finding was detected.",
+    )
+
+
+class IntegrityPassResponse(BaseModel):
+    """
+    Response schema for the last completed integrity scan pass.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    pass_number: int = Field(
+        description="Sequence number of the pass.",
+    )
+
+    started_at: int = Field(
+        description="Timestamp when the pass started.",
+    )
+
+    completed_at: int = Field(
+        description="Timestamp when the pass completed.",
+    )
+
+    checked_count: int = Field(
+        description="Number of rows, folders and blobs checked.",
+    )
+
+    hashed_bytes: int = Field(
+        description="Number of bytes read for checksum verification.",
+    )
+
+    findings_count: int = Field(
+        description="Total number of findings, including unlisted ones.",
+    )
+
+    findings: list[IntegrityFindingResponse] = Field(
+        description="Findings of the pass, up to the report limit.",
+    )
+
+
+class IntegrityReportResponse(BaseModel):
+    """
+    Response schema for the integrity scan report: progress and
+    findings of the pass in progress, and the last completed pass.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    pass_number: int = Field(
+        description="Sequence number of the current or last pass.",
+    )
+
+    pass_started_at: int | None = Field(
+        default=None,
+        description="Timestamp when the current or last pass started.",
+    )
+
+    phase: str | None = Field(
+        default=None,
+        description=(
+            "Phase of the pass in progress; null between passes."
+        ),
+    )
+
+    checked_count: int = Field(
+        description="Number of items checked in the pass in progress.",
+    )
+
+    hashed_bytes: int = Field(
+        description="Number of bytes hashed in the pass in progress.",
+    )
+
+    findings_count: int = Field(
+        description="Total findings of the pass in progress.",
+    )
+
+    findings: list[IntegrityFindingResponse] = Field(
+        description="Findings of the pass in progress so far.",
+    )
+
+    last_pass: IntegrityPassResponse | None = Field(
+        default=None,
+        description="Last completed pass; null if none has completed.",
+    )
@@ -0,0 +1,21 @@
+# app/schemas/metrics_export.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+METRICS_EXPORT_ERRORS = {
+    401: {
+        "description": (
+            "Invalid, expired, or missing authentication token."
+        ),
+    },
+    403: {
+        "description": (
+            "Authenticated user is not an admin, inactive, or blocked."
+        ),
+    },
+    503: {
+        "description": (
+            "Service is temporarily unavailable (lockdown mode enabled "
+            "or gocryptfs storage not ready)."
+        ),
+    },
+}
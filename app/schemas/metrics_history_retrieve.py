@@ -0,0 +1,46 @@
+# app/schemas/metrics_history_retrieve.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.pydantic_error import PydanticErrorResponse
+
+METRICS_HISTORY_RETRIEVE_ERRORS = {
+    401: {
+        "description": (
+            "Invalid, expired, or missing authentication token."
+        ),
+    },
+    403: {
+        "description": (
+            "Authenticated user is not an admin, inactive, or blocked."
+        ),
+    },
+    422: {
+        "model": PydanticErrorResponse,
+        "description": (
+            "Input values failed validation (minutes less than 1)."
+        ),
+    },
+    503: {
+        "description": (
+            "Service is temporarily unavailable (lockdown mode enabled "
+            "or gocryptfs storage not ready)."
+        ),
+    },
+}
+
+
+class MetricsHistoryRequest(BaseModel):
+    """
+    Request schema for retrieving the sampled metrics history of the
+    last minutes. Extra fields are forbidden.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    minutes: int = Field(
+        default=60,
+        ge=1,
+        description="Length of the returned history in minutes.",
+    )
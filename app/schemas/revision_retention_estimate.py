@@ -0,0 +1,56 @@
+# app/schemas/revision_retention_estimate.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from pydantic import BaseModel, ConfigDict, Field
+
+REVISION_RETENTION_ESTIMATE_ERRORS = {
+    401: {
+        "description": (
+            "Invalid, expired, or missing authentication token."
+        ),
+    },
+    403: {
+        "description": (
+            "Authenticated user is not an admin, inactive, or blocked."
+        ),
+    },
+    503: {
+        "description": (
+            "Service is temporarily unavailable (lockdown mode enabled "
+            "or gocryptfs storage not ready)."
+        ),
+    },
+}
+
+
+class RevisionRetentionEstimateResponse(BaseModel):
+    """
+    Response schema for a dry run of the revision retention policies:
+    current revision storage and the part the compactor would remove.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    files_count: int = Field(
+        description="Number of files that have revisions.",
+    )
+
+    revisions_count: int = Field(
+        description="Number of stored revisions.",
+    )
+
+    revisions_bytes: int = Field(
+        description="Total size of stored revisions in bytes.",
+    )
+
+    expired_files_count: int = Field(
+        description="Number of files with revisions to be removed.",
+    )
+
+    expired_revisions_count: int = Field(
+        description="Number of revisions to be removed.",
+    )
+
+    expired_bytes: int = Field(
+        description="Space in bytes to be reclaimed.",
+    )
@@ -0,0 +1,57 @@
+# app/schemas/sql_statement_list.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.constants import SQL_SLOW_MAX_STATEMENTS
+from app.schemas.pydantic_error import PydanticErrorResponse
+
+SQL_STATEMENT_LIST_ERRORS = {
+    401: {
+        "description": (
+            "Invalid, expired, or missing authentication token."
+        ),
+    },
+    403: {
+        "description": (
+            "Authenticated user is not an admin, inactive, or blocked."
+        ),
+    },
+    422: {
+        "model": PydanticErrorResponse,
+        "description": (
+            "Input values failed validation (limit out of range or "
+            "unknown order_by)."
+        ),
+    },
+    503: {
+        "description": (
+            "Service is temporarily unavailable (lockdown mode enabled "
+            "or gocryptfs storage not ready)."
+        ),
+    },
+}
+
+OrderByField = Literal["total_seconds", "max_seconds", "count"]
+
+
+class SqlStatementListRequest(BaseModel):
+    """
+    Request schema for listing the slowest SQL statements, ordered
+    descending by the given field. Extra fields are forbidden.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    limit: int = Field(
+        default=20,
+        ge=1,
+        le=SQL_SLOW_MAX_STATEMENTS,
+        description="Maximum number of statements to return.",
+    )
+    order_by: OrderByField = Field(
+        default="total_seconds",
+        description="Field to order statements by, descending.",
+    )
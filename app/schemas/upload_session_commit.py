@@ -0,0 +1,64 @@
+# app/schemas/upload_session_commit.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.pydantic_error import PydanticErrorResponse
+
+UPLOAD_SESSION_COMMIT_ERRORS = {
+    401: {
+        "description": (
+            "Invalid, expired, or missing authentication token."
+        ),
+    },
+    403: {
+        "description": (
+            "Authenticated user is inactive, blocked, or lacks "
+            "required permissions."
+        ),
+    },
+    404: {
+        "description": (
+            "Upload session was not found or has expired, or its target "
+            "folder was not found."
+        ),
+    },
+    409: {
+        "description": (
+            "Upload is incomplete, or the target filename conflicts "
+            "with a directory, an unmanaged filesystem file, a "
+            "path-length limit, or an existing file with incompatible "
+            "MIME type."
+        ),
+    },
+    422: {
+        "model": PydanticErrorResponse,
+        "description": "Input values failed validation.",
+    },
+    423: {
+        "description": "Target folder is write-protected.",
+    },
+    503: {
+        "description": (
+            "Service is temporarily unavailable (lockdown mode enabled "
+            "or gocryptfs storage not ready)."
+        ),
+    },
+}
+
+
+class UploadSessionCommitResponse(BaseModel):
+    """
+    Response schema for upload session commit containing the stored
+    file identifier.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+        from_attributes=True,
+    )
+
+    file_id: int = Field(
+        validation_alias="id",
+        description="Identifier of the uploaded file.",
+    )
@@ -0,0 +1,91 @@
+# app/schemas/upload_session_create.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.schemas.pydantic_error import PydanticErrorResponse
+from app.validators.path_segment import validate_path_segment
+
+UPLOAD_SESSION_CREATE_ERRORS = {
+    401: {
+        "description": (
+            "Invalid, expired, or missing authentication token."
+        ),
+    },
+    403: {
+        "description": (
+            "Authenticated user is inactive, blocked, or lacks "
+            "required permissions."
+        ),
+    },
+    404: {
+        "description": "Target folder was not found.",
+    },
+    422: {
+        "model": PydanticErrorResponse,
+        "description": (
+            "Input values failed validation (invalid filename or "
+            "negative file size)."
+        ),
+    },
+    423: {
+        "description": "Target folder is write-protected.",
+    },
+    503: {
+        "description": (
+            "Service is temporarily unavailable (lockdown mode enabled "
+            "or gocryptfs storage not ready)."
+        ),
+    },
+}
+
+
+class UploadSessionCreateRequest(BaseModel):
+    """
+    Request schema for opening a resumable upload session with the
+    name and total size of the uploaded file.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+
+    filename: str = Field(
+        min_length=1,
+        max_length=255,
+        description="Name of the uploaded file.",
+    )
+
+    filesize: int = Field(
+        ge=0,
+        description="Total size of the uploaded file in bytes.",
+    )
+
+    @field_validator("filename")
+    @classmethod
+    def validate_filename(cls, value: str) -> str:
+        return validate_path_segment(value)
+
+
+class UploadSessionCreateResponse(BaseModel):
+    """
+    Response schema for upload session creation containing the session
+    identifier and its expiry time.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+        from_attributes=True,
+    )
+
+    upload_id: str = Field(
+        validation_alias="upload_uuid",
+        description="Identifier of the upload session.",
+    )
+
+    expires_at: int = Field(
+        description=(
+            "Unix timestamp after which the session is discarded unless "
+            "more data is received."
+        ),
+    )
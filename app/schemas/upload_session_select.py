@@ -0,0 +1,75 @@
+# app/schemas/upload_session_select.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from pydantic import BaseModel, ConfigDict, Field
+
+UPLOAD_SESSION_SELECT_ERRORS = {
+    401: {
+        "description": (
+            "Invalid, expired, or missing authentication token."
+        ),
+    },
+    403: {
+        "description": (
+            "Authenticated user is inactive, blocked, or lacks "
+            "required permissions."
+        ),
+    },
+    404: {
+        "description": "Upload session was not found or has expired.",
+    },
+    503: {
+        "description": (
+            "Service is temporarily unavailable (lockdown mode enabled "
+            "or gocryptfs storage not ready)."
+        ),
+    },
+}
+
+
+class UploadSessionSelectResponse(BaseModel):
+    """
+    Response schema for upload session retrieval with the byte ranges
+    received so far.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+        from_attributes=True,
+    )
+
+    upload_id: str = Field(
+        validation_alias="upload_uuid",
+        description="Identifier of the upload session.",
+    )
+
+    folder_id: int = Field(
+        description="Identifier of the target folder.",
+    )
+
+    filename: str = Field(
+        description="Name of the uploaded file.",
+    )
+
+    filesize: int = Field(
+        description="Total size of the uploaded file in bytes.",
+    )
+
+    received_ranges: list[tuple[int, int]] = Field(
+        validation_alias="ranges",
+        description=(
+            "Sorted, merged byte ranges received so far, each as "
+            "[start, end) with end exclusive."
+        ),
+    )
+
+    created_at: int = Field(
+        description="Unix timestamp when the session was created.",
+    )
+
+    expires_at: int = Field(
+        description=(
+            "Unix timestamp after which the session is discarded unless "
+            "more data is received."
+        ),
+    )
@@ -0,0 +1,91 @@
+# app/schemas/upload_session_write.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.pydantic_error import PydanticErrorResponse
+
+UPLOAD_SESSION_WRITE_ERRORS = {
+    401: {
+        "description": (
+            "Invalid, expired, or missing authentication token."
+        ),
+    },
+    403: {
+        "description": (
+            "Authenticated user is inactive, blocked, or lacks "
+            "required permissions."
+        ),
+    },
+    404: {
+        "description": "Upload session was not found or has expired.",
+    },
+    422: {
+        "model": PydanticErrorResponse,
+        "description": (
+            "Input values failed validation (negative offset, or chunk "
+            "beyond the declared file size)."
+        ),
+    },
+    429: {
+        "description": (
+            "Too many bytes are being uploaded or rewritten at the "
+            "moment; retry after the Retry-After interval."
+        ),
+    },
+    503: {
+        "description": (
+            "Service is temporarily unavailable (lockdown mode enabled "
+            "or gocryptfs storage not ready)."
+        ),
+    },
+    507: {
+        "description": (
+            "Free space on the encrypted storage is below the "
+            "configured floor."
+        ),
+    },
+}
+
+
+class UploadSessionWriteRequest(BaseModel):
+    """
+    Request query schema for writing an upload session chunk. The
+    chunk itself is the raw request body.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+
+    offset: int = Field(
+        ge=0,
+        description="Byte offset of the chunk within the file.",
+    )
+
+
+class UploadSessionWriteResponse(BaseModel):
+    """
+    Response schema for an upload session chunk with the byte ranges
+    received so far.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+        from_attributes=True,
+    )
+
+    received_ranges: list[tuple[int, int]] = Field(
+        validation_alias="ranges",
+        description=(
+            "Sorted, merged byte ranges received so far, each as "
+            "[start, end) with end exclusive."
+        ),
+    )
+
+    expires_at: int = Field(
+        description=(
+            "Unix timestamp after which the session is discarded unless "
+            "more data is received."
+        ),
+    )
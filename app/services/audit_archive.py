@@ -0,0 +1,144 @@
+# app/services/audit_archive.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import logging
+import time
+import uuid
+from collections.abc import Sequence
+
+from sqlalchemy import delete
+
+from app.config import get_config
+from app.constants import (
+    AUDIT_ARCHIVE_MAX_SEGMENTS_PER_RUN,
+    AUDIT_SEGMENT_ROWS,
+)
+from app.db.engine import AuditSessionLocal
+from app.events import Events as E
+from app.models.audit import Audit
+from app.models.audit_segment import AuditSegment
+from app.repositories.audit_segment import summarize_segment, write_segment
+from app.repositories.file import delete as delete_file
+from app.repositories.orm import ORMRepository
+
+log = logging.getLogger(__name__)
+
+
+async def archive_audit() -> None:
+    """
+    Move the oldest audit rows past the configured age into sealed,
+    compressed, checksummed segment files. Runs as a background job;
+    each sealed segment is committed in its own audit transaction.
+    """
+    config = get_config()
+    if config.AUDIT_ARCHIVE_AFTER_SECONDS <= 0:
+        return
+
+    log.info("event=%s", E.AUDIT_ARCHIVE_STARTED)
+    cutoff = int(time.time()) - config.AUDIT_ARCHIVE_AFTER_SECONDS
+    segments_count = 0
+
+    async with AuditSessionLocal() as session:
+        repository = ORMRepository(session)
+
+        while segments_count < AUDIT_ARCHIVE_MAX_SEGMENTS_PER_RUN:
+            audit_events = await repository.select_all(
+                Audit,
+                order_by="id",
+                order="asc",
+                offset=0,
+                limit=AUDIT_SEGMENT_ROWS,
+            )
+
+            # Only full segments of a contiguous id prefix are sealed,
+            # so segment id ranges never interleave with live rows.
+            if len(audit_events) < AUDIT_SEGMENT_ROWS or any(
+                audit_event.created_at >= cutoff
+                for audit_event in audit_events
+            ):
+                break
+
+            segment = await _seal_segment(repository, audit_events)
+            session.expunge_all()
+            segments_count += 1
+
+            log.info(
+                "event=%s segment_id=%s rows_count=%s",
+                E.AUDIT_ARCHIVE_SEGMENT_SEALED,
+                segment.id, segment.rows_count,
+            )
+
+    log.info(
+        "event=%s segments_count=%s",
+        E.AUDIT_ARCHIVE_COMPLETED, segments_count,
+    )
+
+
+async def _seal_segment(
+    repository: ORMRepository,
+    audit_events: Sequence[Audit],
+) -> AuditSegment:
+    segment = AuditSegment(
+        segment_uuid=str(uuid.uuid4()),
+        rows_count=len(audit_events),
+        **_get_bounds(audit_events, "id"),
+        **_get_bounds(audit_events, "created_at"),
+        **_get_bounds(audit_events, "created_by"),
+        **_get_bounds(audit_events, "resource_id"),
+        summary=summarize_segment(audit_events),
+    )
+
+    # The segment file is durable before the transaction that removes
+    # the live rows commits. A crash in between leaves an orphan file
+    # without a segment row, which is never read.
+    segment.filesize, segment.checksum = await write_segment(
+        segment.absolute_path,
+        audit_events,
+    )
+
+    # NOTE (ADR-24): Audit data is append-only.
+    # Archiving is the only path that removes live audit rows, and only
+    # together with the segment that preserves them. The bulk DELETE
+    # bypasses the ORM before_delete guard on purpose.
+    try:
+        await repository.insert(segment)
+        await repository.session.execute(
+            delete(Audit)
+            .where(
+                Audit.id >= segment.min_id,
+                Audit.id <= segment.max_id,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await repository.commit()
+
+    except Exception:
+        log.exception(
+            "event=%s segment_uuid=%s",
+            E.AUDIT_ARCHIVE_FAILED, segment.segment_uuid,
+        )
+        await repository.rollback()
+        try:
+            await delete_file(segment.absolute_path)
+        except Exception:
+            log.exception(
+                "event=%s segment_uuid=%s",
+                E.AUDIT_ARCHIVE_FAILED, segment.segment_uuid,
+            )
+        raise
+
+    return segment
+
+
+def _get_bounds(
+    audit_events: Sequence[Audit],
+    field: str,
+) -> dict[str, int | None]:
+    values = [
+        getattr(audit_event, field) for audit_event in audit_events
+        if getattr(audit_event, field) is not None
+    ]
+    return {
+        f"min_{field}": min(values) if values else None,
+        f"max_{field}": max(values) if values else None,
+    }
@@ -0,0 +1,151 @@
+# app/services/audit_export.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import logging
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants import AUDIT_EXPORT_BATCH_ROWS
+from app.db.engine import AuditSessionLocal
+from app.events import Events as E
+from app.hooks import hooks
+from app.models.audit import Audit
+from app.models.audit_segment import AuditSegment
+from app.repositories.audit_segment import (
+    get_segment_filters,
+    match_filters,
+    read_segment,
+)
+from app.repositories.orm import ORMRepository
+from app.schemas.audit_export import AuditExportRequest
+from app.schemas.audit_select import AuditSelectResponse
+
+log = logging.getLogger(__name__)
+
+
+async def export_audit(
+    session: AsyncSession,
+    params: AuditExportRequest,
+) -> AsyncIterator[bytes]:
+    """
+    Return an async iterator of NDJSON chunks with audit records
+    matching the provided filters in ascending id order. Archived
+    segments and live rows are exported as one continuous sequence.
+    """
+    log.info("event=%s", E.AUDIT_EXPORT_STARTED)
+
+    filters = params.model_dump(exclude_none=True)
+    after_id = filters.pop("after_id")
+
+    if "event__ilike" in filters:
+        filters["event__ilike"] = f"%{filters['event__ilike']}%"
+
+    log.info("event=%s", E.AUDIT_EXPORT_COMPLETED)
+    await hooks.emit(E.AUDIT_EXPORT_COMPLETED, session, None)
+    return _stream_audit(filters, after_id)
+
+
+# NOTE (ADR-10): SQLite is used as the database backend.
+# In DELETE journal mode an open read transaction holds a SHARED lock
+# that blocks every audit writer. The export therefore walks the audit
+# database with an id cursor, reading each batch in its own short
+# session, instead of keeping one server-side cursor open for the whole
+# response. The cursor also makes the export immune to rows being
+# archived concurrently: a segment sealed mid-export is picked up by
+# its id range on the next iteration.
+
+async def _stream_audit(
+    filters: dict[str, Any],
+    after_id: int,
+) -> AsyncIterator[bytes]:
+    last_id = after_id
+    rows_count = 0
+
+    try:
+        while True:
+            async with AuditSessionLocal() as audit_session:
+                repository = ORMRepository(audit_session)
+                audit_events, last_id = await _select_batch(
+                    repository, filters, last_id,
+                )
+
+            if audit_events is None:
+                break
+
+            if audit_events:
+                rows_count += len(audit_events)
+                yield _encode_batch(audit_events)
+
+    except Exception:
+        log.exception(
+            "event=%s last_id=%s", E.AUDIT_EXPORT_FAILED, last_id,
+        )
+        raise
+
+    log.info(
+        "event=%s rows_count=%s last_id=%s",
+        E.AUDIT_EXPORT_STREAMED, rows_count, last_id,
+    )
+
+
+async def _select_batch(
+    repository: ORMRepository,
+    filters: dict[str, Any],
+    last_id: int,
+) -> tuple[list[Audit] | None, int]:
+    """
+    Return the next batch of matching rows after last_id and the new
+    cursor position. Returns None as the batch when nothing is left.
+    """
+    segments = await repository.select_all(
+        AuditSegment,
+        max_id__gt=last_id,
+        **get_segment_filters(filters),
+        order_by="min_id",
+        order="asc",
+        limit=1,
+    )
+
+    if segments:
+        segment = segments[0]
+        try:
+            audit_events = await read_segment(
+                segment.absolute_path, segment.checksum,
+            )
+        except ValueError:
+            log.error(
+                "event=%s segment_id=%s",
+                E.AUDIT_SEGMENT_CHECKSUM_MISMATCH, segment.id,
+            )
+            raise
+
+        return [
+            audit_event for audit_event in audit_events
+            if audit_event.id > last_id and match_filters(
+                audit_event, filters,
+            )
+        ], segment.max_id
+
+    audit_events = await repository.select_all(
+        Audit,
+        id__gt=last_id,
+        **filters,
+        order_by="id",
+        order="asc",
+        limit=AUDIT_EXPORT_BATCH_ROWS,
+    )
+
+    if not audit_events:
+        return None, last_id
+
+    return audit_events, audit_events[-1].id
+
+
+def _encode_batch(audit_events: Sequence[Audit]) -> bytes:
+    return "".join(
+        AuditSelectResponse.model_validate(audit_event).model_dump_json()
+        + "\n"
+        for audit_event in audit_events
+    ).encode("utf-8")
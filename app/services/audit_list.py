@@ -2,37 +2,350 @@
 # SPDX-License-Identifier: GPL-3.0-only
 
 import logging
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.errors import InternalServerError, ValueInvalidError
 from app.events import Events as E
 from app.hooks import hooks
 from app.models.audit import Audit
+from app.models.audit_segment import AuditSegment
+from app.repositories.audit_segment import (
+    AUDIT_SUMMARY_FIELDS,
+    count_summary,
+    get_segment_filters,
+    match_filters,
+    read_segment,
+)
 from app.repositories.orm import ORMRepository
 from app.schemas.audit_list import AuditListRequest
 
 log = logging.getLogger(__name__)
 
 
+@dataclass
+class _Part:
+    """
+    Rows that sort together as one run: matching live rows (segment
+    None) or rows of one archived segment, limited to one value of the
+    ordering column in value order. count is None while unknown.
+    """
+
+    segment: AuditSegment | None
+    count: int | None
+    value: Any = None
+
+
 async def list_audit(
     session: AsyncSession,
+    audit_session: AsyncSession,
     params: AuditListRequest,
-) -> tuple[list[Audit], int]:
+) -> tuple[list[Audit], int, bool]:
     """
     Return audit records matching the provided filters together with
-    the total number of matching records.
+    the total number of matching records and whether that total is
+    exact. Records are read from the audit database session and from
+    archived segments whose min/max bounds overlap the filters. Only
+    segments holding rows of the page are decoded. Ordering archived
+    rows by a column the segment summaries do not cover raises
+    ValueInvalidError.
     """
     log.info("event=%s", E.AUDIT_LIST_STARTED)
 
-    repository = ORMRepository(session)
+    repository = ORMRepository(audit_session)
     filters = params.model_dump(exclude_none=True)
 
     if "event__ilike" in filters:
         filters["event__ilike"] = f"%{filters['event__ilike']}%"
 
-    audit_count = await repository.count_all(Audit, **filters)
-    audit = await repository.select_all(Audit, **filters)
+    segments = await repository.select_all(
+        AuditSegment,
+        **get_segment_filters(filters),
+        order_by="min_id",
+        order="asc",
+    )
+
+    live_count = await repository.count_all(Audit, **filters)
+    archived_audit: dict[int, list[Audit]] = {}
+
+    if not segments:
+        audit = await repository.select_all(Audit, **filters)
+        audit_count, is_exact = live_count, True
+
+    elif filters["order_by"] in AUDIT_SUMMARY_FIELDS:
+        parts = await _get_value_parts(
+            repository, segments, filters, archived_audit,
+        )
+        audit, audit_count, is_exact = await _select_page(
+            repository, parts, filters, archived_audit,
+        )
+
+    elif await _is_ordered_by_segments(repository, segments, filters):
+        parts = [
+            _Part(segment, _count_archived(segment, filters))
+            for segment in segments
+        ]
+        parts.append(_Part(None, live_count))
+        audit, audit_count, is_exact = await _select_page(
+            repository, parts, filters, archived_audit,
+        )
+
+    elif filters["order_by"] == "created_at":
+        audit, audit_count = await _select_merged(
+            repository, segments, filters, live_count,
+        )
+        is_exact = True
+
+    else:
+        log.warning("event=%s", E.AUDIT_LIST_ORDER_UNSUPPORTED)
+        raise ValueInvalidError(
+            field="order_by", input_value=filters["order_by"],
+        )
 
     log.info("event=%s", E.AUDIT_LIST_COMPLETED)
     await hooks.emit(E.AUDIT_LIST_COMPLETED, session, audit)
-    return audit, audit_count
+    return audit, audit_count, is_exact
+
+
+async def _is_ordered_by_segments(
+    repository: ORMRepository,
+    segments: list[AuditSegment],
+    filters: dict[str, Any],
+) -> bool:
+    """
+    Return True when the sort order of rows follows segment order, with
+    live rows after the last segment. Segments hold contiguous id
+    prefixes, so this always holds for id; it holds for created_at
+    unless the clock went back across a segment boundary.
+    """
+    if filters["order_by"] == "id":
+        return True
+
+    if filters["order_by"] != "created_at":
+        return False
+
+    for previous, segment in zip(segments, segments[1:]):
+        if previous.max_created_at > segment.min_created_at:
+            return False
+
+    first_live = await repository.select_all(
+        Audit,
+        **{**filters, "order": "asc", "offset": 0, "limit": 1},
+    )
+    return (
+        not first_live
+        or first_live[0].created_at >= segments[-1].max_created_at
+    )
+
+
+async def _get_value_parts(
+    repository: ORMRepository,
+    segments: list[AuditSegment],
+    filters: dict[str, Any],
+    archived_audit: dict[int, list[Audit]],
+) -> list[_Part]:
+    """
+    Return parts in ascending order of the ordering column, each value
+    split into segments and then live rows so that ties follow id.
+    Counts per value come from segment summaries and a grouped count
+    of live rows; segments the summary cannot decide are decoded.
+    """
+    order_by = filters["order_by"]
+    parts: dict[Any, list[_Part]] = {}
+
+    for segment in segments:
+        counts = count_summary(segment, filters, group_by=order_by)
+        if counts is None:
+            counts = Counter(
+                getattr(audit_event, order_by)
+                for audit_event in await _get_archived(
+                    segment, filters, archived_audit,
+                )
+            )
+        for value, count in counts.items():
+            if count:
+                parts.setdefault(value, []).append(
+                    _Part(segment, count, value),
+                )
+
+    live_counts = await repository.count_values(Audit, order_by, **filters)
+    for value, count in live_counts.items():
+        parts.setdefault(value, []).append(_Part(None, count, value))
+
+    values = sorted(parts, key=lambda value: (value is not None, value))
+    return [part for value in values for part in parts[value]]
+
+
+async def _select_page(
+    repository: ORMRepository,
+    parts: list[_Part],
+    filters: dict[str, Any],
+    archived_audit: dict[int, list[Audit]],
+) -> tuple[list[Audit], int, bool]:
+    """
+    Return the requested page, the number of matching rows and whether
+    that number is exact, by walking parts in sort order. A segment of
+    unknown count is decoded only while the page is not yet filled;
+    past the page it is left out of the total.
+    """
+    descending = filters["order"] == "desc"
+    if descending:
+        parts = parts[::-1]
+
+    start = filters["offset"]
+    stop = start + filters["limit"]
+    position = 0
+    is_exact = True
+    audit = []
+
+    for part in parts:
+        if part.count is None:
+            if position >= stop:
+                is_exact = False
+                continue
+
+            part.count = len(await _get_archived(
+                part.segment, filters, archived_audit,
+            ))
+
+        part_start = max(start - position, 0)
+        part_stop = min(stop - position, part.count)
+        position += part.count
+
+        if part_start < part_stop:
+            audit.extend(await _select_part(
+                repository, part, filters, archived_audit,
+                part_start, part_stop,
+            ))
+
+    return audit, position, is_exact
+
+
+async def _select_part(
+    repository: ORMRepository,
+    part: _Part,
+    filters: dict[str, Any],
+    archived_audit: dict[int, list[Audit]],
+    part_start: int,
+    part_stop: int,
+) -> list[Audit]:
+    """
+    Return rows [part_start, part_stop) of a part in sort order.
+    """
+    order_by = filters["order_by"]
+    by_value = order_by in AUDIT_SUMMARY_FIELDS
+
+    if part.segment is None:
+        part_filters = {
+            **filters,
+            "offset": part_start,
+            "limit": part_stop - part_start,
+        }
+        if by_value:
+            value_key = "__eq" if part.value is not None else "__is"
+            part_filters[order_by + value_key] = part.value
+            part_filters["order_by"] = "id"
+        return await repository.select_all(Audit, **part_filters)
+
+    audit_events = await _get_archived(part.segment, filters, archived_audit)
+    if by_value:
+        audit_events = [
+            audit_event for audit_event in audit_events
+            if getattr(audit_event, order_by) == part.value
+        ]
+
+    return sorted(
+        audit_events,
+        key=lambda audit_event: _get_sort_key(audit_event, order_by),
+        reverse=filters["order"] == "desc",
+    )[part_start:part_stop]
+
+
+async def _select_merged(
+    repository: ORMRepository,
+    segments: list[AuditSegment],
+    filters: dict[str, Any],
+    live_count: int,
+) -> tuple[list[Audit], int]:
+    """
+    Return the requested page and total by merging rows of every
+    candidate segment with live rows. Used only when creation times
+    went back across segment boundaries.
+    """
+    offset, limit = filters["offset"], filters["limit"]
+    hot_audit = await repository.select_all(
+        Audit, **{**filters, "offset": 0, "limit": offset + limit},
+    )
+
+    archived_audit = []
+    for segment in segments:
+        archived_audit.extend(await _select_archived(segment, filters))
+
+    audit = sorted(
+        hot_audit + archived_audit,
+        key=lambda audit_event: _get_sort_key(
+            audit_event, filters["order_by"],
+        ),
+        reverse=filters["order"] == "desc",
+    )[offset:offset + limit]
+
+    return audit, live_count + len(archived_audit)
+
+
+def _count_archived(
+    segment: AuditSegment,
+    filters: dict[str, Any],
+) -> int | None:
+    """
+    Return the number of segment rows matching filters, or None when
+    it is not known without decoding the segment.
+    """
+    counts = count_summary(segment, filters)
+    return None if counts is None else sum(counts.values())
+
+
+async def _get_archived(
+    segment: AuditSegment,
+    filters: dict[str, Any],
+    archived_audit: dict[int, list[Audit]],
+) -> list[Audit]:
+    """
+    Return matching rows of a segment, decoding it at most once per
+    request.
+    """
+    if segment.id not in archived_audit:
+        archived_audit[segment.id] = await _select_archived(segment, filters)
+    return archived_audit[segment.id]
+
+
+async def _select_archived(
+    segment: AuditSegment,
+    filters: dict[str, Any],
+) -> list[Audit]:
+    """
+    Decode a candidate segment and return its rows matching filters.
+    """
+    try:
+        audit_events = await read_segment(
+            segment.absolute_path, segment.checksum,
+        )
+    except ValueError:
+        log.error(
+            "event=%s segment_id=%s",
+            E.AUDIT_SEGMENT_CHECKSUM_MISMATCH, segment.id,
+        )
+        raise InternalServerError()
+
+    return [
+        audit_event for audit_event in audit_events
+        if match_filters(audit_event, filters)
+    ]
+
+
+def _get_sort_key(audit_event: Audit, order_by: str) -> tuple:
+    # NULLs sort first in ascending order, matching SQLite.
+    value = getattr(audit_event, order_by)
+    return value is not None, value, audit_event.id
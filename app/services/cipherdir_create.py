@@ -14,8 +14,9 @@ from app.errors import ResourceConflictError
 from app.events import Events as E
 from app.locks import LockType, locks
 from app.repositories.file import delete, isfile, write
+from app.runtime.crypto import encrypt_passphrase
 from app.runtime.gocryptfs import init_gocryptfs, is_gocryptfs_initialized
-from app.security.encryption import encrypt_passphrase, generate_fernet_key
+from app.security.encryption import generate_fernet_key
 from app.security.randoms import generate_random_string
 
 log = logging.getLogger(__name__)
@@ -57,7 +58,7 @@ async def create_cipherdir(
             raise ResourceConflictError
 
         passphrase = generate_random_string(GOCRYPTFS_PASSPHRASE_LENGTH)
-        passphrase_encrypted = encrypt_passphrase(
+        passphrase_encrypted = await encrypt_passphrase(
             passphrase.encode("utf-8"),
             master_password.encode("utf-8"),
         )
@@ -19,28 +19,30 @@ from app.events import Events as E
 from app.hooks import hooks
 from app.locks import LockType, locks
 from app.repositories.file import isdir, isfile, ismount, mkdir, read
+from app.runtime.crypto import decrypt_passphrase
 from app.runtime.gocryptfs import (
     is_gocryptfs_initialized,
     mount_gocryptfs,
     unmount_gocryptfs,
 )
+from app.runtime.scheduler import scheduler
 from app.security.cipherdir import is_master_password_attempt_throttled
-from app.security.encryption import decrypt_passphrase
+from app.services.db_integrity_check import check_db_integrity_in_background
+from app.services.intent import replay_intents
 
 log = logging.getLogger(__name__)
 
 
-# TODO: Add garbage cleaning (removal of possible file system artifacts)
-# when cipherdir mounting.
-
 async def mount_cipherdir(
     master_password: str,
 ) -> None:
     """
     Mount the encrypted storage by decrypting the stored passphrase
     with the master password, mounting the gocryptfs filesystem,
-    ensuring the SQLite directory exists, and initializing the
-    database. If a post-mount step fails, the mount is rolled back.
+    ensuring the SQLite directory exists, initializing the database,
+    and replaying the intents of operations interrupted by a crash.
+    If a post-mount step fails, the mount is rolled back. The full
+    database integrity check continues in the background.
     """
     if await is_master_password_attempt_throttled():
         raise TooManyRequestsError
@@ -69,7 +71,7 @@ async def mount_cipherdir(
         )
 
         try:
-            passphrase_bytes = decrypt_passphrase(
+            passphrase_bytes = await decrypt_passphrase(
                 passphrase_encrypted,
                 master_password.encode("utf-8"),
             )
@@ -105,8 +107,22 @@ async def mount_cipherdir(
             if not await isdir(config.FILES_TMP_DIR):
                 await mkdir(config.FILES_TMP_DIR)
 
+            if not await isdir(config.AUDIT_ARCHIVE_DIR):
+                await mkdir(config.AUDIT_ARCHIVE_DIR)
+
+            if not await isdir(config.FILES_TRASH_DIR):
+                await mkdir(config.FILES_TRASH_DIR)
+
+            if not await isdir(config.FILES_INTENTS_DIR):
+                await mkdir(config.FILES_INTENTS_DIR)
+
+            if not await isdir(config.FILES_UPLOADS_DIR):
+                await mkdir(config.FILES_UPLOADS_DIR)
+
             await upgrade_db()
-            await check_db_integrity(config.SQLITE_PATH)
+            await check_db_integrity(config.SQLITE_PATH, quick=True)
+            await check_db_integrity(config.SQLITE_AUDIT_PATH, quick=True)
+            await replay_intents()
 
         except Exception:
             log.exception("event=%s", E.CIPHERDIR_MOUNT_FAILED)
@@ -117,5 +133,10 @@ async def mount_cipherdir(
                 log.exception("event=%s", E.CIPHERDIR_MOUNT_ROLLBACK_FAILED)
             raise
 
+        scheduler.spawn(
+            "db_integrity_check",
+            check_db_integrity_in_background(),
+        )
+
         log.info("event=%s", E.CIPHERDIR_MOUNT_COMPLETED)
         await hooks.emit(E.CIPHERDIR_MOUNT_COMPLETED)
@@ -14,9 +14,9 @@ from app.events import Events as E
 from app.hooks import hooks
 from app.locks import LockType, locks
 from app.repositories.file import isfile, read, write
+from app.runtime.crypto import decrypt_passphrase, encrypt_passphrase
 from app.runtime.gocryptfs import is_gocryptfs_initialized
 from app.security.cipherdir import is_master_password_attempt_throttled
-from app.security.encryption import decrypt_passphrase, encrypt_passphrase
 
 log = logging.getLogger(__name__)
 
@@ -53,7 +53,7 @@ async def change_cipherdir_password(
         )
 
         try:
-            passphrase = decrypt_passphrase(
+            passphrase = await decrypt_passphrase(
                 passphrase_encrypted,
                 current_master_password.encode("utf-8"),
             )
@@ -64,7 +64,7 @@ async def change_cipherdir_password(
                 input_value=OBSCURED_VALUE,
             )
 
-        passphrase_encrypted_changed = encrypt_passphrase(
+        passphrase_encrypted_changed = await encrypt_passphrase(
             passphrase,
             changed_master_password.encode("utf-8"),
         )
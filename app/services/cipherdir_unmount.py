@@ -3,7 +3,7 @@
 
 import logging
 
-from app.cache.lru import get_thumbnail_cache
+from app.cache.lru import get_revision_cache, get_thumbnail_cache
 from app.config import get_config
 from app.constants import GOCRYPTFS_CIPHERDIR_LOCK_PATH, OBSCURED_VALUE
 from app.errors import (
@@ -16,9 +16,9 @@ from app.events import Events as E
 from app.hooks import hooks
 from app.locks import LockType, locks
 from app.repositories.file import isfile, ismount, read
+from app.runtime.crypto import decrypt_passphrase
 from app.runtime.gocryptfs import is_gocryptfs_initialized, unmount_gocryptfs
 from app.security.cipherdir import is_master_password_attempt_throttled
-from app.security.encryption import decrypt_passphrase
 
 log = logging.getLogger(__name__)
 
@@ -58,7 +58,7 @@ async def unmount_cipherdir(
         )
 
         try:
-            decrypt_passphrase(
+            await decrypt_passphrase(
                 passphrase_encrypted,
                 master_password.encode("utf-8"),
             )
@@ -76,14 +76,16 @@ async def unmount_cipherdir(
         # pages and corrupt the database on the next mount. dispose()
         # prevents new writes from being issued through the old mount
         # before the encrypted filesystem is torn down.
-        from app.db.engine import engine  # noqa: PLC0415
+        from app.db.engine import audit_engine, engine  # noqa: PLC0415
         engine.sync_engine.dispose()
+        audit_engine.sync_engine.dispose()
 
         await unmount_gocryptfs(
             mountpoint=config.GOCRYPTFS_MOUNTPOINT,
         )
 
         get_thumbnail_cache().evict_all()
+        get_revision_cache().evict_all()
 
         log.info("event=%s", E.CIPHERDIR_UNMOUNT_COMPLETED)
         await hooks.emit(E.CIPHERDIR_UNMOUNT_COMPLETED)
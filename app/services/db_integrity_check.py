@@ -0,0 +1,53 @@
+# app/services/db_integrity_check.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import logging
+
+from app.config import get_config
+from app.constants import LOCKDOWN_MODE_ENABLED_FLAG_PATH
+from app.db.migrations import check_db_integrity, list_db_tables
+from app.events import Events as E
+from app.hooks import hooks
+from app.repositories.file import touch
+from app.runtime.scheduler import is_storage_available
+
+log = logging.getLogger(__name__)
+
+
+# NOTE (ADR-84): Full database integrity check runs after mount.
+# PRAGMA integrity_check reads the whole database, which keeps a large
+# database offline for minutes when it runs before the first request.
+# Mount only runs quick_check, which verifies the page structure of the
+# whole file; the full check then verifies index content in the
+# background one table at a time, so the shared lock that blocks
+# writers is released between tables. A corrupted table enables
+# lockdown mode instead of rolling back a mount already in use.
+
+async def check_db_integrity_in_background() -> None:
+    """
+    Run the full integrity check of the main database table by table.
+    Stops when the storage becomes unavailable and enables lockdown
+    mode when a table is found corrupted.
+    """
+    log.info("event=%s", E.DB_INTEGRITY_CHECK_STARTED)
+    config = get_config()
+
+    for table in await list_db_tables(config.SQLITE_PATH):
+        if not await is_storage_available():
+            log.info(
+                "event=%s table=%s", E.DB_INTEGRITY_CHECK_INTERRUPTED, table,
+            )
+            return
+
+        try:
+            await check_db_integrity(config.SQLITE_PATH, table=table)
+        except RuntimeError:
+            log.critical(
+                "event=%s table=%s", E.DB_INTEGRITY_CHECK_FAILED, table,
+                exc_info=True,
+            )
+            await touch(LOCKDOWN_MODE_ENABLED_FLAG_PATH)
+            await hooks.emit(E.DB_INTEGRITY_CHECK_FAILED)
+            return
+
+    log.info("event=%s", E.DB_INTEGRITY_CHECK_COMPLETED)
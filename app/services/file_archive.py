@@ -0,0 +1,270 @@
+# app/services/file_archive.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import AsyncIterator
+from typing import NamedTuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.audit import write_audit
+from app.constants import FILES_ARCHIVE_MAX_ITEMS
+from app.db.engine import SessionLocal
+from app.errors import ResourceConflictError, ResourceNotFoundError
+from app.events import Events as E
+from app.hooks import hooks
+from app.locks import LockType, locks
+from app.models.file import File
+from app.models.folder import Folder
+from app.repositories.archive import (
+    ArchiveEntry,
+    TarArchive,
+    ZipArchive,
+    is_compressible,
+)
+from app.repositories.file import read_range
+from app.repositories.orm import ORMRepository
+from app.schemas.file_archive import FileArchiveRequest
+
+log = logging.getLogger(__name__)
+
+
+class _Source(NamedTuple):
+    file_id: int
+    folder_id: int
+    filename: str
+    checksum: str
+    path: str
+
+
+async def archive_files(
+    session: AsyncSession,
+    params: FileArchiveRequest,
+) -> tuple[ZipArchive | TarArchive, str, str]:
+    """
+    Return an archive of a folder subtree or of the selected files,
+    its download filename, and an entity tag for resumed downloads.
+    Entries are listed up front; contents are read only while the
+    archive streams. Selected files are stored under their paths in
+    the files tree, folder contents under the folder name.
+
+    The download of every file is recorded in one audit transaction
+    before streaming starts.
+    """
+    log.info(
+        "event=%s folder_id=%s format=%s",
+        E.FILE_ARCHIVE_STARTED, params.folder_id, params.format,
+    )
+
+    repository = ORMRepository(session)
+
+    if params.folder_id is not None:
+        folder = await repository.select(Folder, obj_id=params.folder_id)
+        if folder is None:
+            log.warning("event=%s", E.FILE_ARCHIVE_NOT_FOUND)
+            raise ResourceNotFoundError
+
+        files, entries = await _list_folder(repository, folder, params)
+        basename = folder.dirname
+
+    else:
+        files, entries = await _list_files(repository, params)
+        basename = "files"
+
+    for file in files:
+        await write_audit(
+            repository=repository,
+            event=E.FILE_ARCHIVE_COMPLETED,
+            resource_type=File.__tablename__,
+            resource_id=file.id,
+        )
+    await repository.commit()
+
+    archive_cls = ZipArchive if params.format == "zip" else TarArchive
+    archive = archive_cls(entries, _read_entry)
+
+    log.info(
+        "event=%s entries_count=%s size=%s",
+        E.FILE_ARCHIVE_COMPLETED, len(entries), archive.size,
+    )
+    await hooks.emit(E.FILE_ARCHIVE_COMPLETED, session, files)
+
+    filename = f"{basename}.{archive_cls.extension}"
+    return archive, filename, _get_etag(params, entries)
+
+
+async def _list_folder(
+    repository: ORMRepository,
+    folder: Folder,
+    params: FileArchiveRequest,
+) -> tuple[list[File], list[ArchiveEntry]]:
+    """
+    Return the files of a folder subtree and the archive entries for
+    its folders and files, named relative to the folder parent.
+    """
+    subtree = await repository.select_subtree_ids(folder)
+    folder_ids = [folder_id for folder_id, _ in subtree]
+
+    files_count = await repository.count_all(File, folder_id__in=folder_ids)
+    if len(folder_ids) + files_count > FILES_ARCHIVE_MAX_ITEMS:
+        log.warning("event=%s", E.FILE_ARCHIVE_TOO_MANY_ITEMS)
+        raise ResourceConflictError
+
+    folders = {
+        item.id: item
+        for item in await repository.select_all(Folder, id__in=folder_ids)
+    }
+    parent_chain = await repository.select_parent_chain(folder)
+    base_dir = os.path.dirname(folder.get_absolute_dir(parent_chain))
+
+    # Subtree pairs are ordered by depth, so every parent path is
+    # known before its children are reached.
+
+    names = {folder.id: folder.dirname}
+    for folder_id, depth in subtree:
+        if depth > 0:
+            item = folders[folder_id]
+            names[folder_id] = f"{names[item.parent_id]}/{item.dirname}"
+
+    entries = [
+        ArchiveEntry(
+            name=names[folder_id],
+            mtime=_get_mtime(folders[folder_id]),
+            is_dir=True,
+        )
+        for folder_id in folder_ids
+    ]
+
+    files = await repository.select_all(
+        File, folder_id__in=folder_ids, order_by="id",
+    )
+    for file in files:
+        name = f"{names[file.folder_id]}/{file.filename}"
+        entries.append(_file_entry(
+            file, name, os.path.join(base_dir, name), params,
+        ))
+
+    entries.sort(key=lambda entry: entry.name)
+    return files, entries
+
+
+async def _list_files(
+    repository: ORMRepository,
+    params: FileArchiveRequest,
+) -> tuple[list[File], list[ArchiveEntry]]:
+    """
+    Return the selected files and their archive entries. A missing
+    file fails the whole request.
+    """
+    files = await repository.select_all(
+        File, id__in=params.file_ids, order_by="id",
+    )
+    if len(files) != len(params.file_ids):
+        log.warning("event=%s", E.FILE_ARCHIVE_NOT_FOUND)
+        raise ResourceNotFoundError
+
+    parent_chains = {}
+    entries = []
+
+    for file in files:
+        folder = file.file_folder
+        if folder.id not in parent_chains:
+            parent_chains[folder.id] = await repository.select_parent_chain(
+                folder,
+            )
+
+        parent_chain = parent_chains[folder.id]
+        entries.append(_file_entry(
+            file,
+            file.get_relative_path(folder, parent_chain),
+            file.get_absolute_path(folder, parent_chain),
+            params,
+        ))
+
+    entries.sort(key=lambda entry: entry.name)
+    return files, entries
+
+
+def _file_entry(
+    file: File,
+    name: str,
+    path: str,
+    params: FileArchiveRequest,
+) -> ArchiveEntry:
+    return ArchiveEntry(
+        name=name,
+        mtime=_get_mtime(file),
+        size=file.filesize,
+        deflate=(
+            params.compression == "deflate" and
+            is_compressible(file.mimetype)
+        ),
+        key=_Source(
+            file.id, file.folder_id, file.filename, file.checksum, path,
+        ),
+    )
+
+
+def _get_mtime(obj: File | Folder) -> int:
+    return obj.updated_at or obj.created_at
+
+
+def _get_etag(params: FileArchiveRequest, entries: list[ArchiveEntry]) -> str:
+    """
+    Return an entity tag that changes whenever the archive bytes would,
+    so a resumed download never mixes two archive versions.
+    """
+    payload = json.dumps([
+        params.format,
+        params.compression,
+        [
+            [
+                entry.name,
+                entry.mtime,
+                entry.size,
+                entry.deflate,
+                entry.key.checksum if entry.key else None,
+            ]
+            for entry in entries
+        ],
+    ])
+    return '"' + hashlib.sha256(payload.encode()).hexdigest()[:32] + '"'
+
+
+# NOTE (ADR-78): Archive entries are read under per-file READ locks.
+# Each file is locked only while its content streams, and the listed
+# checksum is compared with the current row under the lock, so a file
+# changed after the listing aborts the response instead of producing
+# an archive with sizes that do not match its content. The row is
+# read in its own short session, since the request session must not
+# hold the SQLite read transaction for the whole download (ADR-10).
+
+async def _read_entry(
+    entry: ArchiveEntry,
+    offset: int,
+    length: int,
+) -> AsyncIterator[bytes]:
+    source = entry.key
+
+    async with locks.lock_file(source.path, LockType.READ):
+        async with SessionLocal() as session:
+            checksums = await ORMRepository(session).select_values(
+                File,
+                "checksum",
+                id=source.file_id,
+                folder_id=source.folder_id,
+                filename=source.filename,
+            )
+
+        if checksums != [source.checksum]:
+            log.error(
+                "event=%s file_id=%s",
+                E.FILE_ARCHIVE_FILE_CHANGED, source.file_id,
+            )
+            raise ValueError("File changed since the archive was listed")
+
+        async for chunk in read_range(source.path, offset, length):
+            yield chunk
@@ -0,0 +1,69 @@
+# app/services/file_bulk.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from collections.abc import Iterator, Sequence
+from typing import TypeVar
+
+from app.constants import FILES_BULK_BATCH_SIZE
+from app.models.file import File
+from app.models.folder import Folder
+from app.repositories.orm import ORMRepository
+
+T = TypeVar("T")
+
+# NOTE (ADR-21): Commit ownership and transaction boundaries.
+# Bulk file services commit once per batch of FILES_BULK_BATCH_SIZE
+# files instead of once per file. A failed batch is rolled back and
+# reported per file; batches committed before it stay committed, so a
+# bulk request is atomic per batch, not as a whole.
+
+
+def batched(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """
+    Split a sequence into consecutive slices of at most size items.
+    """
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+async def select_files_by_ids(
+    repository: ORMRepository,
+    file_ids: Sequence[int],
+) -> dict[int, File]:
+    """
+    Return existing files keyed by ID. IDs are queried in batches to
+    stay below the SQLite bound parameter limit.
+    """
+    files = {}
+    for chunk in batched(file_ids, FILES_BULK_BATCH_SIZE):
+        for file in await repository.select_all(File, id__in=list(chunk)):
+            files[file.id] = file
+    return files
+
+
+async def select_parent_chains(
+    repository: ORMRepository,
+    folders: Sequence[Folder],
+) -> dict[int, tuple[Folder, ...]]:
+    """
+    Return the parent chain of every distinct folder keyed by folder
+    ID. Each chain is resolved once regardless of how many files share
+    the folder.
+    """
+    parent_chains = {}
+    for folder in folders:
+        if folder.id not in parent_chains:
+            parent_chains[folder.id] = await repository.select_parent_chain(
+                folder,
+            )
+    return parent_chains
+
+
+def is_folder_write_protected(
+    folder: Folder,
+    parent_chain: tuple[Folder, ...],
+) -> bool:
+    return (
+        folder.is_write_protected or
+        folder.is_write_protected_recursive(parent_chain)
+    )
@@ -0,0 +1,241 @@
+# app/services/file_bulk_delete.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.audit import write_audit
+from app.cache.lru import get_thumbnail_cache
+from app.constants import FILES_BULK_BATCH_SIZE
+from app.events import Events as E
+from app.hooks import hooks
+from app.locks import LockType, locks
+from app.models.file import File
+from app.repositories.file import delete, get_tmp_path, rename
+from app.repositories.intent import ACTION_DELETE, ACTION_RENAME, Intent
+from app.repositories.orm import ORMRepository
+from app.schemas.file_bulk import FileBulkStatus
+from app.schemas.file_bulk_delete import FileBulkDeleteRequest
+from app.services.file_bulk import (
+    batched,
+    is_folder_write_protected,
+    select_files_by_ids,
+    select_parent_chains,
+)
+from app.services.intent import begin_intent, end_intent
+
+log = logging.getLogger(__name__)
+
+
+async def delete_files(
+    session: AsyncSession,
+    data: FileBulkDeleteRequest,
+) -> dict[int, FileBulkStatus]:
+    """
+    Delete several files together with their thumbnails and revisions.
+    Files are processed in batches: each batch locks its folders once,
+    moves the primary files to temporary locations, and commits all
+    database changes in one transaction. A failed batch restores its
+    files. Filesystem artifacts are removed after each commit. Returns
+    per-file statuses in request order.
+    """
+    log.info(
+        "event=%s files_count=%s",
+        E.FILE_BULK_DELETE_STARTED, len(data.file_ids),
+    )
+
+    repository = ORMRepository(session)
+    statuses = {}
+
+    for file_ids in batched(data.file_ids, FILES_BULK_BATCH_SIZE):
+        statuses.update(await _delete_batch(repository, file_ids))
+
+    statuses = {file_id: statuses[file_id] for file_id in data.file_ids}
+
+    log.info("event=%s", E.FILE_BULK_DELETE_COMPLETED)
+    await hooks.emit(E.FILE_BULK_DELETE_COMPLETED, session, statuses)
+
+    return statuses
+
+
+async def _delete_batch(
+    repository: ORMRepository,
+    file_ids: Sequence[int],
+) -> dict[int, FileBulkStatus]:
+    files = await select_files_by_ids(repository, file_ids)
+    statuses = {
+        file_id: FileBulkStatus.NOT_FOUND
+        for file_id in file_ids if file_id not in files
+    }
+
+    parent_chains = await select_parent_chains(
+        repository,
+        [file.file_folder for file in files.values()],
+    )
+
+    lock_dirs = set()
+    candidates = []
+
+    for file in files.values():
+        folder = file.file_folder
+        parent_chain = parent_chains[folder.id]
+
+        if is_folder_write_protected(folder, parent_chain):
+            statuses[file.id] = FileBulkStatus.LOCKED
+            continue
+
+        lock_dirs.add(folder.get_absolute_dir(parent_chain))
+        candidates.append((file, file.get_absolute_path(folder, parent_chain)))
+
+    if not candidates:
+        return statuses
+
+    async with locks.lock_many(LockType.WRITE, dir_paths=tuple(lock_dirs)):
+        planned = [
+            _PlannedDelete(
+                file=file,
+                file_path=file_path,
+                tmp_path=get_tmp_path(),
+                artifact_paths=_get_artifact_paths(file),
+            )
+            for file, file_path in candidates
+        ]
+        intent = _build_intent(planned)
+
+        try:
+            await begin_intent(intent)
+
+        except Exception:
+            log.exception("event=%s", E.FILE_BULK_DELETE_BATCH_FAILED)
+            await end_intent(intent)
+            for file, _ in candidates:
+                statuses[file.id] = FileBulkStatus.FAILED
+            return statuses
+
+        try:
+            await _delete_planned(repository, planned, intent, statuses)
+        finally:
+            await end_intent(intent)
+
+    return statuses
+
+
+async def _delete_planned(
+    repository: ORMRepository,
+    planned: list["_PlannedDelete"],
+    intent: Intent,
+    statuses: dict[int, FileBulkStatus],
+) -> None:
+    moved = []
+
+    for entry in planned:
+        file = entry.file
+
+        try:
+            await rename(entry.file_path, entry.tmp_path)
+        except Exception:
+            log.exception(
+                "event=%s file_id=%s",
+                E.FILE_BULK_DELETE_ITEM_FAILED, file.id,
+            )
+            statuses[file.id] = FileBulkStatus.FAILED
+            continue
+
+        moved.append(entry)
+
+        if file.file_thumbnail is not None:
+            await repository.delete(file.file_thumbnail, flush=False)
+
+        for revision in file.file_revisions:
+            await repository.delete(revision, flush=False)
+
+        await repository.delete(file, flush=False)
+        file.file_folder.files_count -= 1
+
+        await write_audit(
+            repository=repository,
+            event=E.FILE_DELETE_COMPLETED,
+            resource_type=File.__tablename__,
+            resource_id=file.id,
+        )
+
+    if not moved:
+        return
+
+    moved_ids = [entry.file.id for entry in moved]
+
+    try:
+        # Re-journal the batch with the moved files only, so that the
+        # commit marker is a row this transaction actually deletes.
+        journaled = _build_intent(moved)
+        journaled.intent_id = intent.intent_id
+        await begin_intent(journaled)
+
+        await repository.flush()
+        await repository.commit()
+
+    except Exception:
+        log.exception("event=%s", E.FILE_BULK_DELETE_BATCH_FAILED)
+        await repository.rollback()
+
+        for file_id, entry in zip(moved_ids, moved):
+            statuses[file_id] = FileBulkStatus.FAILED
+            try:
+                await rename(entry.tmp_path, entry.file_path)
+            except Exception:
+                log.exception(
+                    "event=%s file_id=%s",
+                    E.FILE_BULK_DELETE_RESTORE_FAILED, file_id,
+                )
+
+        return
+
+    cache = get_thumbnail_cache()
+    for file_id in moved_ids:
+        statuses[file_id] = FileBulkStatus.OK
+        cache.evict(file_id)
+
+    for entry in moved:
+        for path in (*entry.artifact_paths, entry.tmp_path):
+            try:
+                await delete(path)
+            except Exception:
+                log.exception(
+                    "event=%s", E.FILE_BULK_DELETE_CLEANUP_FAILED,
+                )
+
+
+@dataclass(frozen=True)
+class _PlannedDelete:
+    file: File
+    file_path: str
+    tmp_path: str
+    artifact_paths: list[str]
+
+
+def _get_artifact_paths(file: File) -> list[str]:
+    paths = [revision.absolute_path for revision in file.file_revisions]
+    if file.file_thumbnail is not None:
+        paths.insert(0, file.file_thumbnail.absolute_path)
+    return paths
+
+
+def _build_intent(entries: list[_PlannedDelete]) -> Intent:
+    return Intent(
+        operation="file_bulk_delete",
+        table=File.__tablename__,
+        filters={"id": entries[0].file.id},
+        committed_if_present=False,
+        on_commit=[
+            (ACTION_DELETE, path)
+            for entry in entries
+            for path in (*entry.artifact_paths, entry.tmp_path)
+        ],
+        on_rollback=[
+            (ACTION_RENAME, entry.tmp_path, entry.file_path)
+            for entry in entries
+        ],
+    )
@@ -0,0 +1,288 @@
+# app/services/file_bulk_move.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import logging
+from collections.abc import Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.audit import write_audit
+from app.constants import FILES_BULK_BATCH_SIZE, FILES_MAX_PATH_LENGTH_BYTES
+from app.errors import ResourceLockedError, ResourceNotFoundError
+from app.events import Events as E
+from app.hooks import hooks
+from app.locks import LockType, locks
+from app.models.file import File
+from app.models.folder import Folder
+from app.models.user import User
+from app.repositories.file import isdir, isfile, rename
+from app.repositories.intent import ACTION_RENAME, Intent
+from app.repositories.orm import ORMRepository
+from app.schemas.file_bulk import FileBulkStatus
+from app.schemas.file_bulk_move import FileBulkMoveRequest
+from app.services.file_bulk import (
+    batched,
+    is_folder_write_protected,
+    select_files_by_ids,
+    select_parent_chains,
+)
+from app.services.intent import begin_intent, end_intent
+
+log = logging.getLogger(__name__)
+
+
+async def move_files(
+    session: AsyncSession,
+    user: User,
+    data: FileBulkMoveRequest,
+) -> dict[int, FileBulkStatus]:
+    """
+    Move several files to another folder. Files are processed in
+    batches: each batch locks its source folders and the destination
+    folder once, renames the files, and commits all database changes in
+    one transaction. Renames of a failed batch are reverted. Returns
+    per-file statuses in request order.
+    """
+    log.info(
+        "event=%s files_count=%s folder_id=%s",
+        E.FILE_BULK_MOVE_STARTED, len(data.file_ids), data.folder_id,
+    )
+
+    repository = ORMRepository(session)
+    destination_folder = await repository.select(
+        Folder,
+        obj_id=data.folder_id,
+    )
+
+    if destination_folder is None:
+        log.warning("event=%s", E.FILE_BULK_MOVE_FOLDER_NOT_FOUND)
+        raise ResourceNotFoundError
+
+    destination_parent_chain = await repository.select_parent_chain(
+        destination_folder,
+    )
+
+    if is_folder_write_protected(
+        destination_folder, destination_parent_chain,
+    ):
+        log.warning("event=%s", E.FILE_BULK_MOVE_DESTINATION_WRITE_PROTECTED)
+        raise ResourceLockedError
+
+    statuses = {}
+
+    for file_ids in batched(data.file_ids, FILES_BULK_BATCH_SIZE):
+        statuses.update(
+            await _move_batch(repository, user, file_ids, data.folder_id),
+        )
+
+    statuses = {file_id: statuses[file_id] for file_id in data.file_ids}
+
+    log.info("event=%s", E.FILE_BULK_MOVE_COMPLETED)
+    await hooks.emit(E.FILE_BULK_MOVE_COMPLETED, session, statuses)
+
+    return statuses
+
+
+async def _move_batch(
+    repository: ORMRepository,
+    user: User,
+    file_ids: Sequence[int],
+    folder_id: int,
+) -> dict[int, FileBulkStatus]:
+    # State is reloaded for every batch: a rolled back batch expires
+    # all objects loaded before it.
+    destination_folder = await repository.select(Folder, obj_id=folder_id)
+    files = await select_files_by_ids(repository, file_ids)
+    statuses = {
+        file_id: FileBulkStatus.NOT_FOUND
+        for file_id in file_ids if file_id not in files
+    }
+
+    if destination_folder is None:
+        return {
+            **statuses,
+            **{file_id: FileBulkStatus.FAILED for file_id in files},
+        }
+
+    parent_chains = await select_parent_chains(
+        repository,
+        [destination_folder, *(file.file_folder for file in files.values())],
+    )
+
+    destination_dir = destination_folder.get_absolute_dir(
+        parent_chains[destination_folder.id],
+    )
+    lock_dirs = {destination_dir}
+    candidates = []
+
+    for file in files.values():
+        source_folder = file.file_folder
+        source_parent_chain = parent_chains[source_folder.id]
+
+        if source_folder.id == destination_folder.id:
+            statuses[file.id] = FileBulkStatus.OK
+            continue
+
+        if is_folder_write_protected(source_folder, source_parent_chain):
+            statuses[file.id] = FileBulkStatus.LOCKED
+            continue
+
+        source_path = file.get_absolute_path(
+            source_folder,
+            source_parent_chain,
+        )
+        destination_path = file.get_absolute_path(
+            destination_folder,
+            parent_chains[destination_folder.id],
+        )
+
+        if len(destination_path.encode("utf-8")) > FILES_MAX_PATH_LENGTH_BYTES:
+            statuses[file.id] = FileBulkStatus.CONFLICT
+            continue
+
+        lock_dirs.add(source_folder.get_absolute_dir(source_parent_chain))
+        candidates.append((file, source_path, destination_path))
+
+    if not candidates:
+        return statuses
+
+    async with locks.lock_many(LockType.WRITE, dir_paths=tuple(lock_dirs)):
+        taken_filenames = {
+            existing_file.filename
+            for existing_file in await repository.select_all(
+                File,
+                folder_id=destination_folder.id,
+                filename__in=[file.filename for file, _, _ in candidates],
+            )
+        }
+
+        # Conflicts are settled before journaling, so the intent never
+        # lists a destination that belongs to another file.
+        planned = []
+
+        for file, source_path, destination_path in candidates:
+            if (
+                file.filename in taken_filenames
+                or await isdir(destination_path)
+                or await isfile(destination_path)
+            ):
+                statuses[file.id] = FileBulkStatus.CONFLICT
+                continue
+
+            planned.append((file, source_path, destination_path))
+            taken_filenames.add(file.filename)
+
+        if not planned:
+            return statuses
+
+        intent = _build_intent(planned, destination_folder.id)
+
+        try:
+            await begin_intent(intent)
+
+        except Exception:
+            log.exception("event=%s", E.FILE_BULK_MOVE_BATCH_FAILED)
+            await end_intent(intent)
+            for file, _, _ in planned:
+                statuses[file.id] = FileBulkStatus.FAILED
+            return statuses
+
+        try:
+            await _move_planned(
+                repository, user, destination_folder,
+                planned, intent, statuses,
+            )
+        finally:
+            await end_intent(intent)
+
+    return statuses
+
+
+async def _move_planned(
+    repository: ORMRepository,
+    user: User,
+    destination_folder: Folder,
+    planned: list[tuple[File, str, str]],
+    intent: Intent,
+    statuses: dict[int, FileBulkStatus],
+) -> None:
+    moved = []
+
+    for file, source_path, destination_path in planned:
+        try:
+            await rename(source_path, destination_path)
+        except Exception:
+            log.exception(
+                "event=%s file_id=%s",
+                E.FILE_BULK_MOVE_ITEM_FAILED, file.id,
+            )
+            statuses[file.id] = FileBulkStatus.FAILED
+            continue
+
+        moved.append((file, source_path, destination_path))
+
+        file.file_folder.files_count -= 1
+        destination_folder.files_count += 1
+        file.folder_id = destination_folder.id
+        file.updated_by = user.id
+
+        await write_audit(
+            repository=repository,
+            event=E.FILE_MOVE_COMPLETED,
+            resource_type=File.__tablename__,
+            resource_id=file.id,
+        )
+
+    if not moved:
+        return
+
+    moved_ids = [file.id for file, _, _ in moved]
+
+    try:
+        # Re-journal the batch with the moved files only, so that the
+        # commit marker is a row this transaction actually updates.
+        journaled = _build_intent(moved, destination_folder.id)
+        journaled.intent_id = intent.intent_id
+        await begin_intent(journaled)
+
+        await repository.flush()
+        await repository.commit()
+
+    except Exception:
+        log.exception("event=%s", E.FILE_BULK_MOVE_BATCH_FAILED)
+        await repository.rollback()
+
+        for file_id, (_, source_path, destination_path) in zip(
+            moved_ids, moved,
+        ):
+            statuses[file_id] = FileBulkStatus.FAILED
+            try:
+                await rename(destination_path, source_path)
+            except Exception:
+                log.exception(
+                    "event=%s file_id=%s",
+                    E.FILE_BULK_MOVE_RESTORE_FAILED, file_id,
+                )
+
+        return
+
+    for file_id in moved_ids:
+        statuses[file_id] = FileBulkStatus.OK
+
+
+def _build_intent(
+    entries: list[tuple[File, str, str]],
+    destination_folder_id: int,
+) -> Intent:
+    return Intent(
+        operation="file_bulk_move",
+        table=File.__tablename__,
+        filters={
+            "id": entries[0][0].id,
+            "folder_id": destination_folder_id,
+        },
+        on_rollback=[
+            (ACTION_RENAME, destination_path, source_path)
+            for _, source_path, destination_path in entries
+        ],
+    )
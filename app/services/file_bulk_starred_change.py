@@ -0,0 +1,91 @@
+# app/services/file_bulk_starred_change.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import logging
+from collections.abc import Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.audit import write_audit
+from app.constants import FILES_BULK_BATCH_SIZE
+from app.events import Events as E
+from app.hooks import hooks
+from app.models.file import File
+from app.models.user import User
+from app.repositories.orm import ORMRepository
+from app.schemas.file_bulk import FileBulkStatus
+from app.schemas.file_bulk_starred_change import FileBulkStarredChangeRequest
+from app.services.file_bulk import batched, select_files_by_ids
+
+log = logging.getLogger(__name__)
+
+
+async def change_files_starred(
+    session: AsyncSession,
+    user: User,
+    data: FileBulkStarredChangeRequest,
+) -> dict[int, FileBulkStatus]:
+    """
+    Change the starred flag for several files, committing once per
+    batch. Returns per-file statuses in request order.
+    """
+    log.info(
+        "event=%s files_count=%s",
+        E.FILE_BULK_STARRED_CHANGE_STARTED, len(data.file_ids),
+    )
+
+    repository = ORMRepository(session)
+    statuses = {}
+
+    for file_ids in batched(data.file_ids, FILES_BULK_BATCH_SIZE):
+        statuses.update(
+            await _change_batch(repository, user, file_ids, data),
+        )
+
+    statuses = {file_id: statuses[file_id] for file_id in data.file_ids}
+
+    log.info("event=%s", E.FILE_BULK_STARRED_CHANGE_COMPLETED)
+    await hooks.emit(E.FILE_BULK_STARRED_CHANGE_COMPLETED, session, statuses)
+
+    return statuses
+
+
+async def _change_batch(
+    repository: ORMRepository,
+    user: User,
+    file_ids: Sequence[int],
+    data: FileBulkStarredChangeRequest,
+) -> dict[int, FileBulkStatus]:
+    files = await select_files_by_ids(repository, file_ids)
+    statuses = {
+        file_id: FileBulkStatus.NOT_FOUND
+        for file_id in file_ids if file_id not in files
+    }
+
+    for file in files.values():
+        file.is_starred = data.is_starred
+        file.updated_by = user.id
+
+        await write_audit(
+            repository=repository,
+            event=E.FILE_STARRED_CHANGE_COMPLETED,
+            resource_type=File.__tablename__,
+            resource_id=file.id,
+        )
+
+    try:
+        await repository.flush()
+        await repository.commit()
+
+    except Exception:
+        log.exception("event=%s", E.FILE_BULK_STARRED_CHANGE_BATCH_FAILED)
+        await repository.rollback()
+        return {
+            **statuses,
+            **{file_id: FileBulkStatus.FAILED for file_id in files},
+        }
+
+    return {
+        **statuses,
+        **{file_id: FileBulkStatus.OK for file_id in files},
+    }
@@ -0,0 +1,132 @@
+# app/services/file_bulk_tag_add.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import logging
+from collections.abc import Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.audit import write_audit
+from app.constants import FILES_BULK_BATCH_SIZE
+from app.events import Events as E
+from app.hooks import hooks
+from app.models.file_tag import FileTag
+from app.models.user import User
+from app.repositories.orm import ORMRepository
+from app.schemas.file_bulk import FileBulkStatus
+from app.schemas.file_bulk_tag_add import FileBulkTagAddRequest
+from app.services.file_bulk import (
+    batched,
+    is_folder_write_protected,
+    select_files_by_ids,
+    select_parent_chains,
+)
+
+log = logging.getLogger(__name__)
+
+
+async def add_files_tag(
+    session: AsyncSession,
+    user: User,
+    data: FileBulkTagAddRequest,
+) -> dict[int, FileBulkStatus]:
+    """
+    Add a tag to several files, committing once per batch. Files that
+    already have the tag are reported as ok without a new row. Files
+    in write-protected folders are skipped. Returns per-file statuses
+    in request order.
+    """
+    log.info(
+        "event=%s files_count=%s",
+        E.FILE_BULK_TAG_ADD_STARTED, len(data.file_ids),
+    )
+
+    repository = ORMRepository(session)
+    statuses = {}
+
+    for file_ids in batched(data.file_ids, FILES_BULK_BATCH_SIZE):
+        statuses.update(
+            await _add_batch(repository, user, file_ids, data),
+        )
+
+    statuses = {file_id: statuses[file_id] for file_id in data.file_ids}
+
+    log.info("event=%s", E.FILE_BULK_TAG_ADD_COMPLETED)
+    await hooks.emit(E.FILE_BULK_TAG_ADD_COMPLETED, session, statuses)
+
+    return statuses
+
+
+async def _add_batch(
+    repository: ORMRepository,
+    user: User,
+    file_ids: Sequence[int],
+    data: FileBulkTagAddRequest,
+) -> dict[int, FileBulkStatus]:
+    files = await select_files_by_ids(repository, file_ids)
+    statuses = {
+        file_id: FileBulkStatus.NOT_FOUND
+        for file_id in file_ids if file_id not in files
+    }
+
+    parent_chains = await select_parent_chains(
+        repository,
+        [file.file_folder for file in files.values()],
+    )
+
+    candidates = []
+    for file in files.values():
+        if is_folder_write_protected(
+            file.file_folder, parent_chains[file.folder_id],
+        ):
+            statuses[file.id] = FileBulkStatus.LOCKED
+        else:
+            candidates.append(file)
+
+    tagged_file_ids = {
+        tag.file_id for tag in await repository.select_all(
+            FileTag,
+            file_id__in=[file.id for file in candidates],
+            tag=data.tag,
+        )
+    } if candidates else set()
+
+    tags = []
+    for file in candidates:
+        if file.id in tagged_file_ids:
+            statuses[file.id] = FileBulkStatus.OK
+            continue
+
+        tag = FileTag(file_id=file.id, created_by=user.id, tag=data.tag)
+        await repository.insert(tag, flush=False)
+        tags.append(tag)
+
+    if not tags:
+        return statuses
+
+    tag_file_ids = [tag.file_id for tag in tags]
+
+    try:
+        await repository.flush()
+
+        for tag in tags:
+            await write_audit(
+                repository=repository,
+                event=E.TAG_ADD_COMPLETED,
+                resource_type=FileTag.__tablename__,
+                resource_id=tag.id,
+            )
+        await repository.commit()
+
+    except Exception:
+        log.exception("event=%s", E.FILE_BULK_TAG_ADD_BATCH_FAILED)
+        await repository.rollback()
+        return {
+            **statuses,
+            **{file_id: FileBulkStatus.FAILED for file_id in tag_file_ids},
+        }
+
+    return {
+        **statuses,
+        **{file_id: FileBulkStatus.OK for file_id in tag_file_ids},
+    }
@@ -15,7 +15,9 @@ from app.models.file import File
 from app.models.file_revision import FileRevision
 from app.models.file_thumbnail import FileThumbnail
 from app.repositories.file import delete, get_tmp_path, rename
+from app.repositories.intent import ACTION_DELETE, ACTION_RENAME, Intent
 from app.repositories.orm import ORMRepository
+from app.services.intent import begin_intent, end_intent
 
 log = logging.getLogger(__name__)
 
@@ -68,7 +70,27 @@ async def delete_file(
             file_id=file.id,
         )
 
+        # Blobs are listed in the intent so that a crash after commit
+        # still removes them on the next mount.
+        artifact_paths = [revision.absolute_path for revision in revisions]
+        if thumbnail is not None:
+            artifact_paths.append(thumbnail.absolute_path)
+
+        intent = Intent(
+            operation="file_delete",
+            table=File.__tablename__,
+            filters={"id": file.id},
+            committed_if_present=False,
+            on_commit=[
+                (ACTION_DELETE, path)
+                for path in (tmp_path, *artifact_paths)
+            ],
+            on_rollback=[(ACTION_RENAME, tmp_path, file_path)],
+        )
+
         try:
+            await begin_intent(intent)
+
             await rename(file_path, tmp_path)
             file_moved = True
 
@@ -112,22 +134,26 @@ async def delete_file(
 
             raise
 
-        try:
-            await delete(tmp_path)
-        except Exception:
-            log.exception("event=%s", E.FILE_DELETE_CLEANUP_TMP_FAILED)
-
-        if thumbnail is not None:
+        else:
             try:
-                await delete(thumbnail.absolute_path)
+                await delete(tmp_path)
             except Exception:
-                log.exception("event=%s", E.FILE_DELETE_CLEANUP_THUMBNAIL_FAILED)  # noqa: E501
+                log.exception("event=%s", E.FILE_DELETE_CLEANUP_TMP_FAILED)
 
-        for revision in revisions:
-            try:
-                await delete(revision.absolute_path)
-            except Exception:
-                log.exception("event=%s", E.FILE_DELETE_CLEANUP_REVISION_FAILED)  # noqa: E501
+            if thumbnail is not None:
+                try:
+                    await delete(thumbnail.absolute_path)
+                except Exception:
+                    log.exception("event=%s", E.FILE_DELETE_CLEANUP_THUMBNAIL_FAILED)  # noqa: E501
+
+            for revision in revisions:
+                try:
+                    await delete(revision.absolute_path)
+                except Exception:
+                    log.exception("event=%s", E.FILE_DELETE_CLEANUP_REVISION_FAILED)  # noqa: E501
+
+        finally:
+            await end_intent(intent)
 
     log.info("event=%s", E.FILE_DELETE_COMPLETED)
     await hooks.emit(E.FILE_DELETE_COMPLETED, session, file)
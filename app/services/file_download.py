@@ -9,10 +9,12 @@ from app.audit import write_audit
 from app.errors import ResourceNotFoundError
 from app.events import Events as E
 from app.hooks import hooks
+from app.locks import LockType, locks
 from app.models.file import File
 from app.models.file_revision import FileRevision
 from app.repositories.file import isfile
 from app.repositories.orm import ORMRepository
+from app.services.revision_content import reconstruct_revision
 
 log = logging.getLogger(__name__)
 
@@ -27,15 +29,17 @@ async def download_file(
     session: AsyncSession,
     file_id: int,
     revision_number: int,
-) -> tuple[File | FileRevision, str]:
+) -> tuple[File | FileRevision, str | bytes]:
     """
-    Return metadata and absolute path for download.
+    Return metadata and absolute path for download, or the content
+    itself for a revision stored as a delta (ADR-76), which is rebuilt
+    under a READ lock on the current file.
 
     revision_number=0 refers to the HEAD (the current file content).
     revision_number>=1 refers to a historical FileRevision record.
 
     Missing database records or missing filesystem files are treated as
-    not found.
+    not found, as are delta revisions that cannot be rebuilt.
     """
     log.info(
         "event=%s file_id=%s revision_number=%s",
@@ -73,6 +77,10 @@ async def download_file(
         log.warning("event=%s", E.FILE_DOWNLOAD_NOT_FOUND)
         raise ResourceNotFoundError
 
+    content = file_path
+    if resource is not file and resource.is_delta:
+        content = await _reconstruct(repository, file, resource)
+
     log.info("event=%s", E.FILE_DOWNLOAD_COMPLETED)
 
     await write_audit(
@@ -85,4 +93,25 @@ async def download_file(
 
     await hooks.emit(E.FILE_DOWNLOAD_COMPLETED, session, file)
 
-    return resource, file_path
+    return resource, content
+
+
+async def _reconstruct(
+    repository: ORMRepository,
+    file: File,
+    revision: FileRevision,
+) -> bytes:
+    parent_chain = await repository.select_parent_chain(file.file_folder)
+    head_path = file.get_absolute_path(file.file_folder, parent_chain)
+
+    async with locks.lock_file(head_path, LockType.READ):
+        try:
+            return await reconstruct_revision(file, revision, head_path)
+
+        except (OSError, ValueError):
+            log.exception(
+                "event=%s revision_id=%s",
+                E.FILE_DOWNLOAD_REVISION_CORRUPTED,
+                revision.id,
+            )
+            raise ResourceNotFoundError
@@ -4,6 +4,7 @@
 import asyncio
 import logging
 import uuid
+from collections.abc import Awaitable, Callable
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,6 +13,7 @@ from app.errors import (
     ResourceConflictError,
     ResourceLockedError,
     ResourceNotFoundError,
+    ValueInvalidError,
 )
 from app.events import Events as E
 from app.hooks import hooks
@@ -20,6 +22,7 @@ from app.models.file import File
 from app.models.file_revision import FileRevision
 from app.models.user import User
 from app.repositories.file import (
+    apply_patches,
     copy,
     delete,
     get_checksum,
@@ -28,8 +31,15 @@ from app.repositories.file import (
     isdir,
     isfile,
 )
+from app.repositories.intent import ACTION_COPY, ACTION_DELETE, Intent
 from app.repositories.orm import ORMRepository
 from app.schemas.file_edit import FileEditRequest
+from app.schemas.file_patch import FilePatchRequest
+from app.services.intent import begin_intent, end_intent
+from app.services.revision_content import (
+    is_delta_due,
+    write_revision_delta,
+)
 
 log = logging.getLogger(__name__)
 
@@ -41,11 +51,60 @@ async def edit_file(
     data: FileEditRequest,
 ) -> File:
     """
-    Edit a text file and create a new revision.
+    Replace the content of a text file and create a new revision.
+    """
+    async def write_content(tmp_path: str, file_path: str) -> None:
+        await _write_text(tmp_path, data.content)
+
+    return await _edit_file(session, user, file_id, write_content)
+
+
+async def patch_file(
+    session: AsyncSession,
+    user: User,
+    file_id: int,
+    data: FilePatchRequest,
+) -> File:
+    """
+    Replace ranges of a text file and create a new revision. The edit
+    is rejected with a conflict if the file content no longer matches
+    the base checksum, and as invalid if a range exceeds the file.
+    """
+    patches = [
+        (patch.start, patch.end, patch.content.encode("utf-8"))
+        for patch in data.patches
+    ]
+
+    async def write_content(tmp_path: str, file_path: str) -> None:
+        try:
+            await apply_patches(
+                file_path, tmp_path, patches, by_line=data.unit == "line",
+            )
+        except ValueError:
+            log.warning("event=%s", E.FILE_EDIT_PATCH_INVALID)
+            raise ValueInvalidError(field="patches")
+
+    return await _edit_file(
+        session, user, file_id, write_content, data.base_checksum,
+    )
+
+
+async def _edit_file(
+    session: AsyncSession,
+    user: User,
+    file_id: int,
+    write_content: Callable[[str, str], Awaitable[None]],
+    base_checksum: str | None = None,
+) -> File:
+    """
+    Apply an edit to a text file under its WRITE lock.
 
     The database is the source of truth. New content is first written
-    to a temporary file. The previous current file is copied into the
-    revisions storage before the main file is replaced.
+    to a temporary file by write_content(tmp_path, file_path). The
+    previous current file is stored in the revisions storage, as a
+    full copy or as a delta against the new content, before the main
+    file is replaced. If base_checksum is given, it is compared with
+    the current checksum under the file WRITE lock.
     """
     log.info("event=%s file_id=%s", E.FILE_EDIT_STARTED, file_id)
 
@@ -81,25 +140,41 @@ async def edit_file(
             log.warning("event=%s", E.FILE_EDIT_INCONSISTENT)
             raise ResourceConflictError
 
+        # The file row was read before the lock, so the checksum is
+        # reselected; a stale row is rejected like a changed base.
+        if base_checksum is not None and (
+            file.checksum != base_checksum
+            or await repository.select_values(
+                File, "checksum", id=file.id,
+            ) != [base_checksum]
+        ):
+            log.warning("event=%s", E.FILE_EDIT_BASE_CHANGED)
+            raise ResourceConflictError
+
         tmp_path = get_tmp_path()
         restore_source_path = None
+        delta_path = None
         file_replaced = False
 
         try:
-            await _write_text(tmp_path, data.content)
+            await write_content(tmp_path, file_path)
             new_filesize = await get_filesize(tmp_path)
             new_checksum = await get_checksum(tmp_path)
 
+        except ValueInvalidError:
+            await _cleanup_path(tmp_path)
+            raise
+
         except Exception:
             log.warning("event=%s", E.FILE_EDIT_WRITE_FAILED)
             await _cleanup_path(tmp_path)
             raise ResourceConflictError
 
+        intent = None
+
         try:
-            latest_revision_number = await repository.count_all(
-                FileRevision,
-                file_id=file.id,
-            ) + 1
+            latest_revision_number = file.latest_revision_number + 1
+            is_delta = await is_delta_due(repository, file, new_filesize)
 
             revision = FileRevision(
                 file_id=file.id,
@@ -110,10 +185,39 @@ async def edit_file(
                 filesize=file.filesize,
                 mimetype=file.mimetype,
                 checksum=file.checksum,
+                is_delta=is_delta,
             )
 
-            await copy(file_path, revision.absolute_path)
-            restore_source_path = revision.absolute_path
+            # A delta revision cannot restore the file by itself, so a
+            # full copy of the current content is kept until commit.
+            backup_path = get_tmp_path() if is_delta else None
+            restore_path = backup_path or revision.absolute_path
+
+            intent = Intent(
+                operation="file_edit",
+                table=FileRevision.__tablename__,
+                filters={"revision_uuid": revision.revision_uuid},
+                on_commit=[
+                    (ACTION_DELETE, path)
+                    for path in (tmp_path, backup_path) if path
+                ],
+                on_rollback=[
+                    (ACTION_COPY, restore_path, file_path),
+                    (ACTION_DELETE, revision.absolute_path),
+                    *[
+                        (ACTION_DELETE, path)
+                        for path in (backup_path, tmp_path) if path
+                    ],
+                ],
+            )
+            await begin_intent(intent)
+
+            await copy(file_path, restore_path)
+            restore_source_path = restore_path
+
+            if is_delta:
+                delta_path = revision.absolute_path
+                await write_revision_delta(file_path, tmp_path, delta_path)
 
             await repository.insert(revision)
 
@@ -138,11 +242,14 @@ async def edit_file(
             )
             await repository.commit()
 
+            if delta_path is not None:
+                await _cleanup_path(restore_source_path)
             restore_source_path = None
 
         except Exception:
             await repository.rollback()
             await _cleanup_path(tmp_path)
+            await _cleanup_path(delta_path)
 
             if restore_source_path is not None:
                 if file_replaced:
@@ -157,6 +264,9 @@ async def edit_file(
 
             raise
 
+        finally:
+            await end_intent(intent)
+
     log.info("event=%s", E.FILE_EDIT_COMPLETED)
     await hooks.emit(E.FILE_EDIT_COMPLETED, session, file)
 
@@ -0,0 +1,613 @@
+# app/services/file_import.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import logging
+from collections.abc import AsyncIterable, Sequence
+from pathlib import PurePosixPath
+from typing import NamedTuple
+
+from pydantic_core import PydanticCustomError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.audit import write_audit
+from app.config import get_config
+from app.constants import (
+    FILES_ARCHIVE_MAX_ITEMS,
+    FILES_BULK_BATCH_SIZE,
+    FILES_MAX_FOLDER_DEPTH,
+    FILES_MAX_PATH_LENGTH_BYTES,
+    UPLOAD_ADMISSION_STORAGE_RETRY_AFTER_SECONDS,
+)
+from app.errors import (
+    InsufficientStorageError,
+    ResourceConflictError,
+    ResourceLockedError,
+    ResourceNotFoundError,
+    ValueInvalidError,
+)
+from app.events import Events as E
+from app.hooks import hooks
+from app.locks import LockType, locks
+from app.models.file import File
+from app.models.folder import Folder
+from app.models.user import User
+from app.repositories.archive import ArchiveReader
+from app.repositories.file import (
+    delete,
+    get_checksum,
+    get_filesize,
+    get_free_bytes,
+    get_mimetype,
+    get_tmp_path,
+    isdir,
+    isfile,
+    mkdir,
+    rename,
+    rmdir,
+    write_stream,
+)
+from app.repositories.intent import ACTION_DELETE, ACTION_RMDIR, Intent
+from app.repositories.orm import ORMRepository
+from app.schemas.file_import import FileImportResult, FileImportStatus
+from app.services.file_bulk import batched, is_folder_write_protected
+from app.services.intent import begin_intent, end_intent
+from app.validators.path_segment import validate_path_segment
+
+log = logging.getLogger(__name__)
+
+_SEGMENT_MAX_LENGTH = 255
+
+# NOTE (ADR-79): Archive import commits per batch under one subtree lock.
+# The request body is spooled to the encrypted tmp area and entries are
+# extracted from it one at a time, so neither the archive nor an entry
+# is held in memory. The target folder directory is WRITE-locked for
+# the whole import; entries are committed in batches of
+# FILES_BULK_BATCH_SIZE like bulk services (ADR-21), each batch
+# journaled as one intent (ADR-73). Thumbnails are not generated inline;
+# the background thumbnail job picks imported images up. Admission only
+# sees the compressed body, so the declared sizes of the entries are
+# checked against FILES_IMPORT_MAX_EXTRACTED_BYTES and free space before
+# extraction, and no entry is extracted past its declared size.
+
+
+async def import_archive(
+    session: AsyncSession,
+    user: User,
+    folder_id: int,
+    data: AsyncIterable[bytes],
+) -> list[FileImportResult]:
+    """
+    Expand a zip or tar archive stream into an existing folder. Folders
+    of the archive are created or reused and files are created; existing
+    files are never overwritten. Returns per-entry results in archive
+    order.
+    """
+    log.info("event=%s folder_id=%s", E.FILE_IMPORT_STARTED, folder_id)
+
+    repository = ORMRepository(session)
+    folder = await repository.select(Folder, obj_id=folder_id)
+
+    if folder is None:
+        log.warning("event=%s", E.FILE_IMPORT_FOLDER_NOT_FOUND)
+        raise ResourceNotFoundError
+
+    parent_chain = await repository.select_parent_chain(folder)
+
+    if is_folder_write_protected(folder, parent_chain):
+        log.warning("event=%s", E.FILE_IMPORT_FOLDER_WRITE_PROTECTED)
+        raise ResourceLockedError
+
+    target_dir = folder.get_absolute_dir(parent_chain)
+    archive_path = get_tmp_path()
+
+    try:
+        await write_stream(archive_path, data)
+
+        try:
+            reader = await ArchiveReader.open(archive_path)
+
+        except ValueError:
+            log.warning("event=%s", E.FILE_IMPORT_ARCHIVE_INVALID)
+            raise ValueInvalidError(field="archive", input_value=None)
+
+        try:
+            if len(reader.members) > FILES_ARCHIVE_MAX_ITEMS:
+                log.warning("event=%s", E.FILE_IMPORT_TOO_MANY_ITEMS)
+                raise ResourceConflictError
+
+            await _check_extracted_size(reader)
+
+            async with locks.lock_directory(target_dir, LockType.WRITE):
+                importer = _Importer(repository, user, folder_id, reader)
+                results = await importer.run()
+
+        finally:
+            await reader.close()
+
+    finally:
+        await _cleanup_path(archive_path)
+
+    log.info(
+        "event=%s entries_count=%s",
+        E.FILE_IMPORT_COMPLETED, len(results),
+    )
+    await hooks.emit(E.FILE_IMPORT_COMPLETED, session, results)
+
+    return results
+
+
+async def _check_extracted_size(reader: ArchiveReader) -> None:
+    """
+    Reject an archive whose files declare more bytes than the import
+    limit allows or than the storage can take above its free space
+    floor. Extraction never writes past the declared sizes, so this
+    bounds what the import writes to the mount.
+    """
+    config = get_config()
+    extracted_bytes = sum(
+        member.size for member in reader.members
+        if member.is_supported and not member.is_dir
+    )
+
+    if 0 < config.FILES_IMPORT_MAX_EXTRACTED_BYTES < extracted_bytes:
+        log.warning(
+            "event=%s extracted_bytes=%s",
+            E.FILE_IMPORT_TOO_LARGE, extracted_bytes,
+        )
+        raise ResourceConflictError
+
+    free_bytes = await get_free_bytes(config.FILES_TMP_DIR)
+    if free_bytes - extracted_bytes < max(config.UPLOADS_MIN_FREE_BYTES, 0):
+        log.warning(
+            "event=%s free_bytes=%s extracted_bytes=%s",
+            E.FILE_IMPORT_STORAGE_LOW, free_bytes, extracted_bytes,
+        )
+        raise InsufficientStorageError(
+            retry_after=UPLOAD_ADMISSION_STORAGE_RETRY_AFTER_SECONDS,
+        )
+
+
+class _StagedFile(NamedTuple):
+    tmp_path: str
+    filesize: int
+    mimetype: str | None
+    checksum: str
+
+
+class _Importer:
+    """
+    State of one archive import. Folder paths are tuples of segments
+    relative to the target folder; the empty tuple is the target.
+    Folders committed by earlier batches are remembered by ID, since a
+    rolled back batch expires every object loaded before it.
+    """
+
+    def __init__(
+        self,
+        repository: ORMRepository,
+        user: User,
+        folder_id: int,
+        reader: ArchiveReader,
+    ) -> None:
+        self.repository = repository
+        self.user = user
+        self.folder_id = folder_id
+        self.reader = reader
+        self.results: list[FileImportResult | None] = [None] * len(
+            reader.members
+        )
+        self.known: dict[tuple[str, ...], int] = {}
+        self.imported: set[tuple[str, ...]] = set()
+        self.failed: dict[tuple[str, ...], FileImportStatus] = {}
+
+        # Batch state, reset for every batch.
+        self.folders: dict[
+            tuple[str, ...], tuple[Folder, tuple[Folder, ...]]
+        ] = {}
+        self.new_dirs: list[tuple[tuple[str, ...], Folder, str]] = []
+        self.new_files: list[tuple[int, File, str, str]] = []
+        self.taken_paths: set[str] = set()
+
+    async def run(self) -> list[FileImportResult]:
+        indexes = range(len(self.reader.members))
+        for batch in batched(indexes, FILES_BULK_BATCH_SIZE):
+            await self._import_batch(batch)
+        return self.results
+
+    async def _import_batch(self, indexes: Sequence[int]) -> None:
+        self.folders = {}
+        self.new_dirs = []
+        self.new_files = []
+        self.taken_paths = set()
+        staged = {}
+
+        # Entries are extracted and probed before the transaction
+        # starts, so the database is not held while content is read.
+        try:
+            for index in indexes:
+                staged_file = await self._stage(index)
+                if staged_file is not None:
+                    staged[index] = staged_file
+
+            target = await self.repository.select(
+                Folder, obj_id=self.folder_id,
+            )
+
+            if target is None:
+                self._fail_batch(indexes)
+                return
+
+            target_chain = await self.repository.select_parent_chain(target)
+            self.folders[()] = (target, target_chain)
+
+            await self._plan_batch(indexes, staged)
+
+        except Exception:
+            log.exception("event=%s", E.FILE_IMPORT_BATCH_FAILED)
+            await self.repository.rollback()
+            self._fail_batch(indexes)
+            return
+
+        finally:
+            planned = {tmp_path for _, _, tmp_path, _ in self.new_files}
+            for staged_file in staged.values():
+                if staged_file.tmp_path not in planned:
+                    await _cleanup_path(staged_file.tmp_path)
+
+        await self._apply_batch(indexes)
+
+    async def _stage(self, index: int) -> _StagedFile | None:
+        member = self.reader.members[index]
+        parts = _split_path(member.name)
+
+        if (
+            parts is None
+            or not member.is_supported
+            or not (parts or member.is_dir)
+        ):
+            log.warning("event=%s", E.FILE_IMPORT_ENTRY_INVALID)
+            self._set_result(index, FileImportStatus.INVALID)
+            return None
+
+        if member.is_dir:
+            return None
+
+        tmp_path = get_tmp_path()
+
+        try:
+            await self.reader.extract(index, tmp_path)
+            return _StagedFile(
+                tmp_path=tmp_path,
+                filesize=await get_filesize(tmp_path),
+                mimetype=await get_mimetype(tmp_path),
+                checksum=await get_checksum(tmp_path),
+            )
+
+        except Exception:
+            log.exception("event=%s", E.FILE_IMPORT_ENTRY_FAILED)
+            await _cleanup_path(tmp_path)
+            self._set_result(index, FileImportStatus.FAILED)
+            return None
+
+    async def _plan_batch(
+        self,
+        indexes: Sequence[int],
+        staged: dict[int, _StagedFile],
+    ) -> None:
+        # Folders and files are inserted and flushed here; nothing is
+        # written to the filesystem until the batch is journaled.
+        for index in indexes:
+            if self.results[index] is not None:
+                continue
+
+            member = self.reader.members[index]
+            parts = _split_path(member.name)
+
+            if member.is_dir:
+                status = await self._resolve_folder(parts)
+                if status is not None:
+                    self._set_result(index, status)
+                continue
+
+            status = await self._resolve_folder(parts[:-1])
+            if status is not None:
+                self._set_result(index, status)
+                continue
+
+            status = await self._plan_file(index, parts, staged[index])
+            if status is not None:
+                self._set_result(index, status)
+
+    async def _resolve_folder(
+        self,
+        parts: tuple[str, ...],
+    ) -> FileImportStatus | None:
+        for level in range(1, len(parts) + 1):
+            path = parts[:level]
+
+            if path in self.folders:
+                continue
+
+            if path in self.failed:
+                return self.failed[path]
+
+            status = await self._open_folder(path)
+            if status is not None:
+                self.failed[path] = status
+                return status
+
+        return None
+
+    async def _open_folder(
+        self,
+        path: tuple[str, ...],
+    ) -> FileImportStatus | None:
+        parent, parent_chain = self.folders[path[:-1]]
+        folder_chain = (parent, *parent_chain)
+
+        if path in self.known:
+            folder = await self.repository.select(
+                Folder, obj_id=self.known[path],
+            )
+            if folder is None:
+                return FileImportStatus.FAILED
+
+            self.folders[path] = (folder, folder_chain)
+            return None
+
+        folder = await self.repository.select(
+            Folder, parent_id=parent.id, dirname=path[-1],
+        )
+
+        if folder is not None:
+            if folder.is_write_protected:
+                return FileImportStatus.LOCKED
+
+            self.known[path] = folder.id
+            self.folders[path] = (folder, folder_chain)
+            return None
+
+        if len(folder_chain) > FILES_MAX_FOLDER_DEPTH:
+            log.warning("event=%s", E.FILE_IMPORT_DEPTH_LIMIT_EXCEEDED)
+            return FileImportStatus.INVALID
+
+        folder = Folder(
+            parent_id=parent.id,
+            created_by=self.user.id,
+            dirname=path[-1],
+            summary=None,
+        )
+        absolute_dir = folder.get_absolute_dir(folder_chain)
+
+        if len(absolute_dir.encode("utf-8")) > FILES_MAX_PATH_LENGTH_BYTES:
+            log.warning("event=%s", E.FILE_IMPORT_PATH_TOO_LONG)
+            return FileImportStatus.INVALID
+
+        if (
+            absolute_dir in self.taken_paths
+            or await isdir(absolute_dir)
+            or await isfile(absolute_dir)
+        ):
+            log.warning("event=%s", E.FILE_IMPORT_ENTRY_CONFLICT)
+            return FileImportStatus.CONFLICT
+
+        await self.repository.insert(folder)
+        parent.children_count += 1
+
+        self.folders[path] = (folder, folder_chain)
+        self.new_dirs.append((path, folder, absolute_dir))
+        self.taken_paths.add(absolute_dir)
+        return None
+
+    async def _plan_file(
+        self,
+        index: int,
+        parts: tuple[str, ...],
+        staged_file: _StagedFile,
+    ) -> FileImportStatus | None:
+        folder, folder_chain = self.folders[parts[:-1]]
+
+        file = File(
+            folder_id=folder.id,
+            created_by=self.user.id,
+            filename=parts[-1],
+            filesize=staged_file.filesize,
+            mimetype=staged_file.mimetype,
+            checksum=staged_file.checksum,
+            summary=None,
+        )
+        file_path = file.get_absolute_path(folder, folder_chain)
+
+        if len(file_path.encode("utf-8")) > FILES_MAX_PATH_LENGTH_BYTES:
+            log.warning("event=%s", E.FILE_IMPORT_PATH_TOO_LONG)
+            return FileImportStatus.INVALID
+
+        existing_file = await self.repository.select(
+            File, folder_id=folder.id, filename=file.filename,
+        )
+
+        if (
+            existing_file is not None
+            or file_path in self.taken_paths
+            or await isdir(file_path)
+            or await isfile(file_path)
+        ):
+            log.warning("event=%s", E.FILE_IMPORT_ENTRY_CONFLICT)
+            return FileImportStatus.CONFLICT
+
+        await self.repository.insert(file)
+        folder.files_count += 1
+
+        self.new_files.append(
+            (index, file, staged_file.tmp_path, file_path),
+        )
+        self.taken_paths.add(file_path)
+        return None
+
+    async def _apply_batch(self, indexes: Sequence[int]) -> None:
+        if not self.new_dirs and not self.new_files:
+            self._finish_batch(indexes)
+            return
+
+        intent = self._build_intent()
+        created_dirs = []
+        renamed_files = []
+
+        try:
+            await begin_intent(intent)
+
+            for _, _, absolute_dir in self.new_dirs:
+                await mkdir(absolute_dir)
+                created_dirs.append(absolute_dir)
+
+            for _, _, tmp_path, file_path in self.new_files:
+                await rename(tmp_path, file_path)
+                renamed_files.append(file_path)
+
+            for _, folder, _ in self.new_dirs:
+                await write_audit(
+                    repository=self.repository,
+                    event=E.FOLDER_CREATE_COMPLETED,
+                    resource_type=Folder.__tablename__,
+                    resource_id=folder.id,
+                )
+
+            for _, file, _, _ in self.new_files:
+                await write_audit(
+                    repository=self.repository,
+                    event=E.FILE_UPLOAD_COMPLETED,
+                    resource_type=File.__tablename__,
+                    resource_id=file.id,
+                )
+
+            await self.repository.commit()
+
+        except Exception:
+            log.exception("event=%s", E.FILE_IMPORT_BATCH_FAILED)
+            await self.repository.rollback()
+
+            for file_path in renamed_files:
+                await _cleanup_path(file_path)
+            for _, _, tmp_path, _ in self.new_files:
+                await _cleanup_path(tmp_path)
+            for absolute_dir in reversed(created_dirs):
+                try:
+                    await rmdir(absolute_dir)
+                except Exception:
+                    log.exception("event=%s", E.FILE_IMPORT_CLEANUP_FAILED)
+
+            self._fail_batch(indexes)
+            return
+
+        finally:
+            await end_intent(intent)
+
+        for path, folder, _ in self.new_dirs:
+            self.known[path] = folder.id
+            self.imported.add(path)
+
+        for index, file, _, _ in self.new_files:
+            self._set_result(index, FileImportStatus.CREATED, file_id=file.id)
+
+        self._finish_batch(indexes)
+
+    def _fail_batch(self, indexes: Sequence[int]) -> None:
+        # Folders inserted by the failed batch were rolled back, so
+        # entries below them fail instead of being placed elsewhere.
+        for path, _, _ in self.new_dirs:
+            self.failed[path] = FileImportStatus.FAILED
+
+        for index in indexes:
+            if self.results[index] is None:
+                self._set_result(index, FileImportStatus.FAILED)
+
+        self.new_dirs = []
+        self.new_files = []
+
+    def _finish_batch(self, indexes: Sequence[int]) -> None:
+        for index in indexes:
+            if self.results[index] is not None:
+                continue
+
+            path = _split_path(self.reader.members[index].name)
+            folder, _ = self.folders[path]
+            status = (
+                FileImportStatus.CREATED if path in self.imported
+                else FileImportStatus.EXISTS
+            )
+            self._set_result(index, status, folder_id=folder.id)
+
+    def _build_intent(self) -> Intent:
+        # The first inserted row marks the commit; IDs are never
+        # reused, so the row exists only if this batch committed.
+        if self.new_dirs:
+            table, marker_id = Folder.__tablename__, self.new_dirs[0][1].id
+        else:
+            table, marker_id = File.__tablename__, self.new_files[0][1].id
+
+        tmp_paths = [tmp_path for _, _, tmp_path, _ in self.new_files]
+        return Intent(
+            operation="file_import",
+            table=table,
+            filters={"id": marker_id},
+            on_commit=[(ACTION_DELETE, path) for path in tmp_paths],
+            on_rollback=[
+                *[(ACTION_DELETE, path) for _, _, _, path in self.new_files],
+                *[
+                    (ACTION_RMDIR, path)
+                    for _, _, path in reversed(self.new_dirs)
+                ],
+                *[(ACTION_DELETE, path) for path in tmp_paths],
+            ],
+        )
+
+    def _set_result(
+        self,
+        index: int,
+        status: FileImportStatus,
+        folder_id: int | None = None,
+        file_id: int | None = None,
+    ) -> None:
+        self.results[index] = FileImportResult(
+            path=self.reader.members[index].name,
+            status=status,
+            folder_id=folder_id,
+            file_id=file_id,
+        )
+
+
+def _split_path(name: str) -> tuple[str, ...] | None:
+    """
+    Return the segments of an archive entry path relative to the
+    target folder, or None if the path is absolute, escapes the
+    target, or has an invalid segment. The target itself, such as
+    the "./" entry of a tar archive, has no segments.
+    """
+    path = PurePosixPath(name)
+    if path.is_absolute():
+        return None
+
+    parts = tuple(part for part in name.split("/") if part not in ("", "."))
+
+    try:
+        for part in parts:
+            validate_path_segment(part)
+            if len(part) > _SEGMENT_MAX_LENGTH:
+                return None
+
+    except PydanticCustomError:
+        return None
+
+    return parts
+
+
+async def _cleanup_path(path: str) -> None:
+    """
+    Delete a temporary or partially imported file. Cleanup is
+    best-effort: failures are logged and do not affect the import.
+    """
+    try:
+        await delete(path)
+
+    except Exception:
+        log.exception("event=%s path=%s", E.FILE_IMPORT_CLEANUP_FAILED, path)
@@ -7,7 +7,6 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.audit import write_audit
-from app.config import get_config
 from app.constants import FILES_MAX_PATH_LENGTH_BYTES
 from app.errors import (
     ResourceConflictError,
@@ -21,8 +20,10 @@ from app.models.file import File
 from app.models.folder import Folder
 from app.models.user import User
 from app.repositories.file import isdir, isfile, rename
+from app.repositories.intent import ACTION_RENAME, Intent
 from app.repositories.orm import ORMRepository
 from app.schemas.file_move import FileMoveRequest
+from app.services.intent import begin_intent, end_intent
 
 log = logging.getLogger(__name__)
 
@@ -51,7 +52,6 @@ async def move_file(
     """
     log.info("event=%s file_id=%s", E.FILE_MOVE_STARTED, file_id)
 
-    config = get_config()
     repository = ORMRepository(session)
 
     file = await repository.select(File, obj_id=file_id)
@@ -106,7 +106,17 @@ async def move_file(
         log.warning("event=%s", E.FILE_MOVE_PATH_TOO_LONG)
         raise ResourceConflictError
 
-    async with locks.lock_directory(config.FILES_DIR, LockType.WRITE):
+    # Only the two folders touched by the move are locked. Both WRITE
+    # locks are granted atomically, so moves in opposite directions
+    # between the same folders cannot deadlock, and operations on
+    # unrelated folders proceed concurrently.
+    async with locks.lock_many(
+        LockType.WRITE,
+        dir_paths=(
+            source_folder.get_absolute_dir(source_parent_chain),
+            destination_folder.get_absolute_dir(destination_parent_chain),
+        ),
+    ):
         file_moved = False
 
         existing_file = await repository.select(
@@ -127,7 +137,16 @@ async def move_file(
             log.warning("event=%s", E.FILE_MOVE_FILENAME_CONFLICT)
             raise ResourceConflictError
 
+        intent = Intent(
+            operation="file_move",
+            table=File.__tablename__,
+            filters={"id": file.id, "folder_id": destination_folder.id},
+            on_rollback=[(ACTION_RENAME, destination_path, source_path)],
+        )
+
         try:
+            await begin_intent(intent)
+
             await rename(source_path, destination_path)
             file_moved = True
 
@@ -172,6 +191,9 @@ async def move_file(
 
             raise
 
+        finally:
+            await end_intent(intent)
+
     log.info("event=%s", E.FILE_MOVE_COMPLETED)
     await hooks.emit(E.FILE_MOVE_COMPLETED, session, file)
 
@@ -35,8 +35,10 @@ from app.repositories.image import (
     get_image_size,
 )
 from app.repositories.image import rotate as rotate_image
+from app.repositories.intent import ACTION_COPY, ACTION_DELETE, Intent
 from app.repositories.orm import ORMRepository
 from app.schemas.file_rotate import FileRotateRequest
+from app.services.intent import begin_intent, end_intent
 
 log = logging.getLogger(__name__)
 
@@ -107,11 +109,10 @@ async def rotate_file(
             await _cleanup_path(tmp_path)
             raise ResourceConflictError
 
+        intent = None
+
         try:
-            latest_revision_number = await repository.count_all(
-                FileRevision,
-                file_id=file.id,
-            ) + 1
+            latest_revision_number = file.latest_revision_number + 1
 
             revision = FileRevision(
                 file_id=file.id,
@@ -124,6 +125,19 @@ async def rotate_file(
                 checksum=file.checksum,
             )
 
+            intent = Intent(
+                operation="file_rotate",
+                table=FileRevision.__tablename__,
+                filters={"revision_uuid": revision.revision_uuid},
+                on_commit=[(ACTION_DELETE, tmp_path)],
+                on_rollback=[
+                    (ACTION_COPY, revision.absolute_path, file_path),
+                    (ACTION_DELETE, revision.absolute_path),
+                    (ACTION_DELETE, tmp_path),
+                ],
+            )
+            await begin_intent(intent)
+
             await copy(file_path, revision.absolute_path)
             restore_source_path = revision.absolute_path
 
@@ -171,6 +185,9 @@ async def rotate_file(
 
             raise
 
+        finally:
+            await end_intent(intent)
+
         thumbnail_creation_blocked = False
         old_thumbnail = await repository.select(
             FileThumbnail,
@@ -3,6 +3,7 @@
 
 import logging
 import uuid
+from collections.abc import Awaitable, Callable
 
 from fastapi import UploadFile
 from pydantic_core import PydanticCustomError
@@ -41,7 +42,13 @@ from app.repositories.image import (
     create_thumbnail,
     get_image_size,
 )
+from app.repositories.intent import ACTION_COPY, ACTION_DELETE, Intent
 from app.repositories.orm import ORMRepository
+from app.services.intent import begin_intent, end_intent
+from app.services.revision_content import (
+    is_delta_due,
+    write_revision_delta,
+)
 from app.validators.path_segment import validate_path_segment
 
 log = logging.getLogger(__name__)
@@ -55,9 +62,10 @@ log = logging.getLogger(__name__)
 # or on a directory covering the file.
 
 # NOTE (ADR-48): File upload cleanup is best-effort.
-# If the process terminates between file write and cleanup, an orphaned
-# file may remain on disk. This is considered unlikely and accepted,
-# as the database is the source of truth.
+# Cleanup failures inside a running process are logged and accepted,
+# as the database is the source of truth. If the process terminates
+# mid-operation, the intent journal (ADR-73) reconciles the filesystem
+# on the next mount.
 
 # NOTE (ADR-49): Files cannot be uploaded to root.
 # Every file must have a parent folder (folder_id is required).
@@ -74,19 +82,6 @@ log = logging.getLogger(__name__)
 # there. Make it configurable (per-instance or per-user opt-out) so
 # users who deliberately need EXIF preserved can keep it.
 
-# TODO: Add background integrity scan for encrypted storage consistency.
-# The scan should periodically verify:
-# 1. Referenced files exist on the filesystem;
-# 2. Filesystem objects have corresponding database entries;
-# 3. File revisions are structurally consistent;
-# 4. Generated thumbnails exist and remain linked correctly;
-# 5. Stored hashes match actual file contents.
-
-# TODO: Add soft filesystem capacity guard for uploads. Refuse new
-# uploads when available disk space falls below a configured minimum
-# threshold.
-
-
 async def upload_file(
     session: AsyncSession,
     user: User,
@@ -94,12 +89,33 @@ async def upload_file(
     uploaded_file: UploadFile,
 ) -> File:
     """
-    Upload a file into an existing folder. The operation is
+    Upload a file from a multipart request into an existing folder.
+    See store_upload for the transactional flow.
+    """
+    return await store_upload(
+        session,
+        user,
+        folder_id,
+        uploaded_file.filename,
+        lambda tmp_path: upload(uploaded_file, tmp_path),
+    )
+
+
+async def store_upload(
+    session: AsyncSession,
+    user: User,
+    folder_id: int,
+    filename: str | None,
+    stage: Callable[[str], Awaitable[None]],
+) -> File:
+    """
+    Store a file into an existing folder. The content is staged by
+    awaiting stage with a temporary path to fill. The operation is
     transactional at the DB level and reconciles filesystem state
     on failure. All writes are staged through a temporary file and
     applied under a directory lock.
 
-    (1) upload file to temporary path
+    (1) stage file content to temporary path
     (2) read real file metadata (size, mimetype, checksum)
 
     if file does not exist:
@@ -150,13 +166,13 @@ async def upload_file(
         raise ResourceLockedError
 
     try:
-        filename = validate_path_segment(uploaded_file.filename)
+        filename = validate_path_segment(filename)
 
     except PydanticCustomError:
         log.warning("event=%s", E.FILE_UPLOAD_FILENAME_INVALID)
         raise ValueInvalidError(
             field="file",
-            input_value=uploaded_file.filename,
+            input_value=filename,
         )
 
     file = File(
@@ -182,7 +198,7 @@ async def upload_file(
     tmp_path = get_tmp_path()
 
     try:
-        await upload(uploaded_file, tmp_path)
+        await stage(tmp_path)
         file_filesize = await get_filesize(tmp_path)
         file_mimetype = await get_mimetype(tmp_path)
         file_checksum = await get_checksum(tmp_path)
@@ -238,6 +254,7 @@ async def upload_file(
 
         written_main_path = None
         restore_source_path = None
+        delta_path = None
         file_replaced = False
 
         # Single transactional block: apply filesystem changes; update
@@ -246,12 +263,25 @@ async def upload_file(
         # Any failure triggers rollback + disk compensation below.
 
         result_file = None
+        intent = None
 
         try:
             # New file flow: write main file first, then persist DB
             # record. On rollback, the main file must be removed.
 
             if existing_file is None:
+                intent = Intent(
+                    operation="file_upload",
+                    table=File.__tablename__,
+                    filters={"folder_id": folder.id, "filename": filename},
+                    on_commit=[(ACTION_DELETE, tmp_path)],
+                    on_rollback=[
+                        (ACTION_DELETE, file_path),
+                        (ACTION_DELETE, tmp_path),
+                    ],
+                )
+                await begin_intent(intent)
+
                 await copy(tmp_path, file_path)
                 written_main_path = file_path
 
@@ -274,14 +304,16 @@ async def upload_file(
             # just remove the saved copy.
 
             else:
-                latest_revision_number = await repository.count_all(
-                    FileRevision,
-                    file_id=existing_file.id,
-                ) + 1
-
                 # Revision numbering depends on the directory WRITE
                 # lock. Uploads into the same folder are serialized,
-                # so count + 1 is safe for files in that folder.
+                # so the file's counter + 1 is safe; the revision count
+                # is not, since retention leaves gaps.
+                latest_revision_number = (
+                    existing_file.latest_revision_number + 1
+                )
+                is_delta = await is_delta_due(
+                    repository, existing_file, file_filesize,
+                )
 
                 revision = FileRevision(
                     file_id=existing_file.id,
@@ -292,10 +324,41 @@ async def upload_file(
                     filesize=existing_file.filesize,
                     mimetype=existing_file.mimetype,
                     checksum=existing_file.checksum,
+                    is_delta=is_delta,
+                )
+
+                # A delta revision cannot restore main by itself, so
+                # the restore source is a separate full copy then.
+                backup_path = get_tmp_path() if is_delta else None
+                restore_path = backup_path or revision.absolute_path
+
+                intent = Intent(
+                    operation="file_upload",
+                    table=FileRevision.__tablename__,
+                    filters={"revision_uuid": revision.revision_uuid},
+                    on_commit=[
+                        (ACTION_DELETE, path)
+                        for path in (tmp_path, backup_path) if path
+                    ],
+                    on_rollback=[
+                        (ACTION_COPY, restore_path, file_path),
+                        (ACTION_DELETE, revision.absolute_path),
+                        *[
+                            (ACTION_DELETE, path)
+                            for path in (backup_path, tmp_path) if path
+                        ],
+                    ],
                 )
+                await begin_intent(intent)
 
-                await copy(file_path, revision.absolute_path)
-                restore_source_path = revision.absolute_path
+                await copy(file_path, restore_path)
+                restore_source_path = restore_path
+
+                if is_delta:
+                    delta_path = revision.absolute_path
+                    await write_revision_delta(
+                        file_path, tmp_path, delta_path,
+                    )
 
                 await repository.insert(revision)
 
@@ -327,6 +390,8 @@ async def upload_file(
             await repository.commit()
             get_thumbnail_cache().evict(result_file.id)
 
+            if delta_path is not None:
+                await _cleanup_path(restore_source_path)
             written_main_path = None
             restore_source_path = None
 
@@ -339,6 +404,7 @@ async def upload_file(
 
             await repository.rollback()
             await _cleanup_path(tmp_path)
+            await _cleanup_path(delta_path)
 
             if written_main_path is not None:
                 await _cleanup_path(written_main_path)
@@ -356,6 +422,9 @@ async def upload_file(
 
             raise
 
+        finally:
+            await end_intent(intent)
+
         # Thumbnail update is post-commit and best-effort. The main
         # upload/revision transaction must not depend on preview
         # artifact generation. If removal of an existing thumbnail
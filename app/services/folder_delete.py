@@ -6,6 +6,8 @@ import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.audit import write_audit
+from app.cache.lru import get_thumbnail_cache
+from app.constants import FILES_BULK_BATCH_SIZE
 from app.errors import (
     ResourceConflictError,
     ResourceLockedError,
@@ -15,10 +17,31 @@ from app.events import Events as E
 from app.hooks import hooks
 from app.locks import LockType, locks
 from app.models.file import File
+from app.models.file_comment import FileComment
+from app.models.file_revision import FileRevision
+from app.models.file_tag import FileTag
+from app.models.file_thumbnail import FileThumbnail
 from app.models.folder import Folder
-from app.repositories.file import rmdir
+from app.repositories.file import rename, rmdir
+from app.repositories.intent import (
+    ACTION_DELETE,
+    ACTION_RENAME,
+    ACTION_RMDIR,
+    Intent,
+)
 from app.repositories.orm import ORMRepository
+from app.repositories.trash import (
+    create_trash_entry,
+    discard_trash_entry,
+    get_trash_entry_path,
+    get_trash_manifest_path,
+    get_trash_pending_path,
+    get_trash_tree_path,
+    seal_trash_entry,
+)
+from app.services.file_bulk import batched
 from app.services.file_delete import delete_file
+from app.services.intent import begin_intent, end_intent
 
 log = logging.getLogger(__name__)
 
@@ -32,17 +55,25 @@ log = logging.getLogger(__name__)
 #    but before the database commit, the system may become inconsistent:
 #    the directory is removed while the database record still exists.
 #    This condition is logged and is not automatically compensated.
+# 3. Recursive deletion is the exception: the whole subtree is removed
+#    in one transaction and its directory in one rename (ADR-72), which
+#    is journaled and reconciled on mount after a crash (ADR-73).
 
 async def delete_folder(
     session: AsyncSession,
     folder_id: int,
+    recursive: bool = False,
 ) -> Folder:
     """
-    Delete a folder and all direct files inside it. Subfolders are
-    never deleted recursively. If the folder contains direct subfolders,
-    deletion fails with a conflict.
+    Delete a folder and all direct files inside it. Without recursive,
+    subfolders are never deleted and a folder containing direct
+    subfolders is rejected with a conflict. With recursive, the whole
+    subtree is deleted at once.
     """
-    log.info("event=%s folder_id=%s", E.FOLDER_DELETE_STARTED, folder_id)
+    log.info(
+        "event=%s folder_id=%s recursive=%s",
+        E.FOLDER_DELETE_STARTED, folder_id, recursive,
+    )
 
     repository = ORMRepository(session)
     folder = await repository.select(Folder, obj_id=folder_id)
@@ -60,6 +91,11 @@ async def delete_folder(
         log.warning("event=%s", E.FOLDER_DELETE_WRITE_PROTECTED)
         raise ResourceLockedError
 
+    if recursive:
+        return await _delete_folder_tree(
+            session, repository, folder, parent_chain,
+        )
+
     if folder.children_count > 0:
         log.warning("event=%s", E.FOLDER_DELETE_HAS_FOLDERS)
         raise ResourceConflictError
@@ -137,3 +173,170 @@ async def delete_folder(
     await hooks.emit(E.FOLDER_DELETE_COMPLETED, session, folder)
 
     return folder
+
+
+async def _delete_folder_tree(
+    session: AsyncSession,
+    repository: ORMRepository,
+    folder: Folder,
+    parent_chain: tuple[Folder, ...],
+) -> Folder:
+    """
+    Delete a folder with its whole subtree. The subtree is locked once,
+    database rows are removed with set-based DELETEs in one transaction,
+    and the directory is moved to the trash with one rename. Blobs are
+    reclaimed later by the trash reclaim job. Folder IDs are bound in
+    batches to stay below the SQLite bound parameter limit.
+    """
+    absolute_dir = folder.get_absolute_dir(parent_chain)
+    parent = parent_chain[0] if parent_chain else None
+
+    if parent is not None:
+        lock_dir = parent.get_absolute_dir(parent_chain[1:])
+    else:
+        lock_dir = absolute_dir
+
+    async with locks.lock_directory(lock_dir, LockType.WRITE):
+        subtree = await repository.select_subtree_ids(folder)
+        folder_ids = [subtree_id for subtree_id, _ in subtree]
+        folder_batches = [
+            list(chunk)
+            for chunk in batched(folder_ids, FILES_BULK_BATCH_SIZE)
+        ]
+
+        for chunk in folder_batches:
+            if await repository.count_all(
+                Folder, id__in=chunk, is_write_protected=True,
+            ) > 0:
+                log.warning("event=%s", E.FOLDER_DELETE_WRITE_PROTECTED)
+                raise ResourceLockedError
+
+        files_subqueries = [
+            repository.make_subquery(File, "id", folder_id__in=chunk)
+            for chunk in folder_batches
+        ]
+        file_ids, revision_uuids, thumbnail_uuids = [], [], []
+
+        for chunk, files_subquery in zip(folder_batches, files_subqueries):
+            file_ids.extend(await repository.select_values(
+                File, "id", folder_id__in=chunk,
+            ))
+            revision_uuids.extend(await repository.select_values(
+                FileRevision, "revision_uuid",
+                file_id__subquery=files_subquery,
+            ))
+            thumbnail_uuids.extend(await repository.select_values(
+                FileThumbnail, "thumbnail_uuid",
+                file_id__subquery=files_subquery,
+            ))
+
+        entry_dir = get_trash_entry_path()
+        tree_dir = get_trash_tree_path(entry_dir)
+        pending_path = get_trash_pending_path(entry_dir)
+        manifest_path = get_trash_manifest_path(entry_dir)
+
+        intent = Intent(
+            operation="folder_delete",
+            table=Folder.__tablename__,
+            filters={"id": folder.id},
+            committed_if_present=False,
+            on_commit=[(ACTION_RENAME, pending_path, manifest_path)],
+            on_rollback=[
+                (ACTION_RENAME, tree_dir, absolute_dir),
+                (ACTION_DELETE, pending_path),
+                (ACTION_RMDIR, entry_dir),
+            ],
+        )
+
+        try:
+            await begin_intent(intent)
+            await create_trash_entry(
+                entry_dir, revision_uuids, thumbnail_uuids,
+            )
+            await rename(absolute_dir, tree_dir)
+
+        except Exception:
+            await repository.rollback()
+            log.exception("event=%s", E.FOLDER_DELETE_FAILED)
+            try:
+                await discard_trash_entry(entry_dir)
+            except Exception:
+                log.exception("event=%s", E.FOLDER_DELETE_FAILED)
+            await end_intent(intent)
+            raise
+
+        try:
+            for chunk, files_subquery in zip(
+                folder_batches, files_subqueries,
+            ):
+                for cls in (
+                    FileComment, FileTag, FileRevision, FileThumbnail,
+                ):
+                    await repository.delete_all(
+                        cls, file_id__subquery=files_subquery,
+                    )
+                await repository.delete_all(File, folder_id__in=chunk)
+
+            # Deepest folders go first: the self-referencing foreign key
+            # is RESTRICT and is checked row by row.
+            for depth in sorted({depth for _, depth in subtree}, reverse=True):
+                depth_ids = [
+                    subtree_id for subtree_id, subtree_depth in subtree
+                    if subtree_depth == depth
+                ]
+                for chunk in batched(depth_ids, FILES_BULK_BATCH_SIZE):
+                    await repository.delete_all(Folder, id__in=list(chunk))
+
+            if parent is not None:
+                parent.children_count -= 1
+                await repository.update(parent)
+
+            for file_id in file_ids:
+                await write_audit(
+                    repository=repository,
+                    event=E.FILE_DELETE_COMPLETED,
+                    resource_type=File.__tablename__,
+                    resource_id=file_id,
+                )
+
+            for subtree_id in reversed(folder_ids):
+                await write_audit(
+                    repository=repository,
+                    event=E.FOLDER_DELETE_COMPLETED,
+                    resource_type=Folder.__tablename__,
+                    resource_id=subtree_id,
+                )
+            await repository.commit()
+
+        except Exception:
+            await repository.rollback()
+            log.exception("event=%s", E.FOLDER_DELETE_FAILED)
+            try:
+                await rename(tree_dir, absolute_dir)
+                await discard_trash_entry(entry_dir)
+            except Exception:
+                log.exception("event=%s", E.FOLDER_DELETE_INCONSISTENT)
+            await end_intent(intent)
+            raise
+
+        try:
+            await seal_trash_entry(entry_dir)
+        except Exception:
+            log.exception(
+                "event=%s entry_dir=%s",
+                E.FOLDER_DELETE_TRASH_SEAL_FAILED, entry_dir,
+            )
+        else:
+            await end_intent(intent)
+
+    cache = get_thumbnail_cache()
+    for file_id in file_ids:
+        cache.evict(file_id)
+
+    log.info(
+        "event=%s folders_count=%s files_count=%s",
+        E.FOLDER_DELETE_COMPLETED, len(folder_ids), len(file_ids),
+    )
+    await hooks.emit(E.FOLDER_DELETE_COMPLETED, session, folder)
+
+    return folder
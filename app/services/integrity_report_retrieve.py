@@ -0,0 +1,34 @@
+# app/services/integrity_report_retrieve.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import logging
+from dataclasses import asdict
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.events import Events as E
+from app.hooks import hooks
+from app.repositories.orm import ORMRepository
+from app.schemas.integrity_report_retrieve import IntegrityReportResponse
+from app.services.integrity_scan import load_scan_state
+
+log = logging.getLogger(__name__)
+
+
+async def retrieve_integrity_report(
+    session: AsyncSession,
+) -> IntegrityReportResponse:
+    """
+    Return the progress and findings of the background integrity scan
+    from its checkpoint. The report reflects the last saved batch.
+    """
+    log.info("event=%s", E.INTEGRITY_REPORT_RETRIEVE_STARTED)
+
+    repository = ORMRepository(session)
+    state = asdict(await load_scan_state(repository))
+    state.pop("position")
+
+    log.info("event=%s", E.INTEGRITY_REPORT_RETRIEVE_COMPLETED)
+    await hooks.emit(E.INTEGRITY_REPORT_RETRIEVE_COMPLETED, session, None)
+
+    return IntegrityReportResponse.model_validate(state)
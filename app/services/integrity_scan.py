@@ -0,0 +1,662 @@
+# app/services/integrity_scan.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import bisect
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from sqlalchemy import select
+
+from app.config import get_config
+from app.constants import (
+    INTEGRITY_SCAN_BATCH_ROWS,
+    INTEGRITY_SCAN_MAX_FINDINGS,
+    INTEGRITY_SCAN_MAX_SECONDS_PER_RUN,
+    INTEGRITY_SCAN_ORPHAN_GRACE_SECONDS,
+    INTEGRITY_SCAN_PAUSE_SECONDS,
+    INTEGRITY_SCAN_VARIABLE_KEY,
+    INTEGRITY_SCAN_VARIABLE_NAMESPACE,
+)
+from app.db.engine import SessionLocal
+from app.events import Events as E
+from app.locks import LockType, locks
+from app.models.file import File
+from app.models.file_revision import FileRevision
+from app.models.file_thumbnail import FileThumbnail
+from app.models.folder import Folder
+from app.models.variable import Variable
+from app.repositories.file import (
+    get_checksum,
+    get_filesize,
+    get_mtime,
+    get_signature,
+    isdir,
+    isfile,
+    listdir,
+)
+from app.repositories.orm import ORMRepository
+from app.repositories.trash import (
+    MANIFEST_REVISIONS,
+    MANIFEST_THUMBNAILS,
+    list_sealed_trash_entries,
+    read_trash_manifest,
+)
+from app.runtime.throttle import IOThrottle
+
+log = logging.getLogger(__name__)
+
+PHASE_FILES = "files"
+PHASE_REVISIONS = "revisions"
+PHASE_THUMBNAILS = "thumbnails"
+PHASE_FOLDERS = "folders"
+PHASE_REVISION_BLOBS = "revision_blobs"
+PHASE_THUMBNAIL_BLOBS = "thumbnail_blobs"
+
+PHASES = (
+    PHASE_FILES,
+    PHASE_REVISIONS,
+    PHASE_THUMBNAILS,
+    PHASE_FOLDERS,
+    PHASE_REVISION_BLOBS,
+    PHASE_THUMBNAIL_BLOBS,
+)
+
+BLOB_PHASES = (PHASE_REVISION_BLOBS, PHASE_THUMBNAIL_BLOBS)
+
+CHECK_MISSING = "missing"
+CHECK_FILESIZE_MISMATCH = "filesize_mismatch"
+CHECK_CHECKSUM_MISMATCH = "checksum_mismatch"
+CHECK_ORPHAN = "orphan"
+CHECK_REVISION_NUMBER_INVALID = "revision_number_invalid"
+CHECK_THUMBNAIL_UNLINKED = "thumbnail_unlinked"
+
+
+# NOTE (ADR-74): Integrity scan is incremental and throttled.
+# The scan walks file, revision and thumbnail rows, folder directories,
+# and the revision and thumbnail blob directories in id or name order,
+# one small batch at a time, and checkpoints its cursor and findings in
+# the Variable table after every batch. A pass can therefore span many
+# runs and restarts, losing at most one batch of work. Rows are read
+# in short sessions that are never held open during I/O; reads are
+# paced to a bytes-per-second and IOPS budget and pause while requests
+# are being processed. Files are checked without locks, and a finding
+# is reported only after it is reproduced and then confirmed under a
+# read lock against the current row and file, so concurrent edits,
+# moves and deletes do not produce false findings. The throttle waits
+# for requests that may be queued on the same lock, so no throttled
+# I/O runs while a lock is held.
+
+@dataclass
+class ScanState:
+    """Checkpointed progress and findings of the integrity scan."""
+
+    pass_number: int = 0
+    pass_started_at: int | None = None
+    phase: str | None = None
+    position: int | str = 0
+    checked_count: int = 0
+    hashed_bytes: int = 0
+    findings_count: int = 0
+    findings: list[dict[str, Any]] = field(default_factory=list)
+    last_pass: dict[str, Any] | None = None
+
+
+@dataclass(frozen=True)
+class _Target:
+    resource_type: str
+    resource_id: int
+    path: str
+    filesize: int | None
+    checksum: str | None = None
+
+
+async def scan_integrity() -> None:
+    """
+    Continue the integrity scan from its checkpoint for at most
+    INTEGRITY_SCAN_MAX_SECONDS_PER_RUN. A new pass starts once
+    INTEGRITY_SCAN_PASS_INTERVAL_SECONDS have passed since the
+    previous pass started.
+    """
+    config = get_config()
+    async with SessionLocal() as session:
+        state = await load_scan_state(ORMRepository(session))
+    now = int(time.time())
+
+    if state.phase is None:
+        if (
+            state.pass_started_at is not None
+            and now - state.pass_started_at
+            < config.INTEGRITY_SCAN_PASS_INTERVAL_SECONDS
+        ):
+            return
+        _start_pass(state, now)
+
+    log.info(
+        "event=%s pass_number=%s phase=%s position=%s",
+        E.INTEGRITY_SCAN_STARTED,
+        state.pass_number, state.phase, state.position,
+    )
+
+    throttle = IOThrottle(
+        bytes_per_second=config.INTEGRITY_SCAN_BYTES_PER_SECOND,
+        iops=config.INTEGRITY_SCAN_IOPS,
+        max_active_requests=config.INTEGRITY_SCAN_MAX_ACTIVE_REQUESTS,
+        pause_seconds=INTEGRITY_SCAN_PAUSE_SECONDS,
+    )
+    deadline = time.monotonic() + INTEGRITY_SCAN_MAX_SECONDS_PER_RUN
+    listings: dict[str, list[str]] = {}
+
+    while state.phase is not None and time.monotonic() < deadline:
+        if await _scan_batch(state, throttle, listings):
+            _advance_phase(state)
+        await _save_scan_state(state)
+
+    log.info(
+        "event=%s pass_number=%s phase=%s checked_count=%s "
+        "findings_count=%s",
+        E.INTEGRITY_SCAN_COMPLETED,
+        state.pass_number, state.phase, state.checked_count,
+        state.findings_count,
+    )
+
+
+async def load_scan_state(repository: ORMRepository) -> ScanState:
+    """
+    Return the checkpointed scan state, or an empty state if the scan
+    has never run.
+    """
+    variable = await repository.select(
+        Variable,
+        namespace=INTEGRITY_SCAN_VARIABLE_NAMESPACE,
+        variable_key=INTEGRITY_SCAN_VARIABLE_KEY,
+    )
+
+    if variable is None:
+        return ScanState()
+
+    return ScanState(**json.loads(variable.variable_value))
+
+
+async def _save_scan_state(state: ScanState) -> None:
+    async with SessionLocal() as session:
+        repository = ORMRepository(session)
+        variable = await repository.select(
+            Variable,
+            namespace=INTEGRITY_SCAN_VARIABLE_NAMESPACE,
+            variable_key=INTEGRITY_SCAN_VARIABLE_KEY,
+        )
+        value = json.dumps(asdict(state))
+
+        if variable is None:
+            await repository.insert(Variable(
+                namespace=INTEGRITY_SCAN_VARIABLE_NAMESPACE,
+                variable_key=INTEGRITY_SCAN_VARIABLE_KEY,
+                variable_value=value,
+            ))
+        else:
+            variable.variable_value = value
+            await repository.update(variable)
+
+        await repository.commit()
+
+
+def _start_pass(state: ScanState, now: int) -> None:
+    state.pass_number += 1
+    state.pass_started_at = now
+    state.phase = PHASES[0]
+    state.position = 0
+    state.checked_count = 0
+    state.hashed_bytes = 0
+    state.findings_count = 0
+    state.findings = []
+
+
+def _advance_phase(state: ScanState) -> None:
+    index = PHASES.index(state.phase) + 1
+
+    if index < len(PHASES):
+        state.phase = PHASES[index]
+        state.position = "" if state.phase in BLOB_PHASES else 0
+        return
+
+    state.last_pass = {
+        "pass_number": state.pass_number,
+        "started_at": state.pass_started_at,
+        "completed_at": int(time.time()),
+        "checked_count": state.checked_count,
+        "hashed_bytes": state.hashed_bytes,
+        "findings_count": state.findings_count,
+        "findings": state.findings,
+    }
+    log.info(
+        "event=%s pass_number=%s checked_count=%s findings_count=%s",
+        E.INTEGRITY_SCAN_PASS_COMPLETED,
+        state.pass_number, state.checked_count, state.findings_count,
+    )
+
+    state.phase = None
+    state.position = 0
+    state.checked_count = 0
+    state.hashed_bytes = 0
+    state.findings_count = 0
+    state.findings = []
+
+
+def _add_finding(
+    state: ScanState,
+    check: str,
+    path: str,
+    resource_type: str | None = None,
+    resource_id: int | None = None,
+) -> None:
+    """
+    Record a finding in the current pass. Only the first
+    INTEGRITY_SCAN_MAX_FINDINGS findings are kept in the report; all
+    of them are counted and logged.
+    """
+    config = get_config()
+    relative_path = os.path.relpath(path, config.GOCRYPTFS_MOUNTPOINT)
+
+    log.warning(
+        "event=%s check=%s resource_type=%s resource_id=%s path=%s",
+        E.INTEGRITY_SCAN_FINDING,
+        check, resource_type, resource_id, relative_path,
+    )
+
+    state.findings_count += 1
+    if len(state.findings) < INTEGRITY_SCAN_MAX_FINDINGS:
+        state.findings.append({
+            "check": check,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "path": relative_path,
+            "detected_at": int(time.time()),
+        })
+
+
+async def _scan_batch(
+    state: ScanState,
+    throttle: IOThrottle,
+    listings: dict[str, list[str]],
+) -> bool:
+    """
+    Scan the next batch of the current phase and advance the cursor.
+    Return True when the phase has nothing left.
+    """
+    if state.phase in BLOB_PHASES:
+        return await _scan_blobs(state, throttle, listings)
+
+    if state.phase == PHASE_FOLDERS:
+        return await _scan_folders(state, throttle)
+
+    return await _scan_targets(state, throttle)
+
+
+async def _scan_targets(state: ScanState, throttle: IOThrottle) -> bool:
+    async with SessionLocal() as session:
+        targets = await _select_targets(
+            ORMRepository(session),
+            state,
+            id__gt=state.position,
+            order_by="id",
+            order="asc",
+            limit=INTEGRITY_SCAN_BATCH_ROWS,
+        )
+
+    if not targets:
+        return True
+
+    for target in targets:
+        check = await _check_target(state, target, throttle)
+        if check is not None:
+            check = await _confirm_target(state, target, throttle)
+
+        if check is not None:
+            _add_finding(
+                state, check, target.path,
+                target.resource_type, target.resource_id,
+            )
+
+        state.checked_count += 1
+        state.position = target.resource_id
+
+    return False
+
+
+async def _select_targets(
+    repository: ORMRepository,
+    state: ScanState,
+    **filters: Any,
+) -> list[_Target]:
+    """
+    Return check targets of the current phase matching filters.
+    Structural problems of the selected rows, which need no I/O, are
+    recorded as findings directly.
+    """
+    if state.phase == PHASE_FILES:
+        files = await repository.select_all(File, **filters)
+        folder_dirs = {}
+        targets = []
+
+        for file in files:
+            folder = file.file_folder
+            if folder.id not in folder_dirs:
+                parent_chain = await repository.select_parent_chain(folder)
+                folder_dirs[folder.id] = folder.get_absolute_dir(
+                    parent_chain,
+                )
+
+            targets.append(_Target(
+                resource_type=File.__tablename__,
+                resource_id=file.id,
+                path=os.path.join(folder_dirs[folder.id], file.filename),
+                filesize=file.filesize,
+                checksum=file.checksum,
+            ))
+
+        return targets
+
+    if state.phase == PHASE_REVISIONS:
+        revisions = await repository.select_all(FileRevision, **filters)
+        result = await repository.session.execute(
+            select(File.id, File.latest_revision_number)
+            .where(File.id.in_({r.file_id for r in revisions}))
+        )
+        latest_numbers = dict(result.tuples().all())
+
+        for revision in revisions:
+            if not (
+                1 <= revision.revision_number
+                <= latest_numbers.get(revision.file_id, 0)
+            ):
+                _add_finding(
+                    state, CHECK_REVISION_NUMBER_INVALID,
+                    revision.absolute_path,
+                    FileRevision.__tablename__, revision.id,
+                )
+
+        # A delta blob (ADR-76) differs in size and checksum from the
+        # revision it rebuilds, so only its presence is checked.
+        return [_Target(
+            resource_type=FileRevision.__tablename__,
+            resource_id=revision.id,
+            path=revision.absolute_path,
+            filesize=None if revision.is_delta else revision.filesize,
+            checksum=None if revision.is_delta else revision.checksum,
+        ) for revision in revisions]
+
+    thumbnails = await repository.select_all(FileThumbnail, **filters)
+
+    for thumbnail in thumbnails:
+        if not thumbnail.thumbnail_file.is_image:
+            _add_finding(
+                state, CHECK_THUMBNAIL_UNLINKED,
+                thumbnail.absolute_path,
+                FileThumbnail.__tablename__, thumbnail.id,
+            )
+
+    return [_Target(
+        resource_type=FileThumbnail.__tablename__,
+        resource_id=thumbnail.id,
+        path=thumbnail.absolute_path,
+        filesize=thumbnail.filesize,
+    ) for thumbnail in thumbnails]
+
+
+async def _check_target(
+    state: ScanState,
+    target: _Target,
+    throttle: IOThrottle,
+) -> str | None:
+    """
+    Return the failed check for the target, or None if the file on
+    disk matches its row.
+    """
+    async def on_chunk(nbytes: int) -> None:
+        state.hashed_bytes += nbytes
+        await throttle.acquire_bytes(nbytes)
+
+    await throttle.acquire_ops()
+
+    try:
+        if not await isfile(target.path):
+            return CHECK_MISSING
+
+        if target.filesize is not None and await get_filesize(
+            target.path,
+        ) != target.filesize:
+            return CHECK_FILESIZE_MISMATCH
+
+        if target.checksum is not None and await get_checksum(
+            target.path, on_chunk=on_chunk,
+        ) != target.checksum:
+            return CHECK_CHECKSUM_MISMATCH
+
+    except FileNotFoundError:
+        return CHECK_MISSING
+
+    return None
+
+
+async def _confirm_target(
+    state: ScanState,
+    target: _Target,
+    throttle: IOThrottle,
+) -> str | None:
+    """
+    Repeat the check, then confirm under a read lock on the target path
+    that neither the row nor the file changed since the file was
+    signed before the check. A changed row or file drops the finding;
+    the current state is checked by the next pass.
+    """
+    signature = await _get_signature(target.path)
+    check = await _check_target(state, target, throttle)
+    if check is None:
+        return None
+
+    async with locks.lock_file(target.path, LockType.READ):
+        # Structural findings of the row were recorded by the batch,
+        # so the reselect records them into a scratch state.
+        async with SessionLocal() as session:
+            current = await _select_targets(
+                ORMRepository(session),
+                ScanState(phase=state.phase),
+                id=target.resource_id,
+            )
+
+        if current != [target]:
+            return None
+
+        if await _get_signature(target.path) != signature:
+            return None
+
+    return check
+
+
+async def _get_signature(path: str) -> tuple[int, int, int] | None:
+    try:
+        return await get_signature(path)
+    except FileNotFoundError:
+        return None
+
+
+async def _scan_folders(state: ScanState, throttle: IOThrottle) -> bool:
+    async with SessionLocal() as session:
+        result = await session.execute(
+            select(Folder.id)
+            .where(Folder.id > state.position)
+            .order_by(Folder.id)
+            .limit(INTEGRITY_SCAN_BATCH_ROWS)
+        )
+        folder_ids = list(result.scalars().all())
+
+    # The files root has no row; it is checked once at the start of
+    # the phase against the root folders.
+    if state.position == 0:
+        await _check_directory(state, throttle, None)
+
+    if not folder_ids:
+        return True
+
+    for folder_id in folder_ids:
+        await _check_directory(state, throttle, folder_id)
+        state.checked_count += 1
+        state.position = folder_id
+
+    return False
+
+
+async def _check_directory(
+    state: ScanState,
+    throttle: IOThrottle,
+    folder_id: int | None,
+) -> None:
+    """
+    Compare a folder directory with the rows of its files and child
+    folders under a read lock on the directory. Missing files are
+    found by the files phase, so only orphan entries are reported. A
+    folder renamed or moved before the lock is granted is skipped.
+    """
+    async with SessionLocal() as session:
+        entry = await _select_directory(ORMRepository(session), folder_id)
+
+    if entry is None:
+        return
+
+    dir_path = entry[0]
+    await throttle.acquire_ops()
+
+    async with locks.lock_directory(dir_path, LockType.READ):
+        async with SessionLocal() as session:
+            entry = await _select_directory(
+                ORMRepository(session), folder_id,
+            )
+
+        if entry is None or entry[0] != dir_path:
+            return
+
+        if not await isdir(dir_path):
+            _add_finding(
+                state, CHECK_MISSING, dir_path,
+                Folder.__tablename__, folder_id,
+            )
+            return
+
+        for name in await listdir(dir_path):
+            if name not in entry[1]:
+                _add_finding(
+                    state, CHECK_ORPHAN, os.path.join(dir_path, name),
+                )
+
+
+async def _select_directory(
+    repository: ORMRepository,
+    folder_id: int | None,
+) -> tuple[str, set[str]] | None:
+    """
+    Return the absolute path of a folder and the names its directory
+    is expected to contain. None selects the files root.
+    """
+    if folder_id is None:
+        config = get_config()
+        dirnames = await repository.select_values(
+            Folder, "dirname", parent_id__is=None,
+        )
+        return config.FILES_DIR, set(dirnames)
+
+    folder = await repository.select(Folder, obj_id=folder_id)
+    if folder is None:
+        return None
+
+    parent_chain = await repository.select_parent_chain(folder)
+    filenames = await repository.select_values(
+        File, "filename", folder_id=folder_id,
+    )
+    dirnames = await repository.select_values(
+        Folder, "dirname", parent_id=folder_id,
+    )
+    return folder.get_absolute_dir(parent_chain), {*filenames, *dirnames}
+
+
+async def _scan_blobs(
+    state: ScanState,
+    throttle: IOThrottle,
+    listings: dict[str, list[str]],
+) -> bool:
+    """
+    Report blobs without a row. Blobs younger than
+    INTEGRITY_SCAN_ORPHAN_GRACE_SECONDS may belong to an operation
+    that has not committed yet, and blobs listed in trash entries are
+    waiting for reclaim; neither is an orphan.
+    """
+    config = get_config()
+    if state.phase == PHASE_REVISION_BLOBS:
+        base_dir = config.FILES_REVISIONS_DIR
+        model, column, manifest_key = (
+            FileRevision, "revision_uuid", MANIFEST_REVISIONS,
+        )
+    else:
+        base_dir = config.FILES_THUMBNAILS_DIR
+        model, column, manifest_key = (
+            FileThumbnail, "thumbnail_uuid", MANIFEST_THUMBNAILS,
+        )
+
+    # The directory is listed once per run and walked by name, so the
+    # cursor stays valid when blobs are added or removed between runs.
+    if state.phase not in listings:
+        await throttle.acquire_ops()
+        listings[state.phase] = await listdir(base_dir)
+
+    names = listings[state.phase]
+    start = bisect.bisect_right(names, state.position)
+    batch = names[start:start + INTEGRITY_SCAN_BATCH_ROWS]
+
+    if not batch:
+        return True
+
+    async with SessionLocal() as session:
+        known = set(await ORMRepository(session).select_values(
+            model, column, **{f"{column}__in": batch},
+        ))
+
+    now = time.time()
+    candidates = []
+
+    for name in batch:
+        state.checked_count += 1
+        if name in known:
+            continue
+
+        await throttle.acquire_ops()
+        try:
+            mtime = await get_mtime(os.path.join(base_dir, name))
+        except FileNotFoundError:
+            continue
+
+        if now - mtime >= INTEGRITY_SCAN_ORPHAN_GRACE_SECONDS:
+            candidates.append(name)
+
+    if candidates:
+        trashed = await _select_trashed(manifest_key)
+        for name in candidates:
+            if name not in trashed:
+                _add_finding(
+                    state, CHECK_ORPHAN, os.path.join(base_dir, name),
+                )
+
+    state.position = batch[-1]
+    return False
+
+
+async def _select_trashed(manifest_key: str) -> set[str]:
+    trashed = set()
+    for entry_dir in await list_sealed_trash_entries():
+        manifest = await read_trash_manifest(entry_dir)
+        trashed.update(
+            os.path.basename(name) for name in manifest[manifest_key]
+        )
+    return trashed
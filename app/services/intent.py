@@ -0,0 +1,124 @@
+# app/services/intent.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import logging
+import os
+
+from app.config import get_config
+from app.db.engine import SessionLocal
+from app.events import Events as E
+from app.models.file import File
+from app.models.file_revision import FileRevision
+from app.models.folder import Folder
+from app.repositories.file import delete, listdir
+from app.repositories.intent import (
+    Intent,
+    apply_intent_actions,
+    list_intents,
+    remove_intent,
+    write_intent,
+)
+from app.repositories.orm import ORMRepository
+
+log = logging.getLogger(__name__)
+
+INTENT_MARKER_MODELS = {
+    File.__tablename__: File,
+    FileRevision.__tablename__: FileRevision,
+    Folder.__tablename__: Folder,
+}
+
+
+async def begin_intent(intent: Intent) -> None:
+    """
+    Journal an operation before its first filesystem effect. Failure
+    propagates, so the operation is aborted with nothing to undo.
+    """
+    await write_intent(intent)
+
+
+async def end_intent(intent: Intent | None) -> None:
+    """
+    Remove the intent of an operation the process has finished,
+    whatever its outcome. Removal is best-effort: an intent left behind
+    is replayed on the next mount with the same outcome.
+    """
+    if intent is None:
+        return
+
+    try:
+        await remove_intent(intent)
+
+    except Exception:
+        log.exception(
+            "event=%s intent_id=%s",
+            E.INTENT_REMOVE_FAILED, intent.intent_id,
+        )
+
+
+async def replay_intents() -> None:
+    """
+    Finish operations interrupted by a crash. For every intent left in
+    the journal, the commit marker is looked up in the database and the
+    matching actions are applied; intents that cannot be replayed are
+    logged and kept for the next mount. Once the journal is empty,
+    temporary files are cleared, since no operation can own them while
+    the storage is being mounted.
+    """
+    log.info("event=%s", E.INTENT_REPLAY_STARTED)
+    intents = await list_intents()
+    failed_count = 0
+
+    async with SessionLocal() as session:
+        repository = ORMRepository(session)
+
+        for intent in intents:
+            try:
+                committed = await _is_committed(repository, intent)
+                await apply_intent_actions(
+                    intent.on_commit if committed else intent.on_rollback,
+                )
+                await remove_intent(intent)
+
+            except Exception:
+                log.exception(
+                    "event=%s intent_id=%s operation=%s",
+                    E.INTENT_REPLAY_FAILED,
+                    intent.intent_id, intent.operation,
+                )
+                failed_count += 1
+                continue
+
+            log.info(
+                "event=%s intent_id=%s operation=%s committed=%s",
+                E.INTENT_REPLAY_APPLIED,
+                intent.intent_id, intent.operation, committed,
+            )
+
+    if failed_count == 0:
+        await _clear_tmp_dir()
+
+    log.info(
+        "event=%s intents_count=%s failed_count=%s",
+        E.INTENT_REPLAY_COMPLETED, len(intents), failed_count,
+    )
+
+
+async def _is_committed(repository: ORMRepository, intent: Intent) -> bool:
+    model = INTENT_MARKER_MODELS[intent.table]
+    present = await repository.count_all(model, **intent.filters) > 0
+    return present == intent.committed_if_present
+
+
+async def _clear_tmp_dir() -> None:
+    config = get_config()
+    names = await listdir(config.FILES_TMP_DIR)
+
+    for name in names:
+        await delete(os.path.join(config.FILES_TMP_DIR, name))
+
+    if names:
+        log.info(
+            "event=%s files_count=%s",
+            E.INTENT_REPLAY_TMP_CLEARED, len(names),
+        )
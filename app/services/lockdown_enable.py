@@ -15,8 +15,8 @@ from app.events import Events as E
 from app.hooks import hooks
 from app.locks import LockType, locks
 from app.repositories.file import isfile, read, touch
+from app.runtime.crypto import decrypt_passphrase
 from app.security.cipherdir import is_master_password_attempt_throttled
-from app.security.encryption import decrypt_passphrase
 
 log = logging.getLogger(__name__)
 
@@ -51,7 +51,7 @@ async def enable_lockdown(
         )
 
         try:
-            decrypt_passphrase(
+            await decrypt_passphrase(
                 passphrase_encrypted,
                 master_password.encode("utf-8"),
             )
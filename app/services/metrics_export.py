@@ -0,0 +1,31 @@
+# app/services/metrics_export.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from app.cache.lru import get_revision_cache, get_thumbnail_cache
+from app.runtime.load import request_load
+from app.runtime.metrics import (
+    CACHE_BYTES,
+    CACHE_ENTRIES,
+    HTTP_REQUESTS_IN_PROGRESS,
+    registry,
+)
+
+
+def export_metrics() -> str:
+    """
+    Return the metrics registry in the Prometheus text format. Gauges
+    of in-memory state (active requests, cache sizes) are read just
+    before rendering; counters and histograms are kept up to date by
+    the code they measure.
+    """
+    HTTP_REQUESTS_IN_PROGRESS.labels().set(request_load.active)
+
+    caches = {
+        "thumbnail": get_thumbnail_cache(),
+        "revision": get_revision_cache(),
+    }
+    for name, cache in caches.items():
+        CACHE_ENTRIES.labels(name).set(cache.count)
+        CACHE_BYTES.labels(name).set(cache.current_bytes)
+
+    return registry.render()
@@ -0,0 +1,24 @@
+# app/services/metrics_history_retrieve.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import time
+
+from app.config import get_config
+from app.runtime.metrics_history import get_metrics_history
+from app.schemas.metrics_history_retrieve import MetricsHistoryRequest
+
+
+def retrieve_metrics_history(params: MetricsHistoryRequest) -> dict:
+    """
+    Return the numeric metrics sampled in the last params.minutes
+    minutes as one list per metric, aligned with the sample timestamps.
+    The history is empty while background sampling is disabled.
+    """
+    start_time = time.time() - params.minutes * 60
+
+    return {
+        "sample_interval_seconds": (
+            get_config().METRICS_SAMPLE_INTERVAL_SECONDS
+        ),
+        **get_metrics_history().since(start_time),
+    }
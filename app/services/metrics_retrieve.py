@@ -10,12 +10,37 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.cache.lru import get_thumbnail_cache
 from app.config import get_config
+from app.log import get_dropped_log_count
 from app.repositories.file import get_filesize
+from app.runtime.metrics_history import get_metrics_history
+from app.runtime.rate_limit import get_rate_limiter
 from app.runtime.uptime import APPLICATION_START_TIME
 from app.version import __version__
 
 
 async def retrieve_metrics(session: AsyncSession) -> dict:
+    """
+    Return the latest background sample of the metrics. The metrics
+    are collected on the spot when sampling is disabled or the latest
+    sample is older than two sampling intervals (none taken yet, or
+    ticks skipped while the storage was unavailable).
+    """
+    interval = get_config().METRICS_SAMPLE_INTERVAL_SECONDS
+    latest = get_metrics_history().latest()
+
+    if interval > 0 and latest is not None:
+        sample_time, sample = latest
+        if time.time() - sample_time <= 2 * interval:
+            return sample
+
+    return await collect_metrics(session)
+
+
+async def collect_metrics(session: AsyncSession) -> dict:
+    """
+    Collect application, system, process, SQLite, cache, rate limit
+    and logging metrics.
+    """
     config = get_config()
 
     disk = psutil.disk_usage("/")
@@ -79,6 +104,8 @@ async def retrieve_metrics(session: AsyncSession) -> dict:
         sqlite_pool.overflow() if sqlite_pool else None
     )
 
+    rate_limiter = get_rate_limiter()
+
     start_time = time.perf_counter()
     await session.execute(text("SELECT 1"))
     sqlite_latency = time.perf_counter() - start_time
@@ -136,4 +163,11 @@ async def retrieve_metrics(session: AsyncSession) -> dict:
         "lru_cache_entry_count": get_thumbnail_cache().count,
         "lru_cache_current_bytes": get_thumbnail_cache().current_bytes,
         "lru_cache_max_bytes": get_thumbnail_cache().max_bytes,
+
+        "rate_limit_enabled": rate_limiter.enabled,
+        "rate_limit_bucket_count": rate_limiter.bucket_count,
+        "rate_limit_allowed_count": rate_limiter.allowed_count,
+        "rate_limit_rejected_count": rate_limiter.rejected_count,
+
+        "log_dropped_count": get_dropped_log_count(),
     }
@@ -0,0 +1,19 @@
+# app/services/metrics_sample.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import time
+
+from app.db.engine import SessionLocal
+from app.runtime.metrics_history import get_metrics_history
+from app.services.metrics_retrieve import collect_metrics
+
+
+async def sample_metrics() -> None:
+    """
+    Collect the metrics and append them to the metrics history, so that
+    the metrics endpoints are served from memory.
+    """
+    async with SessionLocal() as session:
+        sample = await collect_metrics(session)
+
+    get_metrics_history().append(time.time(), sample)
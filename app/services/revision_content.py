@@ -0,0 +1,180 @@
+# app/services/revision_content.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import hashlib
+from collections.abc import Sequence
+
+from app.cache.lru import get_revision_cache
+from app.constants import (
+    REVISION_DELTA_KEYFRAME_INTERVAL,
+    REVISION_DELTA_MAX_BYTES,
+)
+from app.models.file import File
+from app.models.file_revision import FileRevision
+from app.repositories.delta import read_delta, write_delta
+from app.repositories.file import read, write
+from app.repositories.orm import ORMRepository
+
+# NOTE (ADR-76): Text revisions are stored as reverse deltas.
+# A revision of a text file holds a delta that rebuilds it from the
+# next newer version: the next revision, or the current file for the
+# newest one. Creating a revision never rewrites older ones, since the
+# previous current content becomes the new revision. Every
+# REVISION_DELTA_KEYFRAME_INTERVAL-th revision in a row is a full copy,
+# so a revision is rebuilt from at most that many blobs. Removing a
+# revision re-encodes the delta that used it as a base, as a full copy
+# if a removed full copy is skipped.
+
+
+async def is_delta_due(
+    repository: ORMRepository,
+    file: File,
+    new_filesize: int,
+) -> bool:
+    """
+    Return True if the revision created from the current content of a
+    text file should be stored as a delta against its new content, or
+    False if a full copy is due: the file is not text or too large, or
+    the newest revisions are a full run of deltas.
+    """
+    if not file.is_text or max(file.filesize, new_filesize) > (
+        REVISION_DELTA_MAX_BYTES
+    ):
+        return False
+
+    newest = await repository.select_all(
+        FileRevision,
+        file_id=file.id,
+        order_by="revision_number",
+        order="desc",
+        limit=REVISION_DELTA_KEYFRAME_INTERVAL - 1,
+    )
+
+    return not (
+        len(newest) == REVISION_DELTA_KEYFRAME_INTERVAL - 1
+        and all(revision.is_delta for revision in newest)
+    )
+
+
+async def write_revision_delta(
+    file_path: str,
+    new_path: str,
+    delta_path: str,
+) -> None:
+    """
+    Write the current content at file_path as a delta against the new
+    content at new_path.
+    """
+    await write_delta(await read(new_path), await read(file_path), delta_path)
+
+
+async def reconstruct_revision(
+    file: File,
+    revision: FileRevision,
+    file_path: str,
+) -> bytes:
+    """
+    Return the content of a delta revision. Deltas are applied from
+    the nearest newer full copy, cached revision, or the current file
+    at file_path, which must not change meanwhile. The result is
+    verified against the revision checksum and cached; ValueError is
+    raised on a mismatch or a malformed delta.
+    """
+    cache = get_revision_cache()
+    cached = cache.get(revision.id)
+    if cached is not None:
+        return cached[1]
+
+    chain = sorted(
+        (
+            item for item in file.file_revisions
+            if item.revision_number >= revision.revision_number
+        ),
+        key=lambda item: item.revision_number,
+    )
+    deltas = []
+    content = None
+
+    for item in chain:
+        cached = cache.get(item.id)
+        if cached is not None:
+            content = cached[1]
+            break
+        if not item.is_delta:
+            content = await read(item.absolute_path)
+            break
+        deltas.append(item)
+
+    if content is None:
+        content = await read(file_path)
+
+    for item in reversed(deltas):
+        content = await read_delta(content, item.absolute_path)
+
+    if hashlib.sha256(content).hexdigest() != revision.checksum:
+        raise ValueError("Revision checksum mismatch")
+
+    cache.put(revision.id, revision.mimetype, content)
+    return content
+
+
+def select_rebased_revisions(
+    revisions: Sequence[FileRevision],
+    expired: Sequence[FileRevision],
+) -> list[tuple[FileRevision, FileRevision | None, bool]]:
+    """
+    Return the kept delta revisions whose base is among the expired
+    revisions, each with its new base (the nearest newer kept revision,
+    or None for the current file) and whether it must become a full
+    copy because an expired full copy lies between them.
+    """
+    ordered = sorted(revisions, key=lambda item: item.revision_number)
+    expired_ids = {item.id for item in expired}
+    rebased = []
+
+    for index, revision in enumerate(ordered):
+        if revision.id in expired_ids or not revision.is_delta:
+            continue
+
+        skipped = []
+        base = None
+        for item in ordered[index + 1:]:
+            if item.id not in expired_ids:
+                base = item
+                break
+            skipped.append(item)
+
+        if skipped:
+            keyframe = any(not item.is_delta for item in skipped)
+            rebased.append((revision, base, keyframe))
+
+    return rebased
+
+
+async def rebase_revision(
+    file: File,
+    revision: FileRevision,
+    base: FileRevision | None,
+    keyframe: bool,
+    file_path: str,
+    blob_path: str,
+) -> None:
+    """
+    Write the content of a delta revision to blob_path as a full copy
+    if keyframe is set, or else as a delta against base, or against the
+    current file if base is None.
+    """
+    content = await reconstruct_revision(file, revision, file_path)
+
+    if keyframe:
+        await write(blob_path, content)
+        return
+
+    if base is None:
+        base_content = await read(file_path)
+    elif base.is_delta:
+        base_content = await reconstruct_revision(file, base, file_path)
+    else:
+        base_content = await read(base.absolute_path)
+
+    await write_delta(base_content, content, blob_path)
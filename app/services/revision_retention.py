@@ -0,0 +1,534 @@
+# app/services/revision_retention.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import json
+import logging
+import os
+import time
+import uuid
+from collections.abc import Sequence
+from dataclasses import astuple, dataclass, fields, replace
+from typing import Any, Protocol
+
+from sqlalchemy import select
+
+from app.audit import write_audit
+from app.config import get_config
+from app.constants import (
+    REVISION_COMPACT_MAX_REVISIONS_PER_RUN,
+    REVISION_RETENTION_BATCH_FILES,
+    REVISION_RETENTION_FOLDER_KEY_PREFIX,
+    REVISION_RETENTION_VARIABLE_NAMESPACE,
+)
+from app.db.engine import SessionLocal
+from app.events import Events as E
+from app.locks import LockType, locks
+from app.models.file import File
+from app.models.file_revision import FileRevision
+from app.models.folder import Folder
+from app.models.variable import Variable
+from app.repositories.file import delete
+from app.repositories.intent import ACTION_DELETE, Intent
+from app.repositories.orm import ORMRepository
+from app.services.intent import begin_intent, end_intent
+from app.services.revision_content import (
+    rebase_revision,
+    select_rebased_revisions,
+)
+
+log = logging.getLogger(__name__)
+
+# NOTE (ADR-75): Revision retention is enforced by a background job.
+# A policy keeps the last N revisions of a file and the newest revision
+# of each of the last N days, weeks and months, and then caps the total
+# size of the kept revisions. The global policy comes from config and
+# can be overridden per folder subtree in the Variable table; revisions
+# in write-protected folders are never removed. The compactor deletes
+# expired rows in one statement per file under the file's write lock
+# and removes their blobs after commit through the intent journal.
+# Revision numbers follow latest_revision_number, so removed revisions
+# leave gaps and numbers are never reused.
+
+
+class _RevisionRow(Protocol):
+    revision_number: int
+    created_at: int
+    filesize: int
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Rules deciding which revisions of a file are kept."""
+
+    keep_last: int = 0
+    keep_daily: int = 0
+    keep_weekly: int = 0
+    keep_monthly: int = 0
+    max_bytes: int = 0
+
+    @property
+    def keeps_all(self) -> bool:
+        """Return True if the policy never expires a revision."""
+        return not any(astuple(self))
+
+
+@dataclass
+class RetentionEstimate:
+    """Space that the retention policy would reclaim."""
+
+    files_count: int = 0
+    revisions_count: int = 0
+    revisions_bytes: int = 0
+    expired_files_count: int = 0
+    expired_revisions_count: int = 0
+    expired_bytes: int = 0
+
+
+_PERIOD_FORMATS = (
+    ("keep_daily", "%Y-%m-%d"),
+    ("keep_weekly", "%G-%V"),
+    ("keep_monthly", "%Y-%m"),
+)
+
+
+def get_default_policy() -> RetentionPolicy:
+    """Return the retention policy configured for all folders."""
+    config = get_config()
+    return RetentionPolicy(
+        keep_last=config.REVISIONS_KEEP_LAST,
+        keep_daily=config.REVISIONS_KEEP_DAILY,
+        keep_weekly=config.REVISIONS_KEEP_WEEKLY,
+        keep_monthly=config.REVISIONS_KEEP_MONTHLY,
+        max_bytes=config.REVISIONS_MAX_BYTES_PER_FILE,
+    )
+
+
+def parse_policy(value: str, default: RetentionPolicy) -> RetentionPolicy:
+    """
+    Parse a folder policy override: a JSON object with any of the
+    policy fields as non-negative integers. Missing fields are taken
+    from the default policy. Raises ValueError on invalid input.
+    """
+    data = json.loads(value)
+    if not isinstance(data, dict):
+        raise ValueError("policy must be a JSON object")
+
+    names = {f.name for f in fields(RetentionPolicy)}
+    for name, number in data.items():
+        if name not in names:
+            raise ValueError(f"unknown policy field: {name}")
+        if (
+            not isinstance(number, int)
+            or isinstance(number, bool)
+            or number < 0
+        ):
+            raise ValueError(f"invalid value of policy field: {name}")
+
+    return replace(default, **data)
+
+
+async def load_folder_policies(
+    repository: ORMRepository,
+    default: RetentionPolicy,
+) -> dict[int, RetentionPolicy]:
+    """
+    Return folder policy overrides keyed by folder id. Invalid
+    overrides are logged and ignored.
+    """
+    variables = await repository.select_all(
+        Variable,
+        namespace=REVISION_RETENTION_VARIABLE_NAMESPACE,
+    )
+    policies = {}
+
+    for variable in variables:
+        key = variable.variable_key
+        try:
+            if not key.startswith(REVISION_RETENTION_FOLDER_KEY_PREFIX):
+                raise ValueError("unknown key")
+            folder_id = int(
+                key.removeprefix(REVISION_RETENTION_FOLDER_KEY_PREFIX),
+            )
+            policies[folder_id] = parse_policy(
+                variable.variable_value, default,
+            )
+
+        except ValueError:
+            log.warning(
+                "event=%s variable_key=%s",
+                E.REVISION_RETENTION_POLICY_INVALID, key,
+            )
+
+    return policies
+
+
+def resolve_policy(
+    folder: Folder,
+    parent_chain: tuple[Folder, ...],
+    default: RetentionPolicy,
+    overrides: dict[int, RetentionPolicy],
+) -> RetentionPolicy:
+    """
+    Return the policy of files in the folder: the override of the
+    nearest folder up the chain, or the default. Write-protected
+    subtrees keep all revisions.
+    """
+    if (
+        folder.is_write_protected
+        or folder.is_write_protected_recursive(parent_chain)
+    ):
+        return RetentionPolicy()
+
+    for node in (folder, *parent_chain):
+        if node.id in overrides:
+            return overrides[node.id]
+
+    return default
+
+
+def select_expired_revisions(
+    revisions: Sequence[_RevisionRow],
+    policy: RetentionPolicy,
+) -> list[_RevisionRow]:
+    """
+    Return the revisions of one file that the policy does not keep,
+    newest first. Periods are calendar days, ISO weeks and months in
+    UTC; a period without revisions does not count towards its limit.
+    """
+    if policy.keeps_all:
+        return []
+
+    ordered = sorted(
+        revisions,
+        key=lambda revision: revision.revision_number,
+        reverse=True,
+    )
+
+    if any((
+        policy.keep_last,
+        policy.keep_daily,
+        policy.keep_weekly,
+        policy.keep_monthly,
+    )):
+        kept = set(range(min(policy.keep_last, len(ordered))))
+
+        for name, period_format in _PERIOD_FORMATS:
+            limit = getattr(policy, name)
+            periods = set()
+
+            for index, revision in enumerate(ordered):
+                if len(periods) >= limit:
+                    break
+                period = time.strftime(
+                    period_format, time.gmtime(revision.created_at),
+                )
+                if period not in periods:
+                    periods.add(period)
+                    kept.add(index)
+
+    else:
+        kept = set(range(len(ordered)))
+
+    if policy.max_bytes:
+        kept_bytes = 0
+        for index in sorted(kept):
+            kept_bytes += ordered[index].filesize
+            if kept_bytes > policy.max_bytes:
+                kept = {i for i in kept if i < index}
+                break
+
+    return [
+        revision for index, revision in enumerate(ordered)
+        if index not in kept
+    ]
+
+
+async def estimate_retention(
+    repository: ORMRepository,
+) -> RetentionEstimate:
+    """
+    Apply the retention policies to all revisions without deleting
+    anything and return what the compactor would reclaim. Only
+    revision metadata is read.
+    """
+    default = get_default_policy()
+    overrides = await load_folder_policies(repository, default)
+    policies: dict[int, RetentionPolicy] = {}
+    estimate = RetentionEstimate()
+    after_file_id = 0
+
+    while True:
+        batch = await _select_revision_batch(repository, after_file_id)
+        if not batch:
+            return estimate
+
+        for file_id, (folder_id, revisions) in batch.items():
+            policy = await _get_folder_policy(
+                repository, folder_id, default, overrides, policies,
+            )
+            expired = select_expired_revisions(revisions, policy)
+
+            estimate.files_count += 1
+            estimate.revisions_count += len(revisions)
+            estimate.revisions_bytes += sum(r.filesize for r in revisions)
+
+            if expired:
+                estimate.expired_files_count += 1
+                estimate.expired_revisions_count += len(expired)
+                estimate.expired_bytes += sum(r.filesize for r in expired)
+
+        after_file_id = max(batch)
+
+
+async def compact_revisions() -> None:
+    """
+    Delete revisions that are not kept by the retention policies and
+    reclaim their blobs. Candidates are found from revision metadata;
+    at most REVISION_COMPACT_MAX_REVISIONS_PER_RUN revisions are
+    removed per run, the rest is picked up by the next run.
+    """
+    default = get_default_policy()
+    async with SessionLocal() as session:
+        overrides = await load_folder_policies(
+            ORMRepository(session), default,
+        )
+
+    if default.keeps_all and all(
+        policy.keeps_all for policy in overrides.values()
+    ):
+        return
+
+    log.debug("event=%s", E.REVISION_COMPACT_STARTED)
+
+    budget = REVISION_COMPACT_MAX_REVISIONS_PER_RUN
+    policies: dict[int, RetentionPolicy] = {}
+    removed_count = 0
+    removed_bytes = 0
+    after_file_id = 0
+
+    while budget > 0:
+        async with SessionLocal() as session:
+            repository = ORMRepository(session)
+            batch = await _select_revision_batch(repository, after_file_id)
+            candidates = []
+
+            for file_id, (folder_id, revisions) in batch.items():
+                policy = await _get_folder_policy(
+                    repository, folder_id, default, overrides, policies,
+                )
+                if select_expired_revisions(revisions, policy):
+                    candidates.append(file_id)
+
+        if not batch:
+            break
+
+        for file_id in candidates:
+            try:
+                count, size = await _compact_file(
+                    file_id, default, overrides, budget,
+                )
+            except Exception:
+                log.exception(
+                    "event=%s file_id=%s",
+                    E.REVISION_COMPACT_FILE_FAILED, file_id,
+                )
+                continue
+
+            removed_count += count
+            removed_bytes += size
+            budget -= count
+
+            if budget <= 0:
+                break
+
+        after_file_id = max(batch)
+
+    log.debug(
+        "event=%s removed_count=%s removed_bytes=%s",
+        E.REVISION_COMPACT_COMPLETED, removed_count, removed_bytes,
+    )
+
+
+async def _select_revision_batch(
+    repository: ORMRepository,
+    after_file_id: int,
+) -> dict[int, tuple[int, list[Any]]]:
+    """
+    Return metadata of all revisions of the next files that have
+    revisions, keyed by file id, with the folder id of each file.
+    """
+    session = repository.session
+    result = await session.execute(
+        select(FileRevision.file_id)
+        .where(FileRevision.file_id > after_file_id)
+        .group_by(FileRevision.file_id)
+        .order_by(FileRevision.file_id)
+        .limit(REVISION_RETENTION_BATCH_FILES)
+    )
+    file_ids = list(result.scalars().all())
+
+    if not file_ids:
+        return {}
+
+    result = await session.execute(
+        select(
+            FileRevision.file_id,
+            File.folder_id,
+            FileRevision.revision_number,
+            FileRevision.created_at,
+            FileRevision.filesize,
+        )
+        .join(File, File.id == FileRevision.file_id)
+        .where(FileRevision.file_id.in_(file_ids))
+        .order_by(FileRevision.file_id)
+    )
+
+    batch: dict[int, tuple[int, list[Any]]] = {}
+    for row in result.all():
+        batch.setdefault(row.file_id, (row.folder_id, []))[1].append(row)
+
+    return batch
+
+
+async def _get_folder_policy(
+    repository: ORMRepository,
+    folder_id: int,
+    default: RetentionPolicy,
+    overrides: dict[int, RetentionPolicy],
+    policies: dict[int, RetentionPolicy],
+) -> RetentionPolicy:
+    if folder_id not in policies:
+        folder = await repository.select(Folder, obj_id=folder_id)
+        parent_chain = await repository.select_parent_chain(folder)
+        policies[folder_id] = resolve_policy(
+            folder, parent_chain, default, overrides,
+        )
+
+    return policies[folder_id]
+
+
+async def _compact_file(
+    file_id: int,
+    default: RetentionPolicy,
+    overrides: dict[int, RetentionPolicy],
+    budget: int,
+) -> tuple[int, int]:
+    """
+    Delete up to budget expired revisions of one file, oldest first,
+    and return their number and total size. The file is reselected
+    under its write lock, so the policy is applied to current rows.
+    Kept deltas based on an expired revision are re-encoded into new
+    blobs (ADR-76), so the old chain stays readable until commit.
+    """
+    async with SessionLocal() as session:
+        repository = ORMRepository(session)
+        file = await repository.select(File, obj_id=file_id)
+        if file is None:
+            return 0, 0
+
+        parent_chain = await repository.select_parent_chain(file.file_folder)
+        file_path = file.get_absolute_path(file.file_folder, parent_chain)
+
+    async with (
+        locks.lock_file(file_path, LockType.WRITE),
+        SessionLocal() as session,
+    ):
+        repository = ORMRepository(session)
+        file = await repository.select(File, obj_id=file_id)
+        if file is None:
+            return 0, 0
+
+        folder = file.file_folder
+        parent_chain = await repository.select_parent_chain(folder)
+        if file.get_absolute_path(folder, parent_chain) != file_path:
+            return 0, 0
+
+        policy = resolve_policy(folder, parent_chain, default, overrides)
+        revisions = await repository.select_all(
+            FileRevision,
+            file_id=file.id,
+        )
+        expired = select_expired_revisions(revisions, policy)[-budget:]
+        if not expired:
+            return 0, 0
+
+        rebased = select_rebased_revisions(revisions, expired)
+        replaced_paths = [revision.absolute_path for revision, *_ in rebased]
+        rebased_paths = [
+            os.path.join(os.path.dirname(path), str(uuid.uuid4()))
+            for path in replaced_paths
+        ]
+        obsolete_paths = [
+            revision.absolute_path for revision in expired
+        ] + replaced_paths
+
+        # Blobs are listed in the intent so that a crash after commit
+        # still removes them on the next mount.
+        intent = Intent(
+            operation="revision_compact",
+            table=FileRevision.__tablename__,
+            filters={"id__in": [revision.id for revision in expired]},
+            committed_if_present=False,
+            on_commit=[(ACTION_DELETE, path) for path in obsolete_paths],
+            on_rollback=[(ACTION_DELETE, path) for path in rebased_paths],
+        )
+
+        try:
+            await begin_intent(intent)
+
+            for (revision, base, keyframe), path in zip(
+                rebased, rebased_paths,
+            ):
+                await rebase_revision(
+                    file, revision, base, keyframe, file_path, path,
+                )
+
+            for (revision, _, keyframe), path in zip(
+                rebased, rebased_paths,
+            ):
+                revision.revision_uuid = os.path.basename(path)
+                revision.is_delta = not keyframe
+                await repository.update(revision)
+
+            await repository.delete_all(
+                FileRevision,
+                id__in=[revision.id for revision in expired],
+            )
+
+            await write_audit(
+                repository=repository,
+                event=E.REVISION_COMPACT_FILE_COMPACTED,
+                resource_type=File.__tablename__,
+                resource_id=file.id,
+            )
+            await repository.commit()
+
+        except Exception:
+            await repository.rollback()
+            for path in rebased_paths:
+                await _delete_blob(path)
+            raise
+
+        else:
+            for path in obsolete_paths:
+                await _delete_blob(path)
+
+        finally:
+            await end_intent(intent)
+
+    removed_bytes = sum(revision.filesize for revision in expired)
+    log.info(
+        "event=%s file_id=%s removed_count=%s removed_bytes=%s",
+        E.REVISION_COMPACT_FILE_COMPACTED,
+        file_id, len(expired), removed_bytes,
+    )
+    return len(expired), removed_bytes
+
+
+async def _delete_blob(path: str) -> None:
+    try:
+        await delete(path)
+    except Exception:
+        log.exception(
+            "event=%s path=%s", E.REVISION_COMPACT_CLEANUP_FAILED, path,
+        )
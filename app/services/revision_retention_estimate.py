@@ -0,0 +1,38 @@
+# app/services/revision_retention_estimate.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import logging
+from dataclasses import asdict
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.events import Events as E
+from app.hooks import hooks
+from app.repositories.orm import ORMRepository
+from app.schemas.revision_retention_estimate import (
+    RevisionRetentionEstimateResponse,
+)
+from app.services.revision_retention import estimate_retention
+
+log = logging.getLogger(__name__)
+
+
+async def estimate_revision_retention(
+    session: AsyncSession,
+) -> RevisionRetentionEstimateResponse:
+    """
+    Return the space the revision compactor would reclaim under the
+    current retention policies. Nothing is deleted.
+    """
+    log.info("event=%s", E.REVISION_RETENTION_ESTIMATE_STARTED)
+
+    estimate = await estimate_retention(ORMRepository(session))
+
+    log.info(
+        "event=%s expired_revisions_count=%s expired_bytes=%s",
+        E.REVISION_RETENTION_ESTIMATE_COMPLETED,
+        estimate.expired_revisions_count, estimate.expired_bytes,
+    )
+    await hooks.emit(E.REVISION_RETENTION_ESTIMATE_COMPLETED, session, None)
+
+    return RevisionRetentionEstimateResponse.model_validate(asdict(estimate))
@@ -0,0 +1,22 @@
+# app/services/sql_statement_list.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+from app.config import get_config
+from app.db.slow_sql import get_slow_sql_log
+from app.schemas.sql_statement_list import SqlStatementListRequest
+
+
+def list_slow_sql_statements(params: SqlStatementListRequest) -> dict:
+    """
+    Return the slow SQL statements recorded by this process, the most
+    costly first, with their execution statistics and query plans.
+    The list is empty while slow statement logging is disabled.
+    """
+    statements = get_slow_sql_log().top(params.limit, params.order_by)
+
+    return {
+        "threshold_milliseconds": (
+            get_config().SQL_SLOW_THRESHOLD_MILLISECONDS
+        ),
+        "statements": [statement.to_dict() for statement in statements],
+    }
@@ -0,0 +1,146 @@
+# app/services/thumbnail_generate.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import logging
+import uuid
+
+from app.constants import THUMBNAILS_GENERATE_BATCH_SIZE
+from app.db.engine import SessionLocal
+from app.events import Events as E
+from app.locks import LockType, locks
+from app.models.file import File
+from app.models.file_thumbnail import FileThumbnail
+from app.repositories.file import (
+    IMAGE_MIME_TYPES,
+    delete,
+    get_filesize,
+    get_mimetype,
+)
+from app.repositories.image import create_thumbnail, get_image_size
+from app.repositories.orm import ORMRepository
+
+log = logging.getLogger(__name__)
+
+# Files after this ID are checked by the next run. Images that cannot
+# be thumbnailed are retried once per cycle over all files.
+_last_file_id = 0
+
+
+async def generate_thumbnails() -> None:
+    """
+    Create missing thumbnails of image files, such as files created by
+    an archive import. At most THUMBNAILS_GENERATE_BATCH_SIZE files
+    are processed per run; the rest is picked up by the next run.
+    """
+    global _last_file_id
+
+    log.debug("event=%s", E.THUMBNAIL_GENERATE_STARTED)
+
+    async with SessionLocal() as session:
+        repository = ORMRepository(session)
+        files = await repository.select_all(
+            File,
+            id__gt=_last_file_id,
+            mimetype__in=sorted(IMAGE_MIME_TYPES),
+            id__notsubquery=repository.make_subquery(
+                FileThumbnail, "file_id",
+            ),
+            order_by="id",
+            limit=THUMBNAILS_GENERATE_BATCH_SIZE,
+        )
+
+        _last_file_id = (
+            files[-1].id if len(files) == THUMBNAILS_GENERATE_BATCH_SIZE
+            else 0
+        )
+
+        candidates = []
+        for file in files:
+            parent_chain = await repository.select_parent_chain(
+                file.file_folder,
+            )
+            candidates.append((
+                file.id,
+                file.checksum,
+                file.created_by,
+                file.get_absolute_path(file.file_folder, parent_chain),
+            ))
+
+        created_count = 0
+
+        for file_id, checksum, created_by, file_path in candidates:
+            try:
+                created_count += await _generate_thumbnail(
+                    repository, file_id, checksum, created_by, file_path,
+                )
+            except Exception:
+                log.exception(
+                    "event=%s file_id=%s",
+                    E.THUMBNAIL_GENERATE_FILE_FAILED, file_id,
+                )
+
+    log.debug(
+        "event=%s created_count=%s",
+        E.THUMBNAIL_GENERATE_COMPLETED, created_count,
+    )
+
+
+async def _generate_thumbnail(
+    repository: ORMRepository,
+    file_id: int,
+    checksum: str,
+    created_by: int,
+    file_path: str,
+) -> int:
+    # A file moved, replaced or thumbnailed meanwhile is skipped; it is
+    # checked again under the file lock before the thumbnail is made.
+    async with locks.lock_file(file_path, LockType.WRITE):
+        file = await repository.select(File, obj_id=file_id)
+        if file is None or file.checksum != checksum:
+            return 0
+
+        parent_chain = await repository.select_parent_chain(file.file_folder)
+        if file.get_absolute_path(file.file_folder, parent_chain) != file_path:
+            return 0
+
+        if await repository.select(FileThumbnail, file_id=file_id):
+            return 0
+
+        thumbnail = FileThumbnail(
+            file_id=file_id,
+            created_by=created_by,
+            thumbnail_uuid=str(uuid.uuid4()),
+            filesize=0,
+            mimetype=None,
+            width=0,
+            height=0,
+        )
+        thumbnail_path = thumbnail.absolute_path
+
+        try:
+            await create_thumbnail(file_path, thumbnail_path)
+            thumbnail.filesize = await get_filesize(thumbnail_path)
+            thumbnail.mimetype = await get_mimetype(thumbnail_path)
+            thumbnail.width, thumbnail.height = await get_image_size(
+                thumbnail_path,
+            )
+
+            await repository.insert(thumbnail, flush=False)
+            await repository.commit()
+
+        except Exception:
+            await repository.rollback()
+            await _cleanup_path(thumbnail_path)
+            raise
+
+    return 1
+
+
+async def _cleanup_path(path: str) -> None:
+    try:
+        await delete(path)
+
+    except Exception:
+        log.exception(
+            "event=%s path=%s", E.THUMBNAIL_GENERATE_CLEANUP_FAILED, path,
+        )
@@ -0,0 +1,86 @@
+# app/services/trash_reclaim.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import logging
+import os
+
+from app.config import get_config
+from app.constants import FILES_TRASH_RECLAIM_MAX_FILES_PER_RUN
+from app.events import Events as E
+from app.repositories.file import delete, delete_tree
+from app.repositories.trash import (
+    MANIFEST_REVISIONS,
+    MANIFEST_THUMBNAILS,
+    get_trash_tree_path,
+    list_sealed_trash_entries,
+    read_trash_manifest,
+    remove_trash_entry,
+    write_trash_manifest,
+)
+
+log = logging.getLogger(__name__)
+
+
+async def reclaim_trash() -> None:
+    """
+    Remove revisions, thumbnails, and file trees of recursively deleted
+    folders from sealed trash entries. At most
+    FILES_TRASH_RECLAIM_MAX_FILES_PER_RUN files are removed per run;
+    the rest is picked up by the next run.
+    """
+    log.debug("event=%s", E.TRASH_RECLAIM_STARTED)
+
+    budget = FILES_TRASH_RECLAIM_MAX_FILES_PER_RUN
+    removed_count = 0
+
+    for entry_dir in await list_sealed_trash_entries():
+        remaining = await _reclaim_entry(entry_dir, budget)
+        removed_count += budget - remaining
+        budget = remaining
+
+        if budget <= 0:
+            break
+
+    log.debug(
+        "event=%s removed_count=%s",
+        E.TRASH_RECLAIM_COMPLETED, removed_count,
+    )
+
+
+async def _reclaim_entry(entry_dir: str, budget: int) -> int:
+    """
+    Reclaim one trash entry within budget and return the unused budget.
+    The entry is removed once its blobs and tree are gone; otherwise
+    its manifest is shortened so the next run resumes where this one
+    stopped.
+    """
+    config = get_config()
+    manifest = await read_trash_manifest(entry_dir)
+    remaining = {}
+
+    for key, base_dir in (
+        (MANIFEST_REVISIONS, config.FILES_REVISIONS_DIR),
+        (MANIFEST_THUMBNAILS, config.FILES_THUMBNAILS_DIR),
+    ):
+        names = manifest[key]
+        for name in names[:budget]:
+            await delete(os.path.join(base_dir, os.path.basename(name)))
+        remaining[key] = names[budget:]
+        budget -= len(names) - len(remaining[key])
+
+    if remaining != manifest:
+        await write_trash_manifest(entry_dir, remaining)
+
+    if any(remaining.values()):
+        return 0
+
+    removed = await delete_tree(get_trash_tree_path(entry_dir), budget)
+    if removed >= budget:
+        return 0
+
+    await remove_trash_entry(entry_dir)
+    log.info(
+        "event=%s entry_dir=%s",
+        E.TRASH_RECLAIM_ENTRY_REMOVED, entry_dir,
+    )
+    return budget - removed
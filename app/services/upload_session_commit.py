@@ -0,0 +1,106 @@
+# app/services/upload_session_commit.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.errors import ResourceConflictError, ResourceNotFoundError
+from app.events import Events as E
+from app.locks import LockType, locks
+from app.models.file import File
+from app.models.upload_session import UploadSession
+from app.models.user import User
+from app.repositories.file import isfile, rename
+from app.repositories.orm import ORMRepository
+from app.services.file_upload import store_upload
+from app.services.upload_session_select import find_upload_session
+
+log = logging.getLogger(__name__)
+
+
+async def commit_upload_session(
+    session: AsyncSession,
+    user: User,
+    upload_id: str,
+) -> File:
+    """
+    Store the content of a complete upload session as a file in its
+    target folder and close the session. The part file is moved into
+    the regular upload flow, which validates the folder, computes the
+    checksum, and creates a revision and thumbnail as needed. The part
+    file lock is held throughout, so chunk writes cannot interleave.
+
+    If the upload is rejected before the part file is moved, the
+    session is kept and the commit can be retried; once the staged
+    data is gone, the session is closed as well.
+    """
+    log.info("event=%s", E.UPLOAD_SESSION_COMMIT_STARTED)
+
+    repository = ORMRepository(session)
+    upload_session = await find_upload_session(repository, user, upload_id)
+
+    if upload_session is None:
+        log.warning("event=%s", E.UPLOAD_SESSION_COMMIT_NOT_FOUND)
+        raise ResourceNotFoundError
+
+    part_path = upload_session.absolute_path
+    async with locks.lock_file(part_path, LockType.WRITE):
+        current = await repository.select_values(
+            UploadSession, "received_ranges", id=upload_session.id,
+        )
+
+        if not current:
+            log.warning("event=%s", E.UPLOAD_SESSION_COMMIT_NOT_FOUND)
+            raise ResourceNotFoundError
+
+        upload_session.received_ranges = current[0]
+
+        if not upload_session.is_complete:
+            log.warning("event=%s", E.UPLOAD_SESSION_COMMIT_INCOMPLETE)
+            raise ResourceConflictError
+
+        if not await isfile(part_path):
+            log.warning("event=%s", E.UPLOAD_SESSION_COMMIT_DATA_LOST)
+            await _close_session(repository, upload_session)
+            raise ResourceNotFoundError
+
+        try:
+            file = await store_upload(
+                session,
+                user,
+                upload_session.folder_id,
+                upload_session.filename,
+                lambda tmp_path: rename(part_path, tmp_path),
+            )
+
+        except Exception:
+            if not await isfile(part_path):
+                log.warning("event=%s", E.UPLOAD_SESSION_COMMIT_DATA_LOST)
+                await _close_session(repository, upload_session)
+            raise
+
+        await _close_session(repository, upload_session)
+
+    log.info(
+        "event=%s file_id=%s",
+        E.UPLOAD_SESSION_COMMIT_COMPLETED, file.id,
+    )
+    return file
+
+
+async def _close_session(
+    repository: ORMRepository,
+    upload_session: UploadSession,
+) -> None:
+    """
+    Delete the session row once its part file is gone. A failure is
+    left to the expiry job, which removes the row later.
+    """
+    try:
+        await repository.delete_all(UploadSession, id=upload_session.id)
+        await repository.commit()
+
+    except Exception:
+        await repository.rollback()
+        log.exception("event=%s", E.UPLOAD_SESSION_COMMIT_CLOSE_FAILED)
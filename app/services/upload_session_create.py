@@ -0,0 +1,100 @@
+# app/services/upload_session_create.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import logging
+import time
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.audit import write_audit
+from app.config import get_config
+from app.errors import ResourceLockedError, ResourceNotFoundError
+from app.events import Events as E
+from app.hooks import hooks
+from app.locks import LockType, locks
+from app.models.folder import Folder
+from app.models.upload_session import UploadSession
+from app.models.user import User
+from app.repositories.file import delete, touch
+from app.repositories.orm import ORMRepository
+from app.schemas.upload_session_create import UploadSessionCreateRequest
+
+log = logging.getLogger(__name__)
+
+
+async def create_upload_session(
+    session: AsyncSession,
+    user: User,
+    folder_id: int,
+    data: UploadSessionCreateRequest,
+) -> UploadSession:
+    """
+    Open a resumable upload session for a file of known size in an
+    existing folder. An empty part file is reserved for the chunks;
+    the target folder is validated again when the session is
+    committed.
+    """
+    log.info(
+        "event=%s folder_id=%s",
+        E.UPLOAD_SESSION_CREATE_STARTED, folder_id,
+    )
+
+    repository = ORMRepository(session)
+    folder = await repository.select(Folder, obj_id=folder_id)
+
+    if folder is None:
+        log.warning("event=%s", E.UPLOAD_SESSION_CREATE_FOLDER_NOT_FOUND)
+        raise ResourceNotFoundError
+
+    parent_chain = await repository.select_parent_chain(folder)
+
+    if (
+        folder.is_write_protected or
+        folder.is_write_protected_recursive(parent_chain)
+    ):
+        log.warning(
+            "event=%s", E.UPLOAD_SESSION_CREATE_FOLDER_WRITE_PROTECTED,
+        )
+        raise ResourceLockedError
+
+    upload_session = UploadSession(
+        created_by=user.id,
+        expires_at=int(time.time()) + get_config().UPLOAD_SESSION_TTL_SECONDS,
+        folder_id=folder.id,
+        filename=data.filename,
+        filesize=data.filesize,
+        upload_uuid=str(uuid.uuid4()),
+        received_ranges="[]",
+    )
+
+    # The part file is created under its lock before the row commits,
+    # so the orphan sweep never removes it as unreferenced.
+
+    part_path = upload_session.absolute_path
+    async with locks.lock_file(part_path, LockType.WRITE):
+        try:
+            await touch(part_path)
+            await repository.insert(upload_session)
+            await write_audit(
+                repository=repository,
+                event=E.UPLOAD_SESSION_CREATE_COMPLETED,
+                resource_type=UploadSession.__tablename__,
+                resource_id=upload_session.id,
+            )
+            await repository.commit()
+
+        except Exception:
+            await repository.rollback()
+            await delete(part_path)
+            raise
+
+    log.info(
+        "event=%s upload_session_id=%s",
+        E.UPLOAD_SESSION_CREATE_COMPLETED, upload_session.id,
+    )
+    await hooks.emit(
+        E.UPLOAD_SESSION_CREATE_COMPLETED, session, upload_session,
+    )
+
+    return upload_session
@@ -0,0 +1,106 @@
+# app/services/upload_session_expire.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import logging
+import os
+import time
+
+from app.config import get_config
+from app.constants import UPLOAD_SESSIONS_EXPIRE_BATCH_SIZE
+from app.db.engine import SessionLocal
+from app.events import Events as E
+from app.locks import LockType, locks
+from app.models.upload_session import UploadSession
+from app.repositories.file import delete, listdir
+from app.repositories.orm import ORMRepository
+
+log = logging.getLogger(__name__)
+
+
+async def expire_upload_sessions() -> None:
+    """
+    Remove expired upload sessions and their part files, then part
+    files that no session refers to, which are left behind by a crash
+    between closing a session and removing its data. At most
+    UPLOAD_SESSIONS_EXPIRE_BATCH_SIZE sessions and as many orphans are
+    removed per run; the rest is picked up by the next run.
+    """
+    log.debug("event=%s", E.UPLOAD_SESSION_EXPIRE_STARTED)
+
+    now = int(time.time())
+    removed_count = 0
+
+    async with SessionLocal() as session:
+        repository = ORMRepository(session)
+        expired = await repository.select_all(
+            UploadSession,
+            expires_at__le=now,
+            order_by="id",
+            limit=UPLOAD_SESSIONS_EXPIRE_BATCH_SIZE,
+        )
+
+        # A chunk written meanwhile extends the expiry, so it is
+        # checked again under the part file lock.
+
+        for upload_session in expired:
+            part_path = upload_session.absolute_path
+            async with locks.lock_file(part_path, LockType.WRITE):
+                if not await repository.select_values(
+                    UploadSession,
+                    "id",
+                    id=upload_session.id,
+                    expires_at__le=now,
+                ):
+                    continue
+
+                await repository.delete_all(
+                    UploadSession, id=upload_session.id,
+                )
+                await repository.commit()
+                await delete(part_path)
+
+            removed_count += 1
+            log.info(
+                "event=%s upload_session_id=%s",
+                E.UPLOAD_SESSION_EXPIRE_SESSION_REMOVED, upload_session.id,
+            )
+
+        removed_count += await _remove_orphans(repository)
+
+    log.debug(
+        "event=%s removed_count=%s",
+        E.UPLOAD_SESSION_EXPIRE_COMPLETED, removed_count,
+    )
+
+
+async def _remove_orphans(repository: ORMRepository) -> int:
+    """
+    Remove part files without a session row and return their number.
+    Each file is checked under its lock, since a session being created
+    holds the lock on its part file until the row is committed.
+    """
+    uploads_dir = get_config().FILES_UPLOADS_DIR
+    names = await listdir(uploads_dir)
+    if not names:
+        return 0
+
+    known = set(await repository.select_values(UploadSession, "upload_uuid"))
+    orphans = [name for name in names if name not in known]
+    removed_count = 0
+
+    for name in orphans[:UPLOAD_SESSIONS_EXPIRE_BATCH_SIZE]:
+        part_path = os.path.join(uploads_dir, name)
+        async with locks.lock_file(part_path, LockType.WRITE):
+            if await repository.select_values(
+                UploadSession, "id", upload_uuid=name,
+            ):
+                continue
+            await delete(part_path)
+
+        removed_count += 1
+        log.info(
+            "event=%s name=%s",
+            E.UPLOAD_SESSION_EXPIRE_ORPHAN_REMOVED, name,
+        )
+
+    return removed_count
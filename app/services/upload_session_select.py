@@ -0,0 +1,62 @@
+# app/services/upload_session_select.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import logging
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.errors import ResourceNotFoundError
+from app.events import Events as E
+from app.models.upload_session import UploadSession
+from app.models.user import User
+from app.repositories.orm import ORMRepository
+
+log = logging.getLogger(__name__)
+
+
+async def find_upload_session(
+    repository: ORMRepository,
+    user: User,
+    upload_id: str,
+) -> UploadSession | None:
+    """
+    Return the upload session with the given identifier if it was
+    created by the user and has not expired yet, or None otherwise.
+    Sessions of other users are indistinguishable from missing ones.
+    """
+    upload_session = await repository.select(
+        UploadSession,
+        upload_uuid=upload_id,
+        created_by=user.id,
+    )
+
+    if upload_session is None or upload_session.expires_at <= time.time():
+        return None
+
+    return upload_session
+
+
+async def select_upload_session(
+    session: AsyncSession,
+    user: User,
+    upload_id: str,
+) -> UploadSession:
+    """
+    Retrieve an active upload session of the current user, including
+    the byte ranges received so far.
+    """
+    log.info("event=%s", E.UPLOAD_SESSION_SELECT_STARTED)
+
+    repository = ORMRepository(session)
+    upload_session = await find_upload_session(repository, user, upload_id)
+
+    if upload_session is None:
+        log.warning("event=%s", E.UPLOAD_SESSION_SELECT_NOT_FOUND)
+        raise ResourceNotFoundError
+
+    log.info(
+        "event=%s upload_session_id=%s",
+        E.UPLOAD_SESSION_SELECT_COMPLETED, upload_session.id,
+    )
+    return upload_session
@@ -0,0 +1,116 @@
+# app/services/upload_session_write.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import json
+import logging
+import time
+from typing import AsyncIterable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_config
+from app.errors import ResourceNotFoundError, ValueInvalidError
+from app.events import Events as E
+from app.locks import LockType, locks
+from app.models.upload_session import UploadSession
+from app.models.user import User
+from app.repositories.file import write_at
+from app.repositories.orm import ORMRepository
+from app.services.upload_session_select import find_upload_session
+
+log = logging.getLogger(__name__)
+
+
+def merge_ranges(
+    ranges: list[tuple[int, int]],
+    start: int,
+    end: int,
+) -> list[tuple[int, int]]:
+    """
+    Return sorted ranges with [start, end) added; overlapping and
+    adjacent ranges are merged. Empty ranges are ignored.
+    """
+    merged = []
+    for item_start, item_end in sorted([*ranges, (start, end)]):
+        if item_end <= item_start:
+            continue
+        if merged and item_start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], item_end))
+        else:
+            merged.append((item_start, item_end))
+    return merged
+
+
+async def write_upload_session(
+    session: AsyncSession,
+    user: User,
+    upload_id: str,
+    offset: int,
+    data: AsyncIterable[bytes],
+) -> UploadSession:
+    """
+    Write a chunk of an upload session at offset and record its range.
+    Chunks of one session may be written in parallel: data is written
+    under a READ lock on the part file, and the received ranges are
+    merged and the expiry extended under a WRITE lock. A chunk that
+    does not fit into the file size is rejected; the bytes written
+    before are kept but not recorded.
+    """
+    log.info("event=%s offset=%s", E.UPLOAD_SESSION_WRITE_STARTED, offset)
+
+    repository = ORMRepository(session)
+    upload_session = await find_upload_session(repository, user, upload_id)
+
+    if upload_session is None:
+        log.warning("event=%s", E.UPLOAD_SESSION_WRITE_NOT_FOUND)
+        raise ResourceNotFoundError
+
+    if offset > upload_session.filesize:
+        log.warning("event=%s", E.UPLOAD_SESSION_WRITE_OFFSET_INVALID)
+        raise ValueInvalidError(field="offset", input_value=offset)
+
+    # The row is checked again under the lock: a session committed or
+    # expired meanwhile has released its part file.
+
+    part_path = upload_session.absolute_path
+    async with locks.lock_file(part_path, LockType.READ):
+        if not await repository.select_values(
+            UploadSession, "id", id=upload_session.id,
+        ):
+            log.warning("event=%s", E.UPLOAD_SESSION_WRITE_NOT_FOUND)
+            raise ResourceNotFoundError
+
+        try:
+            length = await write_at(
+                part_path, offset, data, upload_session.filesize,
+            )
+
+        except ValueError:
+            log.warning("event=%s", E.UPLOAD_SESSION_WRITE_OFFSET_INVALID)
+            raise ValueInvalidError(field="offset", input_value=offset)
+
+    async with locks.lock_file(part_path, LockType.WRITE):
+        current = await repository.select_values(
+            UploadSession, "received_ranges", id=upload_session.id,
+        )
+
+        if not current:
+            log.warning("event=%s", E.UPLOAD_SESSION_WRITE_NOT_FOUND)
+            raise ResourceNotFoundError
+
+        upload_session.received_ranges = current[0]
+        ranges = merge_ranges(
+            upload_session.ranges, offset, offset + length,
+        )
+        upload_session.received_ranges = json.dumps(ranges)
+        upload_session.expires_at = (
+            int(time.time()) + get_config().UPLOAD_SESSION_TTL_SECONDS
+        )
+
+        await repository.update(upload_session, commit=True)
+
+    log.info(
+        "event=%s upload_session_id=%s length=%s",
+        E.UPLOAD_SESSION_WRITE_COMPLETED, upload_session.id, length,
+    )
+    return upload_session
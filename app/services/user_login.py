@@ -16,8 +16,8 @@ from app.events import Events as E
 from app.hooks import hooks
 from app.models.user import User
 from app.repositories.orm import ORMRepository
+from app.runtime.crypto import is_password_correct
 from app.schemas.user_login import UserLoginRequest
-from app.security.hashing import is_password_correct
 from app.security.totp import generate_mfa_session_uuid
 
 log = logging.getLogger(__name__)
@@ -70,7 +70,7 @@ async def login_user(
             input_value=data.username,
         )
 
-    if is_password_correct(data.password, user.password_hash):
+    if await is_password_correct(data.password, user.password_hash):
         mfa_session_uuid = generate_mfa_session_uuid()
 
         user.failed_password_attempts = 0
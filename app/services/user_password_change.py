@@ -12,9 +12,9 @@ from app.events import Events as E
 from app.hooks import hooks
 from app.models.user import User
 from app.repositories.orm import ORMRepository
+from app.runtime.crypto import hash_string, is_password_correct
 from app.schemas.user_password_change import UserPasswordChangeRequest
 from app.security.encryption import encrypt_string
-from app.security.hashing import hash_string, is_password_correct
 from app.security.jwt import generate_jti
 
 log = logging.getLogger(__name__)
@@ -41,7 +41,7 @@ async def change_password(
     """
     log.info("event=%s user_id=%s", E.USER_PASSWORD_CHANGE_STARTED, user.id)
 
-    if not is_password_correct(
+    if not await is_password_correct(
         data.current_password,
         user.password_hash,
     ):
@@ -51,7 +51,7 @@ async def change_password(
             input_value=OBSCURED_VALUE,
         )
 
-    user.password_hash = hash_string(data.changed_password)
+    user.password_hash = await hash_string(data.changed_password)
     user.password_verified_at = None
 
     current_jti = generate_jti()
@@ -12,9 +12,9 @@ from app.events import Events as E
 from app.hooks import hooks
 from app.models.user import User
 from app.repositories.orm import ORMRepository
+from app.runtime.crypto import hash_string, is_password_correct
 from app.schemas.user_recovery_code_rotate import UserRecoveryCodeRotateRequest
 from app.security.encryption import encrypt_string
-from app.security.hashing import hash_string, is_password_correct
 from app.security.jwt import generate_jti
 from app.security.recovery import generate_recovery_code
 
@@ -34,7 +34,7 @@ async def rotate_recovery_code(
     """
     log.info("event=%s user_id=%s", E.USER_RECOVERY_CODE_ROTATE_STARTED, user.id)  # noqa: E501
 
-    if not is_password_correct(
+    if not await is_password_correct(
         data.recovery_code,
         user.recovery_code_hash,
     ):
@@ -45,7 +45,7 @@ async def rotate_recovery_code(
         )
 
     new_recovery_code = generate_recovery_code()
-    user.recovery_code_hash = hash_string(new_recovery_code)
+    user.recovery_code_hash = await hash_string(new_recovery_code)
     user.failed_recovery_code_attempts = 0
     user.password_verified_at = None
 
@@ -24,9 +24,9 @@ from app.locks import LockType, locks
 from app.models.user import User, UserRole
 from app.repositories.file import touch
 from app.repositories.orm import ORMRepository
+from app.runtime.crypto import hash_string
 from app.schemas.user_register import UserRegisterRequest
 from app.security.encryption import encrypt_string
-from app.security.hashing import hash_string
 from app.security.recovery import generate_recovery_code
 from app.security.totp import generate_totp_secret
 
@@ -102,11 +102,11 @@ async def register_user(
             is_active=is_active,
             role=role,
             username=data.username,
-            password_hash=hash_string(data.password),
+            password_hash=await hash_string(data.password),
             display_name=data.display_name,
             summary=data.summary,
             totp_secret_encrypted=encrypt_string(totp_secret),
-            recovery_code_hash=hash_string(recovery_code),
+            recovery_code_hash=await hash_string(recovery_code),
         )
 
         try:
@@ -20,9 +20,9 @@ from app.events import Events as E
 from app.hooks import hooks
 from app.models.user import User
 from app.repositories.orm import ORMRepository
+from app.runtime.crypto import is_password_correct
 from app.schemas.user_totp_recover import UserTotpRecoverRequest
 from app.security.encryption import encrypt_string
-from app.security.hashing import is_password_correct
 from app.security.jwt import generate_jti
 from app.security.totp import generate_totp_secret
 
@@ -80,7 +80,10 @@ async def recover_totp(
         log.warning("event=%s user_id=%s", E.USER_TOTP_RECOVER_PASSWORD_NOT_VERIFIED, user.id)  # noqa: E501
         raise ResourceConflictError
 
-    if not is_password_correct(data.recovery_code, user.recovery_code_hash):
+    if not await is_password_correct(
+        data.recovery_code,
+        user.recovery_code_hash,
+    ):
 
         user.failed_recovery_code_attempts += 1
         if user.failed_recovery_code_attempts >= (
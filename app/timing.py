@@ -0,0 +1,163 @@
+# app/timing.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import functools
+import inspect
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import StrEnum
+from typing import Any
+
+from app.context import get_context_var, set_context_var
+
+# NOTE (ADR-87): Request time is broken down by category.
+# The request context holds one mutable dict of seconds per category;
+# the dict is shared, not copied, so threads and tasks started with a
+# copy of the context add to the same request. Only the outermost
+# measurement counts: SQL run by a hook is hook time, and a file write
+# done by an image operation is image time, so the categories never
+# overlap and add up to at most the elapsed time. Waiting for a
+# caller-supplied stream, such as a request body, is excluded.
+
+_REQUEST_TIMINGS = "request_timings"
+
+
+class TimingCategory(StrEnum):
+    LOCK = "lock"
+    SQL = "sql"
+    FILE = "file"
+    IMAGE = "image"
+    HOOK = "hook"
+
+
+# Excluded seconds of the active measurement, None outside one.
+_active: ContextVar[list[float] | None] = ContextVar(
+    "timing_active",
+    default=None,
+)
+
+
+def start_timings() -> None:
+    """
+    Attach an empty timing breakdown to the current request context.
+    """
+    set_context_var(_REQUEST_TIMINGS, dict.fromkeys(TimingCategory, 0.0))
+
+
+def get_timings() -> dict[TimingCategory, float]:
+    """
+    Return seconds spent per category in the current request so far.
+    All categories are present; they are zero outside a request.
+    """
+    timings = dict.fromkeys(TimingCategory, 0.0)
+    timings.update(get_context_var(_REQUEST_TIMINGS) or {})
+    return timings
+
+
+def add_timing(category: TimingCategory, seconds: float) -> None:
+    """
+    Add seconds to a category of the current request. Ignored outside
+    a request and inside another measurement, which already counts it.
+    """
+    timings = get_context_var(_REQUEST_TIMINGS)
+    if timings is not None and _active.get() is None:
+        timings[category] += seconds
+
+
+@contextmanager
+def measure(category: TimingCategory) -> Iterator[None]:
+    """
+    Count the wall time of the enclosed block towards a category.
+    """
+    if get_context_var(_REQUEST_TIMINGS) is None or _active.get() is not None:
+        yield
+        return
+
+    excluded = [0.0]
+    token = _active.set(excluded)
+    start_time = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        elapsed_time = time.perf_counter() - start_time
+        _active.reset(token)
+        add_timing(category, elapsed_time - excluded[0])
+
+
+@contextmanager
+def untimed() -> Iterator[None]:
+    """
+    Exclude the enclosed block from the active measurement, if any.
+    """
+    excluded = _active.get()
+    if excluded is None:
+        yield
+        return
+
+    token = _active.set(None)
+    start_time = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        excluded[0] += time.perf_counter() - start_time
+        _active.reset(token)
+
+
+def timed(category: TimingCategory) -> Callable[[Callable], Callable]:
+    """
+    Decorate a function so that its calls are measured. Async
+    generators are measured per step, excluding the time the consumer
+    holds each item.
+    """
+    def decorator(func: Callable) -> Callable:
+        if inspect.isasyncgenfunction(func):
+            @functools.wraps(func)
+            async def asyncgen_wrapper(*args: Any, **kwargs: Any):
+                iterator = func(*args, **kwargs)
+                try:
+                    while True:
+                        with measure(category):
+                            try:
+                                item = await anext(iterator)
+                            except StopAsyncIteration:
+                                return
+                        yield item
+                finally:
+                    with measure(category):
+                        await iterator.aclose()
+
+            return asyncgen_wrapper
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with measure(category):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with measure(category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def format_server_timing(
+    timings: dict[TimingCategory, float],
+    total: float,
+) -> str:
+    """
+    Return a Server-Timing header value with durations in milliseconds.
+    """
+    metrics = [*timings.items(), ("total", total)]
+    return ", ".join(
+        f"{name};dur={seconds * 1000:.3f}" for name, seconds in metrics
+    )
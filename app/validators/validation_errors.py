@@ -40,3 +40,9 @@ VALUE_NOT_PATH_SEGMENT = (
     "value_not_path_segment",
     "Value must be a single safe filesystem path segment",
 )
+
+VALUE_RANGES_INVALID = (
+    "value_ranges_invalid",
+    "Ranges must be ordered, non-overlapping, and end at or after "
+    "their start",
+)
@@ -13,15 +13,19 @@ set -a
 . /etc/hidden/.env
 set +a
 
-# NOTE (ADR-09): Watchdog runs as a background sleep-loop.
-# It periodically validates runtime state and unmounts the gocryptfs
-# mountpoint when required (e.g. missing passphrase or no running
-# application process).
-
+# NOTE (ADR-09): Watchdog runs as one long-lived process.
+# It validates runtime state every GOCRYPTFS_WATCHDOG_INTERVAL_SECONDS
+# and immediately when secrets are removed or the application exits,
+# and unmounts the gocryptfs mountpoint when required (e.g. missing
+# passphrase or no running application process). It receives the PID
+# of this shell, which becomes the uvicorn process through exec below.
+# The loop only restarts the watchdog if it exits unexpectedly.
+
+APP_PID=$$
 (
   while true; do
+    cd /opt/hidden && python3 -m app.runtime.watchdog "$APP_PID"
     sleep "$GOCRYPTFS_WATCHDOG_INTERVAL_SECONDS"
-    cd /opt/hidden && python3 -m app.runtime.watchdog
   done
 ) >> /proc/1/fd/1 2>> /proc/1/fd/2 &
 
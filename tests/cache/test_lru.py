@@ -2,9 +2,9 @@
 # SPDX-License-Identifier: GPL-3.0-only
 
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, call, patch
 
-from app.cache.lru import LRUCache, get_thumbnail_cache
+from app.cache.lru import LRUCache, get_revision_cache, get_thumbnail_cache
 
 
 class TestLRUCache(unittest.TestCase):
@@ -33,6 +33,29 @@ class TestLRUCache(unittest.TestCase):
         self.assertIsNotNone(cache.get(1))
         self.assertIsNotNone(cache.get(3))
 
+    def test_hits_misses_and_evictions_are_counted(self):
+        with (
+            patch("app.cache.lru.CACHE_REQUESTS") as requests_mock,
+            patch("app.cache.lru.CACHE_EVICTIONS") as evictions_mock,
+        ):
+            hit, miss = MagicMock(), MagicMock()
+            requests_mock.labels.side_effect = [hit, miss]
+            cache = LRUCache(max_bytes=3, name="thumbnail")
+
+        cache.put(1, "image/jpeg", b"aaa")
+        cache.get(1)
+        cache.put(2, "image/png", b"bbb")
+        cache.get(1)
+
+        self.assertEqual(
+            requests_mock.labels.call_args_list,
+            [call("thumbnail", "hit"), call("thumbnail", "miss")],
+        )
+        evictions_mock.labels.assert_called_once_with("thumbnail")
+        hit.inc.assert_called_once_with()
+        miss.inc.assert_called_once_with()
+        evictions_mock.labels.return_value.inc.assert_called_once_with()
+
     def test_put_overwrites_existing_entry(self):
         cache = self._make()
         cache.put(1, "image/jpeg", b"old")
@@ -167,3 +190,17 @@ class TestGetThumbnailCache(unittest.TestCase):
         self.assertIs(first, second)
         self.assertEqual(first.max_bytes, 123)
         get_config_mock.assert_called_once()
+
+
+class TestGetRevisionCache(unittest.TestCase):
+
+    def tearDown(self):
+        get_revision_cache.cache_clear()
+
+    def test_returns_singleton_sized_from_config(self):
+        with patch("app.cache.lru.get_config") as get_config_mock:
+            get_config_mock.return_value.REVISION_CACHE_MAX_BYTES = 456
+            first = get_revision_cache()
+            second = get_revision_cache()
+        self.assertIs(first, second)
+        self.assertEqual(first.max_bytes, 456)
@@ -4,7 +4,7 @@
 import importlib
 import os
 import unittest
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 
 TEST_ENV = {
@@ -64,6 +64,149 @@ class TestSQLitePragma(unittest.TestCase):
         cursor.close.assert_called_once()
 
 
+class TestSQLTiming(unittest.TestCase):
+
+    def test_statement_time_is_added(self):
+        engine_module = import_engine_module()
+        connection = MagicMock(info={})
+        args = (MagicMock(), "SELECT 1", (), MagicMock(), False)
+
+        with (
+            patch.object(
+                engine_module.time, "perf_counter", side_effect=[10.0, 10.5],
+            ),
+            patch.object(engine_module, "add_timing") as add_timing,
+        ):
+            engine_module.start_sql_timing(connection, *args)
+            engine_module.stop_sql_timing(connection, *args)
+
+        add_timing.assert_called_once_with(
+            engine_module.TimingCategory.SQL, 0.5,
+        )
+        self.assertEqual(connection.info, {})
+
+    def test_missing_start_time_is_ignored(self):
+        engine_module = import_engine_module()
+        args = (MagicMock(), "SELECT 1", (), MagicMock(), False)
+
+        with patch.object(engine_module, "add_timing") as add_timing:
+            engine_module.stop_sql_timing(MagicMock(info={}), *args)
+
+        add_timing.assert_not_called()
+
+    def test_slow_statement_is_recorded_with_its_plan(self):
+        engine_module = import_engine_module()
+        connection = MagicMock(info={})
+        args = (MagicMock(), "SELECT ?", [(1,), (2,)], MagicMock(), True)
+        slow_sql_log = MagicMock()
+        slow_sql_log.is_slow.return_value = True
+
+        with (
+            patch.object(
+                engine_module.time, "perf_counter", side_effect=[10.0, 12.0],
+            ),
+            patch.object(engine_module, "add_timing"),
+            patch.object(
+                engine_module, "get_slow_sql_log", return_value=slow_sql_log,
+            ),
+            patch.object(engine_module, "explain_query_plan") as explain,
+        ):
+            engine_module.start_sql_timing(connection, *args)
+            engine_module.stop_sql_timing(connection, *args)
+
+            slow_sql_log.is_slow.assert_called_once_with(2.0)
+            statement, elapsed_time, explain_plan = (
+                slow_sql_log.record.call_args.args
+            )
+            self.assertEqual((statement, elapsed_time), ("SELECT ?", 2.0))
+            explain_plan()
+
+        explain.assert_called_once_with(
+            connection.connection.dbapi_connection, "SELECT ?", (1,),
+        )
+
+    def test_fast_statement_is_not_recorded(self):
+        engine_module = import_engine_module()
+        connection = MagicMock(info={})
+        args = (MagicMock(), "SELECT 1", (), MagicMock(), False)
+        slow_sql_log = MagicMock()
+        slow_sql_log.is_slow.return_value = False
+
+        with (
+            patch.object(
+                engine_module.time, "perf_counter", side_effect=[10.0, 10.1],
+            ),
+            patch.object(engine_module, "add_timing"),
+            patch.object(
+                engine_module, "get_slow_sql_log", return_value=slow_sql_log,
+            ),
+        ):
+            engine_module.start_sql_timing(connection, *args)
+            engine_module.stop_sql_timing(connection, *args)
+
+        slow_sql_log.record.assert_not_called()
+
+
+class TestAuditedSession(unittest.IsolatedAsyncioTestCase):
+
+    async def test_commit_flushes_staged_audit_after_main_commit(self):
+        engine_module = import_engine_module()
+        session = engine_module.AuditedSession()
+        call_order = []
+
+        async def record_commit(_self):
+            call_order.append("commit")
+
+        async def record_flush(_session):
+            call_order.append("flush_audit")
+
+        with (
+            patch(
+                "app.db.engine.AsyncSession.commit",
+                new=record_commit,
+            ),
+            patch("app.db.engine.flush_audit", side_effect=record_flush),
+        ):
+            await session.commit()
+
+        self.assertEqual(call_order, ["commit", "flush_audit"])
+
+    async def test_commit_failure_does_not_flush_audit(self):
+        engine_module = import_engine_module()
+        session = engine_module.AuditedSession()
+
+        with (
+            patch(
+                "app.db.engine.AsyncSession.commit",
+                new=AsyncMock(side_effect=RuntimeError("commit failed")),
+            ),
+            patch(
+                "app.db.engine.flush_audit",
+                new_callable=AsyncMock,
+            ) as flush_mock,
+        ):
+            with self.assertRaises(RuntimeError):
+                await session.commit()
+
+        flush_mock.assert_not_awaited()
+
+    async def test_rollback_discards_staged_audit(self):
+        engine_module = import_engine_module()
+        session = engine_module.AuditedSession()
+
+        with (
+            patch(
+                "app.db.engine.AsyncSession.rollback",
+                new_callable=AsyncMock,
+            ) as rollback_mock,
+            patch("app.db.engine.discard_audit") as discard_mock,
+        ):
+            await session.rollback()
+
+        discard_mock.assert_called_once_with(session)
+        rollback_mock.assert_awaited_once()
+
+
 class TestLoadAllModels(unittest.TestCase):
 
     def test_load_all_models_imports_without_error(self):
@@ -1,14 +1,44 @@
 # tests/db/test_migrations.py
 # SPDX-License-Identifier: GPL-3.0-only
 
+import sqlite3
+import subprocess
+import sys
+import tempfile
 import unittest
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from unittest.mock import MagicMock, call, patch
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
 
 from app.db import migrations
 
+ALEMBIC_DIR = Path(__file__).resolve().parents[2] / "alembic"
+
+# Runs in a fresh interpreter: models imported by other tests would
+# otherwise hide a model missing from alembic/env.py.
+ALEMBIC_CHECK_SCRIPT = """
+import sys
+from alembic import command
+from alembic.config import Config
+
+config = Config("alembic.ini", ini_section=sys.argv[1])
+config.set_main_option("sqlalchemy.url", "sqlite:///" + sys.argv[2])
+command.upgrade(config, "head")
+command.check(config)
+"""
+
 
 class TestUpgradeDbSync(unittest.TestCase):
 
+    def setUp(self):
+        config_patcher = patch("app.db.migrations.get_config")
+        self.config_mock = config_patcher.start().return_value
+        self.config_mock.SQLITE_PATH = "/fake/hidden.db"
+        self.config_mock.SQLITE_AUDIT_PATH = "/fake/audit.db"
+        self.addCleanup(config_patcher.stop)
+
     def test_upgrade_db_sync_runs_alembic_upgrade_to_head(self):
         mock_config = MagicMock()
 
@@ -18,11 +48,151 @@ class TestUpgradeDbSync(unittest.TestCase):
                 return_value=mock_config,
             ) as mock_config_cls,
             patch("app.db.migrations.command.upgrade") as mock_upgrade,
+            patch(
+                "app.db.migrations._get_db_revisions",
+                return_value=set(),
+            ) as mock_db_revisions,
+            patch(
+                "app.db.migrations._get_head_revisions",
+                return_value={"head"},
+            ) as mock_head_revisions,
         ):
             migrations._upgrade_db_sync()
 
-        mock_config_cls.assert_called_once_with("/opt/hidden/alembic.ini")
-        mock_upgrade.assert_called_once_with(mock_config, "head")
+        self.assertEqual(
+            mock_config_cls.call_args_list,
+            [
+                call("/opt/hidden/alembic.ini", ini_section="audit"),
+                call("/opt/hidden/alembic.ini", ini_section="alembic"),
+            ],
+        )
+        self.assertEqual(
+            mock_upgrade.call_args_list,
+            [call(mock_config, "head"), call(mock_config, "head")],
+        )
+        self.assertEqual(
+            mock_db_revisions.call_args_list,
+            [call("/fake/audit.db"), call("/fake/hidden.db")],
+        )
+        self.assertEqual(
+            mock_head_revisions.call_args_list,
+            [
+                call("/opt/hidden/alembic/audit_versions"),
+                call("/opt/hidden/alembic/versions"),
+            ],
+        )
+
+    def test_upgrade_db_sync_skips_alembic_for_database_at_head(self):
+        with (
+            patch("app.db.migrations.Config") as mock_config_cls,
+            patch("app.db.migrations.command.upgrade") as mock_upgrade,
+            patch(
+                "app.db.migrations._get_db_revisions",
+                side_effect=[{"audit-head"}, {"main-old"}],
+            ),
+            patch(
+                "app.db.migrations._get_head_revisions",
+                side_effect=[{"audit-head"}, {"main-head"}],
+            ),
+        ):
+            migrations._upgrade_db_sync()
+
+        mock_config_cls.assert_called_once_with(
+            "/opt/hidden/alembic.ini", ini_section="alembic",
+        )
+        mock_upgrade.assert_called_once_with(
+            mock_config_cls.return_value, "head",
+        )
+
+
+class TestAlembicCheck(unittest.TestCase):
+
+    def test_models_match_migrations_at_head(self):
+        for section in ("alembic", "audit"):
+            with (
+                self.subTest(section=section),
+                tempfile.TemporaryDirectory() as tmp,
+            ):
+                result = subprocess.run(
+                    [
+                        sys.executable, "-c", ALEMBIC_CHECK_SCRIPT,
+                        section, str(Path(tmp, "check.db")),
+                    ],
+                    cwd=ALEMBIC_DIR.parent,
+                    capture_output=True,
+                    text=True,
+                )
+
+                self.assertEqual(result.returncode, 0, msg=result.stderr)
+
+
+class TestGetHeadRevisions(unittest.TestCase):
+
+    def _write_script(self, directory, name, revision, down_revision):
+        Path(directory, name).write_text(
+            f"revision: str = {revision!r}\n"
+            f"down_revision = {down_revision!r}\n"
+            "branch_labels = None\n",
+            encoding="utf-8",
+        )
+
+    def test_matches_alembic_heads_of_repository_scripts(self):
+        for section, versions_dir in (
+            ("alembic", ALEMBIC_DIR / "versions"),
+            ("audit", ALEMBIC_DIR / "audit_versions"),
+        ):
+            config = Config(ini_section=section)
+            config.set_main_option("script_location", str(ALEMBIC_DIR))
+            config.set_main_option("version_locations", str(versions_dir))
+            heads = ScriptDirectory.from_config(config).get_heads()
+
+            self.assertEqual(
+                migrations._get_head_revisions(str(versions_dir)),
+                set(heads),
+            )
+
+    def test_merge_revision_replaces_both_parents(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self._write_script(tmp, "a.py", "a", None)
+            self._write_script(tmp, "b.py", "b", "a")
+            self._write_script(tmp, "c.py", "c", "a")
+            self.assertEqual(migrations._get_head_revisions(tmp), {"b", "c"})
+
+            self._write_script(tmp, "d.py", "d", ("b", "c"))
+            self.assertEqual(migrations._get_head_revisions(tmp), {"d"})
+
+    def test_ignores_files_without_revision(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self._write_script(tmp, "a.py", "a", None)
+            Path(tmp, "helpers.py").write_text("x = 1\n", encoding="utf-8")
+
+            self.assertEqual(migrations._get_head_revisions(tmp), {"a"})
+
+
+class TestGetDbRevisions(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db_path = str(Path(tmp.name, "db.sqlite"))
+
+    def test_returns_stored_revisions(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE alembic_version (version_num TEXT)")
+        conn.execute("INSERT INTO alembic_version VALUES ('abc')")
+        conn.commit()
+        conn.close()
+
+        self.assertEqual(migrations._get_db_revisions(self.db_path), {"abc"})
+
+    def test_returns_empty_set_without_version_table(self):
+        sqlite3.connect(self.db_path).close()
+
+        self.assertEqual(migrations._get_db_revisions(self.db_path), set())
+
+    def test_returns_empty_set_without_database_file(self):
+        self.assertEqual(migrations._get_db_revisions(self.db_path), set())
+        self.assertFalse(Path(self.db_path).exists())
 
 
 class TestUpgradeDb(unittest.IsolatedAsyncioTestCase):
@@ -107,6 +277,48 @@ class TestCheckDbIntegritySync(unittest.TestCase):
 
         mock_connect.assert_called_once_with("/some/path/db.sqlite")
 
+    def test_runs_quick_check_when_requested(self):
+        mock_conn = MagicMock()
+        mock_conn.execute.return_value.fetchall.return_value = [("ok",)]
+
+        with patch(
+            "app.db.migrations.sqlite3.connect",
+            return_value=mock_conn
+        ):
+            migrations._check_db_integrity_sync(
+                "/fake/db.sqlite",
+                quick=True,
+            )
+
+        mock_conn.execute.assert_called_once_with("PRAGMA quick_check")
+
+    def test_checks_only_given_table(self):
+        mock_conn = MagicMock()
+        mock_conn.execute.return_value.fetchall.return_value = [("ok",)]
+
+        with patch(
+            "app.db.migrations.sqlite3.connect",
+            return_value=mock_conn
+        ):
+            migrations._check_db_integrity_sync(
+                "/fake/db.sqlite",
+                table='odd"name',
+            )
+
+        mock_conn.execute.assert_called_once_with(
+            'PRAGMA integrity_check("odd""name")'
+        )
+
+    def test_table_check_on_real_database(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = str(Path(tmp, "db.sqlite"))
+            conn = sqlite3.connect(db_path)
+            conn.execute("CREATE TABLE files (id INTEGER PRIMARY KEY)")
+            conn.execute("CREATE INDEX idx_files ON files (id)")
+            conn.close()
+
+            migrations._check_db_integrity_sync(db_path, table="files")
+
 
 class TestCheckDbIntegrity(unittest.IsolatedAsyncioTestCase):
 
@@ -117,6 +329,8 @@ class TestCheckDbIntegrity(unittest.IsolatedAsyncioTestCase):
         mock_to_thread.assert_awaited_once_with(
             migrations._check_db_integrity_sync,
             "/fake/db.sqlite",
+            False,
+            None,
         )
 
     async def test_propagates_runtime_error_from_thread(self):
@@ -132,3 +346,19 @@ class TestCheckDbIntegrity(unittest.IsolatedAsyncioTestCase):
                 await migrations.check_db_integrity("/fake/db.sqlite")
 
         self.assertIs(cm.exception, error)
+
+
+class TestListDbTables(unittest.IsolatedAsyncioTestCase):
+
+    async def test_returns_table_names_in_order(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = str(Path(tmp, "db.sqlite"))
+            conn = sqlite3.connect(db_path)
+            conn.execute("CREATE TABLE users (id INTEGER)")
+            conn.execute("CREATE TABLE files (id INTEGER)")
+            conn.execute("CREATE INDEX idx_files ON files (id)")
+            conn.close()
+
+            tables = await migrations.list_db_tables(db_path)
+
+        self.assertEqual(tables, ["files", "users"])
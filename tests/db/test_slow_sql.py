@@ -0,0 +1,188 @@
+# tests/db/test_slow_sql.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import sqlite3
+import unittest
+from unittest.mock import MagicMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.db.slow_sql import (  # noqa: E402
+    SlowStatementLog,
+    explain_query_plan,
+    get_slow_sql_log,
+    normalize_statement,
+)
+from app.events import Events as E  # noqa: E402
+
+
+class TestNormalizeStatement(unittest.TestCase):
+
+    def test_literals_become_placeholders(self):
+        self.assertEqual(
+            normalize_statement(
+                "SELECT * FROM users WHERE id = 42 AND name = 'o''hara'",
+            ),
+            "SELECT * FROM users WHERE id = ? AND name = ?",
+        )
+
+    def test_placeholder_lists_collapse(self):
+        self.assertEqual(
+            normalize_statement("DELETE FROM t WHERE id IN (?, ?, 3)"),
+            "DELETE FROM t WHERE id IN (?)",
+        )
+
+    def test_whitespace_is_squeezed(self):
+        self.assertEqual(
+            normalize_statement("\n  SELECT a,\n\tb FROM t  "),
+            "SELECT a, b FROM t",
+        )
+
+    def test_identifiers_with_digits_are_kept(self):
+        self.assertEqual(
+            normalize_statement("SELECT users_1.id FROM users AS users_1"),
+            "SELECT users_1.id FROM users AS users_1",
+        )
+
+
+class TestSlowStatementLog(unittest.TestCase):
+
+    def setUp(self):
+        patcher = patch("app.db.slow_sql.log")
+        self.log = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_disabled_with_non_positive_threshold(self):
+        slow_sql_log = SlowStatementLog(threshold_seconds=0)
+        self.assertFalse(slow_sql_log.enabled)
+        self.assertFalse(slow_sql_log.is_slow(100.0))
+
+    def test_is_slow_at_threshold(self):
+        slow_sql_log = SlowStatementLog(threshold_seconds=0.1)
+        self.assertTrue(slow_sql_log.is_slow(0.1))
+        self.assertFalse(slow_sql_log.is_slow(0.09))
+
+    def test_record_aggregates_by_normalized_statement(self):
+        slow_sql_log = SlowStatementLog(threshold_seconds=0.1)
+        explain = MagicMock(return_value=["SCAN t"])
+
+        with patch("app.db.slow_sql.time.time", return_value=1000.0):
+            slow_sql_log.record("SELECT * FROM t WHERE id = 1", 0.2, explain)
+            entry = slow_sql_log.record(
+                "SELECT * FROM t WHERE id = 2", 0.4, explain,
+            )
+
+        explain.assert_called_once_with()
+        self.assertEqual(entry.statement, "SELECT * FROM t WHERE id = ?")
+        self.assertEqual(entry.plan, ["SCAN t"])
+        self.assertEqual(len(entry.statement_id), 16)
+        self.assertEqual(entry.to_dict(), {
+            "statement_id": entry.statement_id,
+            "statement": "SELECT * FROM t WHERE id = ?",
+            "count": 2,
+            "total_seconds": 0.6000000000000001,
+            "mean_seconds": 0.30000000000000004,
+            "max_seconds": 0.4,
+            "last_seen_at": 1000.0,
+            "plan": ["SCAN t"],
+        })
+
+    def test_record_logs_statement_id_without_text(self):
+        slow_sql_log = SlowStatementLog(threshold_seconds=0.1)
+        entry = slow_sql_log.record("SELECT 'secret'", 0.5, lambda: None)
+
+        self.log.warning.assert_called_once_with(
+            "event=%s statement_id=%s elapsed_time=%.6f",
+            E.SQL_STATEMENT_SLOW,
+            entry.statement_id,
+            0.5,
+        )
+
+    def test_full_table_evicts_least_costly_statement(self):
+        slow_sql_log = SlowStatementLog(
+            threshold_seconds=0.1, max_statements=2,
+        )
+        slow_sql_log.record("SELECT a FROM t", 0.5, lambda: None)
+        slow_sql_log.record("SELECT b FROM t", 0.2, lambda: None)
+        slow_sql_log.record("SELECT c FROM t", 0.3, lambda: None)
+
+        self.assertEqual(
+            [entry.statement for entry in slow_sql_log.top(10, "count")],
+            ["SELECT a FROM t", "SELECT c FROM t"],
+        )
+
+    def test_top_orders_descending_and_limits(self):
+        slow_sql_log = SlowStatementLog(threshold_seconds=0.1)
+        slow_sql_log.record("SELECT a FROM t", 0.9, lambda: None)
+        slow_sql_log.record("SELECT b FROM t", 0.2, lambda: None)
+        slow_sql_log.record("SELECT b FROM t", 0.2, lambda: None)
+        slow_sql_log.record("SELECT b FROM t", 0.2, lambda: None)
+
+        self.assertEqual(
+            [e.statement for e in slow_sql_log.top(1, "count")],
+            ["SELECT b FROM t"],
+        )
+        self.assertEqual(
+            [e.statement for e in slow_sql_log.top(2, "max_seconds")],
+            ["SELECT a FROM t", "SELECT b FROM t"],
+        )
+
+
+class TestExplainQueryPlan(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute("CREATE TABLE t (id INTEGER, name TEXT)")
+        self.connection.execute("CREATE INDEX ix_t_name ON t (name)")
+
+    def tearDown(self):
+        self.connection.close()
+
+    def test_returns_plan_lines_with_bound_parameters(self):
+        plan = explain_query_plan(
+            self.connection, "SELECT id FROM t WHERE name = ?", ("x",),
+        )
+        self.assertEqual(len(plan), 1)
+        self.assertIn("ix_t_name", plan[0])
+
+    def test_nested_plan_lines_are_indented(self):
+        plan = explain_query_plan(
+            self.connection,
+            "SELECT id FROM t WHERE id IN (SELECT id FROM t WHERE name = ?)",
+            ("x",),
+        )
+        self.assertTrue(any(line.startswith("  ") for line in plan))
+
+    def test_statement_that_cannot_be_explained_returns_none(self):
+        connection = MagicMock()
+        self.assertIsNone(explain_query_plan(connection, "PRAGMA x", ()))
+        connection.cursor.assert_not_called()
+
+    def test_failure_returns_none_and_closes_cursor(self):
+        cursor = MagicMock()
+        cursor.execute.side_effect = sqlite3.OperationalError("locked")
+        connection = MagicMock()
+        connection.cursor.return_value = cursor
+
+        self.assertIsNone(explain_query_plan(connection, "SELECT 1", None))
+        cursor.close.assert_called_once()
+
+
+class TestGetSlowSqlLog(unittest.TestCase):
+
+    def tearDown(self):
+        get_slow_sql_log.cache_clear()
+
+    def test_threshold_from_config_in_seconds(self):
+        get_slow_sql_log.cache_clear()
+
+        with patch(
+            "app.db.slow_sql.get_config",
+            return_value=MagicMock(SQL_SLOW_THRESHOLD_MILLISECONDS=250),
+        ):
+            slow_sql_log = get_slow_sql_log()
+
+        self.assertEqual(slow_sql_log.threshold_seconds, 0.25)
+        self.assertIs(get_slow_sql_log(), slow_sql_log)
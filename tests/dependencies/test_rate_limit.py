@@ -0,0 +1,43 @@
+# tests/dependencies/test_rate_limit.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.context import reset_context, set_context_var
+from app.dependencies.rate_limit import require_rate_limit
+from app.errors import TooManyRequestsError
+from app.runtime.rate_limit import RateLimitCost
+
+
+class TestRequireRateLimit(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        reset_context()
+        self.addCleanup(reset_context)
+        self.limiter = MagicMock()
+        p = patch(
+            "app.dependencies.rate_limit.get_rate_limiter",
+            return_value=self.limiter,
+        )
+        p.start()
+        self.addCleanup(p.stop)
+
+    async def test_charges_current_user(self):
+        set_context_var("current_user_id", 7)
+        self.limiter.acquire.return_value = None
+
+        await require_rate_limit(RateLimitCost.HEAVY)()
+
+        self.limiter.acquire.assert_called_once_with(7, RateLimitCost.HEAVY)
+
+    async def test_raises_with_retry_after(self):
+        self.limiter.acquire.return_value = 3
+
+        with self.assertRaises(TooManyRequestsError) as ctx:
+            await require_rate_limit(RateLimitCost.LIGHT)()
+
+        self.assertEqual(ctx.exception.retry_after, 3)
+        self.limiter.acquire.assert_called_once_with(
+            None, RateLimitCost.LIGHT,
+        )
@@ -46,3 +46,21 @@ class TestGetSession(unittest.IsolatedAsyncioTestCase):
                 await anext(gen)
 
         mock_cm.__aexit__.assert_awaited_once()
+
+
+class TestGetAuditSession(unittest.IsolatedAsyncioTestCase):
+    async def test_yields_audit_session_and_closes_context(self):
+        mock_sess = MagicMock()
+        mock_cm = MagicMock()
+        mock_cm.__aenter__ = AsyncMock(return_value=mock_sess)
+        mock_cm.__aexit__ = AsyncMock(return_value=None)
+        factory = MagicMock(return_value=mock_cm)
+
+        with patch("app.dependencies.session.AuditSessionLocal", factory):
+            items: list[MagicMock] = []
+            async for s in session_dep.get_audit_session():
+                items.append(s)
+
+        self.assertEqual(items, [mock_sess])
+        factory.assert_called_once_with()
+        mock_cm.__aexit__.assert_awaited_once()
@@ -0,0 +1,35 @@
+# tests/handlers/test_insufficient_storage.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import json
+import unittest
+from unittest.mock import MagicMock
+
+from fastapi import status
+
+from app.errors import InsufficientStorageError
+from app.handlers.insufficient_storage import insufficient_storage_handler
+
+
+class TestInsufficientStorageHandler(unittest.IsolatedAsyncioTestCase):
+    async def test_returns_507_with_detail_payload(self):
+        request = MagicMock()
+        exc = InsufficientStorageError()
+
+        response = await insufficient_storage_handler(request, exc)
+
+        self.assertEqual(
+            response.status_code,
+            status.HTTP_507_INSUFFICIENT_STORAGE,
+        )
+        payload = json.loads(response.body.decode())
+        self.assertEqual(payload, {"detail": "Insufficient storage"})
+        self.assertNotIn("retry-after", response.headers)
+
+    async def test_sets_retry_after_header(self):
+        request = MagicMock()
+        exc = InsufficientStorageError(retry_after=300)
+
+        response = await insufficient_storage_handler(request, exc)
+
+        self.assertEqual(response.headers["retry-after"], "300")
@@ -27,3 +27,12 @@ class TestTooManyRequestsHandler(unittest.IsolatedAsyncioTestCase):
             payload,
             {"detail": "Too many requests"},
         )
+        self.assertNotIn("retry-after", response.headers)
+
+    async def test_sets_retry_after_header(self):
+        request = MagicMock()
+        exc = TooManyRequestsError(retry_after=5)
+
+        response = await too_many_requests_handler(request, exc)
+
+        self.assertEqual(response.headers["retry-after"], "5")
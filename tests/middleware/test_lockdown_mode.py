@@ -5,21 +5,34 @@ import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi import status
+from starlette.datastructures import Headers
 from starlette.responses import Response
 
-from app.middleware.lockdown_mode import lockdown_mode_middleware
+from app.middleware.lockdown_mode import LockdownModeMiddleware
 
 
-def _request(path: str) -> MagicMock:
-    req = MagicMock()
-    req.url.path = path
-    return req
+def _scope(path: str) -> dict:
+    return {"type": "http", "method": "GET", "path": path, "headers": []}
+
+
+def _app(status_code: int) -> AsyncMock:
+    return AsyncMock(side_effect=Response(status_code=status_code).__call__)
+
+
+async def _call(app, scope: dict) -> dict:
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, AsyncMock(), send)
+    return messages[0]
 
 
 class TestLockdownModeMiddleware(unittest.IsolatedAsyncioTestCase):
     async def test_flag_absent_passes_through(self):
-        req = _request("/api/v1/x")
-        inner = AsyncMock(return_value=Response(status_code=200))
+        scope = _scope("/api/v1/x")
+        inner = _app(status_code=200)
 
         with (
             patch(
@@ -32,14 +45,15 @@ class TestLockdownModeMiddleware(unittest.IsolatedAsyncioTestCase):
                 return_value=MagicMock(API_PREFIX="/api/v1"),
             ),
         ):
-            resp = await lockdown_mode_middleware(req, inner)
+            resp = await _call(LockdownModeMiddleware(inner), scope)
 
-        inner.assert_awaited_once_with(req)
-        self.assertEqual(resp.status_code, 200)
+        inner.assert_awaited_once()
+        self.assertIs(inner.await_args.args[0], scope)
+        self.assertEqual(resp["status"], 200)
 
     async def test_flag_present_init_prefix_passes(self):
-        req = _request("/api/v1/init/state")
-        inner = AsyncMock(return_value=Response(status_code=200))
+        scope = _scope("/api/v1/init/state")
+        inner = _app(status_code=200)
 
         with (
             patch(
@@ -52,14 +66,15 @@ class TestLockdownModeMiddleware(unittest.IsolatedAsyncioTestCase):
                 return_value=MagicMock(API_PREFIX="/api/v1"),
             ),
         ):
-            resp = await lockdown_mode_middleware(req, inner)
+            resp = await _call(LockdownModeMiddleware(inner), scope)
 
-        inner.assert_awaited_once_with(req)
-        self.assertEqual(resp.status_code, 200)
+        inner.assert_awaited_once()
+        self.assertIs(inner.await_args.args[0], scope)
+        self.assertEqual(resp["status"], 200)
 
     async def test_flag_present_excluded_docs_passes(self):
-        req = _request("/docs")
-        inner = AsyncMock(return_value=Response(status_code=200))
+        scope = _scope("/docs")
+        inner = _app(status_code=200)
 
         with (
             patch(
@@ -72,13 +87,14 @@ class TestLockdownModeMiddleware(unittest.IsolatedAsyncioTestCase):
                 return_value=MagicMock(API_PREFIX="/api/v1"),
             ),
         ):
-            resp = await lockdown_mode_middleware(req, inner)
+            resp = await _call(LockdownModeMiddleware(inner), scope)
 
-        inner.assert_awaited_once_with(req)
-        self.assertEqual(resp.status_code, 200)
+        inner.assert_awaited_once()
+        self.assertIs(inner.await_args.args[0], scope)
+        self.assertEqual(resp["status"], 200)
 
     async def test_flag_present_blocks_other_paths(self):
-        req = _request("/api/v1/users")
+        scope = _scope("/api/v1/users")
         inner = AsyncMock()
 
         with (
@@ -92,8 +108,11 @@ class TestLockdownModeMiddleware(unittest.IsolatedAsyncioTestCase):
                 return_value=MagicMock(API_PREFIX="/api/v1"),
             ),
         ):
-            resp = await lockdown_mode_middleware(req, inner)
+            resp = await _call(LockdownModeMiddleware(inner), scope)
 
         inner.assert_not_awaited()
-        self.assertEqual(resp.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
-        self.assertEqual(resp.headers.get("Retry-After"), "300")
+        self.assertEqual(
+            resp["status"], status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+        headers = Headers(raw=resp["headers"])
+        self.assertEqual(headers.get("Retry-After"), "300")
@@ -5,15 +5,28 @@ import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi import status
+from starlette.datastructures import Headers
 from starlette.responses import Response
 
-from app.middleware.mountpoint_check import mountpoint_check_middleware
+from app.middleware.mountpoint_check import MountpointCheckMiddleware
 
 
-def _request(path: str) -> MagicMock:
-    req = MagicMock()
-    req.url.path = path
-    return req
+def _scope(path: str) -> dict:
+    return {"type": "http", "method": "GET", "path": path, "headers": []}
+
+
+def _app(status_code: int) -> AsyncMock:
+    return AsyncMock(side_effect=Response(status_code=status_code).__call__)
+
+
+async def _call(app, scope: dict) -> dict:
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, AsyncMock(), send)
+    return messages[0]
 
 
 def _config() -> MagicMock:
@@ -26,33 +39,35 @@ def _config() -> MagicMock:
 
 class TestMountpointCheckMiddleware(unittest.IsolatedAsyncioTestCase):
     async def test_init_prefix_skips_checks(self):
-        req = _request("/api/v1/init/x")
-        inner = AsyncMock(return_value=Response(status_code=200))
+        scope = _scope("/api/v1/init/x")
+        inner = _app(status_code=200)
 
         with patch(
             "app.middleware.mountpoint_check.get_config",
             return_value=_config(),
         ):
-            resp = await mountpoint_check_middleware(req, inner)
+            resp = await _call(MountpointCheckMiddleware(inner), scope)
 
-        inner.assert_awaited_once_with(req)
-        self.assertEqual(resp.status_code, 200)
+        inner.assert_awaited_once()
+        self.assertIs(inner.await_args.args[0], scope)
+        self.assertEqual(resp["status"], 200)
 
     async def test_openapi_excluded_skips_checks(self):
-        req = _request("/openapi.json")
-        inner = AsyncMock(return_value=Response(status_code=200))
+        scope = _scope("/openapi.json")
+        inner = _app(status_code=200)
 
         with patch(
             "app.middleware.mountpoint_check.get_config",
             return_value=_config(),
         ):
-            resp = await mountpoint_check_middleware(req, inner)
+            resp = await _call(MountpointCheckMiddleware(inner), scope)
 
-        inner.assert_awaited_once_with(req)
-        self.assertEqual(resp.status_code, 200)
+        inner.assert_awaited_once()
+        self.assertIs(inner.await_args.args[0], scope)
+        self.assertEqual(resp["status"], 200)
 
     async def test_passphrase_missing_returns_503(self):
-        req = _request("/api/v1/users")
+        scope = _scope("/api/v1/users")
         inner = AsyncMock()
 
         with (
@@ -66,14 +81,17 @@ class TestMountpointCheckMiddleware(unittest.IsolatedAsyncioTestCase):
                 return_value=False,
             ),
         ):
-            resp = await mountpoint_check_middleware(req, inner)
+            resp = await _call(MountpointCheckMiddleware(inner), scope)
 
         inner.assert_not_awaited()
-        self.assertEqual(resp.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
-        self.assertEqual(resp.headers.get("Retry-After"), "300")
+        self.assertEqual(
+            resp["status"], status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+        headers = Headers(raw=resp["headers"])
+        self.assertEqual(headers.get("Retry-After"), "300")
 
     async def test_mountpoint_not_mounted_returns_503(self):
-        req = _request("/api/v1/users")
+        scope = _scope("/api/v1/users")
         inner = AsyncMock()
 
         with (
@@ -92,14 +110,16 @@ class TestMountpointCheckMiddleware(unittest.IsolatedAsyncioTestCase):
                 return_value=False,
             ),
         ):
-            resp = await mountpoint_check_middleware(req, inner)
+            resp = await _call(MountpointCheckMiddleware(inner), scope)
 
         inner.assert_not_awaited()
-        self.assertEqual(resp.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(
+            resp["status"], status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
 
     async def test_ready_passes_through(self):
-        req = _request("/api/v1/users")
-        inner = AsyncMock(return_value=Response(status_code=200))
+        scope = _scope("/api/v1/users")
+        inner = _app(status_code=200)
 
         with (
             patch(
@@ -117,7 +137,8 @@ class TestMountpointCheckMiddleware(unittest.IsolatedAsyncioTestCase):
                 return_value=True,
             ),
         ):
-            resp = await mountpoint_check_middleware(req, inner)
+            resp = await _call(MountpointCheckMiddleware(inner), scope)
 
-        inner.assert_awaited_once_with(req)
-        self.assertEqual(resp.status_code, 200)
+        inner.assert_awaited_once()
+        self.assertIs(inner.await_args.args[0], scope)
+        self.assertEqual(resp["status"], 200)
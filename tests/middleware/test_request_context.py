@@ -1,83 +1,171 @@
-# tests/middleware/test_request_context.py
-# SPDX-License-Identifier: GPL-3.0-only
-
-import unittest
-import uuid
-from unittest.mock import AsyncMock, MagicMock, patch
-
-from starlette.responses import Response
-
-from app.middleware.request_context import (
-    request_context_middleware,
-    resolve_request_uuid,
-)
-
-
-class TestResolveRequestUuid(unittest.TestCase):
-    @patch("app.middleware.request_context.uuid.uuid4")
-    def test_none_generates_uuid(self, mock_uuid: MagicMock) -> None:
-        u = uuid.UUID("12345678-1234-5678-1234-567812345678")
-        mock_uuid.return_value = u
-
-        self.assertEqual(resolve_request_uuid(None), u.hex)
-
-    def test_valid_header_preserved(self) -> None:
-        self.assertEqual(resolve_request_uuid("abc-XYZ_09"), "abc-XYZ_09")
-
-    def test_whitespace_trimmed(self) -> None:
-        self.assertEqual(resolve_request_uuid("  ok-id  "), "ok-id")
-
-    @patch("app.middleware.request_context.uuid.uuid4")
-    def test_empty_after_strip_generates(self, mock_uuid: MagicMock) -> None:
-        u = uuid.UUID("aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee")
-        mock_uuid.return_value = u
-
-        self.assertEqual(resolve_request_uuid("   "), u.hex)
-
-    @patch("app.middleware.request_context.uuid.uuid4")
-    def test_too_long_generates(self, mock_uuid: MagicMock) -> None:
-        u = uuid.UUID("bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb")
-        mock_uuid.return_value = u
-
-        long_val = "a" * 65
-        self.assertEqual(resolve_request_uuid(long_val), u.hex)
-
-    @patch("app.middleware.request_context.uuid.uuid4")
-    def test_invalid_chars_generates(self, mock_uuid: MagicMock) -> None:
-        u = uuid.UUID("cccccccc-cccc-cccc-cccc-cccccccccccc")
-        mock_uuid.return_value = u
-
-        self.assertEqual(resolve_request_uuid("bad id!"), u.hex)
-
-
-class TestRequestContextMiddleware(unittest.IsolatedAsyncioTestCase):
-    async def test_sets_response_header_and_calls_next(self):
-        req = MagicMock()
-        req.headers.get = MagicMock(return_value="corr-id-1")
-        inner = AsyncMock(return_value=Response(status_code=204))
-
-        with patch("app.middleware.request_context.reset_context") as mock_rst:
-            resp = await request_context_middleware(req, inner)
-
-        inner.assert_awaited_once_with(req)
-        self.assertEqual(resp.headers["X-Request-ID"], "corr-id-1")
-        self.assertGreaterEqual(mock_rst.call_count, 1)
-
-    async def test_reset_context_on_inner_error(self):
-        req = MagicMock()
-        req.headers.get = MagicMock(return_value=None)
-
-        async def boom(_r):
-            raise RuntimeError("fail")
-
-        with (
-            patch("app.middleware.request_context.reset_context") as mock_rst,
-            patch(
-                "app.middleware.request_context.resolve_request_uuid",
-                return_value="gen-id",
-            ),
-        ):
-            with self.assertRaises(RuntimeError):
-                await request_context_middleware(req, boom)
-
-        self.assertGreaterEqual(mock_rst.call_count, 1)
+# tests/middleware/test_request_context.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from starlette.datastructures import Headers
+from starlette.responses import Response
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.context import get_context_var  # noqa: E402
+from app.middleware.request_context import (  # noqa: E402
+    RequestContextMiddleware,
+    resolve_request_uuid,
+)
+from app.runtime.load import RequestLoad  # noqa: E402
+from app.timing import TimingCategory, add_timing  # noqa: E402
+
+
+def _scope(headers: list | None = None) -> dict:
+    return {"type": "http", "path": "/", "headers": headers or []}
+
+
+async def _call(app, scope: dict) -> list[dict]:
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, AsyncMock(), send)
+    return messages
+
+
+class TestResolveRequestUuid(unittest.TestCase):
+    @patch("app.middleware.request_context.uuid.uuid4")
+    def test_none_generates_uuid(self, mock_uuid: MagicMock) -> None:
+        u = uuid.UUID("12345678-1234-5678-1234-567812345678")
+        mock_uuid.return_value = u
+
+        self.assertEqual(resolve_request_uuid(None), u.hex)
+
+    def test_valid_header_preserved(self) -> None:
+        self.assertEqual(resolve_request_uuid("abc-XYZ_09"), "abc-XYZ_09")
+
+    def test_whitespace_trimmed(self) -> None:
+        self.assertEqual(resolve_request_uuid("  ok-id  "), "ok-id")
+
+    @patch("app.middleware.request_context.uuid.uuid4")
+    def test_empty_after_strip_generates(self, mock_uuid: MagicMock) -> None:
+        u = uuid.UUID("aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee")
+        mock_uuid.return_value = u
+
+        self.assertEqual(resolve_request_uuid("   "), u.hex)
+
+    @patch("app.middleware.request_context.uuid.uuid4")
+    def test_too_long_generates(self, mock_uuid: MagicMock) -> None:
+        u = uuid.UUID("bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb")
+        mock_uuid.return_value = u
+
+        long_val = "a" * 65
+        self.assertEqual(resolve_request_uuid(long_val), u.hex)
+
+    @patch("app.middleware.request_context.uuid.uuid4")
+    def test_invalid_chars_generates(self, mock_uuid: MagicMock) -> None:
+        u = uuid.UUID("cccccccc-cccc-cccc-cccc-cccccccccccc")
+        mock_uuid.return_value = u
+
+        self.assertEqual(resolve_request_uuid("bad id!"), u.hex)
+
+
+class TestRequestContextMiddleware(unittest.IsolatedAsyncioTestCase):
+    async def test_sets_response_header_and_calls_next(self):
+        scope = _scope([(b"x-request-id", b"corr-id-1")])
+        inner = AsyncMock(side_effect=Response(status_code=204).__call__)
+
+        with patch("app.middleware.request_context.reset_context") as mock_rst:
+            messages = await _call(RequestContextMiddleware(inner), scope)
+
+        inner.assert_awaited_once()
+        self.assertIs(inner.await_args.args[0], scope)
+        headers = Headers(raw=messages[0]["headers"])
+        self.assertEqual(headers["X-Request-ID"], "corr-id-1")
+        self.assertGreaterEqual(mock_rst.call_count, 1)
+
+    async def test_context_is_set_while_response_is_sent(self):
+        seen = []
+
+        async def inner(scope, receive, send):
+            seen.append(get_context_var("request_uuid"))
+            await Response(status_code=204)(scope, receive, send)
+            seen.append(get_context_var("request_uuid"))
+
+        await _call(
+            RequestContextMiddleware(inner),
+            _scope([(b"x-request-id", b"corr-id-2")]),
+        )
+
+        self.assertEqual(seen, ["corr-id-2", "corr-id-2"])
+        self.assertIsNone(get_context_var("request_uuid"))
+
+    async def test_server_timing_header_when_enabled(self):
+        async def inner(scope, receive, send):
+            add_timing(TimingCategory.SQL, 0.0125)
+            await Response(status_code=204)(scope, receive, send)
+
+        with patch(
+            "app.middleware.request_context.get_config",
+            return_value=MagicMock(SERVER_TIMING_ENABLED=True),
+        ):
+            messages = await _call(RequestContextMiddleware(inner), _scope())
+
+        header = Headers(raw=messages[0]["headers"])["Server-Timing"]
+        self.assertIn("sql;dur=12.500", header)
+        self.assertIn("lock;dur=0.000", header)
+        self.assertIn("total;dur=", header)
+
+    async def test_no_server_timing_header_when_disabled(self):
+        inner = AsyncMock(side_effect=Response(status_code=204).__call__)
+
+        with patch(
+            "app.middleware.request_context.get_config",
+            return_value=MagicMock(SERVER_TIMING_ENABLED=False),
+        ):
+            messages = await _call(RequestContextMiddleware(inner), _scope())
+
+        headers = Headers(raw=messages[0]["headers"])
+        self.assertNotIn("Server-Timing", headers)
+
+    async def test_counts_request_as_active_load(self):
+        load = RequestLoad()
+        active = []
+
+        async def inner(scope, receive, send):
+            active.append(load.active)
+            await Response(status_code=204)(scope, receive, send)
+
+        with patch("app.middleware.request_context.request_load", load):
+            await _call(RequestContextMiddleware(inner), _scope())
+
+        self.assertEqual(active, [1])
+        self.assertEqual(load.active, 0)
+
+    async def test_reset_context_on_inner_error(self):
+        async def boom(scope, receive, send):
+            raise RuntimeError("fail")
+
+        with (
+            patch("app.middleware.request_context.reset_context") as mock_rst,
+            patch(
+                "app.middleware.request_context.resolve_request_uuid",
+                return_value="gen-id",
+            ),
+        ):
+            with self.assertRaises(RuntimeError):
+                await _call(RequestContextMiddleware(boom), _scope())
+
+        self.assertGreaterEqual(mock_rst.call_count, 1)
+
+    async def test_non_http_scope_passes_through(self):
+        inner = AsyncMock()
+        scope = {"type": "lifespan"}
+
+        with patch("app.middleware.request_context.reset_context") as mock_rst:
+            await RequestContextMiddleware(inner)(scope, None, None)
+
+        inner.assert_awaited_once_with(scope, None, None)
+        mock_rst.assert_not_called()
@@ -1,22 +1,46 @@
 # tests/middleware/test_request_logging.py
 # SPDX-License-Identifier: GPL-3.0-only
 
+import asyncio
 import unittest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 
-from starlette.responses import Response
+from starlette.responses import Response, StreamingResponse
 
-from app.middleware.request_logging import request_logging_middleware
+from app.events import Events as E
+from app.middleware.request_logging import RequestLoggingMiddleware
+from app.timing import TimingCategory
+
+
+def _scope(method: str, client: tuple | None) -> dict:
+    return {
+        "type": "http",
+        "method": method,
+        "scheme": "http",
+        "server": ("x", 80),
+        "path": "/y",
+        "query_string": b"",
+        "headers": [],
+        "client": client,
+    }
+
+
+async def _call(app, scope: dict) -> list[dict]:
+    messages = []
+
+    async def receive():
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages
 
 
 class TestRequestLoggingMiddleware(unittest.IsolatedAsyncioTestCase):
     async def test_logs_start_and_finish(self):
-        req = MagicMock()
-        req.method = "GET"
-        req.url = "http://x/y"
-        req.client = MagicMock()
-        req.client.host = "10.0.0.1"
-        inner = AsyncMock(return_value=Response(status_code=201))
+        inner = Response(status_code=201)
 
         with (
             patch(
@@ -27,22 +51,39 @@ class TestRequestLoggingMiddleware(unittest.IsolatedAsyncioTestCase):
                 "app.middleware.request_logging.time.perf_counter",
                 return_value=1000.25,
             ),
+            patch(
+                "app.middleware.request_logging.get_timings",
+                return_value={
+                    TimingCategory.LOCK: 0.01,
+                    TimingCategory.SQL: 0.02,
+                    TimingCategory.FILE: 0.03,
+                    TimingCategory.IMAGE: 0.0,
+                    TimingCategory.HOOK: 0.04,
+                },
+            ),
             patch(
                 "app.middleware.request_logging.logger",
             ) as mock_log,
         ):
-            resp = await request_logging_middleware(req, inner)
+            messages = await _call(
+                RequestLoggingMiddleware(inner),
+                _scope("GET", ("10.0.0.1", 1234)),
+            )
 
-        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(messages[0]["status"], 201)
         self.assertEqual(mock_log.info.call_count, 2)
+        first, last = mock_log.info.call_args_list
+        self.assertEqual(first[0][3], "http://x/y")
+        self.assertEqual(first[0][4], "10.0.0.1")
+        self.assertEqual(
+            last[0][1:], (E.REQUEST_COMPLETED, 201, 0.25,
+                          0.01, 0.02, 0.03, 0.0, 0.04),
+        )
+        self.assertIn("sql_time=%.6f", last[0][0])
         mock_log.error.assert_not_called()
 
     async def test_no_client_host_logs_none(self):
-        req = MagicMock()
-        req.method = "POST"
-        req.url = "http://x/"
-        req.client = None
-        inner = AsyncMock(return_value=Response(status_code=200))
+        inner = Response(status_code=200)
 
         with (
             patch(
@@ -55,22 +96,43 @@ class TestRequestLoggingMiddleware(unittest.IsolatedAsyncioTestCase):
             ),
             patch("app.middleware.request_logging.logger") as mock_log,
         ):
-            await request_logging_middleware(req, inner)
+            await _call(RequestLoggingMiddleware(inner), _scope("POST", None))
 
         first = mock_log.info.call_args_list[0]
         self.assertIsNone(first[0][4])
 
-    async def test_inner_exception_logs_error_and_reraises(self):
-        req = MagicMock()
-        req.method = "GET"
-        req.url = "http://x/"
-        req.client = None
+    async def test_completion_logged_after_streamed_body(self):
+        events = []
+
+        async def body():
+            events.append("body")
+            yield b"chunk"
 
-        async def inner(_r):
+        inner = StreamingResponse(body())
+
+        with (
+            patch(
+                "app.middleware.request_logging.get_context_var",
+                return_value=0.0,
+            ),
+            patch("app.middleware.request_logging.logger") as mock_log,
+        ):
+            mock_log.info.side_effect = lambda *args: events.append(args[1])
+            await _call(RequestLoggingMiddleware(inner), _scope("GET", None))
+
+        self.assertEqual(
+            events,
+            [E.REQUEST_STARTED, "body", E.REQUEST_COMPLETED],
+        )
+
+    async def test_inner_exception_logs_error_and_reraises(self):
+        async def inner(scope, receive, send):
             raise ValueError("boom")
 
         with patch("app.middleware.request_logging.logger") as mock_log:
             with self.assertRaises(ValueError):
-                await request_logging_middleware(req, inner)
+                await _call(
+                    RequestLoggingMiddleware(inner), _scope("GET", None),
+                )
 
         mock_log.exception.assert_called_once()
@@ -0,0 +1,89 @@
+# tests/middleware/test_request_metrics.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from starlette.responses import Response
+
+from app.middleware.request_metrics import RequestMetricsMiddleware
+
+
+def _scope(method: str = "GET", route=None) -> dict:
+    scope = {"type": "http", "method": method, "path": "/", "headers": []}
+    if route is not None:
+        scope["route"] = route
+    return scope
+
+
+async def _call(app, scope: dict) -> list[dict]:
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, AsyncMock(), send)
+    return messages
+
+
+class TestRequestMetricsMiddleware(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        module = "app.middleware.request_metrics."
+        self.patchers = {
+            "requests": patch(module + "HTTP_REQUESTS"),
+            "duration": patch(module + "HTTP_REQUEST_DURATION"),
+        }
+        self.mocks = {
+            name: patcher.start() for name, patcher in self.patchers.items()
+        }
+        for patcher in self.patchers.values():
+            self.addCleanup(patcher.stop)
+
+    async def test_records_route_template_and_status(self):
+        route = SimpleNamespace(path="/api/v1/files/{file_id}")
+        inner = AsyncMock(side_effect=Response(status_code=404).__call__)
+
+        messages = await _call(
+            RequestMetricsMiddleware(inner), _scope("GET", route),
+        )
+
+        self.assertEqual(messages[0]["status"], 404)
+        self.mocks["requests"].labels.assert_called_once_with(
+            "GET", "/api/v1/files/{file_id}", 404,
+        )
+        self.mocks["requests"].labels.return_value.inc.assert_called_once()
+        self.mocks["duration"].labels.assert_called_once_with(
+            "GET", "/api/v1/files/{file_id}",
+        )
+        self.mocks["duration"].labels.return_value.observe.assert_called_once()
+
+    async def test_groups_unmatched_routes_and_unknown_methods(self):
+        inner = AsyncMock(side_effect=Response(status_code=404).__call__)
+
+        await _call(RequestMetricsMiddleware(inner), _scope("PROPFIND"))
+
+        self.mocks["requests"].labels.assert_called_once_with(
+            "other", "unmatched", 404,
+        )
+
+    async def test_failure_before_response_counts_as_500(self):
+        async def boom(scope, receive, send):
+            raise RuntimeError("fail")
+
+        with self.assertRaises(RuntimeError):
+            await _call(RequestMetricsMiddleware(boom), _scope("POST"))
+
+        self.mocks["requests"].labels.assert_called_once_with(
+            "POST", "unmatched", 500,
+        )
+
+    async def test_non_http_scope_passes_through(self):
+        inner = AsyncMock()
+        scope = {"type": "lifespan"}
+
+        await RequestMetricsMiddleware(inner)(scope, None, None)
+
+        inner.assert_awaited_once_with(scope, None, None)
+        self.mocks["requests"].labels.assert_not_called()
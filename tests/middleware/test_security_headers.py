@@ -2,21 +2,28 @@
 # SPDX-License-Identifier: GPL-3.0-only
 
 import unittest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
+from starlette.datastructures import Headers
 from starlette.responses import Response
 
-from app.middleware.security_headers import security_headers_middleware
+from app.middleware.security_headers import SecurityHeadersMiddleware
 
 
 class TestSecurityHeadersMiddleware(unittest.IsolatedAsyncioTestCase):
     async def test_adds_headers(self):
-        req = MagicMock()
-        inner = AsyncMock(return_value=Response(status_code=200))
+        inner = AsyncMock(side_effect=Response(status_code=200).__call__)
+        scope = {"type": "http", "headers": []}
+        messages = []
 
-        resp = await security_headers_middleware(req, inner)
+        async def send(message):
+            messages.append(message)
 
-        inner.assert_awaited_once_with(req)
-        self.assertEqual(resp.headers["X-Content-Type-Options"], "nosniff")
-        self.assertEqual(resp.headers["X-Frame-Options"], "DENY")
-        self.assertEqual(resp.headers["Referrer-Policy"], "no-referrer")
+        await SecurityHeadersMiddleware(inner)(scope, AsyncMock(), send)
+
+        inner.assert_awaited_once()
+        headers = Headers(raw=messages[0]["headers"])
+        self.assertEqual(headers["X-Content-Type-Options"], "nosniff")
+        self.assertEqual(headers["X-Frame-Options"], "DENY")
+        self.assertEqual(headers["Referrer-Policy"], "no-referrer")
+        self.assertEqual(messages[1]["type"], "http.response.body")
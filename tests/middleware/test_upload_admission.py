@@ -0,0 +1,99 @@
+# tests/middleware/test_upload_admission.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import jwt
+from fastapi.routing import APIRoute
+from starlette.responses import Response
+
+from app.errors import TooManyRequestsError
+from app.middleware.upload_admission import UploadAdmissionRoute
+
+
+async def _endpoint():
+    return {}
+
+
+def _request(headers: dict) -> MagicMock:
+    req = MagicMock()
+    req.headers = headers
+    return req
+
+
+class TestUploadAdmissionRoute(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.route = UploadAdmissionRoute("/x", _endpoint, methods=["POST"])
+        self.reserved = []
+        self.inner = AsyncMock(return_value=Response(status_code=200))
+
+        @asynccontextmanager
+        async def reserve(user_key, nbytes):
+            self.reserved.append((user_key, nbytes))
+            yield
+
+        admission = MagicMock(reserve=reserve)
+        patches = [
+            patch(
+                "app.middleware.upload_admission.get_upload_admission",
+                return_value=admission,
+            ),
+            patch.object(
+                APIRoute, "get_route_handler", return_value=self.inner,
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    async def test_reserves_content_length_for_token_user(self):
+        req = _request({
+            "authorization": "Bearer token",
+            "content-length": "123",
+        })
+
+        with patch(
+            "app.middleware.upload_admission.decode_auth_token",
+            return_value={"sub": 7},
+        ) as decode_mock:
+            resp = await self.route.get_route_handler()(req)
+
+        decode_mock.assert_called_once_with("token")
+        self.assertEqual(self.reserved, [("7", 123)])
+        self.inner.assert_awaited_once_with(req)
+        self.assertEqual(resp.status_code, 200)
+
+    async def test_missing_or_invalid_headers_reserve_unknown(self):
+        req = _request({
+            "authorization": "Bearer bad",
+            "content-length": "abc",
+        })
+
+        with patch(
+            "app.middleware.upload_admission.decode_auth_token",
+            side_effect=jwt.InvalidTokenError,
+        ):
+            await self.route.get_route_handler()(req)
+        await self.route.get_route_handler()(_request({}))
+
+        self.assertEqual(self.reserved, [(None, None), (None, None)])
+
+    async def test_rejection_skips_handler(self):
+        @asynccontextmanager
+        async def reserve(user_key, nbytes):
+            raise TooManyRequestsError(retry_after=5)
+            yield
+
+        with patch(
+            "app.middleware.upload_admission.get_upload_admission",
+            return_value=MagicMock(reserve=reserve),
+        ):
+            with self.assertRaises(TooManyRequestsError):
+                await self.route.get_route_handler()(
+                    _request({"content-length": "1"}),
+                )
+
+        self.inner.assert_not_awaited()
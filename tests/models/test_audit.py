@@ -3,6 +3,7 @@
 
 import unittest
 
+from app.db.base import AuditBase, Base
 from app.models.audit import Audit, prevent_delete, prevent_update
 
 
@@ -31,11 +32,11 @@ class TestAuditModel(unittest.TestCase):
 
         self.assertTrue(column.nullable)
         self.assertTrue(column.index)
-        self.assertEqual(len(column.foreign_keys), 1)
+        self.assertEqual(len(column.foreign_keys), 0)
 
-        fk = next(iter(column.foreign_keys))
-        self.assertEqual(fk.target_fullname, "users.id")
-        self.assertEqual(fk.ondelete, "RESTRICT")
+    def test_registered_in_audit_metadata_only(self):
+        self.assertIn("audit", AuditBase.metadata.tables)
+        self.assertNotIn("audit", Base.metadata.tables)
 
     def test_event_column_configuration(self):
         column = Audit.__table__.columns["event"]
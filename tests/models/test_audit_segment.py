@@ -0,0 +1,87 @@
+# tests/models/test_audit_segment.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.db.base import AuditBase, Base
+from app.models.audit_segment import (
+    AuditSegment,
+    prevent_delete,
+    prevent_update,
+)
+
+
+class TestAuditSegmentModel(unittest.TestCase):
+
+    def test_table_name(self):
+        self.assertEqual(AuditSegment.__tablename__, "audit_segments")
+
+    def test_registered_in_audit_metadata_only(self):
+        self.assertIn("audit_segments", AuditBase.metadata.tables)
+        self.assertNotIn("audit_segments", Base.metadata.tables)
+
+    def test_segment_uuid_column_configuration(self):
+        column = AuditSegment.__table__.columns["segment_uuid"]
+
+        self.assertFalse(column.nullable)
+        self.assertTrue(column.unique)
+        self.assertEqual(str(column.type), "VARCHAR(36)")
+
+    def test_checksum_column_configuration(self):
+        column = AuditSegment.__table__.columns["checksum"]
+
+        self.assertFalse(column.nullable)
+        self.assertEqual(str(column.type), "VARCHAR(64)")
+
+    def test_id_bounds_are_indexed(self):
+        for name in ("min_id", "max_id"):
+            with self.subTest(name=name):
+                column = AuditSegment.__table__.columns[name]
+                self.assertFalse(column.nullable)
+                self.assertTrue(column.index)
+
+    def test_created_at_bounds_are_required(self):
+        for name in ("min_created_at", "max_created_at"):
+            with self.subTest(name=name):
+                column = AuditSegment.__table__.columns[name]
+                self.assertFalse(column.nullable)
+
+    def test_nullable_bounds(self):
+        for name in (
+            "min_created_by",
+            "max_created_by",
+            "min_resource_id",
+            "max_resource_id",
+        ):
+            with self.subTest(name=name):
+                column = AuditSegment.__table__.columns[name]
+                self.assertTrue(column.nullable)
+
+    def test_absolute_path_uses_archive_dir(self):
+        segment = AuditSegment(segment_uuid="seg-uuid")
+        config = MagicMock(AUDIT_ARCHIVE_DIR="/mnt/audit")
+
+        with patch(
+            "app.models.audit_segment.get_config",
+            return_value=config,
+        ):
+            self.assertEqual(segment.absolute_path, "/mnt/audit/seg-uuid")
+
+    def test_prevent_update_raises_runtime_error(self):
+        with self.assertRaises(RuntimeError) as cm:
+            prevent_update(None, None, None)
+
+        self.assertEqual(
+            str(cm.exception),
+            "Audit segments cannot be updated",
+        )
+
+    def test_prevent_delete_raises_runtime_error(self):
+        with self.assertRaises(RuntimeError) as cm:
+            prevent_delete(None, None, None)
+
+        self.assertEqual(
+            str(cm.exception),
+            "Audit segments cannot be deleted",
+        )
@@ -0,0 +1,56 @@
+# tests/models/test_upload_session.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.models.upload_session import UploadSession
+
+
+class TestUploadSessionModel(unittest.TestCase):
+
+    def _upload_session(self, filesize=10, received_ranges="[]"):
+        return UploadSession(
+            created_by=1,
+            expires_at=100,
+            folder_id=2,
+            filename="a.bin",
+            filesize=filesize,
+            upload_uuid="550e8400-e29b-41d4",
+            received_ranges=received_ranges,
+        )
+
+    def test_absolute_path(self):
+        config = MagicMock()
+        config.FILES_UPLOADS_DIR = "/var/lib/hidden/mountpoint/uploads"
+
+        with patch(
+            "app.models.upload_session.get_config",
+            return_value=config,
+        ):
+            self.assertEqual(
+                self._upload_session().absolute_path,
+                "/var/lib/hidden/mountpoint/uploads/550e8400-e29b-41d4",
+            )
+
+    def test_ranges_parses_json(self):
+        upload_session = self._upload_session(
+            received_ranges="[[0, 4], [6, 8]]",
+        )
+
+        self.assertEqual(upload_session.ranges, [(0, 4), (6, 8)])
+
+    def test_is_complete(self):
+        cases = [
+            (10, "[]", False),
+            (10, "[[0, 4]]", False),
+            (10, "[[0, 4], [4, 10]]", False),
+            (10, "[[0, 10]]", True),
+            (0, "[]", True),
+        ]
+        for filesize, received_ranges, expected in cases:
+            with self.subTest(received_ranges=received_ranges):
+                upload_session = self._upload_session(
+                    filesize, received_ranges,
+                )
+                self.assertEqual(upload_session.is_complete, expected)
@@ -0,0 +1,304 @@
+# tests/repositories/test_archive.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import io
+import os
+import stat
+import struct
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from dataclasses import replace
+from unittest.mock import patch
+
+from app.repositories import archive as ra
+
+MTIME = 1700000000
+CONTENT = {
+    "bin": bytes(range(256)) * 400,
+    "text": b"hello archive\n" * 3000,
+    "empty": b"",
+}
+
+
+def _entries(deflate=False):
+    return [
+        ra.ArchiveEntry(name="root", mtime=MTIME, is_dir=True),
+        ra.ArchiveEntry(
+            name="root/a.bin", mtime=MTIME, size=len(CONTENT["bin"]),
+            deflate=deflate, key="bin",
+        ),
+        ra.ArchiveEntry(
+            name="root/ü/" + "x" * 150 + ".txt", mtime=MTIME,
+            size=len(CONTENT["text"]), deflate=deflate, key="text",
+        ),
+        ra.ArchiveEntry(
+            name="root/empty", mtime=MTIME, deflate=deflate, key="empty",
+        ),
+    ]
+
+
+class TestArchive(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.reads = []
+
+    async def _read_entry(self, entry, offset, length):
+        self.reads.append((entry.key, offset, length))
+        data = CONTENT[entry.key][offset:offset + length]
+        for i in range(0, len(data), 7000):
+            yield data[i:i + 7000]
+
+    async def _collect(self, archive, *args):
+        return b"".join([chunk async for chunk in archive.stream(*args)])
+
+    # --- ZipArchive ---
+
+    async def test_zip_stored_round_trip(self):
+        archive = ra.ZipArchive(_entries(), self._read_entry)
+
+        data = await self._collect(archive)
+
+        self.assertEqual(len(data), archive.size)
+        with zipfile.ZipFile(io.BytesIO(data)) as z:
+            self.assertIsNone(z.testzip())
+            infos = z.infolist()
+            self.assertEqual(
+                [i.filename for i in infos],
+                ["root/", "root/a.bin", _entries()[2].name, "root/empty"],
+            )
+            self.assertTrue(infos[0].is_dir())
+            self.assertEqual(infos[1].compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(z.read("root/a.bin"), CONTENT["bin"])
+            self.assertEqual(infos[1].date_time, (2023, 11, 14, 22, 13, 20))
+
+    async def test_zip_full_stream_reads_each_entry_once(self):
+        archive = ra.ZipArchive(_entries(), self._read_entry)
+
+        await self._collect(archive)
+
+        self.assertEqual(
+            self.reads,
+            [
+                ("bin", 0, len(CONTENT["bin"])),
+                ("text", 0, len(CONTENT["text"])),
+            ],
+        )
+
+    async def test_zip_deflated_round_trip(self):
+        archive = ra.ZipArchive(_entries(deflate=True), self._read_entry)
+
+        data = await self._collect(archive)
+
+        self.assertIsNone(archive.size)
+        self.assertLess(len(data), len(CONTENT["bin"]))
+        with zipfile.ZipFile(io.BytesIO(data)) as z:
+            self.assertIsNone(z.testzip())
+            info = z.getinfo(_entries()[2].name)
+            self.assertEqual(info.compress_type, zipfile.ZIP_DEFLATED)
+            self.assertEqual(z.read(info), CONTENT["text"])
+
+    async def test_zip_deflated_rejects_range(self):
+        archive = ra.ZipArchive(_entries(deflate=True), self._read_entry)
+
+        with self.assertRaises(ValueError):
+            await self._collect(archive, 10, None)
+
+    async def test_zip_ranges_match_full_stream(self):
+        full = await self._collect(
+            ra.ZipArchive(_entries(), self._read_entry),
+        )
+
+        for start, end in [
+            (0, 10), (40, 70000), (70000, None), (len(full) - 5, None),
+        ]:
+            with self.subTest(start=start, end=end):
+                archive = ra.ZipArchive(_entries(), self._read_entry)
+                part = await self._collect(archive, start, end)
+                self.assertEqual(part, full[start:end])
+
+    async def test_zip_range_reads_skipped_entries_for_crc(self):
+        full = await self._collect(
+            ra.ZipArchive(_entries(), self._read_entry),
+        )
+        self.reads.clear()
+
+        directory_offset = struct.unpack("<I", full[-6:-2])[0]
+
+        archive = ra.ZipArchive(_entries(), self._read_entry)
+        await self._collect(archive, directory_offset, None)
+
+        self.assertEqual(
+            sorted(self.reads),
+            [
+                ("bin", 0, len(CONTENT["bin"])),
+                ("text", 0, len(CONTENT["text"])),
+            ],
+        )
+
+    async def test_zip64_records(self):
+        with patch.object(ra, "_ZIP64_SIZE_LIMIT", 10), \
+                patch.object(ra, "_UINT16_MAX", 2):
+            archive = ra.ZipArchive(_entries(), self._read_entry)
+            data = await self._collect(archive)
+
+        self.assertEqual(len(data), archive.size)
+        with zipfile.ZipFile(io.BytesIO(data)) as z:
+            self.assertIsNone(z.testzip())
+            self.assertEqual(len(z.infolist()), 4)
+            self.assertEqual(z.read("root/a.bin"), CONTENT["bin"])
+
+    # --- TarArchive ---
+
+    async def test_tar_round_trip(self):
+        archive = ra.TarArchive(_entries(), self._read_entry)
+
+        data = await self._collect(archive)
+
+        self.assertEqual(len(data), archive.size)
+        self.assertEqual(len(data) % 512, 0)
+        with tarfile.open(fileobj=io.BytesIO(data)) as t:
+            members = t.getmembers()
+            self.assertEqual(
+                [m.name for m in members],
+                ["root", "root/a.bin", _entries()[2].name, "root/empty"],
+            )
+            self.assertTrue(members[0].isdir())
+            self.assertEqual(members[1].mtime, MTIME)
+            self.assertEqual(
+                t.extractfile(members[2]).read(), CONTENT["text"],
+            )
+
+    async def test_tar_ranges_match_full_stream(self):
+        full = await self._collect(
+            ra.TarArchive(_entries(), self._read_entry),
+        )
+
+        for start, end in [(0, 600), (1000, 110000), (110000, None)]:
+            with self.subTest(start=start, end=end):
+                self.reads.clear()
+                archive = ra.TarArchive(_entries(), self._read_entry)
+                part = await self._collect(archive, start, end)
+                self.assertEqual(part, full[start:end])
+
+        self.assertTrue(all(key == "text" for key, _, _ in self.reads))
+
+    # --- is_compressible ---
+
+    def test_is_compressible(self):
+        self.assertTrue(ra.is_compressible(None))
+        self.assertTrue(ra.is_compressible("text/plain"))
+        self.assertTrue(ra.is_compressible("application/octet-stream"))
+        self.assertFalse(ra.is_compressible("image/png"))
+        self.assertFalse(ra.is_compressible("video/mp4"))
+        self.assertFalse(ra.is_compressible("application/zip"))
+
+    # --- _dos_datetime ---
+
+    def test_dos_datetime_clamps_to_format_range(self):
+        self.assertEqual(ra._dos_datetime(0), (0, (1 << 5) | 1))
+        self.assertEqual(
+            ra._dos_datetime(2 ** 33)[1], (127 << 9) | (12 << 5) | 31,
+        )
+
+
+class TestArchiveReader(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    async def _extract(self, reader, index):
+        destination = self._path(f"out{index}")
+        await reader.extract(index, destination)
+        with open(destination, "rb") as f:
+            return f.read()
+
+    async def test_reads_zip_members(self):
+        path = self._path("a.zip")
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("docs/", b"")
+            zf.writestr("docs/a.txt", CONTENT["text"])
+            link = zipfile.ZipInfo("docs/link")
+            link.external_attr = (stat.S_IFLNK | 0o777) << 16
+            zf.writestr(link, b"a.txt")
+
+        reader = await ra.ArchiveReader.open(path)
+
+        self.assertEqual(reader.members, [
+            ra.ArchiveMember("docs/", 0, True, True),
+            ra.ArchiveMember("docs/a.txt", len(CONTENT["text"]), False, True),
+            ra.ArchiveMember("docs/link", 5, False, False),
+        ])
+        self.assertEqual(await self._extract(reader, 1), CONTENT["text"])
+        await reader.close()
+
+    async def test_reads_compressed_tar_members(self):
+        path = self._path("a.tar.gz")
+        with tarfile.open(path, "w:gz") as tf:
+            directory = tarfile.TarInfo("docs")
+            directory.type = tarfile.DIRTYPE
+            tf.addfile(directory)
+            info = tarfile.TarInfo("docs/a.bin")
+            info.size = len(CONTENT["bin"])
+            tf.addfile(info, io.BytesIO(CONTENT["bin"]))
+            link = tarfile.TarInfo("docs/link")
+            link.type = tarfile.SYMTYPE
+            link.linkname = "/etc/passwd"
+            tf.addfile(link)
+
+        reader = await ra.ArchiveReader.open(path)
+
+        self.assertEqual(
+            [(m.name, m.is_dir, m.is_supported) for m in reader.members],
+            [
+                ("docs", True, True),
+                ("docs/a.bin", False, True),
+                ("docs/link", False, False),
+            ],
+        )
+        self.assertEqual(await self._extract(reader, 1), CONTENT["bin"])
+        await reader.close()
+
+    async def test_rejects_non_archive(self):
+        path = self._path("plain.txt")
+        with open(path, "wb") as f:
+            f.write(b"not an archive")
+
+        with self.assertRaises(ValueError):
+            await ra.ArchiveReader.open(path)
+
+    async def test_member_longer_than_declared_raises_value_error(self):
+        path = self._path("a.tar")
+        with tarfile.open(path, "w") as tf:
+            info = tarfile.TarInfo("a.bin")
+            info.size = len(CONTENT["bin"])
+            tf.addfile(info, io.BytesIO(CONTENT["bin"]))
+
+        reader = await ra.ArchiveReader.open(path)
+        reader.members[0] = replace(reader.members[0], size=100)
+        destination = self._path("out")
+
+        with self.assertRaises(ValueError):
+            await reader.extract(0, destination)
+        self.assertEqual(os.path.getsize(destination), 100)
+        await reader.close()
+
+    async def test_corrupted_member_raises_value_error(self):
+        path = self._path("a.zip")
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("a.txt", CONTENT["text"])
+
+        with open(path, "r+b") as f:
+            data = f.read()
+            offset = data.index(CONTENT["text"][:20])
+            f.seek(offset)
+            f.write(b"X" * 20)
+
+        reader = await ra.ArchiveReader.open(path)
+
+        with self.assertRaises(ValueError):
+            await reader.extract(0, self._path("out"))
+        await reader.close()
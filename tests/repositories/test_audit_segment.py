@@ -0,0 +1,240 @@
+# tests/repositories/test_audit_segment.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import gzip
+import hashlib
+import json
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.models.audit import Audit  # noqa: E402
+from app.models.audit_segment import AuditSegment  # noqa: E402
+from app.repositories import audit_segment as ras  # noqa: E402
+
+
+def _audit(audit_id: int) -> Audit:
+    return Audit(
+        id=audit_id,
+        created_at=1000 + audit_id,
+        created_by=7,
+        event="file_upload_completed",
+        request_uuid="req",
+        resource_type="file",
+        resource_id=None,
+    )
+
+
+class TestWriteSegment(unittest.IsolatedAsyncioTestCase):
+
+    async def test_writes_gzip_ndjson_and_returns_size_and_checksum(self):
+        with patch(
+            "app.repositories.audit_segment.write",
+            new_callable=AsyncMock,
+        ) as write_mock:
+            filesize, checksum = await ras.write_segment(
+                "/seg", [_audit(1), _audit(2)],
+            )
+
+        path, data = write_mock.await_args.args
+        self.assertEqual(path, "/seg")
+        self.assertEqual(filesize, len(data))
+        self.assertEqual(checksum, hashlib.sha256(data).hexdigest())
+
+        lines = gzip.decompress(data).decode("utf-8").splitlines()
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual([row["id"] for row in rows], [1, 2])
+        self.assertEqual(set(rows[0]), set(ras.AUDIT_SEGMENT_FIELDS))
+        self.assertIsNone(rows[0]["resource_id"])
+
+    async def test_output_is_deterministic(self):
+        with patch(
+            "app.repositories.audit_segment.write",
+            new_callable=AsyncMock,
+        ):
+            first = await ras.write_segment("/seg", [_audit(1)])
+            second = await ras.write_segment("/seg", [_audit(1)])
+
+        self.assertEqual(first, second)
+
+
+class TestReadSegment(unittest.IsolatedAsyncioTestCase):
+
+    async def test_returns_transient_audit_objects(self):
+        data = ras._encode_segment([
+            {field: getattr(_audit(3), field)
+             for field in ras.AUDIT_SEGMENT_FIELDS},
+        ])
+
+        with patch(
+            "app.repositories.audit_segment.read",
+            new_callable=AsyncMock,
+            return_value=data,
+        ):
+            audit = await ras.read_segment(
+                "/seg", hashlib.sha256(data).hexdigest(),
+            )
+
+        self.assertEqual(len(audit), 1)
+        self.assertIsInstance(audit[0], Audit)
+        self.assertEqual(audit[0].id, 3)
+        self.assertEqual(audit[0].created_at, 1003)
+        self.assertEqual(audit[0].event, "file_upload_completed")
+
+    async def test_raises_on_checksum_mismatch(self):
+        data = ras._encode_segment([])
+
+        with patch(
+            "app.repositories.audit_segment.read",
+            new_callable=AsyncMock,
+            return_value=data,
+        ):
+            with self.assertRaises(ValueError):
+                await ras.read_segment("/seg", "0" * 64)
+
+
+class TestGetSegmentFilters(unittest.TestCase):
+
+    def test_maps_filters_to_bounds(self):
+        self.assertEqual(
+            ras.get_segment_filters({
+                "created_at__ge": 10,
+                "created_at__le": 20,
+                "created_by__eq": 3,
+                "resource_id__eq": 4,
+                "event__ilike": "%x%",
+                "limit": 50,
+            }),
+            {
+                "max_created_at__ge": 10,
+                "min_created_at__le": 20,
+                "min_created_by__le": 3,
+                "max_created_by__ge": 3,
+                "min_resource_id__le": 4,
+                "max_resource_id__ge": 4,
+            },
+        )
+
+    def test_empty_without_prunable_filters(self):
+        self.assertEqual(ras.get_segment_filters({"event__ilike": "%x%"}), {})
+
+
+class TestSegmentSummary(unittest.TestCase):
+
+    def _segment(self, audit_events):
+        return AuditSegment(
+            rows_count=len(audit_events),
+            min_created_at=10,
+            max_created_at=20,
+            summary=ras.summarize_segment(audit_events),
+        )
+
+    def test_summarizes_rows_by_event_resource_type_and_creator(self):
+        audit_events = [
+            Audit(id=1, event="login", resource_type="user", created_by=1),
+            Audit(id=2, event="upload", resource_type="file", created_by=1),
+            Audit(id=3, event="login", resource_type="user", created_by=1),
+            Audit(id=4, event="login", resource_type=None, created_by=None),
+        ]
+
+        self.assertEqual(json.loads(ras.summarize_segment(audit_events)), [
+            ["login", "user", 1, 2],
+            ["upload", "file", 1, 1],
+            ["login", None, None, 1],
+        ])
+
+    def test_counts_filtered_rows_by_group(self):
+        segment = self._segment([
+            Audit(id=1, event="login", resource_type="user", created_by=1),
+            Audit(id=2, event="LOGOUT", resource_type="user", created_by=2),
+            Audit(id=3, event="upload", resource_type="file", created_by=1),
+            Audit(id=4, event="login", resource_type=None, created_by=2),
+        ])
+        filters = {
+            "event__ilike": "%log%",
+            "created_at__ge": 5,
+            "order_by": "id",
+        }
+
+        self.assertEqual(
+            ras.count_summary(segment, filters),
+            {None: 3},
+        )
+        self.assertEqual(
+            ras.count_summary(segment, filters, group_by="resource_type"),
+            {"user": 2, None: 1},
+        )
+        self.assertEqual(
+            ras.count_summary(
+                segment, {**filters, "created_by__eq": 2}, group_by="event",
+            ),
+            {"LOGOUT": 1, "login": 1},
+        )
+
+    def test_counts_rows_without_summary_when_unfiltered(self):
+        segment = AuditSegment(
+            rows_count=5, min_created_at=10, max_created_at=20,
+        )
+
+        self.assertEqual(
+            ras.count_summary(segment, {"created_at__le": 20, "limit": 1}),
+            {None: 5},
+        )
+        self.assertIsNone(
+            ras.count_summary(segment, {"event__ilike": "%x%"}),
+        )
+
+    def test_undecidable_filters_return_none(self):
+        segment = self._segment([Audit(id=1, event="login")])
+
+        for filters in (
+            {"request_uuid__eq": "req"},
+            {"resource_id__eq": 1},
+            {"created_at__ge": 15},
+            {"created_at__le": 15},
+        ):
+            with self.subTest(filters=filters):
+                self.assertIsNone(ras.count_summary(segment, filters))
+
+
+class TestMatchFilters(unittest.TestCase):
+
+    def test_matches_all_operators(self):
+        audit_event = _audit(5)
+
+        self.assertTrue(ras.match_filters(audit_event, {
+            "id__gt": 4,
+            "created_at__ge": 1005,
+            "created_at__le": 1005,
+            "created_by__eq": 7,
+            "event__ilike": "%UPLOAD_%",
+            "order_by": "id",
+            "offset": 0,
+        }))
+
+    def test_rejects_non_matching_values(self):
+        audit_event = _audit(5)
+
+        for filters in (
+            {"id__gt": 5},
+            {"created_at__ge": 1006},
+            {"created_at__le": 1004},
+            {"created_by__eq": 8},
+            {"event__ilike": "%download%"},
+            {"resource_id__eq": 1},
+        ):
+            with self.subTest(filters=filters):
+                self.assertFalse(ras.match_filters(audit_event, filters))
+
+    def test_ilike_escapes_regex_characters(self):
+        filters = {"event__ilike": "a.b"}
+
+        self.assertTrue(ras.match_filters(Audit(id=1, event="a.b"), filters))
+        self.assertFalse(ras.match_filters(Audit(id=1, event="axb"), filters))
+
+    def test_unsupported_operator_raises(self):
+        with self.assertRaises(ValueError):
+            ras.match_filters(_audit(1), {"id__like": "1"})
@@ -0,0 +1,83 @@
+# tests/repositories/test_delta.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+import zlib
+from unittest.mock import AsyncMock, patch
+
+from app.repositories import delta as rd
+
+
+class TestDelta(unittest.IsolatedAsyncioTestCase):
+    # --- encode_delta / apply_delta ---
+
+    def test_round_trip_text(self):
+        base = b"".join(b"line %d\n" % i for i in range(200))
+        target = base.replace(b"line 50\n", b"changed\n") + b"tail"
+
+        delta = rd.encode_delta(base, target)
+
+        self.assertTrue(delta.startswith(rd.DELTA_MAGIC))
+        self.assertLess(len(delta), len(target) // 4)
+        self.assertEqual(rd.apply_delta(base, delta), target)
+
+    def test_round_trip_binary_and_empty(self):
+        cases = [
+            (b"", b""),
+            (b"", b"new"),
+            (b"old\r\nlines", b""),
+            (bytes(range(256)) * 4, bytes(reversed(range(256))) * 3),
+        ]
+        for base, target in cases:
+            with self.subTest(base=base[:8], target=target[:8]):
+                delta = rd.encode_delta(base, target)
+                self.assertEqual(rd.apply_delta(base, delta), target)
+
+    def test_apply_rejects_invalid_header(self):
+        with self.assertRaises(ValueError):
+            rd.apply_delta(b"base", b"not a delta")
+
+    def test_apply_rejects_corrupted_payload(self):
+        with self.assertRaises(ValueError):
+            rd.apply_delta(b"base", rd.DELTA_MAGIC + b"\x00garbage")
+
+    def test_apply_rejects_truncated_operations(self):
+        payload = zlib.compress(bytes([10, rd._OP_INSERT, 5]) + b"ab")
+        with self.assertRaises(ValueError):
+            rd.apply_delta(b"", rd.DELTA_MAGIC + payload)
+
+    def test_apply_rejects_mismatched_base(self):
+        delta = rd.encode_delta(b"first\nsecond\n", b"first\nsecond\n")
+        with self.assertRaises(ValueError):
+            rd.apply_delta(b"first\n", delta)
+
+    def test_varint_round_trip(self):
+        for value in (0, 1, 127, 128, 300, 2 ** 40):
+            encoded = rd._encode_varint(value)
+            self.assertEqual(
+                rd._decode_varint(encoded, 0), (value, len(encoded)),
+            )
+
+    # --- write_delta / read_delta ---
+
+    async def test_write_delta_writes_encoded_delta(self):
+        with patch(
+            "app.repositories.delta.write", new=AsyncMock(),
+        ) as write_mock:
+            await rd.write_delta(b"a\n", b"b\n", "/mnt/revisions/x")
+
+        path, data = write_mock.await_args.args
+        self.assertEqual(path, "/mnt/revisions/x")
+        self.assertEqual(rd.apply_delta(b"a\n", data), b"b\n")
+
+    async def test_read_delta_applies_stored_delta(self):
+        delta = rd.encode_delta(b"a\nb\n", b"a\nc\n")
+
+        with patch(
+            "app.repositories.delta.read",
+            new=AsyncMock(return_value=delta),
+        ) as read_mock:
+            result = await rd.read_delta(b"a\nb\n", "/mnt/revisions/x")
+
+        read_mock.assert_awaited_once_with("/mnt/revisions/x")
+        self.assertEqual(result, b"a\nc\n")
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: GPL-3.0-only
 
 import hashlib
+import io
 import os
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -380,6 +381,38 @@ class TestFileRepository(unittest.IsolatedAsyncioTestCase):
             n = await rf.get_filesize("/f")
         self.assertEqual(n, 12345)
 
+    async def test_get_mtime(self):
+        st = MagicMock()
+        st.st_mtime = 1700000000.5
+        with patch(
+            "app.repositories.file.aiofiles.os.stat",
+            new_callable=AsyncMock,
+            return_value=st,
+        ):
+            mtime = await rf.get_mtime("/f")
+        self.assertEqual(mtime, 1700000000.5)
+
+    async def test_get_free_bytes(self):
+        st = MagicMock(f_bavail=10, f_frsize=4096)
+        with patch(
+            "app.repositories.file.aiofiles.os.statvfs",
+            new_callable=AsyncMock,
+            return_value=st,
+        ) as statvfs_mock:
+            free_bytes = await rf.get_free_bytes("/mnt")
+        self.assertEqual(free_bytes, 40960)
+        statvfs_mock.assert_awaited_once_with("/mnt")
+
+    async def test_get_signature(self):
+        st = MagicMock(st_ino=7, st_size=3, st_mtime_ns=1700000000500000000)
+        with patch(
+            "app.repositories.file.aiofiles.os.stat",
+            new_callable=AsyncMock,
+            return_value=st,
+        ):
+            signature = await rf.get_signature("/f")
+        self.assertEqual(signature, (7, 3, 1700000000500000000))
+
     async def test_isfile(self):
         with patch(
             "app.repositories.file.aiofiles.ospath.isfile",
@@ -418,6 +451,22 @@ class TestFileRepository(unittest.IsolatedAsyncioTestCase):
             hx = await rf.get_checksum("/f")
         self.assertEqual(hx, hashlib.sha256(b"abcd").hexdigest())
 
+    async def test_get_checksum_reports_chunk_sizes(self):
+        async def fake_iter(
+            _path: str,
+            chunk_size: int = FILE_CHUNK_SIZE_BYTES,
+        ):
+            yield b"ab"
+            yield b"cde"
+
+        on_chunk = AsyncMock()
+        with patch.object(rf, "_iter_read", side_effect=fake_iter):
+            hx = await rf.get_checksum("/f", on_chunk=on_chunk)
+        self.assertEqual(hx, hashlib.sha256(b"abcde").hexdigest())
+        self.assertEqual(
+            [c.args for c in on_chunk.await_args_list], [(2,), (3,)],
+        )
+
     async def test_read(self):
         async def fake_iter(
             _path: str,
@@ -430,6 +479,31 @@ class TestFileRepository(unittest.IsolatedAsyncioTestCase):
             data = await rf.read("/f")
         self.assertEqual(data, b"onetwo")
 
+    def _open_mock(self, chunks):
+        mock_f = MagicMock()
+        mock_f.seek = AsyncMock()
+        mock_f.read = AsyncMock(side_effect=chunks)
+        cm = MagicMock()
+        cm.__aenter__ = AsyncMock(return_value=mock_f)
+        cm.__aexit__ = AsyncMock(return_value=None)
+        return mock_f, cm
+
+    async def test_read_range_seeks_and_reads_length(self):
+        mock_f, cm = self._open_mock([b"abc", b"de"])
+        with patch("app.repositories.file.aiofiles.open", return_value=cm):
+            out = [ch async for ch in rf.read_range("/p", 10, 5)]
+
+        self.assertEqual(out, [b"abc", b"de"])
+        mock_f.seek.assert_awaited_once_with(10)
+        self.assertEqual(mock_f.read.await_args_list[1][0][0], 2)
+
+    async def test_read_range_raises_when_file_is_short(self):
+        _, cm = self._open_mock([b"abc", b""])
+        with patch("app.repositories.file.aiofiles.open", return_value=cm):
+            with self.assertRaises(ValueError):
+                async for _ in rf.read_range("/p", 0, 5):
+                    pass
+
     # --- mkdir, rmdir, touch ---
 
     async def test_mkdir(self):
@@ -465,6 +539,69 @@ class TestFileRepository(unittest.IsolatedAsyncioTestCase):
         rmd.assert_awaited_once_with("/data/empty")
         fsync.assert_awaited_once_with("/data")
 
+    async def test_listdir_sorts_names(self):
+        with patch(
+            "app.repositories.file.aiofiles.os.listdir",
+            new_callable=AsyncMock,
+            return_value=["b", "a"],
+        ) as listdir_mock:
+            out = await rf.listdir("/data")
+        listdir_mock.assert_awaited_once_with("/data")
+        self.assertEqual(out, ["a", "b"])
+
+    def test_delete_tree_sync_removes_tree_bottom_up(self):
+        walk = [
+            ("/trash/tree/sub", [], ["b"]),
+            ("/trash/tree", ["sub"], ["a"]),
+        ]
+        with patch(
+            "app.repositories.file.os.walk",
+            return_value=iter(walk),
+        ) as walk_mock, patch(
+            "app.repositories.file.os.unlink",
+        ) as unlink_mock, patch(
+            "app.repositories.file.os.rmdir",
+        ) as rmdir_mock:
+            out = rf._delete_tree_sync("/trash/tree", 10)
+        walk_mock.assert_called_once_with("/trash/tree", topdown=False)
+        self.assertEqual(out, 2)
+        self.assertEqual(
+            [c.args[0] for c in unlink_mock.call_args_list],
+            ["/trash/tree/sub/b", "/trash/tree/a"],
+        )
+        self.assertEqual(
+            [c.args[0] for c in rmdir_mock.call_args_list],
+            ["/trash/tree/sub", "/trash/tree"],
+        )
+
+    def test_delete_tree_sync_stops_at_max_files(self):
+        walk = [
+            ("/trash/tree/sub", [], ["b", "c"]),
+            ("/trash/tree", ["sub"], ["a"]),
+        ]
+        with patch(
+            "app.repositories.file.os.walk",
+            return_value=iter(walk),
+        ), patch(
+            "app.repositories.file.os.unlink",
+        ) as unlink_mock, patch(
+            "app.repositories.file.os.rmdir",
+        ) as rmdir_mock:
+            out = rf._delete_tree_sync("/trash/tree", 1)
+        self.assertEqual(out, 1)
+        unlink_mock.assert_called_once_with("/trash/tree/sub/b")
+        rmdir_mock.assert_not_called()
+
+    async def test_delete_tree_runs_in_thread(self):
+        with patch.object(
+            rf,
+            "_delete_tree_sync",
+            return_value=3,
+        ) as delete_tree_sync:
+            out = await rf.delete_tree("/trash/tree", 5)
+        delete_tree_sync.assert_called_once_with("/trash/tree", 5)
+        self.assertEqual(out, 3)
+
     async def test_touch(self):
         calls = []
 
@@ -575,6 +712,20 @@ class TestFileRepository(unittest.IsolatedAsyncioTestCase):
 
     # --- write, upload ---
 
+    async def test_write_stream_delegates_to_atomic_write(self):
+        async def data():
+            yield b"ab"
+
+        with patch.object(
+            rf, "_atomic_write_stream", new_callable=AsyncMock,
+        ) as write_mock:
+            await rf.write_stream("/tmp/out.bin", data())
+
+        write_mock.assert_awaited_once()
+        stream, destination = write_mock.await_args.args
+        self.assertEqual([chunk async for chunk in stream], [b"ab"])
+        self.assertEqual(destination, "/tmp/out.bin")
+
     async def test_write(self):
         mock_f = MagicMock()
         mock_f.write = AsyncMock()
@@ -694,6 +845,61 @@ class TestFileRepository(unittest.IsolatedAsyncioTestCase):
 
         mock_f.write.assert_awaited()
 
+    async def _apply_patches(self, source, patches, by_line=False):
+        buffer = io.BytesIO(source)
+        source_file = MagicMock()
+        source_file.read = AsyncMock(side_effect=buffer.read)
+        source_file.readline = AsyncMock(side_effect=buffer.readline)
+        cm = MagicMock()
+        cm.__aenter__ = AsyncMock(return_value=source_file)
+        cm.__aexit__ = AsyncMock(return_value=None)
+        written = []
+
+        async def fake_atomic_write_stream(data, destination):
+            async for chunk in data:
+                written.append(chunk)
+
+        with patch(
+            "app.repositories.file.aiofiles.open",
+            return_value=cm,
+        ) as open_mock, patch.object(
+            rf,
+            "_atomic_write_stream",
+            side_effect=fake_atomic_write_stream,
+        ) as write_mock:
+            await rf.apply_patches("/src/x", "/dst/y", patches, by_line)
+
+        open_mock.assert_called_once_with("/src/x", mode="rb")
+        self.assertEqual(write_mock.call_args.args[1], "/dst/y")
+        return b"".join(written)
+
+    async def test_apply_patches_replaces_byte_ranges(self):
+        result = await self._apply_patches(
+            b"0123456789",
+            [(0, 0, b"<"), (2, 4, b"ab"), (9, 10, b"")],
+        )
+        self.assertEqual(result, b"<01ab45678")
+
+    async def test_apply_patches_replaces_line_ranges(self):
+        result = await self._apply_patches(
+            b"one\ntwo\nthree\nfour",
+            [(1, 2, b"2\n"), (4, 4, b"\nfive")],
+            by_line=True,
+        )
+        self.assertEqual(result, b"one\n2\nthree\nfour\nfive")
+
+    async def test_apply_patches_rejects_range_beyond_source(self):
+        for patches, by_line in (
+            ([(8, 12, b"")], False),
+            ([(12, 12, b"x")], False),
+            ([(2, 3, b"")], True),
+        ):
+            with self.subTest(patches=patches, by_line=by_line):
+                with self.assertRaises(ValueError):
+                    await self._apply_patches(
+                        b"0123456789\n", patches, by_line,
+                    )
+
     async def test_rename_same_parent_one_fsync(self):
         with patch(
             "app.repositories.file.asyncio.to_thread",
@@ -754,6 +960,64 @@ class TestFileRepository(unittest.IsolatedAsyncioTestCase):
             [unittest.mock.call("/a"), unittest.mock.call("/b")],
         )
 
+    # --- write_at ---
+
+    async def _write_at(self, chunks, offset, limit):
+        calls = []
+
+        async def fake_to_thread(fn, /, *args, **kwargs):
+            calls.append((fn, args))
+            return 7 if fn is rf.os.open else None
+
+        async def data():
+            for chunk in chunks:
+                yield chunk
+
+        with patch(
+            "app.repositories.file.asyncio.to_thread",
+            side_effect=fake_to_thread,
+        ):
+            try:
+                return await rf.write_at("/up/part", offset, data(), limit)
+            finally:
+                self.calls = calls
+
+    async def test_write_at_writes_chunks_at_offset(self):
+        written = await self._write_at([b"abc", b"de"], 10, 15)
+
+        self.assertEqual(written, 5)
+        self.assertEqual(self.calls, [
+            (rf.os.open, ("/up/part", os.O_WRONLY | os.O_CREAT)),
+            (rf._pwrite_all, (7, b"abc", 10)),
+            (rf._pwrite_all, (7, b"de", 13)),
+            (rf.os.fsync, (7,)),
+            (rf.os.close, (7,)),
+        ])
+
+    async def test_write_at_rejects_data_past_limit(self):
+        with self.assertRaises(ValueError):
+            await self._write_at([b"abc", b"de"], 10, 14)
+
+        self.assertEqual(
+            [fn for fn, _ in self.calls],
+            [rf.os.open, rf._pwrite_all, rf.os.close],
+        )
+
+    def test_pwrite_all_repeats_partial_writes(self):
+        with patch(
+            "app.repositories.file.os.pwrite",
+            side_effect=[2, 3],
+        ) as pwrite_mock:
+            rf._pwrite_all(3, b"hello", 4)
+
+        self.assertEqual(
+            [
+                (bytes(c.args[1]), c.args[2])
+                for c in pwrite_mock.call_args_list
+            ],
+            [(b"hello", 4), (b"llo", 6)],
+        )
+
     # --- _atomic_write_stream error path (via write) ---
 
     async def test_write_unlinks_temp_on_replace_failure(self):
@@ -0,0 +1,158 @@
+# tests/repositories/test_intent.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import json
+import unittest
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.repositories import intent as ri  # noqa: E402
+
+
+class TestIntentRepository(unittest.IsolatedAsyncioTestCase):
+
+    def _config(self):
+        return MagicMock(FILES_INTENTS_DIR="/mnt/intents")
+
+    def _intent(self, **kwargs):
+        return ri.Intent(
+            operation="file_move",
+            table="files",
+            filters={"id": 1},
+            intent_id="abc",
+            **kwargs,
+        )
+
+    def test_get_intent_path(self):
+        with patch.object(ri, "get_config", return_value=self._config()):
+            self.assertEqual(
+                ri.get_intent_path("abc"),
+                "/mnt/intents/abc.json",
+            )
+
+    def test_intent_id_defaults_to_uuid(self):
+        with patch.object(ri.uuid, "uuid4", return_value="generated"):
+            intent = ri.Intent(operation="op", table="files", filters={})
+
+        self.assertEqual(intent.intent_id, "generated")
+        self.assertEqual(intent.on_commit, [])
+        self.assertEqual(intent.on_rollback, [])
+        self.assertTrue(intent.committed_if_present)
+
+    async def test_write_intent_writes_json(self):
+        intent = self._intent(
+            on_rollback=[(ri.ACTION_RENAME, "/mnt/b", "/mnt/a")],
+        )
+
+        with (
+            patch.object(ri, "get_config", return_value=self._config()),
+            patch.object(ri, "write", new_callable=AsyncMock) as write_mock,
+        ):
+            await ri.write_intent(intent)
+
+        path, data = write_mock.await_args.args
+        self.assertEqual(path, "/mnt/intents/abc.json")
+        self.assertEqual(json.loads(data), {
+            "operation": "file_move",
+            "table": "files",
+            "filters": {"id": 1},
+            "on_commit": [],
+            "on_rollback": [["rename", "/mnt/b", "/mnt/a"]],
+            "committed_if_present": True,
+            "intent_id": "abc",
+        })
+
+    async def test_remove_intent_deletes_file(self):
+        with (
+            patch.object(ri, "get_config", return_value=self._config()),
+            patch.object(ri, "delete", new_callable=AsyncMock) as delete_mock,
+        ):
+            await ri.remove_intent(self._intent())
+
+        delete_mock.assert_awaited_once_with("/mnt/intents/abc.json")
+
+    async def test_list_intents_reads_only_intent_files(self):
+        data = json.dumps({
+            "operation": "file_move",
+            "table": "files",
+            "filters": {"id": 1},
+            "on_commit": [],
+            "on_rollback": [["rename", "/mnt/b", "/mnt/a"]],
+            "committed_if_present": True,
+            "intent_id": "abc",
+        }).encode("utf-8")
+
+        with (
+            patch.object(ri, "get_config", return_value=self._config()),
+            patch.object(
+                ri, "listdir", new=AsyncMock(
+                    return_value=["abc.json", "abc.json.tmp"],
+                ),
+            ),
+            patch.object(
+                ri, "read", new=AsyncMock(return_value=data),
+            ) as read_mock,
+        ):
+            intents = await ri.list_intents()
+
+        read_mock.assert_awaited_once_with("/mnt/intents/abc.json")
+        self.assertEqual(intents, [self._intent(
+            on_rollback=[("rename", "/mnt/b", "/mnt/a")],
+        )])
+
+    async def test_apply_intent_actions_runs_actions_in_order(self):
+        manager = MagicMock()
+        manager.delete = AsyncMock()
+        manager.copy = AsyncMock()
+        manager.rename = AsyncMock()
+        manager.rmdir = AsyncMock()
+
+        with (
+            patch.object(ri, "delete", manager.delete),
+            patch.object(ri, "copy", manager.copy),
+            patch.object(ri, "rename", manager.rename),
+            patch.object(ri, "rmdir", manager.rmdir),
+            patch.object(ri, "isfile", new=AsyncMock(return_value=True)),
+            patch.object(ri, "isdir", new=AsyncMock(return_value=True)),
+        ):
+            await ri.apply_intent_actions([
+                (ri.ACTION_COPY, "/mnt/r", "/mnt/f"),
+                (ri.ACTION_DELETE, "/mnt/r"),
+                (ri.ACTION_RENAME, "/mnt/t", "/mnt/f"),
+                (ri.ACTION_RMDIR, "/mnt/e"),
+            ])
+
+        self.assertEqual(manager.mock_calls, [
+            call.copy("/mnt/r", "/mnt/f"),
+            call.delete("/mnt/r"),
+            call.rename("/mnt/t", "/mnt/f"),
+            call.rmdir("/mnt/e"),
+        ])
+
+    async def test_apply_intent_actions_skips_missing_sources(self):
+        with (
+            patch.object(ri, "delete", new_callable=AsyncMock) as delete_mock,
+            patch.object(ri, "copy", new_callable=AsyncMock) as copy_mock,
+            patch.object(ri, "rename", new_callable=AsyncMock) as rename_mock,
+            patch.object(ri, "rmdir", new_callable=AsyncMock) as rmdir_mock,
+            patch.object(ri, "isfile", new=AsyncMock(return_value=False)),
+            patch.object(ri, "isdir", new=AsyncMock(return_value=False)),
+        ):
+            await ri.apply_intent_actions([
+                (ri.ACTION_COPY, "/mnt/r", "/mnt/f"),
+                (ri.ACTION_DELETE, "/mnt/r"),
+                (ri.ACTION_RENAME, "/mnt/t", "/mnt/f"),
+                (ri.ACTION_RMDIR, "/mnt/e"),
+            ])
+
+        copy_mock.assert_not_awaited()
+        delete_mock.assert_awaited_once_with("/mnt/r")
+        rename_mock.assert_not_awaited()
+        rmdir_mock.assert_not_awaited()
+
+    async def test_apply_intent_actions_rejects_unknown_action(self):
+        with self.assertRaises(ValueError):
+            await ri.apply_intent_actions([("chmod", "/mnt/f")])
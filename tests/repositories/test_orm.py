@@ -432,6 +432,88 @@ class TestORMRepository(unittest.IsolatedAsyncioTestCase):
         self.assertIn("count", compiled.lower())
         self.assertIn("status = 'ok'", compiled)
 
+    async def test_count_values_groups_by_column(self):
+        session = MagicMock()
+        mock_result = MagicMock()
+        mock_result.all.return_value = [("ok", 2), (None, 1)]
+        session.execute = AsyncMock(return_value=mock_result)
+        repo = orm.ORMRepository(session)
+
+        out = await repo.count_values(_Sample, "status", name__eq="a")
+
+        self.assertEqual(out, {"ok": 2, None: 1})
+
+        executed_query = session.execute.await_args.args[0]
+        compiled = str(
+            executed_query.compile(compile_kwargs={"literal_binds": True})
+        )
+
+        self.assertIn("count", compiled.lower())
+        self.assertIn("name = 'a'", compiled)
+        self.assertIn("GROUP BY orm_test_sample.status", compiled)
+
+    # --- select_subtree_ids / select_values / delete_all ---
+
+    async def test_select_subtree_ids_executes_recursive_cte_query(self):
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=[
+            MagicMock(id=3, depth=0),
+            MagicMock(id=4, depth=1),
+        ])
+        repo = orm.ORMRepository(session)
+
+        obj = _Tree()
+        obj.id = 3
+        obj.parent_id = 2
+
+        out = await repo.select_subtree_ids(obj)
+
+        self.assertEqual(out, [(3, 0), (4, 1)])
+
+        query = session.execute.await_args.args[0]
+        query_sql = str(query.compile(compile_kwargs={"literal_binds": True}))
+
+        self.assertIn("WITH RECURSIVE subtree", query_sql)
+        self.assertIn("UNION ALL", query_sql)
+        self.assertIn("WHERE orm_test_tree.id = 3", query_sql)
+        self.assertIn("ORDER BY subtree.depth, subtree.id", query_sql)
+
+    async def test_select_values_returns_column_values(self):
+        session = MagicMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = ["a", "b"]
+        session.execute = AsyncMock(return_value=result)
+        repo = orm.ORMRepository(session)
+
+        out = await repo.select_values(_Sample, "name", status__eq="ok")
+
+        self.assertEqual(out, ["a", "b"])
+
+        query = session.execute.await_args.args[0]
+        compiled = str(query.compile(compile_kwargs={"literal_binds": True}))
+
+        self.assertIn("SELECT orm_test_sample.name", compiled)
+        self.assertIn("status = 'ok'", compiled)
+
+    async def test_delete_all_executes_bulk_delete(self):
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock(rowcount=2))
+        repo = orm.ORMRepository(session)
+
+        out = await repo.delete_all(_Sample, id__in=[1, 2])
+
+        self.assertEqual(out, 2)
+
+        query = session.execute.await_args.args[0]
+        compiled = str(query.compile(compile_kwargs={"literal_binds": True}))
+
+        self.assertIn("DELETE FROM orm_test_sample", compiled)
+        self.assertIn("orm_test_sample.id IN (1, 2)", compiled)
+        self.assertFalse(
+            query.get_execution_options()["synchronize_session"],
+        )
+        session.delete.assert_not_called()
+
     # --- flush / commit / rollback ---
 
     async def test_flush_commit_rollback_delegate(self):
@@ -656,6 +738,20 @@ class TestORMRepository(unittest.IsolatedAsyncioTestCase):
         self.assertIn("IN", compiled)
         self.assertIn("SELECT", compiled)
 
+    def test_build_where_notsubquery_compiles(self):
+        session = MagicMock()
+        repo = orm.ORMRepository(session)
+        inner = select(_Sample.id).where(_Sample.status == "ok")
+
+        conds = repo._build_where(_Sample, id__notsubquery=inner)
+
+        self.assertEqual(len(conds), 1)
+        compiled = str(
+            conds[0].compile(compile_kwargs={"literal_binds": True})
+        )
+        self.assertIn("NOT IN", compiled)
+        self.assertIn("SELECT", compiled)
+
     def test_build_where_missing_column_raises(self):
         session = MagicMock()
         repo = orm.ORMRepository(session)
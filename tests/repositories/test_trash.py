@@ -0,0 +1,133 @@
+# tests/repositories/test_trash.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import json
+import unittest
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.repositories import trash as rt  # noqa: E402
+
+
+class TestTrashRepository(unittest.IsolatedAsyncioTestCase):
+
+    def _config(self):
+        return MagicMock(FILES_TRASH_DIR="/mnt/trash")
+
+    def test_get_trash_entry_path(self):
+        with (
+            patch.object(rt, "get_config", return_value=self._config()),
+            patch.object(rt.uuid, "uuid4", return_value="entry"),
+        ):
+            self.assertEqual(rt.get_trash_entry_path(), "/mnt/trash/entry")
+
+    def test_get_trash_tree_path(self):
+        self.assertEqual(
+            rt.get_trash_tree_path("/mnt/trash/entry"),
+            "/mnt/trash/entry/tree",
+        )
+
+    def test_get_trash_manifest_paths(self):
+        self.assertEqual(
+            rt.get_trash_pending_path("/mnt/trash/entry"),
+            "/mnt/trash/entry/manifest.pending",
+        )
+        self.assertEqual(
+            rt.get_trash_manifest_path("/mnt/trash/entry"),
+            "/mnt/trash/entry/manifest.json",
+        )
+
+    async def test_create_trash_entry_writes_pending_manifest(self):
+        with (
+            patch.object(rt, "mkdir", new_callable=AsyncMock) as mkdir_mock,
+            patch.object(rt, "write", new_callable=AsyncMock) as write_mock,
+        ):
+            await rt.create_trash_entry("/mnt/trash/entry", ["r1"], ["t1"])
+
+        mkdir_mock.assert_awaited_once_with("/mnt/trash/entry")
+        path, data = write_mock.await_args.args
+        self.assertEqual(path, "/mnt/trash/entry/manifest.pending")
+        self.assertEqual(
+            json.loads(data),
+            {"revisions": ["r1"], "thumbnails": ["t1"]},
+        )
+
+    async def test_seal_trash_entry_renames_pending_manifest(self):
+        with patch.object(
+            rt, "rename", new_callable=AsyncMock,
+        ) as rename_mock:
+            await rt.seal_trash_entry("/mnt/trash/entry")
+
+        rename_mock.assert_awaited_once_with(
+            "/mnt/trash/entry/manifest.pending",
+            "/mnt/trash/entry/manifest.json",
+        )
+
+    async def test_discard_trash_entry_removes_pending_manifest(self):
+        with (
+            patch.object(rt, "delete", new_callable=AsyncMock) as delete_mock,
+            patch.object(rt, "rmdir", new_callable=AsyncMock) as rmdir_mock,
+        ):
+            await rt.discard_trash_entry("/mnt/trash/entry")
+
+        delete_mock.assert_awaited_once_with(
+            "/mnt/trash/entry/manifest.pending",
+        )
+        rmdir_mock.assert_awaited_once_with("/mnt/trash/entry")
+
+    async def test_list_sealed_trash_entries_skips_pending(self):
+        with (
+            patch.object(rt, "get_config", return_value=self._config()),
+            patch.object(
+                rt, "listdir", new_callable=AsyncMock,
+                return_value=["a", "b"],
+            ),
+            patch.object(
+                rt, "isfile", new_callable=AsyncMock,
+                side_effect=[True, False],
+            ) as isfile_mock,
+        ):
+            entries = await rt.list_sealed_trash_entries()
+
+        self.assertEqual(entries, ["/mnt/trash/a"])
+        self.assertEqual(isfile_mock.await_args_list, [
+            call("/mnt/trash/a/manifest.json"),
+            call("/mnt/trash/b/manifest.json"),
+        ])
+
+    async def test_read_trash_manifest_fills_missing_keys(self):
+        with patch.object(
+            rt, "read", new_callable=AsyncMock,
+            return_value=b'{"revisions": ["r1"]}',
+        ) as read_mock:
+            manifest = await rt.read_trash_manifest("/mnt/trash/entry")
+
+        read_mock.assert_awaited_once_with("/mnt/trash/entry/manifest.json")
+        self.assertEqual(manifest, {"revisions": ["r1"], "thumbnails": []})
+
+    async def test_write_trash_manifest_replaces_sealed_manifest(self):
+        with patch.object(
+            rt, "write", new_callable=AsyncMock,
+        ) as write_mock:
+            await rt.write_trash_manifest(
+                "/mnt/trash/entry", {"revisions": [], "thumbnails": ["t"]},
+            )
+
+        path, data = write_mock.await_args.args
+        self.assertEqual(path, "/mnt/trash/entry/manifest.json")
+        self.assertEqual(
+            json.loads(data), {"revisions": [], "thumbnails": ["t"]},
+        )
+
+    async def test_remove_trash_entry(self):
+        with (
+            patch.object(rt, "delete", new_callable=AsyncMock) as delete_mock,
+            patch.object(rt, "rmdir", new_callable=AsyncMock) as rmdir_mock,
+        ):
+            await rt.remove_trash_entry("/mnt/trash/entry")
+
+        delete_mock.assert_awaited_once_with("/mnt/trash/entry/manifest.json")
+        rmdir_mock.assert_awaited_once_with("/mnt/trash/entry")
@@ -0,0 +1,43 @@
+# tests/routers/test_audit_export.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi.responses import StreamingResponse
+
+from app.models.user import User
+from app.schemas.audit_export import AuditExportRequest
+
+from tests.helpers import set_minimal_app_config_env
+
+
+set_minimal_app_config_env()
+
+from app.routers.audit_export import audit_export_router  # noqa: E402
+
+
+class TestAuditExportRouter(unittest.IsolatedAsyncioTestCase):
+    async def test_returns_ndjson_streaming_response(self):
+        session = AsyncMock()
+        params = AuditExportRequest(after_id=5)
+
+        async def chunks():
+            yield b'{"audit_id":6}\n'
+
+        with patch(
+            "app.routers.audit_export.export_audit",
+            new_callable=AsyncMock,
+            return_value=chunks(),
+        ) as export_mock:
+            out = await audit_export_router(
+                session=session,
+                params=params,
+                current_user=MagicMock(spec=User),
+            )
+
+        export_mock.assert_awaited_once_with(session=session, params=params)
+        self.assertIsInstance(out, StreamingResponse)
+        self.assertEqual(out.media_type, "application/x-ndjson")
+        body = b"".join([chunk async for chunk in out.body_iterator])
+        self.assertEqual(body, b'{"audit_id":6}\n')
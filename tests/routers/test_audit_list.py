@@ -36,7 +36,7 @@ class TestAuditListRouter(unittest.IsolatedAsyncioTestCase):
 
         repository = AsyncMock()
         repository.count_all = AsyncMock(return_value=1)
-        repository.select_all = AsyncMock(return_value=[row])
+        repository.select_all = AsyncMock(side_effect=[[], [row]])
 
         with (
             patch(
@@ -51,11 +51,13 @@ class TestAuditListRouter(unittest.IsolatedAsyncioTestCase):
         ):
             out = await audit_list_router(
                 session=session,
+                audit_session=AsyncMock(),
                 params=params,
                 current_user=current_user,
             )
 
         self.assertEqual(out.audit_count, 1)
+        self.assertTrue(out.audit_count_exact)
         self.assertEqual(len(out.audit), 1)
         self.assertEqual(out.audit[0].audit_id, 7)
         self.assertEqual(out.audit[0].event, "user_login:succeeded")
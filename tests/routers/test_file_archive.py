@@ -0,0 +1,142 @@
+# tests/routers/test_file_archive.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi.responses import Response, StreamingResponse
+
+from app.models.user import User
+from app.schemas.file_archive import FileArchiveRequest
+
+from tests.helpers import set_minimal_app_config_env
+
+
+set_minimal_app_config_env()
+
+from app.routers.file_archive import (  # noqa: E402
+    _parse_range,
+    file_archive_router,
+)
+
+ETAG = '"abc"'
+
+
+class _Archive:
+    media_type = "application/x-tar"
+
+    def __init__(self, size):
+        self.size = size
+        self.calls = []
+
+    async def stream(self, start=0, end=None):
+        self.calls.append((start, end))
+        yield b"data"
+
+
+class TestFileArchiveRouter(unittest.IsolatedAsyncioTestCase):
+
+    async def _call(self, archive, headers=None):
+        request = MagicMock()
+        request.headers = headers or {}
+        session = AsyncMock()
+        params = FileArchiveRequest(folder_id=1, format="tar")
+
+        with patch(
+            "app.routers.file_archive.archive_files",
+            new_callable=AsyncMock,
+            return_value=(archive, "docs.tar", ETAG),
+        ) as archive_mock:
+            out = await file_archive_router(
+                request=request,
+                params=params,
+                session=session,
+                current_user=MagicMock(spec=User),
+            )
+
+        archive_mock.assert_awaited_once_with(session=session, params=params)
+        return out
+
+    async def test_full_archive_with_length(self):
+        archive = _Archive(size=2048)
+
+        out = await self._call(archive)
+
+        self.assertIsInstance(out, StreamingResponse)
+        self.assertEqual(out.status_code, 200)
+        self.assertEqual(out.media_type, "application/x-tar")
+        self.assertEqual(out.headers["content-length"], "2048")
+        self.assertEqual(out.headers["accept-ranges"], "bytes")
+        self.assertEqual(out.headers["etag"], ETAG)
+        self.assertEqual(
+            out.headers["content-disposition"],
+            'attachment; filename="docs.tar"',
+        )
+        body = b"".join([chunk async for chunk in out.body_iterator])
+        self.assertEqual(body, b"data")
+        self.assertEqual(archive.calls, [(0, None)])
+
+    async def test_range_returns_partial_content(self):
+        archive = _Archive(size=2048)
+
+        out = await self._call(
+            archive, {"range": "bytes=1000-", "if-range": ETAG},
+        )
+
+        self.assertEqual(out.status_code, 206)
+        self.assertEqual(out.headers["content-length"], "1048")
+        self.assertEqual(
+            out.headers["content-range"], "bytes 1000-2047/2048",
+        )
+        [chunk async for chunk in out.body_iterator]
+        self.assertEqual(archive.calls, [(1000, 2048)])
+
+    async def test_stale_if_range_returns_full_archive(self):
+        archive = _Archive(size=2048)
+
+        out = await self._call(
+            archive, {"range": "bytes=1000-", "if-range": '"old"'},
+        )
+
+        self.assertEqual(out.status_code, 200)
+        self.assertEqual(out.headers["content-length"], "2048")
+
+    async def test_unsatisfiable_range(self):
+        out = await self._call(_Archive(size=2048), {"range": "bytes=4096-"})
+
+        self.assertIsInstance(out, Response)
+        self.assertEqual(out.status_code, 416)
+        self.assertEqual(out.headers["content-range"], "bytes */2048")
+
+    async def test_unknown_size_ignores_range(self):
+        archive = _Archive(size=None)
+
+        out = await self._call(archive, {"range": "bytes=10-"})
+
+        self.assertEqual(out.status_code, 200)
+        self.assertNotIn("content-length", out.headers)
+        self.assertNotIn("accept-ranges", out.headers)
+
+
+class TestParseRange(unittest.TestCase):
+
+    def test_parses_single_ranges(self):
+        self.assertEqual(_parse_range("bytes=0-99", 1000), (0, 100))
+        self.assertEqual(_parse_range("bytes=900-", 1000), (900, 1000))
+        self.assertEqual(_parse_range("bytes=-100", 1000), (900, 1000))
+        self.assertEqual(_parse_range("bytes=990-2000", 1000), (990, 1000))
+        self.assertEqual(_parse_range("bytes=-5000", 1000), (0, 1000))
+
+    def test_ignores_unsupported_headers(self):
+        for header in (
+            None, "items=0-1", "bytes=0-1,5-6", "bytes=abc", "bytes=5-1",
+            "bytes=-",
+        ):
+            with self.subTest(header=header):
+                self.assertIsNone(_parse_range(header, 1000))
+
+    def test_rejects_unsatisfiable_ranges(self):
+        for header in ("bytes=1000-", "bytes=-0"):
+            with self.subTest(header=header):
+                with self.assertRaises(ValueError):
+                    _parse_range(header, 1000)
@@ -0,0 +1,43 @@
+# tests/routers/test_file_bulk_delete.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from app.routers.file_bulk_delete import file_bulk_delete_router
+from app.schemas.file_bulk import FileBulkStatus
+from app.schemas.file_bulk_delete import FileBulkDeleteRequest
+
+
+class TestFileBulkDeleteRouter(unittest.IsolatedAsyncioTestCase):
+
+    async def test_returns_per_file_results(self):
+        session = AsyncMock()
+        current_user = SimpleNamespace(id=1)
+        data = FileBulkDeleteRequest(file_ids=[1, 2])
+
+        statuses = {
+            1: FileBulkStatus.OK,
+            2: FileBulkStatus.NOT_FOUND,
+        }
+
+        with patch(
+            "app.routers.file_bulk_delete.delete_files",
+            new=AsyncMock(return_value=statuses),
+        ) as delete_files_mock:
+            response = await file_bulk_delete_router(
+                data=data,
+                session=session,
+                current_user=current_user,
+            )
+
+        delete_files_mock.assert_awaited_once_with(
+            session=session,
+            data=data,
+        )
+
+        self.assertEqual(
+            [(r.file_id, r.status) for r in response.results],
+            [(1, FileBulkStatus.OK), (2, FileBulkStatus.NOT_FOUND)],
+        )
@@ -0,0 +1,46 @@
+# tests/routers/test_file_bulk_starred_change.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from app.routers.file_bulk_starred_change import (
+    file_bulk_starred_change_router,
+)
+from app.schemas.file_bulk import FileBulkStatus
+from app.schemas.file_bulk_starred_change import FileBulkStarredChangeRequest
+
+
+class TestFileBulkStarredChangeRouter(unittest.IsolatedAsyncioTestCase):
+
+    async def test_returns_per_file_results(self):
+        session = AsyncMock()
+        current_user = SimpleNamespace(id=1)
+        data = FileBulkStarredChangeRequest(file_ids=[1, 2], is_starred=True)
+
+        statuses = {
+            1: FileBulkStatus.OK,
+            2: FileBulkStatus.NOT_FOUND,
+        }
+
+        with patch(
+            "app.routers.file_bulk_starred_change.change_files_starred",
+            new=AsyncMock(return_value=statuses),
+        ) as change_files_starred_mock:
+            response = await file_bulk_starred_change_router(
+                data=data,
+                session=session,
+                current_user=current_user,
+            )
+
+        change_files_starred_mock.assert_awaited_once_with(
+            session=session,
+            user=current_user,
+            data=data,
+        )
+
+        self.assertEqual(
+            [(r.file_id, r.status) for r in response.results],
+            [(1, FileBulkStatus.OK), (2, FileBulkStatus.NOT_FOUND)],
+        )
@@ -60,3 +60,32 @@ class TestFileDownloadRouter(unittest.IsolatedAsyncioTestCase):
         )
 
         self.assertIs(out, response)
+
+    async def test_returns_content_response_for_reconstructed_revision(self):
+        session = AsyncMock()
+        current_user = MagicMock(spec=User)
+
+        revision = SimpleNamespace(
+            filename="заметки.txt",
+            mimetype="text/plain",
+        )
+
+        with patch(
+            "app.routers.file_download.download_file",
+            new_callable=AsyncMock,
+            return_value=(revision, b"old text"),
+        ):
+            out = await file_download_router(
+                file_id=42,
+                revision_number=3,
+                session=session,
+                current_user=current_user,
+            )
+
+        self.assertEqual(out.body, b"old text")
+        self.assertEqual(out.media_type, "text/plain")
+        self.assertEqual(
+            out.headers["content-disposition"],
+            "attachment; filename*=utf-8''"
+            "%D0%B7%D0%B0%D0%BC%D0%B5%D1%82%D0%BA%D0%B8.txt",
+        )
@@ -0,0 +1,55 @@
+# tests/routers/test_file_import.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.models.user import User
+from app.schemas.file_import import (
+    FileImportResponse,
+    FileImportResult,
+    FileImportStatus,
+)
+
+from tests.helpers import set_minimal_app_config_env
+
+
+set_minimal_app_config_env()
+
+from app.routers.file_import import file_import_router  # noqa: E402
+
+
+class TestFileImportRouter(unittest.IsolatedAsyncioTestCase):
+
+    async def test_passes_request_stream_and_wraps_results(self):
+        request = MagicMock()
+        stream = MagicMock()
+        request.stream.return_value = stream
+        session = AsyncMock()
+        user = MagicMock(spec=User)
+        results = [
+            FileImportResult(
+                path="docs/", status=FileImportStatus.CREATED, folder_id=4,
+            ),
+            FileImportResult(
+                path="docs/a.txt", status=FileImportStatus.CONFLICT,
+            ),
+        ]
+
+        with patch(
+            "app.routers.file_import.import_archive",
+            new_callable=AsyncMock,
+            return_value=results,
+        ) as import_mock:
+            out = await file_import_router(
+                folder_id=3,
+                request=request,
+                session=session,
+                current_user=user,
+            )
+
+        import_mock.assert_awaited_once_with(
+            session=session, user=user, folder_id=3, data=stream,
+        )
+        self.assertIsInstance(out, FileImportResponse)
+        self.assertEqual(out.results, results)
@@ -0,0 +1,46 @@
+# tests/routers/test_file_patch.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.routers.file_patch import file_patch_router  # noqa: E402
+from app.schemas.file_patch import FilePatchRequest  # noqa: E402
+
+
+class TestFilePatchRouter(unittest.IsolatedAsyncioTestCase):
+
+    async def test_returns_file_patch_response(self):
+        session = AsyncMock()
+        current_user = SimpleNamespace(id=1)
+        data = FilePatchRequest(
+            base_checksum="a" * 64,
+            patches=[{"start": 0, "end": 1, "content": "new\n"}],
+        )
+
+        patched_file = SimpleNamespace(id=10)
+
+        with patch(
+            "app.routers.file_patch.patch_file",
+            new=AsyncMock(return_value=patched_file),
+        ) as patch_file_mock:
+            response = await file_patch_router(
+                file_id=10,
+                data=data,
+                session=session,
+                current_user=current_user,
+            )
+
+        patch_file_mock.assert_awaited_once_with(
+            session=session,
+            user=current_user,
+            file_id=10,
+            data=data,
+        )
+
+        self.assertEqual(response.file_id, 10)
@@ -14,6 +14,7 @@ from fastapi import status  # noqa: E402
 
 from app.models.user import User  # noqa: E402
 from app.routers.folder_delete import folder_delete_router  # noqa: E402
+from app.schemas.folder_delete import FolderDeleteRequest  # noqa: E402
 
 
 class TestFolderDeleteRouter(unittest.IsolatedAsyncioTestCase):
@@ -28,6 +29,7 @@ class TestFolderDeleteRouter(unittest.IsolatedAsyncioTestCase):
         ) as mock_service:
             response = await folder_delete_router(
                 folder_id=42,
+                params=FolderDeleteRequest(),
                 session=session,
                 current_user=current_user,
             )
@@ -35,6 +37,7 @@ class TestFolderDeleteRouter(unittest.IsolatedAsyncioTestCase):
         mock_service.assert_awaited_once_with(
             session=session,
             folder_id=42,
+            recursive=False,
         )
 
         self.assertEqual(
@@ -44,3 +47,24 @@ class TestFolderDeleteRouter(unittest.IsolatedAsyncioTestCase):
 
         session.commit.assert_not_called()
         session.rollback.assert_not_called()
+
+    async def test_passes_recursive_flag_to_service(self):
+        session = AsyncMock()
+        current_user = MagicMock(spec=User)
+
+        with patch(
+            "app.routers.folder_delete.delete_folder",
+            new_callable=AsyncMock,
+        ) as mock_service:
+            await folder_delete_router(
+                folder_id=42,
+                params=FolderDeleteRequest(recursive=True),
+                session=session,
+                current_user=current_user,
+            )
+
+        mock_service.assert_awaited_once_with(
+            session=session,
+            folder_id=42,
+            recursive=True,
+        )
@@ -0,0 +1,32 @@
+# tests/routers/test_integrity_report_retrieve.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.routers.integrity_report_retrieve import (  # noqa: E402
+    integrity_report_retrieve_router,
+)
+
+
+class TestIntegrityReportRetrieveRouter(unittest.IsolatedAsyncioTestCase):
+
+    async def test_returns_service_report(self):
+        session = AsyncMock()
+        report = object()
+
+        with patch(
+            "app.routers.integrity_report_retrieve.retrieve_integrity_report",
+            new=AsyncMock(return_value=report),
+        ) as service_mock:
+            response = await integrity_report_retrieve_router(
+                session=session,
+                current_user=object(),
+            )
+
+        service_mock.assert_awaited_once_with(session)
+        self.assertIs(response, report)
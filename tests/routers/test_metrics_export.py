@@ -0,0 +1,34 @@
+# tests/routers/test_metrics_export.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import patch
+
+from fastapi import Response
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.routers.metrics_export import (  # noqa: E402
+    PROMETHEUS_CONTENT_TYPE,
+    metrics_export_router,
+)
+
+
+class TestMetricsExportRouter(unittest.IsolatedAsyncioTestCase):
+
+    async def test_returns_prometheus_text(self):
+        with patch(
+            "app.routers.metrics_export.export_metrics",
+            return_value="# TYPE a gauge\na 1.0\n",
+        ) as service_mock:
+            response = await metrics_export_router(current_user=object())
+
+        service_mock.assert_called_once_with()
+        self.assertIsInstance(response, Response)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.body, b"# TYPE a gauge\na 1.0\n")
+        self.assertEqual(
+            response.headers["content-type"], PROMETHEUS_CONTENT_TYPE,
+        )
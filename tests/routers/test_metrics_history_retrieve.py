@@ -0,0 +1,38 @@
+# tests/routers/test_metrics_history_retrieve.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import patch
+
+from fastapi.responses import JSONResponse
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.routers.metrics_history_retrieve import (  # noqa: E402
+    retrieve_metrics_history_router,
+)
+from app.schemas.metrics_history_retrieve import (  # noqa: E402
+    MetricsHistoryRequest,
+)
+
+
+class TestMetricsHistoryRetrieveRouter(unittest.IsolatedAsyncioTestCase):
+
+    async def test_returns_200_and_calls_service(self):
+        params = MetricsHistoryRequest(minutes=5)
+
+        with patch(
+            "app.routers.metrics_history_retrieve.retrieve_metrics_history",
+            return_value={"timestamps": [], "series": {}},
+        ) as service_mock:
+            response = await retrieve_metrics_history_router(
+                params=params,
+                current_user=object(),
+            )
+
+        service_mock.assert_called_once_with(params)
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.body, b'{"timestamps":[],"series":{}}')
@@ -0,0 +1,33 @@
+# tests/routers/test_revision_retention_estimate.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.routers.revision_retention_estimate import (  # noqa: E402
+    revision_retention_estimate_router,
+)
+
+
+class TestRevisionRetentionEstimateRouter(unittest.IsolatedAsyncioTestCase):
+
+    async def test_returns_service_estimate(self):
+        session = AsyncMock()
+        estimate = object()
+
+        with patch(
+            "app.routers.revision_retention_estimate."
+            "estimate_revision_retention",
+            new=AsyncMock(return_value=estimate),
+        ) as service_mock:
+            response = await revision_retention_estimate_router(
+                session=session,
+                current_user=object(),
+            )
+
+        service_mock.assert_awaited_once_with(session)
+        self.assertIs(response, estimate)
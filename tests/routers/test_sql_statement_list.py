@@ -0,0 +1,41 @@
+# tests/routers/test_sql_statement_list.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import patch
+
+from fastapi.responses import JSONResponse
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.routers.sql_statement_list import (  # noqa: E402
+    sql_statement_list_router,
+)
+from app.schemas.sql_statement_list import (  # noqa: E402
+    SqlStatementListRequest,
+)
+
+
+class TestSqlStatementListRouter(unittest.IsolatedAsyncioTestCase):
+
+    async def test_returns_200_and_calls_service(self):
+        params = SqlStatementListRequest(limit=5)
+
+        with patch(
+            "app.routers.sql_statement_list.list_slow_sql_statements",
+            return_value={"threshold_milliseconds": 0, "statements": []},
+        ) as service_mock:
+            response = await sql_statement_list_router(
+                params=params,
+                current_user=object(),
+            )
+
+        service_mock.assert_called_once_with(params)
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.body,
+            b'{"threshold_milliseconds":0,"statements":[]}',
+        )
@@ -0,0 +1,38 @@
+# tests/routers/test_upload_session_commit.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.routers.upload_session_commit import (  # noqa: E402
+    upload_session_commit_router,
+)
+
+
+class TestUploadSessionCommitRouter(unittest.IsolatedAsyncioTestCase):
+
+    async def test_returns_upload_session_commit_response(self):
+        session = AsyncMock()
+        current_user = SimpleNamespace(id=1)
+
+        with patch(
+            "app.routers.upload_session_commit.commit_upload_session",
+            new=AsyncMock(return_value=SimpleNamespace(id=10)),
+        ) as commit_mock:
+            response = await upload_session_commit_router(
+                upload_id="uuid-1",
+                session=session,
+                current_user=current_user,
+            )
+
+        commit_mock.assert_awaited_once_with(
+            session=session,
+            user=current_user,
+            upload_id="uuid-1",
+        )
+        self.assertEqual(response.file_id, 10)
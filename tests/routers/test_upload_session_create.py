@@ -0,0 +1,46 @@
+# tests/routers/test_upload_session_create.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.routers.upload_session_create import (  # noqa: E402
+    upload_session_create_router,
+)
+from app.schemas.upload_session_create import (  # noqa: E402
+    UploadSessionCreateRequest,
+)
+
+
+class TestUploadSessionCreateRouter(unittest.IsolatedAsyncioTestCase):
+
+    async def test_returns_upload_session_create_response(self):
+        session = AsyncMock()
+        current_user = SimpleNamespace(id=1)
+        data = UploadSessionCreateRequest(filename="a.bin", filesize=8)
+        upload_session = SimpleNamespace(upload_uuid="uuid-1", expires_at=99)
+
+        with patch(
+            "app.routers.upload_session_create.create_upload_session",
+            new=AsyncMock(return_value=upload_session),
+        ) as create_mock:
+            response = await upload_session_create_router(
+                folder_id=2,
+                data=data,
+                session=session,
+                current_user=current_user,
+            )
+
+        create_mock.assert_awaited_once_with(
+            session=session,
+            user=current_user,
+            folder_id=2,
+            data=data,
+        )
+        self.assertEqual(response.upload_id, "uuid-1")
+        self.assertEqual(response.expires_at, 99)
@@ -0,0 +1,47 @@
+# tests/routers/test_upload_session_select.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.routers.upload_session_select import (  # noqa: E402
+    upload_session_select_router,
+)
+
+
+class TestUploadSessionSelectRouter(unittest.IsolatedAsyncioTestCase):
+
+    async def test_returns_upload_session_select_response(self):
+        session = AsyncMock()
+        current_user = SimpleNamespace(id=1)
+        upload_session = SimpleNamespace(
+            upload_uuid="uuid-1",
+            folder_id=2,
+            filename="a.bin",
+            filesize=8,
+            ranges=[(0, 4)],
+            created_at=50,
+            expires_at=99,
+        )
+
+        with patch(
+            "app.routers.upload_session_select.select_upload_session",
+            new=AsyncMock(return_value=upload_session),
+        ) as select_mock:
+            response = await upload_session_select_router(
+                upload_id="uuid-1",
+                session=session,
+                current_user=current_user,
+            )
+
+        select_mock.assert_awaited_once_with(
+            session=session,
+            user=current_user,
+            upload_id="uuid-1",
+        )
+        self.assertEqual(response.received_ranges, [(0, 4)])
@@ -0,0 +1,50 @@
+# tests/routers/test_upload_session_write.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.routers.upload_session_write import (  # noqa: E402
+    upload_session_write_router,
+)
+from app.schemas.upload_session_write import (  # noqa: E402
+    UploadSessionWriteRequest,
+)
+
+
+class TestUploadSessionWriteRouter(unittest.IsolatedAsyncioTestCase):
+
+    async def test_streams_request_body_to_service(self):
+        session = AsyncMock()
+        current_user = SimpleNamespace(id=1)
+        request = MagicMock()
+        stream = object()
+        request.stream.return_value = stream
+        upload_session = SimpleNamespace(ranges=[(0, 8)], expires_at=99)
+
+        with patch(
+            "app.routers.upload_session_write.write_upload_session",
+            new=AsyncMock(return_value=upload_session),
+        ) as write_mock:
+            response = await upload_session_write_router(
+                upload_id="uuid-1",
+                request=request,
+                params=UploadSessionWriteRequest(offset=4),
+                session=session,
+                current_user=current_user,
+            )
+
+        write_mock.assert_awaited_once_with(
+            session=session,
+            user=current_user,
+            upload_id="uuid-1",
+            offset=4,
+            data=stream,
+        )
+        self.assertEqual(response.received_ranges, [(0, 8)])
+        self.assertEqual(response.expires_at, 99)
@@ -0,0 +1,156 @@
+# tests/runtime/test_admission.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.errors import InsufficientStorageError, TooManyRequestsError
+from app.runtime.admission import UploadAdmission, get_upload_admission
+
+
+def _statvfs(free_bytes):
+    return SimpleNamespace(f_bavail=free_bytes, f_frsize=1)
+
+
+class TestUploadAdmission(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.now = 0.0
+        self.statvfs_patch = patch(
+            "app.runtime.admission.os.statvfs",
+            return_value=_statvfs(1000),
+        )
+        self.statvfs_mock = self.statvfs_patch.start()
+        self.addCleanup(self.statvfs_patch.stop)
+
+    def _admission(self, **kwargs):
+        params = {
+            "max_bytes": 100,
+            "max_bytes_per_user": 60,
+            "min_free_bytes": 0,
+            "path": "/mnt",
+            "statvfs_ttl": 5,
+            "clock": lambda: self.now,
+        }
+        params.update(kwargs)
+        return UploadAdmission(**params)
+
+    async def test_reserves_and_releases_bytes(self):
+        admission = self._admission()
+
+        async with admission.reserve("1", 40):
+            self.assertEqual(admission.bytes_in_flight, 40)
+
+        self.assertEqual(admission.bytes_in_flight, 0)
+        self.assertEqual(admission._user_bytes, {})
+
+    async def test_releases_bytes_on_error(self):
+        admission = self._admission()
+
+        with self.assertRaises(RuntimeError):
+            async with admission.reserve("1", 40):
+                raise RuntimeError
+
+        self.assertEqual(admission.bytes_in_flight, 0)
+
+    async def test_rejects_over_global_budget(self):
+        admission = self._admission()
+
+        async with admission.reserve("1", 50), admission.reserve("2", 50):
+            with self.assertRaises(TooManyRequestsError) as ctx:
+                async with admission.reserve("3", 1):
+                    pass
+
+        self.assertEqual(ctx.exception.retry_after, 5)
+        self.assertEqual(admission.bytes_in_flight, 0)
+
+    async def test_rejects_over_user_budget(self):
+        admission = self._admission()
+
+        async with admission.reserve("1", 40):
+            with self.assertRaises(TooManyRequestsError):
+                async with admission.reserve("1", 30):
+                    pass
+
+            async with admission.reserve("2", 30):
+                self.assertEqual(admission.bytes_in_flight, 70)
+
+    async def test_admits_oversize_request_when_idle(self):
+        admission = self._admission()
+
+        async with admission.reserve("1", 500):
+            self.assertEqual(admission.bytes_in_flight, 500)
+
+            with self.assertRaises(TooManyRequestsError):
+                async with admission.reserve("2", 1):
+                    pass
+
+    async def test_unknown_size_reserves_user_budget(self):
+        admission = self._admission()
+
+        async with admission.reserve("1", None):
+            self.assertEqual(admission.bytes_in_flight, 60)
+
+    async def test_unknown_size_reserves_global_budget(self):
+        admission = self._admission(max_bytes_per_user=0)
+
+        async with admission.reserve("1", None):
+            self.assertEqual(admission.bytes_in_flight, 100)
+
+    async def test_unlimited_budgets(self):
+        admission = self._admission(max_bytes=0, max_bytes_per_user=0)
+
+        async with admission.reserve("1", 500), admission.reserve("1", 500):
+            self.assertEqual(admission.bytes_in_flight, 1000)
+
+        self.statvfs_mock.assert_not_called()
+
+    async def test_rejects_below_free_space_floor(self):
+        admission = self._admission(max_bytes=0, min_free_bytes=900)
+
+        async with admission.reserve("1", 50):
+            with self.assertRaises(InsufficientStorageError) as ctx:
+                async with admission.reserve("2", 60):
+                    pass
+
+        self.assertEqual(ctx.exception.retry_after, 300)
+        self.statvfs_mock.assert_called_once_with("/mnt")
+
+    async def test_caches_free_space(self):
+        admission = self._admission(min_free_bytes=1)
+
+        async with admission.reserve("1", 10):
+            pass
+        self.now = 4.0
+        async with admission.reserve("1", 10):
+            pass
+        self.assertEqual(self.statvfs_mock.call_count, 1)
+
+        self.now = 5.0
+        async with admission.reserve("1", 10):
+            pass
+        self.assertEqual(self.statvfs_mock.call_count, 2)
+
+
+class TestGetUploadAdmission(unittest.TestCase):
+
+    def tearDown(self):
+        get_upload_admission.cache_clear()
+
+    def test_returns_singleton_sized_from_config(self):
+        with patch("app.runtime.admission.get_config") as get_config_mock:
+            config = get_config_mock.return_value
+            config.UPLOADS_MAX_BYTES_IN_FLIGHT = 100
+            config.UPLOADS_MAX_BYTES_IN_FLIGHT_PER_USER = 60
+            config.UPLOADS_MIN_FREE_BYTES = 10
+            config.GOCRYPTFS_MOUNTPOINT = "/mnt"
+            first = get_upload_admission()
+            second = get_upload_admission()
+
+        self.assertIs(first, second)
+        self.assertEqual(first._max_bytes, 100)
+        self.assertEqual(first._max_bytes_per_user, 60)
+        self.assertEqual(first._min_free_bytes, 10)
+        self.assertEqual(first._path, "/mnt")
+        get_config_mock.assert_called_once()
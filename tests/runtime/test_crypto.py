@@ -0,0 +1,99 @@
+# tests/runtime/test_crypto.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import operator
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.runtime import crypto
+from app.runtime.crypto import CryptoExecutor, get_crypto_executor
+from app.security import encryption, hashing
+
+
+class TestCryptoExecutor(unittest.IsolatedAsyncioTestCase):
+
+    async def test_runs_in_worker_process(self):
+        executor = CryptoExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+
+        self.assertEqual(await executor.run(operator.add, 2, 3), 5)
+        with self.assertRaises(ValueError):
+            await executor.run(int, "not-a-number")
+
+        self.assertEqual(executor._pool._max_workers, 1)
+
+    async def test_non_positive_workers_use_thread(self):
+        executor = CryptoExecutor(max_workers=0)
+
+        with patch(
+            "app.runtime.crypto.asyncio.to_thread",
+            new=AsyncMock(return_value=5),
+        ) as to_thread_mock:
+            result = await executor.run(operator.add, 2, 3)
+
+        self.assertEqual(result, 5)
+        to_thread_mock.assert_awaited_once_with(operator.add, 2, 3)
+        self.assertIsNone(executor._pool)
+
+    def test_shutdown_stops_pool(self):
+        executor = CryptoExecutor(max_workers=1)
+        pool = MagicMock()
+        executor._pool = pool
+
+        executor.shutdown()
+        executor.shutdown()
+
+        pool.shutdown.assert_called_once_with(
+            wait=False, cancel_futures=True,
+        )
+        self.assertIsNone(executor._pool)
+
+
+class TestCryptoWrappers(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.executor = MagicMock(run=AsyncMock(return_value="result"))
+        p = patch(
+            "app.runtime.crypto.get_crypto_executor",
+            return_value=self.executor,
+        )
+        p.start()
+        self.addCleanup(p.stop)
+
+    async def test_hash_string(self):
+        self.assertEqual(await crypto.hash_string("pw"), "result")
+        self.executor.run.assert_awaited_once_with(hashing.hash_string, "pw")
+
+    async def test_is_password_correct(self):
+        await crypto.is_password_correct("pw", "hash")
+        self.executor.run.assert_awaited_once_with(
+            hashing.is_password_correct, "pw", "hash",
+        )
+
+    async def test_encrypt_passphrase(self):
+        await crypto.encrypt_passphrase(b"data", b"pw")
+        self.executor.run.assert_awaited_once_with(
+            encryption.encrypt_passphrase, b"data", b"pw",
+        )
+
+    async def test_decrypt_passphrase(self):
+        await crypto.decrypt_passphrase(b"blob", b"pw")
+        self.executor.run.assert_awaited_once_with(
+            encryption.decrypt_passphrase, b"blob", b"pw",
+        )
+
+
+class TestGetCryptoExecutor(unittest.TestCase):
+
+    def tearDown(self):
+        get_crypto_executor.cache_clear()
+
+    def test_returns_singleton_sized_from_config(self):
+        with patch("app.runtime.crypto.get_config") as get_config_mock:
+            get_config_mock.return_value.CRYPTO_MAX_WORKERS = 3
+            first = get_crypto_executor()
+            second = get_crypto_executor()
+
+        self.assertIs(first, second)
+        self.assertEqual(first.max_workers, 3)
+        get_config_mock.assert_called_once()
@@ -0,0 +1,28 @@
+# tests/runtime/test_load.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+
+from app.runtime.load import RequestLoad
+
+
+class TestRequestLoad(unittest.TestCase):
+
+    def test_track_counts_active_requests(self):
+        load = RequestLoad()
+
+        with load.track():
+            with load.track():
+                self.assertEqual(load.active, 2)
+            self.assertEqual(load.active, 1)
+
+        self.assertEqual(load.active, 0)
+
+    def test_track_releases_on_error(self):
+        load = RequestLoad()
+
+        with self.assertRaises(RuntimeError):
+            with load.track():
+                raise RuntimeError("fail")
+
+        self.assertEqual(load.active, 0)
@@ -0,0 +1,108 @@
+# tests/runtime/test_metrics.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+
+from app.runtime.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    _Metric,
+)
+
+
+class TestMetrics(unittest.TestCase):
+
+    def test_counter_renders_series_by_labels(self):
+        counter = Counter("c_total", "Requests.", ("method", "status"))
+        counter.labels("GET", 200).inc()
+        counter.labels("GET", 200).inc(2)
+        counter.labels("POST", 500).inc()
+
+        self.assertEqual(
+            counter.render(),
+            [
+                "# HELP c_total Requests.",
+                "# TYPE c_total counter",
+                'c_total{method="GET",status="200"} 3.0',
+                'c_total{method="POST",status="500"} 1.0',
+            ],
+        )
+
+    def test_labels_returns_same_series(self):
+        counter = Counter("c_total", "Requests.", ("method",))
+
+        self.assertIs(counter.labels("GET"), counter.labels("GET"))
+
+    def test_labels_rejects_wrong_count(self):
+        counter = Counter("c_total", "Requests.", ("method",))
+
+        with self.assertRaises(ValueError):
+            counter.labels("GET", "extra")
+
+    def test_unlabelled_gauge_renders_initial_value(self):
+        gauge = Gauge("g", "Active.")
+
+        self.assertEqual(gauge.render()[-1], "g 0.0")
+
+        gauge.labels().set(4)
+
+        self.assertEqual(gauge.render()[-1], "g 4.0")
+
+    def test_histogram_renders_cumulative_buckets(self):
+        histogram = Histogram(
+            "h_seconds", "Latency.", ("route",), buckets=(0.1, 1.0),
+        )
+        series = histogram.labels("/a")
+        series.observe(0.05)
+        series.observe(0.1)
+        series.observe(0.5)
+        series.observe(5.0)
+
+        self.assertEqual(
+            histogram.render()[2:],
+            [
+                'h_seconds_bucket{route="/a",le="0.1"} 2',
+                'h_seconds_bucket{route="/a",le="1.0"} 3',
+                'h_seconds_bucket{route="/a",le="+Inf"} 4',
+                'h_seconds_sum{route="/a"} 5.65',
+                'h_seconds_count{route="/a"} 4',
+            ],
+        )
+
+    def test_metric_family_without_series_type_is_abstract(self):
+        class Untyped(_Metric):
+            type_name = "untyped"
+
+        with self.assertRaises(TypeError):
+            Untyped("u", "Untyped.")
+
+    def test_label_values_are_escaped(self):
+        counter = Counter("c_total", "Requests.", ("route",))
+        counter.labels('a"b\\c\nd').inc()
+
+        self.assertEqual(
+            counter.render()[-1], 'c_total{route="a\\"b\\\\c\\nd"} 1.0',
+        )
+
+
+class TestMetricsRegistry(unittest.TestCase):
+
+    def test_renders_all_metrics(self):
+        registry = MetricsRegistry()
+        registry.register(Gauge("a", "First."))
+        registry.register(Gauge("b", "Second."))
+
+        self.assertEqual(
+            registry.render(),
+            "# HELP a First.\n# TYPE a gauge\na 0.0\n"
+            "# HELP b Second.\n# TYPE b gauge\nb 0.0\n",
+        )
+
+    def test_rejects_duplicate_name(self):
+        registry = MetricsRegistry()
+        registry.register(Gauge("a", "First."))
+
+        with self.assertRaises(ValueError):
+            registry.register(Counter("a", "Again."))
@@ -0,0 +1,95 @@
+# tests/runtime/test_metrics_history.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.runtime.metrics_history import MetricsHistory, get_metrics_history
+
+
+class TestMetricsHistory(unittest.TestCase):
+
+    def test_empty_history(self):
+        history = MetricsHistory(3)
+
+        self.assertIsNone(history.latest())
+        self.assertEqual(history.since(0), {"timestamps": [], "series": {}})
+
+    def test_keeps_numeric_series_and_latest_sample(self):
+        history = MetricsHistory(3)
+        sample = {"cpu": 12.5, "rss": 100, "name": "Linux", "on": True}
+
+        history.append(10.0, sample)
+
+        self.assertEqual(history.latest(), (10.0, sample))
+        self.assertEqual(
+            history.since(0),
+            {"timestamps": [10.0], "series": {"cpu": [12.5], "rss": [100.0]}},
+        )
+
+    def test_overwrites_oldest_sample_when_full(self):
+        history = MetricsHistory(2)
+
+        for timestamp in (10.0, 20.0, 30.0):
+            history.append(timestamp, {"cpu": timestamp / 10})
+
+        self.assertEqual(
+            history.since(0),
+            {"timestamps": [20.0, 30.0], "series": {"cpu": [2.0, 3.0]}},
+        )
+
+    def test_since_filters_old_samples(self):
+        history = MetricsHistory(5)
+
+        for timestamp in (10.0, 20.0, 30.0):
+            history.append(timestamp, {"cpu": 1})
+
+        self.assertEqual(history.since(20.0)["timestamps"], [20.0, 30.0])
+
+    def test_missing_values_are_none(self):
+        history = MetricsHistory(3)
+
+        history.append(10.0, {"cpu": 1, "freq": None})
+        history.append(20.0, {"freq": 2400})
+
+        self.assertEqual(
+            history.since(0)["series"],
+            {"cpu": [1.0, None], "freq": [None, 2400.0]},
+        )
+
+    def test_zero_capacity_keeps_only_latest(self):
+        history = MetricsHistory(0)
+
+        history.append(10.0, {"cpu": 1})
+
+        self.assertEqual(history.latest(), (10.0, {"cpu": 1}))
+        self.assertEqual(history.since(0), {"timestamps": [], "series": {}})
+
+
+class TestGetMetricsHistory(unittest.TestCase):
+
+    def setUp(self):
+        get_metrics_history.cache_clear()
+        self.addCleanup(get_metrics_history.cache_clear)
+
+    def test_capacity_from_config(self):
+        config = MagicMock(
+            METRICS_SAMPLE_INTERVAL_SECONDS=10,
+            METRICS_HISTORY_SECONDS=3600,
+        )
+
+        with patch(
+            "app.runtime.metrics_history.get_config", return_value=config,
+        ):
+            self.assertEqual(get_metrics_history().capacity, 360)
+
+    def test_disabled_sampling_holds_no_history(self):
+        config = MagicMock(
+            METRICS_SAMPLE_INTERVAL_SECONDS=0,
+            METRICS_HISTORY_SECONDS=3600,
+        )
+
+        with patch(
+            "app.runtime.metrics_history.get_config", return_value=config,
+        ):
+            self.assertEqual(get_metrics_history().capacity, 0)
@@ -0,0 +1,134 @@
+# tests/runtime/test_rate_limit.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import patch
+
+from app.runtime.rate_limit import (
+    RateLimitCost,
+    RateLimiter,
+    get_rate_limiter,
+)
+
+COSTS = {
+    RateLimitCost.LIGHT: 1,
+    RateLimitCost.MEDIUM: 5,
+    RateLimitCost.HEAVY: 20,
+}
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0.0
+
+    def _limiter(self, **kwargs):
+        params = {
+            "tokens_per_second": 2,
+            "burst": 10,
+            "costs": COSTS,
+            "clock": lambda: self.now,
+        }
+        params.update(kwargs)
+        return RateLimiter(**params)
+
+    def test_allows_burst_then_rejects(self):
+        limiter = self._limiter()
+
+        self.assertIsNone(limiter.acquire(1, RateLimitCost.MEDIUM))
+        self.assertIsNone(limiter.acquire(1, RateLimitCost.MEDIUM))
+        self.assertEqual(limiter.acquire(1, RateLimitCost.LIGHT), 1)
+        self.assertEqual(limiter.acquire(1, RateLimitCost.MEDIUM), 3)
+
+        self.assertEqual(limiter.allowed_count, 2)
+        self.assertEqual(limiter.rejected_count, 2)
+
+    def test_refills_over_time(self):
+        limiter = self._limiter()
+        limiter.acquire(1, RateLimitCost.MEDIUM)
+        limiter.acquire(1, RateLimitCost.MEDIUM)
+
+        self.now = 2.5
+
+        self.assertIsNone(limiter.acquire(1, RateLimitCost.MEDIUM))
+        self.assertEqual(limiter.acquire(1, RateLimitCost.LIGHT), 1)
+
+    def test_buckets_are_per_user(self):
+        limiter = self._limiter()
+        limiter.acquire(1, RateLimitCost.HEAVY)
+
+        self.assertIsNotNone(limiter.acquire(1, RateLimitCost.LIGHT))
+        self.assertIsNone(limiter.acquire(2, RateLimitCost.LIGHT))
+        self.assertEqual(limiter.bucket_count, 2)
+
+    def test_cost_above_burst_needs_full_bucket(self):
+        limiter = self._limiter()
+
+        self.assertIsNone(limiter.acquire(1, RateLimitCost.HEAVY))
+        self.assertEqual(limiter.acquire(1, RateLimitCost.HEAVY), 5)
+
+        self.now = 5.0
+        self.assertIsNone(limiter.acquire(1, RateLimitCost.HEAVY))
+
+    def test_disabled_when_rate_or_burst_not_positive(self):
+        for kwargs in ({"tokens_per_second": 0}, {"burst": 0}):
+            with self.subTest(**kwargs):
+                limiter = self._limiter(**kwargs)
+                for _ in range(100):
+                    self.assertIsNone(
+                        limiter.acquire(1, RateLimitCost.HEAVY),
+                    )
+                self.assertFalse(limiter.enabled)
+                self.assertEqual(limiter.bucket_count, 0)
+
+    def test_prunes_full_buckets(self):
+        limiter = self._limiter(max_buckets=2)
+        limiter.acquire(1, RateLimitCost.LIGHT)
+        limiter.acquire(2, RateLimitCost.MEDIUM)
+
+        self.now = 1.0
+        limiter.acquire(3, RateLimitCost.LIGHT)
+
+        self.assertEqual(set(limiter._buckets), {2, 3})
+
+    def test_prunes_before_storing_rejected_bucket(self):
+        limiter = self._limiter(max_buckets=2)
+        limiter.acquire(1, RateLimitCost.LIGHT)
+        limiter.acquire(2, RateLimitCost.MEDIUM)
+
+        self.now = 1.0
+        get_tokens = limiter._get_tokens
+        with patch.object(
+            limiter,
+            "_get_tokens",
+            side_effect=lambda key, now: (
+                0.0 if key == 3 else get_tokens(key, now)
+            ),
+        ):
+            self.assertEqual(limiter.acquire(3, RateLimitCost.LIGHT), 1)
+
+        self.assertEqual(set(limiter._buckets), {2, 3})
+        self.assertEqual(limiter.rejected_count, 1)
+
+
+class TestGetRateLimiter(unittest.TestCase):
+
+    def tearDown(self):
+        get_rate_limiter.cache_clear()
+
+    def test_returns_singleton_configured_from_config(self):
+        with patch("app.runtime.rate_limit.get_config") as get_config_mock:
+            config = get_config_mock.return_value
+            config.RATE_LIMIT_TOKENS_PER_SECOND = 2.5
+            config.RATE_LIMIT_BURST_TOKENS = 50
+            config.RATE_LIMIT_COST_LIGHT = 1
+            config.RATE_LIMIT_COST_MEDIUM = 4
+            config.RATE_LIMIT_COST_HEAVY = 16
+            first = get_rate_limiter()
+            second = get_rate_limiter()
+
+        self.assertIs(first, second)
+        self.assertEqual(first.tokens_per_second, 2.5)
+        self.assertEqual(first.burst, 50)
+        self.assertEqual(first.costs[RateLimitCost.MEDIUM], 4)
+        get_config_mock.assert_called_once()
@@ -0,0 +1,161 @@
+# tests/runtime/test_scheduler.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from app.constants import LOCKDOWN_MODE_ENABLED_FLAG_PATH
+from app.events import Events as E
+from app.runtime import scheduler as sch
+
+
+class TestScheduler(unittest.IsolatedAsyncioTestCase):
+
+    async def test_every_ignores_non_positive_interval(self):
+        scheduler = sch.Scheduler()
+        scheduler.every("job", 0, AsyncMock())
+        scheduler.every("job", -1, AsyncMock())
+
+        scheduler.start()
+
+        self.assertEqual(scheduler._tasks, set())
+
+    async def test_periodic_job_runs_when_storage_available(self):
+        scheduler = sch.Scheduler()
+        ran = asyncio.Event()
+
+        async def job():
+            ran.set()
+
+        with patch(
+            "app.runtime.scheduler.is_storage_available",
+            new_callable=AsyncMock,
+            return_value=True,
+        ):
+            scheduler.every("job", 0.001, job)
+            scheduler.start()
+            await asyncio.wait_for(ran.wait(), timeout=1)
+            await scheduler.stop()
+
+        self.assertEqual(scheduler._tasks, set())
+        self.assertEqual(scheduler._jobs, [])
+
+    async def test_periodic_job_skipped_when_storage_unavailable(self):
+        scheduler = sch.Scheduler()
+        job = AsyncMock()
+        available_mock = AsyncMock(return_value=False)
+
+        with patch(
+            "app.runtime.scheduler.is_storage_available",
+            available_mock,
+        ):
+            scheduler.every("job", 0.001, job)
+            scheduler.start()
+            while available_mock.await_count < 2:
+                await asyncio.sleep(0.001)
+            await scheduler.stop()
+
+        job.assert_not_awaited()
+
+    async def test_failing_job_is_logged_and_swallowed(self):
+        scheduler = sch.Scheduler()
+
+        with self.assertLogs("app.runtime.scheduler", level="ERROR") as cm:
+            await scheduler._run_job(
+                "job", AsyncMock(side_effect=RuntimeError("boom")),
+            )
+
+        self.assertTrue(
+            any(E.SCHEDULER_JOB_FAILED in line for line in cm.output)
+        )
+
+    async def test_job_runs_are_counted(self):
+        scheduler = sch.Scheduler()
+
+        with (
+            patch.object(sch, "SCHEDULER_JOB_RUNS") as runs_mock,
+            self.assertLogs("app.runtime.scheduler", level="ERROR"),
+        ):
+            await scheduler._run_job("ok", AsyncMock())
+            await scheduler._run_job(
+                "bad", AsyncMock(side_effect=RuntimeError("boom")),
+            )
+
+        self.assertEqual(
+            runs_mock.labels.call_args_list,
+            [call("ok", "completed"), call("bad", "failed")],
+        )
+
+    async def test_run_job_propagates_cancellation(self):
+        scheduler = sch.Scheduler()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await scheduler._run_job(
+                "job", AsyncMock(side_effect=asyncio.CancelledError()),
+            )
+
+    async def test_spawn_runs_coroutine_once(self):
+        scheduler = sch.Scheduler()
+        job = AsyncMock()
+
+        task = scheduler.spawn("once", job())
+        await task
+
+        job.assert_awaited_once_with()
+        self.assertNotIn(task, scheduler._tasks)
+
+    async def test_stop_cancels_spawned_task(self):
+        scheduler = sch.Scheduler()
+        task = scheduler.spawn("sleeper", asyncio.sleep(60))
+        await asyncio.sleep(0)
+
+        await scheduler.stop()
+
+        self.assertTrue(task.cancelled())
+
+
+class TestIsStorageAvailable(unittest.IsolatedAsyncioTestCase):
+
+    async def test_false_in_lockdown_mode(self):
+        with (
+            patch(
+                "app.runtime.scheduler.get_config",
+                return_value=MagicMock(GOCRYPTFS_MOUNTPOINT="/mnt"),
+            ),
+            patch(
+                "app.runtime.scheduler.isfile",
+                new_callable=AsyncMock,
+                return_value=True,
+            ) as isfile_mock,
+            patch(
+                "app.runtime.scheduler.ismount",
+                new_callable=AsyncMock,
+            ) as ismount_mock,
+        ):
+            self.assertFalse(await sch.is_storage_available())
+
+        isfile_mock.assert_awaited_once_with(LOCKDOWN_MODE_ENABLED_FLAG_PATH)
+        ismount_mock.assert_not_awaited()
+
+    async def test_returns_mount_state(self):
+        for mounted in (True, False):
+            with (
+                self.subTest(mounted=mounted),
+                patch(
+                    "app.runtime.scheduler.get_config",
+                    return_value=MagicMock(GOCRYPTFS_MOUNTPOINT="/mnt"),
+                ),
+                patch(
+                    "app.runtime.scheduler.isfile",
+                    new_callable=AsyncMock,
+                    return_value=False,
+                ),
+                patch(
+                    "app.runtime.scheduler.ismount",
+                    new_callable=AsyncMock,
+                    return_value=mounted,
+                ) as ismount_mock,
+            ):
+                self.assertEqual(await sch.is_storage_available(), mounted)
+                ismount_mock.assert_awaited_once_with("/mnt")
@@ -0,0 +1,103 @@
+# tests/runtime/test_throttle.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from app.runtime.load import RequestLoad
+from app.runtime.throttle import IOThrottle
+
+
+class TestIOThrottle(unittest.IsolatedAsyncioTestCase):
+
+    def _throttle(self, load=None, **kwargs):
+        params = {
+            "bytes_per_second": 100,
+            "iops": 10,
+            "max_active_requests": 1,
+            "pause_seconds": 0.5,
+        }
+        params.update(kwargs)
+        return IOThrottle(load=load or RequestLoad(), **params)
+
+    async def test_paces_bytes_to_budget(self):
+        throttle = self._throttle()
+
+        with (
+            patch(
+                "app.runtime.throttle.time.monotonic", return_value=10.0,
+            ),
+            patch(
+                "app.runtime.throttle.asyncio.sleep", new=AsyncMock(),
+            ) as sleep_mock,
+        ):
+            await throttle.acquire_bytes(50)
+            await throttle.acquire_bytes(50)
+
+        sleep_mock.assert_awaited_once_with(0.5)
+
+    async def test_paces_operations_to_budget(self):
+        throttle = self._throttle()
+
+        with (
+            patch(
+                "app.runtime.throttle.time.monotonic", return_value=10.0,
+            ),
+            patch(
+                "app.runtime.throttle.asyncio.sleep", new=AsyncMock(),
+            ) as sleep_mock,
+        ):
+            await throttle.acquire_ops()
+            await throttle.acquire_ops(2)
+            await throttle.acquire_ops()
+
+        delays = [c.args[0] for c in sleep_mock.await_args_list]
+        self.assertEqual(len(delays), 2)
+        self.assertAlmostEqual(delays[0], 0.1)
+        self.assertAlmostEqual(delays[1], 0.3)
+
+    async def test_unused_budget_does_not_accumulate(self):
+        throttle = self._throttle()
+
+        with (
+            patch(
+                "app.runtime.throttle.time.monotonic",
+                side_effect=[10.0, 100.0],
+            ),
+            patch(
+                "app.runtime.throttle.asyncio.sleep", new=AsyncMock(),
+            ) as sleep_mock,
+        ):
+            await throttle.acquire_bytes(100)
+            await throttle.acquire_bytes(100)
+
+        sleep_mock.assert_not_awaited()
+
+    async def test_non_positive_budgets_are_unlimited(self):
+        throttle = self._throttle(
+            bytes_per_second=0, iops=0, max_active_requests=0,
+        )
+
+        with patch(
+            "app.runtime.throttle.asyncio.sleep", new=AsyncMock(),
+        ) as sleep_mock:
+            await throttle.acquire_bytes(10 ** 9)
+            await throttle.acquire_ops(10 ** 6)
+
+        sleep_mock.assert_not_awaited()
+
+    async def test_pauses_while_requests_are_active(self):
+        load = RequestLoad()
+        load.active = 2
+        throttle = self._throttle(load=load, bytes_per_second=0)
+
+        async def finish_requests(_seconds):
+            load.active = 1
+
+        with patch(
+            "app.runtime.throttle.asyncio.sleep",
+            new=AsyncMock(side_effect=finish_requests),
+        ) as sleep_mock:
+            await throttle.acquire_bytes(10)
+
+        sleep_mock.assert_awaited_once_with(0.5)
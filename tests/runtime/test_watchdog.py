@@ -2,6 +2,12 @@
 # SPDX-License-Identifier: GPL-3.0-only
 
 import asyncio
+import contextlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -347,7 +353,7 @@ class TestRunWatchdog(unittest.IsolatedAsyncioTestCase):
         mock_ismount.assert_awaited_once_with("/mnt/h")
         mock_isdir.assert_awaited_once_with("/sec")
         mock_isfile.assert_awaited_once_with("/sec/pass.enc")
-        mock_running.assert_called_once_with()
+        mock_running.assert_called_once_with(None)
         mock_ld.assert_not_awaited()
         mock_logger.warning.assert_not_called()
         mock_logger.info.assert_not_called()
@@ -573,6 +579,124 @@ class TestIsApplicationRunning(unittest.TestCase):
         with patch("app.runtime.watchdog.Path", return_value=proc):
             self.assertFalse(wd._is_application_running())
 
+    def test_checks_only_given_pid(self):
+        entry = _FakeProcEntry("42", b"python\x00uvicorn\x00app.main:app\x00")
+
+        with patch(
+            "app.runtime.watchdog.Path", return_value=entry,
+        ) as mock_path:
+            self.assertTrue(wd._is_application_running(42))
+
+        mock_path.assert_called_once_with("/proc", "42")
+
+    def test_false_when_given_pid_is_gone(self):
+        with patch(
+            "app.runtime.watchdog.Path",
+            return_value=_FakeProcEntryRaises("42"),
+        ):
+            self.assertFalse(wd._is_application_running(42))
+
+
+class TestWatchdog(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.secrets_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.secrets_dir, True)
+        self.checked = asyncio.Event()
+        self.check = AsyncMock(side_effect=lambda pid: self.checked.set())
+
+        cfg = _cfg()
+        cfg.INSTALL_SECRETS_DIR = self.secrets_dir
+        patches = [
+            patch("app.runtime.watchdog.get_config", return_value=cfg),
+            patch("app.runtime.watchdog.run_watchdog", self.check),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    async def _run(self, watchdog):
+        task = asyncio.create_task(watchdog.run())
+        self.addAsyncCleanup(self._cancel, task)
+        await asyncio.sleep(0.05)
+        return task
+
+    async def _cancel(self, task):
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    async def test_checks_on_interval(self):
+        await self._run(wd.Watchdog(app_pid=None, interval=0.01))
+
+        await asyncio.wait_for(self.checked.wait(), timeout=1)
+        self.check.assert_awaited_with(None)
+
+    async def test_checks_when_secret_deleted(self):
+        secret = os.path.join(self.secrets_dir, "passphrase")
+        open(secret, "w").close()
+        await self._run(wd.Watchdog(app_pid=None, interval=60))
+        self.check.assert_not_awaited()
+
+        os.unlink(secret)
+
+        await asyncio.wait_for(self.checked.wait(), timeout=1)
+
+    async def test_checks_when_secrets_dir_removed_and_rewatches(self):
+        watchdog = wd.Watchdog(app_pid=None, interval=60)
+        await self._run(watchdog)
+
+        os.rmdir(self.secrets_dir)
+        await asyncio.wait_for(self.checked.wait(), timeout=1)
+        self.assertIsNone(watchdog._inotify_wd)
+
+        self.checked.clear()
+        os.mkdir(self.secrets_dir)
+        watchdog._wakeup.set()
+        await asyncio.wait_for(self.checked.wait(), timeout=1)
+        self.assertIsNotNone(watchdog._inotify_wd)
+
+    async def test_checks_when_application_exits(self):
+        proc = subprocess.Popen([
+            sys.executable, "-c", "import time; time.sleep(0.2)",
+        ])
+        self.addCleanup(proc.wait)
+        watchdog = wd.Watchdog(app_pid=proc.pid, interval=60)
+        await self._run(watchdog)
+        self.check.assert_not_awaited()
+
+        await asyncio.wait_for(self.checked.wait(), timeout=5)
+
+        self.check.assert_awaited_once_with(proc.pid)
+        self.assertIsNone(watchdog._pidfd)
+
+    async def test_failed_check_keeps_running(self):
+        self.check.side_effect = RuntimeError("boom")
+
+        with patch("app.runtime.watchdog.logger") as mock_logger:
+            task = await self._run(wd.Watchdog(app_pid=None, interval=0.01))
+
+        self.assertFalse(task.done())
+        self.assertGreater(self.check.await_count, 1)
+        mock_logger.exception.assert_called_with("watchdog check failed")
+
+
+class TestWatch(unittest.IsolatedAsyncioTestCase):
+
+    async def test_runs_watchdog_with_configured_interval(self):
+        cfg = _cfg()
+        cfg.GOCRYPTFS_WATCHDOG_INTERVAL_SECONDS = 60
+
+        with (
+            patch("app.runtime.watchdog.get_config", return_value=cfg),
+            patch("app.runtime.watchdog.Watchdog") as mock_watchdog,
+        ):
+            mock_watchdog.return_value.run = AsyncMock()
+            await wd.watch(42)
+
+        mock_watchdog.assert_called_once_with(42, 60)
+        mock_watchdog.return_value.run.assert_awaited_once_with()
+
 
 class TestMain(unittest.TestCase):
 
@@ -580,7 +704,7 @@ class TestMain(unittest.TestCase):
         with (
             patch("app.runtime.watchdog.init_logging") as mock_init_logging,
             patch(
-                "app.runtime.watchdog.run_watchdog",
+                "app.runtime.watchdog.watch",
                 new=MagicMock(),
             ) as mock_watchdog,
             patch(
@@ -591,7 +715,7 @@ class TestMain(unittest.TestCase):
             with self.assertRaises(SystemExit) as cm:
                 from app.runtime import watchdog as _wd
                 _wd.init_logging()
-                raise SystemExit(asyncio.run(_wd.run_watchdog()))
+                raise SystemExit(asyncio.run(_wd.watch()))
 
         mock_init_logging.assert_called_once()
         mock_asyncio_run.assert_called_once()
@@ -602,7 +726,7 @@ class TestMain(unittest.TestCase):
         error = RuntimeError("watchdog failed")
         with (
             patch("app.runtime.watchdog.init_logging"),
-            patch("app.runtime.watchdog.run_watchdog", new=MagicMock()),
+            patch("app.runtime.watchdog.watch", new=MagicMock()),
             patch(
                 "app.runtime.watchdog.asyncio.run",
                 side_effect=error,
@@ -611,6 +735,6 @@ class TestMain(unittest.TestCase):
             with self.assertRaises(RuntimeError) as cm:
                 from app.runtime import watchdog as _wd
                 _wd.init_logging()
-                asyncio.run(_wd.run_watchdog())
+                asyncio.run(_wd.watch())
 
         self.assertIs(cm.exception, error)
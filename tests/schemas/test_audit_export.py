@@ -0,0 +1,46 @@
+# tests/schemas/test_audit_export.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+
+from pydantic import ValidationError
+
+from app.schemas.audit_export import AUDIT_EXPORT_ERRORS, AuditExportRequest
+
+
+class TestAuditExportRequest(unittest.TestCase):
+    def test_defaults(self):
+        req = AuditExportRequest()
+
+        self.assertIsNone(req.created_at__ge)
+        self.assertIsNone(req.created_at__le)
+        self.assertIsNone(req.event__ilike)
+        self.assertEqual(req.after_id, 0)
+
+    def test_accepts_valid_payload_and_strips_event(self):
+        req = AuditExportRequest(
+            created_at__ge=1,
+            created_at__le=2,
+            event__ilike="  login  ",
+            after_id=42,
+        )
+
+        self.assertEqual(req.created_at__ge, 1)
+        self.assertEqual(req.created_at__le, 2)
+        self.assertEqual(req.event__ilike, "login")
+        self.assertEqual(req.after_id, 42)
+
+    def test_rejects_negative_values(self):
+        for field in ("created_at__ge", "created_at__le", "after_id"):
+            with self.subTest(field=field):
+                with self.assertRaises(ValidationError):
+                    AuditExportRequest(**{field: -1})
+
+    def test_forbids_extra_fields(self):
+        with self.assertRaises(ValidationError):
+            AuditExportRequest(offset=10)
+
+
+class TestAuditExportErrors(unittest.TestCase):
+    def test_error_codes(self):
+        self.assertEqual(set(AUDIT_EXPORT_ERRORS), {401, 403, 422, 503})
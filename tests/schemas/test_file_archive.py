@@ -0,0 +1,59 @@
+# tests/schemas/test_file_archive.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from pydantic import ValidationError
+
+from app.constants import FILES_BULK_MAX_ITEMS
+from app.schemas.file_archive import FILE_ARCHIVE_ERRORS, FileArchiveRequest
+
+
+class TestFileArchiveRequest(unittest.TestCase):
+
+    def test_defaults_to_stored_zip(self):
+        req = FileArchiveRequest(folder_id=1)
+
+        self.assertEqual(req.format, "zip")
+        self.assertEqual(req.compression, "store")
+        self.assertIsNone(req.file_ids)
+
+    def test_deduplicates_file_ids_preserving_order(self):
+        req = FileArchiveRequest(file_ids=[3, 1, 3, 2], format="tar")
+
+        self.assertEqual(req.file_ids, [3, 1, 2])
+
+    def test_requires_exactly_one_selection(self):
+        for kwargs in ({}, {"folder_id": 1, "file_ids": [2]}):
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(ValidationError):
+                    FileArchiveRequest(**kwargs)
+
+    def test_deflate_requires_zip(self):
+        with self.assertRaises(ValidationError):
+            FileArchiveRequest(
+                folder_id=1, format="tar", compression="deflate",
+            )
+
+        req = FileArchiveRequest(folder_id=1, compression="deflate")
+        self.assertEqual(req.compression, "deflate")
+
+    def test_too_many_file_ids_rejected(self):
+        with self.assertRaises(ValidationError) as cm:
+            FileArchiveRequest(
+                file_ids=list(range(1, FILES_BULK_MAX_ITEMS + 2)),
+            )
+
+        error = cm.exception.errors()[0]
+        self.assertEqual(error["loc"], ("file_ids",))
+        self.assertEqual(error["type"], "too_long")
+
+    def test_unknown_format_rejected(self):
+        with self.assertRaises(ValidationError):
+            FileArchiveRequest(folder_id=1, format="rar")
+
+    def test_extra_fields_forbidden(self):
+        with self.assertRaises(ValidationError):
+            FileArchiveRequest(folder_id=1, level=9)
+
+    def test_errors_document_range_status(self):
+        self.assertIn(416, FILE_ARCHIVE_ERRORS)
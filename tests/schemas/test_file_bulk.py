@@ -0,0 +1,70 @@
+# tests/schemas/test_file_bulk.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from pydantic import ValidationError
+
+from app.constants import FILES_BULK_MAX_ITEMS
+from app.schemas.file_bulk import (
+    FileBulkRequest,
+    FileBulkResponse,
+    FileBulkResult,
+    FileBulkStatus,
+)
+
+
+class TestFileBulkRequest(unittest.TestCase):
+
+    def test_accepts_valid_payload(self):
+        req = FileBulkRequest(file_ids=[3, 1, 2])
+
+        self.assertEqual(req.file_ids, [3, 1, 2])
+
+    def test_deduplicates_preserving_order(self):
+        req = FileBulkRequest(file_ids=[3, 1, 3, 2, 1])
+
+        self.assertEqual(req.file_ids, [3, 1, 2])
+
+    def test_empty_list_rejected(self):
+        with self.assertRaises(ValidationError) as cm:
+            FileBulkRequest(file_ids=[])
+
+        error = cm.exception.errors()[0]
+        self.assertEqual(error["loc"], ("file_ids",))
+        self.assertEqual(error["type"], "too_short")
+
+    def test_too_many_items_rejected(self):
+        with self.assertRaises(ValidationError) as cm:
+            FileBulkRequest(file_ids=list(range(1, FILES_BULK_MAX_ITEMS + 2)))
+
+        error = cm.exception.errors()[0]
+        self.assertEqual(error["loc"], ("file_ids",))
+        self.assertEqual(error["type"], "too_long")
+
+    def test_non_positive_id_rejected(self):
+        with self.assertRaises(ValidationError) as cm:
+            FileBulkRequest(file_ids=[1, 0])
+
+        error = cm.exception.errors()[0]
+        self.assertEqual(error["loc"], ("file_ids", 1))
+        self.assertEqual(error["type"], "greater_than_equal")
+
+    def test_extra_field_forbidden(self):
+        with self.assertRaises(ValidationError):
+            FileBulkRequest(file_ids=[1], other=1)
+
+
+class TestFileBulkResponse(unittest.TestCase):
+
+    def test_serializes_statuses(self):
+        response = FileBulkResponse(results=[
+            FileBulkResult(file_id=1, status=FileBulkStatus.OK),
+            FileBulkResult(file_id=2, status=FileBulkStatus.NOT_FOUND),
+        ])
+
+        self.assertEqual(response.model_dump(mode="json"), {
+            "results": [
+                {"file_id": 1, "status": "ok"},
+                {"file_id": 2, "status": "not_found"},
+            ],
+        })
@@ -0,0 +1,31 @@
+# tests/schemas/test_file_bulk_delete.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from pydantic import ValidationError
+
+from app.schemas.file_bulk_delete import (
+    FILE_BULK_DELETE_ERRORS,
+    FileBulkDeleteRequest,
+)
+
+
+class TestFileBulkDeleteRequest(unittest.TestCase):
+
+    def test_accepts_valid_payload(self):
+        req = FileBulkDeleteRequest(file_ids=[1, 2])
+
+        self.assertEqual(req.file_ids, [1, 2])
+
+    def test_extra_field_forbidden(self):
+        with self.assertRaises(ValidationError):
+            FileBulkDeleteRequest(file_ids=[1], folder_id=1)
+
+
+class TestFileBulkDeleteErrors(unittest.TestCase):
+
+    def test_error_codes(self):
+        self.assertEqual(
+            set(FILE_BULK_DELETE_ERRORS),
+            {401, 403, 422, 503},
+        )
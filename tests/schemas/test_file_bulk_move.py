@@ -0,0 +1,40 @@
+# tests/schemas/test_file_bulk_move.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from pydantic import ValidationError
+
+from app.schemas.file_bulk_move import (
+    FILE_BULK_MOVE_ERRORS,
+    FileBulkMoveRequest,
+)
+
+
+class TestFileBulkMoveRequest(unittest.TestCase):
+
+    def test_accepts_valid_payload(self):
+        req = FileBulkMoveRequest(file_ids=[1, 2], folder_id=5)
+
+        self.assertEqual(req.file_ids, [1, 2])
+        self.assertEqual(req.folder_id, 5)
+
+    def test_folder_id_required(self):
+        with self.assertRaises(ValidationError) as cm:
+            FileBulkMoveRequest(file_ids=[1])
+
+        error = cm.exception.errors()[0]
+        self.assertEqual(error["loc"], ("folder_id",))
+        self.assertEqual(error["type"], "missing")
+
+    def test_folder_id_must_be_positive(self):
+        with self.assertRaises(ValidationError):
+            FileBulkMoveRequest(file_ids=[1], folder_id=0)
+
+
+class TestFileBulkMoveErrors(unittest.TestCase):
+
+    def test_error_codes(self):
+        self.assertEqual(
+            set(FILE_BULK_MOVE_ERRORS),
+            {401, 403, 404, 422, 423, 503},
+        )
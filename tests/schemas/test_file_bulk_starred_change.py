@@ -0,0 +1,36 @@
+# tests/schemas/test_file_bulk_starred_change.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from pydantic import ValidationError
+
+from app.schemas.file_bulk_starred_change import (
+    FILE_BULK_STARRED_ERRORS,
+    FileBulkStarredChangeRequest,
+)
+
+
+class TestFileBulkStarredChangeRequest(unittest.TestCase):
+
+    def test_accepts_valid_payload(self):
+        req = FileBulkStarredChangeRequest(file_ids=[1, 2], is_starred=True)
+
+        self.assertEqual(req.file_ids, [1, 2])
+        self.assertIs(req.is_starred, True)
+
+    def test_is_starred_required(self):
+        with self.assertRaises(ValidationError) as cm:
+            FileBulkStarredChangeRequest(file_ids=[1])
+
+        error = cm.exception.errors()[0]
+        self.assertEqual(error["loc"], ("is_starred",))
+        self.assertEqual(error["type"], "missing")
+
+
+class TestFileBulkStarredErrors(unittest.TestCase):
+
+    def test_error_codes(self):
+        self.assertEqual(
+            set(FILE_BULK_STARRED_ERRORS),
+            {401, 403, 422, 503},
+        )
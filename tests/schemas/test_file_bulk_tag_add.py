@@ -0,0 +1,41 @@
+# tests/schemas/test_file_bulk_tag_add.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from pydantic import ValidationError
+
+from app.schemas.file_bulk_tag_add import (
+    FILE_BULK_TAG_ADD_ERRORS,
+    FileBulkTagAddRequest,
+)
+
+
+class TestFileBulkTagAddRequest(unittest.TestCase):
+
+    def test_accepts_valid_payload(self):
+        req = FileBulkTagAddRequest(file_ids=[1, 2], tag="important")
+
+        self.assertEqual(req.file_ids, [1, 2])
+        self.assertEqual(req.tag, "important")
+
+    def test_normalizes_tag(self):
+        req = FileBulkTagAddRequest(file_ids=[1], tag="  Important  ")
+
+        self.assertEqual(req.tag, "important")
+
+    def test_tag_required(self):
+        with self.assertRaises(ValidationError) as cm:
+            FileBulkTagAddRequest(file_ids=[1])
+
+        error = cm.exception.errors()[0]
+        self.assertEqual(error["loc"], ("tag",))
+        self.assertEqual(error["type"], "missing")
+
+
+class TestFileBulkTagAddErrors(unittest.TestCase):
+
+    def test_error_codes(self):
+        self.assertEqual(
+            set(FILE_BULK_TAG_ADD_ERRORS),
+            {401, 403, 422, 503},
+        )
@@ -0,0 +1,44 @@
+# tests/schemas/test_file_import.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from pydantic import ValidationError
+
+from app.schemas.file_import import (
+    FILE_IMPORT_ERRORS,
+    FileImportResponse,
+    FileImportResult,
+    FileImportStatus,
+)
+
+
+class TestFileImportResult(unittest.TestCase):
+
+    def test_ids_default_to_none(self):
+        result = FileImportResult(path="a.txt", status="invalid")
+
+        self.assertEqual(result.status, FileImportStatus.INVALID)
+        self.assertIsNone(result.folder_id)
+        self.assertIsNone(result.file_id)
+
+    def test_unknown_status_rejected(self):
+        with self.assertRaises(ValidationError):
+            FileImportResult(path="a.txt", status="ok")
+
+    def test_response_serializes_statuses(self):
+        response = FileImportResponse(results=[
+            FileImportResult(path="a.txt", status="created", file_id=3),
+        ])
+
+        self.assertEqual(response.model_dump(mode="json"), {
+            "results": [{
+                "path": "a.txt",
+                "status": "created",
+                "folder_id": None,
+                "file_id": 3,
+            }],
+        })
+
+    def test_errors_document_lock_and_limit_statuses(self):
+        self.assertIn(409, FILE_IMPORT_ERRORS)
+        self.assertIn(423, FILE_IMPORT_ERRORS)
@@ -0,0 +1,105 @@
+# tests/schemas/test_file_patch.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+
+from pydantic import ValidationError
+
+from app.constants import FILE_PATCH_MAX_RANGES
+from app.schemas.file_patch import (
+    FilePatchRequest,
+    FilePatchResponse,
+)
+
+CHECKSUM = "a" * 64
+
+
+class TestFilePatchRequest(unittest.TestCase):
+
+    def _request(self, patches, **kwargs):
+        return FilePatchRequest(
+            base_checksum=CHECKSUM, patches=patches, **kwargs,
+        )
+
+    def test_accepts_ordered_ranges_and_defaults_to_lines(self):
+        req = self._request([
+            {"start": 0, "end": 1, "content": "first\n"},
+            {"start": 1, "end": 1, "content": "inserted\n"},
+            {"start": 5, "end": 7, "content": ""},
+        ])
+
+        self.assertEqual(req.unit, "line")
+        self.assertEqual([p.start for p in req.patches], [0, 1, 5])
+
+    def test_accepts_byte_unit(self):
+        req = self._request(
+            [{"start": 3, "end": 4, "content": "x"}], unit="byte",
+        )
+
+        self.assertEqual(req.unit, "byte")
+
+    def test_rejects_overlapping_ranges(self):
+        with self.assertRaises(ValidationError) as cm:
+            self._request([
+                {"start": 0, "end": 3, "content": "a"},
+                {"start": 2, "end": 4, "content": "b"},
+            ])
+
+        error = cm.exception.errors()[0]
+        self.assertEqual(error["loc"], ("patches",))
+        self.assertEqual(error["type"], "value_ranges_invalid")
+
+    def test_rejects_range_ending_before_start(self):
+        with self.assertRaises(ValidationError) as cm:
+            self._request([{"start": 4, "end": 2, "content": "a"}])
+
+        self.assertEqual(
+            cm.exception.errors()[0]["type"], "value_ranges_invalid",
+        )
+
+    def test_rejects_negative_offset(self):
+        with self.assertRaises(ValidationError) as cm:
+            self._request([{"start": -1, "end": 2, "content": "a"}])
+
+        error = cm.exception.errors()[0]
+        self.assertEqual(error["loc"], ("patches", 0, "start"))
+
+    def test_rejects_empty_and_too_long_patch_list(self):
+        patch = {"start": 0, "end": 0, "content": ""}
+        for patches in ([], [patch] * (FILE_PATCH_MAX_RANGES + 1)):
+            with self.subTest(count=len(patches)):
+                with self.assertRaises(ValidationError):
+                    self._request(patches)
+
+    def test_rejects_invalid_base_checksum(self):
+        with self.assertRaises(ValidationError) as cm:
+            FilePatchRequest(
+                base_checksum="ABC",
+                patches=[{"start": 0, "end": 0, "content": ""}],
+            )
+
+        error = cm.exception.errors()[0]
+        self.assertEqual(error["loc"], ("base_checksum",))
+
+    def test_rejects_unknown_unit(self):
+        with self.assertRaises(ValidationError):
+            self._request(
+                [{"start": 0, "end": 0, "content": ""}], unit="word",
+            )
+
+    def test_rejects_extra_field(self):
+        with self.assertRaises(ValidationError) as cm:
+            self._request(
+                [{"start": 0, "end": 0, "content": "", "other": 1}],
+            )
+
+        error = cm.exception.errors()[0]
+        self.assertEqual(error["type"], "extra_forbidden")
+
+
+class TestFilePatchResponse(unittest.TestCase):
+
+    def test_accepts_valid_payload_by_alias(self):
+        resp = FilePatchResponse(id=1)
+
+        self.assertEqual(resp.file_id, 1)
@@ -2,8 +2,9 @@
 # SPDX-License-Identifier: GPL-3.0-only
 
 import unittest
+from pydantic import ValidationError
 
-from app.schemas.folder_delete import FOLDER_DELETE_ERRORS
+from app.schemas.folder_delete import FOLDER_DELETE_ERRORS, FolderDeleteRequest
 
 
 class TestFolderDeleteErrors(unittest.TestCase):
@@ -13,3 +14,16 @@ class TestFolderDeleteErrors(unittest.TestCase):
             set(FOLDER_DELETE_ERRORS),
             {401, 403, 404, 409, 422, 423, 503},
         )
+
+
+class TestFolderDeleteRequest(unittest.TestCase):
+
+    def test_recursive_defaults_to_false(self):
+        self.assertIs(FolderDeleteRequest().recursive, False)
+
+    def test_accepts_recursive_flag(self):
+        self.assertIs(FolderDeleteRequest(recursive=True).recursive, True)
+
+    def test_extra_field_forbidden(self):
+        with self.assertRaises(ValidationError):
+            FolderDeleteRequest(recursive=True, other=1)
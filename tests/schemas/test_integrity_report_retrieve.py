@@ -0,0 +1,79 @@
+# tests/schemas/test_integrity_report_retrieve.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+
+from pydantic import ValidationError
+
+from app.schemas.integrity_report_retrieve import (
+    INTEGRITY_REPORT_RETRIEVE_ERRORS,
+    IntegrityReportResponse,
+)
+
+
+class TestIntegrityReportResponse(unittest.TestCase):
+
+    def _finding(self):
+        return {
+            "check": "orphan",
+            "resource_type": None,
+            "resource_id": None,
+            "path": "revisions/abc",
+            "detected_at": 2,
+        }
+
+    def test_validates_report_with_last_pass(self):
+        report = IntegrityReportResponse.model_validate({
+            "pass_number": 2,
+            "pass_started_at": 1,
+            "phase": "files",
+            "checked_count": 10,
+            "hashed_bytes": 100,
+            "findings_count": 1,
+            "findings": [self._finding()],
+            "last_pass": {
+                "pass_number": 1,
+                "started_at": 0,
+                "completed_at": 1,
+                "checked_count": 20,
+                "hashed_bytes": 200,
+                "findings_count": 0,
+                "findings": [],
+            },
+        })
+
+        self.assertEqual(report.findings[0].check, "orphan")
+        self.assertEqual(report.last_pass.pass_number, 1)
+
+    def test_defaults_for_scan_that_never_ran(self):
+        report = IntegrityReportResponse(
+            pass_number=0,
+            checked_count=0,
+            hashed_bytes=0,
+            findings_count=0,
+            findings=[],
+        )
+
+        self.assertIsNone(report.pass_started_at)
+        self.assertIsNone(report.phase)
+        self.assertIsNone(report.last_pass)
+
+    def test_forbids_extra_fields(self):
+        with self.assertRaises(ValidationError):
+            IntegrityReportResponse(
+                pass_number=0,
+                checked_count=0,
+                hashed_bytes=0,
+                findings_count=0,
+                findings=[],
+                position=0,
+            )
+
+
+class TestIntegrityReportRetrieveErrors(unittest.TestCase):
+
+    def test_openapi_error_map_has_expected_statuses(self):
+        self.assertEqual(
+            set(INTEGRITY_REPORT_RETRIEVE_ERRORS),
+            {401, 403, 503},
+        )
@@ -0,0 +1,36 @@
+# tests/schemas/test_metrics_history_retrieve.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+
+from pydantic import ValidationError
+
+from app.schemas.metrics_history_retrieve import (
+    METRICS_HISTORY_RETRIEVE_ERRORS,
+    MetricsHistoryRequest,
+)
+
+
+class TestMetricsHistoryRequest(unittest.TestCase):
+
+    def test_defaults(self):
+        self.assertEqual(MetricsHistoryRequest().minutes, 60)
+
+    def test_rejects_non_positive_minutes(self):
+        for value in (0, -1):
+            with self.subTest(value=value):
+                with self.assertRaises(ValidationError):
+                    MetricsHistoryRequest(minutes=value)
+
+    def test_forbids_extra_fields(self):
+        with self.assertRaises(ValidationError):
+            MetricsHistoryRequest(hours=1)
+
+
+class TestMetricsHistoryRetrieveErrors(unittest.TestCase):
+
+    def test_openapi_error_map_has_expected_statuses(self):
+        self.assertEqual(
+            set(METRICS_HISTORY_RETRIEVE_ERRORS),
+            {401, 403, 422, 503},
+        )
@@ -0,0 +1,43 @@
+# tests/schemas/test_revision_retention_estimate.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+
+from pydantic import ValidationError
+
+from app.schemas.revision_retention_estimate import (
+    REVISION_RETENTION_ESTIMATE_ERRORS,
+    RevisionRetentionEstimateResponse,
+)
+
+
+class TestRevisionRetentionEstimateResponse(unittest.TestCase):
+
+    def _estimate(self):
+        return {
+            "files_count": 2,
+            "revisions_count": 5,
+            "revisions_bytes": 500,
+            "expired_files_count": 1,
+            "expired_revisions_count": 3,
+            "expired_bytes": 300,
+        }
+
+    def test_validates_estimate(self):
+        estimate = RevisionRetentionEstimateResponse.model_validate(
+            self._estimate(),
+        )
+        self.assertEqual(estimate.expired_bytes, 300)
+
+    def test_rejects_extra_fields(self):
+        with self.assertRaises(ValidationError):
+            RevisionRetentionEstimateResponse.model_validate({
+                **self._estimate(),
+                "unexpected": 1,
+            })
+
+    def test_errors_cover_auth_and_unavailable(self):
+        self.assertEqual(
+            set(REVISION_RETENTION_ESTIMATE_ERRORS),
+            {401, 403, 503},
+        )
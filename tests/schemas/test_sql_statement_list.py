@@ -0,0 +1,43 @@
+# tests/schemas/test_sql_statement_list.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+
+from pydantic import ValidationError
+
+from app.constants import SQL_SLOW_MAX_STATEMENTS
+from app.schemas.sql_statement_list import (
+    SQL_STATEMENT_LIST_ERRORS,
+    SqlStatementListRequest,
+)
+
+
+class TestSqlStatementListRequest(unittest.TestCase):
+
+    def test_defaults(self):
+        params = SqlStatementListRequest()
+        self.assertEqual(params.limit, 20)
+        self.assertEqual(params.order_by, "total_seconds")
+
+    def test_rejects_limit_out_of_range(self):
+        for value in (0, SQL_SLOW_MAX_STATEMENTS + 1):
+            with self.subTest(value=value):
+                with self.assertRaises(ValidationError):
+                    SqlStatementListRequest(limit=value)
+
+    def test_rejects_unknown_order_by(self):
+        with self.assertRaises(ValidationError):
+            SqlStatementListRequest(order_by="statement")
+
+    def test_forbids_extra_fields(self):
+        with self.assertRaises(ValidationError):
+            SqlStatementListRequest(offset=10)
+
+
+class TestSqlStatementListErrors(unittest.TestCase):
+
+    def test_openapi_error_map_has_expected_statuses(self):
+        self.assertEqual(
+            set(SQL_STATEMENT_LIST_ERRORS),
+            {401, 403, 422, 503},
+        )
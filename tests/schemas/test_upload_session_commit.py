@@ -0,0 +1,17 @@
+# tests/schemas/test_upload_session_commit.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from types import SimpleNamespace
+
+from app.schemas.upload_session_commit import UploadSessionCommitResponse
+
+
+class TestUploadSessionCommitResponse(unittest.TestCase):
+
+    def test_maps_id_to_file_id(self):
+        response = UploadSessionCommitResponse.model_validate(
+            SimpleNamespace(id=10),
+        )
+
+        self.assertEqual(response.file_id, 10)
@@ -0,0 +1,48 @@
+# tests/schemas/test_upload_session_create.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from types import SimpleNamespace
+
+from pydantic import ValidationError
+
+from app.schemas.upload_session_create import (
+    UploadSessionCreateRequest,
+    UploadSessionCreateResponse,
+)
+
+
+class TestUploadSessionCreateRequest(unittest.TestCase):
+
+    def test_accepts_filename_and_filesize(self):
+        req = UploadSessionCreateRequest(filename="a.bin", filesize=0)
+
+        self.assertEqual(req.filename, "a.bin")
+        self.assertEqual(req.filesize, 0)
+
+    def test_rejects_invalid_values(self):
+        cases = [
+            {"filename": "", "filesize": 1},
+            {"filename": "../a.bin", "filesize": 1},
+            {"filename": "a/b.bin", "filesize": 1},
+            {"filename": "a.bin", "filesize": -1},
+            {"filename": "a.bin"},
+            {"filename": "a.bin", "filesize": 1, "extra": 1},
+        ]
+        for data in cases:
+            with self.subTest(data=data):
+                with self.assertRaises(ValidationError):
+                    UploadSessionCreateRequest(**data)
+
+
+class TestUploadSessionCreateResponse(unittest.TestCase):
+
+    def test_maps_upload_uuid_to_upload_id(self):
+        response = UploadSessionCreateResponse.model_validate(
+            SimpleNamespace(upload_uuid="uuid-1", expires_at=100),
+        )
+
+        self.assertEqual(
+            response.model_dump(),
+            {"upload_id": "uuid-1", "expires_at": 100},
+        )
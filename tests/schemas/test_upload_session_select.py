@@ -0,0 +1,33 @@
+# tests/schemas/test_upload_session_select.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from types import SimpleNamespace
+
+from app.schemas.upload_session_select import UploadSessionSelectResponse
+
+
+class TestUploadSessionSelectResponse(unittest.TestCase):
+
+    def test_maps_session_attributes(self):
+        response = UploadSessionSelectResponse.model_validate(
+            SimpleNamespace(
+                upload_uuid="uuid-1",
+                folder_id=2,
+                filename="a.bin",
+                filesize=8,
+                ranges=[(0, 4)],
+                created_at=50,
+                expires_at=100,
+            ),
+        )
+
+        self.assertEqual(response.model_dump(mode="json"), {
+            "upload_id": "uuid-1",
+            "folder_id": 2,
+            "filename": "a.bin",
+            "filesize": 8,
+            "received_ranges": [[0, 4]],
+            "created_at": 50,
+            "expires_at": 100,
+        })
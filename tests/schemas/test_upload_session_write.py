@@ -0,0 +1,37 @@
+# tests/schemas/test_upload_session_write.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from types import SimpleNamespace
+
+from pydantic import ValidationError
+
+from app.schemas.upload_session_write import (
+    UploadSessionWriteRequest,
+    UploadSessionWriteResponse,
+)
+
+
+class TestUploadSessionWriteRequest(unittest.TestCase):
+
+    def test_accepts_non_negative_offset(self):
+        self.assertEqual(UploadSessionWriteRequest(offset=0).offset, 0)
+
+    def test_rejects_negative_or_missing_offset(self):
+        for data in ({"offset": -1}, {}):
+            with self.subTest(data=data):
+                with self.assertRaises(ValidationError):
+                    UploadSessionWriteRequest(**data)
+
+
+class TestUploadSessionWriteResponse(unittest.TestCase):
+
+    def test_maps_ranges_to_received_ranges(self):
+        response = UploadSessionWriteResponse.model_validate(
+            SimpleNamespace(ranges=[(0, 4), (6, 8)], expires_at=100),
+        )
+
+        self.assertEqual(
+            response.model_dump(mode="json"),
+            {"received_ranges": [[0, 4], [6, 8]], "expires_at": 100},
+        )
@@ -0,0 +1,176 @@
+# tests/services/test_audit_archive.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import json
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.events import Events as E  # noqa: E402
+from app.models.audit import Audit  # noqa: E402
+from app.models.audit_segment import AuditSegment  # noqa: E402
+from app.services.audit_archive import archive_audit  # noqa: E402
+
+
+def _audit(audit_id: int, created_at: int = 100) -> Audit:
+    return Audit(
+        id=audit_id,
+        created_at=created_at,
+        created_by=audit_id % 2 or None,
+        event="event",
+        resource_id=10 + audit_id,
+    )
+
+
+class TestArchiveAudit(unittest.IsolatedAsyncioTestCase):
+
+    def _patches(self, repository, after_seconds=50, segment_rows=3):
+        session = MagicMock()
+        session_cm = MagicMock()
+        session_cm.__aenter__ = AsyncMock(return_value=session)
+        session_cm.__aexit__ = AsyncMock(return_value=False)
+        repository.session = session
+        repository.session.execute = AsyncMock()
+
+        config = MagicMock(
+            AUDIT_ARCHIVE_AFTER_SECONDS=after_seconds,
+            AUDIT_ARCHIVE_DIR="/mnt/audit",
+        )
+        return session, (
+            patch(
+                "app.services.audit_archive.get_config",
+                return_value=config,
+            ),
+            patch(
+                "app.models.audit_segment.get_config",
+                return_value=config,
+            ),
+            patch(
+                "app.services.audit_archive.AuditSessionLocal",
+                return_value=session_cm,
+            ),
+            patch(
+                "app.services.audit_archive.ORMRepository",
+                return_value=repository,
+            ),
+            patch("app.services.audit_archive.time.time", return_value=1000),
+            patch(
+                "app.services.audit_archive.AUDIT_SEGMENT_ROWS",
+                segment_rows,
+            ),
+        )
+
+    async def test_disabled_when_after_seconds_not_positive(self):
+        repository = AsyncMock()
+        _, patches = self._patches(repository, after_seconds=0)
+
+        with patches[0], patches[2] as session_local_mock:
+            await archive_audit()
+
+        session_local_mock.assert_not_called()
+
+    async def test_seals_full_segments_older_than_cutoff(self):
+        repository = AsyncMock()
+        repository.select_all = AsyncMock(side_effect=[
+            [_audit(1), _audit(2), _audit(3)],
+            [_audit(4), _audit(5)],
+        ])
+        session, patches = self._patches(repository)
+
+        with (
+            patches[0], patches[1], patches[2], patches[3], patches[4],
+            patches[5],
+            patch(
+                "app.services.audit_archive.write_segment",
+                new_callable=AsyncMock,
+                return_value=(123, "a" * 64),
+            ) as write_mock,
+            self.assertLogs("app.services.audit_archive", level="INFO") as cm,
+        ):
+            await archive_audit()
+
+        segment = repository.insert.await_args.args[0]
+        self.assertIsInstance(segment, AuditSegment)
+        self.assertEqual(segment.rows_count, 3)
+        self.assertEqual((segment.min_id, segment.max_id), (1, 3))
+        self.assertEqual((segment.min_created_by, segment.max_created_by),
+                         (1, 1))
+        self.assertEqual(
+            (segment.min_resource_id, segment.max_resource_id), (11, 13),
+        )
+        self.assertEqual(segment.filesize, 123)
+        self.assertEqual(segment.checksum, "a" * 64)
+        self.assertEqual(
+            json.loads(segment.summary),
+            [["event", None, 1, 2], ["event", None, None, 1]],
+        )
+
+        write_mock.assert_awaited_once()
+        self.assertEqual(
+            write_mock.await_args.args[0],
+            "/mnt/audit/" + segment.segment_uuid,
+        )
+        repository.session.execute.assert_awaited_once()
+        repository.commit.assert_awaited_once_with()
+        session.expunge_all.assert_called_once_with()
+        self.assertTrue(
+            any(E.AUDIT_ARCHIVE_SEGMENT_SEALED in line for line in cm.output)
+        )
+
+    async def test_stops_at_rows_newer_than_cutoff(self):
+        repository = AsyncMock()
+        repository.select_all = AsyncMock(return_value=[
+            _audit(1), _audit(2), _audit(3, created_at=990),
+        ])
+        _, patches = self._patches(repository)
+
+        with (
+            patches[0], patches[1], patches[2], patches[3], patches[4],
+            patches[5],
+            patch(
+                "app.services.audit_archive.write_segment",
+                new_callable=AsyncMock,
+            ) as write_mock,
+            self.assertLogs("app.services.audit_archive", level="INFO"),
+        ):
+            await archive_audit()
+
+        write_mock.assert_not_awaited()
+        repository.insert.assert_not_awaited()
+
+    async def test_rolls_back_and_removes_file_on_commit_failure(self):
+        repository = AsyncMock()
+        repository.select_all = AsyncMock(return_value=[
+            _audit(1), _audit(2), _audit(3),
+        ])
+        repository.commit = AsyncMock(side_effect=RuntimeError("db"))
+        _, patches = self._patches(repository)
+
+        with (
+            patches[0], patches[1], patches[2], patches[3], patches[4],
+            patches[5],
+            patch(
+                "app.services.audit_archive.write_segment",
+                new_callable=AsyncMock,
+                return_value=(1, "b" * 64),
+            ),
+            patch(
+                "app.services.audit_archive.delete_file",
+                new_callable=AsyncMock,
+            ) as delete_mock,
+            self.assertLogs("app.services.audit_archive", level="INFO") as cm,
+        ):
+            with self.assertRaises(RuntimeError):
+                await archive_audit()
+
+        segment = repository.insert.await_args.args[0]
+        repository.rollback.assert_awaited_once_with()
+        delete_mock.assert_awaited_once_with(
+            "/mnt/audit/" + segment.segment_uuid,
+        )
+        self.assertTrue(
+            any(E.AUDIT_ARCHIVE_FAILED in line for line in cm.output)
+        )
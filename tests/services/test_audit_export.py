@@ -0,0 +1,153 @@
+# tests/services/test_audit_export.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import json
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.constants import AUDIT_EXPORT_BATCH_ROWS  # noqa: E402
+from app.events import Events as E  # noqa: E402
+from app.models.audit import Audit  # noqa: E402
+from app.models.audit_segment import AuditSegment  # noqa: E402
+from app.schemas.audit_export import AuditExportRequest  # noqa: E402
+from app.services.audit_export import export_audit  # noqa: E402
+
+
+def _audit(audit_id: int, event: str = "user_login:completed") -> Audit:
+    return Audit(id=audit_id, created_at=100 + audit_id, event=event)
+
+
+def _session_local() -> MagicMock:
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=MagicMock())
+    session_cm.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=session_cm)
+
+
+async def _collect(chunks) -> list[dict]:
+    data = b"".join([chunk async for chunk in chunks])
+    return [json.loads(line) for line in data.decode().splitlines()]
+
+
+class TestExportAudit(unittest.IsolatedAsyncioTestCase):
+
+    async def test_emits_hook_before_streaming(self):
+        session = AsyncMock()
+        session_local = _session_local()
+
+        with (
+            patch(
+                "app.services.audit_export.AuditSessionLocal",
+                session_local,
+            ),
+            patch(
+                "app.services.audit_export.hooks.emit",
+                new_callable=AsyncMock,
+            ) as emit_mock,
+            self.assertLogs("app.services.audit_export", level="INFO"),
+        ):
+            await export_audit(session, AuditExportRequest())
+
+        emit_mock.assert_awaited_once_with(
+            E.AUDIT_EXPORT_COMPLETED, session, None,
+        )
+        session_local.assert_not_called()
+
+    async def test_streams_segments_then_live_rows_by_id_cursor(self):
+        segment = AuditSegment(id=1, segment_uuid="seg", checksum="c",
+                               min_id=1, max_id=3)
+        repository = AsyncMock()
+        repository.select_all = AsyncMock(side_effect=[
+            [segment],
+            [],
+            [_audit(4), _audit(5)],
+            [],
+            [],
+        ])
+
+        with (
+            patch(
+                "app.services.audit_export.AuditSessionLocal",
+                _session_local(),
+            ),
+            patch(
+                "app.services.audit_export.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.audit_export.read_segment",
+                new_callable=AsyncMock,
+                return_value=[
+                    _audit(1), _audit(2, "file_upload:completed"), _audit(3),
+                ],
+            ),
+            patch(
+                "app.services.audit_export.hooks.emit",
+                new_callable=AsyncMock,
+            ),
+            self.assertLogs("app.services.audit_export", level="INFO") as cm,
+        ):
+            chunks = await export_audit(
+                AsyncMock(),
+                AuditExportRequest(event__ilike="LOGIN", after_id=1),
+            )
+            rows = await _collect(chunks)
+
+        self.assertEqual([row["audit_id"] for row in rows], [3, 4, 5])
+        self.assertEqual(rows[0]["event"], "user_login:completed")
+
+        calls = repository.select_all.await_args_list
+        self.assertEqual(calls[0].kwargs["max_id__gt"], 1)
+        self.assertEqual(calls[1].kwargs["max_id__gt"], 3)
+        self.assertEqual(calls[2].args, (Audit,))
+        self.assertEqual(calls[2].kwargs["id__gt"], 3)
+        self.assertEqual(calls[2].kwargs["event__ilike"], "%LOGIN%")
+        self.assertEqual(
+            calls[2].kwargs["limit"], AUDIT_EXPORT_BATCH_ROWS,
+        )
+        self.assertEqual(calls[4].kwargs["id__gt"], 5)
+        self.assertTrue(
+            any(E.AUDIT_EXPORT_STREAMED in line for line in cm.output)
+        )
+
+    async def test_corrupted_segment_fails_stream(self):
+        segment = AuditSegment(id=1, segment_uuid="seg", checksum="c",
+                               min_id=1, max_id=3)
+        repository = AsyncMock()
+        repository.select_all = AsyncMock(return_value=[segment])
+
+        with (
+            patch(
+                "app.services.audit_export.AuditSessionLocal",
+                _session_local(),
+            ),
+            patch(
+                "app.services.audit_export.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.audit_export.read_segment",
+                new_callable=AsyncMock,
+                side_effect=ValueError("Audit segment checksum mismatch"),
+            ),
+            patch(
+                "app.services.audit_export.hooks.emit",
+                new_callable=AsyncMock,
+            ),
+            self.assertLogs("app.services.audit_export", level="INFO") as cm,
+        ):
+            chunks = await export_audit(AsyncMock(), AuditExportRequest())
+            with self.assertRaises(ValueError):
+                await _collect(chunks)
+
+        self.assertTrue(
+            any(E.AUDIT_SEGMENT_CHECKSUM_MISMATCH in line
+                for line in cm.output)
+        )
+        self.assertTrue(
+            any(E.AUDIT_EXPORT_FAILED in line for line in cm.output)
+        )
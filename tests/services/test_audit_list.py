@@ -1,6 +1,7 @@
 # tests/services/test_audit_list.py
 # SPDX-License-Identifier: GPL-3.0-only
 
+import json
 import unittest
 from unittest.mock import AsyncMock, patch
 
@@ -11,14 +12,42 @@ from tests.helpers import set_minimal_app_config_env
 set_minimal_app_config_env()
 
 from app.events import Events as E  # noqa: E402
+from app.errors import InternalServerError, ValueInvalidError  # noqa: E402
 from app.models.audit import Audit  # noqa: E402
+from app.models.audit_segment import AuditSegment  # noqa: E402
 from app.schemas.audit_list import AuditListRequest  # noqa: E402
 from app.services.audit_list import list_audit  # noqa: E402
 
 
+def _audit(audit_id: int, created_at: int, event: str = "x") -> Audit:
+    return Audit(id=audit_id, created_at=created_at, event=event)
+
+
+def _segment(
+    segment_id: int,
+    min_id: int,
+    max_id: int,
+    min_created_at: int,
+    max_created_at: int,
+    summary: list | None = None,
+) -> AuditSegment:
+    return AuditSegment(
+        summary=None if summary is None else json.dumps(summary),
+        id=segment_id,
+        segment_uuid=f"seg-{segment_id}",
+        checksum=f"c{segment_id}",
+        rows_count=max_id - min_id + 1,
+        min_id=min_id,
+        max_id=max_id,
+        min_created_at=min_created_at,
+        max_created_at=max_created_at,
+    )
+
+
 class TestListAudit(unittest.IsolatedAsyncioTestCase):
     async def test_logs_audit_list_succeeded_after_fetch(self):
         session = AsyncMock()
+        audit_session = AsyncMock()
         params = AuditListRequest()
 
         repository = AsyncMock()
@@ -29,17 +58,23 @@ class TestListAudit(unittest.IsolatedAsyncioTestCase):
             patch(
                 "app.services.audit_list.ORMRepository",
                 return_value=repository,
-            ),
+            ) as repository_cls,
             patch(
                 "app.services.audit_list.hooks.emit",
                 new_callable=AsyncMock,
             ) as emit_mock,
             self.assertLogs("app.services.audit_list", level="INFO") as log_cm,
         ):
-            audit, audit_count = await list_audit(session, params)
+            audit, audit_count, is_exact = await list_audit(
+                session,
+                audit_session,
+                params,
+            )
 
         self.assertEqual(audit, [])
+        repository_cls.assert_called_once_with(audit_session)
         self.assertEqual(audit_count, 0)
+        self.assertTrue(is_exact)
         emit_mock.assert_awaited_once_with(
             E.AUDIT_LIST_COMPLETED,
             session,
@@ -55,6 +90,7 @@ class TestListAudit(unittest.IsolatedAsyncioTestCase):
 
     async def test_wraps_event_ilike_filter_before_repository_calls(self):
         session = AsyncMock()
+        audit_session = AsyncMock()
         params = AuditListRequest(event__ilike="login")
 
         repository = AsyncMock()
@@ -72,7 +108,7 @@ class TestListAudit(unittest.IsolatedAsyncioTestCase):
             ),
             self.assertLogs("app.services.audit_list", level="INFO"),
         ):
-            await list_audit(session, params)
+            await list_audit(session, audit_session, params)
 
         expected_filters = params.model_dump(exclude_none=True)
         expected_filters["event__ilike"] = "%login%"
@@ -81,7 +117,401 @@ class TestListAudit(unittest.IsolatedAsyncioTestCase):
             Audit,
             **expected_filters,
         )
-        repository.select_all.assert_awaited_once_with(
+        repository.select_all.assert_awaited_with(
             Audit,
             **expected_filters,
         )
+
+    async def test_prunes_segments_by_min_max_bounds(self):
+        params = AuditListRequest(
+            created_at__ge=10,
+            created_at__le=20,
+            created_by__eq=3,
+            resource_id__eq=4,
+        )
+
+        repository = AsyncMock()
+        repository.count_all = AsyncMock(return_value=0)
+        repository.select_all = AsyncMock(return_value=[])
+
+        with (
+            patch(
+                "app.services.audit_list.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.audit_list.hooks.emit",
+                new_callable=AsyncMock,
+            ),
+            self.assertLogs("app.services.audit_list", level="INFO"),
+        ):
+            await list_audit(AsyncMock(), AsyncMock(), params)
+
+        repository.select_all.assert_any_await(
+            AuditSegment,
+            max_created_at__ge=10,
+            min_created_at__le=20,
+            min_created_by__le=3,
+            max_created_by__ge=3,
+            min_resource_id__le=4,
+            max_resource_id__ge=4,
+            order_by="min_id",
+            order="asc",
+        )
+
+    async def test_merges_hot_and_archived_rows(self):
+        params = AuditListRequest(
+            event__ilike="LOG",
+            order_by="created_at",
+            order="desc",
+            offset=1,
+            limit=2,
+        )
+        segment = _segment(1, 1, 3, 20, 60)
+        hot = [_audit(9, 90, "login"), _audit(8, 30, "logout")]
+        archived = [
+            _audit(1, 50, "login"),
+            _audit(2, 60, "upload"),
+            _audit(3, 20, "logout"),
+        ]
+
+        repository = AsyncMock()
+        repository.count_all = AsyncMock(return_value=2)
+        repository.select_all = AsyncMock(
+            side_effect=[[segment], [hot[1]], hot],
+        )
+
+        with (
+            patch(
+                "app.services.audit_list.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.audit_list.read_segment",
+                new_callable=AsyncMock,
+                return_value=archived,
+            ) as read_mock,
+            patch(
+                "app.services.audit_list.hooks.emit",
+                new_callable=AsyncMock,
+            ),
+            self.assertLogs("app.services.audit_list", level="INFO"),
+        ):
+            audit, audit_count, is_exact = await list_audit(
+                AsyncMock(), AsyncMock(), params,
+            )
+
+        read_mock.assert_awaited_once_with(segment.absolute_path, "c1")
+        self.assertEqual([a.id for a in audit], [1, 8])
+        self.assertEqual(audit_count, 4)
+        self.assertEqual(
+            repository.select_all.await_args_list[2].kwargs["offset"], 0,
+        )
+        self.assertEqual(
+            repository.select_all.await_args_list[2].kwargs["limit"], 3,
+        )
+
+    async def test_raises_internal_error_on_corrupted_segment(self):
+        segment = _segment(1, 1, 3, 10, 20)
+
+        repository = AsyncMock()
+        repository.count_all = AsyncMock(return_value=0)
+        repository.select_all = AsyncMock(side_effect=[[segment], []])
+
+        with (
+            patch(
+                "app.services.audit_list.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.audit_list.read_segment",
+                new_callable=AsyncMock,
+                side_effect=ValueError("Audit segment checksum mismatch"),
+            ),
+            self.assertLogs("app.services.audit_list", level="INFO") as cm,
+        ):
+            with self.assertRaises(InternalServerError):
+                await list_audit(AsyncMock(), AsyncMock(), AuditListRequest())
+
+        self.assertTrue(
+            any(E.AUDIT_SEGMENT_CHECKSUM_MISMATCH in line
+                for line in cm.output)
+        )
+
+    async def test_decodes_only_segments_overlapping_the_page(self):
+        params = AuditListRequest(
+            order_by="id", order="desc", offset=3, limit=2,
+        )
+        segments = [
+            _segment(1, 1, 3, 10, 12),
+            _segment(2, 4, 6, 13, 15),
+            _segment(3, 7, 9, 16, 18),
+        ]
+
+        repository = AsyncMock()
+        repository.count_all = AsyncMock(return_value=2)
+        repository.select_all = AsyncMock(side_effect=[segments])
+
+        with (
+            patch(
+                "app.services.audit_list.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.audit_list.read_segment",
+                new_callable=AsyncMock,
+                return_value=[_audit(7, 16), _audit(8, 17), _audit(9, 18)],
+            ) as read_mock,
+            patch(
+                "app.services.audit_list.hooks.emit",
+                new_callable=AsyncMock,
+            ),
+            self.assertLogs("app.services.audit_list", level="INFO"),
+        ):
+            audit, audit_count, is_exact = await list_audit(
+                AsyncMock(), AsyncMock(), params,
+            )
+
+        # Live rows 11 and 10 come first, then segment 3 holds the page.
+        read_mock.assert_awaited_once_with(segments[2].absolute_path, "c3")
+        repository.select_all.assert_awaited_once()
+        self.assertEqual([a.id for a in audit], [8, 7])
+        self.assertEqual(audit_count, 11)
+
+    async def test_reads_live_rows_of_page_with_local_offset(self):
+        params = AuditListRequest(
+            order_by="created_at", order="asc", offset=4, limit=2,
+        )
+        segments = [_segment(1, 1, 3, 10, 12)]
+        live = [_audit(5, 13), _audit(6, 14)]
+
+        repository = AsyncMock()
+        repository.count_all = AsyncMock(return_value=5)
+        repository.select_all = AsyncMock(
+            side_effect=[segments, [live[0]], live],
+        )
+
+        with (
+            patch(
+                "app.services.audit_list.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.audit_list.read_segment",
+                new_callable=AsyncMock,
+            ) as read_mock,
+            patch(
+                "app.services.audit_list.hooks.emit",
+                new_callable=AsyncMock,
+            ),
+            self.assertLogs("app.services.audit_list", level="INFO"),
+        ):
+            audit, audit_count, is_exact = await list_audit(
+                AsyncMock(), AsyncMock(), params,
+            )
+
+        read_mock.assert_not_awaited()
+        self.assertEqual(audit, live)
+        self.assertEqual(audit_count, 8)
+        self.assertEqual(
+            repository.select_all.await_args_list[2].kwargs,
+            {**params.model_dump(exclude_none=True), "offset": 1, "limit": 2},
+        )
+
+    async def test_counts_filtered_segments_from_summaries(self):
+        params = AuditListRequest(
+            event__ilike="login", order_by="id", order="asc", limit=1,
+        )
+        segments = [
+            _segment(1, 1, 2, 10, 11, [
+                ["login", None, None, 1], ["upload", None, None, 1],
+            ]),
+            _segment(2, 3, 4, 12, 13, [["login", None, None, 2]]),
+        ]
+        rows = {
+            "c1": [_audit(1, 10, "login"), _audit(2, 11, "upload")],
+            "c2": [_audit(3, 12, "login"), _audit(4, 13, "login")],
+        }
+
+        repository = AsyncMock()
+        repository.count_all = AsyncMock(return_value=0)
+        repository.select_all = AsyncMock(side_effect=[segments])
+
+        with (
+            patch(
+                "app.services.audit_list.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.audit_list.read_segment",
+                new_callable=AsyncMock,
+                side_effect=lambda path, checksum: rows[checksum],
+            ) as read_mock,
+            patch(
+                "app.services.audit_list.hooks.emit",
+                new_callable=AsyncMock,
+            ),
+            self.assertLogs("app.services.audit_list", level="INFO"),
+        ):
+            audit, audit_count, is_exact = await list_audit(
+                AsyncMock(), AsyncMock(), params,
+            )
+
+        read_mock.assert_awaited_once_with(segments[0].absolute_path, "c1")
+        self.assertEqual([a.id for a in audit], [1])
+        self.assertEqual(audit_count, 3)
+        self.assertTrue(is_exact)
+
+    async def test_leaves_undecidable_segments_past_page_uncounted(self):
+        params = AuditListRequest(
+            request_uuid__eq="req", order_by="id", order="asc", limit=1,
+        )
+        segments = [_segment(1, 1, 2, 10, 11), _segment(2, 3, 4, 12, 13)]
+        rows = [_audit(1, 10), _audit(2, 11)]
+        for audit_event in rows:
+            audit_event.request_uuid = "req"
+
+        repository = AsyncMock()
+        repository.count_all = AsyncMock(return_value=4)
+        repository.select_all = AsyncMock(side_effect=[segments])
+
+        with (
+            patch(
+                "app.services.audit_list.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.audit_list.read_segment",
+                new_callable=AsyncMock,
+                return_value=rows,
+            ) as read_mock,
+            patch(
+                "app.services.audit_list.hooks.emit",
+                new_callable=AsyncMock,
+            ),
+            self.assertLogs("app.services.audit_list", level="INFO"),
+        ):
+            audit, audit_count, is_exact = await list_audit(
+                AsyncMock(), AsyncMock(), params,
+            )
+
+        read_mock.assert_awaited_once_with(segments[0].absolute_path, "c1")
+        self.assertEqual([a.id for a in audit], [1])
+        self.assertEqual(audit_count, 6)
+        self.assertFalse(is_exact)
+
+    async def test_orders_by_summary_field_without_decoding_other_values(self):
+        params = AuditListRequest(
+            order_by="event", order="asc", offset=2, limit=2,
+        )
+        segments = [
+            _segment(1, 1, 3, 10, 12, [
+                ["a", None, None, 2], ["c", None, None, 1],
+            ]),
+            _segment(2, 4, 5, 13, 14, [
+                ["b", None, None, 1], ["c", None, None, 1],
+            ]),
+        ]
+        live = [_audit(9, 20, "b")]
+
+        repository = AsyncMock()
+        repository.count_all = AsyncMock(return_value=1)
+        repository.count_values = AsyncMock(return_value={"b": 1})
+        repository.select_all = AsyncMock(side_effect=[segments, live])
+
+        with (
+            patch(
+                "app.services.audit_list.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.audit_list.read_segment",
+                new_callable=AsyncMock,
+                return_value=[_audit(4, 13, "b"), _audit(5, 14, "c")],
+            ) as read_mock,
+            patch(
+                "app.services.audit_list.hooks.emit",
+                new_callable=AsyncMock,
+            ),
+            self.assertLogs("app.services.audit_list", level="INFO"),
+        ):
+            audit, audit_count, is_exact = await list_audit(
+                AsyncMock(), AsyncMock(), params,
+            )
+
+        # Values sort a, a, b (segment 2), b (live), c, c.
+        read_mock.assert_awaited_once_with(segments[1].absolute_path, "c2")
+        self.assertEqual([a.id for a in audit], [4, 9])
+        self.assertEqual(audit_count, 6)
+        self.assertTrue(is_exact)
+        self.assertEqual(
+            repository.select_all.await_args_list[1].kwargs,
+            {
+                **params.model_dump(exclude_none=True),
+                "event__eq": "b",
+                "order_by": "id",
+                "offset": 0,
+                "limit": 1,
+            },
+        )
+
+    async def test_rejects_order_by_field_without_summary(self):
+        repository = AsyncMock()
+        repository.count_all = AsyncMock(return_value=0)
+        repository.select_all = AsyncMock(
+            side_effect=[[_segment(1, 1, 2, 10, 11)]],
+        )
+
+        with (
+            patch(
+                "app.services.audit_list.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.audit_list.read_segment",
+                new_callable=AsyncMock,
+            ) as read_mock,
+            self.assertLogs("app.services.audit_list", level="INFO"),
+            self.assertRaises(ValueInvalidError),
+        ):
+            await list_audit(
+                AsyncMock(), AsyncMock(),
+                AuditListRequest(order_by="resource_id"),
+            )
+
+        read_mock.assert_not_awaited()
+
+    async def test_decodes_segment_partly_outside_created_at_bounds(self):
+        params = AuditListRequest(created_at__ge=12, order_by="id")
+        segments = [_segment(1, 1, 2, 11, 12), _segment(2, 3, 4, 13, 14)]
+        rows = {
+            "c1": [_audit(1, 11), _audit(2, 12)],
+            "c2": [_audit(3, 13), _audit(4, 14)],
+        }
+
+        repository = AsyncMock()
+        repository.count_all = AsyncMock(return_value=0)
+        repository.select_all = AsyncMock(side_effect=[segments])
+
+        with (
+            patch(
+                "app.services.audit_list.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.audit_list.read_segment",
+                new_callable=AsyncMock,
+                side_effect=lambda path, checksum: rows[checksum],
+            ),
+            patch(
+                "app.services.audit_list.hooks.emit",
+                new_callable=AsyncMock,
+            ),
+            self.assertLogs("app.services.audit_list", level="INFO"),
+        ):
+            audit, audit_count, is_exact = await list_audit(
+                AsyncMock(), AsyncMock(), params,
+            )
+
+        self.assertEqual([a.id for a in audit], [4, 3, 2])
+        self.assertEqual(audit_count, 3)
@@ -95,6 +95,7 @@ class TestCreateCipherdir(unittest.IsolatedAsyncioTestCase):
             ) as random_mock,
             patch(
                 "app.services.cipherdir_create.encrypt_passphrase",
+                new_callable=AsyncMock,
             ) as encrypt_mock,
             patch(
                 "app.services.cipherdir_create.generate_fernet_key",
@@ -282,6 +283,7 @@ class TestCreateCipherdir(unittest.IsolatedAsyncioTestCase):
             ) as random_mock,
             patch(
                 "app.services.cipherdir_create.encrypt_passphrase",
+                new_callable=AsyncMock,
                 return_value=b"encrypted-passphrase",
             ) as encrypt_mock,
             patch(
@@ -370,6 +372,7 @@ class TestCreateCipherdir(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.cipherdir_create.encrypt_passphrase",
+                new_callable=AsyncMock,
                 return_value=b"encrypted-passphrase",
             ),
             patch(
@@ -424,6 +427,7 @@ class TestCreateCipherdir(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.cipherdir_create.encrypt_passphrase",
+                new_callable=AsyncMock,
                 return_value=b"encrypted-passphrase",
             ),
             patch(
@@ -491,6 +495,7 @@ class TestCreateCipherdir(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.cipherdir_create.encrypt_passphrase",
+                new_callable=AsyncMock,
                 return_value=b"encrypted-passphrase",
             ),
             patch(
@@ -553,6 +558,7 @@ class TestCreateCipherdir(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.cipherdir_create.encrypt_passphrase",
+                new_callable=AsyncMock,
                 return_value=b"encrypted-passphrase",
             ),
             patch(
@@ -2,21 +2,25 @@
 # SPDX-License-Identifier: GPL-3.0-only
 
 import unittest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
-from app.constants import (
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.constants import (  # noqa: E402
     GOCRYPTFS_CIPHERDIR_LOCK_PATH,
     OBSCURED_VALUE,
 )
-from app.errors import (
+from app.errors import (  # noqa: E402
     ResourceConflictError,
     ResourceNotFoundError,
     TooManyRequestsError,
     ValueInvalidError,
 )
-from app.locks import LockType
-from app.services.cipherdir_mount import mount_cipherdir
-from app.events import Events as E
+from app.locks import LockType  # noqa: E402
+from app.services.cipherdir_mount import mount_cipherdir  # noqa: E402
+from app.events import Events as E  # noqa: E402
 
 
 class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
@@ -32,8 +36,25 @@ class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
             return_value=False,
         )
         self._rate_gate_mock = self._rate_gate_patcher.start()
+        self._replay_patcher = patch(
+            "app.services.cipherdir_mount.replay_intents",
+            new_callable=AsyncMock,
+        )
+        self.replay_mock = self._replay_patcher.start()
+        self._scheduler_patcher = patch(
+            "app.services.cipherdir_mount.scheduler",
+        )
+        self.scheduler_mock = self._scheduler_patcher.start()
+        self._background_check_patcher = patch(
+            "app.services.cipherdir_mount.check_db_integrity_in_background",
+            new_callable=MagicMock,
+        )
+        self.background_check_mock = self._background_check_patcher.start()
 
     def tearDown(self):
+        self._background_check_patcher.stop()
+        self._scheduler_patcher.stop()
+        self._replay_patcher.stop()
         self._rate_gate_patcher.stop()
         self.log_patcher.stop()
 
@@ -52,12 +73,17 @@ class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
         )
         config.SQLITE_DIR = "/fake/mountpoint/db"
         config.SQLITE_PATH = "/fake/mountpoint/db/hidden.sqlite"
+        config.SQLITE_AUDIT_PATH = "/fake/mountpoint/db/audit.sqlite"
         config.FILES_DIR = "/fake/mountpoint/files"
         config.FILES_REVISIONS_DIR = "/fake/mountpoint/files/revisions"
         config.FILES_THUMBNAILS_DIR = (
             "/fake/mountpoint/files/thumbnails"
         )
         config.FILES_TMP_DIR = "/fake/mountpoint/tmp"
+        config.AUDIT_ARCHIVE_DIR = "/fake/mountpoint/audit"
+        config.FILES_TRASH_DIR = "/fake/mountpoint/trash"
+        config.FILES_INTENTS_DIR = "/fake/mountpoint/intents"
+        config.FILES_UPLOADS_DIR = "/fake/mountpoint/uploads"
         return config
 
     async def test_raises_resource_not_found_when_cipherdir_uninitialized(
@@ -101,6 +127,7 @@ class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
             ) as mkdir_mock,
             patch(
                 "app.services.cipherdir_mount.decrypt_passphrase",
+                new_callable=AsyncMock,
             ) as decrypt_mock,
             patch(
                 "app.services.cipherdir_mount.mount_gocryptfs",
@@ -181,6 +208,7 @@ class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
             ) as mkdir_mock,
             patch(
                 "app.services.cipherdir_mount.decrypt_passphrase",
+                new_callable=AsyncMock,
             ) as decrypt_mock,
             patch(
                 "app.services.cipherdir_mount.mount_gocryptfs",
@@ -261,6 +289,7 @@ class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
             ) as mkdir_mock,
             patch(
                 "app.services.cipherdir_mount.decrypt_passphrase",
+                new_callable=AsyncMock,
             ) as decrypt_mock,
             patch(
                 "app.services.cipherdir_mount.mount_gocryptfs",
@@ -345,6 +374,7 @@ class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
             ) as mkdir_mock,
             patch(
                 "app.services.cipherdir_mount.decrypt_passphrase",
+                new_callable=AsyncMock,
                 side_effect=ValueError,
             ) as decrypt_mock,
             patch(
@@ -413,6 +443,10 @@ class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
                 True,
                 True,
                 True,
+                True,
+                True,
+                True,
+                True,
             ]
         )
 
@@ -451,6 +485,7 @@ class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
             ) as mkdir_mock,
             patch(
                 "app.services.cipherdir_mount.decrypt_passphrase",
+                new_callable=AsyncMock,
                 return_value=b"decrypted-passphrase",
             ) as decrypt_mock,
             patch(
@@ -503,7 +538,17 @@ class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
             mountpoint=config.GOCRYPTFS_MOUNTPOINT,
         )
         init_db_mock.assert_awaited_once()
-        integrity_mock.assert_awaited_once_with(config.SQLITE_PATH)
+        self.assertEqual(
+            integrity_mock.await_args_list,
+            [
+                call(config.SQLITE_PATH, quick=True),
+                call(config.SQLITE_AUDIT_PATH, quick=True),
+            ],
+        )
+        self.scheduler_mock.spawn.assert_called_once_with(
+            "db_integrity_check",
+            self.background_check_mock.return_value,
+        )
         unmount_mock.assert_not_awaited()
         emit_mock.assert_awaited_once_with(E.CIPHERDIR_MOUNT_COMPLETED)
 
@@ -519,6 +564,10 @@ class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
                 False,
                 True,
                 True,
+                True,
+                True,
+                True,
+                True,
             ]
         )
 
@@ -561,6 +610,7 @@ class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.cipherdir_mount.decrypt_passphrase",
+                new_callable=AsyncMock,
                 return_value=b"decrypted-passphrase",
             ),
             patch(
@@ -609,6 +659,10 @@ class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
                 False,
                 True,
                 True,
+                True,
+                True,
+                True,
+                True,
             ]
         )
 
@@ -655,6 +709,7 @@ class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.cipherdir_mount.decrypt_passphrase",
+                new_callable=AsyncMock,
                 return_value=b"decrypted-passphrase",
             ),
             patch(
@@ -708,6 +763,10 @@ class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
                 False,
                 False,
                 False,
+                False,
+                False,
+                False,
+                False,
             ]
         )
 
@@ -748,6 +807,7 @@ class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.cipherdir_mount.decrypt_passphrase",
+                new_callable=AsyncMock,
                 return_value=b"decrypted-passphrase",
             ) as decrypt_mock,
             patch(
@@ -803,9 +863,24 @@ class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
         mkdir_mock.assert_any_await(config.FILES_REVISIONS_DIR)
         mkdir_mock.assert_any_await(config.FILES_THUMBNAILS_DIR)
         mkdir_mock.assert_any_await(config.FILES_TMP_DIR)
-        self.assertEqual(mkdir_mock.await_count, 5)
+        mkdir_mock.assert_any_await(config.AUDIT_ARCHIVE_DIR)
+        mkdir_mock.assert_any_await(config.FILES_TRASH_DIR)
+        mkdir_mock.assert_any_await(config.FILES_INTENTS_DIR)
+        mkdir_mock.assert_any_await(config.FILES_UPLOADS_DIR)
+        self.assertEqual(mkdir_mock.await_count, 9)
         init_db_mock.assert_awaited_once()
-        integrity_mock.assert_awaited_once_with(config.SQLITE_PATH)
+        self.assertEqual(
+            integrity_mock.await_args_list,
+            [
+                call(config.SQLITE_PATH, quick=True),
+                call(config.SQLITE_AUDIT_PATH, quick=True),
+            ],
+        )
+        self.replay_mock.assert_awaited_once_with()
+        self.scheduler_mock.spawn.assert_called_once_with(
+            "db_integrity_check",
+            self.background_check_mock.return_value,
+        )
         unmount_mock.assert_not_awaited()
         emit_mock.assert_awaited_once_with(E.CIPHERDIR_MOUNT_COMPLETED)
 
@@ -821,6 +896,10 @@ class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
                 True,
                 True,
                 True,
+                True,
+                True,
+                True,
+                True,
             ]
         )
 
@@ -859,6 +938,7 @@ class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.cipherdir_mount.decrypt_passphrase",
+                new_callable=AsyncMock,
                 return_value=b"decrypted-passphrase",
             ),
             patch(
@@ -890,8 +970,10 @@ class TestMountCipherdir(unittest.IsolatedAsyncioTestCase):
                 await mount_cipherdir("master-password")
 
         self.assertIn("integrity check failed", str(cm.exception))
+        self.replay_mock.assert_not_awaited()
         mount_mock.assert_awaited_once()
         unmount_mock.assert_awaited_once_with(config.GOCRYPTFS_MOUNTPOINT)
+        self.scheduler_mock.spawn.assert_not_called()
         emit_mock.assert_not_awaited()
 
     async def test_raises_too_many_requests_when_rate_gate_blocks(self):
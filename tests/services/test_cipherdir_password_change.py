@@ -137,6 +137,7 @@ class TestChangeCipherdirPassword(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.cipherdir_password_change.decrypt_passphrase",
+                new_callable=AsyncMock,
                 side_effect=ValueError,
             ) as decrypt_mock,
             patch(
@@ -193,10 +194,12 @@ class TestChangeCipherdirPassword(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.cipherdir_password_change.decrypt_passphrase",
+                new_callable=AsyncMock,
                 return_value=b"plain",
             ) as decrypt_mock,
             patch(
                 "app.services.cipherdir_password_change.encrypt_passphrase",
+                new_callable=AsyncMock,
                 return_value=b"re-encrypted",
             ) as encrypt_mock,
             patch(
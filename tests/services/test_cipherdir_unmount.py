@@ -41,14 +41,24 @@ class TestUnmountCipherdir(unittest.IsolatedAsyncioTestCase):
         self._thumbnail_cache_patcher.start()
         self.addCleanup(self._thumbnail_cache_patcher.stop)
 
+        self.revision_cache_mock = MagicMock()
+        self._revision_cache_patcher = patch(
+            "app.services.cipherdir_unmount.get_revision_cache",
+            return_value=self.revision_cache_mock,
+        )
+        self._revision_cache_patcher.start()
+        self.addCleanup(self._revision_cache_patcher.stop)
+
         # app.db.engine calls get_config() at module level, so we cannot
         # patch it via unittest.mock.patch (the import itself would fail).
         # Instead, inject a fake module into sys.modules before the lazy
         # import inside unmount_cipherdir runs, then restore afterwards.
         self.engine_mock = MagicMock()
+        self.audit_engine_mock = MagicMock()
         self._original_engine_module = sys.modules.get("app.db.engine")
         fake_engine_module = types.ModuleType("app.db.engine")
         fake_engine_module.engine = self.engine_mock
+        fake_engine_module.audit_engine = self.audit_engine_mock
         sys.modules["app.db.engine"] = fake_engine_module
         self.addCleanup(self._restore_engine_module)
 
@@ -106,6 +116,7 @@ class TestUnmountCipherdir(unittest.IsolatedAsyncioTestCase):
             ) as read_mock,
             patch(
                 "app.services.cipherdir_unmount.decrypt_passphrase",
+                new_callable=AsyncMock,
             ) as decrypt_mock,
             patch(
                 "app.services.cipherdir_unmount.unmount_gocryptfs",
@@ -166,6 +177,7 @@ class TestUnmountCipherdir(unittest.IsolatedAsyncioTestCase):
             ) as read_mock,
             patch(
                 "app.services.cipherdir_unmount.decrypt_passphrase",
+                new_callable=AsyncMock,
             ) as decrypt_mock,
             patch(
                 "app.services.cipherdir_unmount.unmount_gocryptfs",
@@ -228,6 +240,7 @@ class TestUnmountCipherdir(unittest.IsolatedAsyncioTestCase):
             ) as read_mock,
             patch(
                 "app.services.cipherdir_unmount.decrypt_passphrase",
+                new_callable=AsyncMock,
             ) as decrypt_mock,
             patch(
                 "app.services.cipherdir_unmount.unmount_gocryptfs",
@@ -292,6 +305,7 @@ class TestUnmountCipherdir(unittest.IsolatedAsyncioTestCase):
             ) as read_mock,
             patch(
                 "app.services.cipherdir_unmount.decrypt_passphrase",
+                new_callable=AsyncMock,
                 side_effect=ValueError,
             ) as decrypt_mock,
             patch(
@@ -365,6 +379,7 @@ class TestUnmountCipherdir(unittest.IsolatedAsyncioTestCase):
             ) as read_mock,
             patch(
                 "app.services.cipherdir_unmount.decrypt_passphrase",
+                new_callable=AsyncMock,
                 return_value=b"decrypted-passphrase",
             ) as decrypt_mock,
             patch(
@@ -399,10 +414,12 @@ class TestUnmountCipherdir(unittest.IsolatedAsyncioTestCase):
             b"master-password",
         )
         self.engine_mock.sync_engine.dispose.assert_called_once_with()
+        self.audit_engine_mock.sync_engine.dispose.assert_called_once_with()
         unmount_mock.assert_awaited_once_with(
             mountpoint=config.GOCRYPTFS_MOUNTPOINT,
         )
         self.thumbnail_cache_mock.evict_all.assert_called_once_with()
+        self.revision_cache_mock.evict_all.assert_called_once_with()
         emit_mock.assert_awaited_once_with(E.CIPHERDIR_UNMOUNT_COMPLETED)
 
     async def test_engine_dispose_called_before_unmount_gocryptfs(self):
@@ -413,10 +430,16 @@ class TestUnmountCipherdir(unittest.IsolatedAsyncioTestCase):
         def record_dispose():
             call_order.append("dispose")
 
+        def record_audit_dispose():
+            call_order.append("audit_dispose")
+
         async def record_unmount(**_kwargs):
             call_order.append("unmount")
 
         self.engine_mock.sync_engine.dispose.side_effect = record_dispose
+        self.audit_engine_mock.sync_engine.dispose.side_effect = (
+            record_audit_dispose
+        )
 
         with (
             patch(
@@ -445,6 +468,7 @@ class TestUnmountCipherdir(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.cipherdir_unmount.decrypt_passphrase",
+                new_callable=AsyncMock,
                 return_value=b"decrypted-passphrase",
             ),
             patch(
@@ -458,7 +482,10 @@ class TestUnmountCipherdir(unittest.IsolatedAsyncioTestCase):
         ):
             await unmount_cipherdir("master-password")
 
-        self.assertEqual(call_order, ["dispose", "unmount"])
+        self.assertEqual(
+            call_order,
+            ["dispose", "audit_dispose", "unmount"],
+        )
 
     async def test_raises_too_many_requests_when_rate_gate_blocks(self):
         with patch(
@@ -0,0 +1,140 @@
+# tests/services/test_db_integrity_check.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.constants import LOCKDOWN_MODE_ENABLED_FLAG_PATH  # noqa: E402
+from app.events import Events as E  # noqa: E402
+from app.hooks import HookManager  # noqa: E402
+from app.services.db_integrity_check import (  # noqa: E402
+    check_db_integrity_in_background,
+)
+
+
+class TestCheckDbIntegrityInBackground(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        module = "app.services.db_integrity_check."
+        self.patchers = {
+            "get_config": patch(
+                module + "get_config",
+                return_value=MagicMock(SQLITE_PATH="/mnt/db/hidden.db"),
+            ),
+            "list_db_tables": patch(
+                module + "list_db_tables",
+                new=AsyncMock(return_value=["files", "users"]),
+            ),
+            "check_db_integrity": patch(
+                module + "check_db_integrity", new=AsyncMock(),
+            ),
+            "is_storage_available": patch(
+                module + "is_storage_available",
+                new=AsyncMock(return_value=True),
+            ),
+            "touch": patch(module + "touch", new=AsyncMock()),
+            "emit": patch(module + "hooks.emit", new=AsyncMock()),
+            "log": patch(module + "log"),
+        }
+        self.mocks = {
+            name: patcher.start() for name, patcher in self.patchers.items()
+        }
+        for patcher in self.patchers.values():
+            self.addCleanup(patcher.stop)
+
+    async def test_checks_every_table(self):
+        await check_db_integrity_in_background()
+
+        self.assertEqual(
+            self.mocks["check_db_integrity"].await_args_list,
+            [
+                call("/mnt/db/hidden.db", table="files"),
+                call("/mnt/db/hidden.db", table="users"),
+            ],
+        )
+        self.mocks["touch"].assert_not_awaited()
+        self.mocks["log"].info.assert_called_with(
+            "event=%s", E.DB_INTEGRITY_CHECK_COMPLETED,
+        )
+
+    async def test_enables_lockdown_when_table_corrupted(self):
+        self.mocks["check_db_integrity"].side_effect = RuntimeError(
+            "SQLite integrity check failed: row 3 missing from index"
+        )
+
+        await check_db_integrity_in_background()
+
+        self.mocks["check_db_integrity"].assert_awaited_once()
+        self.mocks["touch"].assert_awaited_once_with(
+            LOCKDOWN_MODE_ENABLED_FLAG_PATH,
+        )
+        self.mocks["emit"].assert_awaited_once_with(
+            E.DB_INTEGRITY_CHECK_FAILED,
+        )
+        self.mocks["log"].critical.assert_called_once()
+
+    async def test_stops_when_storage_becomes_unavailable(self):
+        self.mocks["is_storage_available"].side_effect = [True, False]
+
+        await check_db_integrity_in_background()
+
+        self.mocks["check_db_integrity"].assert_awaited_once_with(
+            "/mnt/db/hidden.db", table="files",
+        )
+        self.mocks["touch"].assert_not_awaited()
+        self.mocks["log"].info.assert_called_with(
+            "event=%s table=%s", E.DB_INTEGRITY_CHECK_INTERRUPTED, "users",
+        )
+
+    async def test_propagates_other_errors(self):
+        self.mocks["check_db_integrity"].side_effect = OSError("gone")
+
+        with self.assertRaises(OSError):
+            await check_db_integrity_in_background()
+
+        self.mocks["touch"].assert_not_awaited()
+
+
+class TestCheckDbIntegrityFailure(unittest.IsolatedAsyncioTestCase):
+
+    async def test_enables_lockdown_and_runs_registered_hooks(self):
+        module = "app.services.db_integrity_check."
+        hook_manager = HookManager()
+        hook = AsyncMock()
+        hook_manager.on(E.DB_INTEGRITY_CHECK_FAILED, hook)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            flag_path = os.path.join(tmp_dir, "lockdown-mode.lock")
+
+            with (
+                patch(
+                    module + "get_config",
+                    return_value=MagicMock(SQLITE_PATH="/mnt/db/hidden.db"),
+                ),
+                patch(
+                    module + "list_db_tables",
+                    new=AsyncMock(return_value=["files"]),
+                ),
+                patch(
+                    module + "check_db_integrity",
+                    new=AsyncMock(side_effect=RuntimeError("corrupted")),
+                ),
+                patch(
+                    module + "is_storage_available",
+                    new=AsyncMock(return_value=True),
+                ),
+                patch(module + "LOCKDOWN_MODE_ENABLED_FLAG_PATH", flag_path),
+                patch(module + "hooks", new=hook_manager),
+                patch(module + "log"),
+            ):
+                await check_db_integrity_in_background()
+
+            self.assertTrue(os.path.isfile(flag_path))
+
+        hook.assert_awaited_once_with(None, None)
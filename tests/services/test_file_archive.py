@@ -0,0 +1,284 @@
+# tests/services/test_file_archive.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.constants import FILES_ARCHIVE_MAX_ITEMS  # noqa: E402
+from app.errors import (  # noqa: E402
+    ResourceConflictError,
+    ResourceNotFoundError,
+)
+from app.events import Events as E  # noqa: E402
+from app.locks import LockType  # noqa: E402
+from app.models.file import File  # noqa: E402
+from app.models.folder import Folder  # noqa: E402
+from app.repositories.archive import (  # noqa: E402
+    ArchiveEntry,
+    TarArchive,
+    ZipArchive,
+)
+from app.schemas.file_archive import FileArchiveRequest  # noqa: E402
+from app.services import file_archive as svc  # noqa: E402
+
+
+def _folder(folder_id, dirname, parent_id=None):
+    folder = MagicMock(spec=Folder)
+    folder.id = folder_id
+    folder.dirname = dirname
+    folder.parent_id = parent_id
+    folder.created_at = 100
+    folder.updated_at = None
+    return folder
+
+
+def _file(file_id, folder_id, filename, mimetype="text/plain"):
+    file = MagicMock(spec=File)
+    file.id = file_id
+    file.folder_id = folder_id
+    file.filename = filename
+    file.filesize = 10
+    file.mimetype = mimetype
+    file.checksum = f"sum{file_id}"
+    file.created_at = 100
+    file.updated_at = 200
+    return file
+
+
+def _session_local(session):
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=session)
+    session_cm.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=session_cm)
+
+
+class TestArchiveFiles(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.session = AsyncMock()
+        self.repository = MagicMock(
+            select=AsyncMock(),
+            select_all=AsyncMock(),
+            select_subtree_ids=AsyncMock(),
+            select_parent_chain=AsyncMock(return_value=()),
+            count_all=AsyncMock(return_value=0),
+            commit=AsyncMock(),
+        )
+        self.write_audit = AsyncMock()
+        self.emit = AsyncMock()
+
+        patches = [
+            patch.object(svc, "ORMRepository", return_value=self.repository),
+            patch.object(svc, "write_audit", new=self.write_audit),
+            patch.object(svc.hooks, "emit", new=self.emit),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _setup_folder_tree(self):
+        root = _folder(1, "docs")
+        root.get_absolute_dir.return_value = "/mnt/files/home/docs"
+        child = _folder(2, "sub", parent_id=1)
+        files = [_file(10, 2, "b.txt"), _file(11, 1, "a.png", "image/png")]
+
+        self.repository.select.return_value = root
+        self.repository.select_subtree_ids.return_value = [(1, 0), (2, 1)]
+        self.repository.count_all.return_value = len(files)
+        self.repository.select_all.side_effect = [[root, child], files]
+        return root, files
+
+    async def test_folder_archive_lists_subtree(self):
+        _, files = self._setup_folder_tree()
+        params = FileArchiveRequest(folder_id=1, compression="deflate")
+
+        archive, filename, etag = await svc.archive_files(
+            self.session, params,
+        )
+
+        self.assertIsInstance(archive, ZipArchive)
+        self.assertIsNone(archive.size)
+        self.assertEqual(filename, "docs.zip")
+        self.assertTrue(etag.startswith('"') and etag.endswith('"'))
+
+        entries = archive._entries
+        self.assertEqual(
+            [(e.name, e.is_dir, e.deflate) for e in entries],
+            [
+                ("docs", True, False),
+                ("docs/a.png", False, False),
+                ("docs/sub", True, False),
+                ("docs/sub/b.txt", False, True),
+            ],
+        )
+        self.assertEqual(entries[0].mtime, 100)
+        self.assertEqual(entries[3].mtime, 200)
+        self.assertEqual(
+            entries[3].key.path, "/mnt/files/home/docs/sub/b.txt",
+        )
+        self.assertEqual(
+            self.repository.select_all.await_args_list,
+            [
+                call(Folder, id__in=[1, 2]),
+                call(File, folder_id__in=[1, 2], order_by="id"),
+            ],
+        )
+
+    async def test_records_one_audit_commit_and_emits_hook(self):
+        _, files = self._setup_folder_tree()
+
+        await svc.archive_files(self.session, FileArchiveRequest(folder_id=1))
+
+        self.assertEqual(self.write_audit.await_count, 2)
+        self.assertEqual(
+            self.write_audit.await_args_list[0].kwargs["resource_id"], 10,
+        )
+        self.repository.commit.assert_awaited_once()
+        self.emit.assert_awaited_once_with(
+            E.FILE_ARCHIVE_COMPLETED, self.session, files,
+        )
+
+    async def test_folder_not_found(self):
+        self.repository.select.return_value = None
+
+        with self.assertRaises(ResourceNotFoundError):
+            await svc.archive_files(
+                self.session, FileArchiveRequest(folder_id=1),
+            )
+
+        self.repository.commit.assert_not_awaited()
+
+    async def test_too_many_items_rejected(self):
+        self.repository.select.return_value = _folder(1, "docs")
+        self.repository.select_subtree_ids.return_value = [(1, 0)]
+        self.repository.count_all.return_value = FILES_ARCHIVE_MAX_ITEMS
+
+        with self.assertRaises(ResourceConflictError):
+            await svc.archive_files(
+                self.session, FileArchiveRequest(folder_id=1),
+            )
+
+        self.repository.select_all.assert_not_awaited()
+
+    async def test_file_selection_archive(self):
+        folder = _folder(5, "photos")
+        files = [_file(3, 5, "x.txt"), _file(4, 5, "y.txt")]
+        for file in files:
+            file.file_folder = folder
+            file.get_relative_path.return_value = f"photos/{file.filename}"
+            file.get_absolute_path.return_value = (
+                f"/mnt/files/photos/{file.filename}"
+            )
+        self.repository.select_all.return_value = files
+
+        archive, filename, _ = await svc.archive_files(
+            self.session,
+            FileArchiveRequest(file_ids=[4, 3], format="tar"),
+        )
+
+        self.assertIsInstance(archive, TarArchive)
+        self.assertEqual(filename, "files.tar")
+        self.assertEqual(
+            [entry.name for entry in archive._entries],
+            ["photos/x.txt", "photos/y.txt"],
+        )
+        self.repository.select_all.assert_awaited_once_with(
+            File, id__in=[4, 3], order_by="id",
+        )
+        self.repository.select_parent_chain.assert_awaited_once_with(folder)
+
+    async def test_missing_selected_file_fails_request(self):
+        self.repository.select_all.return_value = [_file(3, 5, "x.txt")]
+
+        with self.assertRaises(ResourceNotFoundError):
+            await svc.archive_files(
+                self.session, FileArchiveRequest(file_ids=[3, 4]),
+            )
+
+        self.write_audit.assert_not_awaited()
+
+    async def test_etag_depends_on_checksums(self):
+        params = FileArchiveRequest(folder_id=1)
+        entry = ArchiveEntry(
+            name="a", mtime=1, size=1,
+            key=svc._Source(1, 1, "a", "sum1", "/a"),
+        )
+        changed = ArchiveEntry(
+            name="a", mtime=1, size=1,
+            key=svc._Source(1, 1, "a", "sum2", "/a"),
+        )
+
+        self.assertEqual(
+            svc._get_etag(params, [entry]), svc._get_etag(params, [entry]),
+        )
+        self.assertNotEqual(
+            svc._get_etag(params, [entry]), svc._get_etag(params, [changed]),
+        )
+
+
+class TestReadEntry(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.repository = MagicMock(select_values=AsyncMock())
+        self.entry = ArchiveEntry(
+            name="docs/a.txt",
+            mtime=1,
+            size=5,
+            key=svc._Source(7, 2, "a.txt", "sum7", "/mnt/files/docs/a.txt"),
+        )
+
+        async def read_range(path, offset, length):
+            yield b"abc"
+
+        self.read_range = MagicMock(side_effect=read_range)
+
+        patches = [
+            patch.object(svc, "SessionLocal", _session_local(MagicMock())),
+            patch.object(svc, "ORMRepository", return_value=self.repository),
+            patch.object(svc, "read_range", new=self.read_range),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+        lock_patcher = patch.object(
+            svc.locks, "lock_file", return_value=AsyncMock(),
+        )
+        self.lock_mock = lock_patcher.start()
+        self.addCleanup(lock_patcher.stop)
+
+    async def test_reads_under_lock_after_checksum_check(self):
+        self.repository.select_values.return_value = ["sum7"]
+
+        chunks = [c async for c in svc._read_entry(self.entry, 2, 3)]
+
+        self.assertEqual(chunks, [b"abc"])
+        self.lock_mock.assert_called_once_with(
+            "/mnt/files/docs/a.txt", LockType.READ,
+        )
+        self.repository.select_values.assert_awaited_once_with(
+            File, "checksum", id=7, folder_id=2, filename="a.txt",
+        )
+        self.read_range.assert_called_once_with(
+            "/mnt/files/docs/a.txt", 2, 3,
+        )
+
+    async def test_changed_file_aborts_stream(self):
+        self.repository.select_values.return_value = ["other"]
+
+        with self.assertRaises(ValueError):
+            async for _ in svc._read_entry(self.entry, 0, 5):
+                pass
+
+        self.read_range.assert_not_called()
+
+    async def test_removed_file_aborts_stream(self):
+        self.repository.select_values.return_value = []
+
+        with self.assertRaises(ValueError):
+            async for _ in svc._read_entry(self.entry, 0, 5):
+                pass
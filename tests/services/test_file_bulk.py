@@ -0,0 +1,95 @@
+# tests/services/test_file_bulk.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from app.models.file import File
+from app.models.folder import Folder
+from app.services.file_bulk import (
+    batched,
+    is_folder_write_protected,
+    select_files_by_ids,
+    select_parent_chains,
+)
+
+
+class TestBatched(unittest.TestCase):
+
+    def test_splits_into_slices(self):
+        self.assertEqual(
+            list(batched([1, 2, 3, 4, 5], 2)),
+            [[1, 2], [3, 4], [5]],
+        )
+
+    def test_empty_sequence_yields_nothing(self):
+        self.assertEqual(list(batched([], 2)), [])
+
+
+class TestSelectFilesByIds(unittest.IsolatedAsyncioTestCase):
+
+    async def test_queries_in_chunks_and_keys_by_id(self):
+        file_1 = MagicMock(spec=File)
+        file_1.id = 1
+        file_3 = MagicMock(spec=File)
+        file_3.id = 3
+
+        repository = AsyncMock()
+        repository.select_all.side_effect = [[file_1], [file_3]]
+
+        with patch("app.services.file_bulk.FILES_BULK_BATCH_SIZE", 2):
+            result = await select_files_by_ids(repository, [1, 2, 3])
+
+        self.assertEqual(result, {1: file_1, 3: file_3})
+        self.assertEqual(repository.select_all.await_args_list, [
+            call(File, id__in=[1, 2]),
+            call(File, id__in=[3]),
+        ])
+
+
+class TestSelectParentChains(unittest.IsolatedAsyncioTestCase):
+
+    async def test_resolves_each_folder_once(self):
+        folder_1 = MagicMock(spec=Folder)
+        folder_1.id = 1
+        folder_2 = MagicMock(spec=Folder)
+        folder_2.id = 2
+
+        chain_1 = (MagicMock(),)
+        chain_2 = ()
+
+        repository = AsyncMock()
+        repository.select_parent_chain.side_effect = [chain_1, chain_2]
+
+        result = await select_parent_chains(
+            repository, [folder_1, folder_2, folder_1],
+        )
+
+        self.assertEqual(result, {1: chain_1, 2: chain_2})
+        self.assertEqual(repository.select_parent_chain.await_count, 2)
+
+
+class TestIsFolderWriteProtected(unittest.TestCase):
+
+    def _build_folder(self, own=False, recursive=False):
+        folder = MagicMock(spec=Folder)
+        folder.is_write_protected = own
+        folder.is_write_protected_recursive.return_value = recursive
+        return folder
+
+    def test_not_protected(self):
+        self.assertFalse(is_folder_write_protected(self._build_folder(), ()))
+
+    def test_own_flag(self):
+        self.assertTrue(
+            is_folder_write_protected(self._build_folder(own=True), ()),
+        )
+
+    def test_inherited_flag(self):
+        parent_chain = (MagicMock(),)
+        folder = self._build_folder(recursive=True)
+
+        self.assertTrue(is_folder_write_protected(folder, parent_chain))
+        folder.is_write_protected_recursive.assert_called_once_with(
+            parent_chain,
+        )
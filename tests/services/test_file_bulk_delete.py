@@ -0,0 +1,223 @@
+# tests/services/test_file_bulk_delete.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.events import Events as E  # noqa: E402
+from app.locks import LockType  # noqa: E402
+from app.models.file import File  # noqa: E402
+from app.models.folder import Folder  # noqa: E402
+from app.repositories.intent import ACTION_DELETE, ACTION_RENAME  # noqa: E402
+from app.schemas.file_bulk import FileBulkStatus  # noqa: E402
+from app.schemas.file_bulk_delete import FileBulkDeleteRequest  # noqa: E402
+from app.services.file_bulk_delete import delete_files  # noqa: E402
+
+
+class TestDeleteFiles(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        begin_intent_patcher = patch(
+            "app.services.file_bulk_delete.begin_intent",
+            new_callable=AsyncMock,
+        )
+        self.begin_intent_mock = begin_intent_patcher.start()
+        self.addCleanup(begin_intent_patcher.stop)
+
+        end_intent_patcher = patch(
+            "app.services.file_bulk_delete.end_intent",
+            new_callable=AsyncMock,
+        )
+        self.end_intent_mock = end_intent_patcher.start()
+        self.addCleanup(end_intent_patcher.stop)
+
+    def _build_lock_context(self):
+        lock_context = AsyncMock()
+        lock_context.__aenter__.return_value = None
+        lock_context.__aexit__.return_value = None
+        return lock_context
+
+    def _build_folder(self, folder_id, files_count=0, protected=False):
+        folder = MagicMock(spec=Folder)
+        folder.id = folder_id
+        folder.files_count = files_count
+        folder.is_write_protected = protected
+        folder.is_write_protected_recursive.return_value = False
+        folder.get_absolute_dir.return_value = f"/mnt/files/{folder_id}"
+        return folder
+
+    def _build_file(self, file_id, folder):
+        file = MagicMock(spec=File)
+        file.id = file_id
+        file.folder_id = folder.id
+        file.file_folder = folder
+        file.file_thumbnail = MagicMock(
+            absolute_path=f"/mnt/thumbnails/{file_id}",
+        )
+        file.file_revisions = [
+            MagicMock(absolute_path=f"/mnt/revisions/{file_id}"),
+        ]
+        file.get_absolute_path.return_value = (
+            f"/mnt/files/{folder.id}/file{file_id}.txt"
+        )
+        return file
+
+    def _patches(self, repository, cache):
+        return (
+            patch(
+                "app.services.file_bulk_delete.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.file_bulk_delete.locks.lock_many",
+                return_value=self._build_lock_context(),
+            ),
+            patch(
+                "app.services.file_bulk_delete.get_tmp_path",
+                side_effect=["/mnt/tmp/a", "/mnt/tmp/b"],
+            ),
+            patch(
+                "app.services.file_bulk_delete.rename",
+                new=AsyncMock(),
+            ),
+            patch(
+                "app.services.file_bulk_delete.delete",
+                new=AsyncMock(),
+            ),
+            patch(
+                "app.services.file_bulk_delete.get_thumbnail_cache",
+                return_value=cache,
+            ),
+            patch(
+                "app.services.file_bulk_delete.write_audit",
+                new=AsyncMock(),
+            ),
+            patch(
+                "app.services.file_bulk_delete.hooks.emit",
+                new=AsyncMock(),
+            ),
+        )
+
+    async def test_deletes_files_and_artifacts(self):
+        session = AsyncMock()
+        data = FileBulkDeleteRequest(file_ids=[1, 2, 9])
+
+        folder = self._build_folder(1, files_count=2)
+        protected = self._build_folder(2, protected=True)
+        file_1 = self._build_file(1, folder)
+        file_2 = self._build_file(2, protected)
+
+        repository = AsyncMock()
+        repository.select_all.return_value = [file_1, file_2]
+        repository.select_parent_chain.return_value = ()
+        cache = MagicMock()
+
+        (
+            orm_patch, lock_patch, tmp_patch, rename_patch, delete_patch,
+            cache_patch, audit_patch, emit_patch,
+        ) = self._patches(repository, cache)
+
+        with (
+            orm_patch,
+            lock_patch as lock_many_mock,
+            tmp_patch,
+            rename_patch as rename_mock,
+            delete_patch as delete_mock,
+            cache_patch,
+            audit_patch as write_audit_mock,
+            emit_patch as emit_mock,
+        ):
+            result = await delete_files(session=session, data=data)
+
+        self.assertEqual(result, {
+            1: FileBulkStatus.OK,
+            2: FileBulkStatus.LOCKED,
+            9: FileBulkStatus.NOT_FOUND,
+        })
+
+        lock_many_mock.assert_called_once_with(
+            LockType.WRITE, dir_paths=("/mnt/files/1",),
+        )
+        rename_mock.assert_awaited_once_with(
+            "/mnt/files/1/file1.txt", "/mnt/tmp/a",
+        )
+        repository.delete.assert_any_await(file_1, flush=False)
+        self.assertEqual(folder.files_count, 1)
+        write_audit_mock.assert_awaited_once_with(
+            repository=repository,
+            event=E.FILE_DELETE_COMPLETED,
+            resource_type=File.__tablename__,
+            resource_id=1,
+        )
+        repository.commit.assert_awaited_once()
+        cache.evict.assert_called_once_with(1)
+        self.assertEqual(delete_mock.await_args_list, [
+            call("/mnt/thumbnails/1"),
+            call("/mnt/revisions/1"),
+            call("/mnt/tmp/a"),
+        ])
+
+        planned, journaled = [
+            awaited.args[0]
+            for awaited in self.begin_intent_mock.await_args_list
+        ]
+        self.assertEqual(journaled.intent_id, planned.intent_id)
+        self.assertEqual(journaled.filters, {"id": 1})
+        self.assertFalse(journaled.committed_if_present)
+        self.assertEqual(journaled.on_commit, [
+            (ACTION_DELETE, "/mnt/thumbnails/1"),
+            (ACTION_DELETE, "/mnt/revisions/1"),
+            (ACTION_DELETE, "/mnt/tmp/a"),
+        ])
+        self.assertEqual(journaled.on_rollback, [
+            (ACTION_RENAME, "/mnt/tmp/a", "/mnt/files/1/file1.txt"),
+        ])
+        self.end_intent_mock.assert_awaited_once_with(planned)
+
+        emit_mock.assert_awaited_once_with(
+            E.FILE_BULK_DELETE_COMPLETED, session, result,
+        )
+
+    async def test_failed_commit_restores_files(self):
+        session = AsyncMock()
+        data = FileBulkDeleteRequest(file_ids=[1])
+
+        folder = self._build_folder(1, files_count=1)
+        file_1 = self._build_file(1, folder)
+
+        repository = AsyncMock()
+        repository.select_all.return_value = [file_1]
+        repository.select_parent_chain.return_value = ()
+        repository.commit.side_effect = RuntimeError("boom")
+        cache = MagicMock()
+
+        (
+            orm_patch, lock_patch, tmp_patch, rename_patch, delete_patch,
+            cache_patch, audit_patch, emit_patch,
+        ) = self._patches(repository, cache)
+
+        with (
+            orm_patch,
+            lock_patch,
+            tmp_patch,
+            rename_patch as rename_mock,
+            delete_patch as delete_mock,
+            cache_patch,
+            audit_patch,
+            emit_patch,
+            self.assertLogs("app.services.file_bulk_delete", level="ERROR"),
+        ):
+            result = await delete_files(session=session, data=data)
+
+        self.assertEqual(result, {1: FileBulkStatus.FAILED})
+        repository.rollback.assert_awaited_once()
+        self.assertEqual(rename_mock.await_args_list, [
+            call("/mnt/files/1/file1.txt", "/mnt/tmp/a"),
+            call("/mnt/tmp/a", "/mnt/files/1/file1.txt"),
+        ])
+        delete_mock.assert_not_awaited()
+        cache.evict.assert_not_called()
@@ -0,0 +1,323 @@
+# tests/services/test_file_bulk_move.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.errors import ResourceLockedError, ResourceNotFoundError  # noqa: E402
+from app.events import Events as E  # noqa: E402
+from app.locks import LockType  # noqa: E402
+from app.models.file import File  # noqa: E402
+from app.models.folder import Folder  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.repositories.intent import ACTION_RENAME  # noqa: E402
+from app.schemas.file_bulk import FileBulkStatus  # noqa: E402
+from app.schemas.file_bulk_move import FileBulkMoveRequest  # noqa: E402
+from app.services.file_bulk_move import move_files  # noqa: E402
+
+
+class TestMoveFiles(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        begin_intent_patcher = patch(
+            "app.services.file_bulk_move.begin_intent",
+            new_callable=AsyncMock,
+        )
+        self.begin_intent_mock = begin_intent_patcher.start()
+        self.addCleanup(begin_intent_patcher.stop)
+
+        end_intent_patcher = patch(
+            "app.services.file_bulk_move.end_intent",
+            new_callable=AsyncMock,
+        )
+        self.end_intent_mock = end_intent_patcher.start()
+        self.addCleanup(end_intent_patcher.stop)
+
+    def _build_user(self):
+        user = MagicMock(spec=User)
+        user.id = 10
+        return user
+
+    def _build_lock_context(self):
+        lock_context = AsyncMock()
+        lock_context.__aenter__.return_value = None
+        lock_context.__aexit__.return_value = None
+        return lock_context
+
+    def _build_folder(self, folder_id, files_count=0, protected=False):
+        folder = MagicMock(spec=Folder)
+        folder.id = folder_id
+        folder.files_count = files_count
+        folder.is_write_protected = protected
+        folder.is_write_protected_recursive.return_value = False
+        folder.get_absolute_dir.return_value = f"/mnt/files/{folder_id}"
+        return folder
+
+    def _build_file(self, file_id, folder):
+        file = MagicMock(spec=File)
+        file.id = file_id
+        file.folder_id = folder.id
+        file.filename = f"file{file_id}.txt"
+        file.updated_by = None
+        file.file_folder = folder
+        file.get_absolute_path.side_effect = (
+            lambda target, chain: f"/mnt/files/{target.id}/{file.filename}"
+        )
+        return file
+
+    def _build_repository(self, destination, files, taken=()):
+        repository = AsyncMock()
+        repository.select.return_value = destination
+        repository.select_parent_chain.return_value = ()
+        repository.select_all.side_effect = [files, list(taken)]
+        return repository
+
+    def _patches(self, repository, lock_context):
+        return (
+            patch(
+                "app.services.file_bulk_move.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.file_bulk_move.locks.lock_many",
+                return_value=lock_context,
+            ),
+            patch(
+                "app.services.file_bulk_move.isdir",
+                new=AsyncMock(return_value=False),
+            ),
+            patch(
+                "app.services.file_bulk_move.isfile",
+                new=AsyncMock(return_value=False),
+            ),
+            patch(
+                "app.services.file_bulk_move.rename",
+                new=AsyncMock(),
+            ),
+            patch(
+                "app.services.file_bulk_move.write_audit",
+                new=AsyncMock(),
+            ),
+            patch(
+                "app.services.file_bulk_move.hooks.emit",
+                new=AsyncMock(),
+            ),
+        )
+
+    async def test_moves_files_under_one_lock_and_one_commit(self):
+        session = AsyncMock()
+        user = self._build_user()
+        data = FileBulkMoveRequest(file_ids=[1, 2, 9], folder_id=5)
+
+        source_a = self._build_folder(1, files_count=3)
+        source_b = self._build_folder(2, files_count=3)
+        destination = self._build_folder(5, files_count=0)
+        file_1 = self._build_file(1, source_a)
+        file_2 = self._build_file(2, source_b)
+
+        repository = self._build_repository(destination, [file_1, file_2])
+        lock_context = self._build_lock_context()
+
+        (
+            orm_patch, lock_patch, isdir_patch, isfile_patch,
+            rename_patch, audit_patch, emit_patch,
+        ) = self._patches(repository, lock_context)
+
+        with (
+            orm_patch,
+            lock_patch as lock_many_mock,
+            isdir_patch,
+            isfile_patch,
+            rename_patch as rename_mock,
+            audit_patch as write_audit_mock,
+            emit_patch as emit_mock,
+        ):
+            result = await move_files(session=session, user=user, data=data)
+
+        self.assertEqual(result, {
+            1: FileBulkStatus.OK,
+            2: FileBulkStatus.OK,
+            9: FileBulkStatus.NOT_FOUND,
+        })
+
+        lock_many_mock.assert_called_once()
+        args, kwargs = lock_many_mock.call_args
+        self.assertEqual(args, (LockType.WRITE,))
+        self.assertEqual(
+            set(kwargs["dir_paths"]),
+            {"/mnt/files/1", "/mnt/files/2", "/mnt/files/5"},
+        )
+
+        self.assertEqual(rename_mock.await_args_list, [
+            call("/mnt/files/1/file1.txt", "/mnt/files/5/file1.txt"),
+            call("/mnt/files/2/file2.txt", "/mnt/files/5/file2.txt"),
+        ])
+        self.assertEqual(file_1.folder_id, 5)
+        self.assertEqual(file_2.updated_by, 10)
+        self.assertEqual(source_a.files_count, 2)
+        self.assertEqual(destination.files_count, 2)
+
+        self.assertEqual(write_audit_mock.await_count, 2)
+        write_audit_mock.assert_any_await(
+            repository=repository,
+            event=E.FILE_MOVE_COMPLETED,
+            resource_type=File.__tablename__,
+            resource_id=1,
+        )
+        repository.commit.assert_awaited_once()
+
+        planned, journaled = [
+            awaited.args[0]
+            for awaited in self.begin_intent_mock.await_args_list
+        ]
+        self.assertEqual(journaled.intent_id, planned.intent_id)
+        self.assertEqual(journaled.filters, {"id": 1, "folder_id": 5})
+        self.assertEqual(journaled.on_rollback, [
+            (
+                ACTION_RENAME,
+                "/mnt/files/5/file1.txt",
+                "/mnt/files/1/file1.txt",
+            ),
+            (
+                ACTION_RENAME,
+                "/mnt/files/5/file2.txt",
+                "/mnt/files/2/file2.txt",
+            ),
+        ])
+        self.end_intent_mock.assert_awaited_once_with(planned)
+
+        emit_mock.assert_awaited_once_with(
+            E.FILE_BULK_MOVE_COMPLETED, session, result,
+        )
+
+    async def test_raises_not_found_for_missing_destination(self):
+        session = AsyncMock()
+        data = FileBulkMoveRequest(file_ids=[1], folder_id=5)
+
+        repository = AsyncMock()
+        repository.select.return_value = None
+
+        with (
+            patch(
+                "app.services.file_bulk_move.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.file_bulk_move.hooks.emit",
+                new=AsyncMock(),
+            ) as emit_mock,
+        ):
+            with self.assertRaises(ResourceNotFoundError):
+                await move_files(
+                    session=session, user=self._build_user(), data=data,
+                )
+
+        repository.commit.assert_not_awaited()
+        emit_mock.assert_not_awaited()
+
+    async def test_raises_locked_for_protected_destination(self):
+        session = AsyncMock()
+        data = FileBulkMoveRequest(file_ids=[1], folder_id=5)
+
+        repository = AsyncMock()
+        repository.select.return_value = self._build_folder(5, protected=True)
+        repository.select_parent_chain.return_value = ()
+
+        with patch(
+            "app.services.file_bulk_move.ORMRepository",
+            return_value=repository,
+        ):
+            with self.assertRaises(ResourceLockedError):
+                await move_files(
+                    session=session, user=self._build_user(), data=data,
+                )
+
+        repository.select_all.assert_not_awaited()
+
+    async def test_reports_locked_and_conflict_per_file(self):
+        session = AsyncMock()
+        data = FileBulkMoveRequest(file_ids=[1, 2, 3], folder_id=5)
+
+        protected = self._build_folder(1, protected=True)
+        source = self._build_folder(2, files_count=2)
+        destination = self._build_folder(5)
+        file_1 = self._build_file(1, protected)
+        file_2 = self._build_file(2, source)
+        file_3 = self._build_file(3, destination)
+
+        taken = MagicMock(spec=File)
+        taken.filename = file_2.filename
+
+        repository = self._build_repository(
+            destination, [file_1, file_2, file_3], taken=[taken],
+        )
+        lock_context = self._build_lock_context()
+
+        (
+            orm_patch, lock_patch, isdir_patch, isfile_patch,
+            rename_patch, audit_patch, emit_patch,
+        ) = self._patches(repository, lock_context)
+
+        with (
+            orm_patch,
+            lock_patch,
+            isdir_patch,
+            isfile_patch,
+            rename_patch as rename_mock,
+            audit_patch,
+            emit_patch,
+        ):
+            result = await move_files(
+                session=session, user=self._build_user(), data=data,
+            )
+
+        self.assertEqual(result, {
+            1: FileBulkStatus.LOCKED,
+            2: FileBulkStatus.CONFLICT,
+            3: FileBulkStatus.OK,
+        })
+        rename_mock.assert_not_awaited()
+        repository.commit.assert_not_awaited()
+        self.begin_intent_mock.assert_not_awaited()
+
+    async def test_failed_commit_restores_renamed_files(self):
+        session = AsyncMock()
+        data = FileBulkMoveRequest(file_ids=[1], folder_id=5)
+
+        source = self._build_folder(1, files_count=1)
+        destination = self._build_folder(5)
+        file_1 = self._build_file(1, source)
+
+        repository = self._build_repository(destination, [file_1])
+        repository.commit.side_effect = RuntimeError("boom")
+        lock_context = self._build_lock_context()
+
+        (
+            orm_patch, lock_patch, isdir_patch, isfile_patch,
+            rename_patch, audit_patch, emit_patch,
+        ) = self._patches(repository, lock_context)
+
+        with (
+            orm_patch,
+            lock_patch,
+            isdir_patch,
+            isfile_patch,
+            rename_patch as rename_mock,
+            audit_patch,
+            emit_patch,
+            self.assertLogs("app.services.file_bulk_move", level="ERROR"),
+        ):
+            result = await move_files(
+                session=session, user=self._build_user(), data=data,
+            )
+
+        self.assertEqual(result, {1: FileBulkStatus.FAILED})
+        repository.rollback.assert_awaited_once()
+        self.assertEqual(rename_mock.await_args_list, [
+            call("/mnt/files/1/file1.txt", "/mnt/files/5/file1.txt"),
+            call("/mnt/files/5/file1.txt", "/mnt/files/1/file1.txt"),
+        ])
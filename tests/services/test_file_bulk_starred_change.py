@@ -0,0 +1,158 @@
+# tests/services/test_file_bulk_starred_change.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from app.events import Events as E
+from app.models.file import File
+from app.models.user import User
+from app.schemas.file_bulk import FileBulkStatus
+from app.schemas.file_bulk_starred_change import FileBulkStarredChangeRequest
+from app.services.file_bulk_starred_change import change_files_starred
+
+
+class TestChangeFilesStarred(unittest.IsolatedAsyncioTestCase):
+
+    def _build_user(self):
+        user = MagicMock(spec=User)
+        user.id = 10
+        return user
+
+    def _build_file(self, file_id):
+        file = MagicMock(spec=File)
+        file.id = file_id
+        file.is_starred = False
+        file.updated_by = None
+        return file
+
+    def _patch(self, repository):
+        return (
+            patch(
+                "app.services.file_bulk_starred_change.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.file_bulk_starred_change.write_audit",
+                new=AsyncMock(),
+            ),
+            patch(
+                "app.services.file_bulk_starred_change.hooks.emit",
+                new=AsyncMock(),
+            ),
+        )
+
+    async def test_updates_files_and_reports_missing(self):
+        session = AsyncMock()
+        user = self._build_user()
+        data = FileBulkStarredChangeRequest(
+            file_ids=[3, 1, 2], is_starred=True,
+        )
+        file_1 = self._build_file(1)
+        file_3 = self._build_file(3)
+
+        repository = AsyncMock()
+        repository.select_all.return_value = [file_1, file_3]
+
+        orm_patch, audit_patch, emit_patch = self._patch(repository)
+        with (
+            orm_patch,
+            audit_patch as write_audit_mock,
+            emit_patch as emit_mock,
+        ):
+            result = await change_files_starred(
+                session=session,
+                user=user,
+                data=data,
+            )
+
+        self.assertEqual(list(result.items()), [
+            (3, FileBulkStatus.OK),
+            (1, FileBulkStatus.OK),
+            (2, FileBulkStatus.NOT_FOUND),
+        ])
+        self.assertIs(file_1.is_starred, True)
+        self.assertEqual(file_3.updated_by, 10)
+
+        repository.select_all.assert_awaited_once_with(File, id__in=[3, 1, 2])
+        self.assertEqual(write_audit_mock.await_args_list, [
+            call(
+                repository=repository,
+                event=E.FILE_STARRED_CHANGE_COMPLETED,
+                resource_type=File.__tablename__,
+                resource_id=file_id,
+            )
+            for file_id in (1, 3)
+        ])
+        repository.commit.assert_awaited_once()
+        repository.rollback.assert_not_awaited()
+        emit_mock.assert_awaited_once_with(
+            E.FILE_BULK_STARRED_CHANGE_COMPLETED,
+            session,
+            result,
+        )
+
+    async def test_commits_once_per_batch(self):
+        session = AsyncMock()
+        user = self._build_user()
+        data = FileBulkStarredChangeRequest(
+            file_ids=[1, 2, 3], is_starred=True,
+        )
+
+        repository = AsyncMock()
+        repository.select_all.side_effect = [
+            [self._build_file(1), self._build_file(2)],
+            [self._build_file(3)],
+        ]
+
+        orm_patch, audit_patch, emit_patch = self._patch(repository)
+        with (
+            orm_patch,
+            audit_patch,
+            emit_patch,
+            patch(
+                "app.services.file_bulk_starred_change.FILES_BULK_BATCH_SIZE",
+                2,
+            ),
+        ):
+            result = await change_files_starred(
+                session=session,
+                user=user,
+                data=data,
+            )
+
+        self.assertEqual(set(result.values()), {FileBulkStatus.OK})
+        self.assertEqual(repository.commit.await_count, 2)
+
+    async def test_failed_batch_rolls_back_and_reports_failed(self):
+        session = AsyncMock()
+        user = self._build_user()
+        data = FileBulkStarredChangeRequest(
+            file_ids=[1, 2], is_starred=True,
+        )
+
+        repository = AsyncMock()
+        repository.select_all.return_value = [self._build_file(1)]
+        repository.commit.side_effect = RuntimeError("boom")
+
+        orm_patch, audit_patch, emit_patch = self._patch(repository)
+        with (
+            orm_patch,
+            audit_patch,
+            emit_patch as emit_mock,
+            self.assertLogs(
+                "app.services.file_bulk_starred_change", level="ERROR",
+            ),
+        ):
+            result = await change_files_starred(
+                session=session,
+                user=user,
+                data=data,
+            )
+
+        self.assertEqual(result, {
+            1: FileBulkStatus.FAILED,
+            2: FileBulkStatus.NOT_FOUND,
+        })
+        repository.rollback.assert_awaited_once()
+        emit_mock.assert_awaited_once()
@@ -0,0 +1,145 @@
+# tests/services/test_file_bulk_tag_add.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.db.engine import load_all_models  # noqa: E402
+from app.events import Events as E  # noqa: E402
+from app.models.file import File  # noqa: E402
+from app.models.file_tag import FileTag  # noqa: E402
+from app.models.folder import Folder  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.schemas.file_bulk import FileBulkStatus  # noqa: E402
+from app.schemas.file_bulk_tag_add import FileBulkTagAddRequest  # noqa: E402
+from app.services.file_bulk_tag_add import add_files_tag  # noqa: E402
+
+load_all_models()
+
+
+class TestAddFilesTag(unittest.IsolatedAsyncioTestCase):
+
+    def _build_user(self):
+        user = MagicMock(spec=User)
+        user.id = 10
+        return user
+
+    def _build_folder(self, folder_id, protected=False):
+        folder = MagicMock(spec=Folder)
+        folder.id = folder_id
+        folder.is_write_protected = protected
+        folder.is_write_protected_recursive.return_value = False
+        return folder
+
+    def _build_file(self, file_id, folder):
+        file = MagicMock(spec=File)
+        file.id = file_id
+        file.folder_id = folder.id
+        file.file_folder = folder
+        return file
+
+    def _patches(self, repository):
+        return (
+            patch(
+                "app.services.file_bulk_tag_add.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.file_bulk_tag_add.write_audit",
+                new=AsyncMock(),
+            ),
+            patch(
+                "app.services.file_bulk_tag_add.hooks.emit",
+                new=AsyncMock(),
+            ),
+        )
+
+    async def test_adds_missing_tags_and_skips_existing(self):
+        session = AsyncMock()
+        user = self._build_user()
+        data = FileBulkTagAddRequest(file_ids=[1, 2, 3, 9], tag="work")
+
+        folder = self._build_folder(1)
+        protected = self._build_folder(2, protected=True)
+        file_1 = self._build_file(1, folder)
+        file_2 = self._build_file(2, folder)
+        file_3 = self._build_file(3, protected)
+
+        existing = MagicMock(spec=FileTag)
+        existing.file_id = 2
+
+        repository = AsyncMock()
+        repository.select_all.side_effect = [
+            [file_1, file_2, file_3],
+            [existing],
+        ]
+        repository.select_parent_chain.return_value = ()
+
+        orm_patch, audit_patch, emit_patch = self._patches(repository)
+        with (
+            orm_patch,
+            audit_patch as write_audit_mock,
+            emit_patch as emit_mock,
+        ):
+            result = await add_files_tag(session=session, user=user, data=data)
+
+        self.assertEqual(result, {
+            1: FileBulkStatus.OK,
+            2: FileBulkStatus.OK,
+            3: FileBulkStatus.LOCKED,
+            9: FileBulkStatus.NOT_FOUND,
+        })
+
+        repository.select_all.assert_any_await(
+            FileTag, file_id__in=[1, 2], tag="work",
+        )
+        repository.insert.assert_awaited_once()
+        tag = repository.insert.await_args.args[0]
+        self.assertIsInstance(tag, FileTag)
+        self.assertEqual(tag.file_id, 1)
+        self.assertEqual(tag.created_by, 10)
+        self.assertEqual(tag.tag, "work")
+
+        write_audit_mock.assert_awaited_once_with(
+            repository=repository,
+            event=E.TAG_ADD_COMPLETED,
+            resource_type=FileTag.__tablename__,
+            resource_id=tag.id,
+        )
+        repository.commit.assert_awaited_once()
+        emit_mock.assert_awaited_once_with(
+            E.FILE_BULK_TAG_ADD_COMPLETED, session, result,
+        )
+
+    async def test_failed_batch_rolls_back_and_reports_failed(self):
+        session = AsyncMock()
+        data = FileBulkTagAddRequest(file_ids=[1], tag="work")
+
+        folder = self._build_folder(1)
+        repository = AsyncMock()
+        repository.select_all.side_effect = [
+            [self._build_file(1, folder)],
+            [],
+        ]
+        repository.select_parent_chain.return_value = ()
+        repository.flush.side_effect = RuntimeError("boom")
+
+        orm_patch, audit_patch, emit_patch = self._patches(repository)
+        with (
+            orm_patch,
+            audit_patch as write_audit_mock,
+            emit_patch,
+            self.assertLogs("app.services.file_bulk_tag_add", level="ERROR"),
+        ):
+            result = await add_files_tag(
+                session=session, user=self._build_user(), data=data,
+            )
+
+        self.assertEqual(result, {1: FileBulkStatus.FAILED})
+        repository.rollback.assert_awaited_once()
+        repository.commit.assert_not_awaited()
+        write_audit_mock.assert_not_awaited()
@@ -4,13 +4,18 @@
 import unittest
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
-from app.errors import ResourceLockedError, ResourceNotFoundError
-from app.events import Events as E
-from app.locks import LockType
-from app.models.file import File
-from app.models.file_revision import FileRevision
-from app.models.file_thumbnail import FileThumbnail
-from app.services.file_delete import delete_file
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.errors import ResourceLockedError, ResourceNotFoundError  # noqa: E402
+from app.events import Events as E  # noqa: E402
+from app.locks import LockType  # noqa: E402
+from app.models.file import File  # noqa: E402
+from app.models.file_revision import FileRevision  # noqa: E402
+from app.models.file_thumbnail import FileThumbnail  # noqa: E402
+from app.repositories.intent import ACTION_DELETE, ACTION_RENAME  # noqa: E402
+from app.services.file_delete import delete_file  # noqa: E402
 
 
 TMP_PATH = "/mnt/files/.tmp/delete-file"
@@ -20,6 +25,20 @@ class TestDeleteFile(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self):
         super().setUp()
+        begin_intent_patcher = patch(
+            "app.services.file_delete.begin_intent",
+            new_callable=AsyncMock,
+        )
+        self.begin_intent_mock = begin_intent_patcher.start()
+        self.addCleanup(begin_intent_patcher.stop)
+
+        end_intent_patcher = patch(
+            "app.services.file_delete.end_intent",
+            new_callable=AsyncMock,
+        )
+        self.end_intent_mock = end_intent_patcher.start()
+        self.addCleanup(end_intent_patcher.stop)
+
         self.thumbnail_cache_mock = MagicMock()
         self._thumbnail_cache_patcher = patch(
             "app.services.file_delete.get_thumbnail_cache",
@@ -179,6 +198,19 @@ class TestDeleteFile(unittest.IsolatedAsyncioTestCase):
             ],
         )
 
+        intent = self.begin_intent_mock.await_args.args[0]
+        self.assertEqual(intent.table, File.__tablename__)
+        self.assertEqual(intent.filters, {"id": 42})
+        self.assertFalse(intent.committed_if_present)
+        self.assertCountEqual(intent.on_commit, [
+            (ACTION_DELETE, awaited.args[0])
+            for awaited in delete_mock.await_args_list
+        ])
+        self.assertEqual(intent.on_rollback, [
+            (ACTION_RENAME, TMP_PATH, "/mnt/files/docs/file.txt"),
+        ])
+        self.end_intent_mock.assert_awaited_once_with(intent)
+
         emit_mock.assert_awaited_once_with(
             E.FILE_DELETE_COMPLETED,
             session,
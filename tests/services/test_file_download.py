@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, call, patch
 
 from app.errors import ResourceNotFoundError
 from app.events import Events as E
+from app.locks import LockType
 from app.models.file import File
 from app.models.file_revision import FileRevision
 from app.services.file_download import download_file
@@ -31,8 +32,15 @@ class TestDownloadFile(unittest.IsolatedAsyncioTestCase):
         revision.filename = "document.txt"
         revision.mimetype = "text/plain"
         revision.absolute_path = "/mnt/revisions/some-uuid"
+        revision.is_delta = False
         return revision
 
+    def _build_lock_context(self):
+        lock_context = AsyncMock()
+        lock_context.__aenter__.return_value = None
+        lock_context.__aexit__.return_value = None
+        return lock_context
+
     # --- revision_number=0 (HEAD) ---
 
     async def test_head_returns_file_and_path_and_emits_hook(self):
@@ -226,6 +234,104 @@ class TestDownloadFile(unittest.IsolatedAsyncioTestCase):
         isfile_mock.assert_awaited_once_with("/mnt/revisions/some-uuid")
         emit_mock.assert_not_awaited()
 
+    async def test_delta_revision_returns_reconstructed_content(self):
+        session = AsyncMock()
+        file, folder, parent_chain = self._build_file()
+        revision = self._build_revision()
+        revision.is_delta = True
+
+        repository = AsyncMock()
+        repository.select.side_effect = [file, revision]
+        repository.select_parent_chain.return_value = parent_chain
+
+        with (
+            patch(
+                "app.services.file_download.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.file_download.isfile",
+                new=AsyncMock(return_value=True),
+            ),
+            patch(
+                "app.services.file_download.locks.lock_file",
+                return_value=self._build_lock_context(),
+            ) as lock_file_mock,
+            patch(
+                "app.services.file_download.reconstruct_revision",
+                new=AsyncMock(return_value=b"old text"),
+            ) as reconstruct_mock,
+            patch(
+                "app.services.file_download.write_audit",
+                new=AsyncMock(),
+            ),
+            patch(
+                "app.services.file_download.hooks.emit",
+                new=AsyncMock(),
+            ) as emit_mock,
+        ):
+            result, content = await download_file(session, 42, 3)
+
+        repository.select_parent_chain.assert_awaited_once_with(folder)
+        lock_file_mock.assert_called_once_with(
+            "/mnt/files/document.txt",
+            LockType.READ,
+        )
+        reconstruct_mock.assert_awaited_once_with(
+            file,
+            revision,
+            "/mnt/files/document.txt",
+        )
+        emit_mock.assert_awaited_once_with(
+            E.FILE_DOWNLOAD_COMPLETED, session, file
+        )
+
+        self.assertIs(result, revision)
+        self.assertEqual(content, b"old text")
+
+    async def test_delta_revision_raises_not_found_when_corrupted(self):
+        session = AsyncMock()
+        file, _, parent_chain = self._build_file()
+        revision = self._build_revision()
+        revision.is_delta = True
+
+        repository = AsyncMock()
+        repository.select.side_effect = [file, revision]
+        repository.select_parent_chain.return_value = parent_chain
+
+        with (
+            patch(
+                "app.services.file_download.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.file_download.isfile",
+                new=AsyncMock(return_value=True),
+            ),
+            patch(
+                "app.services.file_download.locks.lock_file",
+                return_value=self._build_lock_context(),
+            ),
+            patch(
+                "app.services.file_download.reconstruct_revision",
+                new=AsyncMock(side_effect=ValueError("checksum")),
+            ),
+            patch("app.services.file_download.log") as log_mock,
+            patch(
+                "app.services.file_download.hooks.emit",
+                new=AsyncMock(),
+            ) as emit_mock,
+        ):
+            with self.assertRaises(ResourceNotFoundError):
+                await download_file(session, 42, 3)
+
+        self.assertEqual(
+            log_mock.exception.call_args.args[1],
+            E.FILE_DOWNLOAD_REVISION_CORRUPTED,
+        )
+        repository.commit.assert_not_awaited()
+        emit_mock.assert_not_awaited()
+
     # --- common ---
 
     async def test_raises_not_found_when_file_does_not_exist(self):
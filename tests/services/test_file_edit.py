@@ -15,6 +15,7 @@ from app.errors import (  # noqa: E402
     ResourceConflictError,
     ResourceLockedError,
     ResourceNotFoundError,
+    ValueInvalidError,
 )
 from app.events import Events as E  # noqa: E402
 from app.locks import LockType  # noqa: E402
@@ -22,8 +23,15 @@ from app.models.file import File  # noqa: E402
 from app.models.file_revision import FileRevision  # noqa: E402
 from app.models.folder import Folder  # noqa: E402
 from app.models.user import User  # noqa: E402
+from app.repositories.intent import ACTION_COPY, ACTION_DELETE  # noqa: E402
 from app.schemas.file_edit import FileEditRequest  # noqa: E402
-from app.services.file_edit import _cleanup_path, _write_text, edit_file  # noqa: E501, E402
+from app.schemas.file_patch import FilePatchRequest  # noqa: E402
+from app.services.file_edit import (  # noqa: E402
+    _cleanup_path,
+    _write_text,
+    edit_file,
+    patch_file,
+)
 import app.services.file_edit as file_edit  # noqa: E402
 
 
@@ -31,6 +39,28 @@ class TestEditFile(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self):
         super().setUp()
+        begin_intent_patcher = patch(
+            "app.services.file_edit.begin_intent",
+            new_callable=AsyncMock,
+        )
+        self.begin_intent_mock = begin_intent_patcher.start()
+        self.addCleanup(begin_intent_patcher.stop)
+
+        end_intent_patcher = patch(
+            "app.services.file_edit.end_intent",
+            new_callable=AsyncMock,
+        )
+        self.end_intent_mock = end_intent_patcher.start()
+        self.addCleanup(end_intent_patcher.stop)
+
+        is_delta_due_patcher = patch(
+            "app.services.file_edit.is_delta_due",
+            new_callable=AsyncMock,
+            return_value=False,
+        )
+        self.is_delta_due_mock = is_delta_due_patcher.start()
+        self.addCleanup(is_delta_due_patcher.stop)
+
         self._log_patcher = patch(
             "app.services.file_edit.log",
             MagicMock(),
@@ -132,6 +162,7 @@ class TestEditFile(unittest.IsolatedAsyncioTestCase):
             patch(
                 "app.services.file_edit.FileRevision",
                 return_value=revision,
+                __tablename__="files_revisions",
             ) as file_revision_mock,
             patch(
                 "app.services.file_edit.copy",
@@ -170,10 +201,7 @@ class TestEditFile(unittest.IsolatedAsyncioTestCase):
         get_filesize_mock.assert_awaited_once_with("/tmp/edited")
         get_checksum_mock.assert_awaited_once_with("/tmp/edited")
 
-        repository.count_all.assert_awaited_once_with(
-            file_revision_mock,
-            file_id=1,
-        )
+        repository.count_all.assert_not_awaited()
 
         self.assertEqual(file_revision_mock.call_args.kwargs["file_id"], 1)
         self.assertEqual(file_revision_mock.call_args.kwargs["created_by"], 10)
@@ -223,12 +251,214 @@ class TestEditFile(unittest.IsolatedAsyncioTestCase):
         repository.commit.assert_awaited_once()
         repository.rollback.assert_not_awaited()
 
+        intent = self.begin_intent_mock.await_args.args[0]
+        self.assertEqual(intent.table, "files_revisions")
+        self.assertEqual(
+            intent.filters,
+            {"revision_uuid": revision.revision_uuid},
+        )
+        self.assertEqual(intent.on_commit, [(ACTION_DELETE, "/tmp/edited")])
+        self.assertEqual(intent.on_rollback, [
+            (
+                ACTION_COPY,
+                "/mnt/revisions/rev-1",
+                "/mnt/files/folder/notes.txt",
+            ),
+            (ACTION_DELETE, "/mnt/revisions/rev-1"),
+            (ACTION_DELETE, "/tmp/edited"),
+        ])
+        self.end_intent_mock.assert_awaited_once_with(intent)
+
         emit_mock.assert_awaited_once_with(
             E.FILE_EDIT_COMPLETED,
             session,
             file,
         )
 
+    async def test_stores_delta_revision_with_backup_restore_source(self):
+        session = AsyncMock()
+        user = self._build_user()
+        data = FileEditRequest(content="new text")
+
+        folder = self._build_folder()
+        file = self._build_file(folder)
+
+        revision = MagicMock(spec=FileRevision)
+        revision.absolute_path = "/mnt/revisions/rev-1"
+
+        repository = AsyncMock()
+        repository.select.return_value = file
+        repository.select_parent_chain.return_value = (MagicMock(),)
+
+        self.is_delta_due_mock.return_value = True
+
+        with (
+            patch(
+                "app.services.file_edit.ORMRepository",
+                return_value=repository
+            ),
+            patch(
+                "app.services.file_edit.locks.lock_file",
+                return_value=self._build_lock_context(),
+            ),
+            patch(
+                "app.services.file_edit.isdir",
+                new=AsyncMock(return_value=False)
+            ),
+            patch(
+                "app.services.file_edit.isfile",
+                new=AsyncMock(return_value=True)
+            ),
+            patch(
+                "app.services.file_edit.get_tmp_path",
+                side_effect=["/tmp/edited", "/tmp/backup"],
+            ),
+            patch("app.services.file_edit._write_text", new=AsyncMock()),
+            patch(
+                "app.services.file_edit.get_filesize",
+                new=AsyncMock(return_value=8),
+            ),
+            patch(
+                "app.services.file_edit.get_checksum",
+                new=AsyncMock(return_value="new-checksum"),
+            ),
+            patch(
+                "app.services.file_edit.FileRevision",
+                return_value=revision,
+                __tablename__="files_revisions",
+            ) as file_revision_mock,
+            patch(
+                "app.services.file_edit.write_revision_delta",
+                new=AsyncMock()
+            ) as write_delta_mock,
+            patch(
+                "app.services.file_edit.copy",
+                new=AsyncMock()
+            ) as copy_mock,
+            patch(
+                "app.services.file_edit.delete",
+                new=AsyncMock()
+            ) as delete_mock,
+            patch("app.services.file_edit.write_audit", new=AsyncMock()),
+            patch("app.services.file_edit.hooks.emit", new=AsyncMock()),
+        ):
+            await edit_file(session, user, 1, data)
+
+        self.is_delta_due_mock.assert_awaited_once_with(repository, file, 8)
+        self.assertTrue(file_revision_mock.call_args.kwargs["is_delta"])
+
+        write_delta_mock.assert_awaited_once_with(
+            "/mnt/files/folder/notes.txt",
+            "/tmp/edited",
+            "/mnt/revisions/rev-1",
+        )
+        self.assertEqual(
+            copy_mock.await_args_list,
+            [
+                call("/mnt/files/folder/notes.txt", "/tmp/backup"),
+                call("/tmp/edited", "/mnt/files/folder/notes.txt"),
+            ],
+        )
+        self.assertEqual(
+            delete_mock.await_args_list,
+            [call("/tmp/edited"), call("/tmp/backup")],
+        )
+
+        intent = self.begin_intent_mock.await_args.args[0]
+        self.assertEqual(intent.on_commit, [
+            (ACTION_DELETE, "/tmp/edited"),
+            (ACTION_DELETE, "/tmp/backup"),
+        ])
+        self.assertEqual(intent.on_rollback, [
+            (ACTION_COPY, "/tmp/backup", "/mnt/files/folder/notes.txt"),
+            (ACTION_DELETE, "/mnt/revisions/rev-1"),
+            (ACTION_DELETE, "/tmp/backup"),
+            (ACTION_DELETE, "/tmp/edited"),
+        ])
+
+    async def test_delta_failure_removes_delta_and_backup(self):
+        session = AsyncMock()
+        user = self._build_user()
+        data = FileEditRequest(content="new text")
+
+        folder = self._build_folder()
+        file = self._build_file(folder)
+
+        revision = MagicMock(spec=FileRevision)
+        revision.absolute_path = "/mnt/revisions/rev-1"
+
+        repository = AsyncMock()
+        repository.select.return_value = file
+        repository.select_parent_chain.return_value = (MagicMock(),)
+        repository.insert.side_effect = RuntimeError("insert failed")
+
+        self.is_delta_due_mock.return_value = True
+
+        with (
+            patch(
+                "app.services.file_edit.ORMRepository",
+                return_value=repository
+            ),
+            patch(
+                "app.services.file_edit.locks.lock_file",
+                return_value=self._build_lock_context(),
+            ),
+            patch(
+                "app.services.file_edit.isdir",
+                new=AsyncMock(return_value=False)
+            ),
+            patch(
+                "app.services.file_edit.isfile",
+                new=AsyncMock(return_value=True)
+            ),
+            patch(
+                "app.services.file_edit.get_tmp_path",
+                side_effect=["/tmp/edited", "/tmp/backup"],
+            ),
+            patch("app.services.file_edit._write_text", new=AsyncMock()),
+            patch(
+                "app.services.file_edit.get_filesize",
+                new=AsyncMock(return_value=8),
+            ),
+            patch(
+                "app.services.file_edit.get_checksum",
+                new=AsyncMock(return_value="new-checksum"),
+            ),
+            patch(
+                "app.services.file_edit.FileRevision",
+                return_value=revision,
+                __tablename__="files_revisions",
+            ),
+            patch(
+                "app.services.file_edit.write_revision_delta",
+                new=AsyncMock()
+            ),
+            patch(
+                "app.services.file_edit.copy",
+                new=AsyncMock()
+            ) as copy_mock,
+            patch(
+                "app.services.file_edit.delete",
+                new=AsyncMock()
+            ) as delete_mock,
+        ):
+            with self.assertRaises(RuntimeError):
+                await edit_file(session, user, 1, data)
+
+        copy_mock.assert_awaited_once_with(
+            "/mnt/files/folder/notes.txt",
+            "/tmp/backup",
+        )
+        repository.rollback.assert_awaited_once()
+        self.assertEqual(
+            delete_mock.await_args_list,
+            [
+                call("/tmp/edited"),
+                call("/mnt/revisions/rev-1"),
+                call("/tmp/backup"),
+            ],
+        )
+
     async def test_raises_not_found(self):
         session = AsyncMock()
         user = self._build_user()
@@ -532,7 +762,8 @@ class TestEditFile(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.file_edit.FileRevision",
-                return_value=revision
+                return_value=revision,
+                __tablename__="files_revisions",
             ),
             patch(
                 "app.services.file_edit.copy",
@@ -621,7 +852,8 @@ class TestEditFile(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.file_edit.FileRevision",
-                return_value=revision
+                return_value=revision,
+                __tablename__="files_revisions",
             ),
             patch(
                 "app.services.file_edit.copy",
@@ -715,7 +947,8 @@ class TestEditFile(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.file_edit.FileRevision",
-                return_value=revision
+                return_value=revision,
+                __tablename__="files_revisions",
             ),
             patch(
                 "app.services.file_edit.copy",
@@ -811,7 +1044,8 @@ class TestEditFile(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.file_edit.FileRevision",
-                return_value=revision
+                return_value=revision,
+                __tablename__="files_revisions",
             ),
             patch(
                 "app.services.file_edit.copy",
@@ -888,3 +1122,179 @@ class TestEditFile(unittest.IsolatedAsyncioTestCase):
             "w", encoding="utf-8"
         )
         m_open().write.assert_called_once_with("café")
+
+
+class TestPatchFile(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        patchers = {
+            "begin_intent": patch(
+                "app.services.file_edit.begin_intent", new=AsyncMock(),
+            ),
+            "end_intent": patch(
+                "app.services.file_edit.end_intent", new=AsyncMock(),
+            ),
+            "is_delta_due": patch(
+                "app.services.file_edit.is_delta_due",
+                new=AsyncMock(return_value=False),
+            ),
+            "log": patch("app.services.file_edit.log", MagicMock()),
+        }
+        self.mocks = {}
+        for name, patcher in patchers.items():
+            self.mocks[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _build_file(self):
+        folder = MagicMock(spec=Folder)
+        folder.is_write_protected = False
+        folder.is_write_protected_recursive.return_value = False
+
+        file = MagicMock(spec=File)
+        file.id = 1
+        file.filesize = 100
+        file.checksum = "a" * 64
+        file.latest_revision_number = 0
+        file.file_folder = folder
+        file.get_absolute_path.return_value = "/mnt/files/folder/log.txt"
+        file.is_text = True
+        return file
+
+    def _build_data(self, base_checksum="a" * 64):
+        return FilePatchRequest(
+            base_checksum=base_checksum,
+            patches=[
+                {"start": 2, "end": 3, "content": "fixed\n"},
+                {"start": 9, "end": 9, "content": "tail\n"},
+            ],
+        )
+
+    async def _patch_file(self, repository, data, apply_patches=None):
+        lock_context = AsyncMock()
+        lock_context.__aenter__.return_value = None
+        lock_context.__aexit__.return_value = None
+        revision = MagicMock(spec=FileRevision)
+        revision.absolute_path = "/mnt/revisions/rev-1"
+        self.apply_patches_mock = apply_patches or AsyncMock()
+        self.delete_mock = AsyncMock()
+
+        with (
+            patch(
+                "app.services.file_edit.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.file_edit.locks.lock_file",
+                return_value=lock_context,
+            ),
+            patch(
+                "app.services.file_edit.isdir",
+                new=AsyncMock(return_value=False),
+            ),
+            patch(
+                "app.services.file_edit.isfile",
+                new=AsyncMock(return_value=True),
+            ),
+            patch(
+                "app.services.file_edit.get_tmp_path",
+                return_value="/tmp/patched",
+            ),
+            patch(
+                "app.services.file_edit.apply_patches",
+                new=self.apply_patches_mock,
+            ),
+            patch(
+                "app.services.file_edit.get_filesize",
+                new=AsyncMock(return_value=110),
+            ),
+            patch(
+                "app.services.file_edit.get_checksum",
+                new=AsyncMock(return_value="b" * 64),
+            ),
+            patch(
+                "app.services.file_edit.FileRevision",
+                return_value=revision,
+                __tablename__="files_revisions",
+            ),
+            patch("app.services.file_edit.copy", new=AsyncMock()),
+            patch("app.services.file_edit.delete", new=self.delete_mock),
+            patch("app.services.file_edit.write_audit", new=AsyncMock()),
+            patch(
+                "app.services.file_edit.hooks.emit", new=AsyncMock(),
+            ) as self.emit_mock,
+        ):
+            return await patch_file(AsyncMock(), MagicMock(id=10), 1, data)
+
+    def _build_repository(self, file, current_checksum):
+        repository = AsyncMock()
+        repository.select.return_value = file
+        repository.select_parent_chain.return_value = ()
+        repository.select_values.return_value = [current_checksum]
+        return repository
+
+    async def test_streams_patches_into_new_revision(self):
+        file = self._build_file()
+        repository = self._build_repository(file, "a" * 64)
+
+        result = await self._patch_file(repository, self._build_data())
+
+        self.assertIs(result, file)
+        repository.select_values.assert_awaited_once_with(
+            File, "checksum", id=1,
+        )
+        self.apply_patches_mock.assert_awaited_once_with(
+            "/mnt/files/folder/log.txt",
+            "/tmp/patched",
+            [(2, 3, b"fixed\n"), (9, 9, b"tail\n")],
+            by_line=True,
+        )
+        self.assertEqual(file.checksum, "b" * 64)
+        self.assertEqual(file.filesize, 110)
+        self.assertEqual(file.latest_revision_number, 1)
+        repository.commit.assert_awaited_once()
+        self.emit_mock.assert_awaited_once()
+
+    async def test_rejects_changed_base_before_writing(self):
+        file = self._build_file()
+        repository = self._build_repository(file, "c" * 64)
+
+        with self.assertRaises(ResourceConflictError):
+            await self._patch_file(repository, self._build_data())
+
+        self.mocks["log"].warning.assert_called_once_with(
+            "event=%s", E.FILE_EDIT_BASE_CHANGED,
+        )
+        self.apply_patches_mock.assert_not_awaited()
+        repository.insert.assert_not_awaited()
+        repository.commit.assert_not_awaited()
+
+    async def test_rejects_stale_file_row(self):
+        file = self._build_file()
+        repository = self._build_repository(file, "c" * 64)
+
+        with self.assertRaises(ResourceConflictError):
+            await self._patch_file(
+                repository, self._build_data(base_checksum="c" * 64),
+            )
+
+        self.apply_patches_mock.assert_not_awaited()
+
+    async def test_range_beyond_file_is_invalid_and_cleaned_up(self):
+        file = self._build_file()
+        repository = self._build_repository(file, "a" * 64)
+
+        with self.assertRaises(ValueInvalidError) as cm:
+            await self._patch_file(
+                repository,
+                self._build_data(),
+                apply_patches=AsyncMock(side_effect=ValueError("range")),
+            )
+
+        self.assertEqual(cm.exception.loc, ("body", "patches"))
+        self.mocks["log"].warning.assert_called_once_with(
+            "event=%s", E.FILE_EDIT_PATCH_INVALID,
+        )
+        self.delete_mock.assert_awaited_once_with("/tmp/patched")
+        repository.insert.assert_not_awaited()
+        repository.commit.assert_not_awaited()
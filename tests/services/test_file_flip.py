@@ -5,27 +5,45 @@ import unittest
 import uuid
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
-from app.errors import (
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.errors import (  # noqa: E402
     ResourceConflictError,
     ResourceLockedError,
     ResourceNotFoundError,
 )
-from app.events import Events as E
-from app.locks import LockType
-from app.models.file import File
-from app.models.file_revision import FileRevision
-from app.models.file_thumbnail import FileThumbnail
-from app.models.folder import Folder
-from app.models.user import User
-from app.schemas.file_flip import FileFlipRequest
-from app.services.file_flip import _cleanup_path, flip_file
-import app.services.file_flip as file_flip
+from app.events import Events as E  # noqa: E402
+from app.locks import LockType  # noqa: E402
+from app.models.file import File  # noqa: E402
+from app.models.file_revision import FileRevision  # noqa: E402
+from app.models.file_thumbnail import FileThumbnail  # noqa: E402
+from app.models.folder import Folder  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.schemas.file_flip import FileFlipRequest  # noqa: E402
+from app.services.file_flip import _cleanup_path, flip_file  # noqa: E402
+import app.services.file_flip as file_flip  # noqa: E402
 
 
 class TestFlipFile(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self):
         super().setUp()
+        begin_intent_patcher = patch(
+            "app.services.file_flip.begin_intent",
+            new_callable=AsyncMock,
+        )
+        self.begin_intent_mock = begin_intent_patcher.start()
+        self.addCleanup(begin_intent_patcher.stop)
+
+        end_intent_patcher = patch(
+            "app.services.file_flip.end_intent",
+            new_callable=AsyncMock,
+        )
+        self.end_intent_mock = end_intent_patcher.start()
+        self.addCleanup(end_intent_patcher.stop)
+
         self._log_patcher = patch(
             "app.services.file_flip.log",
             MagicMock(),
@@ -154,6 +172,7 @@ class TestFlipFile(unittest.IsolatedAsyncioTestCase):
             patch(
                 "app.services.file_flip.FileRevision",
                 return_value=revision,
+                __tablename__="files_revisions",
             ) as file_revision_mock,
             patch(
                 "app.services.file_flip.copy",
@@ -205,10 +224,7 @@ class TestFlipFile(unittest.IsolatedAsyncioTestCase):
         get_mimetype_mock.assert_any_await("/tmp/flipped")
         get_checksum_mock.assert_awaited_once_with("/tmp/flipped")
 
-        repository.count_all.assert_awaited_once_with(
-            file_revision_mock,
-            file_id=1,
-        )
+        repository.count_all.assert_not_awaited()
 
         file_revision_mock.assert_called_once()
         self.assertEqual(file_revision_mock.call_args.kwargs["file_id"], 1)
@@ -575,6 +591,7 @@ class TestFlipFile(unittest.IsolatedAsyncioTestCase):
             patch(
                 "app.services.file_flip.FileRevision",
                 return_value=revision,
+                __tablename__="files_revisions",
             ),
             patch(
                 "app.services.file_flip.copy",
@@ -668,6 +685,7 @@ class TestFlipFile(unittest.IsolatedAsyncioTestCase):
             patch(
                 "app.services.file_flip.FileRevision",
                 return_value=revision,
+                __tablename__="files_revisions",
             ),
             patch(
                 "app.services.file_flip.copy",
@@ -770,6 +788,7 @@ class TestFlipFile(unittest.IsolatedAsyncioTestCase):
             patch(
                 "app.services.file_flip.FileRevision",
                 return_value=revision,
+                __tablename__="files_revisions",
             ),
             patch(
                 "app.services.file_flip.FileThumbnail",
@@ -895,6 +914,7 @@ class TestFlipFile(unittest.IsolatedAsyncioTestCase):
             patch(
                 "app.services.file_flip.FileRevision",
                 return_value=revision,
+                __tablename__="files_revisions",
             ),
             patch(
                 "app.services.file_flip.FileThumbnail",
@@ -992,6 +1012,7 @@ class TestFlipFile(unittest.IsolatedAsyncioTestCase):
             patch(
                 "app.services.file_flip.FileRevision",
                 return_value=revision,
+                __tablename__="files_revisions",
             ),
             patch(
                 "app.services.file_flip.copy",
@@ -1097,6 +1118,7 @@ class TestFlipFile(unittest.IsolatedAsyncioTestCase):
             patch(
                 "app.services.file_flip.FileRevision",
                 return_value=revision,
+                __tablename__="files_revisions",
             ),
             patch(
                 "app.services.file_flip.copy",
@@ -1201,6 +1223,7 @@ class TestFlipFile(unittest.IsolatedAsyncioTestCase):
             patch(
                 "app.services.file_flip.FileRevision",
                 return_value=revision,
+                __tablename__="files_revisions",
             ),
             patch(
                 "app.services.file_flip.copy",
@@ -0,0 +1,448 @@
+# tests/services/test_file_import.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.db.engine import load_all_models  # noqa: E402
+from app.errors import (  # noqa: E402
+    InsufficientStorageError,
+    ResourceConflictError,
+    ResourceLockedError,
+    ResourceNotFoundError,
+    ValueInvalidError,
+)
+from app.events import Events as E  # noqa: E402
+from app.locks import LockType  # noqa: E402
+from app.models.file import File  # noqa: E402
+from app.models.folder import Folder  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.repositories.archive import ArchiveMember, ArchiveReader  # noqa: E402
+from app.repositories.intent import ACTION_DELETE, ACTION_RMDIR  # noqa: E402
+from app.schemas.file_import import FileImportStatus  # noqa: E402
+from app.services.file_import import (  # noqa: E402
+    _split_path,
+    import_archive,
+)
+
+load_all_models()
+
+S = FileImportStatus
+
+
+def _member(name, is_dir=False, is_supported=True, size=0):
+    return ArchiveMember(
+        name=name, size=size, is_dir=is_dir, is_supported=is_supported,
+    )
+
+
+class _Repository:
+    """In-memory stand-in for the ORM repository used by the import."""
+
+    def __init__(self, target, folders=(), files=()):
+        self.target = target
+        self.folders = {folder.id: folder for folder in (target, *folders)}
+        self.files = list(files)
+        self.next_id = 100
+        self.inserted = []
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+
+    async def select(self, cls, obj_id=None, **filters):
+        if cls is Folder and obj_id is not None:
+            return self.folders.get(obj_id)
+        rows = self.folders.values() if cls is Folder else self.files
+        for row in rows:
+            if all(getattr(row, k) == v for k, v in filters.items()):
+                return row
+        return None
+
+    async def select_parent_chain(self, folder):
+        chain = []
+        while folder.parent_id is not None:
+            folder = self.folders[folder.parent_id]
+            chain.append(folder)
+        return tuple(chain)
+
+    async def insert(self, obj):
+        obj.id = self.next_id
+        self.next_id += 1
+        if isinstance(obj, Folder):
+            obj.children_count = 0
+            obj.files_count = 0
+            obj.is_write_protected = False
+            self.folders[obj.id] = obj
+        else:
+            self.files.append(obj)
+        self.inserted.append(obj)
+
+
+class TestImportArchive(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.fs = {
+            name: patcher.start()
+            for name, patcher in {
+                name: patch(
+                    f"app.services.file_import.{name}", new_callable=AsyncMock,
+                )
+                for name in (
+                    "write_stream", "delete", "isdir", "isfile", "mkdir",
+                    "rmdir", "rename", "write_audit", "begin_intent",
+                    "end_intent", "get_filesize", "get_mimetype",
+                    "get_checksum", "get_free_bytes",
+                )
+            }.items()
+        }
+        self.addCleanup(patch.stopall)
+
+        self.fs["isdir"].return_value = False
+        self.fs["isfile"].return_value = False
+        self.fs["get_filesize"].return_value = 3
+        self.fs["get_mimetype"].return_value = "text/plain"
+        self.fs["get_checksum"].return_value = "sum"
+        self.fs["get_free_bytes"].return_value = 1 << 40
+
+        self.config = MagicMock(
+            FILES_TMP_DIR="/tmp",
+            FILES_IMPORT_MAX_EXTRACTED_BYTES=1 << 20,
+            UPLOADS_MIN_FREE_BYTES=1024,
+        )
+        patch(
+            "app.services.file_import.get_config", return_value=self.config,
+        ).start()
+
+        tmp_paths = iter(f"/tmp/t{index}" for index in range(1000))
+        patch(
+            "app.services.file_import.get_tmp_path",
+            side_effect=lambda: next(tmp_paths),
+        ).start()
+
+        self.lock_mock = patch(
+            "app.services.file_import.locks.lock_directory",
+        ).start()
+        self.emit_mock = patch(
+            "app.services.file_import.hooks.emit", new_callable=AsyncMock,
+        ).start()
+
+        self.target = Folder(
+            id=1, parent_id=None, dirname="target", created_by=1,
+            is_write_protected=False, children_count=0, files_count=0,
+        )
+        self.root = self.target.get_absolute_dir(())
+        self.user = MagicMock(spec=User)
+        self.user.id = 10
+
+    def _reader(self, members):
+        reader = MagicMock()
+        reader.members = members
+        reader.extract = AsyncMock()
+        reader.close = AsyncMock()
+        patch(
+            "app.services.file_import.ArchiveReader.open",
+            new=AsyncMock(return_value=reader),
+        ).start()
+        return reader
+
+    async def _import(self, repository):
+        with patch(
+            "app.services.file_import.ORMRepository",
+            return_value=repository,
+        ):
+            return await import_archive(
+                session=AsyncMock(),
+                user=self.user,
+                folder_id=1,
+                data=MagicMock(),
+            )
+
+    async def test_creates_folders_and_files_in_one_batch(self):
+        reader = self._reader([
+            _member("docs/", is_dir=True),
+            _member("docs/a.txt"),
+            _member("docs/sub/b.txt"),
+            _member("../evil.txt"),
+            _member("link", is_supported=False),
+        ])
+        repository = _Repository(self.target)
+
+        results = await self._import(repository)
+
+        self.assertEqual(
+            [(r.path, r.status) for r in results],
+            [
+                ("docs/", S.CREATED),
+                ("docs/a.txt", S.CREATED),
+                ("docs/sub/b.txt", S.CREATED),
+                ("../evil.txt", S.INVALID),
+                ("link", S.INVALID),
+            ],
+        )
+        self.assertEqual(results[0].folder_id, 100)
+        self.assertEqual(results[1].file_id, 101)
+        self.assertEqual(results[2].file_id, 103)
+
+        self.lock_mock.assert_called_once_with(
+            self.root, LockType.WRITE,
+        )
+        self.assertEqual(
+            [c.args[0] for c in self.fs["mkdir"].await_args_list],
+            [self.root + "/docs", self.root + "/docs/sub"],
+        )
+        self.assertEqual(
+            [c.args for c in self.fs["rename"].await_args_list],
+            [
+                ("/tmp/t1", self.root + "/docs/a.txt"),
+                ("/tmp/t2", self.root + "/docs/sub/b.txt"),
+            ],
+        )
+        self.assertEqual(self.target.children_count, 1)
+        self.assertEqual(repository.folders[100].files_count, 1)
+        repository.commit.assert_awaited_once_with()
+        self.assertEqual(reader.extract.await_count, 2)
+
+        intent = self.fs["begin_intent"].await_args.args[0]
+        self.assertEqual(intent.table, Folder.__tablename__)
+        self.assertEqual(intent.filters, {"id": 100})
+        self.assertEqual(intent.on_rollback, [
+            (ACTION_DELETE, self.root + "/docs/a.txt"),
+            (ACTION_DELETE, self.root + "/docs/sub/b.txt"),
+            (ACTION_RMDIR, self.root + "/docs/sub"),
+            (ACTION_RMDIR, self.root + "/docs"),
+            (ACTION_DELETE, "/tmp/t1"),
+            (ACTION_DELETE, "/tmp/t2"),
+        ])
+        self.fs["end_intent"].assert_awaited_once_with(intent)
+
+        events = [
+            c.kwargs["event"] for c in self.fs["write_audit"].call_args_list
+        ]
+        self.assertEqual(events, [
+            E.FOLDER_CREATE_COMPLETED, E.FOLDER_CREATE_COMPLETED,
+            E.FILE_UPLOAD_COMPLETED, E.FILE_UPLOAD_COMPLETED,
+        ])
+
+        self.fs["delete"].assert_any_await("/tmp/t0")
+        reader.close.assert_awaited_once_with()
+        self.emit_mock.assert_awaited_once()
+        self.assertEqual(
+            self.emit_mock.await_args.args[0], E.FILE_IMPORT_COMPLETED,
+        )
+
+    async def test_reuses_existing_folder_and_skips_existing_file(self):
+        existing = Folder(
+            id=2, parent_id=1, dirname="docs", created_by=1,
+            is_write_protected=False, children_count=0, files_count=1,
+        )
+        taken = File(id=7, folder_id=2, filename="a.txt")
+        self._reader([
+            _member("./", is_dir=True),
+            _member("docs/", is_dir=True),
+            _member("docs/a.txt"),
+        ])
+        repository = _Repository(self.target, [existing], [taken])
+
+        results = await self._import(repository)
+
+        self.assertEqual(
+            [(r.status, r.folder_id) for r in results],
+            [(S.EXISTS, 1), (S.EXISTS, 2), (S.CONFLICT, None)],
+        )
+        self.fs["begin_intent"].assert_not_awaited()
+        repository.commit.assert_not_awaited()
+        self.fs["delete"].assert_any_await("/tmp/t1")
+
+    async def test_write_protected_subfolder_is_locked(self):
+        existing = Folder(
+            id=2, parent_id=1, dirname="docs", created_by=1,
+            is_write_protected=True, children_count=0, files_count=0,
+        )
+        self._reader([_member("docs/a.txt"), _member("docs/b.txt")])
+        repository = _Repository(self.target, [existing])
+
+        results = await self._import(repository)
+
+        self.assertEqual(
+            [r.status for r in results], [S.LOCKED, S.LOCKED],
+        )
+        self.fs["rename"].assert_not_awaited()
+
+    async def test_depth_and_path_limits_are_invalid(self):
+        self._reader([
+            _member("a/b/c.txt"),
+            _member("x" * 200 + "/y.txt"),
+        ])
+        repository = _Repository(self.target)
+
+        with (
+            patch("app.services.file_import.FILES_MAX_FOLDER_DEPTH", 1),
+            patch(
+                "app.services.file_import.FILES_MAX_PATH_LENGTH_BYTES",
+                len(self.root) + 64,
+            ),
+        ):
+            results = await self._import(repository)
+
+        self.assertEqual(
+            [r.status for r in results], [S.INVALID, S.INVALID],
+        )
+        self.assertEqual(
+            [folder.dirname for folder in repository.inserted], ["a"],
+        )
+
+    async def test_existing_filesystem_entry_is_conflict(self):
+        self._reader([_member("a.txt")])
+        self.fs["isfile"].return_value = True
+        repository = _Repository(self.target)
+
+        results = await self._import(repository)
+
+        self.assertEqual(results[0].status, S.CONFLICT)
+        self.assertEqual(repository.inserted, [])
+
+    async def test_extract_failure_marks_entry_failed(self):
+        reader = self._reader([_member("a.txt"), _member("b.txt")])
+        reader.extract.side_effect = [ValueError("corrupted"), None]
+        repository = _Repository(self.target)
+
+        results = await self._import(repository)
+
+        self.assertEqual(
+            [r.status for r in results], [S.FAILED, S.CREATED],
+        )
+        self.fs["delete"].assert_any_await("/tmp/t1")
+
+    async def test_commit_failure_reverts_batch(self):
+        self._reader([_member("docs/a.txt")])
+        repository = _Repository(self.target)
+        repository.commit.side_effect = RuntimeError("disk I/O error")
+
+        results = await self._import(repository)
+
+        self.assertEqual(results[0].status, S.FAILED)
+        repository.rollback.assert_awaited_once_with()
+        self.fs["delete"].assert_any_await(self.root + "/docs/a.txt")
+        self.fs["rmdir"].assert_awaited_once_with(self.root + "/docs")
+        self.fs["end_intent"].assert_awaited_once()
+
+    async def test_batches_commit_separately_and_reuse_folders(self):
+        self._reader([_member("docs/a.txt"), _member("docs/b.txt")])
+        repository = _Repository(self.target)
+
+        with patch("app.services.file_import.FILES_BULK_BATCH_SIZE", 1):
+            results = await self._import(repository)
+
+        self.assertEqual(
+            [r.status for r in results], [S.CREATED, S.CREATED],
+        )
+        self.assertEqual(repository.commit.await_count, 2)
+        self.fs["mkdir"].assert_awaited_once_with(self.root + "/docs")
+
+        second = self.fs["begin_intent"].await_args_list[1].args[0]
+        self.assertEqual(second.table, File.__tablename__)
+
+    async def test_folder_not_found(self):
+        repository = _Repository(self.target)
+        repository.folders.clear()
+
+        with self.assertRaises(ResourceNotFoundError):
+            await self._import(repository)
+
+        self.fs["write_stream"].assert_not_awaited()
+
+    async def test_write_protected_target(self):
+        self.target.is_write_protected = True
+
+        with self.assertRaises(ResourceLockedError):
+            await self._import(_Repository(self.target))
+
+        self.fs["write_stream"].assert_not_awaited()
+
+    async def test_invalid_archive(self):
+        patch(
+            "app.services.file_import.ArchiveReader.open",
+            new=AsyncMock(side_effect=ValueError("not an archive")),
+        ).start()
+
+        with self.assertRaises(ValueInvalidError):
+            await self._import(_Repository(self.target))
+
+        self.fs["delete"].assert_awaited_once_with("/tmp/t0")
+
+    async def test_too_many_entries(self):
+        reader = self._reader([_member("a.txt"), _member("b.txt")])
+
+        with (
+            patch("app.services.file_import.FILES_ARCHIVE_MAX_ITEMS", 1),
+            self.assertRaises(ResourceConflictError),
+        ):
+            await self._import(_Repository(self.target))
+
+        self.lock_mock.assert_not_called()
+        reader.close.assert_awaited_once_with()
+        self.fs["delete"].assert_awaited_once_with("/tmp/t0")
+
+    async def test_compressible_archive_over_size_limit(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, "bomb.zip")
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("zeros.bin", bytes(4 << 20))
+        self.assertLess(os.path.getsize(path), 64 << 10)
+
+        reader = await ArchiveReader.open(path)
+        reader.extract = AsyncMock()
+        patch(
+            "app.services.file_import.ArchiveReader.open",
+            new=AsyncMock(return_value=reader),
+        ).start()
+
+        with self.assertRaises(ResourceConflictError):
+            await self._import(_Repository(self.target))
+
+        reader.extract.assert_not_awaited()
+        self.lock_mock.assert_not_called()
+        self.fs["delete"].assert_awaited_once_with("/tmp/t0")
+
+    async def test_archive_over_free_space_floor(self):
+        reader = self._reader([
+            _member("docs/", is_dir=True),
+            _member("docs/a.txt", size=600),
+            _member("docs/link", is_supported=False, size=5000),
+        ])
+        self.fs["get_free_bytes"].return_value = 1500
+
+        with self.assertRaises(InsufficientStorageError):
+            await self._import(_Repository(self.target))
+
+        self.fs["get_free_bytes"].assert_awaited_once_with("/tmp")
+        reader.extract.assert_not_awaited()
+        self.lock_mock.assert_not_called()
+
+    async def test_archive_within_free_space_floor(self):
+        self._reader([_member("a.txt", size=400)])
+        self.fs["get_free_bytes"].return_value = 1500
+
+        results = await self._import(_Repository(self.target))
+
+        self.assertEqual([r.status for r in results], [S.CREATED])
+
+
+class TestSplitPath(unittest.TestCase):
+
+    def test_returns_relative_segments(self):
+        self.assertEqual(_split_path("a/./b//c.txt"), ("a", "b", "c.txt"))
+        self.assertEqual(_split_path("dir/"), ("dir",))
+        self.assertEqual(_split_path("./"), ())
+
+    def test_rejects_unsafe_paths(self):
+        for name in ("/etc/passwd", "a/../b", "..", "a\\b", "x" * 256):
+            with self.subTest(name=name):
+                self.assertIsNone(_split_path(name))
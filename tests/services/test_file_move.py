@@ -6,23 +6,43 @@ from unittest.mock import AsyncMock, MagicMock, call, patch
 
 from sqlalchemy.exc import IntegrityError
 
-from app.constants import FILES_MAX_PATH_LENGTH_BYTES
-from app.errors import (
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.constants import FILES_MAX_PATH_LENGTH_BYTES  # noqa: E402
+from app.errors import (  # noqa: E402
     ResourceConflictError,
     ResourceLockedError,
     ResourceNotFoundError,
 )
-from app.events import Events as E
-from app.locks import LockType
-from app.models.file import File
-from app.models.folder import Folder
-from app.models.user import User
-from app.schemas.file_move import FileMoveRequest
-from app.services.file_move import move_file
+from app.events import Events as E  # noqa: E402
+from app.locks import LockType  # noqa: E402
+from app.models.file import File  # noqa: E402
+from app.models.folder import Folder  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.repositories.intent import ACTION_RENAME  # noqa: E402
+from app.schemas.file_move import FileMoveRequest  # noqa: E402
+from app.services.file_move import move_file  # noqa: E402
 
 
 class TestMoveFile(unittest.IsolatedAsyncioTestCase):
 
+    def setUp(self):
+        begin_intent_patcher = patch(
+            "app.services.file_move.begin_intent",
+            new_callable=AsyncMock,
+        )
+        self.begin_intent_mock = begin_intent_patcher.start()
+        self.addCleanup(begin_intent_patcher.stop)
+
+        end_intent_patcher = patch(
+            "app.services.file_move.end_intent",
+            new_callable=AsyncMock,
+        )
+        self.end_intent_mock = end_intent_patcher.start()
+        self.addCleanup(end_intent_patcher.stop)
+
     def _build_user(self):
         user = MagicMock(spec=User)
         user.id = 10
@@ -40,6 +60,7 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
         folder.files_count = files_count
         folder.is_write_protected = False
         folder.is_write_protected_recursive.return_value = False
+        folder.get_absolute_dir.return_value = f"/mnt/files/{folder_id}"
         return folder
 
     def _build_file(self, source_folder):
@@ -74,9 +95,6 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
             destination_parent_chain,
         ]
 
-        config = MagicMock()
-        config.FILES_DIR = "/mnt/files"
-
         lock_context = self._build_lock_context()
 
         with (
@@ -85,13 +103,9 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
                 return_value=repository,
             ),
             patch(
-                "app.services.file_move.get_config",
-                return_value=config,
-            ),
-            patch(
-                "app.services.file_move.locks.lock_directory",
+                "app.services.file_move.locks.lock_many",
                 return_value=lock_context,
-            ) as lock_directory_mock,
+            ) as lock_many_mock,
             patch(
                 "app.services.file_move.rename",
                 new=AsyncMock(),
@@ -157,9 +171,15 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
             ],
         )
 
-        lock_directory_mock.assert_called_once_with(
-            "/mnt/files",
+        lock_many_mock.assert_called_once_with(
             LockType.WRITE,
+            dir_paths=("/mnt/files/1", "/mnt/files/2"),
+        )
+        source_folder.get_absolute_dir.assert_called_once_with(
+            source_parent_chain,
+        )
+        destination_folder.get_absolute_dir.assert_called_once_with(
+            destination_parent_chain,
         )
         lock_context.__aenter__.assert_awaited_once()
         lock_context.__aexit__.assert_awaited_once()
@@ -198,6 +218,17 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
         repository.commit.assert_awaited_once()
         repository.rollback.assert_not_awaited()
 
+        intent = self.begin_intent_mock.await_args.args[0]
+        self.assertEqual(intent.table, File.__tablename__)
+        self.assertEqual(intent.filters, {"id": 42, "folder_id": 2})
+        self.assertEqual(intent.on_commit, [])
+        self.assertEqual(intent.on_rollback, [(
+            ACTION_RENAME,
+            "/mnt/files/destination/document.txt",
+            "/mnt/files/source/document.txt",
+        )])
+        self.end_intent_mock.assert_awaited_once_with(intent)
+
         emit_mock.assert_awaited_once_with(
             E.FILE_MOVE_COMPLETED,
             session,
@@ -220,9 +251,9 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
                 return_value=repository,
             ),
             patch(
-                "app.services.file_move.locks.lock_directory",
+                "app.services.file_move.locks.lock_many",
                 return_value=lock_context,
-            ) as lock_directory_mock,
+            ) as lock_many_mock,
             patch(
                 "app.services.file_move.rename",
                 new=AsyncMock(),
@@ -250,7 +281,7 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
         repository.commit.assert_not_awaited()
         repository.rollback.assert_not_awaited()
 
-        lock_directory_mock.assert_not_called()
+        lock_many_mock.assert_not_called()
         lock_context.__aenter__.assert_not_awaited()
         rename_mock.assert_not_awaited()
         write_audit_mock.assert_not_awaited()
@@ -278,9 +309,9 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
                 return_value=repository,
             ),
             patch(
-                "app.services.file_move.locks.lock_directory",
+                "app.services.file_move.locks.lock_many",
                 return_value=lock_context,
-            ) as lock_directory_mock,
+            ) as lock_many_mock,
             patch(
                 "app.services.file_move.rename",
                 new=AsyncMock(),
@@ -314,7 +345,7 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
         repository.commit.assert_not_awaited()
         repository.rollback.assert_not_awaited()
 
-        lock_directory_mock.assert_not_called()
+        lock_many_mock.assert_not_called()
         rename_mock.assert_not_awaited()
         write_audit_mock.assert_not_awaited()
         emit_mock.assert_not_awaited()
@@ -340,9 +371,9 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
                 return_value=repository,
             ),
             patch(
-                "app.services.file_move.locks.lock_directory",
+                "app.services.file_move.locks.lock_many",
                 return_value=lock_context,
-            ) as lock_directory_mock,
+            ) as lock_many_mock,
             patch(
                 "app.services.file_move.rename",
                 new=AsyncMock(),
@@ -375,7 +406,7 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
         repository.commit.assert_not_awaited()
         repository.rollback.assert_not_awaited()
 
-        lock_directory_mock.assert_not_called()
+        lock_many_mock.assert_not_called()
         rename_mock.assert_not_awaited()
         write_audit_mock.assert_not_awaited()
         emit_mock.assert_not_awaited()
@@ -402,9 +433,9 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
                 return_value=repository,
             ),
             patch(
-                "app.services.file_move.locks.lock_directory",
+                "app.services.file_move.locks.lock_many",
                 return_value=lock_context,
-            ) as lock_directory_mock,
+            ) as lock_many_mock,
             patch(
                 "app.services.file_move.rename",
                 new=AsyncMock(),
@@ -442,7 +473,7 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
         repository.commit.assert_not_awaited()
         repository.rollback.assert_not_awaited()
 
-        lock_directory_mock.assert_not_called()
+        lock_many_mock.assert_not_called()
         rename_mock.assert_not_awaited()
         write_audit_mock.assert_not_awaited()
         emit_mock.assert_not_awaited()
@@ -475,9 +506,9 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
                 return_value=repository,
             ),
             patch(
-                "app.services.file_move.locks.lock_directory",
+                "app.services.file_move.locks.lock_many",
                 return_value=lock_context,
-            ) as lock_directory_mock,
+            ) as lock_many_mock,
             patch(
                 "app.services.file_move.rename",
                 new=AsyncMock(),
@@ -507,7 +538,7 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
         repository.commit.assert_not_awaited()
         repository.rollback.assert_not_awaited()
 
-        lock_directory_mock.assert_not_called()
+        lock_many_mock.assert_not_called()
         rename_mock.assert_not_awaited()
         write_audit_mock.assert_not_awaited()
         emit_mock.assert_not_awaited()
@@ -537,9 +568,9 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
                 return_value=repository,
             ),
             patch(
-                "app.services.file_move.locks.lock_directory",
+                "app.services.file_move.locks.lock_many",
                 return_value=lock_context,
-            ) as lock_directory_mock,
+            ) as lock_many_mock,
             patch(
                 "app.services.file_move.rename",
                 new=AsyncMock(),
@@ -565,7 +596,7 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
         repository.commit.assert_not_awaited()
         repository.rollback.assert_not_awaited()
 
-        lock_directory_mock.assert_not_called()
+        lock_many_mock.assert_not_called()
         rename_mock.assert_not_awaited()
         write_audit_mock.assert_not_awaited()
         emit_mock.assert_not_awaited()
@@ -588,9 +619,6 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
         ]
         repository.select_parent_chain.side_effect = [(), ()]
 
-        config = MagicMock()
-        config.FILES_DIR = "/mnt/files"
-
         lock_context = self._build_lock_context()
 
         with (
@@ -599,11 +627,7 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
                 return_value=repository,
             ),
             patch(
-                "app.services.file_move.get_config",
-                return_value=config,
-            ),
-            patch(
-                "app.services.file_move.locks.lock_directory",
+                "app.services.file_move.locks.lock_many",
                 return_value=lock_context,
             ),
             patch(
@@ -657,9 +681,6 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
         repository.select.side_effect = [file, destination_folder, None]
         repository.select_parent_chain.side_effect = [(), ()]
 
-        config = MagicMock()
-        config.FILES_DIR = "/mnt/files"
-
         lock_context = self._build_lock_context()
 
         with (
@@ -668,11 +689,7 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
                 return_value=repository,
             ),
             patch(
-                "app.services.file_move.get_config",
-                return_value=config,
-            ),
-            patch(
-                "app.services.file_move.locks.lock_directory",
+                "app.services.file_move.locks.lock_many",
                 return_value=lock_context,
             ),
             patch(
@@ -728,9 +745,6 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
         repository.select.side_effect = [file, destination_folder, None]
         repository.select_parent_chain.side_effect = [(), ()]
 
-        config = MagicMock()
-        config.FILES_DIR = "/mnt/files"
-
         lock_context = self._build_lock_context()
 
         with (
@@ -739,11 +753,7 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
                 return_value=repository,
             ),
             patch(
-                "app.services.file_move.get_config",
-                return_value=config,
-            ),
-            patch(
-                "app.services.file_move.locks.lock_directory",
+                "app.services.file_move.locks.lock_many",
                 return_value=lock_context,
             ),
             patch(
@@ -799,9 +809,6 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
         repository.select_parent_chain.side_effect = [(), ()]
         repository.update.side_effect = IntegrityError(None, None, None)
 
-        config = MagicMock()
-        config.FILES_DIR = "/mnt/files"
-
         lock_context = self._build_lock_context()
 
         with (
@@ -810,11 +817,7 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
                 return_value=repository,
             ),
             patch(
-                "app.services.file_move.get_config",
-                return_value=config,
-            ),
-            patch(
-                "app.services.file_move.locks.lock_directory",
+                "app.services.file_move.locks.lock_many",
                 return_value=lock_context,
             ),
             patch(
@@ -881,9 +884,6 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
         repository.select_parent_chain.side_effect = [(), ()]
         repository.update.side_effect = IntegrityError(None, None, None)
 
-        config = MagicMock()
-        config.FILES_DIR = "/mnt/files"
-
         lock_context = self._build_lock_context()
 
         rename_mock = AsyncMock(
@@ -899,11 +899,7 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
                 return_value=repository,
             ),
             patch(
-                "app.services.file_move.get_config",
-                return_value=config,
-            ),
-            patch(
-                "app.services.file_move.locks.lock_directory",
+                "app.services.file_move.locks.lock_many",
                 return_value=lock_context,
             ),
             patch(
@@ -976,9 +972,6 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
         repository.select.side_effect = [file, destination_folder, None]
         repository.select_parent_chain.side_effect = [(), ()]
 
-        config = MagicMock()
-        config.FILES_DIR = "/mnt/files"
-
         lock_context = self._build_lock_context()
 
         with (
@@ -987,11 +980,7 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
                 return_value=repository,
             ),
             patch(
-                "app.services.file_move.get_config",
-                return_value=config,
-            ),
-            patch(
-                "app.services.file_move.locks.lock_directory",
+                "app.services.file_move.locks.lock_many",
                 return_value=lock_context,
             ),
             patch(
@@ -1059,9 +1048,6 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
         repository.select.side_effect = [file, destination_folder, None]
         repository.select_parent_chain.side_effect = [(), ()]
 
-        config = MagicMock()
-        config.FILES_DIR = "/mnt/files"
-
         lock_context = self._build_lock_context()
 
         rename_mock = AsyncMock(side_effect=[None, restore_error])
@@ -1072,11 +1058,7 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
                 return_value=repository,
             ),
             patch(
-                "app.services.file_move.get_config",
-                return_value=config,
-            ),
-            patch(
-                "app.services.file_move.locks.lock_directory",
+                "app.services.file_move.locks.lock_many",
                 return_value=lock_context,
             ),
             patch(
@@ -1147,9 +1129,6 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
         repository.select.side_effect = [file, destination_folder, None]
         repository.select_parent_chain.side_effect = [(), ()]
 
-        config = MagicMock()
-        config.FILES_DIR = "/mnt/files"
-
         lock_context = self._build_lock_context()
 
         with (
@@ -1158,11 +1137,7 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
                 return_value=repository,
             ),
             patch(
-                "app.services.file_move.get_config",
-                return_value=config,
-            ),
-            patch(
-                "app.services.file_move.locks.lock_directory",
+                "app.services.file_move.locks.lock_many",
                 return_value=lock_context,
             ),
             patch(
@@ -1221,9 +1196,6 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
         repository.select.side_effect = [file, destination_folder, None]
         repository.select_parent_chain.side_effect = [(), ()]
 
-        config = MagicMock()
-        config.FILES_DIR = "/mnt/files"
-
         lock_context = self._build_lock_context()
 
         with (
@@ -1232,11 +1204,7 @@ class TestMoveFile(unittest.IsolatedAsyncioTestCase):
                 return_value=repository,
             ),
             patch(
-                "app.services.file_move.get_config",
-                return_value=config,
-            ),
-            patch(
-                "app.services.file_move.locks.lock_directory",
+                "app.services.file_move.locks.lock_many",
                 return_value=lock_context,
             ),
             patch(
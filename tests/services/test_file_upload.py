@@ -4,25 +4,29 @@
 import unittest
 import uuid
 from contextlib import ExitStack
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 from sqlalchemy.exc import IntegrityError
 
-from app.db.engine import load_all_models
-from app.errors import (
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.db.engine import load_all_models  # noqa: E402
+from app.errors import (  # noqa: E402
     ResourceConflictError,
     ResourceLockedError,
     ResourceNotFoundError,
     ValueInvalidError,
 )
-from app.events import Events as E
-from app.locks import LockType
-from app.models.file import File
-from app.models.file_revision import FileRevision
-from app.models.file_thumbnail import FileThumbnail
-from app.models.folder import Folder
-from app.models.user import User
-from app.services.file_upload import _cleanup_path, upload_file
+from app.events import Events as E  # noqa: E402
+from app.locks import LockType  # noqa: E402
+from app.models.file import File  # noqa: E402
+from app.models.file_thumbnail import FileThumbnail  # noqa: E402
+from app.models.folder import Folder  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.repositories.intent import ACTION_COPY, ACTION_DELETE  # noqa: E402
+from app.services.file_upload import _cleanup_path, upload_file  # noqa: E402
 
 load_all_models()
 
@@ -34,6 +38,28 @@ class TestUploadFile(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self):
         super().setUp()
+        begin_intent_patcher = patch(
+            "app.services.file_upload.begin_intent",
+            new_callable=AsyncMock,
+        )
+        self.begin_intent_mock = begin_intent_patcher.start()
+        self.addCleanup(begin_intent_patcher.stop)
+
+        end_intent_patcher = patch(
+            "app.services.file_upload.end_intent",
+            new_callable=AsyncMock,
+        )
+        self.end_intent_mock = end_intent_patcher.start()
+        self.addCleanup(end_intent_patcher.stop)
+
+        is_delta_due_patcher = patch(
+            "app.services.file_upload.is_delta_due",
+            new_callable=AsyncMock,
+            return_value=False,
+        )
+        self.is_delta_due_mock = is_delta_due_patcher.start()
+        self.addCleanup(is_delta_due_patcher.stop)
+
         self.thumbnail_cache_mock = MagicMock()
         self._thumbnail_cache_patcher = patch(
             "app.services.file_upload.get_thumbnail_cache",
@@ -85,6 +111,33 @@ class TestUploadFile(unittest.IsolatedAsyncioTestCase):
         existing.latest_revision_number = 0
         return existing
 
+    async def test_stages_uploaded_file_through_store_upload(self):
+        session = AsyncMock()
+        user = MagicMock()
+        uploaded_file = MagicMock(filename="a.txt")
+        stored = MagicMock()
+
+        async def fake_store_upload(s, u, folder_id, filename, stage):
+            await stage("/tmp/staged")
+            return stored
+
+        with (
+            patch(
+                "app.services.file_upload.store_upload",
+                new=AsyncMock(side_effect=fake_store_upload),
+            ) as store_mock,
+            patch(
+                "app.services.file_upload.upload", new=AsyncMock(),
+            ) as upload_mock,
+        ):
+            result = await upload_file(session, user, 5, uploaded_file)
+
+        self.assertIs(result, stored)
+        self.assertEqual(
+            store_mock.await_args.args[:4], (session, user, 5, "a.txt"),
+        )
+        upload_mock.assert_awaited_once_with(uploaded_file, "/tmp/staged")
+
     async def test_raises_not_found_when_folder_missing(self):
         session = AsyncMock()
         user = self._build_user()
@@ -952,10 +1005,7 @@ class TestUploadFile(unittest.IsolatedAsyncioTestCase):
             (STAGED_TMP, main_path),
         )
 
-        repository.count_all.assert_awaited_once_with(
-            FileRevision,
-            file_id=42,
-        )
+        repository.count_all.assert_not_awaited()
 
         repository.insert.assert_awaited_once()
         inserted = repository.insert.await_args[0][0]
@@ -973,19 +1023,20 @@ class TestUploadFile(unittest.IsolatedAsyncioTestCase):
             existing,
         )
 
-    async def test_revision_number_is_count_all_plus_one(self):
+    async def test_revision_number_follows_latest_revision_number(self):
         session = AsyncMock()
         user = self._build_user()
         uploaded = self._build_upload("document.txt")
         folder = self._build_folder()
         existing = self._build_existing_file_mock()
+        existing.latest_revision_number = 7
 
         repository = AsyncMock()
         repository.select = AsyncMock(
             side_effect=[folder, existing, None],
         )
         repository.select_parent_chain.return_value = ()
-        repository.count_all = AsyncMock(return_value=7)
+        repository.count_all = AsyncMock(return_value=3)
 
         config = MagicMock()
         config.FILES_DIR = "/mnt/files"
@@ -1046,14 +1097,116 @@ class TestUploadFile(unittest.IsolatedAsyncioTestCase):
         ):
             await upload_file(session, user, 1, uploaded)
 
-        repository.count_all.assert_awaited_once_with(
-            FileRevision,
-            file_id=42,
-        )
+        repository.count_all.assert_not_awaited()
         inserted = repository.insert.await_args[0][0]
         self.assertEqual(inserted.revision_number, 8)
         self.assertEqual(existing.latest_revision_number, 8)
 
+    async def test_revision_stores_delta_and_removes_backup_after_commit(
+        self,
+    ):
+        session = AsyncMock()
+        user = self._build_user()
+        uploaded = self._build_upload("document.txt")
+        folder = self._build_folder()
+        existing = self._build_existing_file_mock()
+
+        repository = AsyncMock()
+        repository.select = AsyncMock(
+            side_effect=[folder, existing, None],
+        )
+        repository.select_parent_chain.return_value = ()
+
+        config = MagicMock()
+        config.FILES_DIR = "/mnt/files"
+        config.FILES_REVISIONS_DIR = "/mnt/revisions"
+
+        fixed_uuid = uuid.UUID("12345678-1234-5678-1234-567812345678")
+        self.is_delta_due_mock.return_value = True
+
+        with (
+            patch(
+                "app.services.file_upload.ORMRepository",
+                return_value=repository,
+            ),
+            patch("app.models.file.get_config", return_value=config),
+            patch("app.models.folder.get_config", return_value=config),
+            patch(
+                "app.models.file_revision.get_config",
+                return_value=config,
+            ),
+            patch(
+                "app.services.file_upload.uuid.uuid4",
+                return_value=fixed_uuid,
+            ),
+            patch(
+                "app.services.file_upload.locks.lock_directory",
+                return_value=self._build_lock_context(),
+            ),
+            patch(
+                "app.services.file_upload.get_tmp_path",
+                side_effect=[STAGED_TMP, "/tmp/backup"],
+            ),
+            patch("app.services.file_upload.upload", new=AsyncMock()),
+            patch(
+                "app.services.file_upload.copy",
+                new=AsyncMock(),
+            ) as copy_mock,
+            patch(
+                "app.services.file_upload.write_revision_delta",
+                new=AsyncMock(),
+            ) as write_delta_mock,
+            patch(
+                "app.services.file_upload.get_filesize",
+                new=AsyncMock(return_value=200),
+            ),
+            patch(
+                "app.services.file_upload.get_mimetype",
+                new=AsyncMock(return_value="text/plain"),
+            ),
+            patch(
+                "app.services.file_upload.get_checksum",
+                new=AsyncMock(return_value="d" * 64),
+            ),
+            patch(
+                "app.services.file_upload.delete",
+                new=AsyncMock(),
+            ) as delete_mock,
+            patch("app.services.file_upload.write_audit", new=AsyncMock()),
+            patch("app.services.file_upload.hooks.emit", new=AsyncMock()),
+            patch(
+                "app.services.file_upload.isdir",
+                new=AsyncMock(return_value=False),
+            ),
+            patch(
+                "app.services.file_upload.isfile",
+                new=AsyncMock(return_value=False),
+            ),
+        ):
+            await upload_file(session, user, 1, uploaded)
+
+        self.is_delta_due_mock.assert_awaited_once_with(
+            repository, existing, 200,
+        )
+        revision = repository.insert.await_args[0][0]
+        self.assertTrue(revision.is_delta)
+
+        file_path = copy_mock.await_args_list[0].args[0]
+        self.assertEqual(
+            copy_mock.await_args_list,
+            [call(file_path, "/tmp/backup"), call(STAGED_TMP, file_path)],
+        )
+        write_delta_mock.assert_awaited_once_with(
+            file_path, STAGED_TMP, f"/mnt/revisions/{fixed_uuid}",
+        )
+        self.assertIn(call("/tmp/backup"), delete_mock.await_args_list)
+
+        intent = self.begin_intent_mock.await_args.args[0]
+        self.assertEqual(intent.on_rollback[0], (
+            ACTION_COPY, "/tmp/backup", file_path,
+        ))
+        self.assertIn((ACTION_DELETE, "/tmp/backup"), intent.on_commit)
+
     async def test_revision_succeeds_when_existing_and_upload_mime_are_none(
         self,
     ):
@@ -1153,10 +1306,7 @@ class TestUploadFile(unittest.IsolatedAsyncioTestCase):
         self.assertIs(result, existing)
         self.assertIsNone(existing.mimetype)
 
-        repository.count_all.assert_awaited_once_with(
-            FileRevision,
-            file_id=42,
-        )
+        repository.count_all.assert_not_awaited()
         inserted_rev = repository.insert.await_args[0][0]
         self.assertEqual(inserted_rev.revision_number, 1)
         self.assertEqual(existing.latest_revision_number, 1)
@@ -1250,10 +1400,7 @@ class TestUploadFile(unittest.IsolatedAsyncioTestCase):
             with self.assertRaises(IntegrityError):
                 await upload_file(session, user, 1, uploaded)
 
-        repository.count_all.assert_awaited_once_with(
-            FileRevision,
-            file_id=42,
-        )
+        repository.count_all.assert_not_awaited()
         self.assertEqual(existing.latest_revision_number, 0)
 
         copy_mock.assert_awaited_once_with(main_path, rev_disk_path)
@@ -1345,10 +1492,7 @@ class TestUploadFile(unittest.IsolatedAsyncioTestCase):
             with self.assertRaises(RuntimeError):
                 await upload_file(session, user, 1, uploaded)
 
-        repository.count_all.assert_awaited_once_with(
-            FileRevision,
-            file_id=42,
-        )
+        repository.count_all.assert_not_awaited()
         self.assertEqual(existing.latest_revision_number, 1)
 
         self.assertEqual(copy_mock.await_count, 3)
@@ -1450,10 +1594,7 @@ class TestUploadFile(unittest.IsolatedAsyncioTestCase):
             with self.assertRaises(RuntimeError):
                 await upload_file(session, user, 1, uploaded)
 
-        repository.count_all.assert_awaited_once_with(
-            FileRevision,
-            file_id=42,
-        )
+        repository.count_all.assert_not_awaited()
         self.assertEqual(existing.latest_revision_number, 1)
 
         self.assertEqual(copy_mock.await_count, 3)
@@ -1759,6 +1900,7 @@ class TestUploadFile(unittest.IsolatedAsyncioTestCase):
         config.FILES_THUMBNAILS_DIR = "/mnt/thumbs"
 
         rev_uuid = uuid.UUID("12345678-1234-5678-1234-567812345678")
+        intent_uuid = uuid.UUID("11111111-1111-4111-8111-111111111111")
         new_thumb_uuid = uuid.UUID("87654321-4321-4321-4321-876543218765")
         new_thumb_disk = (
             "/mnt/thumbs/87654321-4321-4321-4321-876543218765"
@@ -1784,7 +1926,7 @@ class TestUploadFile(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.file_upload.uuid.uuid4",
-                side_effect=[rev_uuid, new_thumb_uuid],
+                side_effect=[rev_uuid, intent_uuid, new_thumb_uuid],
             ),
             patch(
                 "app.services.file_upload.locks.lock_directory",
@@ -1847,10 +1989,7 @@ class TestUploadFile(unittest.IsolatedAsyncioTestCase):
         ):
             await upload_file(session, user, 1, uploaded)
 
-        repository.count_all.assert_awaited_once_with(
-            FileRevision,
-            file_id=42,
-        )
+        repository.count_all.assert_not_awaited()
         rev_row = repository.insert.await_args_list[0].args[0]
         self.assertEqual(rev_row.revision_number, 1)
         self.assertEqual(existing.latest_revision_number, 1)
@@ -2027,10 +2166,7 @@ class TestUploadFile(unittest.IsolatedAsyncioTestCase):
             )
             await upload_file(session, user, 1, uploaded)
 
-        repository.count_all.assert_awaited_once_with(
-            FileRevision,
-            file_id=42,
-        )
+        repository.count_all.assert_not_awaited()
         self.assertEqual(existing.latest_revision_number, 1)
 
         repository.delete.assert_awaited_once_with(old_thumb, flush=False)
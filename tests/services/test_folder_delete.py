@@ -4,16 +4,29 @@
 import unittest
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
-from app.errors import (
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.errors import (  # noqa: E402
     ResourceConflictError,
     ResourceLockedError,
     ResourceNotFoundError,
 )
-from app.events import Events as E
-from app.locks import LockType
-from app.models.file import File
-from app.models.folder import Folder
-from app.services.folder_delete import delete_folder
+from app.events import Events as E  # noqa: E402
+from app.locks import LockType  # noqa: E402
+from app.models.file import File  # noqa: E402
+from app.models.file_comment import FileComment  # noqa: E402
+from app.models.file_revision import FileRevision  # noqa: E402
+from app.models.file_tag import FileTag  # noqa: E402
+from app.models.file_thumbnail import FileThumbnail  # noqa: E402
+from app.models.folder import Folder  # noqa: E402
+from app.repositories.intent import (  # noqa: E402
+    ACTION_DELETE,
+    ACTION_RENAME,
+    ACTION_RMDIR,
+)
+from app.services.folder_delete import delete_folder  # noqa: E402
 
 
 class TestDeleteFolder(unittest.IsolatedAsyncioTestCase):
@@ -746,3 +759,399 @@ class TestDeleteFolder(unittest.IsolatedAsyncioTestCase):
         rmdir_mock.assert_awaited_once_with("/mnt/files/root-only")
         folder.get_absolute_dir.assert_called_once_with(())
         repository.update.assert_not_awaited()
+
+
+class TestDeleteFolderRecursive(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        begin_intent_patcher = patch(
+            "app.services.folder_delete.begin_intent",
+            new_callable=AsyncMock,
+        )
+        self.begin_intent_mock = begin_intent_patcher.start()
+        self.addCleanup(begin_intent_patcher.stop)
+
+        end_intent_patcher = patch(
+            "app.services.folder_delete.end_intent",
+            new_callable=AsyncMock,
+        )
+        self.end_intent_mock = end_intent_patcher.start()
+        self.addCleanup(end_intent_patcher.stop)
+
+        entry_path_patcher = patch(
+            "app.services.folder_delete.get_trash_entry_path",
+            return_value="/mnt/trash/entry",
+        )
+        entry_path_patcher.start()
+        self.addCleanup(entry_path_patcher.stop)
+
+    def _build_lock_context(self):
+        lock_context = AsyncMock()
+        lock_context.__aenter__.return_value = None
+        lock_context.__aexit__.return_value = None
+        return lock_context
+
+    def _build_folder(self):
+        folder = MagicMock(spec=Folder)
+        folder.id = 42
+        folder.children_count = 2
+        folder.is_write_protected = False
+        folder.is_write_protected_recursive.return_value = False
+        folder.get_absolute_dir.return_value = "/mnt/files/parent/docs"
+        return folder
+
+    def _build_parent(self):
+        parent = MagicMock(spec=Folder)
+        parent.id = 1
+        parent.children_count = 2
+        parent.get_absolute_dir.return_value = "/mnt/files/parent"
+        return parent
+
+    def _build_repository(self, folder, parent, protected_count=0):
+        repository = AsyncMock()
+        repository.select.return_value = folder
+        repository.select_parent_chain.return_value = (parent,)
+        repository.select_subtree_ids.return_value = [
+            (42, 0), (43, 1), (44, 1), (45, 2),
+        ]
+        repository.count_all.return_value = protected_count
+        repository.select_values.side_effect = [
+            [100, 101],
+            ["rev-1", "rev-2"],
+            ["thumb-1"],
+        ]
+        repository.make_subquery = MagicMock(return_value="files-subquery")
+        return repository
+
+    def _patches(self, repository, cache):
+        return (
+            patch(
+                "app.services.folder_delete.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.folder_delete.locks.lock_directory",
+                return_value=self._build_lock_context(),
+            ),
+            patch(
+                "app.services.folder_delete.create_trash_entry",
+                new=AsyncMock(return_value="/mnt/trash/entry"),
+            ),
+            patch(
+                "app.services.folder_delete.discard_trash_entry",
+                new=AsyncMock(),
+            ),
+            patch(
+                "app.services.folder_delete.seal_trash_entry",
+                new=AsyncMock(),
+            ),
+            patch(
+                "app.services.folder_delete.rename",
+                new=AsyncMock(),
+            ),
+            patch(
+                "app.services.folder_delete.get_thumbnail_cache",
+                return_value=cache,
+            ),
+            patch(
+                "app.services.folder_delete.write_audit",
+                new=AsyncMock(),
+            ),
+            patch(
+                "app.services.folder_delete.hooks.emit",
+                new=AsyncMock(),
+            ),
+        )
+
+    async def test_deletes_subtree_moves_tree_to_trash_and_seals(self):
+        session = AsyncMock()
+        folder = self._build_folder()
+        parent = self._build_parent()
+        repository = self._build_repository(folder, parent)
+        cache = MagicMock()
+
+        (
+            orm_patch, lock_patch, create_patch, discard_patch, seal_patch,
+            rename_patch, cache_patch, audit_patch, emit_patch,
+        ) = self._patches(repository, cache)
+
+        with (
+            orm_patch,
+            lock_patch as lock_directory_mock,
+            create_patch as create_entry_mock,
+            discard_patch as discard_entry_mock,
+            seal_patch as seal_entry_mock,
+            rename_patch as rename_mock,
+            cache_patch,
+            audit_patch as write_audit_mock,
+            emit_patch as emit_mock,
+        ):
+            result = await delete_folder(
+                session=session, folder_id=42, recursive=True,
+            )
+
+        self.assertIs(result, folder)
+        lock_directory_mock.assert_called_once_with(
+            "/mnt/files/parent", LockType.WRITE,
+        )
+        repository.count_all.assert_awaited_once_with(
+            Folder, id__in=[42, 43, 44, 45], is_write_protected=True,
+        )
+        intent = self.begin_intent_mock.await_args.args[0]
+        self.assertEqual(intent.table, Folder.__tablename__)
+        self.assertEqual(intent.filters, {"id": 42})
+        self.assertFalse(intent.committed_if_present)
+        self.assertEqual(intent.on_commit, [(
+            ACTION_RENAME,
+            "/mnt/trash/entry/manifest.pending",
+            "/mnt/trash/entry/manifest.json",
+        )])
+        self.assertEqual(intent.on_rollback, [
+            (
+                ACTION_RENAME,
+                "/mnt/trash/entry/tree",
+                "/mnt/files/parent/docs",
+            ),
+            (ACTION_DELETE, "/mnt/trash/entry/manifest.pending"),
+            (ACTION_RMDIR, "/mnt/trash/entry"),
+        ])
+        create_entry_mock.assert_awaited_once_with(
+            "/mnt/trash/entry", ["rev-1", "rev-2"], ["thumb-1"],
+        )
+        rename_mock.assert_awaited_once_with(
+            "/mnt/files/parent/docs", "/mnt/trash/entry/tree",
+        )
+
+        self.assertEqual(repository.delete_all.await_args_list, [
+            call(FileComment, file_id__subquery="files-subquery"),
+            call(FileTag, file_id__subquery="files-subquery"),
+            call(FileRevision, file_id__subquery="files-subquery"),
+            call(FileThumbnail, file_id__subquery="files-subquery"),
+            call(File, folder_id__in=[42, 43, 44, 45]),
+            call(Folder, id__in=[45]),
+            call(Folder, id__in=[43, 44]),
+            call(Folder, id__in=[42]),
+        ])
+        self.assertEqual(parent.children_count, 1)
+        repository.update.assert_awaited_once_with(parent)
+
+        self.assertEqual(write_audit_mock.await_count, 6)
+        write_audit_mock.assert_any_await(
+            repository=repository,
+            event=E.FILE_DELETE_COMPLETED,
+            resource_type=File.__tablename__,
+            resource_id=100,
+        )
+        write_audit_mock.assert_any_await(
+            repository=repository,
+            event=E.FOLDER_DELETE_COMPLETED,
+            resource_type=Folder.__tablename__,
+            resource_id=42,
+        )
+        repository.commit.assert_awaited_once()
+        seal_entry_mock.assert_awaited_once_with("/mnt/trash/entry")
+        self.end_intent_mock.assert_awaited_once_with(intent)
+        discard_entry_mock.assert_not_awaited()
+
+        self.assertEqual(cache.evict.call_args_list, [call(100), call(101)])
+        emit_mock.assert_awaited_once_with(
+            E.FOLDER_DELETE_COMPLETED, session, folder,
+        )
+
+    async def test_binds_folder_ids_in_batches(self):
+        session = AsyncMock()
+        folder = self._build_folder()
+        parent = self._build_parent()
+        repository = self._build_repository(folder, parent)
+        repository.select_values.side_effect = [
+            [100], ["rev-1"], [], [101], [], ["thumb-1"],
+        ]
+        repository.make_subquery.side_effect = ["subquery-1", "subquery-2"]
+        cache = MagicMock()
+
+        (
+            orm_patch, lock_patch, create_patch, discard_patch, seal_patch,
+            rename_patch, cache_patch, audit_patch, emit_patch,
+        ) = self._patches(repository, cache)
+
+        with (
+            orm_patch,
+            lock_patch,
+            create_patch as create_entry_mock,
+            discard_patch,
+            seal_patch,
+            rename_patch,
+            cache_patch,
+            audit_patch,
+            emit_patch,
+            patch("app.services.folder_delete.FILES_BULK_BATCH_SIZE", 2),
+        ):
+            await delete_folder(
+                session=session, folder_id=42, recursive=True,
+            )
+
+        self.assertEqual(repository.count_all.await_args_list, [
+            call(Folder, id__in=[42, 43], is_write_protected=True),
+            call(Folder, id__in=[44, 45], is_write_protected=True),
+        ])
+        self.assertEqual(repository.make_subquery.call_args_list, [
+            call(File, "id", folder_id__in=[42, 43]),
+            call(File, "id", folder_id__in=[44, 45]),
+        ])
+        create_entry_mock.assert_awaited_once_with(
+            "/mnt/trash/entry", ["rev-1"], ["thumb-1"],
+        )
+        self.assertEqual(repository.delete_all.await_args_list, [
+            call(FileComment, file_id__subquery="subquery-1"),
+            call(FileTag, file_id__subquery="subquery-1"),
+            call(FileRevision, file_id__subquery="subquery-1"),
+            call(FileThumbnail, file_id__subquery="subquery-1"),
+            call(File, folder_id__in=[42, 43]),
+            call(FileComment, file_id__subquery="subquery-2"),
+            call(FileTag, file_id__subquery="subquery-2"),
+            call(FileRevision, file_id__subquery="subquery-2"),
+            call(FileThumbnail, file_id__subquery="subquery-2"),
+            call(File, folder_id__in=[44, 45]),
+            call(Folder, id__in=[45]),
+            call(Folder, id__in=[43, 44]),
+            call(Folder, id__in=[42]),
+        ])
+        self.assertEqual(cache.evict.call_args_list, [call(100), call(101)])
+
+    async def test_raises_locked_when_nested_folder_protected(self):
+        session = AsyncMock()
+        folder = self._build_folder()
+        parent = self._build_parent()
+        repository = self._build_repository(folder, parent, protected_count=1)
+
+        (
+            orm_patch, lock_patch, create_patch, discard_patch, seal_patch,
+            rename_patch, cache_patch, audit_patch, emit_patch,
+        ) = self._patches(repository, MagicMock())
+
+        with (
+            orm_patch,
+            lock_patch,
+            create_patch as create_entry_mock,
+            discard_patch,
+            seal_patch,
+            rename_patch as rename_mock,
+            cache_patch,
+            audit_patch,
+            emit_patch as emit_mock,
+        ):
+            with self.assertRaises(ResourceLockedError):
+                await delete_folder(
+                    session=session, folder_id=42, recursive=True,
+                )
+
+        create_entry_mock.assert_not_awaited()
+        rename_mock.assert_not_awaited()
+        repository.delete_all.assert_not_awaited()
+        emit_mock.assert_not_awaited()
+
+    async def test_failed_commit_moves_tree_back(self):
+        session = AsyncMock()
+        folder = self._build_folder()
+        parent = self._build_parent()
+        repository = self._build_repository(folder, parent)
+        repository.commit.side_effect = RuntimeError("boom")
+
+        (
+            orm_patch, lock_patch, create_patch, discard_patch, seal_patch,
+            rename_patch, cache_patch, audit_patch, emit_patch,
+        ) = self._patches(repository, MagicMock())
+
+        with (
+            orm_patch,
+            lock_patch,
+            create_patch,
+            discard_patch as discard_entry_mock,
+            seal_patch as seal_entry_mock,
+            rename_patch as rename_mock,
+            cache_patch,
+            audit_patch,
+            emit_patch as emit_mock,
+            self.assertLogs("app.services.folder_delete", level="ERROR"),
+        ):
+            with self.assertRaises(RuntimeError):
+                await delete_folder(
+                    session=session, folder_id=42, recursive=True,
+                )
+
+        repository.rollback.assert_awaited_once()
+        self.assertEqual(rename_mock.await_args_list, [
+            call("/mnt/files/parent/docs", "/mnt/trash/entry/tree"),
+            call("/mnt/trash/entry/tree", "/mnt/files/parent/docs"),
+        ])
+        discard_entry_mock.assert_awaited_once_with("/mnt/trash/entry")
+        seal_entry_mock.assert_not_awaited()
+        self.end_intent_mock.assert_awaited_once()
+        emit_mock.assert_not_awaited()
+
+    async def test_failed_rename_discards_trash_entry(self):
+        session = AsyncMock()
+        folder = self._build_folder()
+        parent = self._build_parent()
+        repository = self._build_repository(folder, parent)
+
+        (
+            orm_patch, lock_patch, create_patch, discard_patch, seal_patch,
+            rename_patch, cache_patch, audit_patch, emit_patch,
+        ) = self._patches(repository, MagicMock())
+
+        with (
+            orm_patch,
+            lock_patch,
+            create_patch,
+            discard_patch as discard_entry_mock,
+            seal_patch,
+            rename_patch as rename_mock,
+            cache_patch,
+            audit_patch,
+            emit_patch,
+            self.assertLogs("app.services.folder_delete", level="ERROR"),
+        ):
+            rename_mock.side_effect = OSError("busy")
+            with self.assertRaises(OSError):
+                await delete_folder(
+                    session=session, folder_id=42, recursive=True,
+                )
+
+        repository.rollback.assert_awaited_once()
+        repository.delete_all.assert_not_awaited()
+        discard_entry_mock.assert_awaited_once_with("/mnt/trash/entry")
+
+    async def test_seal_failure_is_logged_and_does_not_fail(self):
+        session = AsyncMock()
+        folder = self._build_folder()
+        parent = self._build_parent()
+        repository = self._build_repository(folder, parent)
+
+        (
+            orm_patch, lock_patch, create_patch, discard_patch, seal_patch,
+            rename_patch, cache_patch, audit_patch, emit_patch,
+        ) = self._patches(repository, MagicMock())
+
+        with (
+            orm_patch,
+            lock_patch,
+            create_patch,
+            discard_patch,
+            seal_patch as seal_entry_mock,
+            rename_patch,
+            cache_patch,
+            audit_patch,
+            emit_patch as emit_mock,
+            self.assertLogs(
+                "app.services.folder_delete", level="ERROR",
+            ) as logs,
+        ):
+            seal_entry_mock.side_effect = OSError("io")
+            await delete_folder(
+                session=session, folder_id=42, recursive=True,
+            )
+
+        self.assertIn(E.FOLDER_DELETE_TRASH_SEAL_FAILED, logs.output[0])
+        self.end_intent_mock.assert_not_awaited()
+        emit_mock.assert_awaited_once()
@@ -0,0 +1,85 @@
+# tests/services/test_integrity_report_retrieve.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.events import Events as E  # noqa: E402
+from app.hooks import HookManager  # noqa: E402
+from app.services.integrity_report_retrieve import (  # noqa: E402
+    retrieve_integrity_report,
+)
+from app.services.integrity_scan import ScanState  # noqa: E402
+
+
+class TestRetrieveIntegrityReport(unittest.IsolatedAsyncioTestCase):
+
+    async def test_runs_registered_hooks(self):
+        session = MagicMock()
+        hook_manager = HookManager()
+        hook = AsyncMock()
+        hook_manager.on(E.INTEGRITY_REPORT_RETRIEVE_COMPLETED, hook)
+
+        with (
+            patch("app.services.integrity_report_retrieve.ORMRepository"),
+            patch(
+                "app.services.integrity_report_retrieve.load_scan_state",
+                new=AsyncMock(return_value=ScanState()),
+            ),
+            patch(
+                "app.services.integrity_report_retrieve.hooks",
+                new=hook_manager,
+            ),
+        ):
+            report = await retrieve_integrity_report(session)
+
+        hook.assert_awaited_once_with(session, None)
+        self.assertEqual(report.findings, [])
+
+    async def test_returns_report_without_cursor(self):
+        session = MagicMock()
+        repository = MagicMock()
+        state = ScanState(
+            pass_number=3,
+            pass_started_at=100,
+            phase="revision_blobs",
+            position="abc",
+            checked_count=5,
+            findings_count=1,
+            findings=[{
+                "check": "orphan",
+                "resource_type": None,
+                "resource_id": None,
+                "path": "revisions/abc",
+                "detected_at": 101,
+            }],
+        )
+
+        with (
+            patch(
+                "app.services.integrity_report_retrieve.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.integrity_report_retrieve.load_scan_state",
+                new=AsyncMock(return_value=state),
+            ) as load_mock,
+            patch(
+                "app.services.integrity_report_retrieve.hooks.emit",
+                new=AsyncMock(),
+            ) as emit_mock,
+        ):
+            report = await retrieve_integrity_report(session)
+
+        load_mock.assert_awaited_once_with(repository)
+        emit_mock.assert_awaited_once_with(
+            E.INTEGRITY_REPORT_RETRIEVE_COMPLETED, session, None,
+        )
+        self.assertEqual(report.pass_number, 3)
+        self.assertEqual(report.phase, "revision_blobs")
+        self.assertEqual(report.findings[0].path, "revisions/abc")
+        self.assertIsNone(report.last_pass)
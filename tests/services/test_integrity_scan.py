@@ -0,0 +1,721 @@
+# tests/services/test_integrity_scan.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import asyncio
+import json
+import unittest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.locks import LockManager, LockType  # noqa: E402
+from app.runtime.load import RequestLoad  # noqa: E402
+from app.runtime.throttle import IOThrottle  # noqa: E402
+from app.services import integrity_scan as scan  # noqa: E402
+from app.services.integrity_scan import ScanState, _Target  # noqa: E402
+
+
+def _session_local(session=None):
+    session = session or MagicMock()
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=session)
+    session_cm.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=session_cm)
+
+
+def _config():
+    return MagicMock(
+        GOCRYPTFS_MOUNTPOINT="/mnt",
+        FILES_DIR="/mnt/files",
+        FILES_REVISIONS_DIR="/mnt/revisions",
+        FILES_THUMBNAILS_DIR="/mnt/thumbnails",
+        INTEGRITY_SCAN_PASS_INTERVAL_SECONDS=100,
+        INTEGRITY_SCAN_BYTES_PER_SECOND=1,
+        INTEGRITY_SCAN_IOPS=1,
+        INTEGRITY_SCAN_MAX_ACTIVE_REQUESTS=1,
+    )
+
+
+def _target(resource_id=1, checksum="abc", filesize=3):
+    return _Target(
+        resource_type="files",
+        resource_id=resource_id,
+        path=f"/mnt/files/docs/{resource_id}.txt",
+        filesize=filesize,
+        checksum=checksum,
+    )
+
+
+@asynccontextmanager
+async def _no_lock(*args, **kwargs):
+    yield
+
+
+class IntegrityScanTestCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.throttle = MagicMock()
+        self.throttle.acquire_ops = AsyncMock()
+        self.throttle.acquire_bytes = AsyncMock()
+
+        patches = [
+            patch.object(scan, "get_config", return_value=_config()),
+            patch.object(scan, "SessionLocal", _session_local()),
+            patch.object(scan, "ORMRepository"),
+            patch.object(scan, "log"),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+
+class TestScanIntegrity(IntegrityScanTestCase):
+
+    def _patch_state(self, state):
+        load = patch.object(
+            scan, "load_scan_state", new=AsyncMock(return_value=state),
+        )
+        save = patch.object(scan, "_save_scan_state", new=AsyncMock())
+        return load, save
+
+    async def test_waits_for_pass_interval_between_passes(self):
+        state = ScanState(pass_number=1, pass_started_at=1000)
+        load_patch, save_patch = self._patch_state(state)
+
+        with (
+            load_patch,
+            save_patch as save_mock,
+            patch.object(scan.time, "time", return_value=1050),
+            patch.object(scan, "_scan_batch", new=AsyncMock()) as batch_mock,
+        ):
+            await scan.scan_integrity()
+
+        batch_mock.assert_not_awaited()
+        save_mock.assert_not_awaited()
+
+    async def test_runs_full_pass_and_checkpoints_every_batch(self):
+        state = ScanState(pass_number=1, pass_started_at=1000)
+        load_patch, save_patch = self._patch_state(state)
+
+        with (
+            load_patch,
+            save_patch as save_mock,
+            patch.object(scan.time, "time", return_value=2000),
+            patch.object(
+                scan, "_scan_batch", new=AsyncMock(return_value=True),
+            ) as batch_mock,
+        ):
+            await scan.scan_integrity()
+
+        self.assertEqual(batch_mock.await_count, len(scan.PHASES))
+        self.assertEqual(save_mock.await_count, len(scan.PHASES))
+        self.assertIsNone(state.phase)
+        self.assertEqual(state.pass_number, 2)
+        self.assertEqual(state.pass_started_at, 2000)
+        self.assertEqual(state.last_pass["pass_number"], 2)
+        self.assertEqual(state.last_pass["completed_at"], 2000)
+
+    async def test_resumes_pass_in_progress_until_deadline(self):
+        state = ScanState(
+            pass_number=1, pass_started_at=1000,
+            phase=scan.PHASE_REVISIONS, position=42,
+        )
+        load_patch, save_patch = self._patch_state(state)
+
+        with (
+            load_patch,
+            save_patch as save_mock,
+            patch.object(scan.time, "time", return_value=1001),
+            patch.object(
+                scan.time, "monotonic",
+                side_effect=[0, 1, 2, scan.INTEGRITY_SCAN_MAX_SECONDS_PER_RUN],
+            ),
+            patch.object(
+                scan, "_scan_batch", new=AsyncMock(return_value=False),
+            ) as batch_mock,
+        ):
+            await scan.scan_integrity()
+
+        self.assertEqual(batch_mock.await_count, 2)
+        self.assertEqual(save_mock.await_count, 2)
+        self.assertEqual(state.pass_number, 1)
+        self.assertEqual(state.phase, scan.PHASE_REVISIONS)
+
+
+class TestScanState(IntegrityScanTestCase):
+
+    async def test_load_returns_empty_state_without_variable(self):
+        repository = MagicMock()
+        repository.select = AsyncMock(return_value=None)
+
+        state = await scan.load_scan_state(repository)
+
+        self.assertEqual(state, ScanState())
+
+    async def test_load_parses_variable_value(self):
+        repository = MagicMock()
+        repository.select = AsyncMock(return_value=MagicMock(
+            variable_value=json.dumps({"pass_number": 2, "phase": "files"}),
+        ))
+
+        state = await scan.load_scan_state(repository)
+
+        self.assertEqual(state, ScanState(pass_number=2, phase="files"))
+
+    async def test_save_inserts_or_updates_variable(self):
+        variable = MagicMock()
+        repository = scan.ORMRepository.return_value
+        repository.select = AsyncMock(side_effect=[None, variable])
+        repository.insert = AsyncMock()
+        repository.update = AsyncMock()
+        repository.commit = AsyncMock()
+
+        with patch.object(scan, "Variable") as variable_cls:
+            await scan._save_scan_state(ScanState(pass_number=1))
+            await scan._save_scan_state(ScanState(pass_number=2))
+
+        kwargs = variable_cls.call_args.kwargs
+        self.assertEqual(kwargs["namespace"], "integrity_scan")
+        self.assertEqual(kwargs["variable_key"], "state")
+        self.assertEqual(
+            json.loads(kwargs["variable_value"])["pass_number"], 1,
+        )
+        repository.insert.assert_awaited_once_with(variable_cls.return_value)
+        repository.update.assert_awaited_once_with(variable)
+        self.assertEqual(
+            json.loads(variable.variable_value)["pass_number"], 2,
+        )
+        self.assertEqual(repository.commit.await_count, 2)
+
+    def test_advance_phase_resets_cursor(self):
+        state = ScanState(phase=scan.PHASE_FOLDERS, position=10)
+
+        scan._advance_phase(state)
+
+        self.assertEqual(state.phase, scan.PHASE_REVISION_BLOBS)
+        self.assertEqual(state.position, "")
+
+    def test_add_finding_keeps_report_bounded(self):
+        state = ScanState()
+
+        with patch.object(scan, "INTEGRITY_SCAN_MAX_FINDINGS", 1):
+            scan._add_finding(state, "orphan", "/mnt/revisions/a")
+            scan._add_finding(state, "orphan", "/mnt/revisions/b")
+
+        self.assertEqual(state.findings_count, 2)
+        self.assertEqual(len(state.findings), 1)
+        self.assertEqual(state.findings[0]["path"], "revisions/a")
+        self.assertEqual(scan.log.warning.call_count, 2)
+
+
+class TestScanTargets(IntegrityScanTestCase):
+
+    async def test_reports_only_confirmed_findings(self):
+        state = ScanState(phase=scan.PHASE_FILES, position=0)
+        targets = [_target(1), _target(2), _target(3)]
+
+        with (
+            patch.object(
+                scan, "_select_targets", new=AsyncMock(return_value=targets),
+            ),
+            patch.object(
+                scan, "_check_target",
+                new=AsyncMock(side_effect=[
+                    None, scan.CHECK_MISSING, scan.CHECK_CHECKSUM_MISMATCH,
+                ]),
+            ),
+            patch.object(
+                scan, "_confirm_target",
+                new=AsyncMock(
+                    side_effect=[None, scan.CHECK_CHECKSUM_MISMATCH],
+                ),
+            ) as confirm_mock,
+        ):
+            done = await scan._scan_targets(state, self.throttle)
+
+        self.assertFalse(done)
+        self.assertEqual(confirm_mock.await_count, 2)
+        self.assertEqual(state.position, 3)
+        self.assertEqual(state.checked_count, 3)
+        self.assertEqual(state.findings_count, 1)
+        self.assertEqual(state.findings[0]["resource_id"], 3)
+        self.assertEqual(state.findings[0]["check"], "checksum_mismatch")
+
+    async def test_empty_batch_completes_phase(self):
+        state = ScanState(phase=scan.PHASE_FILES, position=7)
+
+        with patch.object(
+            scan, "_select_targets", new=AsyncMock(return_value=[]),
+        ):
+            self.assertTrue(await scan._scan_targets(state, self.throttle))
+
+        self.assertEqual(state.position, 7)
+
+
+class TestSelectTargets(IntegrityScanTestCase):
+
+    async def test_revision_number_outside_range_is_reported(self):
+        repository = MagicMock()
+        repository.select_all = AsyncMock(return_value=[
+            MagicMock(
+                id=1, file_id=10, revision_number=1, filesize=1,
+                checksum="a", absolute_path="/mnt/revisions/a",
+                is_delta=False,
+            ),
+            MagicMock(
+                id=2, file_id=10, revision_number=5, filesize=1,
+                checksum="b", absolute_path="/mnt/revisions/b",
+                is_delta=False,
+            ),
+        ])
+        result = MagicMock()
+        result.tuples.return_value.all.return_value = [(10, 2)]
+        repository.session.execute = AsyncMock(return_value=result)
+        state = ScanState(phase=scan.PHASE_REVISIONS)
+
+        targets = await scan._select_targets(repository, state, id__gt=0)
+
+        self.assertEqual([t.resource_id for t in targets], [1, 2])
+        self.assertEqual(state.findings_count, 1)
+        self.assertEqual(state.findings[0]["resource_id"], 2)
+        self.assertEqual(
+            state.findings[0]["check"], "revision_number_invalid",
+        )
+
+    async def test_delta_revision_is_checked_for_presence_only(self):
+        repository = MagicMock()
+        repository.select_all = AsyncMock(return_value=[MagicMock(
+            id=1, file_id=10, revision_number=1, filesize=100,
+            checksum="a", absolute_path="/mnt/revisions/a", is_delta=True,
+        )])
+        result = MagicMock()
+        result.tuples.return_value.all.return_value = [(10, 1)]
+        repository.session.execute = AsyncMock(return_value=result)
+        state = ScanState(phase=scan.PHASE_REVISIONS)
+
+        targets = await scan._select_targets(repository, state, id__gt=0)
+
+        self.assertEqual(targets, [_Target(
+            resource_type="files_revisions",
+            resource_id=1,
+            path="/mnt/revisions/a",
+            filesize=None,
+        )])
+
+    async def test_thumbnail_of_non_image_is_reported(self):
+        repository = MagicMock()
+        repository.select_all = AsyncMock(return_value=[MagicMock(
+            id=4, filesize=9, absolute_path="/mnt/thumbnails/t",
+            thumbnail_file=MagicMock(is_image=False),
+        )])
+        state = ScanState(phase=scan.PHASE_THUMBNAILS)
+
+        targets = await scan._select_targets(repository, state, id__gt=0)
+
+        self.assertEqual(targets, [_Target(
+            resource_type="files_thumbnails",
+            resource_id=4,
+            path="/mnt/thumbnails/t",
+            filesize=9,
+        )])
+        self.assertEqual(state.findings[0]["check"], "thumbnail_unlinked")
+
+    async def test_file_paths_resolve_parent_chain_once_per_folder(self):
+        folder = MagicMock(id=5)
+        folder.get_absolute_dir.return_value = "/mnt/files/docs"
+        repository = MagicMock()
+        repository.select_all = AsyncMock(return_value=[
+            MagicMock(
+                id=1, file_folder=folder, filename="1.txt",
+                filesize=3, checksum="abc",
+            ),
+            MagicMock(
+                id=2, file_folder=folder, filename="2.txt",
+                filesize=3, checksum="abc",
+            ),
+        ])
+        repository.select_parent_chain = AsyncMock(return_value=())
+
+        targets = await scan._select_targets(
+            repository, ScanState(phase=scan.PHASE_FILES), id__gt=0,
+        )
+
+        self.assertEqual(targets, [_target(1), _target(2)])
+        repository.select_parent_chain.assert_awaited_once_with(folder)
+
+
+class TestCheckTarget(IntegrityScanTestCase):
+
+    def _patches(self, isfile=True, filesize=3, checksum="abc"):
+        return (
+            patch.object(scan, "isfile", new=AsyncMock(return_value=isfile)),
+            patch.object(
+                scan, "get_filesize", new=AsyncMock(return_value=filesize),
+            ),
+            patch.object(
+                scan, "get_checksum", new=AsyncMock(return_value=checksum),
+            ),
+        )
+
+    async def _check(self, target=None, **kwargs):
+        isfile_patch, size_patch, checksum_patch = self._patches(**kwargs)
+        with isfile_patch, size_patch, checksum_patch as checksum_mock:
+            result = await scan._check_target(
+                ScanState(), target or _target(), self.throttle,
+            )
+        return result, checksum_mock
+
+    async def test_matching_file_passes(self):
+        result, _ = await self._check()
+        self.assertIsNone(result)
+        self.throttle.acquire_ops.assert_awaited_once_with()
+
+    async def test_missing_file(self):
+        result, _ = await self._check(isfile=False)
+        self.assertEqual(result, scan.CHECK_MISSING)
+
+    async def test_filesize_mismatch_skips_hashing(self):
+        result, checksum_mock = await self._check(filesize=4)
+        self.assertEqual(result, scan.CHECK_FILESIZE_MISMATCH)
+        checksum_mock.assert_not_awaited()
+
+    async def test_checksum_mismatch(self):
+        result, _ = await self._check(checksum="def")
+        self.assertEqual(result, scan.CHECK_CHECKSUM_MISMATCH)
+
+    async def test_target_without_checksum_is_not_hashed(self):
+        result, checksum_mock = await self._check(
+            target=_target(checksum=None), checksum="def",
+        )
+        self.assertIsNone(result)
+        checksum_mock.assert_not_awaited()
+
+    async def test_target_without_filesize_skips_size_check(self):
+        result, _ = await self._check(
+            target=_target(filesize=None, checksum=None), filesize=4,
+        )
+        self.assertIsNone(result)
+
+    async def test_file_removed_during_check_is_missing(self):
+        with (
+            patch.object(scan, "isfile", new=AsyncMock(return_value=True)),
+            patch.object(
+                scan, "get_filesize",
+                new=AsyncMock(side_effect=FileNotFoundError),
+            ),
+        ):
+            result = await scan._check_target(
+                ScanState(), _target(), self.throttle,
+            )
+
+        self.assertEqual(result, scan.CHECK_MISSING)
+
+    async def test_hashing_is_paced_and_counted(self):
+        state = ScanState()
+
+        async def fake_checksum(path, on_chunk):
+            await on_chunk(2)
+            await on_chunk(1)
+            return "abc"
+
+        with (
+            patch.object(scan, "isfile", new=AsyncMock(return_value=True)),
+            patch.object(scan, "get_filesize", new=AsyncMock(return_value=3)),
+            patch.object(scan, "get_checksum", new=fake_checksum),
+        ):
+            await scan._check_target(state, _target(), self.throttle)
+
+        self.assertEqual(state.hashed_bytes, 3)
+        self.assertEqual(
+            self.throttle.acquire_bytes.await_args_list, [call(2), call(1)],
+        )
+
+
+class TestConfirmTarget(IntegrityScanTestCase):
+
+    def _patches(self, selected, signatures, check=scan.CHECK_MISSING):
+        return (
+            patch.object(
+                scan, "_select_targets",
+                new=AsyncMock(return_value=selected),
+            ),
+            patch.object(
+                scan, "get_signature", new=AsyncMock(side_effect=signatures),
+            ),
+            patch.object(
+                scan, "_check_target", new=AsyncMock(return_value=check),
+            ),
+        )
+
+    async def test_finding_not_reproduced_is_dropped_without_lock(self):
+        target = _target()
+        select_patch, signature_patch, check_patch = self._patches(
+            [target], [(1, 3, 10)], check=None,
+        )
+
+        with (
+            patch.object(scan.locks, "lock_file") as lock_mock,
+            select_patch, signature_patch, check_patch,
+        ):
+            result = await scan._confirm_target(
+                ScanState(phase=scan.PHASE_FILES), target, self.throttle,
+            )
+
+        self.assertIsNone(result)
+        lock_mock.assert_not_called()
+
+    async def test_changed_row_drops_finding(self):
+        target = _target()
+        select_patch, signature_patch, check_patch = self._patches(
+            [_target(checksum="new")], [(1, 3, 10), (1, 3, 10)],
+        )
+
+        with (
+            patch.object(scan.locks, "lock_file", new=_no_lock),
+            select_patch, signature_patch, check_patch,
+        ):
+            result = await scan._confirm_target(
+                ScanState(phase=scan.PHASE_FILES), target, self.throttle,
+            )
+
+        self.assertIsNone(result)
+
+    async def test_file_changed_since_check_drops_finding(self):
+        target = _target()
+        select_patch, signature_patch, check_patch = self._patches(
+            [target], [(1, 3, 10), (2, 3, 11)],
+        )
+
+        with (
+            patch.object(scan.locks, "lock_file", new=_no_lock),
+            select_patch, signature_patch, check_patch,
+        ):
+            result = await scan._confirm_target(
+                ScanState(phase=scan.PHASE_FILES), target, self.throttle,
+            )
+
+        self.assertIsNone(result)
+
+    async def test_unchanged_row_and_file_confirm_finding(self):
+        target = _target()
+        events = []
+
+        @asynccontextmanager
+        async def lock_file(path, lock_type):
+            events.append(("lock", path, lock_type))
+            yield
+            events.append(("unlock", path, lock_type))
+
+        async def check_target(state, checked_target, throttle):
+            events.append(("check", checked_target.path, None))
+            return scan.CHECK_CHECKSUM_MISMATCH
+
+        select_patch, signature_patch, _ = self._patches(
+            [target], [(1, 3, 10), (1, 3, 10)],
+        )
+
+        with (
+            patch.object(scan.locks, "lock_file", new=lock_file),
+            patch.object(scan, "_check_target", new=check_target),
+            select_patch as select_mock,
+            signature_patch,
+        ):
+            result = await scan._confirm_target(
+                ScanState(phase=scan.PHASE_FILES), target, self.throttle,
+            )
+
+        self.assertEqual(result, scan.CHECK_CHECKSUM_MISMATCH)
+        self.assertEqual(events, [
+            ("check", target.path, None),
+            ("lock", target.path, LockType.READ),
+            ("unlock", target.path, LockType.READ),
+        ])
+        self.assertEqual(select_mock.await_args.kwargs, {"id": 1})
+
+    async def test_missing_file_is_confirmed(self):
+        target = _target()
+        select_patch, signature_patch, check_patch = self._patches(
+            [target], [FileNotFoundError, FileNotFoundError],
+        )
+
+        with (
+            patch.object(scan.locks, "lock_file", new=_no_lock),
+            select_patch, signature_patch, check_patch,
+        ):
+            result = await scan._confirm_target(
+                ScanState(phase=scan.PHASE_FILES), target, self.throttle,
+            )
+
+        self.assertEqual(result, scan.CHECK_MISSING)
+
+    async def test_writers_queued_on_lock_under_load_do_not_deadlock(self):
+        target = _target()
+        lock_manager = LockManager()
+        load = RequestLoad()
+        throttle = IOThrottle(
+            bytes_per_second=0,
+            iops=0,
+            max_active_requests=2,
+            pause_seconds=0.001,
+            load=load,
+        )
+        writers = []
+        written = []
+
+        async def write(index):
+            with load.track():
+                async with lock_manager.lock_file(target.path, LockType.WRITE):
+                    written.append(index)
+
+        async def select_targets(*args, **kwargs):
+            # Requests arrive while the scanner holds its read lock.
+            writers.extend(
+                asyncio.create_task(write(index)) for index in range(3)
+            )
+            await asyncio.sleep(0.01)
+            self.assertEqual(load.active, 3)
+            return [target]
+
+        async def checksum(path, on_chunk):
+            await on_chunk(3)
+            return "bad"
+
+        with (
+            patch.object(scan, "locks", lock_manager),
+            patch.object(scan, "_select_targets", new=select_targets),
+            patch.object(
+                scan, "get_signature", new=AsyncMock(return_value=(1, 3, 10)),
+            ),
+            patch.object(scan, "isfile", new=AsyncMock(return_value=True)),
+            patch.object(scan, "get_filesize", new=AsyncMock(return_value=3)),
+            patch.object(scan, "get_checksum", new=checksum),
+        ):
+            result = await asyncio.wait_for(
+                scan._confirm_target(
+                    ScanState(phase=scan.PHASE_FILES), target, throttle,
+                ),
+                timeout=5,
+            )
+            await asyncio.wait_for(asyncio.gather(*writers), timeout=5)
+
+        self.assertEqual(result, scan.CHECK_CHECKSUM_MISMATCH)
+        self.assertEqual(sorted(written), [0, 1, 2])
+        self.assertEqual(load.active, 0)
+
+
+class TestCheckDirectory(IntegrityScanTestCase):
+
+    async def test_reports_orphan_entries(self):
+        state = ScanState()
+
+        with (
+            patch.object(scan.locks, "lock_directory", new=_no_lock),
+            patch.object(
+                scan, "_select_directory",
+                new=AsyncMock(return_value=("/mnt/files/docs", {"a.txt"})),
+            ),
+            patch.object(scan, "isdir", new=AsyncMock(return_value=True)),
+            patch.object(
+                scan, "listdir", new=AsyncMock(return_value=["a.txt", "b"]),
+            ),
+        ):
+            await scan._check_directory(state, self.throttle, 5)
+
+        self.assertEqual(state.findings_count, 1)
+        self.assertEqual(state.findings[0]["check"], "orphan")
+        self.assertEqual(state.findings[0]["path"], "files/docs/b")
+
+    async def test_reports_missing_directory(self):
+        state = ScanState()
+
+        with (
+            patch.object(scan.locks, "lock_directory", new=_no_lock),
+            patch.object(
+                scan, "_select_directory",
+                new=AsyncMock(return_value=("/mnt/files/docs", set())),
+            ),
+            patch.object(scan, "isdir", new=AsyncMock(return_value=False)),
+        ):
+            await scan._check_directory(state, self.throttle, 5)
+
+        self.assertEqual(state.findings[0]["check"], "missing")
+        self.assertEqual(state.findings[0]["resource_type"], "folders")
+        self.assertEqual(state.findings[0]["resource_id"], 5)
+
+    async def test_skips_folder_moved_before_lock(self):
+        state = ScanState()
+
+        with (
+            patch.object(scan.locks, "lock_directory", new=_no_lock),
+            patch.object(
+                scan, "_select_directory",
+                new=AsyncMock(side_effect=[
+                    ("/mnt/files/docs", set()),
+                    ("/mnt/files/other", set()),
+                ]),
+            ),
+            patch.object(scan, "isdir", new=AsyncMock()) as isdir_mock,
+        ):
+            await scan._check_directory(state, self.throttle, 5)
+
+        isdir_mock.assert_not_awaited()
+        self.assertEqual(state.findings_count, 0)
+
+
+class TestScanBlobs(IntegrityScanTestCase):
+
+    async def test_reports_old_unknown_blobs_not_in_trash(self):
+        state = ScanState(phase=scan.PHASE_REVISION_BLOBS, position="a")
+        listings = {}
+        repository = scan.ORMRepository.return_value
+        repository.select_values = AsyncMock(return_value=["b"])
+
+        with (
+            patch.object(
+                scan, "listdir",
+                new=AsyncMock(return_value=["a", "b", "c", "d", "e"]),
+            ),
+            patch.object(
+                scan, "get_mtime",
+                new=AsyncMock(side_effect=[0, 0, 9000]),
+            ),
+            patch.object(scan.time, "time", return_value=10000),
+            patch.object(
+                scan, "list_sealed_trash_entries",
+                new=AsyncMock(return_value=["/mnt/trash/x"]),
+            ),
+            patch.object(
+                scan, "read_trash_manifest",
+                new=AsyncMock(return_value={
+                    "revisions": ["d"], "thumbnails": [],
+                }),
+            ),
+        ):
+            done = await scan._scan_blobs(state, self.throttle, listings)
+
+        self.assertFalse(done)
+        repository.select_values.assert_awaited_once_with(
+            scan.FileRevision, "revision_uuid",
+            revision_uuid__in=["b", "c", "d", "e"],
+        )
+        self.assertEqual(
+            [f["path"] for f in state.findings], ["revisions/c"],
+        )
+        self.assertEqual(state.position, "e")
+        self.assertEqual(state.checked_count, 4)
+        self.assertIn(scan.PHASE_REVISION_BLOBS, listings)
+
+    async def test_listing_is_reused_and_end_completes_phase(self):
+        state = ScanState(phase=scan.PHASE_THUMBNAIL_BLOBS, position="z")
+
+        with patch.object(scan, "listdir", new=AsyncMock()) as listdir_mock:
+            done = await scan._scan_blobs(
+                state, self.throttle,
+                {scan.PHASE_THUMBNAIL_BLOBS: ["a", "z"]},
+            )
+
+        self.assertTrue(done)
+        listdir_mock.assert_not_awaited()
@@ -0,0 +1,185 @@
+# tests/services/test_intent.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.events import Events as E  # noqa: E402
+from app.models.file import File  # noqa: E402
+from app.repositories.intent import (  # noqa: E402
+    ACTION_DELETE,
+    ACTION_RENAME,
+    Intent,
+)
+from app.services.intent import (  # noqa: E402
+    begin_intent,
+    end_intent,
+    replay_intents,
+)
+
+
+def _intent(intent_id="abc", committed_if_present=True):
+    return Intent(
+        operation="file_move",
+        table="files",
+        filters={"id": 1},
+        on_commit=[(ACTION_DELETE, "/mnt/tmp/a")],
+        on_rollback=[(ACTION_RENAME, "/mnt/b", "/mnt/a")],
+        committed_if_present=committed_if_present,
+        intent_id=intent_id,
+    )
+
+
+class TestBeginEndIntent(unittest.IsolatedAsyncioTestCase):
+
+    async def test_begin_intent_writes_intent(self):
+        intent = _intent()
+
+        with patch(
+            "app.services.intent.write_intent", new=AsyncMock(),
+        ) as write_mock:
+            await begin_intent(intent)
+
+        write_mock.assert_awaited_once_with(intent)
+
+    async def test_begin_intent_propagates_failure(self):
+        with patch(
+            "app.services.intent.write_intent",
+            new=AsyncMock(side_effect=OSError("disk")),
+        ):
+            with self.assertRaises(OSError):
+                await begin_intent(_intent())
+
+    async def test_end_intent_removes_intent(self):
+        intent = _intent()
+
+        with patch(
+            "app.services.intent.remove_intent", new=AsyncMock(),
+        ) as remove_mock:
+            await end_intent(intent)
+
+        remove_mock.assert_awaited_once_with(intent)
+
+    async def test_end_intent_ignores_none(self):
+        with patch(
+            "app.services.intent.remove_intent", new=AsyncMock(),
+        ) as remove_mock:
+            await end_intent(None)
+
+        remove_mock.assert_not_awaited()
+
+    async def test_end_intent_logs_failure(self):
+        with (
+            patch(
+                "app.services.intent.remove_intent",
+                new=AsyncMock(side_effect=OSError("disk")),
+            ),
+            patch("app.services.intent.log") as log_mock,
+        ):
+            await end_intent(_intent())
+
+        log_mock.exception.assert_called_once_with(
+            "event=%s intent_id=%s", E.INTENT_REMOVE_FAILED, "abc",
+        )
+
+
+class TestReplayIntents(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        config = MagicMock(FILES_TMP_DIR="/mnt/tmp")
+        session = MagicMock()
+        session_cm = MagicMock()
+        session_cm.__aenter__ = AsyncMock(return_value=session)
+        session_cm.__aexit__ = AsyncMock(return_value=None)
+
+        self.repository = MagicMock()
+        self.repository.count_all = AsyncMock()
+
+        self.apply_mock = AsyncMock()
+        self.remove_mock = AsyncMock()
+        self.listdir_mock = AsyncMock(return_value=["a", "b"])
+        self.delete_mock = AsyncMock()
+        self.list_mock = AsyncMock()
+
+        patches = [
+            patch("app.services.intent.get_config", return_value=config),
+            patch(
+                "app.services.intent.SessionLocal",
+                return_value=session_cm,
+            ),
+            patch(
+                "app.services.intent.ORMRepository",
+                return_value=self.repository,
+            ),
+            patch("app.services.intent.list_intents", new=self.list_mock),
+            patch(
+                "app.services.intent.apply_intent_actions",
+                new=self.apply_mock,
+            ),
+            patch("app.services.intent.remove_intent", new=self.remove_mock),
+            patch("app.services.intent.listdir", new=self.listdir_mock),
+            patch("app.services.intent.delete", new=self.delete_mock),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    async def test_applies_commit_or_rollback_actions(self):
+        committed = _intent("a")
+        rolled_back = _intent("b", committed_if_present=False)
+        self.list_mock.return_value = [committed, rolled_back]
+        self.repository.count_all.side_effect = [1, 1]
+
+        await replay_intents()
+
+        self.assertEqual(self.apply_mock.await_args_list, [
+            call(committed.on_commit),
+            call(rolled_back.on_rollback),
+        ])
+        self.assertEqual(self.remove_mock.await_args_list, [
+            call(committed),
+            call(rolled_back),
+        ])
+        self.repository.count_all.assert_awaited_with(File, id=1)
+
+    async def test_missing_marker_rolls_back(self):
+        intent = _intent()
+        self.list_mock.return_value = [intent]
+        self.repository.count_all.return_value = 0
+
+        await replay_intents()
+
+        self.apply_mock.assert_awaited_once_with(intent.on_rollback)
+
+    async def test_clears_tmp_dir_when_all_replayed(self):
+        self.list_mock.return_value = []
+
+        await replay_intents()
+
+        self.assertEqual(self.delete_mock.await_args_list, [
+            call("/mnt/tmp/a"),
+            call("/mnt/tmp/b"),
+        ])
+
+    async def test_failed_intent_is_kept_and_tmp_dir_is_preserved(self):
+        failed = _intent("a")
+        replayed = _intent("b")
+        self.list_mock.return_value = [failed, replayed]
+        self.repository.count_all.return_value = 1
+        self.apply_mock.side_effect = [OSError("disk"), None]
+
+        with patch("app.services.intent.log") as log_mock:
+            await replay_intents()
+
+        self.remove_mock.assert_awaited_once_with(replayed)
+        self.listdir_mock.assert_not_awaited()
+        self.delete_mock.assert_not_awaited()
+        log_mock.exception.assert_called_once()
+        log_mock.info.assert_called_with(
+            "event=%s intents_count=%s failed_count=%s",
+            E.INTENT_REPLAY_COMPLETED, 2, 1,
+        )
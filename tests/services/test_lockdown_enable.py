@@ -74,6 +74,7 @@ class TestEnableLockdown(unittest.IsolatedAsyncioTestCase):
             ) as touch_mock,
             patch(
                 "app.services.lockdown_enable.decrypt_passphrase",
+                new_callable=AsyncMock,
             ) as decrypt_mock,
             patch(
                 "app.services.lockdown_enable.hooks.emit",
@@ -124,6 +125,7 @@ class TestEnableLockdown(unittest.IsolatedAsyncioTestCase):
             ) as touch_mock,
             patch(
                 "app.services.lockdown_enable.decrypt_passphrase",
+                new_callable=AsyncMock,
             ) as decrypt_mock,
             patch(
                 "app.services.lockdown_enable.hooks.emit",
@@ -172,6 +174,7 @@ class TestEnableLockdown(unittest.IsolatedAsyncioTestCase):
             ) as read_mock,
             patch(
                 "app.services.lockdown_enable.decrypt_passphrase",
+                new_callable=AsyncMock,
                 side_effect=ValueError,
             ) as decrypt_mock,
             patch(
@@ -231,6 +234,7 @@ class TestEnableLockdown(unittest.IsolatedAsyncioTestCase):
             ) as read_mock,
             patch(
                 "app.services.lockdown_enable.decrypt_passphrase",
+                new_callable=AsyncMock,
                 return_value=b"decrypted-passphrase",
             ) as decrypt_mock,
             patch(
@@ -4,10 +4,10 @@
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from app.services.metrics_retrieve import retrieve_metrics
+from app.services.metrics_retrieve import collect_metrics, retrieve_metrics
 
 
-class TestRetrieveMetrics(unittest.IsolatedAsyncioTestCase):
+class TestCollectMetrics(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self):
         _platform_patches = {
@@ -88,6 +88,13 @@ class TestRetrieveMetrics(unittest.IsolatedAsyncioTestCase):
         cache_mock.current_bytes = 204800
         cache_mock.max_bytes = 52428800
 
+        rate_limiter_mock = MagicMock(
+            enabled=True,
+            bucket_count=3,
+            allowed_count=40,
+            rejected_count=2,
+        )
+
         with (
             patch(
                 "app.services.metrics_retrieve.get_config",
@@ -101,6 +108,14 @@ class TestRetrieveMetrics(unittest.IsolatedAsyncioTestCase):
                 "app.services.metrics_retrieve.get_thumbnail_cache",
                 return_value=cache_mock,
             ) as get_thumbnail_cache_mock,
+            patch(
+                "app.services.metrics_retrieve.get_rate_limiter",
+                return_value=rate_limiter_mock,
+            ),
+            patch(
+                "app.services.metrics_retrieve.get_dropped_log_count",
+                return_value=5,
+            ),
             patch(
                 "app.services.metrics_retrieve.APPLICATION_START_TIME",
                 1000.0,
@@ -138,7 +153,7 @@ class TestRetrieveMetrics(unittest.IsolatedAsyncioTestCase):
                 return_value=proc,
             ) as process_mock,
         ):
-            out = await retrieve_metrics(session)
+            out = await collect_metrics(session)
 
         get_config_mock.assert_called_once()
         get_thumbnail_cache_mock.assert_called()
@@ -221,6 +236,13 @@ class TestRetrieveMetrics(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(out["lru_cache_current_bytes"], 204800)
         self.assertEqual(out["lru_cache_max_bytes"], 52428800)
 
+        self.assertTrue(out["rate_limit_enabled"])
+        self.assertEqual(out["rate_limit_bucket_count"], 3)
+        self.assertEqual(out["rate_limit_allowed_count"], 40)
+        self.assertEqual(out["rate_limit_rejected_count"], 2)
+
+        self.assertEqual(out["log_dropped_count"], 5)
+
     async def test_returns_none_for_pool_metrics_when_pool_is_missing(self):
         session = AsyncMock()
 
@@ -263,6 +285,10 @@ class TestRetrieveMetrics(unittest.IsolatedAsyncioTestCase):
                 "app.services.metrics_retrieve.get_thumbnail_cache",
                 return_value=MagicMock(count=0, current_bytes=0, max_bytes=0),
             ),
+            patch(
+                "app.services.metrics_retrieve.get_rate_limiter",
+                return_value=MagicMock(),
+            ),
             patch(
                 "app.services.metrics_retrieve.APPLICATION_START_TIME",
                 1000.0,
@@ -300,10 +326,73 @@ class TestRetrieveMetrics(unittest.IsolatedAsyncioTestCase):
                 return_value=proc,
             ),
         ):
-            out = await retrieve_metrics(session)
+            out = await collect_metrics(session)
 
         self.assertIsNone(out["cpu_frequency_hertz"])
         self.assertIsNone(out["sqlite_pool_size"])
         self.assertIsNone(out["sqlite_pool_checked_in"])
         self.assertIsNone(out["sqlite_pool_checked_out"])
         self.assertIsNone(out["sqlite_pool_overflow"])
+
+
+class TestRetrieveMetrics(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.session = AsyncMock()
+
+    async def _retrieve(self, interval, latest, now=1000.0):
+        history = MagicMock()
+        history.latest.return_value = latest
+
+        with (
+            patch(
+                "app.services.metrics_retrieve.get_config",
+                return_value=MagicMock(
+                    METRICS_SAMPLE_INTERVAL_SECONDS=interval,
+                ),
+            ),
+            patch(
+                "app.services.metrics_retrieve.get_metrics_history",
+                return_value=history,
+            ),
+            patch(
+                "app.services.metrics_retrieve.time.time", return_value=now,
+            ),
+            patch(
+                "app.services.metrics_retrieve.collect_metrics",
+                new=AsyncMock(return_value={"live": True}),
+            ) as collect_mock,
+        ):
+            result = await retrieve_metrics(self.session)
+
+        return result, collect_mock
+
+    async def test_returns_recent_sample(self):
+        result, collect_mock = await self._retrieve(
+            10, (985.0, {"sampled": True}),
+        )
+
+        self.assertEqual(result, {"sampled": True})
+        collect_mock.assert_not_awaited()
+
+    async def test_collects_when_sample_is_stale(self):
+        result, collect_mock = await self._retrieve(
+            10, (970.0, {"sampled": True}),
+        )
+
+        self.assertEqual(result, {"live": True})
+        collect_mock.assert_awaited_once_with(self.session)
+
+    async def test_collects_when_no_sample_yet(self):
+        result, collect_mock = await self._retrieve(10, None)
+
+        self.assertEqual(result, {"live": True})
+        collect_mock.assert_awaited_once_with(self.session)
+
+    async def test_collects_when_sampling_disabled(self):
+        result, collect_mock = await self._retrieve(
+            0, (999.0, {"sampled": True}),
+        )
+
+        self.assertEqual(result, {"live": True})
+        collect_mock.assert_awaited_once_with(self.session)
@@ -0,0 +1,62 @@
+# tests/services/test_metrics_export.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import MagicMock, call, patch
+
+from app.services.metrics_export import export_metrics
+
+
+class TestExportMetrics(unittest.TestCase):
+
+    def setUp(self):
+        module = "app.services.metrics_export."
+        self.patchers = {
+            "get_thumbnail_cache": patch(
+                module + "get_thumbnail_cache",
+                return_value=MagicMock(count=2, current_bytes=300),
+            ),
+            "get_revision_cache": patch(
+                module + "get_revision_cache",
+                return_value=MagicMock(count=1, current_bytes=50),
+            ),
+            "request_load": patch(
+                module + "request_load", MagicMock(active=3),
+            ),
+            "in_progress": patch(module + "HTTP_REQUESTS_IN_PROGRESS"),
+            "entries": patch(module + "CACHE_ENTRIES"),
+            "bytes": patch(module + "CACHE_BYTES"),
+            "registry": patch(module + "registry"),
+        }
+        self.mocks = {
+            name: patcher.start() for name, patcher in self.patchers.items()
+        }
+        for patcher in self.patchers.values():
+            self.addCleanup(patcher.stop)
+
+    def test_updates_gauges_and_renders_registry(self):
+        self.mocks["registry"].render.return_value = "# metrics\n"
+
+        result = export_metrics()
+
+        self.assertEqual(result, "# metrics\n")
+        in_progress = self.mocks["in_progress"].labels.return_value
+        in_progress.set.assert_called_once_with(3)
+        self.assertEqual(
+            self.mocks["entries"].labels.call_args_list,
+            [call("thumbnail"), call("revision")],
+        )
+        self.assertEqual(
+            self.mocks["bytes"].labels.return_value.set.call_args_list,
+            [call(300), call(50)],
+        )
+
+    def test_renders_real_registry(self):
+        self.patchers["registry"].stop()
+        self.patchers.pop("registry")
+
+        result = export_metrics()
+
+        self.assertIn("# TYPE hidden_http_requests_total counter\n", result)
+        self.assertIn("# TYPE hidden_lock_wait_seconds histogram\n", result)
+        self.assertTrue(result.endswith("\n"))
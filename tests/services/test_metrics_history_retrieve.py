@@ -0,0 +1,43 @@
+# tests/services/test_metrics_history_retrieve.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.schemas.metrics_history_retrieve import MetricsHistoryRequest
+from app.services.metrics_history_retrieve import retrieve_metrics_history
+
+
+class TestRetrieveMetricsHistory(unittest.TestCase):
+
+    def test_returns_history_of_last_minutes(self):
+        history = MagicMock()
+        history.since.return_value = {
+            "timestamps": [1000.0],
+            "series": {"cpu": [1.0]},
+        }
+
+        with (
+            patch(
+                "app.services.metrics_history_retrieve.get_metrics_history",
+                return_value=history,
+            ),
+            patch(
+                "app.services.metrics_history_retrieve.get_config",
+                return_value=MagicMock(METRICS_SAMPLE_INTERVAL_SECONDS=10),
+            ),
+            patch(
+                "app.services.metrics_history_retrieve.time.time",
+                return_value=1300.0,
+            ),
+        ):
+            result = retrieve_metrics_history(
+                MetricsHistoryRequest(minutes=5),
+            )
+
+        history.since.assert_called_once_with(1000.0)
+        self.assertEqual(result, {
+            "sample_interval_seconds": 10,
+            "timestamps": [1000.0],
+            "series": {"cpu": [1.0]},
+        })
@@ -0,0 +1,42 @@
+# tests/services/test_metrics_sample.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.services.metrics_sample import sample_metrics  # noqa: E402
+
+
+class TestSampleMetrics(unittest.IsolatedAsyncioTestCase):
+
+    async def test_appends_collected_metrics(self):
+        session = MagicMock()
+        session_local = MagicMock()
+        session_local.return_value.__aenter__ = AsyncMock(
+            return_value=session,
+        )
+        session_local.return_value.__aexit__ = AsyncMock(return_value=None)
+        history = MagicMock()
+
+        with (
+            patch("app.services.metrics_sample.SessionLocal", session_local),
+            patch(
+                "app.services.metrics_sample.collect_metrics",
+                new=AsyncMock(return_value={"cpu": 1}),
+            ) as collect_mock,
+            patch(
+                "app.services.metrics_sample.get_metrics_history",
+                return_value=history,
+            ),
+            patch(
+                "app.services.metrics_sample.time.time", return_value=100.0,
+            ),
+        ):
+            await sample_metrics()
+
+        collect_mock.assert_awaited_once_with(session)
+        history.append.assert_called_once_with(100.0, {"cpu": 1})
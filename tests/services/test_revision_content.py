@@ -0,0 +1,290 @@
+# tests/services/test_revision_content.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import hashlib
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.cache.lru import LRUCache  # noqa: E402
+from app.constants import (  # noqa: E402
+    REVISION_DELTA_KEYFRAME_INTERVAL,
+    REVISION_DELTA_MAX_BYTES,
+)
+from app.repositories.delta import encode_delta  # noqa: E402
+from app.services import revision_content as rc  # noqa: E402
+
+HEAD_PATH = "/mnt/files/docs/a.txt"
+
+V1 = b"one\ntwo\nthree\n"
+V2 = b"one\n2\nthree\n"
+V3 = b"one\n2\nthree\nfour\n"
+HEAD = b"zero\none\n2\nthree\nfour\n"
+
+
+def _revision(number, is_delta=True, content=b""):
+    return SimpleNamespace(
+        id=100 + number,
+        revision_number=number,
+        is_delta=is_delta,
+        mimetype="text/plain",
+        checksum=hashlib.sha256(content).hexdigest(),
+        absolute_path=f"/mnt/revisions/{number}",
+    )
+
+
+class RevisionContentTestCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cache = LRUCache(1 << 20)
+        cache_patcher = patch.object(
+            rc, "get_revision_cache", return_value=self.cache,
+        )
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+
+    def _storage(self, revisions):
+        """
+        Return read side effect serving HEAD and revision blobs: v3 is
+        a delta against HEAD, v2 a delta against v3 and v1 a delta
+        against v2, unless the revision is a full copy.
+        """
+        contents = {1: V1, 2: V2, 3: V3}
+        bases = {1: V2, 2: V3, 3: HEAD}
+        blobs = {HEAD_PATH: HEAD}
+        for revision in revisions:
+            n = revision.revision_number
+            blobs[revision.absolute_path] = (
+                encode_delta(bases[n], contents[n])
+                if revision.is_delta else contents[n]
+            )
+        return AsyncMock(side_effect=lambda path: blobs[path])
+
+
+class TestIsDeltaDue(RevisionContentTestCase):
+
+    def _file(self, is_text=True, filesize=10):
+        return MagicMock(id=1, is_text=is_text, filesize=filesize)
+
+    async def test_non_text_file_gets_full_copy(self):
+        repository = MagicMock(select_all=AsyncMock())
+
+        result = await rc.is_delta_due(repository, self._file(False), 10)
+
+        self.assertFalse(result)
+        repository.select_all.assert_not_awaited()
+
+    async def test_large_content_gets_full_copy(self):
+        repository = MagicMock(select_all=AsyncMock())
+
+        result = await rc.is_delta_due(
+            repository, self._file(), REVISION_DELTA_MAX_BYTES + 1,
+        )
+
+        self.assertFalse(result)
+
+    async def test_full_run_of_deltas_gets_keyframe(self):
+        newest = [
+            _revision(n)
+            for n in range(REVISION_DELTA_KEYFRAME_INTERVAL - 1, 0, -1)
+        ]
+        repository = MagicMock(select_all=AsyncMock(return_value=newest))
+
+        result = await rc.is_delta_due(repository, self._file(), 10)
+
+        self.assertFalse(result)
+        repository.select_all.assert_awaited_once_with(
+            rc.FileRevision,
+            file_id=1,
+            order_by="revision_number",
+            order="desc",
+            limit=REVISION_DELTA_KEYFRAME_INTERVAL - 1,
+        )
+
+    async def test_delta_due_after_recent_keyframe(self):
+        newest = [_revision(2), _revision(1, is_delta=False)]
+        repository = MagicMock(select_all=AsyncMock(return_value=newest))
+
+        self.assertTrue(await rc.is_delta_due(repository, self._file(), 10))
+
+    async def test_first_revision_is_delta(self):
+        repository = MagicMock(select_all=AsyncMock(return_value=[]))
+
+        self.assertTrue(await rc.is_delta_due(repository, self._file(), 10))
+
+
+class TestReconstructRevision(RevisionContentTestCase):
+
+    async def test_applies_deltas_from_head(self):
+        revisions = [_revision(1, content=V1), _revision(2, content=V2),
+                     _revision(3, content=V3)]
+        file = SimpleNamespace(file_revisions=list(reversed(revisions)))
+        storage = self._storage(revisions)
+
+        with patch.object(rc, "read", new=storage), \
+                patch("app.repositories.delta.read", new=storage):
+            result = await rc.reconstruct_revision(
+                file, revisions[0], HEAD_PATH,
+            )
+
+        self.assertEqual(result, V1)
+        self.assertEqual(self.cache.get(101), ("text/plain", V1))
+
+    async def test_starts_from_nearest_full_copy(self):
+        revisions = [_revision(1, content=V1),
+                     _revision(2, is_delta=False, content=V2),
+                     _revision(3, content=V3)]
+        file = SimpleNamespace(file_revisions=revisions)
+        storage = self._storage(revisions)
+
+        with patch.object(rc, "read", new=storage), \
+                patch("app.repositories.delta.read", new=storage):
+            result = await rc.reconstruct_revision(
+                file, revisions[0], HEAD_PATH,
+            )
+
+        self.assertEqual(result, V1)
+        read_paths = [c.args[0] for c in storage.await_args_list]
+        self.assertNotIn(HEAD_PATH, read_paths)
+        self.assertNotIn("/mnt/revisions/3", read_paths)
+
+    async def test_returns_cached_content(self):
+        revision = _revision(1, content=V1)
+        self.cache.put(101, "text/plain", V1)
+
+        with patch.object(rc, "read", new=AsyncMock()) as read_mock:
+            result = await rc.reconstruct_revision(
+                SimpleNamespace(file_revisions=[revision]),
+                revision,
+                HEAD_PATH,
+            )
+
+        self.assertEqual(result, V1)
+        read_mock.assert_not_awaited()
+
+    async def test_raises_on_checksum_mismatch(self):
+        revision = _revision(3, content=b"other")
+        storage = self._storage([revision])
+
+        with patch.object(rc, "read", new=storage), \
+                patch("app.repositories.delta.read", new=storage):
+            with self.assertRaises(ValueError):
+                await rc.reconstruct_revision(
+                    SimpleNamespace(file_revisions=[revision]),
+                    revision,
+                    HEAD_PATH,
+                )
+
+        self.assertIsNone(self.cache.get(103))
+
+
+class TestSelectRebasedRevisions(unittest.TestCase):
+
+    def test_rebases_deltas_above_expired_revisions(self):
+        revisions = [_revision(n) for n in range(1, 6)]
+        revisions[2].is_delta = False
+
+        result = rc.select_rebased_revisions(
+            revisions, [revisions[1], revisions[4]],
+        )
+
+        self.assertEqual(result, [
+            (revisions[0], revisions[2], False),
+            (revisions[3], None, False),
+        ])
+
+    def test_keyframe_when_expired_full_copy_is_skipped(self):
+        revisions = [_revision(n) for n in range(1, 4)]
+        revisions[1].is_delta = False
+
+        result = rc.select_rebased_revisions(revisions, [revisions[1]])
+
+        self.assertEqual(result, [(revisions[0], revisions[2], True)])
+
+    def test_full_copies_and_unaffected_deltas_are_kept(self):
+        revisions = [_revision(1, is_delta=False), _revision(2),
+                     _revision(3)]
+
+        result = rc.select_rebased_revisions(revisions, [revisions[1]])
+
+        self.assertEqual(result, [])
+
+
+class TestRebaseRevision(RevisionContentTestCase):
+
+    async def test_writes_keyframe_as_full_copy(self):
+        revision = _revision(1, content=V1)
+
+        with (
+            patch.object(
+                rc, "reconstruct_revision", new=AsyncMock(return_value=V1),
+            ),
+            patch.object(rc, "write", new=AsyncMock()) as write_mock,
+            patch.object(rc, "write_delta", new=AsyncMock()) as delta_mock,
+        ):
+            await rc.rebase_revision(
+                MagicMock(), revision, None, True, HEAD_PATH, "/new",
+            )
+
+        write_mock.assert_awaited_once_with("/new", V1)
+        delta_mock.assert_not_awaited()
+
+    async def test_writes_delta_against_head_or_base(self):
+        revision = _revision(1, content=V1)
+        full_base = _revision(3, is_delta=False, content=V3)
+        cases = [
+            (None, HEAD),
+            (full_base, V3),
+        ]
+        for base, base_content in cases:
+            with self.subTest(base=base):
+                with (
+                    patch.object(
+                        rc, "reconstruct_revision",
+                        new=AsyncMock(return_value=V1),
+                    ),
+                    patch.object(
+                        rc, "read", new=AsyncMock(return_value=base_content),
+                    ) as read_mock,
+                    patch.object(
+                        rc, "write_delta", new=AsyncMock(),
+                    ) as delta_mock,
+                ):
+                    await rc.rebase_revision(
+                        MagicMock(), revision, base, False, HEAD_PATH,
+                        "/new",
+                    )
+
+                read_mock.assert_awaited_once_with(
+                    HEAD_PATH if base is None else base.absolute_path,
+                )
+                delta_mock.assert_awaited_once_with(
+                    base_content, V1, "/new",
+                )
+
+    async def test_writes_delta_against_reconstructed_delta_base(self):
+        revision = _revision(1, content=V1)
+        base = _revision(2, content=V2)
+        file = MagicMock()
+
+        with (
+            patch.object(
+                rc, "reconstruct_revision",
+                new=AsyncMock(side_effect=[V1, V2]),
+            ) as reconstruct_mock,
+            patch.object(rc, "write_delta", new=AsyncMock()) as delta_mock,
+        ):
+            await rc.rebase_revision(
+                file, revision, base, False, HEAD_PATH, "/new",
+            )
+
+        self.assertEqual(
+            [c.args[1] for c in reconstruct_mock.await_args_list],
+            [revision, base],
+        )
+        delta_mock.assert_awaited_once_with(V2, V1, "/new")
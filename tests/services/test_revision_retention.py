@@ -0,0 +1,523 @@
+# tests/services/test_revision_retention.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.events import Events as E  # noqa: E402
+from app.locks import LockType  # noqa: E402
+from app.repositories.intent import ACTION_DELETE  # noqa: E402
+from app.services import revision_retention as retention  # noqa: E402
+from app.services.revision_retention import RetentionPolicy  # noqa: E402
+
+DAY = 86400
+
+
+def _session_local(session=None):
+    session = session or MagicMock()
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=session)
+    session_cm.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=session_cm)
+
+
+def _revision(number, created_at=0, filesize=10, is_delta=False):
+    return SimpleNamespace(
+        id=100 + number,
+        revision_number=number,
+        created_at=created_at,
+        filesize=filesize,
+        is_delta=is_delta,
+        absolute_path=f"/mnt/revisions/{number}",
+    )
+
+
+def _folder(folder_id, is_write_protected=False):
+    folder = MagicMock(id=folder_id, is_write_protected=is_write_protected)
+    folder.is_write_protected_recursive.return_value = False
+    return folder
+
+
+@asynccontextmanager
+async def _no_lock(*args, **kwargs):
+    yield
+
+
+def _numbers(revisions):
+    return [revision.revision_number for revision in revisions]
+
+
+class TestRetentionPolicy(unittest.TestCase):
+
+    def test_keeps_all_only_without_rules(self):
+        self.assertTrue(RetentionPolicy().keeps_all)
+        self.assertFalse(RetentionPolicy(max_bytes=1).keeps_all)
+
+    def test_parse_policy_merges_with_default(self):
+        default = RetentionPolicy(keep_last=5, max_bytes=100)
+        policy = retention.parse_policy('{"keep_daily": 7}', default)
+        self.assertEqual(
+            policy,
+            RetentionPolicy(keep_last=5, keep_daily=7, max_bytes=100),
+        )
+
+    def test_parse_policy_rejects_invalid_input(self):
+        for value in (
+            "[]",
+            '{"keep_hourly": 1}',
+            '{"keep_last": -1}',
+            '{"keep_last": true}',
+            '{"keep_last": "1"}',
+            "not json",
+        ):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    retention.parse_policy(value, RetentionPolicy())
+
+    def test_resolve_policy_uses_nearest_override(self):
+        folder, parent, root = _folder(3), _folder(2), _folder(1)
+        default = RetentionPolicy(keep_last=1)
+        overrides = {
+            1: RetentionPolicy(keep_last=10),
+            2: RetentionPolicy(keep_last=20),
+        }
+
+        policy = retention.resolve_policy(
+            folder, (parent, root), default, overrides,
+        )
+        self.assertEqual(policy.keep_last, 20)
+
+        policy = retention.resolve_policy(folder, (), default, {})
+        self.assertIs(policy, default)
+
+    def test_write_protected_folder_keeps_all(self):
+        folder = _folder(3)
+        folder.is_write_protected_recursive.return_value = True
+
+        policy = retention.resolve_policy(
+            folder, (_folder(2, is_write_protected=True),),
+            RetentionPolicy(keep_last=1), {},
+        )
+        self.assertTrue(policy.keeps_all)
+
+
+class TestSelectExpiredRevisions(unittest.TestCase):
+
+    def test_keep_all_policy_expires_nothing(self):
+        revisions = [_revision(n) for n in range(1, 4)]
+        self.assertEqual(
+            retention.select_expired_revisions(revisions, RetentionPolicy()),
+            [],
+        )
+
+    def test_keep_last_expires_older_revisions_newest_first(self):
+        revisions = [_revision(n) for n in (2, 5, 1, 4, 3)]
+        expired = retention.select_expired_revisions(
+            revisions, RetentionPolicy(keep_last=2),
+        )
+        self.assertEqual(_numbers(expired), [3, 2, 1])
+
+    def test_keep_daily_keeps_newest_revision_of_each_day(self):
+        revisions = [
+            _revision(1, created_at=0),
+            _revision(2, created_at=100),
+            _revision(3, created_at=DAY + 100),
+            _revision(4, created_at=3 * DAY),
+            _revision(5, created_at=3 * DAY + 100),
+        ]
+        expired = retention.select_expired_revisions(
+            revisions, RetentionPolicy(keep_daily=2),
+        )
+        self.assertEqual(_numbers(expired), [4, 2, 1])
+
+    def test_period_rules_and_keep_last_combine(self):
+        revisions = [
+            _revision(1, created_at=0),
+            _revision(2, created_at=40 * DAY),
+            _revision(3, created_at=41 * DAY),
+            _revision(4, created_at=42 * DAY),
+        ]
+        expired = retention.select_expired_revisions(
+            revisions, RetentionPolicy(keep_last=2, keep_monthly=2),
+        )
+        self.assertEqual(_numbers(expired), [2])
+
+    def test_keep_weekly_uses_iso_weeks(self):
+        # 1970-01-01 is a Thursday; day 4 is the Monday of the next week.
+        revisions = [
+            _revision(1, created_at=0),
+            _revision(2, created_at=3 * DAY),
+            _revision(3, created_at=4 * DAY),
+        ]
+        expired = retention.select_expired_revisions(
+            revisions, RetentionPolicy(keep_weekly=5),
+        )
+        self.assertEqual(_numbers(expired), [1])
+
+    def test_max_bytes_alone_caps_newest_revisions(self):
+        revisions = [_revision(n, filesize=40) for n in range(1, 5)]
+        expired = retention.select_expired_revisions(
+            revisions, RetentionPolicy(max_bytes=100),
+        )
+        self.assertEqual(_numbers(expired), [2, 1])
+
+    def test_max_bytes_caps_revisions_kept_by_rules(self):
+        revisions = [
+            _revision(1, filesize=10),
+            _revision(2, filesize=60),
+            _revision(3, filesize=50),
+        ]
+        expired = retention.select_expired_revisions(
+            revisions, RetentionPolicy(keep_last=3, max_bytes=100),
+        )
+        self.assertEqual(_numbers(expired), [2, 1])
+
+
+class RevisionRetentionTestCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.session = MagicMock()
+        self.config = MagicMock(
+            REVISIONS_KEEP_LAST=2,
+            REVISIONS_KEEP_DAILY=0,
+            REVISIONS_KEEP_WEEKLY=0,
+            REVISIONS_KEEP_MONTHLY=0,
+            REVISIONS_MAX_BYTES_PER_FILE=0,
+        )
+        patches = [
+            patch.object(retention, "get_config", return_value=self.config),
+            patch.object(
+                retention, "SessionLocal", _session_local(self.session),
+            ),
+            patch.object(retention, "log"),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+
+class TestLoadFolderPolicies(RevisionRetentionTestCase):
+
+    async def test_invalid_overrides_are_ignored(self):
+        repository = MagicMock()
+        repository.select_all = AsyncMock(return_value=[
+            MagicMock(variable_key="folder-7", variable_value='{"keep_last": 9}'),  # noqa: E501
+            MagicMock(variable_key="folder-x", variable_value="{}"),
+            MagicMock(variable_key="other", variable_value="{}"),
+            MagicMock(variable_key="folder-8", variable_value="[]"),
+        ])
+        default = RetentionPolicy(keep_daily=3)
+
+        policies = await retention.load_folder_policies(repository, default)
+
+        repository.select_all.assert_awaited_once_with(
+            retention.Variable,
+            namespace="revision_retention",
+        )
+        self.assertEqual(policies, {
+            7: RetentionPolicy(keep_last=9, keep_daily=3),
+        })
+        self.assertEqual(retention.log.warning.call_count, 3)
+
+
+class TestEstimateRetention(RevisionRetentionTestCase):
+
+    async def test_sums_stored_and_expired_revisions(self):
+        repository = MagicMock()
+        batches = [
+            {
+                1: (10, [_revision(n, filesize=5) for n in range(1, 4)]),
+                2: (10, [_revision(1, filesize=7)]),
+            },
+            {},
+        ]
+
+        with (
+            patch.object(
+                retention, "load_folder_policies",
+                new=AsyncMock(return_value={}),
+            ),
+            patch.object(
+                retention, "_select_revision_batch",
+                new=AsyncMock(side_effect=batches),
+            ) as batch_mock,
+            patch.object(
+                retention, "_get_folder_policy",
+                new=AsyncMock(return_value=RetentionPolicy(keep_last=2)),
+            ),
+        ):
+            estimate = await retention.estimate_retention(repository)
+
+        self.assertEqual(batch_mock.await_args_list, [
+            call(repository, 0),
+            call(repository, 2),
+        ])
+        self.assertEqual(estimate, retention.RetentionEstimate(
+            files_count=2,
+            revisions_count=4,
+            revisions_bytes=22,
+            expired_files_count=1,
+            expired_revisions_count=1,
+            expired_bytes=5,
+        ))
+
+
+class TestCompactRevisions(RevisionRetentionTestCase):
+
+    async def test_returns_without_rules(self):
+        self.config.REVISIONS_KEEP_LAST = 0
+
+        with (
+            patch.object(
+                retention, "load_folder_policies",
+                new=AsyncMock(return_value={1: RetentionPolicy()}),
+            ),
+            patch.object(
+                retention, "_select_revision_batch", new=AsyncMock(),
+            ) as batch_mock,
+        ):
+            await retention.compact_revisions()
+
+        batch_mock.assert_not_awaited()
+
+    async def test_compacts_only_candidates_within_budget(self):
+        batches = [
+            {
+                1: (10, [_revision(n) for n in range(1, 4)]),
+                2: (10, [_revision(1)]),
+                3: (10, [_revision(n) for n in range(1, 5)]),
+            },
+            {},
+        ]
+
+        with (
+            patch.object(
+                retention, "load_folder_policies",
+                new=AsyncMock(return_value={}),
+            ),
+            patch.object(
+                retention, "_select_revision_batch",
+                new=AsyncMock(side_effect=batches),
+            ),
+            patch.object(
+                retention, "_get_folder_policy",
+                new=AsyncMock(return_value=RetentionPolicy(keep_last=2)),
+            ),
+            patch.object(
+                retention, "REVISION_COMPACT_MAX_REVISIONS_PER_RUN", 5,
+            ),
+            patch.object(
+                retention, "_compact_file",
+                new=AsyncMock(side_effect=[Exception("boom"), (2, 20)]),
+            ) as compact_mock,
+        ):
+            await retention.compact_revisions()
+
+        default = RetentionPolicy(keep_last=2)
+        self.assertEqual(compact_mock.await_args_list, [
+            call(1, default, {}, 5),
+            call(3, default, {}, 5),
+        ])
+        retention.log.exception.assert_called_once_with(
+            "event=%s file_id=%s", E.REVISION_COMPACT_FILE_FAILED, 1,
+        )
+
+    async def test_stops_when_budget_is_spent(self):
+        batch = {
+            1: (10, [_revision(n) for n in range(1, 4)]),
+            2: (10, [_revision(n) for n in range(1, 4)]),
+        }
+
+        with (
+            patch.object(
+                retention, "load_folder_policies",
+                new=AsyncMock(return_value={}),
+            ),
+            patch.object(
+                retention, "_select_revision_batch",
+                new=AsyncMock(return_value=batch),
+            ) as batch_mock,
+            patch.object(
+                retention, "_get_folder_policy",
+                new=AsyncMock(return_value=RetentionPolicy(keep_last=2)),
+            ),
+            patch.object(
+                retention, "REVISION_COMPACT_MAX_REVISIONS_PER_RUN", 1,
+            ),
+            patch.object(
+                retention, "_compact_file",
+                new=AsyncMock(return_value=(1, 10)),
+            ) as compact_mock,
+        ):
+            await retention.compact_revisions()
+
+        compact_mock.assert_awaited_once()
+        batch_mock.assert_awaited_once()
+
+
+class TestCompactFile(RevisionRetentionTestCase):
+
+    def _file(self, path="/mnt/files/docs/a.txt"):
+        file = MagicMock(id=1)
+        file.get_absolute_path.return_value = path
+        file.file_folder = _folder(10)
+        return file
+
+    def _repository(self, files, revisions):
+        repository = MagicMock()
+        repository.select = AsyncMock(side_effect=files)
+        repository.select_parent_chain = AsyncMock(return_value=())
+        repository.select_all = AsyncMock(return_value=revisions)
+        repository.delete_all = AsyncMock()
+        repository.update = AsyncMock()
+        repository.commit = AsyncMock()
+        repository.rollback = AsyncMock()
+        return repository
+
+    def _patches(self, repository):
+        return (
+            patch.object(
+                retention, "ORMRepository", return_value=repository,
+            ),
+            patch.object(retention.locks, "lock_file", side_effect=_no_lock),
+            patch.object(retention, "begin_intent", new=AsyncMock()),
+            patch.object(retention, "end_intent", new=AsyncMock()),
+            patch.object(retention, "write_audit", new=AsyncMock()),
+            patch.object(retention, "delete", new=AsyncMock()),
+        )
+
+    async def test_deletes_oldest_expired_revisions_within_budget(self):
+        file = self._file()
+        revisions = [_revision(n, filesize=n) for n in range(1, 6)]
+        repository = self._repository([file, file], revisions)
+        (
+            repository_patch, lock_patch, begin_patch, end_patch,
+            audit_patch, delete_patch,
+        ) = self._patches(repository)
+
+        with (
+            repository_patch, lock_patch as lock_mock,
+            begin_patch as begin_mock, end_patch as end_mock,
+            audit_patch as audit_mock, delete_patch as delete_mock,
+        ):
+            result = await retention._compact_file(
+                1, RetentionPolicy(keep_last=2), {}, 2,
+            )
+
+        self.assertEqual(result, (2, 3))
+        lock_mock.assert_called_once_with(
+            "/mnt/files/docs/a.txt", LockType.WRITE,
+        )
+        intent = begin_mock.await_args.args[0]
+        self.assertEqual(intent.table, "files_revisions")
+        self.assertEqual(intent.filters, {"id__in": [102, 101]})
+        self.assertFalse(intent.committed_if_present)
+        self.assertEqual(intent.on_commit, [
+            (ACTION_DELETE, "/mnt/revisions/2"),
+            (ACTION_DELETE, "/mnt/revisions/1"),
+        ])
+        repository.delete_all.assert_awaited_once_with(
+            retention.FileRevision, id__in=[102, 101],
+        )
+        audit_mock.assert_awaited_once_with(
+            repository=repository,
+            event=E.REVISION_COMPACT_FILE_COMPACTED,
+            resource_type="files",
+            resource_id=1,
+        )
+        repository.commit.assert_awaited_once_with()
+        self.assertEqual(delete_mock.await_args_list, [
+            call("/mnt/revisions/2"),
+            call("/mnt/revisions/1"),
+        ])
+        end_mock.assert_awaited_once_with(intent)
+
+    async def test_rebases_kept_delta_into_new_blob(self):
+        file = self._file()
+        revisions = [_revision(n, is_delta=True) for n in range(1, 4)]
+        repository = self._repository([file, file], revisions)
+        patches = self._patches(repository)
+        new_uuid = uuid.UUID("00000000-0000-4000-8000-0000000000aa")
+
+        with (
+            patches[0], patches[1], patches[2] as begin_mock, patches[3],
+            patches[4], patches[5] as delete_mock,
+            patch.object(
+                retention, "select_rebased_revisions",
+                return_value=[(revisions[2], None, True)],
+            ),
+            patch.object(
+                retention, "rebase_revision", new=AsyncMock(),
+            ) as rebase_mock,
+            patch.object(retention.uuid, "uuid4", return_value=new_uuid),
+        ):
+            await retention._compact_file(
+                1, RetentionPolicy(keep_last=1), {}, 10,
+            )
+
+        rebase_mock.assert_awaited_once_with(
+            file, revisions[2], None, True,
+            "/mnt/files/docs/a.txt", f"/mnt/revisions/{new_uuid}",
+        )
+        self.assertEqual(revisions[2].revision_uuid, str(new_uuid))
+        self.assertFalse(revisions[2].is_delta)
+        repository.update.assert_awaited_once_with(revisions[2])
+
+        intent = begin_mock.await_args.args[0]
+        self.assertEqual(intent.on_commit, [
+            (ACTION_DELETE, "/mnt/revisions/2"),
+            (ACTION_DELETE, "/mnt/revisions/1"),
+            (ACTION_DELETE, "/mnt/revisions/3"),
+        ])
+        self.assertEqual(intent.on_rollback, [
+            (ACTION_DELETE, f"/mnt/revisions/{new_uuid}"),
+        ])
+        self.assertEqual(delete_mock.await_args_list, [
+            call("/mnt/revisions/2"),
+            call("/mnt/revisions/1"),
+            call("/mnt/revisions/3"),
+        ])
+
+    async def test_skips_file_moved_before_lock(self):
+        moved = self._file(path="/mnt/files/other/a.txt")
+        repository = self._repository([self._file(), moved], [])
+        patches = self._patches(repository)
+
+        with (
+            patches[0], patches[1], patches[2] as begin_mock,
+            patches[3], patches[4], patches[5],
+        ):
+            result = await retention._compact_file(
+                1, RetentionPolicy(keep_last=1), {}, 10,
+            )
+
+        self.assertEqual(result, (0, 0))
+        repository.select_all.assert_not_awaited()
+        begin_mock.assert_not_awaited()
+
+    async def test_rolls_back_and_keeps_blobs_on_failure(self):
+        file = self._file()
+        revisions = [_revision(n) for n in range(1, 4)]
+        repository = self._repository([file, file], revisions)
+        repository.commit.side_effect = Exception("commit failed")
+        patches = self._patches(repository)
+
+        with (
+            patches[0], patches[1], patches[2], patches[3] as end_mock,
+            patches[4], patches[5] as delete_mock,
+        ):
+            with self.assertRaises(Exception):
+                await retention._compact_file(
+                    1, RetentionPolicy(keep_last=2), {}, 10,
+                )
+
+        repository.rollback.assert_awaited_once_with()
+        delete_mock.assert_not_awaited()
+        end_mock.assert_awaited_once()
@@ -0,0 +1,86 @@
+# tests/services/test_revision_retention_estimate.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.events import Events as E  # noqa: E402
+from app.hooks import HookManager  # noqa: E402
+from app.services.revision_retention import RetentionEstimate  # noqa: E402
+from app.services.revision_retention_estimate import (  # noqa: E402
+    estimate_revision_retention,
+)
+
+
+class TestEstimateRevisionRetention(unittest.IsolatedAsyncioTestCase):
+
+    async def test_runs_registered_hooks(self):
+        session = MagicMock()
+        hook_manager = HookManager()
+        hook = AsyncMock()
+        hook_manager.on(E.REVISION_RETENTION_ESTIMATE_COMPLETED, hook)
+        estimate = RetentionEstimate(
+            files_count=0,
+            revisions_count=0,
+            revisions_bytes=0,
+            expired_files_count=0,
+            expired_revisions_count=0,
+            expired_bytes=0,
+        )
+
+        with (
+            patch("app.services.revision_retention_estimate.ORMRepository"),
+            patch(
+                "app.services.revision_retention_estimate."
+                "estimate_retention",
+                new=AsyncMock(return_value=estimate),
+            ),
+            patch(
+                "app.services.revision_retention_estimate.hooks",
+                new=hook_manager,
+            ),
+        ):
+            response = await estimate_revision_retention(session)
+
+        hook.assert_awaited_once_with(session, None)
+        self.assertEqual(response.expired_bytes, 0)
+
+    async def test_returns_estimate(self):
+        session = MagicMock()
+        repository = MagicMock()
+        estimate = RetentionEstimate(
+            files_count=2,
+            revisions_count=5,
+            revisions_bytes=500,
+            expired_files_count=1,
+            expired_revisions_count=3,
+            expired_bytes=300,
+        )
+
+        with (
+            patch(
+                "app.services.revision_retention_estimate.ORMRepository",
+                return_value=repository,
+            ),
+            patch(
+                "app.services.revision_retention_estimate."
+                "estimate_retention",
+                new=AsyncMock(return_value=estimate),
+            ) as estimate_mock,
+            patch(
+                "app.services.revision_retention_estimate.hooks.emit",
+                new=AsyncMock(),
+            ) as emit_mock,
+        ):
+            response = await estimate_revision_retention(session)
+
+        estimate_mock.assert_awaited_once_with(repository)
+        emit_mock.assert_awaited_once_with(
+            E.REVISION_RETENTION_ESTIMATE_COMPLETED, session, None,
+        )
+        self.assertEqual(response.revisions_count, 5)
+        self.assertEqual(response.expired_bytes, 300)
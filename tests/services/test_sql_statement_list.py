@@ -0,0 +1,37 @@
+# tests/services/test_sql_statement_list.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.schemas.sql_statement_list import SqlStatementListRequest
+from app.services.sql_statement_list import list_slow_sql_statements
+
+
+class TestListSlowSqlStatements(unittest.TestCase):
+
+    def test_returns_top_statements_and_threshold(self):
+        statement = MagicMock()
+        statement.to_dict.return_value = {"statement_id": "abc"}
+        slow_sql_log = MagicMock()
+        slow_sql_log.top.return_value = [statement]
+
+        with (
+            patch(
+                "app.services.sql_statement_list.get_slow_sql_log",
+                return_value=slow_sql_log,
+            ),
+            patch(
+                "app.services.sql_statement_list.get_config",
+                return_value=MagicMock(SQL_SLOW_THRESHOLD_MILLISECONDS=100),
+            ),
+        ):
+            result = list_slow_sql_statements(
+                SqlStatementListRequest(limit=5, order_by="count"),
+            )
+
+        slow_sql_log.top.assert_called_once_with(5, "count")
+        self.assertEqual(result, {
+            "threshold_milliseconds": 100,
+            "statements": [{"statement_id": "abc"}],
+        })
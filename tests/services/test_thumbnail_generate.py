@@ -0,0 +1,123 @@
+# tests/services/test_thumbnail_generate.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.db.engine import load_all_models  # noqa: E402
+from app.locks import LockType  # noqa: E402
+from app.models.file import File  # noqa: E402
+from app.models.file_thumbnail import FileThumbnail  # noqa: E402
+from app.services import thumbnail_generate as svc  # noqa: E402
+
+load_all_models()
+
+
+def _session_local():
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=MagicMock())
+    session_cm.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=session_cm)
+
+
+def _file(n, checksum="sum"):
+    return SimpleNamespace(
+        id=n,
+        checksum=checksum,
+        created_by=7,
+        file_folder=SimpleNamespace(id=1),
+        get_absolute_path=lambda folder, chain: f"/mnt/files/f{n}",
+    )
+
+
+class TestGenerateThumbnails(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.files = {1: _file(1), 2: _file(2)}
+        self.repository = MagicMock(
+            select_all=AsyncMock(return_value=list(self.files.values())),
+            select=AsyncMock(side_effect=self._select),
+            select_parent_chain=AsyncMock(return_value=()),
+            make_subquery=MagicMock(return_value="subquery"),
+            insert=AsyncMock(),
+            commit=AsyncMock(),
+            rollback=AsyncMock(),
+        )
+        self.thumbnails = set()
+        self.create_thumbnail = AsyncMock()
+        self.delete = AsyncMock()
+        self.lock_file = MagicMock()
+
+        patches = [
+            patch.object(svc, "SessionLocal", _session_local()),
+            patch.object(svc, "ORMRepository", return_value=self.repository),
+            patch.object(svc, "create_thumbnail", self.create_thumbnail),
+            patch.object(svc, "get_filesize", AsyncMock(return_value=10)),
+            patch.object(
+                svc, "get_mimetype", AsyncMock(return_value="image/jpeg"),
+            ),
+            patch.object(
+                svc, "get_image_size", AsyncMock(return_value=(32, 24)),
+            ),
+            patch.object(svc, "delete", self.delete),
+            patch.object(svc.locks, "lock_file", self.lock_file),
+            patch.object(svc, "_last_file_id", 0),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    async def _select(self, cls, obj_id=None, file_id=None):
+        if cls is File:
+            return self.files.get(obj_id)
+        return file_id if file_id in self.thumbnails else None
+
+    async def test_creates_missing_thumbnails(self):
+        await svc.generate_thumbnails()
+
+        kwargs = self.repository.select_all.await_args.kwargs
+        self.assertEqual(kwargs["id__gt"], 0)
+        self.assertIn("image/jpeg", kwargs["mimetype__in"])
+        self.assertEqual(kwargs["id__notsubquery"], "subquery")
+        self.repository.make_subquery.assert_called_once_with(
+            FileThumbnail, "file_id",
+        )
+
+        self.lock_file.assert_any_call("/mnt/files/f1", LockType.WRITE)
+        self.assertEqual(self.create_thumbnail.await_count, 2)
+        self.assertEqual(self.repository.commit.await_count, 2)
+
+        thumbnail = self.repository.insert.await_args_list[0].args[0]
+        self.assertEqual(thumbnail.file_id, 1)
+        self.assertEqual(thumbnail.created_by, 7)
+        self.assertEqual((thumbnail.width, thumbnail.height), (32, 24))
+        self.assertEqual(svc._last_file_id, 0)
+
+    async def test_skips_changed_or_thumbnailed_files(self):
+        self.files[1] = _file(1, checksum="changed")
+        self.thumbnails.add(2)
+
+        await svc.generate_thumbnails()
+
+        self.create_thumbnail.assert_not_awaited()
+        self.repository.insert.assert_not_awaited()
+
+    async def test_failure_rolls_back_and_continues(self):
+        self.create_thumbnail.side_effect = [OSError("broken"), None]
+
+        await svc.generate_thumbnails()
+
+        self.repository.rollback.assert_awaited_once_with()
+        self.delete.assert_awaited_once()
+        self.repository.commit.assert_awaited_once_with()
+
+    async def test_full_batch_advances_cursor(self):
+        with patch.object(svc, "THUMBNAILS_GENERATE_BATCH_SIZE", 2):
+            await svc.generate_thumbnails()
+
+        self.assertEqual(svc._last_file_id, 2)
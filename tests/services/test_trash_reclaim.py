@@ -0,0 +1,163 @@
+# tests/services/test_trash_reclaim.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.services.trash_reclaim import reclaim_trash  # noqa: E402
+
+
+class TestReclaimTrash(unittest.IsolatedAsyncioTestCase):
+
+    def _patches(self, entries, manifests, removed=0, max_files=10):
+        config = MagicMock(
+            FILES_REVISIONS_DIR="/mnt/revisions",
+            FILES_THUMBNAILS_DIR="/mnt/thumbnails",
+        )
+        return (
+            patch(
+                "app.services.trash_reclaim.get_config",
+                return_value=config,
+            ),
+            patch(
+                "app.services.trash_reclaim."
+                "FILES_TRASH_RECLAIM_MAX_FILES_PER_RUN",
+                max_files,
+            ),
+            patch(
+                "app.services.trash_reclaim.list_sealed_trash_entries",
+                new=AsyncMock(return_value=entries),
+            ),
+            patch(
+                "app.services.trash_reclaim.read_trash_manifest",
+                new=AsyncMock(side_effect=manifests),
+            ),
+            patch(
+                "app.services.trash_reclaim.delete",
+                new=AsyncMock(),
+            ),
+            patch(
+                "app.services.trash_reclaim.delete_tree",
+                new=AsyncMock(return_value=removed),
+            ),
+            patch(
+                "app.services.trash_reclaim.write_trash_manifest",
+                new=AsyncMock(),
+            ),
+            patch(
+                "app.services.trash_reclaim.remove_trash_entry",
+                new=AsyncMock(),
+            ),
+        )
+
+    async def test_removes_blobs_tree_and_entry(self):
+        manifest = {"revisions": ["r1", "../r2"], "thumbnails": ["t1"]}
+        (
+            config_patch, max_patch, list_patch, read_patch, delete_patch,
+            tree_patch, write_patch, remove_patch,
+        ) = self._patches(["/mnt/trash/a"], [manifest], removed=3)
+
+        with (
+            config_patch,
+            max_patch,
+            list_patch,
+            read_patch,
+            delete_patch as delete_mock,
+            tree_patch as delete_tree_mock,
+            write_patch as write_manifest_mock,
+            remove_patch as remove_entry_mock,
+        ):
+            await reclaim_trash()
+
+        self.assertEqual(delete_mock.await_args_list, [
+            call("/mnt/revisions/r1"),
+            call("/mnt/revisions/r2"),
+            call("/mnt/thumbnails/t1"),
+        ])
+        write_manifest_mock.assert_awaited_once_with(
+            "/mnt/trash/a", {"revisions": [], "thumbnails": []},
+        )
+        delete_tree_mock.assert_awaited_once_with("/mnt/trash/a/tree", 7)
+        remove_entry_mock.assert_awaited_once_with("/mnt/trash/a")
+
+    async def test_stops_when_budget_is_spent_on_blobs(self):
+        manifest = {"revisions": ["r1", "r2", "r3"], "thumbnails": ["t1"]}
+        (
+            config_patch, max_patch, list_patch, read_patch, delete_patch,
+            tree_patch, write_patch, remove_patch,
+        ) = self._patches(
+            ["/mnt/trash/a", "/mnt/trash/b"], [manifest], max_files=2,
+        )
+
+        with (
+            config_patch,
+            max_patch,
+            list_patch,
+            read_patch as read_manifest_mock,
+            delete_patch as delete_mock,
+            tree_patch as delete_tree_mock,
+            write_patch as write_manifest_mock,
+            remove_patch as remove_entry_mock,
+        ):
+            await reclaim_trash()
+
+        self.assertEqual(delete_mock.await_count, 2)
+        write_manifest_mock.assert_awaited_once_with(
+            "/mnt/trash/a", {"revisions": ["r3"], "thumbnails": ["t1"]},
+        )
+        read_manifest_mock.assert_awaited_once_with("/mnt/trash/a")
+        delete_tree_mock.assert_not_awaited()
+        remove_entry_mock.assert_not_awaited()
+
+    async def test_keeps_entry_when_tree_is_not_finished(self):
+        manifest = {"revisions": [], "thumbnails": []}
+        (
+            config_patch, max_patch, list_patch, read_patch, delete_patch,
+            tree_patch, write_patch, remove_patch,
+        ) = self._patches(["/mnt/trash/a"], [manifest], removed=10)
+
+        with (
+            config_patch,
+            max_patch,
+            list_patch,
+            read_patch,
+            delete_patch,
+            tree_patch,
+            write_patch as write_manifest_mock,
+            remove_patch as remove_entry_mock,
+        ):
+            await reclaim_trash()
+
+        write_manifest_mock.assert_not_awaited()
+        remove_entry_mock.assert_not_awaited()
+
+    async def test_continues_with_next_entry_within_budget(self):
+        empty = {"revisions": [], "thumbnails": []}
+        (
+            config_patch, max_patch, list_patch, read_patch, delete_patch,
+            tree_patch, write_patch, remove_patch,
+        ) = self._patches(
+            ["/mnt/trash/a", "/mnt/trash/b"], [empty, empty], removed=4,
+        )
+
+        with (
+            config_patch,
+            max_patch,
+            list_patch,
+            read_patch,
+            delete_patch,
+            tree_patch as delete_tree_mock,
+            write_patch,
+            remove_patch as remove_entry_mock,
+        ):
+            await reclaim_trash()
+
+        self.assertEqual(delete_tree_mock.await_args_list, [
+            call("/mnt/trash/a/tree", 10),
+            call("/mnt/trash/b/tree", 6),
+        ])
+        self.assertEqual(remove_entry_mock.await_count, 2)
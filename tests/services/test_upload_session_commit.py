@@ -0,0 +1,156 @@
+# tests/services/test_upload_session_commit.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.db.engine import load_all_models  # noqa: E402
+from app.errors import (  # noqa: E402
+    ResourceConflictError,
+    ResourceNotFoundError,
+)
+from app.locks import LockType  # noqa: E402
+from app.models.upload_session import UploadSession  # noqa: E402
+from app.services import upload_session_commit as svc  # noqa: E402
+
+load_all_models()
+
+PART_PATH = "/mnt/uploads/uuid-1"
+
+
+class TestCommitUploadSession(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.upload_session = UploadSession(
+            id=3,
+            folder_id=2,
+            filename="a.bin",
+            filesize=10,
+            upload_uuid="uuid-1",
+            received_ranges="[]",
+        )
+        self.repository = MagicMock(
+            select_values=AsyncMock(return_value=["[[0, 10]]"]),
+            delete_all=AsyncMock(),
+            commit=AsyncMock(),
+            rollback=AsyncMock(),
+        )
+        self.user = SimpleNamespace(id=7)
+        self.file = SimpleNamespace(id=10)
+        self.store_upload = AsyncMock(side_effect=self._store_upload)
+        self.rename = AsyncMock()
+        self.isfile = AsyncMock(return_value=True)
+
+    async def _store_upload(self, session, user, folder_id, filename, stage):
+        await stage("/mnt/tmp/x")
+        return self.file
+
+    async def _commit(self, upload_session="default"):
+        if upload_session == "default":
+            upload_session = self.upload_session
+        self.session = AsyncMock()
+        with (
+            patch.object(svc, "ORMRepository", return_value=self.repository),
+            patch.object(
+                svc, "find_upload_session",
+                new=AsyncMock(return_value=upload_session),
+            ),
+            patch(
+                "app.models.upload_session.get_config",
+                return_value=SimpleNamespace(
+                    FILES_UPLOADS_DIR="/mnt/uploads",
+                ),
+            ),
+            patch.object(
+                svc.locks, "lock_file", return_value=AsyncMock(),
+            ) as self.lock_mock,
+            patch.object(svc, "store_upload", new=self.store_upload),
+            patch.object(svc, "rename", new=self.rename),
+            patch.object(svc, "isfile", new=self.isfile),
+        ):
+            return await svc.commit_upload_session(
+                self.session, self.user, "uuid-1",
+            )
+
+    async def test_stores_part_file_and_closes_session(self):
+        result = await self._commit()
+
+        self.assertIs(result, self.file)
+        self.lock_mock.assert_called_once_with(PART_PATH, LockType.WRITE)
+        self.repository.select_values.assert_awaited_once_with(
+            UploadSession, "received_ranges", id=3,
+        )
+
+        self.assertEqual(
+            self.store_upload.await_args.args[:4],
+            (self.session, self.user, 2, "a.bin"),
+        )
+        self.rename.assert_awaited_once_with(PART_PATH, "/mnt/tmp/x")
+
+        self.repository.delete_all.assert_awaited_once_with(
+            UploadSession, id=3,
+        )
+        self.repository.commit.assert_awaited_once_with()
+
+    async def test_raises_not_found_for_missing_or_closed_session(self):
+        with self.assertRaises(ResourceNotFoundError):
+            await self._commit(upload_session=None)
+
+        self.repository.select_values.return_value = []
+        with self.assertRaises(ResourceNotFoundError):
+            await self._commit()
+
+        self.store_upload.assert_not_awaited()
+
+    async def test_raises_conflict_for_incomplete_upload(self):
+        self.repository.select_values.return_value = ["[[0, 4], [6, 10]]"]
+
+        with self.assertRaises(ResourceConflictError):
+            await self._commit()
+
+        self.store_upload.assert_not_awaited()
+        self.repository.delete_all.assert_not_awaited()
+
+    async def test_closes_session_when_part_file_is_missing(self):
+        self.isfile.return_value = False
+
+        with self.assertRaises(ResourceNotFoundError):
+            await self._commit()
+
+        self.store_upload.assert_not_awaited()
+        self.repository.delete_all.assert_awaited_once_with(
+            UploadSession, id=3,
+        )
+
+    async def test_keeps_session_when_rejected_before_staging(self):
+        self.store_upload.side_effect = ResourceConflictError
+
+        with self.assertRaises(ResourceConflictError):
+            await self._commit()
+
+        self.repository.delete_all.assert_not_awaited()
+
+    async def test_closes_session_when_staged_data_is_lost(self):
+        self.store_upload.side_effect = ResourceConflictError
+        self.isfile.side_effect = [True, False]
+
+        with self.assertRaises(ResourceConflictError):
+            await self._commit()
+
+        self.repository.delete_all.assert_awaited_once_with(
+            UploadSession, id=3,
+        )
+
+    async def test_close_failure_is_logged_not_raised(self):
+        self.repository.commit.side_effect = RuntimeError("boom")
+
+        with self.assertLogs(svc.log, level="ERROR"):
+            result = await self._commit()
+
+        self.assertIs(result, self.file)
+        self.repository.rollback.assert_awaited_once_with()
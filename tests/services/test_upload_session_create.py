@@ -0,0 +1,114 @@
+# tests/services/test_upload_session_create.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.db.engine import load_all_models  # noqa: E402
+from app.errors import (  # noqa: E402
+    ResourceLockedError,
+    ResourceNotFoundError,
+)
+from app.events import Events as E  # noqa: E402
+from app.locks import LockType  # noqa: E402
+from app.models.upload_session import UploadSession  # noqa: E402
+from app.services import upload_session_create as svc  # noqa: E402
+
+load_all_models()
+
+
+class TestCreateUploadSession(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.folder = MagicMock(id=2, is_write_protected=False)
+        self.folder.is_write_protected_recursive.return_value = False
+        self.repository = MagicMock(
+            select=AsyncMock(return_value=self.folder),
+            select_parent_chain=AsyncMock(return_value=[]),
+            insert=AsyncMock(),
+            commit=AsyncMock(),
+            rollback=AsyncMock(),
+        )
+        self.data = SimpleNamespace(filename="a.bin", filesize=8)
+        self.config = SimpleNamespace(
+            UPLOAD_SESSION_TTL_SECONDS=60,
+            FILES_UPLOADS_DIR="/mnt/uploads",
+        )
+
+    async def _create(self, touch_mock=None, delete_mock=None):
+        lock_context = AsyncMock()
+        with (
+            patch.object(svc, "ORMRepository", return_value=self.repository),
+            patch.object(svc, "get_config", return_value=self.config),
+            patch(
+                "app.models.upload_session.get_config",
+                return_value=self.config,
+            ),
+            patch.object(svc.time, "time", return_value=1000),
+            patch.object(
+                svc.locks, "lock_file", return_value=lock_context,
+            ) as self.lock_mock,
+            patch.object(svc, "touch", new=touch_mock or AsyncMock()),
+            patch.object(svc, "delete", new=delete_mock or AsyncMock()),
+            patch.object(svc, "write_audit", new=AsyncMock()) as self.audit,
+            patch.object(svc.hooks, "emit", new=AsyncMock()) as self.emit,
+        ):
+            return await svc.create_upload_session(
+                AsyncMock(), SimpleNamespace(id=7), 2, self.data,
+            )
+
+    async def test_creates_session_and_reserves_part_file(self):
+        touch_mock = AsyncMock()
+
+        upload_session = await self._create(touch_mock=touch_mock)
+
+        self.assertIsInstance(upload_session, UploadSession)
+        self.assertEqual(upload_session.created_by, 7)
+        self.assertEqual(upload_session.folder_id, 2)
+        self.assertEqual(upload_session.filename, "a.bin")
+        self.assertEqual(upload_session.filesize, 8)
+        self.assertEqual(upload_session.expires_at, 1060)
+        self.assertEqual(upload_session.ranges, [])
+
+        part_path = f"/mnt/uploads/{upload_session.upload_uuid}"
+        self.lock_mock.assert_called_once_with(part_path, LockType.WRITE)
+        touch_mock.assert_awaited_once_with(part_path)
+        self.repository.insert.assert_awaited_once_with(upload_session)
+        self.repository.commit.assert_awaited_once_with()
+        self.assertEqual(
+            self.audit.await_args.kwargs["event"],
+            E.UPLOAD_SESSION_CREATE_COMPLETED,
+        )
+        self.emit.assert_awaited_once()
+
+    async def test_raises_not_found_for_missing_folder(self):
+        self.repository.select.return_value = None
+
+        with self.assertRaises(ResourceNotFoundError):
+            await self._create()
+
+        self.repository.insert.assert_not_awaited()
+
+    async def test_raises_locked_for_write_protected_folder(self):
+        self.folder.is_write_protected_recursive.return_value = True
+
+        with self.assertRaises(ResourceLockedError):
+            await self._create()
+
+        self.repository.insert.assert_not_awaited()
+
+    async def test_removes_part_file_on_failure(self):
+        self.repository.commit.side_effect = RuntimeError("boom")
+        delete_mock = AsyncMock()
+
+        with self.assertRaises(RuntimeError):
+            await self._create(delete_mock=delete_mock)
+
+        self.repository.rollback.assert_awaited_once_with()
+        delete_mock.assert_awaited_once()
+        self.emit.assert_not_awaited()
@@ -0,0 +1,124 @@
+# tests/services/test_upload_session_expire.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.constants import UPLOAD_SESSIONS_EXPIRE_BATCH_SIZE  # noqa: E402
+from app.locks import LockType  # noqa: E402
+from app.models.upload_session import UploadSession  # noqa: E402
+from app.services import upload_session_expire as svc  # noqa: E402
+
+NOW = 1000
+
+
+def _session_local():
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=MagicMock())
+    session_cm.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=session_cm)
+
+
+def _upload_session(n):
+    return SimpleNamespace(id=n, absolute_path=f"/mnt/uploads/u{n}")
+
+
+class TestExpireUploadSessions(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.repository = MagicMock(
+            select_all=AsyncMock(return_value=[]),
+            select_values=AsyncMock(return_value=[]),
+            delete_all=AsyncMock(),
+            commit=AsyncMock(),
+        )
+        self.delete = AsyncMock()
+        self.listdir = AsyncMock(return_value=[])
+
+        patches = [
+            patch.object(svc, "SessionLocal", _session_local()),
+            patch.object(svc, "ORMRepository", return_value=self.repository),
+            patch.object(
+                svc, "get_config",
+                return_value=SimpleNamespace(FILES_UPLOADS_DIR="/mnt/uploads"),
+            ),
+            patch.object(svc.time, "time", return_value=NOW),
+            patch.object(svc, "delete", new=self.delete),
+            patch.object(svc, "listdir", new=self.listdir),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+        lock_patcher = patch.object(
+            svc.locks, "lock_file", return_value=AsyncMock(),
+        )
+        self.lock_mock = lock_patcher.start()
+        self.addCleanup(lock_patcher.stop)
+
+    async def test_removes_expired_sessions_and_part_files(self):
+        self.repository.select_all.return_value = [
+            _upload_session(1), _upload_session(2),
+        ]
+        self.repository.select_values.side_effect = [[1], [2], []]
+
+        await svc.expire_upload_sessions()
+
+        self.repository.select_all.assert_awaited_once_with(
+            UploadSession,
+            expires_at__le=NOW,
+            order_by="id",
+            limit=UPLOAD_SESSIONS_EXPIRE_BATCH_SIZE,
+        )
+        self.assertEqual(self.repository.select_values.await_args_list[:2], [
+            call(UploadSession, "id", id=1, expires_at__le=NOW),
+            call(UploadSession, "id", id=2, expires_at__le=NOW),
+        ])
+        self.assertEqual(self.repository.delete_all.await_args_list, [
+            call(UploadSession, id=1),
+            call(UploadSession, id=2),
+        ])
+        self.assertEqual(self.repository.commit.await_count, 2)
+        self.assertEqual(self.delete.await_args_list, [
+            call("/mnt/uploads/u1"),
+            call("/mnt/uploads/u2"),
+        ])
+        self.lock_mock.assert_any_call("/mnt/uploads/u1", LockType.WRITE)
+
+    async def test_skips_session_extended_meanwhile(self):
+        self.repository.select_all.return_value = [_upload_session(1)]
+        self.repository.select_values.side_effect = [[], []]
+
+        await svc.expire_upload_sessions()
+
+        self.repository.delete_all.assert_not_awaited()
+        self.delete.assert_not_awaited()
+
+    async def test_removes_orphan_part_files(self):
+        self.listdir.return_value = ["known", "orphan", "created"]
+        self.repository.select_values.side_effect = [
+            ["known"], [], [5],
+        ]
+
+        await svc.expire_upload_sessions()
+
+        self.assertEqual(self.repository.select_values.await_args_list, [
+            call(UploadSession, "upload_uuid"),
+            call(UploadSession, "id", upload_uuid="orphan"),
+            call(UploadSession, "id", upload_uuid="created"),
+        ])
+        self.delete.assert_awaited_once_with("/mnt/uploads/orphan")
+        self.assertEqual(self.lock_mock.call_args_list, [
+            call("/mnt/uploads/orphan", LockType.WRITE),
+            call("/mnt/uploads/created", LockType.WRITE),
+        ])
+
+    async def test_empty_uploads_dir_skips_orphan_query(self):
+        await svc.expire_upload_sessions()
+
+        self.repository.select_values.assert_not_awaited()
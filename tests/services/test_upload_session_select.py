@@ -0,0 +1,77 @@
+# tests/services/test_upload_session_select.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.errors import ResourceNotFoundError  # noqa: E402
+from app.models.upload_session import UploadSession  # noqa: E402
+from app.services import upload_session_select as svc  # noqa: E402
+
+NOW = 1000
+
+
+class TestFindUploadSession(unittest.IsolatedAsyncioTestCase):
+
+    async def _find(self, upload_session):
+        repository = MagicMock(
+            select=AsyncMock(return_value=upload_session),
+        )
+        with patch.object(svc.time, "time", return_value=NOW):
+            result = await svc.find_upload_session(
+                repository, SimpleNamespace(id=7), "uuid-1",
+            )
+        repository.select.assert_awaited_once_with(
+            UploadSession, upload_uuid="uuid-1", created_by=7,
+        )
+        return result
+
+    async def test_returns_active_session(self):
+        upload_session = SimpleNamespace(expires_at=NOW + 1)
+
+        self.assertIs(await self._find(upload_session), upload_session)
+
+    async def test_returns_none_for_missing_or_expired_session(self):
+        for upload_session in (None, SimpleNamespace(expires_at=NOW)):
+            with self.subTest(upload_session=upload_session):
+                self.assertIsNone(await self._find(upload_session))
+
+
+class TestSelectUploadSession(unittest.IsolatedAsyncioTestCase):
+
+    async def test_returns_session(self):
+        upload_session = SimpleNamespace(id=3)
+        user = SimpleNamespace(id=7)
+
+        with (
+            patch.object(svc, "ORMRepository") as repository_cls,
+            patch.object(
+                svc, "find_upload_session",
+                new=AsyncMock(return_value=upload_session),
+            ) as find_mock,
+        ):
+            result = await svc.select_upload_session(
+                AsyncMock(), user, "uuid-1",
+            )
+
+        self.assertIs(result, upload_session)
+        find_mock.assert_awaited_once_with(
+            repository_cls.return_value, user, "uuid-1",
+        )
+
+    async def test_raises_not_found(self):
+        with (
+            patch.object(svc, "ORMRepository"),
+            patch.object(
+                svc, "find_upload_session", new=AsyncMock(return_value=None),
+            ),
+        ):
+            with self.assertRaises(ResourceNotFoundError):
+                await svc.select_upload_session(
+                    AsyncMock(), SimpleNamespace(id=7), "uuid-1",
+                )
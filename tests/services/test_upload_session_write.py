@@ -0,0 +1,139 @@
+# tests/services/test_upload_session_write.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from tests.helpers import set_minimal_app_config_env
+
+set_minimal_app_config_env()
+
+from app.errors import (  # noqa: E402
+    ResourceNotFoundError,
+    ValueInvalidError,
+)
+from app.locks import LockType  # noqa: E402
+from app.models.upload_session import UploadSession  # noqa: E402
+from app.services import upload_session_write as svc  # noqa: E402
+
+PART_PATH = "/mnt/uploads/uuid-1"
+
+
+class TestMergeRanges(unittest.TestCase):
+
+    def test_merges_overlapping_and_adjacent_ranges(self):
+        cases = [
+            ([], 0, 4, [(0, 4)]),
+            ([(0, 4)], 4, 8, [(0, 8)]),
+            ([(0, 4), (8, 12)], 2, 9, [(0, 12)]),
+            ([(8, 12)], 0, 4, [(0, 4), (8, 12)]),
+            ([(0, 4)], 5, 5, [(0, 4)]),
+            ([(0, 10)], 2, 4, [(0, 10)]),
+        ]
+        for ranges, start, end, expected in cases:
+            with self.subTest(ranges=ranges, start=start, end=end):
+                self.assertEqual(
+                    svc.merge_ranges(ranges, start, end), expected,
+                )
+
+
+class TestWriteUploadSession(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.upload_session = MagicMock(
+            id=3,
+            filesize=10,
+            absolute_path=PART_PATH,
+            received_ranges="[]",
+        )
+        type(self.upload_session).ranges = property(
+            lambda obj: [
+                tuple(item) for item in json.loads(obj.received_ranges)
+            ],
+        )
+        self.repository = MagicMock(
+            select_values=AsyncMock(side_effect=[[3], ["[[0, 2]]"]]),
+            update=AsyncMock(),
+        )
+        self.write_at = AsyncMock(return_value=4)
+
+    async def _write(self, offset=2, upload_session="default"):
+        if upload_session == "default":
+            upload_session = self.upload_session
+        self.data = object()
+        with (
+            patch.object(svc, "ORMRepository", return_value=self.repository),
+            patch.object(
+                svc, "find_upload_session",
+                new=AsyncMock(return_value=upload_session),
+            ),
+            patch.object(
+                svc, "get_config",
+                return_value=SimpleNamespace(UPLOAD_SESSION_TTL_SECONDS=60),
+            ),
+            patch.object(svc.time, "time", return_value=1000),
+            patch.object(
+                svc.locks, "lock_file", return_value=AsyncMock(),
+            ) as self.lock_mock,
+            patch.object(svc, "write_at", new=self.write_at),
+        ):
+            result = await svc.write_upload_session(
+                AsyncMock(), SimpleNamespace(id=7), "uuid-1", offset,
+                self.data,
+            )
+        return result
+
+    async def test_writes_chunk_and_records_range(self):
+        result = await self._write()
+
+        self.assertIs(result, self.upload_session)
+        self.write_at.assert_awaited_once_with(PART_PATH, 2, self.data, 10)
+        self.assertEqual(result.ranges, [(0, 6)])
+        self.assertEqual(result.expires_at, 1060)
+        self.assertEqual(self.lock_mock.call_args_list, [
+            call(PART_PATH, LockType.READ),
+            call(PART_PATH, LockType.WRITE),
+        ])
+        self.assertEqual(self.repository.select_values.await_args_list, [
+            call(UploadSession, "id", id=3),
+            call(UploadSession, "received_ranges", id=3),
+        ])
+        self.repository.update.assert_awaited_once_with(
+            self.upload_session, commit=True,
+        )
+
+    async def test_raises_not_found_for_missing_session(self):
+        with self.assertRaises(ResourceNotFoundError):
+            await self._write(upload_session=None)
+
+    async def test_rejects_offset_past_file_size(self):
+        with self.assertRaises(ValueInvalidError):
+            await self._write(offset=11)
+
+        self.write_at.assert_not_awaited()
+
+    async def test_raises_not_found_when_closed_before_write(self):
+        self.repository.select_values.side_effect = [[]]
+
+        with self.assertRaises(ResourceNotFoundError):
+            await self._write()
+
+        self.write_at.assert_not_awaited()
+
+    async def test_rejects_chunk_past_file_size(self):
+        self.write_at.side_effect = ValueError
+
+        with self.assertRaises(ValueInvalidError):
+            await self._write()
+
+        self.repository.update.assert_not_awaited()
+
+    async def test_raises_not_found_when_closed_after_write(self):
+        self.repository.select_values.side_effect = [[3], []]
+
+        with self.assertRaises(ResourceNotFoundError):
+            await self._write()
+
+        self.repository.update.assert_not_awaited()
@@ -138,6 +138,7 @@ class TestLoginUser(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.user_login.is_password_correct",
+                new_callable=AsyncMock,
                 return_value=True,
             ),
             patch(
@@ -192,6 +193,7 @@ class TestLoginUser(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.user_login.is_password_correct",
+                new_callable=AsyncMock,
                 return_value=False,
             ),
             patch(
@@ -232,6 +234,7 @@ class TestLoginUser(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.user_login.is_password_correct",
+                new_callable=AsyncMock,
                 return_value=False,
             ),
             patch(
@@ -271,6 +274,7 @@ class TestLoginUser(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.user_login.is_password_correct",
+                new_callable=AsyncMock,
                 return_value=False,
             ),
             patch(
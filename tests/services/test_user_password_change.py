@@ -37,10 +37,12 @@ class TestChangePassword(unittest.IsolatedAsyncioTestCase):
         with (
             patch(
                 "app.services.user_password_change.is_password_correct",
+                new_callable=AsyncMock,
                 return_value=False,
             ) as is_password_correct_mock,
             patch(
                 "app.services.user_password_change.hash_string",
+                new_callable=AsyncMock,
             ) as hash_string_mock,
             patch(
                 "app.services.user_password_change.generate_jti",
@@ -90,10 +92,12 @@ class TestChangePassword(unittest.IsolatedAsyncioTestCase):
         with (
             patch(
                 "app.services.user_password_change.is_password_correct",
+                new_callable=AsyncMock,
                 return_value=True,
             ) as is_password_correct_mock,
             patch(
                 "app.services.user_password_change.hash_string",
+                new_callable=AsyncMock,
                 return_value="new-password-hash",
             ) as hash_string_mock,
             patch(
@@ -154,10 +158,12 @@ class TestChangePassword(unittest.IsolatedAsyncioTestCase):
         with (
             patch(
                 "app.services.user_password_change.is_password_correct",
+                new_callable=AsyncMock,
                 return_value=True,
             ) as is_password_correct_mock,
             patch(
                 "app.services.user_password_change.hash_string",
+                new_callable=AsyncMock,
                 return_value="rehash-of-same-password",
             ) as hash_string_mock,
             patch(
@@ -36,6 +36,7 @@ class TestRotateRecoveryCode(unittest.IsolatedAsyncioTestCase):
         with (
             patch(
                 "app.services.user_recovery_code_rotate.is_password_correct",
+                new_callable=AsyncMock,
                 return_value=False,
             ) as is_password_correct_mock,
             patch(
@@ -44,6 +45,7 @@ class TestRotateRecoveryCode(unittest.IsolatedAsyncioTestCase):
             ) as generate_mock,
             patch(
                 "app.services.user_recovery_code_rotate.hash_string",
+                new_callable=AsyncMock,
             ) as hash_string_mock,
             patch(
                 "app.services.user_recovery_code_rotate.generate_jti",
@@ -95,6 +97,7 @@ class TestRotateRecoveryCode(unittest.IsolatedAsyncioTestCase):
         with (
             patch(
                 "app.services.user_recovery_code_rotate.is_password_correct",
+                new_callable=AsyncMock,
                 return_value=True,
             ) as is_password_correct_mock,
             patch(
@@ -104,6 +107,7 @@ class TestRotateRecoveryCode(unittest.IsolatedAsyncioTestCase):
             ) as generate_mock,
             patch(
                 "app.services.user_recovery_code_rotate.hash_string",
+                new_callable=AsyncMock,
                 return_value="new-recovery-hash",
             ) as hash_string_mock,
             patch(
@@ -171,6 +171,7 @@ class TestRegisterUser(unittest.IsolatedAsyncioTestCase):
             ) as generate_recovery_code_mock,
             patch(
                 "app.services.user_register.hash_string",
+                new_callable=AsyncMock,
                 side_effect=["hashed-password", "hashed-recovery"],
             ) as hash_string_mock,
             patch(
@@ -293,6 +294,7 @@ class TestRegisterUser(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.user_register.hash_string",
+                new_callable=AsyncMock,
                 side_effect=["hashed-password", "hashed-recovery"],
             ),
             patch(
@@ -373,6 +375,7 @@ class TestRegisterUser(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.user_register.hash_string",
+                new_callable=AsyncMock,
                 side_effect=["hashed-password", "hashed-recovery"],
             ),
             patch(
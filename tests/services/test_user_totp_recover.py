@@ -132,6 +132,7 @@ class TestRecoverTotp(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.user_totp_recover.is_password_correct",
+                new_callable=AsyncMock,
                 return_value=False,
             ) as verify_mock,
             patch(
@@ -189,6 +190,7 @@ class TestRecoverTotp(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.user_totp_recover.is_password_correct",
+                new_callable=AsyncMock,
                 return_value=False,
             ) as verify_mock,
             patch(
@@ -226,6 +228,7 @@ class TestRecoverTotp(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.user_totp_recover.is_password_correct",
+                new_callable=AsyncMock,
                 return_value=False,
             ),
             patch(
@@ -265,6 +268,7 @@ class TestRecoverTotp(unittest.IsolatedAsyncioTestCase):
             ),
             patch(
                 "app.services.user_totp_recover.is_password_correct",
+                new_callable=AsyncMock,
                 return_value=True,
             ) as verify_mock,
             patch(
@@ -1,18 +1,33 @@
 # tests/test_audit.py
 # SPDX-License-Identifier: GPL-3.0-only
 
+import sys
+import types
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from app.audit import write_audit
+from app.audit import (
+    AUDIT_PENDING_KEY,
+    discard_audit,
+    flush_audit,
+    write_audit,
+)
+from app.events import Events as E
 from app.models.audit import Audit
 
 
+def _build_repository():
+    repository = MagicMock()
+    repository.session.info = {}
+    repository.insert = AsyncMock()
+    repository.commit = AsyncMock()
+    return repository
+
+
 class TestWriteAudit(unittest.IsolatedAsyncioTestCase):
 
-    async def test_writes_audit_event_using_context_user(self):
-        repository = MagicMock()
-        repository.insert = AsyncMock()
+    async def test_stages_audit_event_using_context_user(self):
+        repository = _build_repository()
 
         def get_context_var(name):
             values = {
@@ -31,9 +46,10 @@ class TestWriteAudit(unittest.IsolatedAsyncioTestCase):
                 resource_id=42,
             )
 
-        repository.insert.assert_awaited_once()
+        pending = repository.session.info[AUDIT_PENDING_KEY]
+        self.assertEqual(len(pending), 1)
 
-        audit_event = repository.insert.await_args.args[0]
+        audit_event = pending[0]
         self.assertIsInstance(audit_event, Audit)
         self.assertEqual(audit_event.created_by, 7)
         self.assertEqual(audit_event.event, "file_delete:completed")
@@ -41,14 +57,11 @@ class TestWriteAudit(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(audit_event.resource_type, "files")
         self.assertEqual(audit_event.resource_id, 42)
 
-        self.assertEqual(
-            repository.insert.await_args.kwargs,
-            {"commit": False},
-        )
+        repository.insert.assert_not_awaited()
+        repository.commit.assert_not_awaited()
 
     async def test_explicit_user_id_overrides_context_user(self):
-        repository = MagicMock()
-        repository.insert = AsyncMock()
+        repository = _build_repository()
 
         with (
             patch("app.audit.get_context_var", return_value="request-123"),
@@ -60,23 +73,97 @@ class TestWriteAudit(unittest.IsolatedAsyncioTestCase):
                 commit=True,
             )
 
-        audit_event = repository.insert.await_args.args[0]
+        audit_event = repository.session.info[AUDIT_PENDING_KEY][0]
         self.assertEqual(audit_event.created_by, 9)
         self.assertEqual(audit_event.event, "user_update:completed")
         self.assertEqual(audit_event.request_uuid, "request-123")
         self.assertIsNone(audit_event.resource_type)
         self.assertIsNone(audit_event.resource_id)
 
+        repository.commit.assert_awaited_once_with()
+
+    async def test_appends_to_events_already_staged(self):
+        repository = _build_repository()
+
+        with patch("app.audit.get_context_var", return_value=None):
+            await write_audit(repository=repository, event="first")
+            await write_audit(repository=repository, event="second")
+
         self.assertEqual(
-            repository.insert.await_args.kwargs,
-            {"commit": True},
+            [a.event for a in repository.session.info[AUDIT_PENDING_KEY]],
+            ["first", "second"],
         )
 
-    async def test_uses_given_repository_instance(self):
-        repository = MagicMock()
-        repository.insert = AsyncMock()
 
-        with patch("app.audit.get_context_var", return_value=None):
-            await write_audit(repository=repository, event="event")
+class TestFlushAudit(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.audit_session = MagicMock()
+        self.audit_session.commit = AsyncMock()
+
+        audit_cm = MagicMock()
+        audit_cm.__aenter__ = AsyncMock(return_value=self.audit_session)
+        audit_cm.__aexit__ = AsyncMock(return_value=None)
+        self.audit_session_local = MagicMock(return_value=audit_cm)
+
+        # app.db.engine calls get_config() at module level, so the
+        # lazily imported module is replaced with a stub.
+        fake_engine_module = types.ModuleType("app.db.engine")
+        fake_engine_module.AuditSessionLocal = self.audit_session_local
+        patcher = patch.dict(
+            sys.modules, {"app.db.engine": fake_engine_module},
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_writes_staged_events_to_audit_database(self):
+        audit_events = [Audit(event="a"), Audit(event="b")]
+        session = MagicMock()
+        session.info = {AUDIT_PENDING_KEY: audit_events}
+
+        await flush_audit(session)
+
+        self.audit_session.add_all.assert_called_once_with(audit_events)
+        self.audit_session.commit.assert_awaited_once_with()
+        self.assertNotIn(AUDIT_PENDING_KEY, session.info)
+
+    async def test_noop_when_nothing_staged(self):
+        session = MagicMock()
+        session.info = {}
+
+        await flush_audit(session)
+
+        self.audit_session_local.assert_not_called()
+
+    async def test_logs_and_swallows_audit_write_failure(self):
+        session = MagicMock()
+        session.info = {AUDIT_PENDING_KEY: [Audit(event="a")]}
+        self.audit_session.commit.side_effect = RuntimeError("disk")
+
+        with self.assertLogs("app.audit", level="ERROR") as log_cm:
+            await flush_audit(session)
+
+        self.assertTrue(
+            any(E.AUDIT_WRITE_FAILED in entry for entry in log_cm.output),
+            msg=log_cm.output,
+        )
+        self.assertNotIn(AUDIT_PENDING_KEY, session.info)
+
+
+class TestDiscardAudit(unittest.TestCase):
+
+    def test_drops_staged_events(self):
+        session = MagicMock()
+        session.info = {AUDIT_PENDING_KEY: [Audit(event="a")]}
+
+        discard_audit(session)
+
+        self.assertNotIn(AUDIT_PENDING_KEY, session.info)
+
+    def test_noop_when_nothing_staged(self):
+        session = MagicMock()
+        session.info = {}
+
+        discard_audit(session)
 
-        repository.insert.assert_awaited_once()
+        self.assertEqual(session.info, {})
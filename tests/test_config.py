@@ -7,16 +7,21 @@ from unittest.mock import mock_open, patch
 
 from app.config import Config, get_config
 from app.constants import (
+    AUDIT_ARCHIVE_DIRNAME,
     FERNET_KEY_FILENAME,
     FIRST_ADMIN_CREATED_FLAG_FILENAME,
     FILES_DIRNAME,
     FILES_REVISIONS_DIRNAME,
     FILES_THUMBNAILS_DIRNAME,
     FILES_TMP_DIRNAME,
+    FILES_INTENTS_DIRNAME,
+    FILES_UPLOADS_DIRNAME,
+    FILES_TRASH_DIRNAME,
     GOCRYPTFS_CIPHER_DIRNAME,
     GOCRYPTFS_MOUNTPOINT_DIRNAME,
     GOCRYPTFS_PASSPHRASE_ENCRYPTED_FILENAME,
     JWT_SIGNING_KEY_FILENAME,
+    SQLITE_AUDIT_FILENAME,
     SQLITE_DIRNAME,
     SQLITE_FILENAME,
 )
@@ -74,6 +79,22 @@ class TestConfigPaths(unittest.TestCase):
             "sqlite+aiosqlite:///" + sqlite_path,
         )
 
+    def test_computes_sqlite_audit_paths(self):
+        config = build_config()
+
+        sqlite_audit_path = os.path.join(
+            "/state",
+            GOCRYPTFS_MOUNTPOINT_DIRNAME,
+            SQLITE_DIRNAME,
+            SQLITE_AUDIT_FILENAME,
+        )
+
+        self.assertEqual(config.SQLITE_AUDIT_PATH, sqlite_audit_path)
+        self.assertEqual(
+            config.SQLITE_AUDIT_URL,
+            "sqlite+aiosqlite:///" + sqlite_audit_path,
+        )
+
     def test_computes_files_paths(self):
         config = build_config()
         mountpoint = os.path.join("/state", GOCRYPTFS_MOUNTPOINT_DIRNAME)
@@ -94,6 +115,22 @@ class TestConfigPaths(unittest.TestCase):
             config.FILES_TMP_DIR,
             os.path.join(mountpoint, FILES_TMP_DIRNAME),
         )
+        self.assertEqual(
+            config.AUDIT_ARCHIVE_DIR,
+            os.path.join(mountpoint, AUDIT_ARCHIVE_DIRNAME),
+        )
+        self.assertEqual(
+            config.FILES_TRASH_DIR,
+            os.path.join(mountpoint, FILES_TRASH_DIRNAME),
+        )
+        self.assertEqual(
+            config.FILES_INTENTS_DIR,
+            os.path.join(mountpoint, FILES_INTENTS_DIRNAME),
+        )
+        self.assertEqual(
+            config.FILES_UPLOADS_DIR,
+            os.path.join(mountpoint, FILES_UPLOADS_DIRNAME),
+        )
 
     def test_computes_secret_paths(self):
         config = build_config()
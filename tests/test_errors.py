@@ -4,6 +4,7 @@
 import unittest
 
 from app.errors import (
+    InsufficientStorageError,
     InternalServerError,
     PydanticError,
     ResourceConflictError,
@@ -30,10 +31,17 @@ class TestSimpleErrors(unittest.TestCase):
             ResourceConflictError,
             ResourceLockedError,
             TooManyRequestsError,
+            InsufficientStorageError,
         ):
             with self.subTest(error_class=error_class):
                 self.assertIsInstance(error_class(), Exception)
 
+    def test_retry_after_defaults_to_none(self):
+        for error_class in (TooManyRequestsError, InsufficientStorageError):
+            with self.subTest(error_class=error_class):
+                self.assertIsNone(error_class().retry_after)
+                self.assertEqual(error_class(retry_after=5).retry_after, 5)
+
 
 class TestPydanticError(unittest.TestCase):
 
@@ -67,6 +67,23 @@ class TestHookManager(unittest.IsolatedAsyncioTestCase):
         next_hook.assert_awaited_once_with(session, obj)
         exception_mock.assert_called_once_with("hook execution failed")
 
+    async def test_hook_failure_is_counted(self):
+        manager = HookManager()
+        manager.on(
+            E.FILE_UPDATE_COMPLETED, AsyncMock(side_effect=RuntimeError()),
+        )
+
+        with (
+            patch("app.hooks.logger.exception"),
+            patch("app.hooks.HOOK_FAILURES") as failures_mock,
+        ):
+            await manager.emit(E.FILE_UPDATE_COMPLETED)
+
+        failures_mock.labels.assert_called_once_with(
+            E.FILE_UPDATE_COMPLETED,
+        )
+        failures_mock.labels.return_value.inc.assert_called_once_with()
+
     async def test_emit_allows_none_object(self):
         manager = HookManager()
         session = AsyncMock()
@@ -200,6 +200,16 @@ class TestLockManagerAsync(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(manager._holders, [])
 
+    async def test_lock_wait_is_observed(self):
+        manager = LockManager()
+
+        with patch("app.locks.LOCK_WAIT_DURATION") as wait_mock:
+            async with manager.lock_directory("/tmp/a", LockType.WRITE):
+                pass
+
+        wait_mock.labels.assert_called_once_with(LockType.WRITE)
+        wait_mock.labels.return_value.observe.assert_called_once()
+
     async def test_write_lock_waits_for_read_lock_on_same_directory(self):
         manager = LockManager()
         acquired = asyncio.Event()
@@ -280,3 +290,106 @@ class TestLockManagerAsync(unittest.IsolatedAsyncioTestCase):
 
         with self.assertRaises(RuntimeError):
             await manager._release(resource, LockType.WRITE)
+
+
+class TestLockManagerLockMany(unittest.IsolatedAsyncioTestCase):
+
+    async def test_acquires_and_releases_all_resources(self):
+        manager = LockManager()
+
+        async with manager.lock_many(
+            LockType.WRITE,
+            dir_paths=("/tmp/b", "/tmp/a"),
+            file_paths=("/tmp/c/file.txt",),
+        ):
+            self.assertEqual(
+                [holder.resource for holder in manager._holders],
+                [
+                    LockResource(directory="/tmp/a"),
+                    LockResource(directory="/tmp/b"),
+                    LockResource(directory="/tmp/c", filename="file.txt"),
+                ],
+            )
+
+        self.assertEqual(manager._holders, [])
+
+    async def test_overlapping_requested_resources_do_not_self_block(self):
+        manager = LockManager()
+
+        async with manager.lock_many(
+            LockType.WRITE,
+            dir_paths=("/tmp/a", "/tmp/a/b", "/tmp/a"),
+        ):
+            self.assertEqual(len(manager._holders), 2)
+
+        self.assertEqual(manager._holders, [])
+
+    async def test_waits_until_all_resources_are_free(self):
+        manager = LockManager()
+        acquired = asyncio.Event()
+        release = asyncio.Event()
+
+        async def holder():
+            async with manager.lock_directory("/tmp/b", LockType.READ):
+                acquired.set()
+                await release.wait()
+
+        async def mover():
+            async with manager.lock_many(
+                LockType.WRITE,
+                dir_paths=("/tmp/a", "/tmp/b"),
+            ):
+                return "done"
+
+        holder_task = asyncio.create_task(holder())
+        await acquired.wait()
+
+        mover_task = asyncio.create_task(mover())
+        await asyncio.sleep(0)
+
+        self.assertFalse(mover_task.done())
+        # Nothing is held partially while waiting.
+        self.assertEqual(len(manager._holders), 1)
+
+        async with manager.lock_directory("/tmp/a", LockType.WRITE):
+            pass
+
+        release.set()
+
+        self.assertEqual(await mover_task, "done")
+        await holder_task
+        self.assertEqual(manager._holders, [])
+
+    async def test_opposite_order_requests_do_not_deadlock(self):
+        manager = LockManager()
+
+        async def move(first, second):
+            for _ in range(20):
+                async with manager.lock_many(
+                    LockType.WRITE,
+                    dir_paths=(first, second),
+                ):
+                    await asyncio.sleep(0)
+
+        await asyncio.wait_for(
+            asyncio.gather(
+                move("/tmp/a", "/tmp/b"),
+                move("/tmp/b", "/tmp/a"),
+            ),
+            timeout=1,
+        )
+
+        self.assertEqual(manager._holders, [])
+
+    async def test_unrelated_lock_sets_run_concurrently(self):
+        manager = LockManager()
+
+        async with manager.lock_many(
+            LockType.WRITE,
+            dir_paths=("/tmp/a", "/tmp/b"),
+        ):
+            async with manager.lock_many(
+                LockType.WRITE,
+                dir_paths=("/tmp/c", "/tmp/d"),
+            ):
+                self.assertEqual(len(manager._holders), 4)
@@ -1,12 +1,47 @@
 # tests/test_log.py
 # SPDX-License-Identifier: GPL-3.0-only
 
+import io
+import json
 import logging
 import sys
 import unittest
+from queue import Queue
 from unittest.mock import MagicMock, patch
 
-from app.log import RequestContextFilter, init_logging
+from app.context import reset_context, set_context_var
+from app.events import Events as E
+from app.log import (
+    JsonFormatter,
+    LogQueueHandler,
+    RequestContextFilter,
+    get_dropped_log_count,
+    init_logging,
+    stop_logging,
+)
+
+
+def _config(**values) -> MagicMock:
+    config = MagicMock(
+        LOG_LEVEL="INFO",
+        LOG_FORMAT="%(message)s",
+        LOG_JSON=False,
+        LOG_QUEUE_SIZE=0,
+    )
+    config.configure_mock(**values)
+    return config
+
+
+def _record(msg: str, *args, level: int = logging.INFO):
+    return logging.LogRecord(
+        name="test",
+        level=level,
+        pathname=__file__,
+        lineno=1,
+        msg=msg,
+        args=args,
+        exc_info=None,
+    )
 
 
 class TestRequestContextFilter(unittest.TestCase):
@@ -56,15 +91,15 @@ class TestRequestContextFilter(unittest.TestCase):
 class TestInitLogging(unittest.TestCase):
 
     def tearDown(self):
+        stop_logging()
         root_logger = logging.getLogger()
         root_logger.handlers.clear()
         root_logger.setLevel(logging.WARNING)
 
     def test_configures_root_logger_with_stream_handler(self):
-        config = MagicMock()
-        config.LOG_LEVEL = "DEBUG"
-        config.LOG_FORMAT = (
-            "%(levelname)s %(request_uuid)s %(message)s"
+        config = _config(
+            LOG_LEVEL="DEBUG",
+            LOG_FORMAT="%(levelname)s %(request_uuid)s %(message)s",
         )
 
         with (
@@ -91,9 +126,7 @@ class TestInitLogging(unittest.TestCase):
         old_handler = logging.NullHandler()
         root_logger.addHandler(old_handler)
 
-        config = MagicMock()
-        config.LOG_LEVEL = "INFO"
-        config.LOG_FORMAT = "%(message)s"
+        config = _config()
 
         with patch("app.log.get_config", return_value=config):
             init_logging()
@@ -104,9 +137,7 @@ class TestInitLogging(unittest.TestCase):
         self.assertIsNot(root_logger.handlers[0], old_handler)
 
     def test_unknown_log_level_falls_back_to_info(self):
-        config = MagicMock()
-        config.LOG_LEVEL = "UNKNOWN"
-        config.LOG_FORMAT = "%(message)s"
+        config = _config(LOG_LEVEL="UNKNOWN")
 
         with patch("app.log.get_config", return_value=config):
             init_logging()
@@ -114,3 +145,185 @@ class TestInitLogging(unittest.TestCase):
         root_logger = logging.getLogger()
 
         self.assertEqual(root_logger.level, logging.INFO)
+
+    def test_json_formatter_when_enabled(self):
+        with patch("app.log.get_config", return_value=_config(LOG_JSON=True)):
+            init_logging()
+
+        handler = logging.getLogger().handlers[0]
+
+        self.assertIsInstance(handler.formatter, JsonFormatter)
+
+    def test_queue_writes_records_from_listener_thread(self):
+        stream = io.StringIO()
+        config = _config(
+            LOG_QUEUE_SIZE=10,
+            LOG_FORMAT="%(request_uuid)s %(message)s",
+        )
+
+        with (
+            patch("app.log.get_config", return_value=config),
+            patch("app.log.sys.stdout", stream),
+        ):
+            init_logging()
+
+        handler = logging.getLogger().handlers[0]
+        self.assertIsInstance(handler, LogQueueHandler)
+        self.assertEqual(handler.shed_size, 8)
+
+        set_context_var("request_uuid", "req-1")
+        try:
+            logging.getLogger("test").info("event=%s", "x:started")
+        finally:
+            reset_context()
+
+        stop_logging()
+
+        self.assertEqual(stream.getvalue(), "req-1 event=x:started\n")
+        self.assertEqual(get_dropped_log_count(), 0)
+
+    def test_dropped_count_is_zero_without_queue(self):
+        with patch("app.log.get_config", return_value=_config()):
+            init_logging()
+
+        self.assertEqual(get_dropped_log_count(), 0)
+
+
+class TestLogQueueHandler(unittest.TestCase):
+
+    def test_sheds_records_below_warning_past_high_water_mark(self):
+        queue = Queue(maxsize=4)
+        handler = LogQueueHandler(queue, shed_size=2)
+
+        for i in range(3):
+            handler.handle(_record("info %s", i))
+        handler.handle(_record("warning", level=logging.WARNING))
+
+        self.assertEqual(handler.dropped_count, 1)
+        messages = [queue.get_nowait().getMessage() for _ in range(4)]
+        self.assertEqual(
+            messages,
+            [
+                "info 0",
+                "info 1",
+                f"event={E.LOG_RECORDS_DROPPED} dropped=1",
+                "warning",
+            ],
+        )
+
+    def test_drops_every_record_when_full(self):
+        queue = Queue(maxsize=1)
+        handler = LogQueueHandler(queue, shed_size=1)
+
+        handler.handle(_record("error 1", level=logging.ERROR))
+        handler.handle(_record("error 2", level=logging.ERROR))
+        handler.handle(_record("info", level=logging.INFO))
+
+        self.assertEqual(handler.dropped_count, 2)
+        self.assertEqual(queue.get_nowait().getMessage(), "error 1")
+
+        handler.handle(_record("error 3", level=logging.ERROR))
+
+        dropped = queue.get_nowait()
+        self.assertEqual(dropped.levelno, logging.WARNING)
+        self.assertEqual(dropped.request_uuid, "-")
+        self.assertEqual(
+            dropped.getMessage(),
+            f"event={E.LOG_RECORDS_DROPPED} dropped=2",
+        )
+        self.assertEqual(handler.dropped_count, 3)
+
+    def test_enqueues_copy_with_merged_message(self):
+        queue = Queue(maxsize=1)
+        handler = LogQueueHandler(queue, shed_size=1)
+        values = ["x:started"]
+        record = _record("event=%s", values)
+
+        handler.handle(record)
+        values.append("x:changed")
+
+        enqueued = queue.get_nowait()
+        self.assertIsNot(enqueued, record)
+        self.assertEqual(enqueued.getMessage(), "event=['x:started']")
+        self.assertIsNone(enqueued.args)
+        self.assertEqual(record.args, (values,))
+
+    def test_renders_exception_before_enqueueing(self):
+        queue = Queue(maxsize=1)
+        handler = LogQueueHandler(queue, shed_size=1)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = _record("event=%s", "x:failed", level=logging.ERROR)
+            record.exc_info = sys.exc_info()
+
+        handler.handle(record)
+
+        enqueued = queue.get_nowait()
+        self.assertIsNone(enqueued.exc_info)
+        self.assertIn("ValueError: boom", enqueued.exc_text)
+        self.assertIn(
+            "ValueError: boom", logging.Formatter().format(enqueued),
+        )
+
+    def test_does_not_prepare_shed_records(self):
+        queue = Queue(maxsize=2)
+        handler = LogQueueHandler(queue, shed_size=1)
+        handler.handle(_record("info 1"))
+
+        with patch.object(handler, "prepare") as prepare_mock:
+            handler.handle(_record("info 2"))
+
+        prepare_mock.assert_not_called()
+        self.assertEqual(handler.dropped_count, 1)
+
+
+class TestJsonFormatter(unittest.TestCase):
+
+    def test_emits_event_fields_and_request_uuid(self):
+        record = _record(
+            "event=%s user_id=%s elapsed_time=%.3f", "x:completed", 7, 0.5,
+        )
+        record.request_uuid = "req-1"
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual(entry["event"], "x:completed")
+        self.assertEqual(entry["user_id"], "7")
+        self.assertEqual(entry["elapsed_time"], "0.500")
+        self.assertEqual(entry["request_uuid"], "req-1")
+        self.assertEqual(entry["level"], "INFO")
+        self.assertEqual(entry["logger"], "test")
+        self.assertEqual(
+            entry["message"],
+            "event=x:completed user_id=7 elapsed_time=0.500",
+        )
+        self.assertTrue(entry["time"].endswith("+00:00"))
+
+    def test_message_fields_do_not_override_base_fields(self):
+        record = _record("level=%s message=%s", "custom", "text")
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual(entry["level"], "INFO")
+        self.assertEqual(entry["message"], "level=custom message=text")
+        self.assertEqual(entry["request_uuid"], "-")
+
+    def test_includes_exception(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = _record("event=%s", "x:failed", level=logging.ERROR)
+            record.exc_info = sys.exc_info()
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        self.assertIn("ValueError: boom", entry["exc_info"])
+
+    def test_includes_exception_rendered_by_queue_handler(self):
+        record = _record("event=%s", "x:failed", level=logging.ERROR)
+        record.exc_text = "Traceback (most recent call last):\nValueError"
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual(entry["exc_info"], record.exc_text)
@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: GPL-3.0-only
 
 from unittest import IsolatedAsyncioTestCase
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.gzip import GZipMiddleware
@@ -14,6 +14,7 @@ set_minimal_app_config_env()
 
 from app import version as version_module  # noqa: E402
 from app.errors import (  # noqa: E402
+    InsufficientStorageError,
     InternalServerError,
     ResourceConflictError,
     ResourceForbiddenError,
@@ -26,7 +27,18 @@ from app.errors import (  # noqa: E402
     ValueInvalidError,
     ValueNotFoundError,
 )
-from app.main import app, lifespan  # noqa: E402
+from app.main import app, config, lifespan  # noqa: E402
+from app.services.audit_archive import archive_audit  # noqa: E402
+from app.services.trash_reclaim import reclaim_trash  # noqa: E402
+from app.services.integrity_scan import scan_integrity  # noqa: E402
+from app.services.revision_retention import compact_revisions  # noqa: E402
+from app.services.upload_session_expire import (  # noqa: E402
+    expire_upload_sessions,
+)
+from app.services.thumbnail_generate import (  # noqa: E402
+    generate_thumbnails,
+)
+from app.services.metrics_sample import sample_metrics  # noqa: E402
 
 
 def _methods_on_path(path: str) -> set[str]:
@@ -76,6 +88,12 @@ _EXPECTED_API_ROUTES: tuple[tuple[str, frozenset[str]], ...] = (
     ("/api/v1/file/{file_id}/tag", frozenset({"POST"})),
     ("/api/v1/file/{file_id}/tag/{tag}", frozenset({"DELETE"})),
     ("/api/v1/files", frozenset({"GET"})),
+    ("/api/v1/files/move", frozenset({"POST"})),
+    ("/api/v1/files/delete", frozenset({"POST"})),
+    ("/api/v1/files/tag", frozenset({"POST"})),
+    ("/api/v1/files/starred", frozenset({"PATCH"})),
+    ("/api/v1/files/archive", frozenset({"GET"})),
+    ("/api/v1/folder/{folder_id}/import", frozenset({"POST"})),
     ("/api/v1/file/{file_id}/comment", frozenset({"POST"})),
     ("/api/v1/comment/{comment_id}", frozenset({"PATCH", "DELETE"})),
     (
@@ -84,7 +102,13 @@ _EXPECTED_API_ROUTES: tuple[tuple[str, frozenset[str]], ...] = (
     ),
     ("/api/v1/variables/{namespace}", frozenset({"GET"})),
     ("/api/v1/metrics", frozenset({"GET"})),
+    ("/api/v1/metrics/export", frozenset({"GET"})),
+    ("/api/v1/metrics/history", frozenset({"GET"})),
+    ("/api/v1/sql/statements", frozenset({"GET"})),
     ("/api/v1/audit", frozenset({"GET"})),
+    ("/api/v1/audit/export", frozenset({"GET"})),
+    ("/api/v1/integrity/report", frozenset({"GET"})),
+    ("/api/v1/revisions/retention/estimate", frozenset({"GET"})),
 )
 
 
@@ -139,6 +163,27 @@ class TestMainApp(IsolatedAsyncioTestCase):
 
         self.assertIn("POST", methods)
 
+    def test_registers_file_patch_route(self) -> None:
+        methods = self._route_methods(
+            f"{self._API}/file/{{file_id}}/patch",
+        )
+
+        self.assertIn("POST", methods)
+
+    def test_registers_upload_session_routes(self) -> None:
+        self.assertIn(
+            "POST",
+            self._route_methods(f"{self._API}/folder/{{folder_id}}/upload"),
+        )
+        self.assertEqual(
+            self._route_methods(f"{self._API}/upload/{{upload_id}}"),
+            {"GET", "PUT"},
+        )
+        self.assertIn(
+            "POST",
+            self._route_methods(f"{self._API}/upload/{{upload_id}}/commit"),
+        )
+
     def test_registers_file_list_route(self) -> None:
         methods = self._route_methods(f"{self._API}/files")
 
@@ -174,17 +219,64 @@ class TestMainApp(IsolatedAsyncioTestCase):
             patch("app.main.init_logging") as mock_log,
             patch("app.main.load_all_models") as mock_models,
             patch("app.main.hooks.load_extensions") as mock_ext,
+            patch("app.main.scheduler") as mock_scheduler,
+            patch("app.main.get_crypto_executor") as mock_crypto,
         ):
+            mock_scheduler.stop = AsyncMock()
             async with lifespan(fake_app):
                 mock_log.assert_called_once_with()
                 mock_models.assert_called_once_with()
                 mock_ext.assert_called_once_with()
+                self.assertEqual(mock_scheduler.every.call_args_list, [
+                    call(
+                        "audit_archive",
+                        config.AUDIT_ARCHIVE_INTERVAL_SECONDS,
+                        archive_audit,
+                    ),
+                    call(
+                        "trash_reclaim",
+                        config.TRASH_RECLAIM_INTERVAL_SECONDS,
+                        reclaim_trash,
+                    ),
+                    call(
+                        "integrity_scan",
+                        config.INTEGRITY_SCAN_INTERVAL_SECONDS,
+                        scan_integrity,
+                    ),
+                    call(
+                        "revision_compact",
+                        config.REVISIONS_COMPACT_INTERVAL_SECONDS,
+                        compact_revisions,
+                    ),
+                    call(
+                        "upload_session_expire",
+                        config.UPLOAD_SESSIONS_EXPIRE_INTERVAL_SECONDS,
+                        expire_upload_sessions,
+                    ),
+                    call(
+                        "thumbnail_generate",
+                        config.THUMBNAILS_GENERATE_INTERVAL_SECONDS,
+                        generate_thumbnails,
+                    ),
+                    call(
+                        "metrics_sample",
+                        config.METRICS_SAMPLE_INTERVAL_SECONDS,
+                        sample_metrics,
+                    ),
+                ])
+                mock_scheduler.start.assert_called_once_with()
+                mock_scheduler.stop.assert_not_awaited()
+                mock_crypto.return_value.shutdown.assert_not_called()
+
+        mock_scheduler.stop.assert_awaited_once_with()
+        mock_crypto.return_value.shutdown.assert_called_once_with()
 
     def test_domain_exception_handlers_registered(self) -> None:
         expected = (
             InternalServerError,
             ServiceUnavailableError,
             TooManyRequestsError,
+            InsufficientStorageError,
             ResourceNotFoundError,
             ResourceForbiddenError,
             ResourceConflictError,
@@ -203,10 +295,40 @@ class TestMainApp(IsolatedAsyncioTestCase):
         self.assertIn(GZipMiddleware, classes)
         self.assertIn(CORSMiddleware, classes)
 
-    def test_http_middleware_layers_count(self) -> None:
+    def test_gzip_middleware_excludes_archives(self) -> None:
+        gzip = next(
+            m for m in app.user_middleware if m.cls is GZipMiddleware
+        )
+        excluded = gzip.kwargs["exclude_content_types"]
+
+        self.assertIn("application/zip", excluded)
+        self.assertIn("application/x-tar", excluded)
+
+    def test_http_middleware_layers_order(self) -> None:
         from starlette.middleware.base import BaseHTTPMiddleware
 
-        base_http = sum(
-            1 for m in app.user_middleware if m.cls is BaseHTTPMiddleware
+        from app.middleware.lockdown_mode import LockdownModeMiddleware
+        from app.middleware.mountpoint_check import MountpointCheckMiddleware
+        from app.middleware.request_context import RequestContextMiddleware
+        from app.middleware.request_logging import RequestLoggingMiddleware
+        from app.middleware.request_metrics import RequestMetricsMiddleware
+        from app.middleware.security_headers import (
+            SecurityHeadersMiddleware,
+        )
+
+        classes = [m.cls for m in app.user_middleware]
+
+        self.assertNotIn(BaseHTTPMiddleware, classes)
+        self.assertEqual(
+            classes,
+            [
+                GZipMiddleware,
+                CORSMiddleware,
+                SecurityHeadersMiddleware,
+                RequestContextMiddleware,
+                RequestMetricsMiddleware,
+                RequestLoggingMiddleware,
+                MountpointCheckMiddleware,
+                LockdownModeMiddleware,
+            ],
         )
-        self.assertGreaterEqual(base_http, 5)
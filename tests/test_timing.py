@@ -0,0 +1,161 @@
+# tests/test_timing.py
+# SPDX-License-Identifier: GPL-3.0-only
+
+import asyncio
+import unittest
+
+from app.context import reset_context
+from app.timing import (
+    TimingCategory,
+    add_timing,
+    format_server_timing,
+    get_timings,
+    measure,
+    start_timings,
+    timed,
+    untimed,
+)
+
+
+class TestTimings(unittest.TestCase):
+
+    def setUp(self):
+        reset_context()
+
+    def tearDown(self):
+        reset_context()
+
+    def test_timings_are_zero_outside_request(self):
+        add_timing(TimingCategory.SQL, 1.0)
+
+        self.assertEqual(
+            get_timings(), dict.fromkeys(TimingCategory, 0.0),
+        )
+
+    def test_add_timing_accumulates(self):
+        start_timings()
+
+        add_timing(TimingCategory.SQL, 0.25)
+        add_timing(TimingCategory.SQL, 0.5)
+
+        self.assertEqual(get_timings()[TimingCategory.SQL], 0.75)
+        self.assertEqual(get_timings()[TimingCategory.FILE], 0.0)
+
+    def test_get_timings_returns_copy(self):
+        start_timings()
+
+        get_timings()[TimingCategory.SQL] = 1.0
+
+        self.assertEqual(get_timings()[TimingCategory.SQL], 0.0)
+
+    def test_measure_counts_block(self):
+        start_timings()
+
+        with measure(TimingCategory.IMAGE):
+            pass
+
+        self.assertGreater(get_timings()[TimingCategory.IMAGE], 0.0)
+
+    def test_nested_measurement_counts_towards_outer(self):
+        start_timings()
+
+        with measure(TimingCategory.HOOK):
+            add_timing(TimingCategory.SQL, 1.0)
+            with measure(TimingCategory.FILE):
+                pass
+
+        timings = get_timings()
+        self.assertGreater(timings[TimingCategory.HOOK], 0.0)
+        self.assertEqual(timings[TimingCategory.SQL], 0.0)
+        self.assertEqual(timings[TimingCategory.FILE], 0.0)
+
+    def test_untimed_block_is_excluded(self):
+        start_timings()
+
+        with measure(TimingCategory.FILE):
+            with untimed():
+                add_timing(TimingCategory.SQL, 1.0)
+
+        timings = get_timings()
+        self.assertLess(timings[TimingCategory.FILE], 0.01)
+        self.assertEqual(timings[TimingCategory.SQL], 1.0)
+
+    def test_timed_sync_function(self):
+        start_timings()
+
+        @timed(TimingCategory.LOCK)
+        def work(value):
+            return value * 2
+
+        self.assertEqual(work(2), 4)
+        self.assertGreater(get_timings()[TimingCategory.LOCK], 0.0)
+
+
+class TestTimedAsync(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        reset_context()
+        start_timings()
+
+    def tearDown(self):
+        reset_context()
+
+    async def test_timed_coroutine_function(self):
+        @timed(TimingCategory.FILE)
+        async def work():
+            await asyncio.sleep(0)
+            return "ok"
+
+        self.assertEqual(await work(), "ok")
+        self.assertGreater(get_timings()[TimingCategory.FILE], 0.0)
+
+    async def test_thread_adds_to_same_request(self):
+        await asyncio.to_thread(add_timing, TimingCategory.SQL, 0.5)
+
+        self.assertEqual(get_timings()[TimingCategory.SQL], 0.5)
+
+    async def test_timed_async_generator_excludes_consumer(self):
+        @timed(TimingCategory.FILE)
+        async def chunks():
+            yield b"a"
+            yield b"b"
+
+        result = []
+        async for chunk in chunks():
+            add_timing(TimingCategory.SQL, 1.0)
+            result.append(chunk)
+
+        self.assertEqual(result, [b"a", b"b"])
+        timings = get_timings()
+        self.assertGreater(timings[TimingCategory.FILE], 0.0)
+        self.assertEqual(timings[TimingCategory.SQL], 2.0)
+
+    async def test_timed_async_generator_closed_early(self):
+        closed = []
+
+        @timed(TimingCategory.FILE)
+        async def chunks():
+            try:
+                yield b"a"
+                yield b"b"
+            finally:
+                closed.append(True)
+
+        iterator = chunks()
+        self.assertEqual(await anext(iterator), b"a")
+        await iterator.aclose()
+
+        self.assertEqual(closed, [True])
+
+
+class TestFormatServerTiming(unittest.TestCase):
+
+    def test_formats_milliseconds(self):
+        value = format_server_timing(
+            {TimingCategory.LOCK: 0.0015, TimingCategory.SQL: 0.25},
+            0.5,
+        )
+
+        self.assertEqual(
+            value, "lock;dur=1.500, sql;dur=250.000, total;dur=500.000",
+        )